@@ -1,4 +1,19 @@
 #!/usr/bin/env python
 
-import Main
-Main.main()
+import sys
+
+# the subcommands and options of headless.main, which make this a command line run
+HEADLESS_COMMANDS = ('ports', 'flash', 'config', 'provision', 'clone', 'backup', 'firmware', 'daemon')
+HEADLESS_OPTIONS = ('-h', '--help', '-j', '--jobs', '--history')
+
+# Finder on older macOS passes the process serial number (-psn_0_12345), that is no command
+args = [arg for arg in sys.argv[1:] if not arg.startswith('-psn_')]
+
+if args and (args[0] in HEADLESS_COMMANDS or args[0].startswith(HEADLESS_OPTIONS)):
+    # Command line use: run headless, this never imports wx
+    import headless
+    sys.argv[1:] = args
+    sys.exit(headless.main())
+else:
+    import Main
+    Main.main()
@@ -3,31 +3,16 @@
 from __future__ import print_function
 import wx
 import wx.adv
-import wx.lib.inspection
-import wx.lib.mixins.inspection
 
-import sys
+import copy
 import os
-import esptool
-import threading
-import json
-import images as images
+import console
+import engine
+import firmstore
+import jobs
+import portwatch
+from engine import FlashConfig
 from serial import SerialException
-from serial.tools import list_ports
-from esptool import ESPLoader
-from esptool import NotImplementedInROMError
-from argparse import Namespace
-
-import platform
-import posixpath
-import re
-import serial.serialutil
-
-import dotenv
-
-
-import ampy.files as files
-import ampy.pyboard as pyboard
 
 
 
@@ -50,204 +35,124 @@ __supported_baud_rates__ = [9600, 57600, 74880, 115200, 230400, 460800, 921600]
 
 # ---------------------------------------------------------------------------
 
-_board = None
+FLASH_RETRIES = 2        # extra attempts for a failed flashing job
+SAVE_CONFIG_RETRIES = 1  # extra attempts for a failed config upload
+MAX_CONCURRENT_JOBS = 4  # boards worked on at the same time
+JOB_HISTORY_FILE = './job-history.json'
+# a firmware image, or a flash layout manifest listing several (see engine.load_flash_layout)
+FIRMWARE_WILDCARD = "Firmware images (*.bin)|*.bin|Flash layout manifests (*.json)|*.json|All files (*.*)|*.*"
+
+# The widget inspection tool (Ctrl-Alt-I) is a development aid, only load it on request
+INSPECTION_ENABLED = bool(os.environ.get('BLOCKY_INSPECTION'))
+if INSPECTION_ENABLED:
+    import wx.lib.mixins.inspection
+    AppBase = wx.lib.mixins.inspection.InspectableApp
+else:
+    AppBase = wx.App
+
+_bitmaps = {}
+
+
+def get_bitmap(name):
+    # images.py is only imported, and every bitmap only decoded, on first use
+    if name not in _bitmaps:
+        import images
+        _bitmaps[name] = getattr(images, name).GetBitmap()
+    return _bitmaps[name]
 
 
 def get_serial_ports():
-    ports = [""]
-    for port, desc, hwid in sorted(list_ports.comports()):
-        ports.append(port)
-    return ports
-
-def windows_full_port_name(portname):
-    # Helper function to generate proper Windows COM port paths.  Apparently
-    # Windows requires COM ports above 9 to have a special path, where ports below
-    # 9 are just referred to by COM1, COM2, etc. (wacky!)  See this post for
-    # more info and where this code came from:
-    # http://eli.thegreenplace.net/2009/07/31/listing-all-serial-ports-on-windows-with-python/
-    m = re.match("^COM(\d+)$", portname)
-    if m and int(m.group(1)) < 10:
-        return portname
-    else:
-        return "\\\\.\\{0}".format(portname)
-
-
-# See discussion at http://stackoverflow.com/q/41101897/131929
-class RedirectText:
-    def __init__(self, text_ctrl):
-        self.__out = text_ctrl
-
-    def write(self, string):
-        if string.startswith("\r"):
-            # carriage return -> remove last line i.e. reset position to start of last line
-            current_value = self.__out.GetValue()
-            last_newline = current_value.rfind("\n")
-            new_value = current_value[:last_newline + 1]  # preserve \n
-            new_value += string[1:]  # chop off leading \r
-            wx.CallAfter(self.__out.SetValue, new_value)
+    return [""] + portwatch.list_serial_ports()
+
+
+def update_port_choice(choice, ports):
+    # Refresh the items of a port wx.Choice without losing the selection.
+    selected = choice.GetStringSelection()
+    choice.SetItems(ports)
+    if selected in ports:
+        choice.SetStringSelection(selected)
+
+
+# Shows a console.LogBuffer in a text control.  Writers never touch the
+# control: a timer polls the buffer and repaints at most REFRESH_INTERVAL ms
+# apart, only replacing the unfinished last line and appending new lines.
+class ConsoleView:
+    REFRESH_INTERVAL = 100  # ms, i.e. at most 10 repaints a second
+
+    def __init__(self, text_ctrl, log):
+        self._ctrl = text_ctrl
+        self._log = log
+        self._cursor = None
+        self._version = None
+        self._shown = 0  # complete lines in the control
+        self._current_start = 0  # position of the unfinished last line
+        self._timer = wx.Timer(text_ctrl)
+        text_ctrl.Bind(wx.EVT_TIMER, self.refresh, self._timer)
+        self._timer.Start(self.REFRESH_INTERVAL)
+
+    def refresh(self, event=None):
+        version = self._log.version
+        if version == self._version:
+            return
+        self._version = version
+        # appending only would let the control grow forever, rebuild it now and then
+        trim = self._shown > 2 * self._log.max_lines
+        self._cursor, reset, lines, current = self._log.read(self._cursor, trim)
+        if reset:
+            self._ctrl.SetValue(''.join(lines) + current)
+            self._shown = len(lines)
         else:
-            wx.CallAfter(self.__out.AppendText, string)
+            self._ctrl.Replace(self._current_start, self._ctrl.GetLastPosition(), ''.join(lines) + current)
+            self._shown += len(lines)
+        self._current_start = self._ctrl.GetLastPosition() - len(current)
+        self._ctrl.ShowPosition(self._ctrl.GetLastPosition())
+
+    def set_log(self, log):
+        # show another buffer, from scratch
+        self._log = log
+        self._cursor = None
+        self._version = None
+        self.refresh()
 
-    # noinspection PyMethodMayBeStatic
-    def flush(self):
-        # noinspection PyStatementEffect
-        None
+    def stop(self):
+        self._timer.Stop()
 
 # ---------------------------------------------------------------------------
 
 
 # ---------------------------------------------------------------------------
-class FlashingThread(threading.Thread):
-    def __init__(self, parent, config):
-        threading.Thread.__init__(self)
-        self.daemon = True
-        self._parent = parent
+# Job workloads, run by the JobScheduler on one of its worker threads.
+# What they print ends up in the console channel of the job's port.
+class FlashingTask:
+    def __init__(self, config):
         self._config = config
 
-    def run(self):
+    def __call__(self, job):
+        import esptool
         try:
-            initial_baud = min(ESPLoader.ESP_ROM_BAUD, self._config.baud)
-
-            esp = ESPLoader.detect_chip(self._config.port, initial_baud)
-            print("Chip is %s" % (esp.get_chip_description()))
-
-            esp = esp.run_stub()
-
-            if self._config.baud > initial_baud:
-                try:
-                    esp.change_baud(self._config.baud)
-                except NotImplementedInROMError:
-                    print("WARNING: ROM doesn't support changing baud rate. Keeping initial baud rate %d." %
-                          initial_baud)
-
-            args = Namespace()
-            args.flash_size = "detect"
-            args.flash_mode = self._config.mode
-            args.flash_freq = "40m"
-            args.no_progress = False
-            args.no_stub = False
-            args.verify = False  # TRUE is deprecated
-            args.compress = True
-            args.addr_filename = [[int("0x00000", 0), open(self._config.firmware_path, 'rb')]]
-
-            print("Configuring flash size...")
-            esptool.detect_flash_size(esp, args)
-            esp.flash_set_parameters(esptool.flash_size_bytes(args.flash_size))
-
-            if self._config.erase_before_flash:
-                esptool.erase_flash(esp, args)
-            esptool.write_flash(esp, args)
-            # The last line printed by esptool is "Leaving..." -> some indication that the process is done is needed
-            print("\nDone.")
+            engine.flash_firmware(self._config, job)
         except SerialException as e:
-            self._parent.report_error(e.strerror)
+            print(e.strerror)
             raise e
+        except esptool.FatalError as e:
+            print("\nA fatal error occurred: %s" % e)
+            raise
 
 # ---------------------------------------------------------------------------
 
-class SaveConfigThread(threading.Thread):
-    def __init__(self, parent, config):
-        threading.Thread.__init__(self)
-        self.daemon = True
-        self._parent = parent
+class SaveConfigTask:
+    def __init__(self, config):
         self._config = config
 
-    def run(self):
-        global _board
+    def __call__(self, job):
         try:
-            initial_baud = min(ESPLoader.ESP_ROM_BAUD, self._config['baud'])
-
-            #esp = ESPLoader.detect_chip(self._config['port'], initial_baud)
-            #print("Chip is %s" % (esp.get_chip_description()))
-
-            #esp = esp.run_stub()
-
-            if self._config['baud'] > initial_baud:
-                try:
-                    esp.change_baud(self._config['baud'])
-                except NotImplementedInROMError:
-                    print("WARNING: ROM doesn't support changing baud rate. Keeping initial baud rate %d." %
-                          initial_baud)
-
-            # On Windows fix the COM port path name for ports above 9 (see comment in
-            # windows_full_port_name function).
-            port = self._config['port']
-            if platform.system() == "Windows":
-                port = windows_full_port_name(port)
-            try:
-                # create config file
-                print('Generating config file')
-                local_file = './config.json'
-                config_json = {
-                    'known_networks': [
-                        {'ssid': self._config['wifi_name'], 'password': self._config['wifi_pass']},
-                    ], 
-                    'device_name': 'blocky_111', 
-                    'auth_key': self._config['device_key']}
-
-                with open(local_file, 'w') as outfile:
-                    json.dump(config_json, outfile)
-
-                print('Done')
-                print('Sending to board...')
-                
-                _board = pyboard.Pyboard(port, baudrate=initial_baud, rawdelay=0)
-            
-                # Use the local filename
-                remote = 'config.json'
-
-                # File copy, open the file and copy its contents to the board.
-                # Put the file on the board.
-                with open(local_file, "rb") as infile:
-                    board_files = files.Files(_board)
-                    board_files.put(remote, infile.read())
-            except pyboard.PyboardError as err:
-                print('Error detected')
-                print(err)
-            # The last line printed by esptool is "Leaving..." -> some indication that the process is done is needed
-            print("\nDone.")
+            engine.save_config(self._config, job)
+        except jobs.JobCancelled:
+            raise
         except Exception as e:
             print('Error detected')
             print(e)
-            #self._parent.report_error(e.strerror)
-            #raise e
-        _board.close()
-        _board = None
-
-# ---------------------------------------------------------------------------
-# DTO between GUI and flashing thread
-class FlashConfig:
-    def __init__(self):
-        self.baud = 115200
-        self.erase_before_flash = False
-        self.mode = "dio"
-        self.firmware_path = None
-        self.port = None
-
-    @classmethod
-    def load(cls, file_path):
-        conf = cls()
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            conf.port = data['port']
-            conf.baud = data['baud']
-            conf.mode = data['mode']
-            conf.erase_before_flash = data['erase']
-        return conf
-
-    def safe(self, file_path):
-        data = {
-            'port': self.port,
-            'baud': self.baud,
-            'mode': self.mode,
-            'erase': self.erase_before_flash,
-        }
-        with open(file_path, 'w') as f:
-            json.dump(data, f)
-
-    def is_complete(self):
-        return self.firmware_path is not None and self.port is not None
+            raise
 
 # ---------------------------------------------------------------------------
 class BlockConfigFrame(wx.Frame):
@@ -265,20 +170,32 @@ class BlockConfigFrame(wx.Frame):
         p = wx.Panel(self)
         self.nb = wx.Notebook(p)
  
+        # All board work goes through one scheduler: one job per port at a time
+        self.scheduler = jobs.JobScheduler(max_workers=MAX_CONCURRENT_JOBS, history_path=JOB_HISTORY_FILE)
+        self.scheduler.add_listener(self._on_job_event)
+
+        # Every port has its own console channel that the jobs for it print to,
+        # the tabs show the channel of the port selected
+        self.channels = console.Channels()
+        console.install_router()
+
         # Create the tab windows
-        saveConfigTab = TabSaveConfig(self.nb)
-        flashFirmwareTab = TabFlashFirmware(self.nb)
+        saveConfigTab = TabSaveConfig(self.nb, self.scheduler, self.channels)
+        flashFirmwareTab = TabFlashFirmware(self.nb, self.scheduler, self.channels)
+        self.tabs = [saveConfigTab, flashFirmwareTab]
+        self.preparer = flashFirmwareTab.preparer
+
+        # Keep the port lists current as boards are plugged in and out
+        self.port_watcher = portwatch.PortWatcher()
+        self.port_watcher.add_listener(self._on_port_event)
+        self.port_watcher.start()
+        self.Bind(wx.EVT_CLOSE, self._on_close)
  
         # Add the windows to tabs and name them.
         self.nb.AddPage(saveConfigTab, "Generate Config")
         self.nb.AddPage(flashFirmwareTab, "Flash Firmware")
 
-        def on_tab_changed(event):
-            tab = self.nb.GetPage(event.GetSelection())
-            sys.stdout = RedirectText(tab.console_ctrl)
-        
-        self.nb.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, on_tab_changed) 
- 
+
         # Set noteboook in a sizer to create the layout
         sizer = wx.BoxSizer()
         sizer.Add(self.nb, 1, wx.EXPAND)
@@ -288,9 +205,40 @@ class BlockConfigFrame(wx.Frame):
         self.Centre(wx.BOTH)
         self.Show(True)
 
-        sys.stdout = RedirectText(saveConfigTab.console_ctrl)
+    def _on_port_event(self, event, port):
+        # called from the watcher thread
+        wx.CallAfter(self._dispatch_port_event, event, port)
+
+    def _dispatch_port_event(self, event, port):
+        ports = get_serial_ports()
+        for tab in self.tabs:
+            tab.on_port_event(event, port, ports)
+
+    def _on_job_event(self, job):
+        # called from a worker thread
+        wx.CallAfter(self._show_job_status, job)
+
+    def _show_job_status(self, job):
+        active = len(self.scheduler.jobs())
+        state = job.state
+        progress = job.progress
+        if state == jobs.RUNNING and progress is not None:
+            state = "%s %d%%" % (progress.phase, 100 * progress.done // max(progress.total, 1))
+            if progress.eta is not None and progress.done < progress.total:
+                state += ", %ds left" % progress.eta
+        self.statusBar.SetStatusText("%s on %s: %s (%d active)" % (job.name, job.port, state, active), 1)
+
+    def _on_close(self, event):
+        self.port_watcher.stop()
+        self.preparer.stop()
+        engine.warm_loaders.release_all()
+        self.scheduler.shutdown(wait=False)
+        for tab in self.tabs:
+            tab.console_view.stop()
+        event.Skip()
 
     def _set_icons(self):
+        import images
         self.SetIcon(images.Icon.GetIcon())
 
     def _build_status_bar(self):
@@ -306,8 +254,10 @@ class BlockConfigFrame(wx.Frame):
         file_menu = wx.Menu()
         wx.App.SetMacExitMenuItemId(wx.ID_EXIT)
         exit_item = file_menu.Append(wx.ID_EXIT, "E&xit\tCtrl-Q", "Exit Blocky Config Tool")
-        exit_item.SetBitmap(images.Exit.GetBitmap())
+        exit_item.SetBitmap(get_bitmap('Exit'))
         self.Bind(wx.EVT_MENU, self._on_exit_app, exit_item)
+        cancel_item = file_menu.Insert(0, wx.ID_ANY, "&Cancel all jobs\tCtrl-K", "Cancel queued and running jobs")
+        self.Bind(wx.EVT_MENU, self._on_cancel_jobs, cancel_item)
         self.menuBar.Append(file_menu, "&File")
 
         # Help menu
@@ -319,6 +269,9 @@ class BlockConfigFrame(wx.Frame):
         self.SetMenuBar(self.menuBar)
 
     # Menu methods
+    def _on_cancel_jobs(self, event):
+        self.scheduler.cancel_all()
+
     def _on_exit_app(self, event):
         self.Close(True)
 
@@ -330,9 +283,11 @@ class BlockConfigFrame(wx.Frame):
 
 # ---------------------------------------------------------------------------
 class TabSaveConfig(wx.Panel):
-    def __init__(self, parent):
+    def __init__(self, parent, scheduler, channels):
 
         self._config = {}
+        self._scheduler = scheduler
+        self._channels = channels
 
         wx.Panel.__init__(self, parent)
         
@@ -343,7 +298,8 @@ class TabSaveConfig(wx.Panel):
         port_label = wx.StaticText(self, label="Serial port")
 
         self.ports = wx.Choice(self, choices=get_serial_ports())
-        bmp = images.Reload.GetBitmap()
+        self.ports.Bind(wx.EVT_CHOICE, self.on_select_port)
+        bmp = get_bitmap('Reload')
         reload_button = wx.BitmapButton(self, id=wx.ID_ANY, bitmap=bmp,
                                         size=(bmp.GetWidth() + 7, bmp.GetHeight() + 7))
         reload_button.Bind(wx.EVT_BUTTON, self.on_reload)
@@ -373,6 +329,9 @@ class TabSaveConfig(wx.Panel):
         self.console_ctrl.SetBackgroundColour(wx.BLACK)
         self.console_ctrl.SetForegroundColour(wx.RED)
         self.console_ctrl.SetDefaultStyle(wx.TextAttr(wx.RED))
+        self._messages = console.LogBuffer()  # shown while no port is selected
+        self.console = self._messages
+        self.console_view = ConsoleView(self.console_ctrl, self.console)
 
         fgs.AddMany([
             port_label, (serial_boxsizer, 1, wx.EXPAND),
@@ -390,16 +349,26 @@ class TabSaveConfig(wx.Panel):
         self.SetSizer(hbox)
 
     def on_reload(self, event):
-        self.ports.SetItems(get_serial_ports())
+        update_port_choice(self.ports, get_serial_ports())
+
+    def on_port_event(self, event, port, ports):
+        update_port_choice(self.ports, ports)
+
+    def on_select_port(self, event):
+        self.show_port(self.ports.GetStringSelection())
+
+    def show_port(self, port):
+        self.console = self._channels.get(port) if port else self._messages
+        self.console_view.set_log(self.console)
 
     def report_error(self, message):
-        self.console_ctrl.SetValue(message)
+        self.console.clear()
+        self.console.write(message)
 
     def log_message(self, message):
-        self.console_ctrl.AppendText(message)
+        self.console.write(message)
 
     def on_clicked(self, event):
-        self.console_ctrl.SetValue("")
         self.config = {
           'port': self.ports.GetString(self.ports.GetSelection()),
           'baud': 115200,
@@ -408,23 +377,79 @@ class TabSaveConfig(wx.Panel):
           'device_key': self.device_key_text.GetValue()
         }
 
-        worker = SaveConfigThread(self, self.config)
-        worker.start()
+        port = self.config['port']
+        self.show_port(port)
+        if not port:
+            self.log_message("Select a serial port first.\n")
+            return
+        if self._scheduler.is_port_busy(port):
+            self.log_message("Another job for %s is in progress, this one is queued.\n" % port)
+        else:
+            self.console.clear()
+        self._scheduler.submit(jobs.Job("Save config", port, SaveConfigTask(self.config),
+                                        retries=SAVE_CONFIG_RETRIES, backoff=2.0,
+                                        output=self._channels.get(port)))
 
 # ---------------------------------------------------------------------------
 class TabFlashFirmware(wx.Panel):
-    def __init__(self, parent):
+    def __init__(self, parent, scheduler, channels):
         wx.Panel.__init__(self, parent)
         
         self._config = FlashConfig.load('./config.cnf')
+        self._scheduler = scheduler
+        self._channels = channels
+        # reads, patches and compresses the picked firmware before the flash button is pressed
+        self.preparer = engine.FirmwarePreparer()
 
         self._init_ui()
 
-        sys.stdout = RedirectText(self.console_ctrl)
+    def show_port(self, port):
+        self.console = self._channels.get(port) if port else self._messages
+        self.console_view.set_log(self.console)
+
+    def log_message(self, message):
+        self.console.write(message)
+
+    def on_port_event(self, event, port, ports):
+        update_port_choice(self.choice, ports)
+        if event == portwatch.PORT_REMOVED:
+            engine.warm_loaders.release(port)
+        if event == portwatch.PORT_ADDED and self.auto_flash.GetValue():
+            self.choice.SetStringSelection(port)
+            self.show_port(port)
+            if self._config.firmware_path is None:
+                self.log_message("Board plugged in at %s but no firmware is selected.\n" % port)
+                return
+            self._config.port = port
+            self._start_flashing("Board plugged in at %s, flashing...\n" % port)
+        elif event == portwatch.PORT_ADDED:
+            self.warm_up(port)
+
+    def warm_up(self, port):
+        # connect ahead of the flash button, if asked to and no job uses the port
+        if port and self.connect_ahead.GetValue() and not self._scheduler.is_port_busy(port):
+            engine.warm_loaders.warm(port, self._config.baud)
+
+    def _start_flashing(self, message=None):
+        self.show_port(self._config.port)
+        if not self._config.is_complete():
+            self.log_message("Select a serial port and a firmware first.\n")
+            return
+        if self._scheduler.is_port_busy(self._config.port):
+            self.log_message("Another job for %s is in progress, this one is queued.\n" % self._config.port)
+        else:
+            self.console.clear()
+        if message:
+            self.log_message(message)
+        # each job gets its own copy, later GUI changes must not affect it
+        config = copy.copy(self._config)
+        self._scheduler.submit(jobs.Job("Flash", config.port, FlashingTask(config),
+                                        retries=FLASH_RETRIES, backoff=2.0,
+                                        output=self._channels.get(config.port)))
 
     def _init_ui(self):
         def on_reload(event):
-            self.choice.SetItems(self._get_serial_ports())
+            update_port_choice(self.choice, get_serial_ports())
 
         def on_baud_changed(event):
             radio_button = event.GetEventObject()
@@ -437,6 +462,7 @@ class TabFlashFirmware(wx.Panel):
 
             if radio_button.GetValue():
                 self._config.mode = radio_button.mode
+                self.preparer.select(self._config)
 
         def on_erase_changed(event):
             radio_button = event.GetEventObject()
@@ -445,31 +471,84 @@ class TabFlashFirmware(wx.Panel):
                 self._config.erase_before_flash = radio_button.erase
 
         def on_clicked(event):
-            self.console_ctrl.SetValue("")
-            worker = FlashingThread(self, self._config)
-            worker.start()
+            self._start_flashing()
 
         def on_select_port(event):
             choice = event.GetEventObject()
             self._config.port = choice.GetString(choice.GetSelection())
+            self.show_port(self._config.port)
+            self.warm_up(self._config.port)
+
+        def on_connect_ahead_changed(event):
+            if self.connect_ahead.GetValue():
+                self.warm_up(self._config.port)
+            else:
+                engine.warm_loaders.release_all()
+
+        def update_firmware_choice(select=None):
+            # the images of the firmware store, and select if it is a manifest (flashed from its path)
+            entries = engine.firmware_store.entries()
+            refs = [entry['digest'] for entry in entries]
+            labels = [firmstore.describe(entry) for entry in entries]
+            if select is not None and select not in refs:
+                refs.insert(0, select)
+                labels.insert(0, select)
+            self.firmware_choice.refs = refs
+            self.firmware_choice.SetItems(labels)
+            if select is not None:
+                self.firmware_choice.SetSelection(refs.index(select))
+                self._config.firmware_path = select
+                self.preparer.select(self._config)
+
+        def on_select_firmware(event):
+            self._config.firmware_path = self.firmware_choice.refs[self.firmware_choice.GetSelection()]
+            self.preparer.select(self._config)
 
         def on_pick_file(event):
-            self._config.firmware_path = event.GetPath().replace("'", "")
+            path = event.GetPath().replace("'", "")
+            if path.lower().endswith(engine.MANIFEST_EXTENSION):
+                update_firmware_choice(path)
+                return
+            # images are added to the store, and picked from there from now on
+            try:
+                entry = engine.firmware_store.add(path)
+            except (IOError, OSError) as e:
+                self.log_message("Cannot add %s to the firmware store: %s\n" % (path, e))
+                return
+            update_firmware_choice(entry['digest'])
+
+        def on_pick_files_dir(event):
+            # optional, an empty path flashes the firmware only
+            self._config.files_dir = event.GetPath() or None
+            self.preparer.select(self._config)
 
         hbox = wx.BoxSizer(wx.HORIZONTAL)
 
-        fgs = wx.FlexGridSizer(7, 2, 10, 10)
+        fgs = wx.FlexGridSizer(10, 2, 10, 10)
 
         self.choice = wx.Choice(self, choices=get_serial_ports())
         self.choice.Bind(wx.EVT_CHOICE, on_select_port)
-        bmp = images.Reload.GetBitmap()
+        bmp = get_bitmap('Reload')
         reload_button = wx.BitmapButton(self, id=wx.ID_ANY, bitmap=bmp,
                                         size=(bmp.GetWidth() + 7, bmp.GetHeight() + 7))
         reload_button.Bind(wx.EVT_BUTTON, on_reload)
         reload_button.SetToolTip("Reload serial device list")
 
-        file_picker = wx.FilePickerCtrl(self, style=wx.FLP_USE_TEXTCTRL)
+        self.firmware_choice = wx.Choice(self)
+        self.firmware_choice.Bind(wx.EVT_CHOICE, on_select_firmware)
+        update_firmware_choice()
+        file_picker = wx.FilePickerCtrl(self, style=wx.FLP_OPEN | wx.FLP_FILE_MUST_EXIST, wildcard=FIRMWARE_WILDCARD)
         file_picker.Bind(wx.EVT_FILEPICKER_CHANGED, on_pick_file)
+        file_picker.SetToolTip("Add a firmware image to the store, or pick a flash layout manifest")
+
+        firmware_boxsizer = wx.BoxSizer(wx.HORIZONTAL)
+        firmware_boxsizer.Add(self.firmware_choice, 1, wx.EXPAND)
+        firmware_boxsizer.AddStretchSpacer(0)
+        firmware_boxsizer.Add(file_picker, 0, wx.ALIGN_RIGHT, 20)
+
+        files_dir_picker = wx.DirPickerCtrl(self, style=wx.DIRP_USE_TEXTCTRL | wx.DIRP_DIR_MUST_EXIST)
+        files_dir_picker.Bind(wx.EVT_DIRPICKER_CHANGED, on_pick_files_dir)
+        files_dir_picker.SetToolTip("Optional: flash the files in this folder as the board's filesystem")
 
         serial_boxsizer = wx.BoxSizer(wx.HORIZONTAL)
         serial_boxsizer.Add(self.choice, 1,  wx.EXPAND)
@@ -524,14 +603,24 @@ class TabFlashFirmware(wx.Panel):
         button = wx.Button(self, -1, "Flash NodeMCU")
         button.Bind(wx.EVT_BUTTON, on_clicked)
 
+        self.auto_flash = wx.CheckBox(self, label="Flash boards as soon as they are plugged in")
+        self.connect_ahead = wx.CheckBox(self, label="Connect to boards as soon as they are selected or plugged in")
+        self.connect_ahead.Bind(wx.EVT_CHECKBOX, on_connect_ahead_changed)
+        self.connect_ahead.SetToolTip("Saves the seconds of connecting when flashing, "
+                                      "the board is reset after %d s without a job" % engine.WarmLoaders.IDLE_TIMEOUT)
+
         self.console_ctrl = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.HSCROLL)
         self.console_ctrl.SetFont(wx.Font(13, wx.FONTFAMILY_TELETYPE, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL))
         self.console_ctrl.SetBackgroundColour(wx.BLACK)
         self.console_ctrl.SetForegroundColour(wx.RED)
         self.console_ctrl.SetDefaultStyle(wx.TextAttr(wx.RED))
+        self._messages = console.LogBuffer()  # shown while no port is selected
+        self.console = self._messages
+        self.console_view = ConsoleView(self.console_ctrl, self.console)
 
         port_label = wx.StaticText(self, label="Serial port")
-        file_label = wx.StaticText(self, label="Firmware File")
+        file_label = wx.StaticText(self, label="Firmware")
+        files_dir_label = wx.StaticText(self, label="Board Files")
         baud_label = wx.StaticText(self, label="Baud rate")
         flashmode_label = wx.StaticText(self, label="Flash mode")
 
@@ -546,7 +635,7 @@ class TabFlashFirmware(wx.Panel):
 
             win.Popup()
 
-        icon = wx.StaticBitmap(self, wx.ID_ANY, images.Info.GetBitmap())
+        icon = wx.StaticBitmap(self, wx.ID_ANY, get_bitmap('Info'))
         icon.Bind(wx.EVT_MOTION, on_info_hover)
 
         flashmode_label_boxsizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -559,20 +648,25 @@ class TabFlashFirmware(wx.Panel):
 
         fgs.AddMany([
                     port_label, (serial_boxsizer, 1, wx.EXPAND),
-                    file_label, (file_picker, 1, wx.EXPAND),
+                    file_label, (firmware_boxsizer, 1, wx.EXPAND),
+                    files_dir_label, (files_dir_picker, 1, wx.EXPAND),
                     baud_label, baud_boxsizer,
                     flashmode_label_boxsizer, flashmode_boxsizer,
                     erase_label, erase_boxsizer,
+                    (wx.StaticText(self, label="")), self.auto_flash,
+                    (wx.StaticText(self, label="")), self.connect_ahead,
                     (wx.StaticText(self, label="")), (button, 1, wx.EXPAND),
                     (console_label, 1, wx.EXPAND), (self.console_ctrl, 1, wx.EXPAND)])
-        fgs.AddGrowableRow(6, 1)
+        fgs.AddGrowableRow(9, 1)
         fgs.AddGrowableCol(1, 1)
         hbox.Add(fgs, proportion=2, flag=wx.ALL | wx.EXPAND, border=15)
         self.SetSizer(hbox)
 
 # ----------------------------------------------------------------------------
-class App(wx.App, wx.lib.mixins.inspection.InspectionMixin):
+class App(AppBase):
     def OnInit(self):
+        if INSPECTION_ENABLED:
+            self.InitInspection()
         wx.SystemOptions.SetOption("mac.window-plain-transition", 1)
         self.SetAppName("Blocky Config Tool")
 
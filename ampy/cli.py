@@ -20,10 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 from __future__ import print_function
+import glob
 import os
 import platform
 import posixpath
 import re
+import sys
+import threading
 import serial.serialutil
 
 import click
@@ -39,7 +42,11 @@ import ampy.files as files
 import ampy.pyboard as pyboard
 
 
-_board = None
+_ports = []
+_baud = 115200
+_delay = 0
+_open_boards = []
+_output_lock = threading.Lock()
 
 
 def windows_full_port_name(portname):
@@ -55,14 +62,149 @@ def windows_full_port_name(portname):
         return "\\\\.\\{0}".format(portname)
 
 
+def expand_ports(patterns):
+    """Expand the --port values into a list of unique port names.  Values
+    containing shell wildcards (e.g. /dev/ttyUSB*) are matched against the
+    filesystem, everything else is used as-is.
+    """
+    ports = []
+    for pattern in patterns:
+        # AMPY_PORT may hold several whitespace separated ports.
+        for name in pattern.split():
+            if glob.has_magic(name):
+                matches = sorted(glob.glob(name))
+                if not matches:
+                    raise click.BadParameter(
+                        "No serial port matches {0}".format(name), param_hint="--port"
+                    )
+            else:
+                matches = [name]
+            for match in matches:
+                if match not in ports:
+                    ports.append(match)
+    return ports
+
+
+def _open_board(port):
+    # On Windows fix the COM port path name for ports above 9 (see comment in
+    # windows_full_port_name function).
+    if platform.system() == "Windows":
+        port = windows_full_port_name(port)
+    board = pyboard.Pyboard(port, baudrate=_baud, rawdelay=_delay)
+    _open_boards.append(board)
+    return board
+
+
+def _close_board(board):
+    try:
+        _open_boards.remove(board)
+        board.close()
+    except:
+        # Best effort, same as the close at exit.
+        pass
+
+
+def _echo(message="", err=False, nl=True):
+    click.echo(message, err=err, nl=nl)
+
+
+class _PrefixedEcho(object):
+    """Echo replacement used when several boards run at once.  Every line of
+    output is prefixed with the port name and written under a lock so lines
+    from different boards never interleave.  Partial lines (nl=False) are
+    held back until they are completed or the board finishes.
+    """
+
+    def __init__(self, port):
+        self._prefix = "[{0}] ".format(port)
+        self._partial = {False: "", True: ""}
+
+    def __call__(self, message="", err=False, nl=True):
+        text = self._partial[err] + message + ("\n" if nl else "")
+        lines = text.split("\n")
+        self._partial[err] = lines.pop()
+        if lines:
+            self._emit(lines, err)
+
+    def flush(self):
+        for err in (False, True):
+            if self._partial[err]:
+                self._emit([self._partial[err]], err)
+                self._partial[err] = ""
+
+    def _emit(self, lines, err):
+        with _output_lock:
+            for line in lines:
+                click.echo(self._prefix + line, err=err)
+
+
+def _run_on_board(port, func, failures):
+    echo = _PrefixedEcho(port)
+    board = None
+    try:
+        board = _open_board(port)
+        func(board, echo, port)
+    except BaseException as ex:
+        # PyboardError derives from BaseException, so catch that too.
+        echo("Error: {0}".format(ex), err=True)
+        failures.append(port)
+    finally:
+        echo.flush()
+        if board is not None:
+            _close_board(board)
+
+
+def _run_on_boards(func):
+    """Run func(board, echo, port) against every board selected with --port.
+
+    With a single port this behaves like ampy always did: output is printed
+    as-is and errors propagate.  With several ports each board is driven from
+    its own thread, output is prefixed per port and the command exits with a
+    non-zero status if any of the boards failed.
+    """
+    if len(_ports) == 1:
+        func(_open_board(_ports[0]), _echo, _ports[0])
+        return
+    failures = []
+    workers = [
+        threading.Thread(target=_run_on_board, args=(port, func, failures))
+        for port in _ports
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if failures:
+        click.echo(
+            "{0} of {1} boards failed: {2}".format(
+                len(failures), len(_ports), ", ".join(sorted(failures))
+            ),
+            err=True,
+        )
+        sys.exit(1)
+
+
+def _local_name_for(local_file, port):
+    """Return the local file name to use for a board.  With several boards
+    the port name is inserted before the extension so files don't clash,
+    i.e. main.py from /dev/ttyUSB0 becomes main.ttyUSB0.py.
+    """
+    if len(_ports) == 1:
+        return local_file
+    root, ext = os.path.splitext(local_file)
+    tag = re.sub(r"[^A-Za-z0-9_-]+", "_", os.path.basename(port))
+    return "{0}.{1}{2}".format(root, tag, ext)
+
+
 @click.group()
 @click.option(
     "--port",
     "-p",
     envvar="AMPY_PORT",
     required=True,
+    multiple=True,
     type=click.STRING,
-    help="Name of serial port for connected board.  Can optionally specify with AMPY_PORT environment variable.",
+    help="Name of serial port for connected board.  Can be given several times or as a glob like /dev/ttyUSB* to run the command on many boards at once.  Can optionally specify with AMPY_PORT environment variable.",
     metavar="PORT",
 )
 @click.option(
@@ -90,18 +232,21 @@ def cli(port, baud, delay):
     Ampy is a tool to control MicroPython boards over a serial connection.  Using
     ampy you can manipulate files on the board's internal filesystem and even run
     scripts.
+
+    Several boards can be driven at once by repeating --port or passing a glob,
+    for example:
+
+      ampy --port '/dev/ttyUSB*' put main.py
     """
-    global _board
-    # On Windows fix the COM port path name for ports above 9 (see comment in
-    # windows_full_port_name function).
-    if platform.system() == "Windows":
-        port = windows_full_port_name(port)
-    _board = pyboard.Pyboard(port, baudrate=baud, rawdelay=delay)
+    global _ports, _baud, _delay
+    _ports = expand_ports(port)
+    _baud = baud
+    _delay = delay
 
 
 @cli.command()
 @click.argument("remote_file")
-@click.argument("local_file", type=click.File("wb"), required=False)
+@click.argument("local_file", type=click.Path(dir_okay=False), required=False)
 def get(remote_file, local_file):
     """
     Retrieve a file from the board.
@@ -120,15 +265,23 @@ def get(remote_file, local_file):
     Or to get main.py and save it as main.py locally run:
 
       ampy --port /board/serial/port get main.py main.py
+
+    When several ports are given the port name is added to the local file
+    name, i.e. main.py from /dev/ttyUSB0 is saved as main.ttyUSB0.py.
     """
-    # Get the file contents.
-    board_files = files.Files(_board)
-    contents = board_files.get(remote_file)
-    # Print the file out if no local file was provided, otherwise save it.
-    if local_file is None:
-        print(contents.decode("utf-8"))
-    else:
-        local_file.write(contents)
+
+    def get_from(board, echo, port):
+        # Get the file contents.
+        board_files = files.Files(board)
+        contents = board_files.get(remote_file)
+        # Print the file out if no local file was provided, otherwise save it.
+        if local_file is None:
+            echo(contents.decode("utf-8"))
+        else:
+            with open(_local_name_for(local_file, port), "wb") as outfile:
+                outfile.write(contents)
+
+    _run_on_boards(get_from)
 
 
 @cli.command()
@@ -151,9 +304,13 @@ def mkdir(directory, exists_okay):
 
       ampy --port /board/serial/port mkdir /code
     """
-    # Run the mkdir command.
-    board_files = files.Files(_board)
-    board_files.mkdir(directory, exists_okay=exists_okay)
+
+    def mkdir_on(board, echo, port):
+        # Run the mkdir command.
+        board_files = files.Files(board)
+        board_files.mkdir(directory, exists_okay=exists_okay)
+
+    _run_on_boards(mkdir_on)
 
 
 @cli.command()
@@ -189,10 +346,14 @@ def ls(directory, long_format, recursive):
 
       ampy --port /board/serial/port ls -l /foo/bar
     """
-    # List each file/directory on a separate line.
-    board_files = files.Files(_board)
-    for f in board_files.ls(directory, long_format=long_format, recursive=recursive):
-        print(f)
+
+    def ls_on(board, echo, port):
+        # List each file/directory on a separate line.
+        board_files = files.Files(board)
+        for f in board_files.ls(directory, long_format=long_format, recursive=recursive):
+            echo(f)
+
+    _run_on_boards(ls_on)
 
 
 @cli.command()
@@ -232,35 +393,39 @@ def put(local, remote):
     # Use the local filename if no remote filename is provided.
     if remote is None:
         remote = os.path.basename(os.path.abspath(local))
-    # Check if path is a folder and do recursive copy of everything inside it.
-    # Otherwise it's a file and should simply be copied over.
-    if os.path.isdir(local):
-        # Directory copy, create the directory and walk all children to copy
-        # over the files.
-        board_files = files.Files(_board)
-        for parent, child_dirs, child_files in os.walk(local):
-            # Create board filesystem absolute path to parent directory.
-            remote_parent = posixpath.normpath(
-                posixpath.join(remote, os.path.relpath(parent, local))
-            )
-            try:
-                # Create remote parent directory.
-                board_files.mkdir(remote_parent)
-                # Loop through all the files and put them on the board too.
-                for filename in child_files:
-                    with open(os.path.join(parent, filename), "rb") as infile:
-                        remote_filename = posixpath.join(remote_parent, filename)
-                        board_files.put(remote_filename, infile.read())
-            except files.DirectoryExistsError:
-                # Ignore errors for directories that already exist.
-                pass
 
-    else:
-        # File copy, open the file and copy its contents to the board.
-        # Put the file on the board.
-        with open(local, "rb") as infile:
-            board_files = files.Files(_board)
-            board_files.put(remote, infile.read())
+    def put_on(board, echo, port):
+        # Check if path is a folder and do recursive copy of everything inside it.
+        # Otherwise it's a file and should simply be copied over.
+        if os.path.isdir(local):
+            # Directory copy, create the directory and walk all children to copy
+            # over the files.
+            board_files = files.Files(board)
+            for parent, child_dirs, child_files in os.walk(local):
+                # Create board filesystem absolute path to parent directory.
+                remote_parent = posixpath.normpath(
+                    posixpath.join(remote, os.path.relpath(parent, local))
+                )
+                try:
+                    # Create remote parent directory.
+                    board_files.mkdir(remote_parent)
+                    # Loop through all the files and put them on the board too.
+                    for filename in child_files:
+                        with open(os.path.join(parent, filename), "rb") as infile:
+                            remote_filename = posixpath.join(remote_parent, filename)
+                            board_files.put(remote_filename, infile.read())
+                except files.DirectoryExistsError:
+                    # Ignore errors for directories that already exist.
+                    pass
+
+        else:
+            # File copy, open the file and copy its contents to the board.
+            # Put the file on the board.
+            with open(local, "rb") as infile:
+                board_files = files.Files(board)
+                board_files.put(remote, infile.read())
+
+    _run_on_boards(put_on)
 
 
 @cli.command()
@@ -277,9 +442,13 @@ def rm(remote_file):
 
       ampy --port /board/serial/port rm main.py
     """
-    # Delete the provided file/directory on the board.
-    board_files = files.Files(_board)
-    board_files.rm(remote_file)
+
+    def rm_on(board, echo, port):
+        # Delete the provided file/directory on the board.
+        board_files = files.Files(board)
+        board_files.rm(remote_file)
+
+    _run_on_boards(rm_on)
 
 
 @cli.command()
@@ -299,9 +468,13 @@ def rmdir(remote_folder, missing_okay):
 
       ampy --port /board/serial/port rmdir adafruit_library
     """
-    # Delete the provided file/directory on the board.
-    board_files = files.Files(_board)
-    board_files.rmdir(remote_folder, missing_okay=missing_okay)
+
+    def rmdir_on(board, echo, port):
+        # Delete the provided file/directory on the board.
+        board_files = files.Files(board)
+        board_files.rmdir(remote_folder, missing_okay=missing_okay)
+
+    _run_on_boards(rmdir_on)
 
 
 @cli.command()
@@ -331,16 +504,18 @@ def run(local_file, no_output):
 
       ampy --port /board/serial/port run --no-output test.py
     """
-    # Run the provided file and print its output.
-    board_files = files.Files(_board)
-    try:
-        output = board_files.run(local_file, not no_output)
-        if output is not None:
-            print(output.decode("utf-8"), end="")
-    except IOError:
-        click.echo(
-            "Failed to find or read input file: {0}".format(local_file), err=True
-        )
+
+    def run_on(board, echo, port):
+        # Run the provided file and print its output.
+        board_files = files.Files(board)
+        try:
+            output = board_files.run(local_file, not no_output)
+            if output is not None:
+                echo(output.decode("utf-8"), nl=False)
+        except IOError:
+            echo("Failed to find or read input file: {0}".format(local_file), err=True)
+
+    _run_on_boards(run_on)
 
 
 @cli.command()
@@ -374,54 +549,58 @@ def reset(mode):
 
       ampy --port /board/serial/port reset
     """
-    _board.enter_raw_repl()
-    if mode == "SOFT":
-        _board.exit_raw_repl()
-        return
 
-    _board.exec_(
-        """if 1:
-        def on_next_reset(x):
-            try:
-                import microcontroller
-            except:
-                if x == 'NORMAL': return ''
-                return 'Reset mode only supported on CircuitPython'
-            try:
-                microcontroller.on_next_reset(getattr(microcontroller.RunMode, x))
-            except ValueError as e:
-                return str(e)
-            return ''
-        def reset():
-            try:
-                import microcontroller
-            except:
-                import machine as microcontroller
-            microcontroller.reset()
-    """
-    )
-    r = _board.eval("on_next_reset({})".format(repr(mode)))
-    print("here we are", repr(r))
-    if r:
-        click.echo(r, err=True)
-        return
+    def reset_on(board, echo, port):
+        board.enter_raw_repl()
+        if mode == "SOFT":
+            board.exit_raw_repl()
+            return
+
+        board.exec_(
+            """if 1:
+            def on_next_reset(x):
+                try:
+                    import microcontroller
+                except:
+                    if x == 'NORMAL': return ''
+                    return 'Reset mode only supported on CircuitPython'
+                try:
+                    microcontroller.on_next_reset(getattr(microcontroller.RunMode, x))
+                except ValueError as e:
+                    return str(e)
+                return ''
+            def reset():
+                try:
+                    import microcontroller
+                except:
+                    import machine as microcontroller
+                microcontroller.reset()
+        """
+        )
+        r = board.eval("on_next_reset({})".format(repr(mode)))
+        echo("here we are " + repr(r))
+        if r:
+            echo(r, err=True)
+            return
 
-    try:
-        _board.exec_("reset()")
-    except serial.serialutil.SerialException as e:
-        # An error is expected to occur, as the board should disconnect from
-        # serial when restarted via microcontroller.reset()
-        pass
+        try:
+            board.exec_("reset()")
+        except serial.serialutil.SerialException as e:
+            # An error is expected to occur, as the board should disconnect from
+            # serial when restarted via microcontroller.reset()
+            pass
+
+    _run_on_boards(reset_on)
 
 
 if __name__ == "__main__":
     try:
         cli()
     finally:
-        # Try to ensure the board serial connection is always gracefully closed.
-        if _board is not None:
+        # Try to ensure the board serial connections are always gracefully closed.
+        for board in list(_open_boards):
             try:
-                _board.close()
+                board.close()
             except:
                 # Swallow errors when attempting to close as it's just a best effort
                 # and shouldn't cause a new error or problem if the connection can't
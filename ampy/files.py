@@ -20,7 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import ast
+import collections
 import textwrap
+import time
 
 from ampy.pyboard import PyboardError
 
@@ -29,6 +31,13 @@ BUFFER_SIZE = 32  # Amount of data to read or write to the serial port at a time
 # This is kept small because small chips and USB to serial
 # bridges usually have very small buffers.
 
+# Progress of a file transfer, passed to the progress_callback of Files.
+# Same fields as esptool.ProgressEvent: done and total are bytes, rate is
+# bytes per second, eta seconds (None while unknown), device the serial port.
+ProgressEvent = collections.namedtuple('ProgressEvent', 'phase done total rate eta device')
+
+PHASE_UPLOAD = 'upload'
+
 
 class DirectoryExistsError(Exception):
     pass
@@ -40,13 +49,25 @@ class Files(object):
     board's filesystem.
     """
 
-    def __init__(self, pyboard):
+    def __init__(self, pyboard, progress_callback=None):
         """Initialize the MicroPython board files class using the provided pyboard
         instance.  In most cases you should create a Pyboard instance (from
         pyboard.py) which connects to a board over a serial connection and pass
         it in, but you can pass in other objects for testing, etc.
+        If given, progress_callback is called with a ProgressEvent while
+        files are uploaded.
         """
         self._pyboard = pyboard
+        self.progress_callback = progress_callback
+
+    def _report_progress(self, phase, done, total, started):
+        if self.progress_callback is None:
+            return
+        elapsed = time.time() - started
+        rate = done / float(elapsed) if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else None
+        device = getattr(getattr(self._pyboard, "serial", None), "port", None)
+        self.progress_callback(ProgressEvent(phase, done, total, rate, eta, device))
 
     def get(self, filename):
         """Retrieve the contents of the specified file and return its contents
@@ -208,6 +229,7 @@ class Files(object):
         self._pyboard.enter_raw_repl()
         self._pyboard.exec_("f = open('{0}', 'wb')".format(filename))
         size = len(data)
+        started = time.time()
         # Loop through and write a buffer size chunk of data at a time.
         for i in range(0, size, BUFFER_SIZE):
             chunk_size = min(BUFFER_SIZE, size - i)
@@ -216,6 +238,7 @@ class Files(object):
             if not chunk.startswith("b"):
                 chunk = "b" + chunk
             self._pyboard.exec_("f.write({0})".format(chunk))
+            self._report_progress(PHASE_UPLOAD, i + chunk_size, size, started)
         self._pyboard.exec_("f.close()")
         self._pyboard.exit_raw_repl()
 
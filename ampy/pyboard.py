@@ -42,6 +42,8 @@ import time
 
 _rawdelay = None
 
+REPLY_TIMEOUT_FLOOR = 0.3  # least timeout for a prompt, however fast the board answered before
+
 try:
     stdout = sys.stdout.buffer
 except AttributeError:
@@ -119,9 +121,15 @@ class TelnetToSerial:
             return n_waiting
 
 class Pyboard:
-    def __init__(self, device, baudrate=115200, user='micro', password='python', wait=0, rawdelay=0):
+    def __init__(self, device, baudrate=115200, user='micro', password='python', wait=0, rawdelay=0,
+                 reply_times=None):
         global _rawdelay
         _rawdelay = rawdelay
+        # optional estimates of how long the board takes to show each prompt,
+        # a dict of prompt: object with record(seconds) and bound(floor) (like
+        # a defaultdict of esptool.LatencyEstimate): prompts are then waited
+        # for just as long as the board needs, not 10 seconds
+        self.reply_times = reply_times
         if device and device[0].isdigit() and device[-1].isdigit() and device.count('.') == 3:
             # device looks like an IP address
             self.serial = TelnetToSerial(device, user, password, read_timeout=10)
@@ -151,27 +159,44 @@ class Pyboard:
     def close(self):
         self.serial.close()
 
-    def read_until(self, min_num_bytes, ending, timeout=10, data_consumer=None):
-        data = self.serial.read(min_num_bytes)
-        if data_consumer:
-            data_consumer(data)
-        timeout_count = 0
-        while True:
-            if data.endswith(ending):
-                break
-            elif self.serial.inWaiting() > 0:
+    def read_until(self, min_num_bytes, ending, timeout=10, data_consumer=None, max_num_bytes=None):
+        # timeout is in seconds without new data, the first bytes included: a
+        # board that does not answer at all must not block in serial.read()
+        data = b''
+        last_data = time.time()
+        while (len(data) < min_num_bytes or not data.endswith(ending)) and \
+                (max_num_bytes is None or len(data) < max_num_bytes):
+            if self.serial.inWaiting() > 0:
                 new_data = self.serial.read(1)
                 data = data + new_data
                 if data_consumer:
                     data_consumer(new_data)
-                timeout_count = 0
+                last_data = time.time()
+            elif timeout is not None and time.time() - last_data >= timeout:
+                break
             else:
-                timeout_count += 1
-                if timeout is not None and timeout_count >= 100 * timeout:
-                    break
                 time.sleep(0.01)
         return data
 
+    def read_prompt(self, ending, timeout=10, exact=False):
+        """read_until ending, a prompt the board shows right after what was
+        written to it.  Waits as long as reply_times expects at most for
+        this prompt, if set, and records the time it took.  A prompt that
+        was already waiting says nothing about the board, it is not
+        recorded.  With exact, the reply is the prompt and nothing else:
+        reading stops after len(ending) bytes."""
+        max_num_bytes = len(ending) if exact else None
+        if self.reply_times is None:
+            return self.read_until(len(ending), ending, timeout=timeout, max_num_bytes=max_num_bytes)
+        reply_time = self.reply_times[ending]
+        timeout = min(timeout, reply_time.bound(REPLY_TIMEOUT_FLOOR) or timeout)
+        waiting = self.serial.inWaiting() > 0
+        start = time.time()
+        data = self.read_until(len(ending), ending, timeout=timeout, max_num_bytes=max_num_bytes)
+        if not waiting and data.endswith(ending):
+            reply_time.record(time.time() - start)
+        return data
+
     def enter_raw_repl(self):
         # Brief delay before sending RAW MODE char if requests
         if _rawdelay > 0:
@@ -186,6 +211,7 @@ class Pyboard:
             n = self.serial.inWaiting()
 
         self.serial.write(b'\r\x01') # ctrl-A: enter raw REPL
+        # not read_prompt: the board may still be busy stopping the program
         data = self.read_until(1, b'raw REPL; CTRL-B to exit\r\n>')
         if not data.endswith(b'raw REPL; CTRL-B to exit\r\n>'):
             print(data)
@@ -237,7 +263,7 @@ class Pyboard:
             command_bytes = bytes(command, encoding='utf8')
 
         # check we have a prompt
-        data = self.read_until(1, b'>')
+        data = self.read_prompt(b'>')
         if not data.endswith(b'>'):
             raise PyboardError('could not enter raw repl')
 
@@ -248,7 +274,7 @@ class Pyboard:
         self.serial.write(b'\x04')
 
         # check if we could exec command
-        data = self.serial.read(2)
+        data = self.read_prompt(b'OK', exact=True)
         if data != b'OK':
             raise PyboardError('could not exec command')
 
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Flash write throughput against block size on clean and noisy links.
+
+Writes an image to a simulated ESP (see esp_sim.py) over a simulated
+serial link that corrupts bytes at a given rate, once for every fixed
+block size and once with the block size esptool picks itself
+(ESPLoader.flash_write_size), and prints the effective throughput.  Large
+blocks win on a clean link, on a noisy one their retransmits cost more
+than the per block overhead saved and writes start failing outright.
+The fixed sizes are kept even then, the automatic choice writes the rest
+in smaller blocks.
+
+The automatic choice needs some blocks to learn the link from, like the
+stub upload of a real session, so its session writes a small warm up
+image first.
+
+Example usage:
+
+    python benchmarks/block_size.py
+    python benchmarks/block_size.py --baud 460800 --latency 0.004 --error-rates 0 1e-4
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from argparse import Namespace
+
+import esp_sim
+import esptool
+
+KB = 1024
+
+
+class FixedBlockLoader(esptool.ESP8266StubLoader):
+    block_size = None
+
+    def __init__(self, rom, block_size):
+        esptool.ESP8266StubLoader.__init__(self, rom)
+        self.block_size = block_size
+        self.MIN_FLASH_WRITE_SIZE = block_size  # no smaller blocks after failures either
+
+    def flash_write_size(self):
+        return self.block_size
+
+
+def write_args(path):
+    args = Namespace()
+    args.flash_size = '4MB'
+    args.flash_mode = 'keep'
+    args.flash_freq = 'keep'
+    args.compress = False
+    args.no_compress = True
+    args.no_stub = False
+    args.verify = False
+    args.addr_filename = [(0, open(path, 'rb'))]
+    return args
+
+
+def write(esp, path):
+    """Return seconds write_flash of path took, None if it failed."""
+    args = write_args(path)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        start = time.time()
+        esptool.write_flash(esp, args)
+        return time.time() - start
+    except esptool.FatalError:
+        return None
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+        args.addr_filename[0][1].close()
+
+
+def run(options, error_rate, block_size, image, warm_up):
+    port = esp_sim.SimulatedESP(baudrate=options.baud, simulate_link=True, latency=options.latency,
+                                error_rate=error_rate, seed=options.seed)
+    rom = esptool.ESP8266ROM(port, port.baudrate)
+    if block_size is None:
+        esp = esptool.ESP8266StubLoader(rom)
+        write(esp, warm_up)
+    else:
+        esp = FixedBlockLoader(rom, block_size)
+    chosen = esp.flash_write_size()
+    return write(esp, image), chosen
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure flash write throughput per block size and error rate')
+    parser.add_argument('--baud', type=int, default=921600)
+    parser.add_argument('--latency', help='Response latency of the link in seconds', type=float, default=0.002)
+    parser.add_argument('--size', help='Image size in KB', type=int, default=128)
+    parser.add_argument('--error-rates', help='Probabilities of a corrupted byte', type=float, nargs='+',
+                        default=[0, 2e-5, 1e-4, 2e-4])
+    parser.add_argument('--seed', help='Seed of the simulated noise', type=int, default=0)
+    options = parser.parse_args()
+
+    sizes = []
+    size = esptool.ESP8266StubLoader.FLASH_WRITE_SIZE
+    while size >= esptool.ESP8266StubLoader.MIN_FLASH_WRITE_SIZE:
+        sizes.insert(0, size)
+        size //= 2
+
+    tmpdir = tempfile.mkdtemp()
+    image = os.path.join(tmpdir, 'image.bin')
+    warm_up = os.path.join(tmpdir, 'warm-up.bin')
+    with open(image, 'wb') as f:
+        f.write(b'\x00' + os.urandom(options.size * KB - 1))
+    with open(warm_up, 'wb') as f:
+        f.write(b'\x00' + os.urandom(32 * KB - 1))
+    try:
+        print("%d KB at %d baud, %.1f ms latency, throughput in kbit/s" %
+              (options.size, options.baud, options.latency * 1000))
+        print("%-10s" % "errors/B" + "".join("%8d" % s for s in sizes) + "%14s" % "auto")
+        for error_rate in options.error_rates:
+            row = "%-10g" % error_rate
+            for block_size in sizes:
+                elapsed, _ = run(options, error_rate, block_size, image, warm_up)
+                row += "%8s" % ("failed" if elapsed is None else "%.0f" % (options.size * KB * 8 / elapsed / 1000))
+            elapsed, chosen = run(options, error_rate, None, image, warm_up)
+            row += "%14s" % ("%s (%d)" % ("failed" if elapsed is None else "%.0f" % (options.size * KB * 8 / elapsed / 1000),
+                                          chosen))
+            print(row)
+    finally:
+        os.remove(image)
+        os.remove(warm_up)
+        os.rmdir(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
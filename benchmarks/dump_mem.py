@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Memory dump speed, one READ_REG round trip per word against pipelined
+READ_REGs (ESPLoader.read_regs), over a simulated serial link.
+
+Example usage:
+
+    python benchmarks/dump_mem.py
+    python benchmarks/dump_mem.py --baud 921600 --latency 0.004 --size 4096
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import time
+
+import esp_sim
+
+ADDRESS = 0x3ffe8000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per word and pipelined memory reads')
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--latency', help='Response latency of the link in seconds', type=float, default=0.002)
+    parser.add_argument('--size', help='Bytes to read', type=int, default=2048)
+    args = parser.parse_args()
+
+    port = esp_sim.SimulatedESP(baudrate=args.baud, simulate_link=True, latency=args.latency)
+    esp = esp_sim.connect(port)
+    addresses = range(ADDRESS, ADDRESS + args.size // 4 * 4, 4)
+
+    start = time.time()
+    for addr in addresses:
+        esp.read_reg(addr)
+    per_word = time.time() - start
+
+    start = time.time()
+    esp.read_regs(addresses)
+    pipelined = time.time() - start
+
+    print("%d bytes at %d baud, %.1f ms latency" % (args.size, args.baud, args.latency * 1000))
+    print("read_reg per word: %6.2f s (%6.0f bytes/s)" % (per_word, args.size / per_word))
+    print("read_regs:         %6.2f s (%6.0f bytes/s)" % (pipelined, args.size / pipelined))
+
+
+if __name__ == '__main__':
+    main()
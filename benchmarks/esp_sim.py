@@ -0,0 +1,210 @@
+# coding=utf-8
+
+"""
+Simulated ESP8266 running the esptool flasher stub, for benchmarks.
+
+SimulatedESP looks like a pyserial port to esptool: SLIP frames written to
+it are decoded and answered the way the stub loader does, flash writes land
+in an in-memory flash image so the MD5 checks after writing pass or fail
+for real, and SPI flash commands run through the SPI registers (flash_id,
+read_status) get a reply.  Optionally the serial link is simulated too: a frame reaches
+the chip after its time on the wire at the given baud rate, and its
+response can be read once it has travelled back plus a fixed latency
+(USB bridge turnaround).  Writes do not block, like with a real port
+buffer, so requests sent ahead of their responses overlap.  A noisy link
+corrupts each byte of a data block with probability error_rate, the block
+is then rejected with a checksum error like the stub does.
+
+Example usage:
+
+    port = SimulatedESP()
+    esp = connect(port)
+    esptool.write_flash(esp, args)
+"""
+
+from __future__ import division
+
+import collections
+import hashlib
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import esptool  # noqa: E402
+
+L = esptool.ESPLoader
+
+SPI_CMD_REG = esptool.ESP8266ROM.SPI_REG_BASE
+SPI_USR2_REG = SPI_CMD_REG + 0x24
+SPI_W0_REG = SPI_CMD_REG + esptool.ESP8266ROM.SPI_W0_OFFS
+SPI_CMD_USR = 1 << 18
+DATA_OPS = (L.ESP_MEM_DATA, L.ESP_FLASH_DATA, L.ESP_FLASH_DEFL_DATA)
+SPI_REPLIES = {
+    0x9F: 0x1640ef,  # RDID: Winbond, 4MB
+    0x05: 0x00,  # RDSR
+    0x35: 0x00,  # RDSR2
+}
+
+
+def slip_encode(packet):
+    return b'\xc0' + packet.replace(b'\xdb', b'\xdb\xdd').replace(b'\xc0', b'\xdb\xdc') + b'\xc0'
+
+
+class SimulatedESP(object):
+    def __init__(self, flash_size=4 * 1024 * 1024, baudrate=115200, simulate_link=False, latency=0.0,
+                 error_rate=0.0, seed=0, port='sim://esp8266'):
+        self.flash = bytearray(b'\xff' * flash_size)
+        self.port = port
+        self.timeout = esptool.DEFAULT_TIMEOUT
+        self.baudrate = baudrate
+        self.simulate_link = simulate_link
+        self.latency = latency  # seconds added to every response
+        self.error_rate = error_rate  # probability of a corrupted byte in a data block
+        self.bad_blocks = 0
+        self._random = random.Random(seed)
+        self.registers = {}
+        self.frames_received = 0
+        self.bytes_received = 0
+        self._rx = bytearray()  # undecoded bytes written by the host
+        self._tx = bytearray()  # bytes the host can read
+        self._in_flight = collections.deque()  # (time readable, bytes) still on the way to the host
+        self._link_free_at = 0  # when the host to chip direction is idle again
+        self._reply_free_at = 0  # same for the chip to host direction
+        self._now = 0  # arrival time of the frame being handled
+        self._write_pos = 0
+        self._block_size = 0
+        self._inflate = None
+
+    # pyserial interface used by esptool
+    def _arrived(self):
+        now = time.time()
+        while self._in_flight and self._in_flight[0][0] <= now:
+            self._tx += self._in_flight.popleft()[1]
+
+    def inWaiting(self):
+        self._arrived()
+        return len(self._tx)
+
+    in_waiting = property(inWaiting)
+
+    def read(self, size=1):
+        self._arrived()
+        if not self._tx and self._in_flight:
+            wait = self._in_flight[0][0] - time.time()
+            if self.timeout is None or wait <= self.timeout:
+                time.sleep(max(wait, 0))
+                self._arrived()
+        data = bytes(self._tx[:size])
+        del self._tx[:size]
+        return data
+
+    def write(self, data):
+        self.bytes_received += len(data)
+        if self.simulate_link:
+            # the frame reaches the chip after its time on the wire
+            self._link_free_at = max(time.time(), self._link_free_at) + len(data) * 10 / self.baudrate
+            self._now = self._link_free_at
+        self._rx += data
+        while True:
+            start = self._rx.find(b'\xc0')
+            end = self._rx.find(b'\xc0', start + 1)
+            if start < 0 or end < 0:
+                break
+            frame = bytes(self._rx[start + 1:end])
+            del self._rx[:end + 1]
+            if frame:
+                frame = frame.replace(b'\xdb\xdc', b'\xc0').replace(b'\xdb\xdd', b'\xdb')
+                self._handle(frame)
+        return len(data)
+
+    def flushInput(self):
+        del self._tx[:]
+        self._in_flight.clear()
+
+    reset_input_buffer = flushInput
+
+    def close(self):
+        pass
+
+    # stub loader
+    def _reply(self, op, value=0, data=b'', error=0):
+        packet = struct.pack('<BBHI', 1, op, len(data) + 2, value) + data + struct.pack('BB', error, 0)
+        self._send(packet)
+
+    def _send(self, packet):
+        frame = slip_encode(packet)
+        if not self.simulate_link:
+            self._tx += frame
+            return
+        self._reply_free_at = max(self._now, self._reply_free_at) + len(frame) * 10 / self.baudrate
+        self._in_flight.append((self._reply_free_at + self.latency, frame))
+
+    def _handle(self, frame):
+        self.frames_received += 1
+        if len(frame) < 8 or frame[0:1] != b'\x00':
+            return  # acks of read_flash and noise
+        _, op, size, _ = struct.unpack('<BBHI', frame[:8])
+        data = frame[8:8 + size]
+        if op in DATA_OPS and self.error_rate and self._random.random() >= (1 - self.error_rate) ** len(frame):
+            self.bad_blocks += 1
+            self._reply(op, error=1)  # checksum mismatch, the block is dropped
+            return
+        if op in (L.ESP_FLASH_BEGIN, L.ESP_FLASH_DEFL_BEGIN):
+            _, _, self._block_size, self._write_pos = struct.unpack('<IIII', data[:16])
+            self._inflate = zlib.decompressobj() if op == L.ESP_FLASH_DEFL_BEGIN else None
+        elif op == L.ESP_FLASH_DATA:
+            length, seq = struct.unpack('<II', data[:8])
+            self._store(self._write_pos + seq * self._block_size, data[16:16 + length])
+        elif op == L.ESP_FLASH_DEFL_DATA:
+            chunk = self._inflate.decompress(data[16:])
+            self._store(self._write_pos, chunk)
+            self._write_pos += len(chunk)
+        elif op == L.ESP_SPI_FLASH_MD5:
+            addr, length = struct.unpack('<II', data[:8])
+            self._reply(op, data=hashlib.md5(self.flash[addr:addr + length]).digest())
+            return
+        elif op == L.ESP_READ_REG:
+            addr, = struct.unpack('<I', data[:4])
+            self._reply(op, value=self.registers.get(addr, 0))
+            return
+        elif op == L.ESP_WRITE_REG:
+            addr, value, mask, _ = struct.unpack('<IIII', data[:16])
+            old = self.registers.get(addr, 0)
+            self.registers[addr] = (old & ~mask) | (value & mask)
+            if addr == SPI_CMD_REG:
+                self._spi_command()
+        elif op == L.ESP_ERASE_FLASH:
+            self.flash[:] = b'\xff' * len(self.flash)
+        elif op == L.ESP_ERASE_REGION:
+            offset, length = struct.unpack('<II', data[:8])
+            self.flash[offset:offset + length] = b'\xff' * length
+        elif op == L.ESP_READ_FLASH:
+            offset, length, _, _ = struct.unpack('<IIII', data[:16])
+            self._reply(op)
+            content = bytes(self.flash[offset:offset + length])
+            for i in range(0, length, L.FLASH_SECTOR_SIZE):
+                self._send(content[i:i + L.FLASH_SECTOR_SIZE])
+            self._send(hashlib.md5(content).digest())
+            return
+        self._reply(op)
+
+    def _spi_command(self):
+        # the user command set up in the SPI registers completes at once
+        self.registers[SPI_CMD_REG] &= ~SPI_CMD_USR
+        command = self.registers.get(SPI_USR2_REG, 0) & 0xFF
+        if command in SPI_REPLIES:
+            self.registers[SPI_W0_REG] = SPI_REPLIES[command]
+
+    def _store(self, offset, data):
+        self.flash[offset:offset + len(data)] = data
+
+
+def connect(port):
+    """Return a stub loader talking to the simulated port, skipping the
+    reset, sync and stub upload of a real board."""
+    return esptool.ESP8266StubLoader(esptool.ESP8266ROM(port, port.baudrate))
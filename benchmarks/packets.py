@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Microbenchmarks of esptool packet encoding.
+
+Times ESPLoader.checksum against the per-byte implementation it replaced,
+on flash write blocks of the ROM (1 KB) and stub (16 KB) loaders, and the
+checksum of a whole image (BaseFirmwareImage.calculate_checksum).
+
+Example usage:
+
+    python benchmarks/packets.py
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import esptool  # noqa: E402
+
+
+def old_checksum(data, state=esptool.ESPLoader.ESP_CHECKSUM_MAGIC):
+    for b in data:
+        if type(b) is int:  # python 2/3 compat
+            state ^= b
+        else:
+            state ^= ord(b)
+    return state
+
+
+def best_of(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def main():
+    data = zlib.compress(os.urandom(1024 * 1024), 9)
+
+    print("%-22s %8s %12s %12s %8s" % ("operation", "bytes", "old us", "new us", "speedup"))
+    for size in (esptool.ESPLoader.FLASH_WRITE_SIZE, esptool.ESP8266StubLoader.FLASH_WRITE_SIZE):
+        block = data[:size]
+        assert old_checksum(block) == esptool.ESPLoader.checksum(block)
+        old = best_of(lambda: old_checksum(block), 200)
+        new = best_of(lambda: esptool.ESPLoader.checksum(block), 200)
+        print("%-22s %8d %12.1f %12.1f %7.1fx" % ("checksum", size, old * 1e6, new * 1e6, old / new))
+
+    image = esptool.ESPFirmwareImage()
+    image.segments = [esptool.ImageSegment(0x40100000, data[:512 * 1024]),
+                      esptool.ImageSegment(0x3ffe8000, data[512 * 1024:1024 * 1024])]
+    new = best_of(image.calculate_checksum, 5)
+    old = best_of(lambda: [old_checksum(seg.data) for seg in image.segments], 5)
+    print("%-22s %8d %12.1f %12.1f %7.1fx" % ("image checksum", 1024 * 1024, old * 1e6, new * 1e6, old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+SPI flash command speed, a register round trip per access against the
+RegisterBatch of ESPLoader.run_spiflash_commands, over a simulated serial
+link.
+
+Example usage:
+
+    python benchmarks/spiflash.py
+    python benchmarks/spiflash.py --baud 921600 --latency 0.004
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import struct
+import time
+
+import esp_sim
+import esptool
+
+
+class UnbatchedLoader(esptool.ESP8266StubLoader):
+    """Runs every register access of a batch as its own round trip, like
+    run_spiflash_command did before batching."""
+
+    def run_spiflash_commands(self, commands):
+        saved = esptool.RegisterBatch.run
+        esptool.RegisterBatch.run = run_unbatched
+        try:
+            return esptool.ESP8266StubLoader.run_spiflash_commands(self, commands)
+        finally:
+            esptool.RegisterBatch.run = saved
+
+
+def run_unbatched(batch):
+    requests, batch._requests, batch._reads = batch._requests, [], 0
+    values = []
+    for op, payload, addr in requests:
+        if op == esptool.ESPLoader.ESP_READ_REG:
+            values.append(batch._loader.read_reg(addr))
+        else:
+            batch._loader.write_reg(*struct.unpack('<IIII', payload))
+    return values
+
+
+def timed(func, runs):
+    start = time.time()
+    for _ in range(runs):
+        func()
+    return (time.time() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per register and batched SPI flash commands')
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--latency', help='Response latency of the link in seconds', type=float, default=0.002)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    port = esp_sim.SimulatedESP(baudrate=args.baud, simulate_link=True, latency=args.latency)
+    batched = esp_sim.connect(port)
+    unbatched = UnbatchedLoader(esptool.ESP8266ROM(port, port.baudrate))
+
+    print("%d baud, %.1f ms latency" % (args.baud, args.latency * 1000))
+    print("%-14s %14s %14s" % ("operation", "per access ms", "batched ms"))
+    for name, call in (("flash_id", lambda esp: esp.flash_id()),
+                       ("read_status", lambda esp: esp.read_status(2)),
+                       ("write_status", lambda esp: esp.write_status(0, 2))):
+        assert call(unbatched) == call(batched)
+        old = timed(lambda: call(unbatched), args.runs)
+        new = timed(lambda: call(batched), args.runs)
+        print("%-14s %14.1f %14.1f" % (name, old * 1000, new * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Cold start benchmark of the config tool.
+
+Imports each entry module in a fresh interpreter a number of times and
+prints the median wall time, so a change that drags a heavy import back
+into the start path shows up.  Modules whose dependencies are missing
+(wx on a build server, say) are skipped.
+
+Example usage:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 Main headless
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ['Main', 'headless', 'engine', 'esptool', 'images']
+
+# Runs in the child: time the import and report which heavy modules came along
+CHILD = """
+import sys, time
+start = time.time()
+import %s
+elapsed = time.time() - start
+heavy = [m for m in ('wx', 'esptool', 'images', 'ampy.pyboard') if m in sys.modules]
+print('%%f %%s' %% (elapsed, ','.join(heavy)))
+"""
+
+
+def time_import(module):
+    """Return (seconds, heavy modules loaded) of one cold import of module,
+    or None if it cannot be imported here.
+    """
+    proc = subprocess.Popen([sys.executable, '-c', CHILD % module], cwd=ROOT,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = proc.communicate()
+    if proc.returncode != 0:
+        return None
+    elapsed, _, heavy = out.decode().strip().rpartition('\n')[2].partition(' ')
+    return float(elapsed), heavy
+
+
+def median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold import time of the config tool modules')
+    parser.add_argument('--runs', '-n', help='Imports per module', type=int, default=10)
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    args = parser.parse_args()
+
+    print("%-10s %10s  %s" % ("module", "median ms", "heavy modules loaded"))
+    for module in args.modules:
+        results = []
+        for _ in range(args.runs):
+            result = time_import(module)
+            if result is None:
+                break
+            results.append(result)
+        if not results:
+            print("%-10s %10s" % (module, "skipped"))
+            continue
+        print("%-10s %10.1f  %s" % (module, median([r[0] for r in results]) * 1000, results[-1][1] or "-"))
+
+
+if __name__ == '__main__':
+    main()
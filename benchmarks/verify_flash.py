@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+verify_flash --diff with a few bad sectors: reading the whole region back
+against bisecting it with MD5 commands and reading only the bad sectors
+(esptool.find_bad_ranges), over a simulated serial link.
+
+The simulated chip hashes instantly, a real one takes MD5_TIMEOUT_PER_MB
+at worst, so the MD5 commands cost more on hardware than here.
+
+Example usage:
+
+    python benchmarks/verify_flash.py
+    python benchmarks/verify_flash.py --baud 115200 --size 256 --bad 3
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import os
+import random
+import time
+
+import esp_sim
+import esptool
+
+KB = 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare full read back and MD5 bisection of a flash region')
+    parser.add_argument('--baud', type=int, default=921600)
+    parser.add_argument('--latency', help='Response latency of the link in seconds', type=float, default=0.002)
+    parser.add_argument('--size', help='Region size in KB', type=int, default=1024)
+    parser.add_argument('--bad', help='Number of corrupted sectors', type=int, default=1)
+    args = parser.parse_args()
+
+    image = os.urandom(args.size * KB)
+    port = esp_sim.SimulatedESP(baudrate=args.baud, simulate_link=True, latency=args.latency)
+    port.flash[:len(image)] = image
+    sectors = len(image) // esptool.ESPLoader.FLASH_SECTOR_SIZE
+    for sector in random.sample(range(sectors), args.bad):
+        port.flash[sector * esptool.ESPLoader.FLASH_SECTOR_SIZE + 100] ^= 0xff
+    esp = esp_sim.connect(port)
+
+    start = time.time()
+    flash = esp.read_flash(0, len(image))
+    full = time.time() - start
+    full_runs = esptool.diff_runs(flash, image)
+
+    frames = port.frames_received
+    start = time.time()
+    runs = []
+    for range_start, range_end in esptool.find_bad_ranges(esp, 0, image):
+        flash = esp.read_flash(range_start, range_end - range_start)
+        runs += [(range_start + s, range_start + e) for s, e in esptool.diff_runs(flash, image[range_start:range_end])]
+    bisect = time.time() - start
+    assert runs == full_runs
+
+    print("%d KB at %d baud, %.1f ms latency, %d bad sectors" % (args.size, args.baud, args.latency * 1000, args.bad))
+    print("full read back: %7.2f s" % full)
+    print("bisection:      %7.2f s (%d frames sent)" % (bisect, port.frames_received - frames))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Host side CPU cost of esptool.write_flash.
+
+Writes images of a few sizes to a simulated ESP (see esp_sim.py, no serial
+link delays) and prints the process CPU time spent per megabyte, with and
+without compression.  Also times the block slicing alone, the old way
+(image = image[block_size:], copying the rest of the image every block)
+against slicing at offsets.
+
+Example usage:
+
+    python benchmarks/write_flash.py
+    python benchmarks/write_flash.py --sizes 1 4
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import os
+import sys
+import tempfile
+from argparse import Namespace
+
+import esp_sim
+import esptool
+
+try:
+    from time import process_time as cpu_time
+except ImportError:  # Python 2
+    from time import clock as cpu_time
+
+MB = 1024 * 1024
+
+
+def make_image(path, size):
+    with open(path, 'wb') as f:
+        # half random, half compressible, and no image header at offset 0
+        f.write(b'\x00' + os.urandom(size // 2 - 1) + b'\x5a' * (size - size // 2))
+
+
+def write_args(path, compress):
+    args = Namespace()
+    args.flash_size = '4MB'
+    args.flash_mode = 'keep'
+    args.flash_freq = 'keep'
+    args.compress = compress
+    args.no_compress = not compress
+    args.no_stub = False
+    args.verify = False
+    args.addr_filename = [(0, open(path, 'rb'))]
+    return args
+
+
+def time_write_flash(path, compress):
+    port = esp_sim.SimulatedESP()
+    esp = esp_sim.connect(port)
+    args = write_args(path, compress)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        start = cpu_time()
+        esptool.write_flash(esp, args)
+        return cpu_time() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+        args.addr_filename[0][1].close()
+
+
+def time_slicing(size, block_size):
+    image = b'\x5a' * size
+    start = cpu_time()
+    while len(image) > 0:
+        block = image[0:block_size]
+        image = image[block_size:]
+    old = cpu_time() - start
+    image = b'\x5a' * size
+    start = cpu_time()
+    for seq, block in esptool.iter_blocks(image, block_size):
+        pass
+    return old, cpu_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure host CPU time of write_flash per MB')
+    parser.add_argument('--sizes', help='Image sizes in MB', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        print("%8s %18s %18s" % ("size", "raw CPU s/MB", "compressed CPU s/MB"))
+        for size in args.sizes:
+            path = os.path.join(tmpdir, 'image-%d.bin' % size)
+            make_image(path, size * MB)
+            raw = time_write_flash(path, False)
+            compressed = time_write_flash(path, True)
+            print("%6dMB %18.3f %18.3f" % (size, raw / size, compressed / size))
+            os.remove(path)
+
+        print()
+        print("%8s %10s %18s %18s" % ("size", "block", "old slicing s/MB", "offsets s/MB"))
+        for size in args.sizes:
+            for block_size in (esptool.ESPLoader.FLASH_WRITE_SIZE, esptool.ESP8266StubLoader.FLASH_WRITE_SIZE):
+                old, new = time_slicing(size * MB, block_size)
+                print("%6dMB %10d %18.4f %18.4f" % (size, block_size, old / size, new / size))
+    finally:
+        os.rmdir(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+# coding=utf-8
+
+"""
+Console output of jobs: bounded log buffers and per-thread stdout routing.
+
+A file-like sink for the output of flashing and provisioning jobs.  Only the
+last MAX_LINES lines are kept and a line rewritten with a leading carriage
+return (the progress updates of esptool) replaces the unfinished last line
+instead of being appended, so a long session can neither grow memory nor
+the text the GUI has to show.
+
+Writers may be on any thread.  Readers poll with read(cursor), which returns
+only what changed since their last read, and decide themselves how often to
+repaint.  Free of wx so it can also be used headless.
+
+esptool and ampy print to sys.stdout.  To keep the output of jobs running
+side by side apart, redirect() installs an OutputRouter as sys.stdout once
+and sends everything a thread prints to the stream it was given, every other
+thread still writes to the original stdout.
+
+Example usage:
+
+    log = LogBuffer()
+    with redirect(log):
+        print("Writing at 0x00000000... (1 %)", end="")
+        print("\\rWriting at 0x00004000... (2 %)", end="")
+    cursor, reset, lines, current = log.read(None)
+"""
+
+import contextlib
+import itertools
+import sys
+import threading
+from collections import deque
+
+
+class LogBuffer(object):
+    MAX_LINES = 2000
+
+    def __init__(self, max_lines=MAX_LINES):
+        self.max_lines = max_lines
+        self._lines = deque(maxlen=max_lines)  # complete lines, with their '\n'
+        self._current = ''  # unfinished last line
+        self._total = 0  # complete lines ever written since the last clear()
+        self._generation = 0  # bumped by clear()
+        self._lock = threading.Lock()
+        self.version = 0  # bumped on every change, cheap to poll
+
+    def write(self, string):
+        string = string.replace('\r\n', '\n')
+        with self._lock:
+            for part in string.splitlines(True):
+                if '\r' in part:
+                    # carriage return -> start the unfinished line over
+                    self._current = part[part.rfind('\r') + 1:]
+                else:
+                    self._current += part
+                if self._current.endswith('\n'):
+                    self._lines.append(self._current)
+                    self._current = ''
+                    self._total += 1
+            self.version += 1
+
+    def flush(self):
+        pass
+
+    def clear(self):
+        with self._lock:
+            self._lines.clear()
+            self._current = ''
+            self._total = 0
+            self._generation += 1
+            self.version += 1
+
+    def text(self):
+        with self._lock:
+            return ''.join(self._lines) + self._current
+
+    def read(self, cursor, reset=False):
+        """Return (cursor, reset, lines, current): the complete lines added
+        since cursor (the one returned by the previous call, None at first)
+        and the unfinished last line.  reset is True when the reader has to
+        throw away what it has and show lines instead, because the buffer
+        was cleared, lines it has not seen yet were dropped, or the reader
+        asked for it.
+        """
+        with self._lock:
+            first = self._total - len(self._lines)  # index of the oldest line kept
+            if cursor is None or reset or cursor[0] != self._generation or cursor[1] < first:
+                reset = True
+                lines = list(self._lines)
+            else:
+                new = self._total - cursor[1]
+                lines = list(itertools.islice(self._lines, len(self._lines) - new, None))
+            return (self._generation, self._total), reset, lines, self._current
+
+
+class Channels(object):
+    """A LogBuffer per key (a serial port, say), created on first use."""
+
+    def __init__(self, max_lines=LogBuffer.MAX_LINES):
+        self._max_lines = max_lines
+        self._logs = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            log = self._logs.get(key)
+            if log is None:
+                log = self._logs[key] = LogBuffer(self._max_lines)
+            return log
+
+
+class LinePrefixer(object):
+    """Writes to stream with prefix in front of every line, so the output
+    of several jobs sharing a terminal can be told apart.
+    """
+    _lock = threading.Lock()  # shared, whole lines of different jobs must not mix
+
+    def __init__(self, stream, prefix):
+        self._stream = stream
+        self._prefix = prefix
+        self._line_start = True
+
+    def write(self, string):
+        out = []
+        for part in string.splitlines(True):
+            if self._line_start or part.startswith('\r'):
+                # a carriage return starts the line over, prefix included
+                out.append(part[:1] + self._prefix + part[1:] if part.startswith('\r') else self._prefix + part)
+            else:
+                out.append(part)
+            self._line_start = part.endswith('\n')
+        with self._lock:
+            self._stream.write(''.join(out))
+            self._stream.flush()
+
+    def flush(self):
+        pass
+
+
+class Tee(object):
+    """Writes to all of the given streams."""
+
+    def __init__(self, *streams):
+        self._streams = streams
+
+    def write(self, string):
+        for stream in self._streams:
+            stream.write(string)
+
+    def flush(self):
+        for stream in self._streams:
+            stream.flush()
+
+
+class OutputRouter(object):
+    """sys.stdout replacement sending what each thread writes to the stream
+    redirect() gave it, or to default.
+    """
+
+    def __init__(self, default):
+        self.default = default
+        self._local = threading.local()
+
+    def stream(self):
+        return getattr(self._local, 'stream', None) or self.default
+
+    def write(self, string):
+        self.stream().write(string)
+
+    def flush(self):
+        self.stream().flush()
+
+    @contextlib.contextmanager
+    def redirect(self, stream):
+        previous = getattr(self._local, 'stream', None)
+        self._local.stream = stream
+        try:
+            yield stream
+        finally:
+            self._local.stream = previous
+
+
+_router_lock = threading.Lock()
+
+
+def install_router():
+    """Make sys.stdout an OutputRouter, if it is not already, and return it."""
+    with _router_lock:
+        if not isinstance(sys.stdout, OutputRouter):
+            sys.stdout = OutputRouter(sys.stdout)
+        return sys.stdout
+
+
+def redirect(stream):
+    """Context manager sending the output of the calling thread to stream
+    (to the original stdout if stream is None).
+    """
+    return install_router().redirect(stream)
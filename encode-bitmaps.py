@@ -9,7 +9,6 @@ from wx.tools import img2py
 command_lines = [
     "-F -n Exit images/exit.png images.py",
     "-a -F -n Reload images/reload.png images.py",
-    "-a -F -n Splash images/splash.png images.py",
     "-a -F -n Info images/info.png images.py",
     "-a -F -i -n Icon images/icon-256.png images.py",
     ]
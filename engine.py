@@ -0,0 +1,883 @@
+# coding=utf-8
+
+"""
+Blocky flashing and provisioning engine.
+
+Everything the config tool does to a board, free of any GUI code: flashing
+a firmware file, or all regions of a flash layout manifest, with esptool,
+optionally together with a filesystem image of a directory of board files,
+writing a generated config.json, either uploaded with ampy or patched into
+the filesystem image on flash, cloning a golden board and backing up the
+files of a board.  Used by the wx GUI (Main.py) as well as the headless CLI
+and daemon (headless.py), so it must never import wx.
+
+The functions take an optional jobs.Job, call job.check_cancelled()
+between steps so a cancelled job stops at the next safe point and report
+progress events through job.set_progress().
+"""
+
+from __future__ import print_function
+
+import collections
+import copy
+import hashlib
+import io
+import json
+import os
+import platform
+import re
+import sys
+import threading
+import time
+from argparse import Namespace
+
+import console
+import firmstore
+import fsimage
+
+# esptool and ampy are imported by the functions using them: they are only
+# needed once a job starts and importing esptool is not free.
+
+DEVICE_NAME = 'blocky_111'
+LOCAL_CONFIG_FILE = './config.json'
+REMOTE_CONFIG_FILE = 'config.json'
+ROM_BAUD = 115200  # ESPLoader.ESP_ROM_BAUD
+FIRMWARE_OFFSET = 0x0  # where a single firmware image is flashed
+MANIFEST_EXTENSION = '.json'
+# Filesystem of the Blocky MicroPython firmware (ESP8266, 1.9), flashed as a
+# single image: the block device starts a sector after flash_user_start() and
+# has 0x6a sectors.  A manifest says where its filesystem is, see filesystem_layout
+FS_OFFSET = 0x91000
+FS_SIZE = 0x6a * fsimage.SECTOR_SIZE
+CONFIG_SLOT_SIZE = 1024  # bytes config.json takes in a filesystem image, padded with spaces
+DEFAULT_FLASH_SIZE = '4MB'  # what firmware is prepared for until a flash size was detected
+CHECKPOINT_MAX_AGE = 600  # seconds an unfinished write can be resumed after
+
+firmware_store = firmstore.FirmwareStore()  # images are flashed from here, see resolve_firmware
+detected_flash_sizes = []  # on the boards flashed so far, the latest first
+_flash_sizes_lock = threading.Lock()
+_checkpoints = {}  # MAC of a board: (time, esptool.WriteCheckpoint) of its last unfinished write
+_checkpoints_lock = threading.Lock()
+# timing of the links to the boards on each port, kept across connections so
+# the timeouts of a job fit the link from its first command on
+_link_stats = {}  # (port, baud): esptool.LinkStats
+_reply_times = {}  # port: {prompt: esptool.LatencyEstimate} of MicroPython
+_links_lock = threading.Lock()
+
+
+def windows_full_port_name(portname):
+    # Helper function to generate proper Windows COM port paths.  Apparently
+    # Windows requires COM ports above 9 to have a special path, where ports below
+    # 9 are just referred to by COM1, COM2, etc. (wacky!)  See this post for
+    # more info and where this code came from:
+    # http://eli.thegreenplace.net/2009/07/31/listing-all-serial-ports-on-windows-with-python/
+    m = re.match(r"^COM(\d+)$", portname)
+    if m and int(m.group(1)) < 10:
+        return portname
+    else:
+        return "\\\\.\\{0}".format(portname)
+
+
+def _check_cancelled(job):
+    if job is not None:
+        job.check_cancelled()
+
+
+def load_flash_layout(path):
+    """Return the regions to flash for path as a sorted list of (offset,
+    file path).
+
+    path is either a firmware image, flashed at FIRMWARE_OFFSET, or a flash
+    layout manifest: a .json file like the flasher_args.json of ESP-IDF
+    builds, whose "flash_files" maps offsets to images relative to the
+    manifest.  ESP32 MicroPython builds need several of them, e.g.
+
+        {"flash_files": {"0x1000": "bootloader.bin", "0x8000": "partitions.bin",
+                         "0x10000": "firmware.bin", "0x200000": "fs.img"}}
+
+    Raises ValueError for a manifest that cannot be used.
+    """
+    if not path.lower().endswith(MANIFEST_EXTENSION):
+        return [(FIRMWARE_OFFSET, path)]
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    files = manifest.get('flash_files') if isinstance(manifest, dict) else None
+    if not files:
+        raise ValueError("%s is not a flash layout manifest, it has no flash_files" % path)
+    base = os.path.dirname(os.path.abspath(path))
+    return sorted((int(offset, 0), os.path.join(base, name)) for offset, name in files.items())
+
+
+def filesystem_layout(firmware=None):
+    """Return (offset, size) of the filesystem of the firmware ref
+    firmware (see resolve_firmware): FS_OFFSET and FS_SIZE for a single
+    image or None, the "filesystem" of a flash layout manifest, e.g.
+
+        {"flash_files": {...}, "filesystem": {"offset": "0x200000", "size": "0x200000"}}
+
+    Raises ValueError if a manifest does not say.
+    """
+    path = resolve_firmware(firmware) if firmware else None
+    if path is None or not path.lower().endswith(MANIFEST_EXTENSION):
+        return FS_OFFSET, FS_SIZE
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    try:
+        layout = manifest['filesystem']
+        offset, size = int(layout['offset'], 0), int(layout['size'], 0)
+    except (KeyError, TypeError, ValueError):
+        raise ValueError('%s does not say where the filesystem goes, add '
+                         '"filesystem": {"offset": "0x...", "size": "0x..."}' % path)
+    if offset % fsimage.SECTOR_SIZE or size <= 0 or size % fsimage.SECTOR_SIZE:
+        raise ValueError("The filesystem of %s is not a whole number of %d byte sectors"
+                         % (path, fsimage.SECTOR_SIZE))
+    return offset, size
+
+
+def resolve_firmware(ref, store=None):
+    """Return the path of the firmware ref: a file, or an image in the
+    firmware store named by its tag, version, name or digest.
+
+    Raises ValueError if there is neither.
+    """
+    if os.path.exists(ref):
+        return ref
+    store = store or firmware_store
+    try:
+        return store.path(store.find(ref))
+    except KeyError:
+        raise ValueError("%s is neither a file nor in the firmware store" % ref)
+
+
+def _preload_compressed(path, store=None):
+    # an image from the store comes with its compressed payload, so
+    # esptool does not have to compress it again
+    import esptool
+    store = store or firmware_store
+    entry = store.entry_for_path(path)
+    if entry is not None:
+        esptool.add_compressed_image(entry['md5'], entry['size'], store.compressed(entry))
+
+
+def board_config_data(board_config, size=CONFIG_SLOT_SIZE):
+    """Return board_config as config.json contents padded with spaces to
+    size bytes, so the config of every device fits the same slot."""
+    data = json.dumps(board_config).encode('utf-8')
+    if len(data) > size:
+        raise ValueError("config.json is %d bytes, more than the %d reserved for it" % (len(data), size))
+    return data + b' ' * (size - len(data))
+
+
+def _image_file(data, name):
+    # a file object esptool can write like one it opened
+    f = io.BytesIO(data)
+    f.name = name
+    return f
+
+
+class FilesystemImage(object):
+    """The filesystem image of the board files below files_dir (None for
+    none), built once and flashed at offset, size bytes (see
+    filesystem_layout).
+
+    config.json always takes CONFIG_SLOT_SIZE bytes in the image: the one
+    below files_dir or an empty board config, padded.  The config of a
+    device then only changes the sectors holding it, see config_patch().
+
+    Raises ValueError if the files do not fit.
+    """
+
+    def __init__(self, files_dir=None, offset=FS_OFFSET, size=FS_SIZE):
+        self.files_dir = files_dir
+        self.offset = offset
+        config = make_board_config('', '', '')
+        if files_dir and os.path.isfile(os.path.join(files_dir, REMOTE_CONFIG_FILE)):
+            with open(os.path.join(files_dir, REMOTE_CONFIG_FILE), 'r') as f:
+                config = json.load(f)
+        self.image = fsimage.build_fat_image(files_dir, size,
+                                             extra_files={REMOTE_CONFIG_FILE: board_config_data(config)})
+        # boot sector, FAT and root directory: the same on every board
+        # flashed with this image, whatever config it got since
+        self.metadata_size = fsimage.data_offset(self.image)
+        self.metadata_md5 = hashlib.md5(self.image[:self.metadata_size]).hexdigest()
+
+    def file(self):
+        return _image_file(self.image, '%s (filesystem image)' % (self.files_dir or 'empty'))
+
+    def config_patch(self, board_config):
+        """Return the (flash offset, sector) pairs to write for a board with
+        this image to get board_config as its config.json."""
+        return [(self.offset + offset, sector) for offset, sector in
+                fsimage.patch_file(self.image, REMOTE_CONFIG_FILE, board_config_data(board_config))]
+
+    def patched(self, board_config):
+        """Return the whole image with board_config as its config.json."""
+        image = bytearray(self.image)
+        for offset, sector in self.config_patch(board_config):
+            image[offset - self.offset:offset - self.offset + len(sector)] = sector
+        return bytes(image)
+
+
+# ---------------------------------------------------------------------------
+# DTO between GUI/CLI and the flashing job
+class FlashConfig:
+    def __init__(self):
+        self.baud = 115200
+        self.erase_before_flash = False
+        self.mode = "dio"
+        self.firmware_path = None
+        self.files_dir = None  # board files flashed as a filesystem image, if set
+        self.port = None
+
+    @classmethod
+    def load(cls, file_path):
+        conf = cls()
+        if os.path.exists(file_path):
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+            conf.port = data['port']
+            conf.baud = data['baud']
+            conf.mode = data['mode']
+            conf.erase_before_flash = data['erase']
+        return conf
+
+    @classmethod
+    def from_dict(cls, data):
+        conf = cls()
+        conf.port = data.get('port')
+        conf.firmware_path = data.get('firmware')
+        conf.files_dir = data.get('files') or None
+        conf.baud = int(data.get('baud', conf.baud))
+        conf.mode = data.get('mode', conf.mode)
+        conf.erase_before_flash = bool(data.get('erase', conf.erase_before_flash))
+        return conf
+
+    def safe(self, file_path):
+        data = {
+            'port': self.port,
+            'baud': self.baud,
+            'mode': self.mode,
+            'erase': self.erase_before_flash,
+        }
+        with open(file_path, 'w') as f:
+            json.dump(data, f)
+
+    def is_complete(self):
+        return self.firmware_path is not None and self.port is not None
+
+
+def _connect(port, baud, job=None):
+    """Connect to the board on port and return the stub loader running on
+    it, talking at baud if the chip can change it.  A loader warmed up for
+    the port (see WarmLoaders) is used if there is one."""
+    esp = warm_loaders.take(port, baud)
+    if esp is None:
+        return _open_loader(port, baud, job)
+    if job is not None:
+        esp.progress_callback = job.set_progress
+    return esp
+
+
+def _port_timing(registry, key, factory):
+    with _links_lock:
+        if key not in registry:
+            registry[key] = factory()
+        return registry[key]
+
+
+def _use_port_link_stats(esp, port):
+    # what earlier connections at this baud rate measured, instead of a fresh start
+    from esptool import LinkStats
+    esp.link_stats = _port_timing(_link_stats, (port, esp._port.baudrate), LinkStats)
+
+
+def _open_loader(port, baud, job=None):
+    from esptool import ESPLoader
+    from esptool import NotImplementedInROMError
+
+    initial_baud = min(ESPLoader.ESP_ROM_BAUD, baud)
+
+    esp = ESPLoader.detect_chip(port, initial_baud)
+    _use_port_link_stats(esp, port)
+    print("Chip is %s" % (esp.get_chip_description()))
+    if job is not None:
+        esp.progress_callback = job.set_progress
+
+    try:
+        esp = esp.run_stub()
+
+        if baud > initial_baud:
+            try:
+                esp.change_baud(baud)
+            except NotImplementedInROMError:
+                print("WARNING: ROM doesn't support changing baud rate. Keeping initial baud rate %d." %
+                      initial_baud)
+        _use_port_link_stats(esp, port)
+    except Exception:
+        esp._port.close()
+        raise
+    return esp
+
+
+class _WarmLoader(object):
+    def __init__(self, port, baud):
+        self.port = port
+        self.baud = baud
+        self.esp = None
+        self.log = console.LogBuffer()  # what connecting printed, shown by the job using it
+        self.ready = threading.Event()
+        self.timer = None
+        self.released = False  # tear down once connected, no job gets it
+        self.closed = threading.Event()  # set once the port is closed again
+
+
+class WarmLoaders(object):
+    """Speculative connections to boards, made as soon as a port is
+    selected or a board plugged in rather than when a job starts: detecting
+    the chip, uploading the stub, changing the baud rate and reading the
+    flash ID.  The next job for the port (see _connect) gets the loader
+    ready to flash.  A loader no job asked for within idle_timeout seconds
+    is torn down and the board reset, to run its firmware again.
+    """
+    IDLE_TIMEOUT = 30.0
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._loaders = {}  # port: _WarmLoader
+
+    def warm(self, port, baud):
+        """Connect to the board on port in the background, unless that is
+        done or under way already."""
+        with self._lock:
+            if port in self._loaders:
+                return
+            loader = self._loaders[port] = _WarmLoader(port, baud)
+        thread = threading.Thread(target=self._connect, args=(loader,), name='warm %s' % port)
+        thread.daemon = True
+        thread.start()
+
+    def _connect(self, loader):
+        try:
+            with console.redirect(loader.log):
+                esp = _open_loader(loader.port, loader.baud)
+                esp.flash_id()
+        except Exception as e:
+            with self._lock:
+                if self._loaders.get(loader.port) is loader:
+                    del self._loaders[loader.port]
+            loader.log.write("Could not connect ahead: %s\n" % e)
+            loader.ready.set()
+            loader.closed.set()
+            return
+        with self._lock:
+            loader.esp = esp
+            released = loader.released
+            if not released:
+                loader.timer = threading.Timer(self.idle_timeout, self._expire, [loader])
+                loader.timer.daemon = True
+                loader.timer.start()
+        loader.ready.set()
+        if released:
+            self._teardown(loader)  # released while connecting
+
+    def _expire(self, loader):
+        with self._lock:
+            if self._loaders.get(loader.port) is not loader:
+                return  # taken or released meanwhile
+            del self._loaders[loader.port]
+        self._teardown(loader)
+
+    @staticmethod
+    def _teardown(loader):
+        try:
+            if loader.timer is not None:
+                loader.timer.cancel()
+            if loader.esp is not None:
+                try:
+                    loader.esp.hard_reset()
+                except Exception:
+                    pass
+                loader.esp._port.close()
+        finally:
+            loader.closed.set()
+
+    def take(self, port, baud):
+        """Return the warm loader for port, talking at baud, and hand it to
+        the caller, or None if there is none.  A connection under way is
+        waited for rather than started over."""
+        with self._lock:
+            loader = self._loaders.pop(port, None)
+        if loader is None:
+            return None
+        loader.ready.wait()
+        if loader.timer is not None:
+            loader.timer.cancel()
+        if loader.esp is None:
+            return None
+        sys.stdout.write(loader.log.text())
+        esp = loader.esp
+        try:
+            esp.flash_id()  # the board may have been reset or unplugged since
+            if baud != loader.baud:
+                esp.change_baud(baud)
+                _use_port_link_stats(esp, port)
+        except Exception as e:
+            print("Connection made ahead is gone (%s), connecting again..." % e)
+            loader.esp = None
+            esp._port.close()
+            return None
+        print("Using the connection made ahead")
+        return esp
+
+    def release(self, port, wait=False):
+        """Tear down the warm loader for port, if any, so the port can be
+        opened otherwise.  Returns right away, for the GUI thread: a
+        connection under way is torn down by its own thread once made, an
+        open one on a new thread.  With wait, returns once the port is
+        closed."""
+        with self._lock:
+            loader = self._loaders.pop(port, None)
+            if loader is None:
+                return
+            loader.released = True
+            esp = loader.esp
+        if esp is not None:
+            # not a daemon, so the board is reset even when the program exits
+            threading.Thread(target=self._teardown, args=(loader,), name='release %s' % port).start()
+        if wait:
+            loader.closed.wait()
+
+    def release_all(self):
+        with self._lock:
+            ports = list(self._loaders)
+        for port in ports:
+            self.release(port)
+
+
+warm_loaders = WarmLoaders()  # used by _connect, warmed by the GUI and daemon
+
+
+def _write_args(mode, regions):
+    # esptool.write_flash arguments for the (offset, file object) regions
+    args = Namespace()
+    args.flash_size = "detect"
+    args.flash_mode = mode
+    args.flash_freq = "40m" if mode != 'keep' else 'keep'
+    args.no_progress = False
+    args.no_stub = False
+    args.verify = False  # TRUE is deprecated
+    args.compress = True
+    args.addr_filename = [[offset, f] for offset, f in regions]
+    return args
+
+
+def _configure_flash_size(esp, args):
+    import esptool
+    print("Configuring flash size...")
+    esptool.detect_flash_size(esp, args)
+    esp.flash_set_parameters(esptool.flash_size_bytes(args.flash_size))
+    with _flash_sizes_lock:
+        if args.flash_size in detected_flash_sizes:
+            detected_flash_sizes.remove(args.flash_size)
+        detected_flash_sizes.insert(0, args.flash_size)
+
+
+def _write_checkpoint(esp, fresh=False):
+    """Return (board, checkpoint): the MAC of the board esp talks to and
+    the esptool.WriteCheckpoint its last write, interrupted less than
+    CHECKPOINT_MAX_AGE seconds ago, left.  A new one if there is none or
+    fresh is set.  Writing with it resumes the write of an earlier attempt
+    of the job, or of the job before on the same board, wherever the
+    board is plugged in now."""
+    import esptool
+
+    try:
+        board = esp.read_mac()
+    except esptool.FatalError:
+        return None, esptool.WriteCheckpoint()  # cannot tell boards apart, nothing to resume
+    now = time.time()
+    with _checkpoints_lock:
+        for other, (stamp, _) in list(_checkpoints.items()):
+            if now - stamp > CHECKPOINT_MAX_AGE:
+                del _checkpoints[other]
+        checkpoint = None if fresh else _checkpoints.get(board, (None, None))[1]
+        if checkpoint is None:
+            checkpoint = esptool.WriteCheckpoint()
+        _checkpoints[board] = (now, checkpoint)
+    return board, checkpoint
+
+
+def _write_finished(board):
+    with _checkpoints_lock:
+        _checkpoints.pop(board, None)
+
+
+def _flash_files(config):
+    """Open the regions flash_firmware writes for config as (offset, file
+    object), before connecting: a missing file or a full filesystem fails
+    right away.  Raises ValueError for a firmware that cannot be used."""
+    files = []
+    try:
+        for offset, path in load_flash_layout(resolve_firmware(config.firmware_path)):
+            files.append((offset, open(path, 'rb')))
+            _preload_compressed(path)
+        if config.files_dir:
+            offset, size = filesystem_layout(config.firmware_path)
+            files.append((offset, FilesystemImage(config.files_dir, offset, size).file()))
+    except Exception:
+        for _, f in files:
+            f.close()
+        raise
+    return files
+
+
+class FirmwarePreparer(object):
+    """Does the work of flash_firmware that needs no board on a background
+    thread, as soon as the firmware is picked and again whenever its files
+    change: reading, patching the flash parameters, hashing and compressing
+    the images (see esptool.prepare_write_flash).  The results are kept by
+    esptool, flashing then goes straight to talking to the chip.
+
+    Images are prepared for the flash mode of the config and the flash
+    sizes detected on boards before, DEFAULT_FLASH_SIZE until there are any.
+    """
+    POLL_INTERVAL = 1.0  # seconds between checks of the files for changes
+
+    def __init__(self):
+        self._config = None
+        self._prepared = None  # what the last preparation was for
+        self._stopped = False
+        self._wakeup = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='firmware-preparer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def select(self, config):
+        """Prepare the firmware of config, a FlashConfig, from now on."""
+        with self._wakeup:
+            self._config = copy.copy(config)
+            self._wakeup.notify()
+
+    def stop(self):
+        with self._wakeup:
+            self._stopped = True
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                self._wakeup.wait(self.POLL_INTERVAL)
+                if self._stopped:
+                    return
+                # after the wait: a select() that woke us is prepared right away
+                config = self._config
+            if config is None or not config.firmware_path:
+                continue
+            with _flash_sizes_lock:
+                sizes = list(detected_flash_sizes) or [DEFAULT_FLASH_SIZE]
+            state = (config.firmware_path, config.mode, config.files_dir, tuple(sizes), self._file_times(config))
+            if state == self._prepared:
+                continue
+            self._prepared = state
+            try:
+                self._prepare(config, sizes)
+            except Exception as e:
+                # flashing reports the problem, if it is still there by then
+                print("Could not prepare %s: %s" % (config.firmware_path, e))
+
+    @staticmethod
+    def _file_times(config):
+        # what changes when one of the files flashed for config changes
+        try:
+            paths = [path for _, path in load_flash_layout(resolve_firmware(config.firmware_path))]
+            if config.files_dir:
+                paths += [os.path.join(d, name) for d, _, names in os.walk(config.files_dir) for name in names]
+            return tuple((path, os.path.getmtime(path), os.path.getsize(path)) for path in paths)
+        except (ValueError, IOError, OSError):
+            return None
+
+    def _prepare(self, config, sizes):
+        import esptool
+
+        files = _flash_files(config)
+        try:
+            chip = firmstore.image_chip(files[0][1].read(8)) if files else None
+            loader = esptool.ESP32ROM if chip == 'esp32' else esptool.ESP8266ROM
+            for size in sizes:
+                args = _write_args(config.mode, files)
+                args.flash_size = size
+                esptool.prepare_write_flash(loader, args)
+        finally:
+            for _, f in files:
+                f.close()
+
+
+def flash_firmware(config, job=None):
+    """Flash config.firmware_path, an image or a flash layout manifest (see
+    load_flash_layout), to the board on config.port, and the files below
+    config.files_dir as a filesystem image if it is set.  All regions are
+    written in one stub session.  Run again after a link error, on the same
+    board, it continues from the first sector not written yet."""
+    import esptool
+
+    esp = None
+    files = []
+    try:
+        try:
+            if config.files_dir:
+                print("Building the filesystem image of %s..." % config.files_dir)
+            files = _flash_files(config)
+        except ValueError as e:
+            raise esptool.FatalError(str(e))
+
+        esp = _connect(config.port, config.baud, job)
+        args = _write_args(config.mode, files)
+        board, args.checkpoint = _write_checkpoint(esp)
+        _check_cancelled(job)
+        _configure_flash_size(esp, args)
+
+        if config.erase_before_flash and not args.checkpoint.erased:
+            _check_cancelled(job)
+            esptool.erase_flash(esp, args)
+            # what earlier writes left is gone
+            board, args.checkpoint = _write_checkpoint(esp, fresh=True)
+            args.checkpoint.erased = True
+        _check_cancelled(job)
+        esptool.write_flash(esp, args)
+        _write_finished(board)
+        # The last line printed by esptool is "Leaving..." -> some indication that the process is done is needed
+        print("\nDone.")
+    finally:
+        for _, f in files:
+            f.close()
+        # release the port so a retry or the next job can open it
+        if esp is not None:
+            esp._port.close()
+
+
+def read_golden(port, baud, job=None, store=None):
+    """Read the whole flash of the board on port, a golden board to clone,
+    into the firmware store and return the path of the dump there."""
+    import esptool
+
+    esp = None
+    try:
+        esp = _connect(port, baud, job)
+        args = _write_args('keep', [])
+        _configure_flash_size(esp, args)
+        _check_cancelled(job)
+        size = esptool.flash_size_bytes(args.flash_size)
+        print("Reading %d bytes of flash..." % size)
+        data = esp.read_flash(0, size)
+    finally:
+        if esp is not None:
+            esp._port.close()
+
+    store = store or firmware_store
+    entry = store.add(data, name='golden %s' % os.path.basename(port))
+    print("Golden image is %s" % firmstore.describe(entry))
+    return store.path(entry)
+
+
+def clone_patches(golden, overrides, sector_size=fsimage.SECTOR_SIZE):
+    """Return the (offset, data) regions to write over the golden image, a
+    file object, for the (offset, data) overrides of one board.  They are
+    widened to whole sectors filled from the golden image, writing them
+    must not erase the golden contents next to an override."""
+    patched = {}  # sector offset: sector
+    for offset, data in overrides:
+        for start in range(offset - offset % sector_size, offset + len(data), sector_size):
+            if start not in patched:
+                golden.seek(start)
+                sector = golden.read(sector_size)
+                patched[start] = bytearray(sector + b'\xff' * (sector_size - len(sector)))
+            lo = max(offset, start)
+            hi = min(offset + len(data), start + sector_size)
+            patched[start][lo - start:hi - start] = data[lo - offset:hi - offset]
+    return [(start, bytes(patched[start])) for start in sorted(patched)]
+
+
+def clone_board(config, job=None):
+    """Write the golden image config['image'] (see read_golden) to the board
+    on config['port'], then the per-board config['overrides'], a list of
+    (offset, file path), config sectors or keys say.
+
+    The flash parameters in the image are kept as they are.  The golden
+    image is compressed once, when it is added to the firmware store.
+    """
+    import esptool
+
+    esp = None
+    golden = None
+    try:
+        try:
+            golden = open(resolve_firmware(config['image']), 'rb')
+            _preload_compressed(golden.name)
+            overrides = []
+            for offset, path in config.get('overrides', []):
+                with open(path, 'rb') as f:
+                    overrides.append((offset, f.read()))
+        except (IOError, OSError, ValueError) as e:
+            raise esptool.FatalError(str(e))
+        patches = clone_patches(golden, overrides)
+
+        esp = _connect(config['port'], config['baud'], job)
+        args = _write_args('keep', [(0, golden)])
+        board, args.checkpoint = _write_checkpoint(esp)
+        _check_cancelled(job)
+        _configure_flash_size(esp, args)
+        golden.seek(0, 2)
+        if golden.tell() > esptool.flash_size_bytes(args.flash_size):
+            raise esptool.FatalError("The golden image is %d bytes, more than the %s flash of this board"
+                                     % (golden.tell(), args.flash_size))
+        golden.seek(0)
+        # the header of the image as read, so it matches the compressed payload of the store
+        args.flash_size = 'keep'
+        _check_cancelled(job)
+        esptool.write_flash(esp, args)
+        if patches:
+            print("Writing %d sector(s) of this board..." % len(patches))
+            args.addr_filename = [[offset, _image_file(data, 'override at 0x%x' % offset)]
+                                  for offset, data in patches]
+            _check_cancelled(job)
+            esptool.write_flash(esp, args)
+        _write_finished(board)
+        print("\nDone.")
+    finally:
+        if golden is not None:
+            golden.close()
+        if esp is not None:
+            esp._port.close()
+
+
+def backup_files(config, job=None):
+    """Copy the files of the board on config['port'] to config['directory'],
+    read as one filesystem image with the stub rather than one by one over
+    the raw REPL.  Only the boot sector, FAT, root directory and the
+    clusters in use are read.  The filesystem is where config.get('firmware'),
+    the firmware the board was flashed with, has it (see filesystem_layout)."""
+    import esptool
+
+    esp = None
+    try:
+        try:
+            fs_offset, fs_size = filesystem_layout(config.get('firmware'))
+        except (IOError, OSError, ValueError) as e:
+            raise esptool.FatalError(str(e))
+        esp = _connect(config['port'], config['baud'], job)
+        _check_cancelled(job)
+        print("Reading the filesystem at 0x%x..." % fs_offset)
+        image = esp.read_flash(fs_offset, fsimage.SECTOR_SIZE)
+        try:
+            # each read covers what the previous one says is needed
+            for size in (fsimage.data_offset, fsimage.used_size):
+                needed = min(size(image), fs_size)
+                if needed > len(image):
+                    _check_cancelled(job)
+                    image += esp.read_flash(fs_offset + len(image), needed - len(image))
+            paths = fsimage.extract_fat_image(image, config['directory'])
+        except ValueError:
+            raise esptool.FatalError("No filesystem found at 0x%x" % fs_offset)
+    finally:
+        if esp is not None:
+            esp._port.close()
+    print("Copied %d files and directories to %s" % (len(paths), config['directory']))
+    print("\nDone.")
+
+
+def make_board_config(wifi_name, wifi_pass, device_key, device_name=DEVICE_NAME):
+    """Return the config.json contents for a Blocky board as a dict."""
+    return {
+        'known_networks': [
+            {'ssid': wifi_name, 'password': wifi_pass},
+        ],
+        'device_name': device_name,
+        'auth_key': device_key}
+
+
+def save_config(config, job=None):
+    """Generate config.json from config (a dict with port, baud, wifi_name,
+    wifi_pass and device_key) and upload it to the board.
+    """
+    import ampy.files as files
+    import ampy.pyboard as pyboard
+    import esptool
+
+    warm_loaders.release(config['port'], wait=True)  # ampy needs the port, and the board out of the bootloader
+    board = None
+    try:
+        initial_baud = min(ROM_BAUD, config['baud'])
+
+        # On Windows fix the COM port path name for ports above 9 (see comment in
+        # windows_full_port_name function).
+        port = config['port']
+        if platform.system() == "Windows":
+            port = windows_full_port_name(port)
+        try:
+            # create config file
+            print('Generating config file')
+            config_json = make_board_config(config['wifi_name'], config['wifi_pass'], config['device_key'])
+
+            with open(LOCAL_CONFIG_FILE, 'w') as outfile:
+                json.dump(config_json, outfile)
+
+            print('Done')
+            _check_cancelled(job)
+            print('Sending to board...')
+
+            reply_times = _port_timing(_reply_times, port, lambda: collections.defaultdict(esptool.LatencyEstimate))
+            board = pyboard.Pyboard(port, baudrate=initial_baud, rawdelay=0, reply_times=reply_times)
+
+            # File copy, open the file and copy its contents to the board.
+            # Put the file on the board.
+            with open(LOCAL_CONFIG_FILE, "rb") as infile:
+                board_files = files.Files(board, job.set_progress if job is not None else None)
+                board_files.put(REMOTE_CONFIG_FILE, infile.read())
+        except pyboard.PyboardError as err:
+            print('Error detected')
+            print(err)
+            # PyboardError is a BaseException, re-raise it as an Exception so a scheduler can retry
+            raise RuntimeError(str(err))
+        # The last line printed by esptool is "Leaving..." -> some indication that the process is done is needed
+        print("\nDone.")
+    finally:
+        if board is not None:
+            board.close()
+
+
+def provision_config(config, image, job=None):
+    """Write the config.json generated from config (like for save_config)
+    into the filesystem of the board on config['port'], which was flashed
+    with image, a FilesystemImage.
+
+    Only the flash sectors holding config.json are written.  If the
+    filesystem on the board is not the one of image, the whole image is
+    written instead.
+    """
+    import esptool
+
+    board_config = make_board_config(config['wifi_name'], config['wifi_pass'], config['device_key'])
+    esp = None
+    try:
+        try:
+            patch = image.config_patch(board_config)
+        except ValueError as e:
+            raise esptool.FatalError(str(e))
+
+        esp = _connect(config['port'], config['baud'], job)
+        _check_cancelled(job)
+        if esp.flash_md5sum(image.offset, image.metadata_size) == image.metadata_md5:
+            print("Writing %s, %d sector(s)..." % (REMOTE_CONFIG_FILE, len(patch)))
+            regions = [(offset, _image_file(sector, REMOTE_CONFIG_FILE)) for offset, sector in patch]
+        else:
+            print("The filesystem on the board is not the prebuilt one, writing all of it...")
+            regions = [(image.offset, _image_file(image.patched(board_config), 'filesystem image'))]
+        args = _write_args('keep', regions)
+        _configure_flash_size(esp, args)
+        _check_cancelled(job)
+        esptool.write_flash(esp, args)
+        print("\nDone.")
+    finally:
+        if esp is not None:
+            esp._port.close()
@@ -20,14 +20,18 @@ from __future__ import division, print_function
 
 import argparse
 import base64
+import binascii
+import collections
 import copy
 import hashlib
-import inspect
 import io
+import math
+import mmap
 import os
 import shlex
 import struct
 import sys
+import threading
 import time
 import zlib
 
@@ -45,6 +49,22 @@ MAX_TIMEOUT = CHIP_ERASE_TIMEOUT * 2  # longest any command can run
 SYNC_TIMEOUT = 0.1                    # timeout for syncing with bootloader
 MD5_TIMEOUT_PER_MB = 8                # timeout (per megabyte) for calculating md5sum
 ERASE_REGION_TIMEOUT_PER_MB = 30      # timeout (per megabyte) for erasing a region
+ERASE_WRITE_TIMEOUT_PER_MB = 40       # timeout (per megabyte) for erasing and writing data
+FLASH_BLOCK_ERASE_TIMEOUT = 2         # worst case erase of a 64 KB flash block (datasheet), any flash block may start one
+MIN_BLOCK_TIMEOUT = 1                 # timeout for a flash block on top of its transfer and write time
+MIN_COMMAND_TIMEOUT = 0.2             # least timeout for a command, however fast the link answered before
+WRITE_BLOCK_ATTEMPTS = 5              # attempts to write a flash block before giving up
+COMPRESSED_CACHE_BYTES = 32 * 1024 * 1024  # compressed images kept for writing them again
+
+# Progress of a long running operation, see ESPLoader.progress_callback.
+# done and total are bytes (steps for a chip erase), rate is bytes per second
+# and eta seconds (None while unknown), device is the serial port.
+ProgressEvent = collections.namedtuple('ProgressEvent', 'phase done total rate eta device')
+
+PHASE_ERASE = 'erase'
+PHASE_WRITE = 'write'
+PHASE_VERIFY = 'verify'
+PHASE_READ = 'read'
 
 
 def timeout_per_mb(seconds_per_mb, size_bytes):
@@ -55,6 +75,115 @@ def timeout_per_mb(seconds_per_mb, size_bytes):
     return result
 
 
+class LatencyEstimate(object):
+    """ Moving average of a delay, the time a command takes to be answered
+    say, and of its mean deviation, like TCP estimates round trip times.
+
+    bound() is the average plus DEVIATIONS mean deviations, for delays
+    around a stable average above all but about one in a thousand of them.
+    It follows the link as it gets slower or faster, so a timeout set to it
+    is only as long as the link needs and a chip that stopped answering is
+    noticed in a fraction of a fixed worst case timeout.
+    """
+    GAIN = 0.125  # of the newest sample in the average
+    DEVIATION_GAIN = 0.25  # same for the deviation
+    DEVIATIONS = 4
+    MIN_SAMPLES = 4  # before bound() gives one
+
+    def __init__(self):
+        self.average = None
+        self.deviation = 0.0
+        self.samples = 0
+
+    def record(self, delay):
+        self.samples += 1
+        if self.average is None:
+            self.average = delay
+            self.deviation = delay / 2
+        else:
+            self.deviation += self.DEVIATION_GAIN * (abs(delay - self.average) - self.deviation)
+            self.average += self.GAIN * (delay - self.average)
+
+    def bound(self, floor=0.0):
+        """ The longest delay to expect, at least floor.  None until there
+        are MIN_SAMPLES samples """
+        if self.samples < self.MIN_SAMPLES:
+            return None
+        return max(floor, self.average + self.DEVIATIONS * self.deviation)
+
+
+class LinkStats(object):
+    """ Block transfers over one serial link, to choose the flash write
+    block size from.
+
+    Every block sent is recorded with its size, the time until its
+    response and whether it failed.  What a block costs beyond its time
+    on the wire (response latency, flash write) and the probability of a
+    byte being corrupted are estimated from these.  best_block_size()
+    then picks the size with the least expected time per byte written,
+    retransmits included: on a clean link the largest, on a noisy one a
+    smaller block whose retransmits are cheap.
+    """
+    OVERHEAD_WEIGHT = 0.2  # of the newest sample in the moving average
+    CONFIDENCE_Z = 1.96  # of the upper bound on the share of failed blocks (95 %)
+
+    def __init__(self):
+        self.bytes_sent = 0
+        self.blocks = 0
+        self.failures = 0
+        self.overhead = None  # seconds per block besides the wire time
+        self.latency = LatencyEstimate()  # of command responses, besides their wire time
+
+    def record(self, size, elapsed, byte_time, failed=False):
+        """ Record a block of 'size' bytes answered after 'elapsed' seconds
+        (None if there was no answer), at 'byte_time' seconds per byte on
+        the wire """
+        self.bytes_sent += size
+        self.blocks += 1
+        if failed:
+            self.failures += 1
+        if elapsed is None:
+            return
+        overhead = max(elapsed - size * byte_time, 0.0)
+        if self.overhead is None:
+            self.overhead = overhead
+        else:
+            self.overhead += self.OVERHEAD_WEIGHT * (overhead - self.overhead)
+
+    def error_rate(self):
+        """ Estimated probability of a corrupted byte, from the share of
+        failed blocks and their mean size.  Once blocks failed, the upper
+        end of the (Wilson) confidence interval of that share is taken
+        rather than the share itself: a few blocks that happened to get
+        through must not make a bad link look usable. """
+        if self.failures == 0:
+            return 0.0
+        n = float(self.blocks)
+        share = self.failures / n
+        z2 = self.CONFIDENCE_Z ** 2
+        upper = (share + z2 / (2 * n) +
+                 self.CONFIDENCE_Z * math.sqrt(share * (1 - share) / n + z2 / (4 * n * n))) / (1 + z2 / n)
+        upper = min(upper, 1.0 - 1e-9)  # all failed -> finite estimate
+        return min(1.0, -math.log(1.0 - upper) / (self.bytes_sent / n))
+
+    def best_block_size(self, sizes, byte_time):
+        """ Of 'sizes', return the one with the least expected seconds per
+        byte, each attempt costing overhead plus wire time and succeeding
+        with probability (1 - error rate) ** size """
+        overhead = self.overhead or 0.0
+        p = self.error_rate()
+
+        def cost(size):
+            success = (1.0 - p) ** size
+            if success == 0:
+                return float('inf')
+            return (overhead + size * byte_time) / (size * success)
+        best = min(sorted(sizes, reverse=True), key=cost)  # the largest of equally good ones
+        if cost(best) == float('inf'):
+            return min(sizes)  # none is likely to get through, the smallest at least might
+        return best
+
+
 DETECTED_FLASH_SIZES = {0x12: '256KB', 0x13: '512KB', 0x14: '1MB',
                         0x15: '2MB', 0x16: '4MB', 0x17: '8MB', 0x18: '16MB'}
 
@@ -99,6 +228,14 @@ else:
     def byte(bitstr, index):
         return bitstr[index]
 
+# Function to read a bitstring as one (arbitrarily large) integer
+if PYTHON2:
+    def int_from_bytes(bitstr):
+        return int(binascii.hexlify(bitstr), 16)
+else:
+    def int_from_bytes(bitstr):
+        return int.from_bytes(bitstr, 'little')
+
 
 def esp8266_function_only(func):
     """ Attribute for a function only supported on ESP8266 """
@@ -148,7 +285,9 @@ class ESPLoader(object):
     # Maximum block sized for RAM and Flash writes, respectively.
     ESP_RAM_BLOCK   = 0x1800
 
+    # Largest and smallest flash write block, see flash_write_size()
     FLASH_WRITE_SIZE = 0x400
+    MIN_FLASH_WRITE_SIZE = 0x100
 
     # Default baudrate. The ROM auto-bauds, so we can use more or less whatever we want.
     ESP_ROM_BAUD    = 115200
@@ -171,6 +310,10 @@ class ESPLoader(object):
     # The number of bytes in the UART response that signify command status
     STATUS_BYTES_LENGTH = 2
 
+    # Bytes of requests a RegisterBatch sends ahead of their responses at
+    # most, the size of the UART RX FIFO
+    PIPELINE_BYTES = 128
+
     def __init__(self, port=DEFAULT_PORT, baud=ESP_ROM_BAUD, trace_enabled=False):
         """Base constructor for ESPLoader bootloader interaction
 
@@ -194,6 +337,98 @@ class ESPLoader(object):
         # https://github.com/espressif/esptool/issues/44#issuecomment-107094446
         self._set_port_baudrate(baud)
         self._trace_enabled = trace_enabled
+        # called with a ProgressEvent by long running operations, if set
+        self.progress_callback = None
+        self.link_stats = LinkStats()
+        # block size of the current flash download, set by flash_begin()
+        # and flash_defl_begin()
+        self.write_block_size = self.FLASH_WRITE_SIZE
+        # bytes the last flash block sent writes, which the next command may wait for
+        self.queued_flash = 0
+
+    def report_progress(self, phase, done, total, started):
+        """ Pass a ProgressEvent for an operation begun at time 'started' to
+        progress_callback, if there is one.
+        """
+        if self.progress_callback is None:
+            return
+        elapsed = time.time() - started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else None
+        self.progress_callback(ProgressEvent(phase, done, total, rate, eta, getattr(self._port, 'port', None)))
+
+    def byte_time(self):
+        """ Seconds a byte takes on the wire, start and stop bit included """
+        return 10.0 / self._port.baudrate
+
+    def flash_write_size(self):
+        """ Block size for the next flash download, the power of two between
+        MIN_FLASH_WRITE_SIZE and FLASH_WRITE_SIZE which link_stats expects
+        to be fastest """
+        sizes = []
+        size = self.FLASH_WRITE_SIZE
+        while size >= self.MIN_FLASH_WRITE_SIZE:
+            sizes.append(size)
+            size //= 2
+        return self.link_stats.best_block_size(sizes, self.byte_time())
+
+    def command_timeout(self, size=0):
+        """ Timeout for a command sending 'size' bytes which the chip
+        answers right away: its wire time and the response latency
+        link_stats expects at most, at least MIN_COMMAND_TIMEOUT.
+        DEFAULT_TIMEOUT until the latency is known. """
+        latency = self.link_stats.latency.bound(MIN_COMMAND_TIMEOUT)
+        if latency is None:
+            return DEFAULT_TIMEOUT
+        return min(DEFAULT_TIMEOUT, 2 * (size + 20) * self.byte_time() + latency)
+
+    def flash_block_timeout(self, size, flashed=None):
+        """ Timeout for a flash block of 'size' bytes which writes 'flashed'
+        bytes to flash, more than 'size' for compressed data: its wire time
+        and response latency, plus the worst case time to erase and write
+        the flash (a 64 KB block erase it may start, and
+        ERASE_WRITE_TIMEOUT_PER_MB).  Only the latency adapts to the link,
+        it is MIN_BLOCK_TIMEOUT until link_stats knows it. """
+        if flashed is None:
+            flashed = size
+        latency = self.link_stats.latency.bound(MIN_COMMAND_TIMEOUT)
+        if latency is None:
+            latency = MIN_BLOCK_TIMEOUT
+        return (2 * size * self.byte_time() + min(latency, MIN_BLOCK_TIMEOUT) +
+                FLASH_BLOCK_ERASE_TIMEOUT + ERASE_WRITE_TIMEOUT_PER_MB * flashed / 1e6)
+
+    def flash_queued_timeout(self, timeout=0):
+        """ 'timeout' for a command which the chip may only answer once it
+        wrote the last flash block sent, plus the timeout of that block """
+        return timeout + self.flash_block_timeout(0, self.queued_flash)
+
+    def _send_block(self, op_description, op, data, seq, timeout, attempts=1, flashed=None):
+        """ Send a RAM or flash data block, check the result and record the
+        transfer in link_stats.  A block the chip answers with an error is
+        sent again, up to 'attempts' times in all.  Without an answer the
+        chip may still have taken the block (and a deflate stream would
+        then get it twice), so that fails at once. """
+        packet = struct.pack('<IIII', len(data), seq, 0, 0) + data
+        chk = self.checksum(data)
+        for attempt in range(attempts):
+            t = time.time()
+            try:
+                val, res = self.command(op, packet, chk, timeout=timeout)
+            except FatalError:
+                self.link_stats.record(len(packet), None, self.byte_time(), failed=True)
+                raise
+            elapsed = time.time() - t
+            try:
+                result = self._check_result("%s after seq %d" % (op_description, seq), val, res)
+            except FatalError:
+                self.link_stats.record(len(packet), elapsed, self.byte_time(), failed=True)
+                if attempt == attempts - 1:
+                    raise
+                self.trace("Block %d failed, sending it again", seq)
+                continue
+            self.link_stats.record(len(packet), elapsed, self.byte_time())
+            self.queued_flash = flashed or 0
+            return result
 
     def _set_port_baudrate(self, baud):
         try:
@@ -255,52 +490,72 @@ class ESPLoader(object):
     """ Calculate checksum of a blob, as it is defined by the ROM """
     @staticmethod
     def checksum(data, state=ESP_CHECKSUM_MAGIC):
-        for b in data:
-            if type(b) is int:  # python 2/3 compat
-                state ^= b
-            else:
-                state ^= ord(b)
-
-        return state
-
-    """ Send a request and read the response """
-    def command(self, op=None, data=b"", chk=0, wait_response=True, timeout=DEFAULT_TIMEOUT):
+        # XOR of all bytes: take data as one big integer and XOR its halves
+        # together until a single byte is left, instead of a loop per byte
+        length = len(data)
+        if length == 0:
+            return state
+        value = int_from_bytes(data)
+        while length > 1:
+            half = (length + 1) // 2
+            value = (value >> (8 * half)) ^ (value & ((1 << (8 * half)) - 1))
+            length = half
+        return state ^ value
+
+    """ Send a request and read the response.  Without a timeout the chip
+    is expected to answer right away (see command_timeout), the time it
+    takes is recorded in link_stats. """
+    def command(self, op=None, data=b"", chk=0, wait_response=True, timeout=None):
+        quick = timeout is None
+        if quick:
+            timeout = self.command_timeout(len(data))
         saved_timeout = self._port.timeout
         new_timeout = min(timeout, MAX_TIMEOUT)
         if new_timeout != saved_timeout:
             self._port.timeout = new_timeout
 
         try:
+            t = time.time()
             if op is not None:
                 self.trace("command op=0x%02x data len=%s wait_response=%d timeout=%.3f data=%r",
                            op, len(data), 1 if wait_response else 0, timeout, data)
-                pkt = struct.pack(b'<BBHI', 0x00, op, len(data), chk) + data
-                self.write(pkt)
+                self._send_request(op, data, chk)
 
             if not wait_response:
                 return
 
-            # tries to get a response until that response has the
-            # same operation as the request or a retries limit has
-            # exceeded. This is needed for some esp8266s that
-            # reply with more sync responses than expected.
-            for retry in range(100):
-                p = self.read()
-                if len(p) < 8:
-                    continue
-                (resp, op_ret, len_ret, val) = struct.unpack('<BBHI', p[:8])
-                if resp != 1:
-                    continue
-                data = p[8:]
-                if op is None or op_ret == op:
-                    return val, data
+            val, res = self._read_response(op)
+            if quick and op is not None:
+                wire_time = (len(data) + len(res) + 20) * self.byte_time()
+                self.link_stats.latency.record(max(time.time() - t - wire_time, 0.0))
+            return val, res
         finally:
             if new_timeout != saved_timeout:
                 self._port.timeout = saved_timeout
 
+    def _send_request(self, op, data=b"", chk=0):
+        pkt = struct.pack(b'<BBHI', 0x00, op, len(data), chk) + data
+        self.write(pkt)
+
+    def _read_response(self, op=None):
+        # tries to get a response until that response has the
+        # same operation as the request or a retries limit has
+        # exceeded. This is needed for some esp8266s that
+        # reply with more sync responses than expected.
+        for retry in range(100):
+            p = self.read()
+            if len(p) < 8:
+                continue
+            (resp, op_ret, len_ret, val) = struct.unpack('<BBHI', p[:8])
+            if resp != 1:
+                continue
+            data = p[8:]
+            if op is None or op_ret == op:
+                return val, data
+
         raise FatalError("Response doesn't match request")
 
-    def check_command(self, op_description, op=None, data=b'', chk=0, timeout=DEFAULT_TIMEOUT):
+    def check_command(self, op_description, op=None, data=b'', chk=0, timeout=None):
         """
         Execute a command with 'command', check the result code and throw an appropriate
         FatalError if it fails.
@@ -308,7 +563,9 @@ class ESPLoader(object):
         Returns the "result" of a successful command.
         """
         val, data = self.command(op, data, chk, timeout=timeout)
+        return self._check_result(op_description, val, data)
 
+    def _check_result(self, op_description, val, data):
         # things are a bit weird here, bear with us
 
         # the status bytes are the last 2/4 bytes in the data (depending on chip)
@@ -414,10 +671,22 @@ class ESPLoader(object):
         # when detecting chip type, and the way we check for success (STATUS_BYTES_LENGTH) is different
         # for different chip types (!)
         val, data = self.command(self.ESP_READ_REG, struct.pack('<I', addr))
+        return self._check_read_reg(addr, val, data)
+
+    @staticmethod
+    def _check_read_reg(addr, val, data):
         if byte(data, 0) != 0:
             raise FatalError.WithResult("Failed to read register address %08x" % addr, data)
         return val
 
+    """ Read several memory addresses with one pipelined RegisterBatch,
+    returns a list of their values """
+    def read_regs(self, addresses):
+        batch = RegisterBatch(self)
+        for addr in addresses:
+            batch.read(addr)
+        return batch.run()
+
     """ Write to memory address in target """
     def write_reg(self, addr, value, mask=0xFFFFFFFF, delay_us=0):
         return self.check_command("write target memory", self.ESP_WRITE_REG,
@@ -430,9 +699,7 @@ class ESPLoader(object):
 
     """ Send a block of an image to RAM """
     def mem_block(self, data, seq):
-        return self.check_command("write to target RAM", self.ESP_MEM_DATA,
-                                  struct.pack('<IIII', len(data), seq, 0, 0) + data,
-                                  self.checksum(data))
+        return self._send_block("write to target RAM", self.ESP_MEM_DATA, data, seq, self.command_timeout(len(data)))
 
     """ Leave download mode and run the application """
     def mem_finish(self, entrypoint=0):
@@ -441,37 +708,38 @@ class ESPLoader(object):
 
     """ Start downloading to Flash (performs an erase)
 
-    Returns number of blocks (of size self.FLASH_WRITE_SIZE) to write.
+    Returns number of blocks (of size self.write_block_size, chosen by
+    flash_write_size() unless block_size is given) to write.
     """
-    def flash_begin(self, size, offset):
-        num_blocks = (size + self.FLASH_WRITE_SIZE - 1) // self.FLASH_WRITE_SIZE
+    def flash_begin(self, size, offset, block_size=None):
+        self.write_block_size = block_size or self.flash_write_size()
+        num_blocks = (size + self.write_block_size - 1) // self.write_block_size
         erase_size = self.get_erase_size(offset, size)
 
         t = time.time()
         if self.IS_STUB:
-            timeout = DEFAULT_TIMEOUT
+            timeout = max(DEFAULT_TIMEOUT, self.flash_queued_timeout())
         else:
             timeout = timeout_per_mb(ERASE_REGION_TIMEOUT_PER_MB, size)  # ROM performs the erase up front
         self.check_command("enter Flash download mode", self.ESP_FLASH_BEGIN,
-                           struct.pack('<IIII', erase_size, num_blocks, self.FLASH_WRITE_SIZE, offset),
+                           struct.pack('<IIII', erase_size, num_blocks, self.write_block_size, offset),
                            timeout=timeout)
         if size != 0 and not self.IS_STUB:
             print("Took %.2fs to erase flash block" % (time.time() - t))
         return num_blocks
 
-    """ Write block to flash """
-    def flash_block(self, data, seq, timeout=DEFAULT_TIMEOUT):
-        self.check_command("write to target Flash after seq %d" % seq,
-                           self.ESP_FLASH_DATA,
-                           struct.pack('<IIII', len(data), seq, 0, 0) + data,
-                           self.checksum(data),
-                           timeout=timeout)
+    """ Write block to flash, sent again if it fails """
+    def flash_block(self, data, seq, timeout=None):
+        if timeout is None:
+            timeout = self.flash_block_timeout(len(data))
+        self._send_block("write to target Flash", self.ESP_FLASH_DATA, data, seq, timeout, WRITE_BLOCK_ATTEMPTS,
+                         flashed=len(data))
 
     """ Leave flash mode and run/reboot """
     def flash_finish(self, reboot=False):
         pkt = struct.pack('<I', int(not reboot))
         # stub sends a reply to this command
-        self.check_command("leave Flash mode", self.ESP_FLASH_END, pkt)
+        self.check_command("leave Flash mode", self.ESP_FLASH_END, pkt, timeout=self.flash_queued_timeout())
 
     """ Run application code in flash """
     def run(self, reboot=False):
@@ -484,12 +752,13 @@ class ESPLoader(object):
         SPIFLASH_RDID = 0x9F
         return self.run_spiflash_command(SPIFLASH_RDID, b"", 24)
 
-    def parse_flash_size_arg(self, arg):
+    @classmethod
+    def parse_flash_size_arg(cls, arg):
         try:
-            return self.FLASH_SIZES[arg]
+            return cls.FLASH_SIZES[arg]
         except KeyError:
             raise FatalError("Flash size '%s' is not supported by this chip type. Supported sizes: %s"
-                             % (arg, ", ".join(self.FLASH_SIZES.keys())))
+                             % (arg, ", ".join(cls.FLASH_SIZES.keys())))
 
     def run_stub(self, stub=None):
         if stub is None:
@@ -519,35 +788,43 @@ class ESPLoader(object):
         return self.STUB_CLASS(self)
 
     @stub_and_esp32_function_only
-    def flash_defl_begin(self, size, compsize, offset):
+    def flash_defl_begin(self, size, compsize, offset, block_size=None):
         """ Start downloading compressed data to Flash (performs an erase)
 
-        Returns number of blocks (size self.FLASH_WRITE_SIZE) to write.
+        Returns number of blocks (size self.write_block_size, chosen by
+        flash_write_size() unless block_size is given) to write.
         """
-        num_blocks = (compsize + self.FLASH_WRITE_SIZE - 1) // self.FLASH_WRITE_SIZE
-        erase_blocks = (size + self.FLASH_WRITE_SIZE - 1) // self.FLASH_WRITE_SIZE
+        self.write_block_size = block_size or self.flash_write_size()
+        num_blocks = (compsize + self.write_block_size - 1) // self.write_block_size
+        erase_blocks = (size + self.write_block_size - 1) // self.write_block_size
 
         t = time.time()
         if self.IS_STUB:
             write_size = size  # stub expects number of bytes here, manages erasing internally
-            timeout = DEFAULT_TIMEOUT
+            timeout = max(DEFAULT_TIMEOUT, self.flash_queued_timeout())
         else:
-            write_size = erase_blocks * self.FLASH_WRITE_SIZE  # ROM expects rounded up to erase block size
+            write_size = erase_blocks * self.write_block_size  # ROM expects rounded up to erase block size
             timeout = timeout_per_mb(ERASE_REGION_TIMEOUT_PER_MB, write_size)  # ROM performs the erase up front
         print("Compressed %d bytes to %d..." % (size, compsize))
         self.check_command("enter compressed flash mode", self.ESP_FLASH_DEFL_BEGIN,
-                           struct.pack('<IIII', write_size, num_blocks, self.FLASH_WRITE_SIZE, offset),
+                           struct.pack('<IIII', write_size, num_blocks, self.write_block_size, offset),
                            timeout=timeout)
         if size != 0 and not self.IS_STUB:
             # (stub erases as it writes, but ROM loaders erase on begin)
             print("Took %.2fs to erase flash block" % (time.time() - t))
         return num_blocks
 
-    """ Write block to flash, send compressed """
+    """ Write block to flash, send compressed, sent again if it fails """
     @stub_and_esp32_function_only
-    def flash_defl_block(self, data, seq, timeout=DEFAULT_TIMEOUT):
-        self.check_command("write compressed data to flash after seq %d" % seq,
-                           self.ESP_FLASH_DEFL_DATA, struct.pack('<IIII', len(data), seq, 0, 0) + data, self.checksum(data), timeout=timeout)
+    def flash_defl_block(self, data, seq, timeout=None, flashed=None):
+        """ Send a block of compressed data, which inflates to 'flashed'
+        bytes if known """
+        if flashed is None:
+            flashed = len(data)  # at least
+        if timeout is None:
+            timeout = self.flash_block_timeout(len(data), flashed=flashed)
+        self._send_block("write compressed data to flash", self.ESP_FLASH_DEFL_DATA, data, seq, timeout,
+                         WRITE_BLOCK_ATTEMPTS, flashed=flashed)
 
     """ Leave compressed flash mode and run/reboot """
     @stub_and_esp32_function_only
@@ -557,14 +834,15 @@ class ESPLoader(object):
             # exits the bootloader. Stub doesn't do this.
             return
         pkt = struct.pack('<I', int(not reboot))
-        self.check_command("leave compressed flash mode", self.ESP_FLASH_DEFL_END, pkt)
+        self.check_command("leave compressed flash mode", self.ESP_FLASH_DEFL_END, pkt,
+                           timeout=self.flash_queued_timeout())
         self.in_bootloader = False
 
     @stub_and_esp32_function_only
     def flash_md5sum(self, addr, size):
         # the MD5 command returns additional bytes in the standard
         # command reply slot
-        timeout = timeout_per_mb(MD5_TIMEOUT_PER_MB, size)
+        timeout = self.flash_queued_timeout(timeout_per_mb(MD5_TIMEOUT_PER_MB, size))
         res = self.check_command('calculate md5sum', self.ESP_SPI_FLASH_MD5, struct.pack('<IIII', addr, size, 0, 0),
                                  timeout=timeout)
 
@@ -585,6 +863,7 @@ class ESPLoader(object):
         self._set_port_baudrate(baud)
         time.sleep(0.05)  # get rid of crap sent during baud rate change
         self.flush_input()
+        self.link_stats = LinkStats()  # errors and latency differ at the new rate
 
     @stub_function_only
     def erase_flash(self):
@@ -611,17 +890,20 @@ class ESPLoader(object):
                                        self.FLASH_SECTOR_SIZE,
                                        64))
         # now we expect (length // block_size) SLIP frames with the data
-        data = b''
+        data = bytearray()
+        t = time.time()
         while len(data) < length:
             p = self.read()
             data += p
             self.write(struct.pack('<I', len(data)))
             if progress_fn and (len(data) % 1024 == 0 or len(data) == length):
                 progress_fn(len(data), length)
+            self.report_progress(PHASE_READ, len(data), length, t)
         if progress_fn:
             progress_fn(len(data), length)
         if len(data) > length:
             raise FatalError('Read more than expected')
+        data = bytes(data)
         digest_frame = self.read()
         if len(digest_frame) != 16:
             raise FatalError('Expected digest, got: %s' % hexify(digest_frame))
@@ -677,6 +959,20 @@ class ESPLoader(object):
         After writing command byte, writes 'data' to MOSI and then
         reads back 'read_bits' of reply on MISO. Result is a number.
         """
+        return self.run_spiflash_commands([(spiflash_command, data, read_bits)])[0]
+
+    def run_spiflash_commands(self, commands):
+        """Run several SPI flash commands, see run_spiflash_command().
+
+        'commands' is a list of (spiflash_command, data, read_bits), the
+        result is the list of numbers read back.
+
+        All register accesses of a command go out as one pipelined
+        RegisterBatch, which ends by reading back SPI_CMD_REG and the
+        result: the command has nearly always completed by then, only if
+        not SPI_CMD_REG is polled.  The SPI controller registers are saved
+        before the first command and restored after the last one.
+        """
 
         # SPI_USR register flags
         SPI_USR_COMMAND = (1 << 31)
@@ -694,24 +990,24 @@ class ESPLoader(object):
         # following two registers are ESP32 only
         if self.SPI_HAS_MOSI_DLEN_REG:
             # ESP32 has a more sophisticated wayto set up "user" commands
-            def set_data_lengths(mosi_bits, miso_bits):
+            def set_data_lengths(batch, mosi_bits, miso_bits):
                 SPI_MOSI_DLEN_REG = base + 0x28
                 SPI_MISO_DLEN_REG = base + 0x2C
                 if mosi_bits > 0:
-                    self.write_reg(SPI_MOSI_DLEN_REG, mosi_bits - 1)
+                    batch.write(SPI_MOSI_DLEN_REG, mosi_bits - 1)
                 if miso_bits > 0:
-                    self.write_reg(SPI_MISO_DLEN_REG, miso_bits - 1)
+                    batch.write(SPI_MISO_DLEN_REG, miso_bits - 1)
         else:
 
-            def set_data_lengths(mosi_bits, miso_bits):
+            def set_data_lengths(batch, mosi_bits, miso_bits):
                 SPI_DATA_LEN_REG = SPI_USR1_REG
                 SPI_MOSI_BITLEN_S = 17
                 SPI_MISO_BITLEN_S = 8
                 mosi_mask = 0 if (mosi_bits == 0) else (mosi_bits - 1)
                 miso_mask = 0 if (miso_bits == 0) else (miso_bits - 1)
-                self.write_reg(SPI_DATA_LEN_REG,
-                               (miso_mask << SPI_MISO_BITLEN_S) | (
-                                   mosi_mask << SPI_MOSI_BITLEN_S))
+                batch.write(SPI_DATA_LEN_REG,
+                            (miso_mask << SPI_MISO_BITLEN_S) | (
+                                mosi_mask << SPI_MOSI_BITLEN_S))
 
         # SPI peripheral "command" bitmasks for SPI_CMD_REG
         SPI_CMD_USR  = (1 << 18)
@@ -719,46 +1015,61 @@ class ESPLoader(object):
         # shift values
         SPI_USR2_DLEN_SHIFT = 28
 
-        if read_bits > 32:
-            raise FatalError("Reading more than 32 bits back from a SPI flash operation is unsupported")
-        if len(data) > 64:
-            raise FatalError("Writing more than 64 bytes of data with one SPI command is unsupported")
-
-        data_bits = len(data) * 8
-        old_spi_usr = self.read_reg(SPI_USR_REG)
-        old_spi_usr2 = self.read_reg(SPI_USR2_REG)
-        flags = SPI_USR_COMMAND
-        if read_bits > 0:
-            flags |= SPI_USR_MISO
-        if data_bits > 0:
-            flags |= SPI_USR_MOSI
-        set_data_lengths(data_bits, read_bits)
-        self.write_reg(SPI_USR_REG, flags)
-        self.write_reg(SPI_USR2_REG,
-                       (7 << SPI_USR2_DLEN_SHIFT) | spiflash_command)
-        if data_bits == 0:
-            self.write_reg(SPI_W0_REG, 0)  # clear data register before we read it
-        else:
-            data = pad_to(data, 4, b'\00')  # pad to 32-bit multiple
-            words = struct.unpack("I" * (len(data) // 4), data)
-            next_reg = SPI_W0_REG
-            for word in words:
-                self.write_reg(next_reg, word)
-                next_reg += 4
-        self.write_reg(SPI_CMD_REG, SPI_CMD_USR)
+        for spiflash_command, data, read_bits in commands:
+            if read_bits > 32:
+                raise FatalError("Reading more than 32 bits back from a SPI flash operation is unsupported")
+            if len(data) > 64:
+                raise FatalError("Writing more than 64 bytes of data with one SPI command is unsupported")
 
         def wait_done():
             for _ in range(10):
                 if (self.read_reg(SPI_CMD_REG) & SPI_CMD_USR) == 0:
                     return
             raise FatalError("SPI command did not complete in time")
-        wait_done()
 
-        status = self.read_reg(SPI_W0_REG)
+        batch = RegisterBatch(self)
+        old_spi_usr = batch.read(SPI_USR_REG)
+        old_spi_usr2 = batch.read(SPI_USR2_REG)
+        saved = None
+        results = []
+        for spiflash_command, data, read_bits in commands:
+            data_bits = len(data) * 8
+            flags = SPI_USR_COMMAND
+            if read_bits > 0:
+                flags |= SPI_USR_MISO
+            if data_bits > 0:
+                flags |= SPI_USR_MOSI
+            set_data_lengths(batch, data_bits, read_bits)
+            batch.write(SPI_USR_REG, flags)
+            batch.write(SPI_USR2_REG,
+                        (7 << SPI_USR2_DLEN_SHIFT) | spiflash_command)
+            if data_bits == 0:
+                batch.write(SPI_W0_REG, 0)  # clear data register before we read it
+            else:
+                data = pad_to(data, 4, b'\00')  # pad to 32-bit multiple
+                words = struct.unpack("I" * (len(data) // 4), data)
+                next_reg = SPI_W0_REG
+                for word in words:
+                    batch.write(next_reg, word)
+                    next_reg += 4
+            batch.write(SPI_CMD_REG, SPI_CMD_USR)
+            cmd = batch.read(SPI_CMD_REG)
+            status = batch.read(SPI_W0_REG)
+            values = batch.run()
+            if saved is None:
+                saved = (values[old_spi_usr], values[old_spi_usr2])
+            if values[cmd] & SPI_CMD_USR:
+                # still busy when the result was read, wait and read it again
+                wait_done()
+                results.append(self.read_reg(SPI_W0_REG))
+            else:
+                results.append(values[status])
+
         # restore some SPI controller registers
-        self.write_reg(SPI_USR_REG, old_spi_usr)
-        self.write_reg(SPI_USR2_REG, old_spi_usr2)
-        return status
+        batch.write(SPI_USR_REG, saved[0])
+        batch.write(SPI_USR2_REG, saved[1])
+        batch.run()
+        return results
 
     def read_status(self, num_bytes=2):
         """Read up to 24 bits (num_bytes) of SPI flash status register contents
@@ -773,8 +1084,9 @@ class ESPLoader(object):
 
         status = 0
         shift = 0
-        for cmd in [SPIFLASH_RDSR, SPIFLASH_RDSR2, SPIFLASH_RDSR3][0:num_bytes]:
-            status += self.run_spiflash_command(cmd, read_bits=8) << shift
+        commands = [(cmd, b"", 8) for cmd in [SPIFLASH_RDSR, SPIFLASH_RDSR2, SPIFLASH_RDSR3][0:num_bytes]]
+        for value in self.run_spiflash_commands(commands):
+            status += value << shift
             shift += 8
         return status
 
@@ -801,19 +1113,21 @@ class ESPLoader(object):
 
         enable_cmd = SPIFLASH_WREN if set_non_volatile else SPIFLASH_WEVSR
 
+        commands = []
         # try using a 16-bit WRSR (not supported by all chips)
         # this may be redundant, but shouldn't hurt
         if num_bytes == 2:
-            self.run_spiflash_command(enable_cmd)
-            self.run_spiflash_command(SPIFLASH_WRSR, struct.pack("<H", new_status))
+            commands.append((enable_cmd, b"", 0))
+            commands.append((SPIFLASH_WRSR, struct.pack("<H", new_status), 0))
 
         # also try using individual commands (also not supported by all chips for num_bytes 2 & 3)
         for cmd in [SPIFLASH_WRSR, SPIFLASH_WRSR2, SPIFLASH_WRSR3][0:num_bytes]:
-            self.run_spiflash_command(enable_cmd)
-            self.run_spiflash_command(cmd, struct.pack("B", new_status & 0xFF))
+            commands.append((enable_cmd, b"", 0))
+            commands.append((cmd, struct.pack("B", new_status & 0xFF), 0))
             new_status >>= 8
 
-        self.run_spiflash_command(SPIFLASH_WRDI)
+        commands.append((SPIFLASH_WRDI, b"", 0))
+        self.run_spiflash_commands(commands)
 
     def hard_reset(self):
         self._port.setRTS(True)  # EN->LOW
@@ -842,6 +1156,67 @@ class ESPLoader(object):
                 self.command(self.ESP_RUN_USER_CODE, wait_response=False)
 
 
+class RegisterBatch(object):
+    """ Register writes and reads queued up and sent to the chip back to back
+
+    run() sends the queued requests without waiting for each response, up
+    to ESPLoader.PIPELINE_BYTES of them in flight, then checks all the
+    responses in order.  read() returns the index of its value in the list
+    run() returns.
+
+        batch = RegisterBatch(esp)
+        batch.write(addr, value)
+        i = batch.read(addr)
+        value = batch.run()[i]
+    """
+    def __init__(self, loader):
+        self._loader = loader
+        self._requests = []  # (op, payload, addr)
+        self._reads = 0
+
+    def write(self, addr, value, mask=0xFFFFFFFF, delay_us=0):
+        self._requests.append((ESPLoader.ESP_WRITE_REG, struct.pack('<IIII', addr, value, mask, delay_us), addr))
+
+    def read(self, addr):
+        self._requests.append((ESPLoader.ESP_READ_REG, struct.pack('<I', addr), addr))
+        self._reads += 1
+        return self._reads - 1
+
+    def run(self):
+        """ Send the queued requests, return the values read """
+        loader = self._loader
+        requests, self._requests, self._reads = self._requests, [], 0
+        values = []
+        pending = collections.deque()
+        in_flight = 0
+        saved_timeout = loader._port.timeout
+        # a response may wait for the ones in flight before it
+        loader._port.timeout = loader.command_timeout(loader.PIPELINE_BYTES)
+        try:
+            for op, payload, addr in requests:
+                # what the request takes in the FIFO, SLIP escapes included
+                size = slip_frame_size(struct.pack(b'<BBHI', 0x00, op, len(payload), 0) + payload)
+                while pending and in_flight + size > loader.PIPELINE_BYTES:
+                    in_flight -= self._collect(pending.popleft(), values)
+                loader._send_request(op, payload)
+                pending.append((op, addr, size))
+                in_flight += size
+            while pending:
+                self._collect(pending.popleft(), values)
+        finally:
+            loader._port.timeout = saved_timeout
+        return values
+
+    def _collect(self, request, values):
+        op, addr, size = request
+        val, data = self._loader._read_response(op)
+        if op == ESPLoader.ESP_READ_REG:
+            values.append(self._loader._check_read_reg(addr, val, data))
+        else:
+            self._loader._check_result("write target memory", val, data)
+        return size
+
+
 class ESP8266ROM(ESPLoader):
     """ Access class for ESP8266 ROM bootloader
     """
@@ -948,6 +1323,11 @@ class ESP8266StubLoader(ESP8266ROM):
     def __init__(self, rom_loader):
         self._port = rom_loader._port
         self._trace_enabled = rom_loader._trace_enabled
+        self.progress_callback = rom_loader.progress_callback
+        self.link_stats = rom_loader.link_stats
+        self.write_block_size = self.FLASH_WRITE_SIZE
+        # bytes the last flash block sent writes, which the next command may wait for
+        self.queued_flash = 0
         self.flush_input()  # resets _slip_reader
 
     def get_erase_size(self, offset, size):
@@ -1042,6 +1422,11 @@ class ESP32StubLoader(ESP32ROM):
     def __init__(self, rom_loader):
         self._port = rom_loader._port
         self._trace_enabled = rom_loader._trace_enabled
+        self.progress_callback = rom_loader.progress_callback
+        self.link_stats = rom_loader.link_stats
+        self.write_block_size = self.FLASH_WRITE_SIZE
+        # bytes the last flash block sent writes, which the next command may wait for
+        self.queued_flash = 0
         self.flush_input()  # resets _slip_reader
 
 
@@ -1058,6 +1443,77 @@ class ESPBOOTLOADER(object):
     IMAGE_V2_SEGMENT = 4
 
 
+class StubCode(object):
+    """ Class attribute decoding the STUB_CODE_ENCODED of its class on first access
+
+    The encoded stub is a base64 encoded, zlib compressed Python literal of
+    a dict, parsed with ast.literal_eval.  The result is kept in memory and
+    in a binary cache file next to esptool.py, so only the first run ever
+    pays for the parsing.
+    """
+    CACHE_MAGIC = b'ESPSTUB1'
+    CACHE_HEADER = '<8sIIIII'  # magic, text_start, data_start (MAX_UINT32: no data), entry, text and data length
+
+    def __init__(self):
+        self._stub = None
+
+    def __get__(self, obj, cls):
+        if self._stub is None:
+            encoded = cls.STUB_CODE_ENCODED
+            path = self.cache_path(cls.CHIP_NAME, encoded)
+            self._stub = self.read_cache(path)
+            if self._stub is None:
+                self._stub = self.decode(encoded)
+                self.write_cache(path, self._stub)
+        return self._stub
+
+    @staticmethod
+    def cache_path(chip_name, encoded):
+        # named after the encoded stub, a new esptool.py version never reads an old stub
+        digest = hashlib.md5(encoded).hexdigest()[:12]
+        directory = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(directory, 'esptool-stub-%s-%s.bin' % (chip_name.lower(), digest))
+
+    @staticmethod
+    def decode(encoded):
+        import ast
+        source = zlib.decompress(base64.b64decode(encoded)).decode('utf-8')
+        return ast.literal_eval(source)
+
+    @classmethod
+    def read_cache(cls, path):
+        try:
+            with open(path, 'rb') as f:
+                cached = f.read()
+        except EnvironmentError:
+            return None
+        header_size = struct.calcsize(cls.CACHE_HEADER)
+        if len(cached) < header_size:
+            return None
+        magic, text_start, data_start, entry, text_length, data_length = \
+            struct.unpack(cls.CACHE_HEADER, cached[:header_size])
+        if magic != cls.CACHE_MAGIC or len(cached) != header_size + text_length + data_length:
+            return None
+        stub = {'text': cached[header_size:header_size + text_length], 'text_start': text_start, 'entry': entry}
+        if data_start != MAX_UINT32:
+            stub['data'] = cached[header_size + text_length:]
+            stub['data_start'] = data_start
+        return stub
+
+    @classmethod
+    def write_cache(cls, path, stub):
+        data = stub.get('data', b'')
+        header = struct.pack(cls.CACHE_HEADER, cls.CACHE_MAGIC, stub['text_start'],
+                             stub.get('data_start', MAX_UINT32), stub['entry'], len(stub['text']), len(data))
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(header + stub['text'] + data)
+            os.rename(tmp_path, path)
+        except EnvironmentError:
+            pass  # read-only install, the stub is just decoded again next time
+
+
 def LoadFirmwareImage(chip, filename):
     """ Load a firmware image. Can be for ESP8266 or ESP32. ESP8266 images will be examined to determine if they are
         original ROM firmware images (ESPFirmwareImage) or "v2" OTA bootloader images.
@@ -1601,6 +2057,12 @@ class ELFFile(object):
         self.sections = prog_sections
 
 
+def slip_frame_size(packet):
+    """ Bytes ESPLoader.write sends for packet: 0xC0 and 0xDB take two bytes
+    each, plus the frame delimiters """
+    return len(packet) + packet.count(b'\xc0') + packet.count(b'\xdb') + 2
+
+
 def slip_reader(port, trace_function):
     """Generator to read SLIP packets from a serial port.
     Yields one full SLIP packet at a time, raises exception on timeout or invalid data.
@@ -1616,7 +2078,7 @@ def slip_reader(port, trace_function):
         if read_bytes == b'':
             waiting_for = "header" if partial_packet is None else "content"
             trace_function("Timed out waiting for packet %s", waiting_for)
-            raise FatalError("Timed out waiting for packet %s" % waiting_for)
+            raise NoResponseError("Timed out waiting for packet %s" % waiting_for)
         trace_function("Read %d bytes: %r", len(read_bytes), read_bytes)
         for b in read_bytes:
             if type(b) is int:
@@ -1704,10 +2166,33 @@ def pad_to(data, alignment, pad_character=b'\xFF'):
     """ Pad to the next alignment boundary """
     pad_mod = len(data) % alignment
     if pad_mod != 0:
-        data += pad_character * (alignment - pad_mod)
+        data = data[:] + pad_character * (alignment - pad_mod)  # [:] turns an mmap into bytes
     return data
 
 
+def iter_blocks(data, block_size):
+    """ Yield (seq, block) for data split into block_size pieces
+
+    Blocks are sliced at their offset, so only the block itself is copied,
+    never the rest of the image.
+    """
+    for seq, offset in enumerate(range(0, len(data), block_size)):
+        yield seq, data[offset:offset + block_size]
+
+
+def map_file(f):
+    """ Return the contents of file object f as a read-only mmap, or as bytes
+    if it can't be mapped (empty file, not a real file...)
+
+    Close the result when it's an mmap.
+    """
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, ValueError, EnvironmentError, io.UnsupportedOperation):
+        f.seek(0)
+        return f.read()
+
+
 class FatalError(RuntimeError):
     """
     Wrapper class for runtime errors that aren't caused by internal bugs, but by
@@ -1726,6 +2211,12 @@ class FatalError(RuntimeError):
         return FatalError(message)
 
 
+class NoResponseError(FatalError):
+    """
+    Raised when the chip sends nothing within the timeout of a command.
+    """
+
+
 class NotImplementedInROMError(FatalError):
     """
     Wrapper class for the error thrown when a particular ESP bootloader function
@@ -1741,19 +2232,17 @@ class NotImplementedInROMError(FatalError):
 
 
 def load_ram(esp, args):
-    image = LoadFirmwareImage(esp, args.filename)
+    image = LoadFirmwareImage(esp.CHIP_NAME.lower(), args.filename)
 
     print('RAM boot...')
-    for (offset, size, data) in image.segments:
-        print('Downloading %d bytes at %08x...' % (size, offset), end=' ')
+    for seg in image.segments:
+        size = len(seg.data)
+        print('Downloading %d bytes at %08x...' % (size, seg.addr), end=' ')
         sys.stdout.flush()
-        esp.mem_begin(size, div_roundup(size, esp.ESP_RAM_BLOCK), esp.ESP_RAM_BLOCK, offset)
+        esp.mem_begin(size, div_roundup(size, esp.ESP_RAM_BLOCK), esp.ESP_RAM_BLOCK, seg.addr)
 
-        seq = 0
-        while len(data) > 0:
-            esp.mem_block(data[0:esp.ESP_RAM_BLOCK], seq)
-            data = data[esp.ESP_RAM_BLOCK:]
-            seq += 1
+        for seq, block in iter_blocks(seg.data, esp.ESP_RAM_BLOCK):
+            esp.mem_block(block, seq)
         print('done!')
 
     print('All segments done, executing at %08x' % image.entrypoint)
@@ -1769,16 +2258,21 @@ def write_mem(esp, args):
     print('Wrote %08x, mask %08x to %08x' % (args.value, args.mask, args.address))
 
 
+DUMP_MEM_CHUNK = 1024  # bytes dump_mem reads with one read_regs() call
+
+
 def dump_mem(esp, args):
-    f = open(args.filename, 'wb')
-    for i in range(args.size // 4):
-        d = esp.read_reg(args.address + (i * 4))
-        f.write(struct.pack(b'<I', d))
-        if f.tell() % 1024 == 0:
-            print('\r%d bytes read... (%d %%)' % (f.tell(),
-                                                  f.tell() * 100 // args.size),
-                  end=' ')
-        sys.stdout.flush()
+    size = args.size // 4 * 4
+    t = time.time()
+    with open(args.filename, 'wb') as f:
+        # read in chunks of pipelined READ_REGs, each written out as it arrives
+        for offset in range(0, size, DUMP_MEM_CHUNK):
+            end = min(offset + DUMP_MEM_CHUNK, size)
+            values = esp.read_regs(range(args.address + offset, args.address + end, 4))
+            f.write(struct.pack(b'<%dI' % len(values), *values))
+            print('\r%d bytes read... (%d %%)' % (end, end * 100 // args.size), end=' ')
+            sys.stdout.flush()
+            esp.report_progress(PHASE_READ, end, size, t)
     print('Done!')
 
 
@@ -1822,6 +2316,257 @@ def _update_image_flash_params(esp, address, args, image):
     return image
 
 
+def coalesce_regions(regions, sector_size=ESPLoader.FLASH_SECTOR_SIZE):
+    """ Merge the (address, name, data) regions which end and start in
+    neighbouring flash sectors into one, so they are written as a single
+    (compressed) stream.  Returns (address, names, data) tuples, names
+    being the list of the names merged.
+
+    The gap between two merged regions is filled with 0xFF.  It lies in
+    sectors the regions are erased in anyway, so flash ends up the same.
+    Regions sharing a sector are an error.
+    """
+    merged = []
+    for address, name, data in sorted(regions, key=lambda r: r[0]):
+        if merged:
+            prev_address, prev_names, prev_data = merged[-1]
+            prev_end = prev_address + len(prev_data)
+            erased_end = (prev_end + sector_size - 1) & ~(sector_size - 1)
+            if address < erased_end:
+                raise FatalError('Detected overlap at address: 0x%x for file: %s' % (address, name))
+            if address & ~(sector_size - 1) == erased_end:
+                merged[-1] = (prev_address, prev_names + [name],
+                              b''.join([prev_data[:], b'\xff' * (address - prev_end), data[:]]))  # [:] turns an mmap into bytes
+                continue
+        merged.append((address, [name], data))
+    return merged
+
+
+_compressed_images = collections.OrderedDict()  # (MD5, size) of image: compressed image, newest last
+_compressing = {}  # (MD5, size) of image: lock held while it is compressed
+_compress_lock = threading.Lock()  # of both, never held while compressing
+
+
+def compress_image(image, md5=None):
+    """ Return image compressed for flash_defl_begin.
+
+    The compressed images are kept, up to COMPRESSED_CACHE_BYTES, so an
+    image written to many boards, one after the other or in parallel, is
+    only compressed once.  Different images are compressed in parallel. """
+    key = (md5 or hashlib.md5(image).hexdigest(), len(image))
+    with _compress_lock:
+        compressed = _cached_compressed(key)
+        if compressed is not None:
+            return compressed
+        key_lock = _compressing.setdefault(key, threading.Lock())
+    with key_lock:  # others writing the same image wait for it
+        with _compress_lock:
+            compressed = _cached_compressed(key)
+        if compressed is None:
+            compressed = zlib.compress(image, 9)
+            with _compress_lock:
+                _keep_compressed(key, compressed)
+                _compressing.pop(key, None)
+    return compressed
+
+
+def add_compressed_image(md5, size, compressed):
+    """ Hand compress_image the compressed data of an image with this MD5
+    and size, compressed before (by a firmware store, say) """
+    with _compress_lock:
+        _compressed_images.pop((md5, size), None)
+        _keep_compressed((md5, size), compressed)
+
+
+def _cached_compressed(key):
+    # with _compress_lock held: the kept image, now the newest, or None
+    compressed = _compressed_images.pop(key, None)
+    if compressed is not None:
+        _compressed_images[key] = compressed
+    return compressed
+
+
+def _keep_compressed(key, compressed):
+    _compressed_images[key] = compressed
+    cached = sum(len(c) for c in _compressed_images.values())
+    while cached > COMPRESSED_CACHE_BYTES and len(_compressed_images) > 1:
+        cached -= len(_compressed_images.popitem(last=False)[1])
+
+
+class WriteCheckpoint(object):
+    """ How far write_flash got with each region, kept by the caller across
+    attempts (as args.checkpoint) so a write interrupted by a link error is
+    resumed instead of started over.
+
+    A region is known by its address and the MD5 of its contents.  What
+    the checkpoint claims is not trusted: the resumed write checks the
+    sectors before it by MD5 first (see resume_offset). """
+
+    def __init__(self):
+        self.erased = False  # the whole chip, before the regions were written
+        self._written = {}  # (address, MD5): bytes of the region written
+
+    def written(self, address, md5):
+        return self._written.get((address, md5), 0)
+
+    def update(self, address, md5, written):
+        self._written[(address, md5)] = written
+
+    def done(self, address, md5):
+        self._written.pop((address, md5), None)
+
+
+def resume_offset(esp, address, image, written, sector_size=ESPLoader.FLASH_SECTOR_SIZE):
+    """ Return the offset in image, written at address, to resume writing it
+    from: the start of the first sector not matching image in flash, of
+    those a previous attempt claims to have 'written'.  One MD5 command if
+    the claim holds, else about log2(sectors) (see find_bad_ranges). """
+    end = (address + min(written, len(image))) & ~(sector_size - 1)
+    if end <= address:
+        return 0
+    verified = image[:end - address]
+    if esp.flash_md5sum(address, len(verified)) == hashlib.md5(verified).hexdigest():
+        return end - address
+    return max(find_bad_ranges(esp, address, verified, sector_size)[0][0] & ~(sector_size - 1), address) - address
+
+
+def _write_flash_region(esp, args, address, image):
+    """ Write one region of write_flash, image being its (mapped) contents.
+
+    If a block keeps failing, the block size flash_write_size() chose is
+    too large for the link: the rest of the region is written again, from
+    the first sector not in flash, in blocks half the size, down to
+    MIN_FLASH_WRITE_SIZE. """
+    calcmd5 = hashlib.md5(image).hexdigest()
+    region_address, region_size = address, len(image)
+    checkpoint = getattr(args, 'checkpoint', None)
+    skipped = 0
+    if checkpoint is not None and checkpoint.written(address, calcmd5):
+        try:
+            skipped = resume_offset(esp, address, image, checkpoint.written(address, calcmd5))
+        except NotImplementedInROMError:
+            pass  # no flash MD5 to check the sectors written with
+        if skipped:
+            print('Resuming at 0x%08x, %d bytes already in flash' % (address + skipped, skipped))
+    block_size = None  # chosen by flash_write_size()
+    start, written = skipped, 0
+    t = time.time()
+    while True:
+        address = region_address + skipped
+        part = image[skipped:]
+        uncsize = len(part)
+        if args.compress:
+            part = compress_image(part, None if skipped else calcmd5)
+            blocks = esp.flash_defl_begin(uncsize, len(part), address, block_size)
+            # what each block inflates to on the chip, for its timeout and the progress
+            inflate = zlib.decompressobj()
+        else:
+            blocks = esp.flash_begin(uncsize, address, block_size)
+        block_size = esp.write_block_size
+        esp.trace("Writing in blocks of %d bytes", block_size)
+        done = 0
+        try:
+            for seq, block in iter_blocks(part, block_size):
+                print('\rWriting at 0x%08x... (%d %%)' % (address + seq * block_size, 100 * (seq + 1) // blocks),
+                      end='')
+                sys.stdout.flush()
+                if args.compress:
+                    flashed = len(inflate.decompress(block))
+                    esp.flash_defl_block(block, seq, timeout=esp.flash_block_timeout(len(block), flashed=flashed),
+                                         flashed=flashed)
+                else:
+                    # Pad the last block
+                    block = block + b'\xff' * (block_size - len(block))
+                    flashed = len(block)
+                    esp.flash_block(block, seq, timeout=esp.flash_block_timeout(len(block)))
+                written += len(block)
+                # progress in image bytes, so rate and ETA are not skewed by compression
+                done = min(uncsize, done + flashed)
+                esp.report_progress(PHASE_WRITE, skipped + done, region_size, t)
+                if checkpoint is not None:
+                    checkpoint.update(region_address, calcmd5, skipped + done)
+            break
+        except NoResponseError:
+            raise  # the chip is gone, smaller blocks will not help
+        except FatalError as e:
+            if block_size <= esp.MIN_FLASH_WRITE_SIZE:
+                raise
+            block_size //= 2
+            print('\n%s, writing the rest in blocks of %d bytes...' % (e, block_size))
+            try:
+                skipped += resume_offset(esp, address, image[skipped:], done)
+            except NotImplementedInROMError:
+                pass  # no flash MD5 to check the sectors written with, start the part over
+    t = time.time() - t
+    address, uncsize = region_address + start, region_size - start
+    speed_msg = ""
+    if args.compress:
+        if t > 0.0:
+            speed_msg = " (effective %.1f kbit/s)" % (uncsize / t * 8 / 1000)
+        print('\rWrote %d bytes (%d compressed) at 0x%08x in %.1f seconds%s...' % (uncsize, written, address, t, speed_msg))
+    else:
+        if t > 0.0:
+            speed_msg = " (%.1f kbit/s)" % (written / t * 8 / 1000)
+        print('\rWrote %d bytes at 0x%08x in %.1f seconds%s...' % (written, address, t, speed_msg))
+    try:
+        t = time.time()
+        esp.report_progress(PHASE_VERIFY, 0, region_size, t)
+        res = esp.flash_md5sum(region_address, region_size)
+        esp.report_progress(PHASE_VERIFY, region_size, region_size, t)
+        if res != calcmd5:
+            if checkpoint is not None:
+                checkpoint.done(region_address, calcmd5)  # start over next time
+            print('File  md5: %s' % calcmd5)
+            print('Flash md5: %s' % res)
+            print('MD5 of 0xFF is %s' % (hashlib.md5(b'\xFF' * region_size).hexdigest()))
+            raise FatalError("MD5 of file does not match data in flash!")
+        else:
+            print('Hash of data verified.')
+    except NotImplementedInROMError:
+        pass
+    if checkpoint is not None:
+        checkpoint.done(region_address, calcmd5)
+
+
+def flash_regions(esp, args, mapped):
+    """ Return the regions write_flash writes for args.addr_filename, as
+    (address, names, image) tuples: padded, with the flash parameters of a
+    bootloader image patched and coalesced.  esp may be a loader class,
+    this needs no chip.
+
+    The files are mapped rather than read, an image is only copied into
+    memory if its header has to be changed, it has to be padded or it is
+    merged with its neighbours.  The mmaps are added to mapped, to be
+    closed by the caller. """
+    regions = []
+    for address, argfile in args.addr_filename:
+        data = map_file(argfile)
+        argfile.seek(0)  # in case we need it again
+        mapped.append(data)
+        image = pad_to(data, 4)
+        if len(image) == 0:
+            print('WARNING: File %s is empty' % argfile.name)
+            continue
+        regions.append((address, argfile.name, _update_image_flash_params(esp, address, args, image)))
+    return coalesce_regions(regions)
+
+
+def prepare_write_flash(loader_class, args):
+    """ Do what write_flash(esp, args) does to the files before talking to
+    a loader_class chip: mapping, patching, hashing and compressing them.
+    The compressed images are kept (see compress_image), so write_flash
+    right after only has to send them. """
+    mapped = []
+    try:
+        for address, names, image in flash_regions(loader_class, args, mapped):
+            if args.compress:
+                compress_image(image)
+    finally:
+        for data in mapped:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+
 def write_flash(esp, args):
     # set args.compress based on default behaviour:
     # -> if either --compress or --no-compress is set, honour that
@@ -1829,72 +2574,29 @@ def write_flash(esp, args):
     if args.compress is None and not args.no_compress:
         args.compress = not args.no_stub
 
-    # verify file sizes fit in flash
-    flash_end = flash_size_bytes(args.flash_size)
-    for address, argfile in args.addr_filename:
-        argfile.seek(0,2)  # seek to end
-        if address + argfile.tell() > flash_end:
-            raise FatalError(("File %s (length %d) at offset %d will not fit in %d bytes of flash. " +
-                             "Use --flash-size argument, or change flashing address.")
-                             % (argfile.name, argfile.tell(), address, flash_end))
-        argfile.seek(0)
+    # verify file sizes fit in flash (with 'keep' the caller knows the size)
+    if args.flash_size != 'keep':
+        flash_end = flash_size_bytes(args.flash_size)
+        for address, argfile in args.addr_filename:
+            argfile.seek(0,2)  # seek to end
+            if address + argfile.tell() > flash_end:
+                raise FatalError(("File %s (length %d) at offset %d will not fit in %d bytes of flash. " +
+                                 "Use --flash-size argument, or change flashing address.")
+                                 % (argfile.name, argfile.tell(), address, flash_end))
+            argfile.seek(0)
 
-    for address, argfile in args.addr_filename:
-        if args.no_stub:
-            print('Erasing flash...')
-        image = pad_to(argfile.read(), 4)
-        if len(image) == 0:
-            print('WARNING: File %s is empty' % argfile.name)
-            continue
-        image = _update_image_flash_params(esp, address, args, image)
-        calcmd5 = hashlib.md5(image).hexdigest()
-        uncsize = len(image)
-        if args.compress:
-            uncimage = image
-            image = zlib.compress(uncimage, 9)
-            ratio = uncsize / len(image)
-            blocks = esp.flash_defl_begin(uncsize, len(image), address)
-        else:
-            ratio = 1.0
-            blocks = esp.flash_begin(uncsize, address)
-        argfile.seek(0)  # in case we need it again
-        seq = 0
-        written = 0
-        t = time.time()
-        while len(image) > 0:
-            print('\rWriting at 0x%08x... (%d %%)' % (address + seq * esp.FLASH_WRITE_SIZE, 100 * (seq + 1) // blocks), end='')
-            sys.stdout.flush()
-            block = image[0:esp.FLASH_WRITE_SIZE]
-            if args.compress:
-                esp.flash_defl_block(block, seq, timeout=DEFAULT_TIMEOUT * ratio)
-            else:
-                # Pad the last block
-                block = block + b'\xff' * (esp.FLASH_WRITE_SIZE - len(block))
-                esp.flash_block(block, seq)
-            image = image[esp.FLASH_WRITE_SIZE:]
-            seq += 1
-            written += len(block)
-        t = time.time() - t
-        speed_msg = ""
-        if args.compress:
-            if t > 0.0:
-                speed_msg = " (effective %.1f kbit/s)" % (uncsize / t * 8 / 1000)
-            print('\rWrote %d bytes (%d compressed) at 0x%08x in %.1f seconds%s...' % (uncsize, written, address, t, speed_msg))
-        else:
-            if t > 0.0:
-                speed_msg = " (%.1f kbit/s)" % (written / t * 8 / 1000)
-            print('\rWrote %d bytes at 0x%08x in %.1f seconds%s...' % (written, address, t, speed_msg))
-        try:
-            res = esp.flash_md5sum(address, uncsize)
-            if res != calcmd5:
-                print('File  md5: %s' % calcmd5)
-                print('Flash md5: %s' % res)
-                print('MD5 of 0xFF is %s' % (hashlib.md5(b'\xFF' * uncsize).hexdigest()))
-                raise FatalError("MD5 of file does not match data in flash!")
-            else:
-                print('Hash of data verified.')
-        except NotImplementedInROMError:
-            pass
+    mapped = []
+    try:
+        for address, names, image in flash_regions(esp, args, mapped):
+            if len(names) > 1:
+                print('Writing %s as one region...' % ', '.join(names))
+            if args.no_stub:
+                print('Erasing flash...')
+            _write_flash_region(esp, args, address, image)
+    finally:
+        for data in mapped:
+            if isinstance(data, mmap.mmap):
+                data.close()
 
     print('\nLeaving...')
 
@@ -1989,14 +2691,18 @@ def chip_id(esp, args):
 def erase_flash(esp, args):
     print('Erasing flash (this may take a while)...')
     t = time.time()
+    esp.report_progress(PHASE_ERASE, 0, 1, t)
     esp.erase_flash()
+    esp.report_progress(PHASE_ERASE, 1, 1, t)
     print('Chip erase completed successfully in %.1fs' % (time.time() - t))
 
 
 def erase_region(esp, args):
     print('Erasing region (may be slow depending on size)...')
     t = time.time()
+    esp.report_progress(PHASE_ERASE, 0, args.size, t)
     esp.erase_region(args.address, args.size)
+    esp.report_progress(PHASE_ERASE, args.size, args.size, t)
     print('Erase completed successfully in %.1f seconds.' % (time.time() - t))
 
 
@@ -2031,6 +2737,65 @@ def read_flash(esp, args):
     open(args.filename, 'wb').write(data)
 
 
+def find_bad_ranges(esp, address, image, sector_size=ESPLoader.FLASH_SECTOR_SIZE):
+    """ Return the (start, end) flash address ranges, in whole sectors (cut
+    to the region at its ends), where flash differs from image written at
+    address.  The region is known to differ already.
+
+    Bisects with flash_md5sum: a differing range is split at a sector
+    boundary and its first half hashed.  If that half matches, the second
+    one must be the one differing and is bisected without hashing it.  A
+    single bad sector in N sectors takes about log2(N) MD5 commands, and
+    only the bad sectors need to be read back.
+    """
+    def differs(start, end):
+        expected = hashlib.md5(image[start - address:end - address]).hexdigest()
+        return esp.flash_md5sum(start, end - start) != expected
+
+    def bisect(start, end):
+        if start // sector_size == (end - 1) // sector_size:
+            return [(start, end)]  # within one sector
+        mid = (start + end) // 2 & ~(sector_size - 1)
+        if mid <= start:
+            mid += sector_size
+        if not differs(start, mid):
+            return bisect(mid, end)
+        bad = bisect(start, mid)
+        if differs(mid, end):
+            bad += bisect(mid, end)
+        return bad
+
+    ranges = []
+    for start, end in bisect(address, address + len(image)):
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
+
+
+def diff_runs(data, expected):
+    """ Return the (start, end) index ranges where the equally long data and
+    expected differ """
+    data = bytearray(data)
+    expected = bytearray(expected)
+    runs = []
+    start = None
+    for i in range(len(data)):
+        if data[i] != expected[i]:
+            if start is None:
+                start = i
+        elif start is not None:
+            runs.append((start, i))
+            start = None
+    if start is not None:
+        runs.append((start, len(data)))
+    return runs
+
+
+DIFF_SHOW_BYTES = 8  # bytes of a differing range verify_flash --diff prints
+
+
 def verify_flash(esp, args):
     differences = False
 
@@ -2054,17 +2819,23 @@ def verify_flash(esp, args):
                 print('-- verify FAILED (digest mismatch)')
                 continue
 
-        flash = esp.read_flash(address, image_size)
-        assert flash != image
-        diff = [i for i in range(image_size) if flash[i] != image[i]]
-        print('-- verify FAILED: %d differences, first @ 0x%08x' % (len(diff), address + diff[0]))
-        for d in diff:
-            flash_byte = flash[d]
-            image_byte = image[d]
-            if PYTHON2:
-                flash_byte = ord(flash_byte)
-                image_byte = ord(image_byte)
-            print('   %08x %02x %02x' % (address + d, flash_byte, image_byte))
+        # only the sectors which differ are read back
+        runs = []
+        for start, end in find_bad_ranges(esp, address, image):
+            flash = esp.read_flash(start, end - start)
+            expected = image[start - address:end - address]
+            for run_start, run_end in diff_runs(flash, expected):
+                runs.append((start + run_start, flash[run_start:run_end], expected[run_start:run_end]))
+        if not runs:
+            print('-- verify FAILED (digest mismatch, no differences in the data read back)')
+            continue
+        print('-- verify FAILED: %d differences in %d ranges, first @ 0x%08x' %
+              (sum(len(run[1]) for run in runs), len(runs), runs[0][0]))
+        for run_address, flash_bytes, image_bytes in runs:
+            # address, length, then the first bytes in flash and in the image
+            print('   %08x %6d %s %s' % (run_address, len(flash_bytes),
+                                        hexify(flash_bytes[:DIFF_SHOW_BYTES]).lower(),
+                                        hexify(image_bytes[:DIFF_SHOW_BYTES]).lower()))
     if differences:
         raise FatalError("Verify failed.")
 
@@ -2301,6 +3072,7 @@ def main():
 
     operation_func = globals()[args.operation]
 
+    import inspect  # only needed here, and slow to import
     if PYTHON2:
         # This function is depreciated in Python3
         operation_args = inspect.getargspec(operation_func).args
@@ -2484,8 +3256,9 @@ class AddrFilenamePairAction(argparse.Action):
         setattr(namespace, self.dest, pairs)
 
 
-# Binary stub code (see flasher_stub dir for source & details)
-ESP8266ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
+# Binary stub code (see flasher_stub dir for source & details), decoded on
+# first use by StubCode
+ESP8266ROM.STUB_CODE_ENCODED = b"""
 eNrNPXt/1Da2X2XshJCEASzb40cIy2QShkdhG6BJQ3/TbWzZhlJgkyG7SVn2fvbr85Jkz4RA2e69f4SObFk6Ou9zdKT+6/pZfXF2fWtQXp9dFNnsQgWziyAYt/+o2UXTwN/0Pjzq/mXtX1Pf+/7hzqP2u7j9K6Hr\
 vfat5kZ9j7plzme67alymGVMPenFcW8Ctfy3cvoQaA5AujsTzdCD2n40Xrqc2UWub/A6ikB+tdNedwaOHajNgAxJBxO9hgxXdrDVQdBgw4G1JUZWIVhHDoBAI/N1Do3aaeQG8bHzBj5WpR26CGbzHnIyA8LsTH7u\
 t//UTkOFzhDaAaMMnIZqzCK228c5AxS4oAKxisqBLnCgCzovNc1l5lEjB0WqywNB4LAeNmT2UguNWsJnmdMobOMIvxoPn+B/gjv4n4uHhl0e868yfsS/tL7Fv1Q7QR1yo8py/PXaPGsHqWTGvAWsRq4eP1kTkHhI\
@@ -2553,8 +3326,8 @@ ju007hCki32QuLWM2ZjGdTm89ZlB+Yaopd0qPpfUNv7FPiPOwHxK+IlYteMtsnwy64oZL2+UJV0DtPgm
 RT9UOtZp9e5iVr258QyYay8D96pZ2+jcHlj0kje9MbVacuO26vXv38Id9tpRrx332kmvnfXauttWPXg6J5fVwG10erpXeavjxUu//7Q/dUU7/EoeuoqnruKxfju5op1e0c4+2z77TOv9Z1rdu76XtfVn2/PPyc6V\
 f18rt8lX4ejsK9bdh7y5Qgv0IFc9SFQPi6oz3orbuOE2OsPecRu7buOF2+gQ5ENP0/TgLHpt3WvX0RIpUf9FKf6ztcC3aolv1SLfqmW+VQtd1f7KPxXY9JmRQHQ3+MToiCUtNhsmc8Ya5zGMpKnL/08Tiyv12ct1\
 neIoDdsQM/v3/wLWvxs5\
-""")))
-ESP32ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
+"""
+ESP32ROM.STUB_CODE_ENCODED = b"""
 eNqNWnt31LgV/yqOIU/I1rI9tsQ5W5JAhxC2XcKWEOic3bFkO4EtKWSnm7BL+9mr+7LkmUnbPybYsnR1dR+/+xC/by+628X2o8Ruz257nfg/5WN4yvCpOpzdZv7RKP/a+l8/u3VZQoNazxb+Lzxl98+O6SvObP6f\
 mQroZTRBfioTDrLoKfpp4aib+M+OKGnY09Jz5seyfNh7F9bEXG2ssJe+J4r8ujNbnF2v8o9kgLjK5ST+vUx2svUnybIDYrULfKrKc9IEnrs2kplb2tMY2jMMIBNnX+6W3vBT4Vln0WpQavuYCMgvo3NE6t4QbvIU\
 PgHfT/zDBE6iw0m6hr42E5H++RGJqBdRFYdAFj698fNg1J6nwNNrULU/m5vAjJyJguoKkHZ6cO5f1aYfLyIVZ/wMx5oAhdMwGHQFcpvQijYffTy6HGn6GOW5YKL66DhlVbvsUQmEjky6JGgRItglspstGSm+mCyS\
@@ -2584,7 +3357,11 @@ d1t4I9etNsC1Ds5tJqtzcHyN6jQ3bMi4d+qANZZjglxnwEzbBceiPIwp52soi8HxtQyGK1CBnpIe+t6X
 uTi8mvPVGEbifLge3Y57LItVaUgHA4tmAjc8/QDB7/m7k/QHRFD9himulfz2zSVshHaXb0Al1L0PCYz0+I36Mcpr9eVQYjo93wHmP+Lyd0zU4IWlCdurnKYB1Z9RTWjCrwgfQJSmCGaw/hbFyK3RkBPvMGayA1Lv\
 JA8yxwhexcLCjtlX6nPQLlsc9CdbKT9VoV87uvrLdu/JXkDGpdx+y6qlvLR1GIdN/P+ScO4+jcTHG3Zov7Is5DB2tDQNjITlvGQsru2HCf6/sZ9+WTTX8L/HVFaXRaGqUvsv3dXi+sswWGQ5DLbNouH/ZhY1f7f5\
 S0yomEyqQut//QdAk8Ky\
-""")))
+"""
+
+
+ESP8266ROM.STUB_CODE = StubCode()
+ESP32ROM.STUB_CODE = StubCode()
 
 
 def _main():
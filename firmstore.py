@@ -0,0 +1,248 @@
+# coding=utf-8
+
+"""
+Local content-addressed firmware store.
+
+Every firmware image added is kept once, under its SHA-256, together with
+what flashing it needs and what tells builds apart, worked out when it is
+added rather than on every flash:
+
+- the header of the image: chip, segments, entry point, flash mode, size
+  and frequency, parsed with esptool,
+- the MicroPython version and build date found in the image,
+- its MD5 and its payload compressed the way write_flash sends it.
+
+index.json in the store holds these per image together with tags
+("production", "beta") set by the user.  An image is looked up by digest
+(or a prefix of it), tag, version or file name.  A tag belongs to one
+image at a time, tagging another image moves it.
+
+Example usage:
+
+    store = FirmwareStore()
+    entry = store.add('build/firmware-combined.bin', tags=['beta'])
+    path = store.path(store.find('beta'))
+"""
+
+from __future__ import print_function
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+
+STORE_DIR = './firmware-store'
+INDEX_FILE = 'index.json'
+COMPRESS_LEVEL = 9  # what esptool.write_flash compresses with
+
+ESP_IMAGE_MAGIC = 0xe9
+ESP8266_V2_MAGIC = 0xea
+ESP32_IRAM = (0x40080000, 0x400a0000)  # entry points of ESP32 images, ESP8266 ones are above
+FLASH_MODES = {0: 'qio', 1: 'qout', 2: 'dio', 3: 'dout'}
+FLASH_FREQS = {0: '40m', 1: '26m', 2: '20m', 0xf: '80m'}
+MICROPYTHON_BANNER = re.compile(br'MicroPython (v[0-9][\w.+-]*) on (\d{4}-\d{2}-\d{2})')
+
+
+def image_chip(data):
+    """Return 'esp8266' or 'esp32' for a firmware image starting with data,
+    None if it is no image (a filesystem image, say)."""
+    if len(data) < 8 or bytearray(data[0:1])[0] not in (ESP_IMAGE_MAGIC, ESP8266_V2_MAGIC):
+        return None
+    if bytearray(data[0:1])[0] == ESP8266_V2_MAGIC:
+        return 'esp8266'
+    entry = bytearray(data[4:8])
+    entry = entry[0] | entry[1] << 8 | entry[2] << 16 | entry[3] << 24
+    return 'esp32' if ESP32_IRAM[0] <= entry < ESP32_IRAM[1] else 'esp8266'
+
+
+def image_metadata(path, data, mtime=None):
+    """Return the index entry fields describing the image data read from
+    path, as far as they can be found.  The build time is the one in the
+    image, else mtime."""
+    import esptool
+
+    meta = {'chip': image_chip(data), 'segments': [], 'entry': None, 'flash_mode': None,
+            'flash_size': None, 'flash_freq': None, 'version': None, 'build_time': None}
+    if mtime is not None:
+        meta['build_time'] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))
+    if meta['chip'] is not None:
+        try:
+            image = esptool.LoadFirmwareImage(meta['chip'], path)
+        except (esptool.FatalError, ValueError, IndexError, TypeError) as e:
+            print("WARNING: %s: %s" % (path, e))
+        else:
+            rom = esptool.ESP32ROM if meta['chip'] == 'esp32' else esptool.ESP8266ROM
+            sizes = dict((v, k) for k, v in rom.FLASH_SIZES.items())
+            meta['segments'] = [[s.addr, len(s.data)] for s in image.segments]
+            meta['entry'] = image.entrypoint
+            meta['flash_mode'] = FLASH_MODES.get(image.flash_mode)
+            meta['flash_size'] = sizes.get(image.flash_size_freq & 0xf0)
+            meta['flash_freq'] = FLASH_FREQS.get(image.flash_size_freq & 0x0f)
+    banner = MICROPYTHON_BANNER.search(data)
+    if banner is not None:
+        meta['version'] = banner.group(1).decode('ascii')
+        meta['build_time'] = banner.group(2).decode('ascii')
+    return meta
+
+
+def _replace(src, dst):
+    # os.replace is Python 3 only, os.rename does not overwrite on Windows
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+    else:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+class FirmwareStore(object):
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._index = {}  # digest: entry
+        self._mtime = None  # of index.json when read, to notice other processes writing it
+
+    def _index_path(self):
+        return os.path.join(self.root, INDEX_FILE)
+
+    def _load(self):
+        path = self._index_path()
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        if mtime != self._mtime:
+            with open(path, 'r') as f:
+                self._index = json.load(f)
+            self._mtime = mtime
+
+    def _save(self):
+        path = self._index_path()
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self._index, f, indent=1, sort_keys=True)
+        _replace(path + '.tmp', path)
+        self._mtime = os.path.getmtime(path)
+
+    def path(self, entry):
+        """Path of the image of an index entry"""
+        return os.path.join(self.root, entry['digest'] + '.bin')
+
+    def compressed_path(self, entry):
+        return os.path.join(self.root, entry['digest'] + '.z')
+
+    def add(self, source, name=None, tags=()):
+        """Add the image at path source, or the bytes source, to the store
+        if it is not in yet, tag it and return its index entry."""
+        mtime = None
+        if isinstance(source, bytes):
+            data = source
+        else:
+            with open(source, 'rb') as f:
+                data = f.read()
+            name = name or os.path.basename(source)
+            mtime = os.path.getmtime(source)
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if not os.path.isdir(self.root):
+                os.makedirs(self.root)
+            self._load()
+            entry = self._index.get(digest)
+            if entry is None:
+                entry = {'digest': digest, 'name': name or digest[:12], 'size': len(data),
+                         'md5': hashlib.md5(data).hexdigest(), 'tags': [],
+                         'added': time.strftime('%Y-%m-%d %H:%M:%S')}
+                for path, contents in ((self.path(entry), data),
+                                       (self.compressed_path(entry), zlib.compress(data, COMPRESS_LEVEL))):
+                    with open(path + '.tmp', 'wb') as f:
+                        f.write(contents)
+                    _replace(path + '.tmp', path)
+                entry['compressed_size'] = os.path.getsize(self.compressed_path(entry))
+                entry.update(image_metadata(self.path(entry), data, mtime))
+                self._index[digest] = entry
+            self._tag(entry, tags)
+            self._save()
+            return dict(entry)
+
+    def tag(self, ref, *tags):
+        """Tag the image ref (see find) and return its entry."""
+        with self._lock:
+            self._load()
+            entry = self._find(ref)
+            self._tag(entry, tags)
+            self._save()
+            return dict(entry)
+
+    def _tag(self, entry, tags):
+        for tag in tags:
+            for other in self._index.values():
+                if tag in other['tags']:
+                    other['tags'].remove(tag)
+            entry['tags'].append(tag)
+
+    def remove(self, ref):
+        with self._lock:
+            self._load()
+            entry = self._find(ref)
+            del self._index[entry['digest']]
+            self._save()
+            for path in (self.path(entry), self.compressed_path(entry)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def entries(self):
+        """All index entries, the newest first."""
+        with self._lock:
+            self._load()
+            return sorted((dict(e) for e in self._index.values()), key=lambda e: e['added'], reverse=True)
+
+    def find(self, ref):
+        """Return the entry of the image ref names: a tag, a version, a file
+        name or a digest or a prefix of it.  The newest image wins if several
+        have the version or name.
+
+        Raises KeyError if there is none.
+        """
+        with self._lock:
+            self._load()
+            return dict(self._find(ref))
+
+    def _find(self, ref):
+        if ref in self._index:
+            return self._index[ref]
+        newest = sorted(self._index.values(), key=lambda e: e['added'], reverse=True)
+        for matches in (lambda e: ref in e['tags'],
+                        lambda e: e.get('version') == ref,
+                        lambda e: e['name'] == ref,
+                        lambda e: len(ref) >= 6 and e['digest'].startswith(ref)):
+            for entry in newest:
+                if matches(entry):
+                    return entry
+        raise KeyError("No firmware %s in the store" % ref)
+
+    def entry_for_path(self, path):
+        """The entry of an image path in the store, None for other paths."""
+        digest, ext = os.path.splitext(os.path.basename(path))
+        if ext != '.bin' or os.path.abspath(os.path.dirname(path)) != os.path.abspath(self.root):
+            return None
+        with self._lock:
+            self._load()
+            entry = self._index.get(digest)
+            return dict(entry) if entry is not None else None
+
+    def compressed(self, entry):
+        with open(self.compressed_path(entry), 'rb') as f:
+            return f.read()
+
+
+def describe(entry):
+    """One line about an index entry, for lists and choices"""
+    parts = [entry['name']]
+    if entry.get('version'):
+        parts.append(entry['version'])
+    details = [d for d in (entry.get('chip'), entry.get('flash_size'), entry.get('build_time')) if d]
+    if details:
+        parts.append('(%s)' % ', '.join(details))
+    if entry['tags']:
+        parts.append('[%s]' % ', '.join(entry['tags']))
+    parts.append(entry['digest'][:8])
+    return ' '.join(parts)
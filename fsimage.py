@@ -0,0 +1,478 @@
+# coding=utf-8
+
+"""
+Host side FAT filesystem images for MicroPython boards.
+
+Builds the image of the FAT filesystem MicroPython mounts at / from a local
+directory tree, so a board's files can be flashed with esptool in the same
+session as the firmware instead of being copied one by one over the raw
+REPL.  The layout is what the FatFs of MicroPython reads: one FAT, sectors
+as large as the flash sectors of its block device (4096 bytes), one sector
+per cluster and no partition table.  FAT12 or FAT16, whichever the size of
+the filesystem calls for.
+
+Names that do not fit 8.3 get long file name entries.  Only the clusters in
+use are part of the returned image: the rest of the filesystem is free as
+far as the FAT is concerned, whatever the flash there still holds, so it
+does not have to be written.
+
+The other way round, extract_fat_image() writes the files of a filesystem
+read back from a board to a local directory.
+
+Example usage:
+
+    image = build_fat_image('board-files', 0x6a000)
+    with open('fs.img', 'wb') as f:
+        f.write(image)
+
+    extract_fat_image(image, 'backup')
+"""
+
+from __future__ import division
+
+import os
+import struct
+import time
+
+SECTOR_SIZE = 4096  # MicroPython's flash block device
+ROOT_ENTRIES = 512  # fixed size root directory of FAT12/16, as FatFs formats it
+MEDIA = 0xf8
+MAX_FAT12_CLUSTERS = 0xff5  # FatFs picks FAT12 up to this many clusters
+MAX_FAT16_CLUSTERS = 0xfff5
+VOLUME_ID = 0  # fixed, the same files give the same image
+
+ENTRY_SIZE = 32
+ATTR_VOLUME_ID = 0x08
+ATTR_DIRECTORY = 0x10
+ATTR_ARCHIVE = 0x20
+ATTR_LONG_NAME = 0x0f
+NT_LOWER_BASE = 0x08  # short name shown in lower case, when LFN is enabled
+NT_LOWER_EXT = 0x10
+LFN_CHARS = 13  # UTF-16 characters per long name entry
+
+FAT_EPOCH = ((0 << 9) | (1 << 5) | 1, 0)  # date and time of 1980-01-01 00:00
+
+SHORT_NAME_CHARS = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!#$%&'()-@^_`{}~")
+
+
+class FilesystemFullError(ValueError):
+    pass
+
+
+def _fat_datetime(timestamp):
+    if timestamp is None:
+        return FAT_EPOCH
+    t = time.localtime(timestamp)
+    year = min(max(t.tm_year, 1980), 2107)
+    date = ((year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return date, (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+
+
+def _short_name(name):
+    """Return (11 byte short name, NT case flags) for name if it fits 8.3
+    with each part in one case, else None."""
+    if name.startswith('.') or name.count('.') > 1:
+        return None
+    base, _, ext = name.partition('.')
+    if not 1 <= len(base) <= 8 or len(ext) > 3:
+        return None
+    flags = 0
+    for part, lower_flag in ((base, NT_LOWER_BASE), (ext, NT_LOWER_EXT)):
+        if part != part.upper() and part != part.lower():
+            return None  # mixed case needs a long name
+        if part != part.upper():
+            flags |= lower_flag
+        if not set(part.upper()) <= SHORT_NAME_CHARS:
+            return None
+    return (base.upper().ljust(8) + ext.upper().ljust(3)).encode('ascii'), flags
+
+
+def _short_alias(name, taken):
+    """Return a unique BASE~N.EXT short name for a long name."""
+    def clean(part):
+        return ''.join(c if c in SHORT_NAME_CHARS else '_' for c in part.upper().replace(' ', ''))
+    stem, dot, ext = name.lstrip('.').rpartition('.')
+    if not dot:
+        stem, ext = ext, ''
+    stem, ext = clean(stem), clean(ext)[:3]
+    for n in range(1, 1000000):
+        tail = '~%d' % n
+        alias = (stem[:8 - len(tail)] + tail).ljust(8) + ext.ljust(3)
+        alias = alias.encode('ascii')
+        if alias not in taken:
+            return alias
+    raise FilesystemFullError("No short name left for %s" % name)
+
+
+def _names(path):
+    names = []
+    for name in os.listdir(path):
+        if not isinstance(name, type(u'')):
+            name = name.decode('utf-8')
+        names.append(name)
+    return sorted(names)
+
+
+def _lfn_checksum(short_name):
+    total = 0
+    for c in bytearray(short_name):
+        total = (((total & 1) << 7) + (total >> 1) + c) & 0xff
+    return total
+
+
+def _lfn_entry_count(name):
+    return 0 if _short_name(name) else (len(name.encode('utf-16-le')) // 2 + LFN_CHARS - 1) // LFN_CHARS
+
+
+def _entries(name, short, flags, attr, cluster, size, mtime):
+    """Directory entries of one file or directory: its long name entries,
+    if any, then the short entry."""
+    date, clock = _fat_datetime(mtime)
+    if short[0:1] == b'\xe5':
+        short = b'\x05' + short[1:]  # 0xe5 marks deleted entries
+    entry = struct.pack('<11sBBBHHHHHHHI', short, attr, flags, 0, clock, date, date,
+                        cluster >> 16, clock, date, cluster & 0xffff, size)
+    if _short_name(name) is not None:
+        return [entry]
+    chars = name.encode('utf-16-le')
+    count = _lfn_entry_count(name)
+    chars = (chars + b'\x00\x00').ljust(count * LFN_CHARS * 2, b'\xff')[:count * LFN_CHARS * 2]
+    checksum = _lfn_checksum(short)
+    lfn = []
+    for i in range(count):
+        part = chars[i * LFN_CHARS * 2:(i + 1) * LFN_CHARS * 2]
+        order = i + 1 | (0x40 if i == count - 1 else 0)
+        lfn.append(struct.pack('<B10sBBB12sH4s', order, part[0:10], ATTR_LONG_NAME, 0, checksum,
+                               part[10:22], 0, part[22:26]))
+    return lfn[::-1] + [entry]
+
+
+class _FatBuilder(object):
+    def __init__(self, size, sector_size):
+        self.sector_size = sector_size
+        total = size // sector_size
+        self.root_sectors = ROOT_ENTRIES * ENTRY_SIZE // sector_size
+        # the FAT has to cover the clusters left after the FAT itself
+        fat_sectors = 1
+        while True:
+            clusters = total - 1 - self.root_sectors - fat_sectors
+            if clusters == MAX_FAT12_CLUSTERS:
+                total -= 1  # FAT12 to FatFs, FAT16 to some other readers
+                continue
+            self.fat_bits = 12 if clusters < MAX_FAT12_CLUSTERS else 16
+            if clusters > MAX_FAT16_CLUSTERS:
+                raise ValueError("%d bytes is too large for a FAT12/16 filesystem" % size)
+            needed = ((clusters + 2) * self.fat_bits // 8 + sector_size - 1) // sector_size
+            if needed <= fat_sectors:
+                break
+            fat_sectors = needed
+        if clusters < 1:
+            raise ValueError("%d bytes is too small for a FAT filesystem" % size)
+        self.total_sectors = total
+        self.fat_sectors = fat_sectors
+        self.clusters = clusters
+        self.data_start = (1 + fat_sectors + self.root_sectors) * sector_size
+        self.fat = [0] * (clusters + 2)
+        self.fat[0] = 0xf00 | MEDIA if self.fat_bits == 12 else 0xff00 | MEDIA
+        self.fat[1] = (1 << self.fat_bits) - 1
+        self.next_cluster = 2
+        self.image = bytearray(self.data_start)
+
+    def allocate(self, nbytes, what):
+        """Allocate contiguous clusters for nbytes, return the first one (0
+        for nothing to store)."""
+        count = (nbytes + self.sector_size - 1) // self.sector_size
+        if count == 0:
+            return 0
+        first = self.next_cluster
+        if first + count > self.clusters + 2:
+            raise FilesystemFullError("Out of space in the filesystem image at %s" % what)
+        for cluster in range(first, first + count - 1):
+            self.fat[cluster] = cluster + 1
+        self.fat[first + count - 1] = (1 << self.fat_bits) - 1  # end of chain
+        self.next_cluster += count
+        self.image.extend(bytearray(count * self.sector_size))
+        return first
+
+    def store(self, cluster, data):
+        offset = self.data_start + (cluster - 2) * self.sector_size
+        self.image[offset:offset + len(data)] = data
+
+    def add_directory(self, path, cluster, parent_cluster, extra_files=None):
+        """Store the files below path (None for no files) and the name: data
+        of extra_files, and return the entries of the directory (its . and
+        .. too, unless it is the root)."""
+        extra_files = extra_files or {}
+        entries = []
+        if cluster:
+            date, clock = _fat_datetime(os.path.getmtime(path))
+            for name, target in ((b'.', cluster), (b'..', parent_cluster)):
+                entries.append(struct.pack('<11sBBBHHHHHHHI', name.ljust(11), ATTR_DIRECTORY, 0, 0, clock, date,
+                                           date, target >> 16, clock, date, target & 0xffff, 0))
+        names = sorted(set(_names(path) if path is not None else []) | set(extra_files))
+        taken = set(short[0] for short in map(_short_name, names) if short is not None)
+        for name in names:
+            child = os.path.join(path, name) if path is not None else name
+            short = _short_name(name)
+            if short is None:
+                short = _short_alias(name, taken), 0
+                taken.add(short[0])
+            if name in extra_files:
+                # no file time, the same contents give the same image
+                data = extra_files[name]
+                file_cluster = self.allocate(len(data), name)
+                self.store(file_cluster, data)
+                entries += _entries(name, short[0], short[1], ATTR_ARCHIVE, file_cluster, len(data), None)
+            elif os.path.isdir(child):
+                count = 2 + sum(_lfn_entry_count(n) + 1 for n in _names(child))
+                child_cluster = self.allocate(count * ENTRY_SIZE, child)
+                self.store(child_cluster, b''.join(self.add_directory(child, child_cluster, cluster)))
+                entries += _entries(name, short[0], short[1], ATTR_DIRECTORY, child_cluster, 0,
+                                    os.path.getmtime(child))
+            else:
+                with open(child, 'rb') as f:
+                    data = f.read()
+                file_cluster = self.allocate(len(data), child)
+                self.store(file_cluster, data)
+                entries += _entries(name, short[0], short[1], ATTR_ARCHIVE, file_cluster, len(data),
+                                    os.path.getmtime(child))
+        return entries
+
+    def boot_sector(self, label):
+        fs_type = b'FAT12   ' if self.fat_bits == 12 else b'FAT16   '
+        small_total = self.total_sectors if self.total_sectors < 0x10000 else 0
+        sector = struct.pack('<3s8sHBHBHHBHHHIIBBBI11s8s', b'\xeb\xfe\x90', b'MSDOS5.0', self.sector_size, 1, 1, 1,
+                             ROOT_ENTRIES, small_total, MEDIA, self.fat_sectors, 63, 255, 0,
+                             self.total_sectors if small_total == 0 else 0, 0x80, 0, 0x29,
+                             VOLUME_ID, label.encode('ascii').upper().ljust(11)[:11], fs_type)
+        sector = sector.ljust(510, b'\x00') + b'\x55\xaa'
+        return sector.ljust(self.sector_size, b'\x00')
+
+    def fat_table(self):
+        if self.fat_bits == 16:
+            table = struct.pack('<%dH' % len(self.fat), *self.fat)
+        else:
+            table = bytearray()
+            fat = self.fat + [0] * (len(self.fat) % 2)
+            for i in range(0, len(fat), 2):
+                pair = fat[i] | fat[i + 1] << 12
+                table += struct.pack('<I', pair)[:3]
+        return bytes(table).ljust(self.fat_sectors * self.sector_size, b'\x00')
+
+
+def build_fat_image(root, size, sector_size=SECTOR_SIZE, label='NO NAME', extra_files=None):
+    """Return the image of a FAT filesystem of size bytes holding the files
+    and directories below root (None for none), cut after the last cluster
+    in use.  extra_files maps names of files in the root directory to their
+    contents, they replace files of the same name below root.
+
+    Raises FilesystemFullError if they do not fit.
+    """
+    builder = _FatBuilder(size, sector_size)
+    entries = builder.add_directory(root, 0, 0, extra_files)
+    if len(entries) > ROOT_ENTRIES:
+        raise FilesystemFullError("Too many entries in the root directory of the filesystem image")
+    root_start = (1 + builder.fat_sectors) * sector_size
+    builder.image[0:sector_size] = builder.boot_sector(label)
+    builder.image[sector_size:root_start] = builder.fat_table()
+    builder.image[root_start:root_start + len(entries) * ENTRY_SIZE] = b''.join(entries)
+    return bytes(builder.image)
+
+
+def _geometry(image):
+    """Return (sector size, cluster size, root directory offset, root
+    entries, data offset) from the boot sector of image."""
+    sector_size, cluster_sectors, reserved, fats, root_entries, _, _, fat_sectors = \
+        struct.unpack('<HBHBHHBH', image[11:24])
+    root = (reserved + fats * fat_sectors) * sector_size
+    return sector_size, cluster_sectors * sector_size, root, root_entries, root + root_entries * ENTRY_SIZE
+
+
+def data_offset(image):
+    """Return where the first cluster of image starts, everything before is
+    boot sector, FAT and root directory."""
+    return _geometry(image)[4]
+
+
+def _fat_time(date, clock):
+    if date == 0:
+        return None
+    try:
+        return time.mktime(((date >> 9) + 1980, date >> 5 & 0xf, date & 0x1f,
+                            clock >> 11, clock >> 5 & 0x3f, (clock & 0x1f) * 2, 0, 0, -1))
+    except (ValueError, OverflowError):
+        return None
+
+
+def _directory_entries(data):
+    """Yield (name, attr, first cluster, size, mtime) for the entries of a
+    directory, long names joined, deleted entries, volume label and . and ..
+    left out."""
+    long_name = []
+    for offset in range(0, len(data) - ENTRY_SIZE + 1, ENTRY_SIZE):
+        entry = data[offset:offset + ENTRY_SIZE]
+        first = bytearray(entry[0:1])[0]
+        if first == 0:
+            break  # end of the directory
+        if first == 0xe5:
+            long_name = []
+            continue
+        attr = bytearray(entry[11:12])[0]
+        if attr == ATTR_LONG_NAME:
+            part = entry[1:11] + entry[14:26] + entry[28:32]
+            long_name.insert(0, part)
+            continue
+        short = entry[:11]
+        if first == 0x05:
+            short = b'\xe5' + short[1:]
+        if long_name:
+            name = b''.join(long_name).decode('utf-16-le', 'replace').split(u'\x00')[0]
+        else:
+            flags = bytearray(entry[12:13])[0]
+            base, ext = short[:8].decode('latin-1').rstrip(), short[8:].decode('latin-1').rstrip()
+            if flags & NT_LOWER_BASE:
+                base = base.lower()
+            if flags & NT_LOWER_EXT:
+                ext = ext.lower()
+            name = base + (u'.' + ext if ext else u'')
+        long_name = []
+        if attr & ATTR_VOLUME_ID or name in (u'.', u'..'):
+            continue
+        cluster_high, clock, date, cluster_low, size = struct.unpack('<HHHHI', entry[20:32])
+        yield name, attr, cluster_high << 16 | cluster_low, size, _fat_time(date, clock)
+
+
+def locate_file(image, name):
+    """Return (offset, size) of the contents of file name in the root
+    directory of image, which has to be stored in consecutive clusters, as
+    build_fat_image stores all files.  Names are compared ignoring case.
+
+    Raises KeyError if there is no such file.
+    """
+    _, cluster_size, root, root_entries, data = _geometry(image)
+    for found, attr, cluster, size, _ in _directory_entries(image[root:root + root_entries * ENTRY_SIZE]):
+        if not attr & ATTR_DIRECTORY and found.lower() == name.lower():
+            return data + (cluster - 2) * cluster_size, size
+    raise KeyError(name)
+
+
+class _FatReader(object):
+    """Files of a FAT12/16 image made by FatFs, on a board or by
+    build_fat_image.  The image may be cut after its last cluster in use."""
+
+    def __init__(self, image):
+        if len(image) < 512 or image[510:512] != b'\x55\xaa':
+            raise ValueError("Not a FAT filesystem image")
+        self.image = image
+        (self.sector_size, self.cluster_size, self.root, self.root_entries,
+         self.data) = _geometry(image)
+        reserved, = struct.unpack('<H', image[14:16])
+        small_total, = struct.unpack('<H', image[19:21])
+        total = small_total or struct.unpack('<I', image[32:36])[0]
+        if self.sector_size & (self.sector_size - 1) or not self.cluster_size or total * self.sector_size <= self.data:
+            raise ValueError("Not a FAT filesystem image")
+        self.fat = reserved * self.sector_size
+        self.clusters = (total * self.sector_size - self.data) // self.cluster_size
+        self.fat_bits = 12 if self.clusters <= MAX_FAT12_CLUSTERS else 16
+        self.end_of_chain = (1 << self.fat_bits) - 8  # 0xff8 and up
+
+    def next_cluster(self, cluster):
+        if self.fat_bits == 16:
+            return struct.unpack('<H', self.image[self.fat + cluster * 2:self.fat + cluster * 2 + 2])[0]
+        offset = self.fat + cluster * 3 // 2
+        pair, = struct.unpack('<H', self.image[offset:offset + 2])
+        return pair >> 4 if cluster & 1 else pair & 0xfff
+
+    def last_used_cluster(self):
+        last = 1
+        for cluster in range(2, self.clusters + 2):
+            if self.next_cluster(cluster):
+                last = cluster
+        return last
+
+    def chain(self, cluster, size=None):
+        """Return the contents of the clusters chained from cluster, cut to
+        size if given."""
+        parts = []
+        seen = set()
+        while 2 <= cluster < self.clusters + 2 and cluster not in seen:
+            seen.add(cluster)
+            offset = self.data + (cluster - 2) * self.cluster_size
+            parts.append(self.image[offset:offset + self.cluster_size])
+            if size is not None and len(parts) * self.cluster_size >= size:
+                break
+            cluster = self.next_cluster(cluster)
+        data = b''.join(parts)
+        return data if size is None else data[:size]
+
+    def walk(self, data=None, path=u''):
+        """Yield (path, attr, contents, mtime) of the files and directories
+        below the directory with the given entries, the root by default.
+        Paths use '/' and directories come before what they hold."""
+        if data is None:
+            data = self.image[self.root:self.root + self.root_entries * ENTRY_SIZE]
+        for name, attr, cluster, size, mtime in _directory_entries(data):
+            child = path + u'/' + name if path else name
+            if attr & ATTR_DIRECTORY:
+                yield child, attr, None, mtime
+                for item in self.walk(self.chain(cluster), child):
+                    yield item
+            else:
+                yield child, attr, self.chain(cluster, size), mtime
+
+
+def used_size(image):
+    """Return how much of the start of image, a FAT filesystem, holds the
+    boot sector, FAT, root directory and all the clusters in use.  image
+    only needs to hold the boot sector, FAT and root directory.
+
+    Raises ValueError if image is no FAT filesystem.
+    """
+    reader = _FatReader(image)
+    return reader.data + (reader.last_used_cluster() - 1) * reader.cluster_size
+
+
+def extract_fat_image(image, directory):
+    """Write the files and directories of image, a FAT filesystem image such
+    as read back from a board, below directory and return their paths.
+
+    Raises ValueError if image is no FAT filesystem.
+    """
+    written = []
+    for path, attr, contents, mtime in _FatReader(image).walk():
+        target = os.path.join(directory, *path.split(u'/'))
+        if contents is None:
+            if not os.path.isdir(target):
+                os.makedirs(target)
+        else:
+            parent = os.path.dirname(target)
+            if not os.path.isdir(parent):
+                os.makedirs(parent)
+            with open(target, 'wb') as f:
+                f.write(contents)
+            if mtime is not None:
+                os.utime(target, (mtime, mtime))
+        written.append(target)
+    return written
+
+
+def patch_file(image, name, data):
+    """Return the (offset, sector) pairs of image to write so the file name
+    in its root directory holds data instead, only the sectors which change.
+
+    data has to be as long as the file, so neither the directory nor the FAT
+    change.  Raises ValueError if it is not.
+    """
+    sector_size = _geometry(image)[0]
+    offset, size = locate_file(image, name)
+    if len(data) != size:
+        raise ValueError("%s is %d bytes in the filesystem image, not %d" % (name, size, len(data)))
+    sectors = []
+    for start in range(offset - offset % sector_size, offset + size, sector_size):
+        old = bytes(image[start:start + sector_size])
+        sector = bytearray(old)
+        low, high = max(offset, start), min(offset + size, start + sector_size)
+        sector[low - start:high - start] = data[low - offset:high - offset]
+        if bytes(sector) != old:
+            sectors.append((start, bytes(sector)))
+    return sectors
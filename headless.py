@@ -0,0 +1,531 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Headless entry point of the Blocky config tool.
+
+Runs the same flashing and provisioning engine as the GUI without ever
+importing wx, either as one-shot commands or as a long running daemon that
+is controlled through a small JSON HTTP API, served on a local TCP port or
+on a Unix socket.
+
+Example usage:
+
+    BlockyConfigTool.py ports
+    BlockyConfigTool.py flash -p /dev/ttyUSB0 -p /dev/ttyUSB1 firmware.bin
+    BlockyConfigTool.py flash -p /dev/ttyUSB0 build/flasher_args.json
+    BlockyConfigTool.py firmware add build/firmware-combined.bin --tag production
+    BlockyConfigTool.py flash -p /dev/ttyUSB0 -p /dev/ttyUSB1 production
+    BlockyConfigTool.py config -p /dev/ttyUSB0 --wifi-name home --wifi-pass secret --device-key abc
+    BlockyConfigTool.py provision -p /dev/ttyUSB0 --files board/ --wifi-name home --device-key abc
+    BlockyConfigTool.py clone --golden /dev/ttyUSB0 -p /dev/ttyUSB1 -p /dev/ttyUSB2 \
+        --override /dev/ttyUSB1:0x3fc000:keys-1.bin --override /dev/ttyUSB2:0x3fc000:keys-2.bin
+    BlockyConfigTool.py backup -p /dev/ttyUSB0 backup/
+    BlockyConfigTool.py daemon --listen 127.0.0.1:8266 --auto-flash firmware.bin
+    BlockyConfigTool.py daemon --socket /run/blocky.sock
+
+Daemon API:
+
+    GET    /ports       serial ports currently present
+    GET    /firmware    images in the firmware store
+    GET    /jobs        queued and running jobs
+    GET    /jobs/<id>   a single job
+    GET    /jobs/<id>/log  output of a job
+    GET    /history     finished jobs
+    POST   /jobs        {"type": "flash", "port": ..., "firmware": ..., "baud": ..., "mode": ..., "erase": ...,
+                         "files": ...}
+                        {"type": "config", "port": ..., "wifi_name": ..., "wifi_pass": ..., "device_key": ...}
+                        {"type": "provision", "port": ..., "files": ..., "firmware": ..., "wifi_name": ...,
+                         "wifi_pass": ..., "device_key": ...}
+                        {"type": "clone", "port": ..., "image": ..., "baud": ...,
+                         "overrides": {"0x3fc000": "keys.bin", ...}}
+                        {"type": "backup", "port": ..., "directory": ..., "firmware": ..., "baud": ...}
+    DELETE /jobs/<id>   cancel a job
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn, UnixStreamServer
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+
+import console
+import engine
+import firmstore
+import jobs
+import portwatch
+
+FLASH_RETRIES = 2
+SAVE_CONFIG_RETRIES = 1
+PROVISION_RETRIES = 2
+CLONE_RETRIES = 2
+BACKUP_RETRIES = 2
+DEFAULT_LISTEN = '127.0.0.1:8266'
+JOB_HISTORY_FILE = './job-history.json'
+
+
+JOB_LOG_LINES = 200  # output lines the daemon keeps per job
+
+
+def job_output(port):
+    # jobs for several ports share the terminal, prefix their lines with the port
+    return console.LinePrefixer(console.install_router().default, '[%s] ' % port)
+
+
+def flash_job(config, output=None):
+    return jobs.Job("Flash", config.port, lambda job: engine.flash_firmware(config, job),
+                    retries=FLASH_RETRIES, backoff=2.0, output=output or job_output(config.port))
+
+
+def save_config_job(config, output=None):
+    return jobs.Job("Save config", config['port'], lambda job: engine.save_config(config, job),
+                    retries=SAVE_CONFIG_RETRIES, backoff=2.0, output=output or job_output(config['port']))
+
+
+def provision_job(config, image, output=None):
+    return jobs.Job("Provision", config['port'], lambda job: engine.provision_config(config, image, job),
+                    retries=PROVISION_RETRIES, backoff=2.0, output=output or job_output(config['port']))
+
+
+def clone_job(config, output=None):
+    return jobs.Job("Clone", config['port'], lambda job: engine.clone_board(config, job),
+                    retries=CLONE_RETRIES, backoff=2.0, output=output or job_output(config['port']))
+
+
+def backup_job(config, output=None):
+    return jobs.Job("Backup", config['port'], lambda job: engine.backup_files(config, job),
+                    retries=BACKUP_RETRIES, backoff=2.0, output=output or job_output(config['port']))
+
+
+def job_from_request(data, output=None):
+    """Build a Job from a POST /jobs request body."""
+    kind = data.get('type')
+    if not data.get('port'):
+        raise ValueError("'port' is required")
+    if kind == 'flash':
+        config = engine.FlashConfig.from_dict(data)
+        if not config.is_complete():
+            raise ValueError("'firmware' is required")
+        return flash_job(config, output)
+    elif kind in ('config', 'provision'):
+        config = {
+            'port': data['port'],
+            'baud': int(data.get('baud', 115200)),
+            'wifi_name': data.get('wifi_name', ''),
+            'wifi_pass': data.get('wifi_pass', ''),
+            'device_key': data.get('device_key', ''),
+        }
+        if kind == 'provision':
+            config['baud'] = int(data.get('baud', 460800))
+            image = engine.FilesystemImage(data.get('files') or None, *engine.filesystem_layout(data.get('firmware')))
+            return provision_job(config, image, output)
+        return save_config_job(config, output)
+    elif kind == 'clone':
+        if not data.get('image'):
+            raise ValueError("'image' is required")
+        config = {
+            'port': data['port'],
+            'baud': int(data.get('baud', 460800)),
+            'image': data['image'],
+            'overrides': sorted((int(offset, 0), path) for offset, path in data.get('overrides', {}).items()),
+        }
+        return clone_job(config, output)
+    elif kind == 'backup':
+        if not data.get('directory'):
+            raise ValueError("'directory' is required")
+        return backup_job({'port': data['port'], 'baud': int(data.get('baud', 460800)),
+                           'directory': data['directory'], 'firmware': data.get('firmware')}, output)
+    raise ValueError("Unknown job type %r" % kind)
+
+
+# ---------------------------------------------------------------------------
+class Daemon(object):
+    KNOWN_JOBS = 1000  # jobs that can still be looked up by id
+
+    def __init__(self, scheduler, auto_flash=None, connect_ahead=None):
+        self.scheduler = scheduler
+        self.auto_flash = auto_flash
+        self.connect_ahead = connect_ahead  # baud rate to connect to new boards at ahead of their jobs
+        self._jobs = OrderedDict()
+        self._logs = {}
+        self._lock = threading.Lock()
+        self.watcher = portwatch.PortWatcher()
+        self.watcher.add_listener(self._on_port_event)
+        self.preparer = None
+        if auto_flash is not None:
+            # the firmware is ready to send before the first board shows up
+            self.preparer = engine.FirmwarePreparer()
+            self.preparer.select(engine.FlashConfig.from_dict(auto_flash))
+
+    def start(self):
+        self.watcher.start()
+
+    def stop(self):
+        self.watcher.stop()
+        if self.preparer is not None:
+            self.preparer.stop()
+        engine.warm_loaders.release_all()
+        self.scheduler.shutdown(wait=False)
+
+    def job_output(self, port):
+        """Output stream for a new job: kept for GET /jobs/<id>/log and
+        echoed to the terminal.  Returns (stream, log).
+        """
+        log = console.LogBuffer(JOB_LOG_LINES)
+        return console.Tee(log, job_output(port)), log
+
+    def submit(self, job, log=None):
+        with self._lock:
+            self._jobs[job.id] = job
+            self._logs[job.id] = log
+            while len(self._jobs) > self.KNOWN_JOBS:
+                old_id, _ = self._jobs.popitem(last=False)
+                self._logs.pop(old_id, None)
+        return self.scheduler.submit(job)
+
+    def get_job(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_log(self, job_id):
+        with self._lock:
+            return self._logs.get(job_id)
+
+    def _on_port_event(self, event, port):
+        print("Port %s %s" % (port, event))
+        if event == portwatch.PORT_REMOVED:
+            engine.warm_loaders.release(port)
+        elif self.auto_flash is not None:
+            # PORT_ADDED
+            config = engine.FlashConfig.from_dict(dict(self.auto_flash, port=port))
+            output, log = self.job_output(port)
+            self.submit(flash_job(config, output), log)
+        elif self.connect_ahead and not self.scheduler.is_port_busy(port):
+            engine.warm_loaders.warm(port, self.connect_ahead)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return 'unix'
+
+    def _reply(self, code, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _job_id(self, suffix=None):
+        parts = self.path.strip('/').split('/')
+        if suffix is not None:
+            if parts[-1] != suffix:
+                return None
+            parts = parts[:-1]
+        if len(parts) == 2 and parts[0] == 'jobs':
+            try:
+                return int(parts[1])
+            except ValueError:
+                pass
+        return None
+
+    def do_GET(self):
+        daemon = self.server.app
+        if self.path == '/ports':
+            self._reply(200, daemon.watcher.ports())
+        elif self.path == '/firmware':
+            self._reply(200, engine.firmware_store.entries())
+        elif self.path == '/jobs':
+            self._reply(200, [job.to_dict() for job in daemon.scheduler.jobs()])
+        elif self.path == '/history':
+            self._reply(200, list(daemon.scheduler.history))
+        elif self.path.endswith('/log'):
+            log = daemon.get_log(self._job_id('log'))
+            if log is None:
+                self._reply(404, {'error': 'not found'})
+            else:
+                self._reply(200, {'log': log.text()})
+        else:
+            job = daemon.get_job(self._job_id())
+            if job is None:
+                self._reply(404, {'error': 'not found'})
+            else:
+                self._reply(200, job.to_dict())
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            self._reply(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            data = json.loads(self.rfile.read(length).decode('utf-8'))
+            output, log = self.server.app.job_output(data.get('port'))
+            job = job_from_request(data, output)
+        except (ValueError, KeyError, TypeError, AttributeError, IOError, OSError) as e:
+            # IOError/OSError: a files directory or firmware that is not there
+            self._reply(400, {'error': str(e)})
+            return
+        self.server.app.submit(job, log)
+        self._reply(201, job.to_dict())
+
+    def do_DELETE(self):
+        daemon = self.server.app
+        job = daemon.get_job(self._job_id())
+        if job is None:
+            self._reply(404, {'error': 'not found'})
+            return
+        daemon.scheduler.cancel(job)
+        self._reply(200, job.to_dict())
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        UnixStreamServer.server_bind(self)
+        # BaseHTTPRequestHandler expects these from HTTPServer
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+def run_daemon(args):
+    auto_flash = None
+    if args.auto_flash:
+        auto_flash = {'firmware': args.auto_flash, 'baud': args.baud, 'mode': args.mode, 'erase': args.erase,
+                      'files': args.files}
+    scheduler = jobs.JobScheduler(max_workers=args.jobs, history_path=args.history)
+    daemon = Daemon(scheduler, auto_flash, args.baud if args.connect_ahead else None)
+
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+        server = ThreadingUnixHTTPServer(args.socket, RequestHandler)
+        where = args.socket
+    else:
+        host, _, port = args.listen.rpartition(':')
+        server = ThreadingHTTPServer((host, int(port)), RequestHandler)
+        where = args.listen
+    server.app = daemon
+    daemon.start()
+    print("Blocky config daemon listening on %s" % where)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+def run_jobs(args, make_job):
+    """Run one job per --port and wait for all of them."""
+    scheduler = jobs.JobScheduler(max_workers=args.jobs, history_path=args.history)
+    submitted = [scheduler.submit(make_job(port)) for port in args.port]
+    try:
+        for job in submitted:
+            while not job.wait(0.5):
+                pass  # short waits keep Ctrl-C working on Python 2
+    except KeyboardInterrupt:
+        scheduler.cancel_all()
+    scheduler.shutdown()
+    failed = [job for job in submitted if job.state != jobs.DONE]
+    for job in failed:
+        print("%s on %s %s: %s" % (job.name, job.port, job.state, job.error))
+    return 1 if failed else 0
+
+
+def run_firmware(args):
+    store = engine.firmware_store
+    try:
+        if args.action == 'add':
+            entry = store.add(args.image, name=args.name, tags=args.tag)
+            print("Added %s" % firmstore.describe(entry))
+        elif args.action == 'tag':
+            print(firmstore.describe(store.tag(args.ref, *args.tags)))
+        elif args.action == 'remove':
+            store.remove(args.ref)
+        else:
+            for entry in store.entries():
+                print(firmstore.describe(entry))
+    except (KeyError, IOError, OSError) as e:
+        print(e.args[0] if isinstance(e, KeyError) else e)
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Blocky config tool (headless)', prog='BlockyConfigTool')
+    parser.add_argument('--jobs', '-j', help='Maximum number of boards worked on at the same time',
+                        type=int, default=4)
+    parser.add_argument('--history', help='Job history file', default=JOB_HISTORY_FILE)
+    subparsers = parser.add_subparsers(dest='operation')
+
+    def add_flash_args(parent):
+        parent.add_argument('--baud', '-b', help='Baud rate used when flashing', type=int, default=115200)
+        parent.add_argument('--mode', '-fm', help='SPI Flash mode', choices=['qio', 'dio', 'dout'], default='dio')
+        parent.add_argument('--erase', help='Erase the whole flash before flashing', action='store_true')
+        parent.add_argument('--files', metavar='DIR',
+                            help='Also flash the files below DIR as the filesystem of the board')
+
+    subparsers.add_parser('ports', help='List serial ports')
+
+    parser_flash = subparsers.add_parser('flash', help='Flash firmware to one or more boards')
+    parser_flash.add_argument('--port', '-p', help='Serial port, can be repeated', action='append', required=True)
+    parser_flash.add_argument('firmware', help='Firmware image, a flash layout manifest (.json), or the tag, '
+                                               'version or digest of an image in the firmware store')
+    add_flash_args(parser_flash)
+
+    parser_config = subparsers.add_parser('config', help='Upload config.json to one or more boards')
+    parser_config.add_argument('--port', '-p', help='Serial port, can be repeated', action='append', required=True)
+    parser_config.add_argument('--wifi-name', required=True)
+    parser_config.add_argument('--wifi-pass', default='')
+    parser_config.add_argument('--device-key', required=True)
+
+    parser_provision = subparsers.add_parser(
+        'provision', help='Write config.json into the filesystem flashed with --files, only the sectors it changes')
+    parser_provision.add_argument('--port', '-p', help='Serial port, can be repeated', action='append',
+                                  required=True)
+    parser_provision.add_argument('--baud', '-b', help='Baud rate used when flashing', type=int, default=460800)
+    parser_provision.add_argument('--files', metavar='DIR',
+                                  help='Board files the boards were flashed with (default: none)')
+    parser_provision.add_argument('--firmware',
+                                  help='Firmware the boards were flashed with, if its manifest places the '
+                                       'filesystem (default: the ESP8266 layout)')
+    parser_provision.add_argument('--wifi-name', required=True)
+    parser_provision.add_argument('--wifi-pass', default='')
+    parser_provision.add_argument('--device-key', required=True)
+
+    parser_clone = subparsers.add_parser('clone', help='Write the whole flash of a golden board to other boards')
+    golden = parser_clone.add_mutually_exclusive_group(required=True)
+    golden.add_argument('--golden', metavar='PORT', help='Serial port of the golden board to read first')
+    golden.add_argument('--image', help='Flash dump of a golden board read before, a file or in the firmware store')
+    parser_clone.add_argument('--port', '-p', help='Serial port of a board to clone to, can be repeated',
+                              action='append', required=True)
+    parser_clone.add_argument('--baud', '-b', help='Baud rate used when reading and flashing', type=int,
+                              default=460800)
+    parser_clone.add_argument('--override', metavar='PORT:OFFSET:FILE', action='append', default=[],
+                              help='Write FILE at OFFSET of the board on PORT after the golden image, '
+                                   'can be repeated')
+
+    parser_backup = subparsers.add_parser('backup', help='Copy the files of one or more boards to a directory')
+    parser_backup.add_argument('--port', '-p', help='Serial port, can be repeated', action='append', required=True)
+    parser_backup.add_argument('--baud', '-b', help='Baud rate used when reading', type=int, default=460800)
+    parser_backup.add_argument('--firmware',
+                               help='Firmware the boards were flashed with, if its manifest places the '
+                                    'filesystem (default: the ESP8266 layout)')
+    parser_backup.add_argument('directory', help='Where to put the files, in a directory per port for several ports')
+
+    parser_firmware = subparsers.add_parser('firmware', help='Manage the firmware store')
+    firmware_actions = parser_firmware.add_subparsers(dest='action')
+    firmware_actions.add_parser('list', help='List the images in the store')
+    parser_add = firmware_actions.add_parser('add', help='Add an image to the store')
+    parser_add.add_argument('image', help='Firmware image file')
+    parser_add.add_argument('--name', help='Name of the image (default: its file name)')
+    parser_add.add_argument('--tag', '-t', help='Tag the image, can be repeated', action='append', default=[])
+    parser_tag = firmware_actions.add_parser('tag', help='Tag an image, moving the tags off other images')
+    parser_tag.add_argument('ref', help='Tag, version, name or digest of the image')
+    parser_tag.add_argument('tags', nargs='+')
+    parser_remove = firmware_actions.add_parser('remove', help='Remove an image from the store')
+    parser_remove.add_argument('ref', help='Tag, version, name or digest of the image')
+
+    parser_daemon = subparsers.add_parser('daemon', help='Run as a daemon with a local HTTP API')
+    listen = parser_daemon.add_mutually_exclusive_group()
+    listen.add_argument('--listen', help='host:port to serve the API on (default %s)' % DEFAULT_LISTEN,
+                        default=DEFAULT_LISTEN)
+    listen.add_argument('--socket', help='Unix socket to serve the API on')
+    parser_daemon.add_argument('--auto-flash', metavar='FIRMWARE',
+                               help='Flash this firmware to every board that gets plugged in')
+    parser_daemon.add_argument('--connect-ahead', action='store_true',
+                               help='Connect to boards as soon as they are plugged in, so their jobs start flashing '
+                                    'right away')
+    add_flash_args(parser_daemon)
+
+    args = parser.parse_args()
+
+    if args.operation == 'ports':
+        for port in portwatch.list_serial_ports():
+            print(port)
+        return 0
+    elif args.operation == 'flash':
+        def make_job(port):
+            config = engine.FlashConfig.from_dict({'port': port, 'firmware': args.firmware, 'baud': args.baud,
+                                                   'mode': args.mode, 'erase': args.erase, 'files': args.files})
+            return flash_job(config)
+        return run_jobs(args, make_job)
+    elif args.operation == 'config':
+        def make_job(port):
+            return save_config_job({'port': port, 'baud': 115200, 'wifi_name': args.wifi_name,
+                                    'wifi_pass': args.wifi_pass, 'device_key': args.device_key})
+        return run_jobs(args, make_job)
+    elif args.operation == 'provision':
+        # the image is built once, every board only gets its config sectors
+        try:
+            image = engine.FilesystemImage(args.files, *engine.filesystem_layout(args.firmware))
+        except (ValueError, IOError, OSError) as e:
+            print(e)
+            return 1
+
+        def make_job(port):
+            return provision_job({'port': port, 'baud': args.baud, 'wifi_name': args.wifi_name,
+                                  'wifi_pass': args.wifi_pass, 'device_key': args.device_key}, image)
+        return run_jobs(args, make_job)
+    elif args.operation == 'clone':
+        overrides = {}
+        for override in args.override:
+            try:
+                port, offset, path = override.split(':', 2)
+                overrides.setdefault(port, []).append((int(offset, 0), path))
+            except ValueError:
+                print("Bad --override %s, expected PORT:OFFSET:FILE" % override)
+                return 1
+        image = args.image
+        if args.golden:
+            reader = jobs.Job("Read golden board", args.golden,
+                              lambda job: engine.read_golden(args.golden, args.baud, job),
+                              output=job_output(args.golden))
+            read_args = argparse.Namespace(port=[args.golden], jobs=1, history=args.history)
+            if run_jobs(read_args, lambda port: reader):
+                return 1
+            image = reader.result
+
+        def make_job(port):
+            return clone_job({'port': port, 'baud': args.baud, 'image': image,
+                              'overrides': sorted(overrides.get(port, []))})
+        return run_jobs(args, make_job)
+    elif args.operation == 'backup':
+        def make_job(port):
+            directory = args.directory
+            if len(args.port) > 1:
+                directory = os.path.join(directory, os.path.basename(port.rstrip('/\\')))
+            return backup_job({'port': port, 'baud': args.baud, 'directory': directory, 'firmware': args.firmware})
+        return run_jobs(args, make_job)
+    elif args.operation == 'firmware':
+        return run_firmware(args)
+    elif args.operation == 'daemon':
+        run_daemon(args)
+        return 0
+    parser.print_help()
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
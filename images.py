@@ -45,7567 +45,6 @@ Reload = PyEmbeddedImage(
     "MDExLTA4LTIxVDE0OjAxOjU2LTA2OjAwdNJAnQAAACV0RVh0ZGF0ZTptb2RpZnkAMjAxMS0w"
     "OC0yMVQxNDowMTo1Ni0wNjowMAWP+CEAAAAASUVORK5CYII=")
 
-#----------------------------------------------------------------------
-Splash = PyEmbeddedImage(
-    "iVBORw0KGgoAAAANSUhEUgAAAlgAAAGNCAYAAADNfQ/dAAAMF2lDQ1BJQ0MgUHJvZmlsZQAA"
-    "SImVVwdYU8kWnltSCAktEAEpoTdBinSB0KuAdLARkpCEEiEhqNiRRQXXgooFK7oKouhaAFkr"
-    "olhYBHt/WFBZWRcLNlTepICur33v5Js7f86cOfOfk3MnMwCoO7Lz8nJQDQByRQXiuNAAZkpq"
-    "GpPUDahAB37UgS2bI8nzj42NAlCG+7/LuxsAkfVX7WW+/nX8v4omlyfhAIDEQpzBlXByIT4M"
-    "AK7LyRMXAEBoh3qzGQV5MtwPsbYYEgSAiMswX4F1ZThDgcfIbRLiAiFmAUCmstliPgBqMt7M"
-    "Qg4f+lGTcXQUcYUiiDdB7MsRsLkQ34N4TG7udIjVyRBbZ3znh/83nxkjPtls/ghWxCIXcpBQ"
-    "kpfDnvV/puN/S26OdHgNU9ioAnFYnCxmmLea7OmRMkyF+JgoIzoGYi2Izwu5cnsZviOQhiUq"
-    "7fs4kkCYM8AAAAVcdlAkxAYQM6TZif5K7MwWy+dCezRaWBCeoMQZ4ulxSv9ooSgnOkrpZ4mA"
-    "Fz6Mt/AkwfHDNpnCkHCIYaWhh4sECckKnmhroTApGmI1iDsl2fGRyrkPigSB0cM2YmmcjLM5"
-    "xG8zxSFxChtMN1cyHBfmwGHL14K1gLEKBAlhirlYCk+SEjXMgcsLClZwwLg8UaKSGwarKyBO"
-    "Obc0LydWaY9t4eWExinyjB2QFMYPz71SAAtMkQfsURY7Ila51ru8gtgEBTccBVEgEAQBJpDC"
-    "lgGmgywg7Ohr7IPfFCMhgA3EgA94wF6pGZ6RLB8RwWc8KAJ/QsQDkpF5AfJRHiiE+i8jWsXT"
-    "HmTKRwvlM7LBU4hzcX3cF/fGo+CTBZsz7oF7Ds9jqg+vSgwmBhHDiCFEmxEeHMg6BzYxEP4b"
-    "XSTseTA6GRfRcAzf/BGeEroIjwjXCd2E2yAJPJF7UVpNExaLf2DOBBNAN/QWoowuA/rsHbbB"
-    "LSFrVzwA94H8IXecgesDe3wcjMQf94OxuULt9wylI9y+5fLH9WSsv49HqVezVXNVssgY+WUC"
-    "R6x+9BL4XY64sI/80RJbgh3C2rDT2AXsGNYImNhJrAlrx47L8EglPJFXwvBqcXJu2dCPcNjG"
-    "sc6x1/HzD2uzlevL8iUp4M0skL0MgdPzZomFfEEB0x/uxjxmuIjjMIbp7OjkBoBsb1dsHW8Y"
-    "8j0bYVz8pss/BYBnGVTyv+nYZgAcfQoA/d03ndlrWO4rATjeyZGKCxU62XYMCIAC/zG0gR4w"
-    "AmbAGsbjDNyAN2CBYBABYkACSAVTYcYFIBdyngHmgIWgFJSDlWAt2Ai2gh2gBuwDB0EjOAZO"
-    "g3PgEugE18FdWBc94AXoB+/AIIIgJISG0BE9xBixQOwQZ8QD8UWCkSgkDklF0hE+IkKkyBxk"
-    "EVKOVCAbke1ILfIrchQ5jVxAupDbyEOkF3mNfEIxlIpqo4aoJToW9UD90Ug0AZ2C8tF8tAgt"
-    "QZej69FqdC/agJ5GL6HX0W70BTqAAUwVY2AmmD3mgQViMVgalomJsXlYGVaJVWP1WDP8na9i"
-    "3Vgf9hEn4nScidvD2gzDE3EOno/Pw5fhG/EavAFvxa/iD/F+/CuBRjAg2BG8COGEFAKfMINQ"
-    "Sqgk7CIcIZyF700P4R2RSGQQrYju8L1MJWYRZxOXETcT9xNPEbuIj4kDJBJJj2RH8iHFkNik"
-    "AlIpaQNpL+kk6Qqph/SBrEo2JjuTQ8hpZBG5mFxJ3kM+Qb5CfkYeVNFQsVDxUolR4arMUlmh"
-    "slOlWeWySo/KIEWTYkXxoSRQsigLKesp9ZSzlHuUN6qqqqaqnqoTVYWqC1TXqx5QPa/6UPUj"
-    "VYtqSw2kTqZKqcupu6mnqLepb2g0miWNRUujFdCW02ppZ2gPaB/U6GoOauFqXLX5alVqDWpX"
-    "1F6qq6hbqPurT1UvUq9UP6R+Wb1PQ0XDUiNQg60xT6NK46jGTY0BTbqmk2aMZq7mMs09mhc0"
-    "n2uRtCy1grW4WiVaO7TOaD2mY3QzeiCdQ19E30k/S+/RJmpbaYdrZ2mXa+/T7tDu19HSGaeT"
-    "pDNTp0rnuE43A2NYMsIZOYwVjIOMG4xPowxH+Y/ijVo6qn7UlVHvdUfrsnR5umW6+3Wv637S"
-    "Y+oF62XrrdJr1Luvj+vb6k/Un6G/Rf+sft9o7dHeozmjy0YfHH3HADWwNYgzmG2ww6DdYMDQ"
-    "yDDUMM9wg+EZwz4jhhHLKMtojdEJo15jurGvsdB4jfFJ4z+YOkx/Zg5zPbOV2W9iYBJmIjXZ"
-    "btJhMmhqZZpoWmy63/S+GcXMwyzTbI1Zi1m/ubH5BPM55nXmdyxULDwsBBbrLNos3ltaWSZb"
-    "LrZstHxupWsVblVkVWd1z5pm7Wedb11tfc2GaONhk22z2abTFrV1tRXYVtletkPt3OyEdpvt"
-    "usYQxniOEY2pHnPTnmrvb19oX2f/0IHhEOVQ7NDo8HKs+di0savGto396ujqmOO40/Guk5ZT"
-    "hFOxU7PTa2dbZ45zlfM1F5pLiMt8lyaXV+PsxvHGbRl3y5XuOsF1sWuL6xc3dzexW71br7u5"
-    "e7r7JvebHtoesR7LPM57EjwDPOd7HvP86OXmVeB10Osvb3vvbO893s/HW43njd85/rGPqQ/b"
-    "Z7tPty/TN913m2+3n4kf26/a7xHLjMVl7WI987fxz/Lf6/8ywDFAHHAk4H2gV+DcwFNBWFBo"
-    "UFlQR7BWcGLwxuAHIaYh/JC6kP5Q19DZoafCCGGRYavCboYbhnPCa8P7I9wj5ka0RlIj4yM3"
-    "Rj6Kso0SRzVPQCdETFg94V60RbQoujEGxITHrI65H2sVmx/720TixNiJVROfxjnFzYlri6fH"
-    "T4vfE/8uISBhRcLdROtEaWJLknrS5KTapPfJQckVyd0pY1PmplxK1U8VpjalkdKS0nalDUwK"
-    "nrR2Us9k18mlk29MsZoyc8qFqfpTc6Yen6Y+jT3tUDohPTl9T/pndgy7mj2QEZ6xKaOfE8hZ"
-    "x3nBZXHXcHt5PrwK3rNMn8yKzOd8H/5qfq/AT1Ap6BMGCjcKX2WFZW3Nep8dk707eygnOWd/"
-    "Ljk3PfeoSEuULWqdbjR95vSuPLu80rzufK/8tfn94kjxLgkimSJpKtCGx5x2qbX0J+nDQt/C"
-    "qsIPM5JmHJqpOVM0s32W7ayls54VhRT9MhufzZndMsdkzsI5D+f6z90+D5mXMa9lvtn8kvk9"
-    "C0IX1CykLMxe+HuxY3FF8dtFyYuaSwxLFpQ8/in0p7pStVJx6c3F3ou3LsGXCJd0LHVZumHp"
-    "1zJu2cVyx/LK8s/LOMsu/uz08/qfh5ZnLu9Y4bZiy0riStHKG6v8VtVUaFYUVTxePWF1wxrm"
-    "mrI1b9dOW3uhclzl1nWUddJ13euj1jdtMN+wcsPnjYKN16sCqvZvMti0dNP7zdzNV7awttRv"
-    "NdxavvXTNuG2W9tDtzdUW1ZX7iDuKNzxdGfSzrZfPH6p3aW/q3zXl92i3d01cTWtte61tXsM"
-    "9qyoQ+ukdb17J+/t3Be0r6nevn77fsb+8gPggPTAH7+m/3rjYOTBlkMeh+oPWxzedIR+pKwB"
-    "aZjV0N8oaOxuSm3qOhpxtKXZu/nIbw6/7T5mcqzquM7xFScoJ0pODJ0sOjlwKu9U32n+6cct"
-    "01runkk5c611YmvH2ciz58+FnDvT5t928rzP+WMXvC4cvehxsfGS26WGdtf2I7+7/n6kw62j"
-    "4bL75aZOz87mrvFdJ674XTl9NejquWvh1y5dj77edSPxxq2bk2923+Leen475/arO4V3Bu8u"
-    "uEe4V3Zf437lA4MH1f+w+cf+brfu4w+DHrY/in909zHn8Ysnkiefe0qe0p5WPjN+Vvvc+fmx"
-    "3pDezj8m/dHzIu/FYF/pn5p/bnpp/fLwX6y/2vtT+nteiV8NvV72Ru/N7rfj3rYMxA48eJf7"
-    "bvB92Qe9DzUfPT62fUr+9GxwxmfS5/VfbL40f438em8od2gojy1my48CGGxoZiYAr3cDQEuF"
-    "Z4dOAChqiruXXBDFfVGOwH/CivuZXODJZTcLgMQFAETBM8oW2CwgpsJedvROYAHUxWWkKUWS"
-    "6eKs8EWFNxjCh6GhN4YAkJoB+CIeGhrcPDT0ZSckexuAU/mKO59MiPB8v012nwTtNzXAj/JP"
-    "mbtsFbT/gFkAAAAJcEhZcwAACxMAAAsTAQCanBgAAAHVaVRYdFhNTDpjb20uYWRvYmUueG1w"
-    "AAAAAAA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAg"
-    "Q29yZSA1LjQuMCI+CiAgIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcv"
-    "MTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgICAgIDxyZGY6RGVzY3JpcHRpb24gcmRm"
-    "OmFib3V0PSIiCiAgICAgICAgICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20v"
-    "dGlmZi8xLjAvIj4KICAgICAgICAgPHRpZmY6Q29tcHJlc3Npb24+MTwvdGlmZjpDb21wcmVz"
-    "c2lvbj4KICAgICAgICAgPHRpZmY6T3JpZW50YXRpb24+MTwvdGlmZjpPcmllbnRhdGlvbj4K"
-    "ICAgICAgICAgPHRpZmY6UGhvdG9tZXRyaWNJbnRlcnByZXRhdGlvbj4yPC90aWZmOlBob3Rv"
-    "bWV0cmljSW50ZXJwcmV0YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3Jk"
-    "ZjpSREY+CjwveDp4bXBtZXRhPgoC2IAFAABAAElEQVR4Aey9eaxty3bWN3d/+uZ2r/Hzs587"
-    "jIMRxhATAsKKLAy2FLCdCBBCFooUWSE9IUJBIgrJHwmNLCXCkSwUgSKiIEwiQhzHkEBshcQ2"
-    "bjB2bGMb7PcMr7/NaffZfb7fN8aoWXOuufbe595z7z336dbea1bVqNHVqGaOVbNmrY0f/Bvf"
-    "czYMZ8OG/oYNfZxSTumzMxUpbG5uChxpA+oi0OmpLsLdTHxooJ2HgJ2JZ5QYbxOp4M55z+mR"
-    "MecoKsn2n5jC7+z0NGSXfLOFFimqA5KsQMjb3NxaZRocDbfIqtep2EjfzY3g0wiFVDDzXrJT"
-    "Q36TCakbdh7pbTnXk7oH3DalroaPuLYR7UTdFIUNMIsyiVt1xU7VVip02pRnsq0bgRzY0I4y"
-    "1qeEdwbiAvKCrcb2KXzkSacl+llTWIcyRq9Q2aMrQ07ZoeiQtBIE3FS7l52q3NoV3wIqnvDs"
-    "4LYpArJa6/CAg9vaEJ0X5HSsL0h2Qi/AXFe8pGuoVG20jnIKX+JDhwSOlk53JHA3XHGzR6b7"
-    "fEcySRbOotwJ5vmZ4tNjXcSzL1+i73mNaWqsD22eATundQrk+M3xH1m8VfoY0yM/UsWT+pKu"
-    "T2FVeeQ1oSr0tvF87I411j9wL3fFetjP9hKLJbtdjlOH1fGBP5pZTgyADpHCUSJ1NX7a4VT3"
-    "pjPNoQ6CnZJ2GTYQlIvyxM0myoJX8ho/oXPP2dB9mXszZFw2t7YMMx6Cih/pC4JZ5P2zbz/I"
-    "mj5reEzbdYpUtOfhFEXYJ7Tn3h51Hyf54sF9/kQfVVB2YH4OW9iGxcxxs4RzRR+ZCeIkU/0H"
-    "YNBgnWwXsxzbeUY4yZLZ5sblBqJhcULEwA0u5eHlTHcjBuQgmTgcWyIphUynmynxRjoipaDl"
-    "iGPwVrmFipMBIzy5z6IYsEVbhiq5znf8bAM4VMIdDWx3o6ivc9y4IzRe4CQvm7WEgq+6naos"
-    "HE5RBrtBQ8dMLC6Sja+VWHAkQioUphLvJIyClatlzqAeCKIvFW1TMh2v4huDBgajHOqDdDMQ"
-    "nbUxIGBZGnCcbIeG0IuZlEAQKiBLGZOMcoMPYt15sKwJjM3E4ToEqXHFbIXabM042JlYbDqQ"
-    "icirjLqYx5yX8rTpiGus4JnX07PsJxSlXDQq206QQckGiX4JaybTEQs4OEyQo9zgbSyrEwRW"
-    "3/iUVOWsxISn6XohATBOWa/0qiIpkTwky+mxTpabEivtRs26jbo0busTSRP9aTSE7VP8aAOl"
-    "sXTpG9XJeSi580XOuqJb0a6X7JLL4l3AZlJ8Ec/ob6oT9VLo8blBVB0mTF1h7DBCg3rMV6rn"
-    "V7DLxO57QlxLPxlAIK7RYB3cSkQd3FTih0z+3LJmt8zTOBR19Te7S16Cq67+j9wlSQMt22od"
-    "zYTjBbg9jxjvgpRtZRiPqXS44Bu3WM0HfZ8W0uaGFgF6WSqPmTiM5CJdSrd53+pNaTmo0fPr"
-    "FHWfKPmpo20pwgCXlJ5rx6BLLslYgsE31GnaOR855GTdqGPqHRBhKG83C8dQ2bgvo0QwjdJu"
-    "1oGpgulFG3USLmKAJ39LNXvhyMcJDkGHnGQTRHVN/MpWvF3c4R0Cq0gxslM4UAuu4iqzhVJp"
-    "VAFeyNBkOVqNVRUGrqdVNXZxTeKYVPuKBM/ElbJljCIEtyaNRgdeIpydnkTKFUqoOviZ8o1X"
-    "x9cwidN3BBjHxxzgGfqlsqpG8hNeNYZRK+/JqDRJhYhywBU5ykYnp6zDgw86TGDglB7goiw4"
-    "0s64iSxQ0cEjdO+A0VpNbzhSWnWDC3SwLD4goDPcpiGRXEZJTAXR0aeYwX+UZDlCwemyrB69"
-    "9ZUeKNyyn8HigNx+QMjuTW3jUnsFC6OeqRk2K7h5zS5epTVRFFQ1MUIfBLeNOzjfypJ7YCLL"
-    "5ZIeX8JEpKJk75Vg+Dg/WhiSZhfK4eZLsI2r8DvZhtF2E5R5nsLEaAKCoKcjXbV1XwyUp7uK"
-    "SVi9558V7zi1SawXqnLrkzq+aR06Oc88WfZzY03rSru0vlF4z1yBCxhm31i1eNKVA9CzAebO"
-    "2APXpaOHVD8xlhstWCyUNkbWSfpZXPXHVnq5xErfvxzZBGui+6RkzKzDyaqOiJmKdldGCKFj"
-    "zrLZD2J+wM4dhxTifq45jRWwmiPAA95GstMhzPidXJK2bcIcISf7Qg8u+a1+wrO+AjSYUzOO"
-    "qN0QmN/gWjHV6uYl2thCazxUGflSK5k5X9jQKc2/BYx5s2OZI/uv1UGOPpYdCCvX4lz3ESuG"
-    "TGFalq7lzjbZVRbEHU/kddlMysEKdm791fIJZE4fDKfQaHgeaXH3CONy0yyjBEPR6J+bIbE5"
-    "YBAKMYrgTgdyXLE+oQoyjg4QGV9TrtNZY3DC2OgTN31YlY5mm7gI6JLD6UY8dqxOUnzJ+9sF"
-    "xFItOrtKBXc69UVrmon/lWBmgkJDGpxGX4VJ1ZSqfMYtEn6SWCbyRRO6jHUiH5ZOhRQZJ/kk"
-    "tHFt+ZH9OfPtTOdUCFtRr0mAH21FffNT5fOqtooVQsZIm3E1r0Jr9bJaM92QD2KLsxxdikGL"
-    "y36JLJygTZrCo7jRh51Z6vaj2MQpiui3MUbSTKGLV7WEhaNJgfgtB8EXimzrGYFlCbZUNkNd"
-    "j0OjpC7mo7zbaUGHOc8+X/WHLL4IUI3krYi+WTg9HWngTyluzuLtzXc2QlBvd9LMN9XXq+zt"
-    "Vej55z5t07fWuu5T72KV5/3WdWPM8FHbu80ZN/rzLOPxpCci/hI/U7xMkXHgBw5pfxElm2OS"
-    "0VF9q3GiTPJmrCLf6ALbulu32RgrmBA8MvlWKNqYS7LGlGXSWF0a7pSN/V1cWrlLjQCof0Qo"
-    "YaGIaYOHsdEnP+TBs14kBcc2Z9xMVWnqPcoFOYKrrkvUhy/ZCAt8e/hkLKPoo9xXXdqjXvAy"
-    "CF0h8ApGLAeLUE0QuctfkRbYYfCek6t3eVYXYGI4hFUVSIXxEhY1NCxu3BgCkrE8vh0JSAcx"
-    "t6Z+wyu4ibMjVcetxnJdaSAcRHEyN5JrQ+k6RQgt0mbih17oHusqxTD05Zl71Z0Sp7POE67w"
-    "UajHhYEHa3SggP/oXIlJYcJNuvYS+FFM2jfIDtuwhbxV6okLp4M5CeJSnVC61R7iICx7FLun"
-    "jt03xKWTGfZf4JQq0PZh02zTUGWiXo0FgOydc/2TpfsQ8tYaRYgq22Tx207Wgi4GoUUK75Lr"
-    "sOck6/Cyms3iIUF1dkFM1u4/LrAl1rG6AF6ShFbJitdQWuSasucRfEF1nkeV33Gdqk0rfscV"
-    "eIYCF9tbY7nmYoa8v4DlePXKiWDz+0uvUt0j7DRUQRmr4oTX/akmnNqG0+BFrzjuijBIp4RZ"
-    "jfmw5pKMa2qMxSEBU+Yqz5wPoTNXJZKHv5Fn1jJUHpIr7mmTQSIgv99rHQoGTunQbORHAjwB"
-    "SSVTk6a081QzZVhPLskPrXK1tiC909eRFUlyJIo6NF0EQYt0sEB4+mBF6UBJSkpiXAGvTlEi"
-    "raab1brK+dFLUjc+5EecplUzmvhDlyiutC5kTYk8r4wguuPjZOgnBi4bnRYV+r/vbMHQOJ1s"
-    "pHjTs26B1iPVp1PbEsmHejtAy3/jEeCSR6FZQA9OrWA0tCzP/GUi+MXqQNwQ0Q1tLKerZ/EC"
-    "bikmBNqwC8Vx1shp81KqkSTmYr5skTgV8czcPFVecZUV/6bJ3H4gdgoV3qTNi5njuWYpM3GK"
-    "LlY1O8Yqd7vk8rPRsz7mkItQySaLR3o/IlR/7SDue2HvcTW1py+71MTcl5FuNaGfk2uASIJj"
-    "eU1oJEKL8/tTkUxi8bd9qp3s/InPUpsgfBbKtj24vgVWWfAXBnVZE9DpnOI1VO8euNkw+4vb"
-    "FRtm/p3WrPR5p+XO5ZUeXbelg6k/PR8tXH2s9Cz918GrnLjqVLjUq/gwXmJ613zslSDwwyGg"
-    "zDD6RhFD6C/xso3mHzjFXIS5dA8TzTgEQea+No5LT1nIh+dEM2ACzULxijIpYdoeCaIFwkQJ"
-    "OpX7P+IQm7yKNotAVNIBHWtcUMdyPg0HD+bgdPiRGWHJyfJtJyoEAZ+yKVnz4d4oIP/CM3sh"
-    "llzLAmjCYOIsOOjX8RNS4kWqz6WDlQ0312TED2W6PEnEcgk1VNGqkMClfOBghPmdCA0hNkYq"
-    "HVoHBOYRzEt4/rOXCga0lM+xM6/IEqpYmejAIw38QIrGAw63JIxslGWJa2UVMXB2eMoweOph"
-    "cbAAL3Eo8t4aQAh0mTLeFhZ5QATHEJtB5gW3jsa4+GId5mgCum5zeAm2/pWxlsaEl2uKPh3j"
-    "SlYMcp9eyWc7A3co25ApsR0DJ4F3MNPVJeE1iaS5hL9EEG3VlxmLPpUf2PbpElPwxl+AGJBw"
-    "qHFTYgUDnPUxP69IgqoCM5FMfwFgYk18EQWZ9BQeTt6W3ggqepz8oKUNwNUfsfYVQgesBcmw"
-    "eF2ir4lnfpHxJlDTg63STk8y/MF7JcC/A5Nc5/yt0J4DoA4E10Vp61v4KS9VNHRaLoSqQNG8"
-    "67G0td6hNepFFbOf2MZR37WqZr2DkRgEq7XorQC6c3BddJG93B9nTPIbfZNziURxcFWyPq1a"
-    "2CDbvVgZH8+j9LugLkXnuBPSZEwQLp8pVm0MNH1CoZhrxK8qOGMd9ElNHaFXPPZzCFR/2dT7"
-    "hYyTTExMccfcSXBNBmUi0ztqvCShIqOZdxIQId9UcQ0sAJXPpFUN/nHNcjIdKpQhKIGKWrEV"
-    "JZ8Q86TGQBIxmJtNu0Cn/1Y/Z3Xp6htqpDLgyk5l15FPR9LqnaXmCV2fH4GGI5KQ/COTAEXg"
-    "RBWLyYixLrU91sFcbQwqRgVaMGfLLQkux/sOw+E5C1uNC2o5HyhKCGOEg9X4lrKhcRoLYg00"
-    "9+Sg5RpsdDPBaPmx3tBKoDUtOPLS61eq6QvPoJUe0FjRkAEHL8HCTrTmaKZR7u4h/lU3oPAi"
-    "H7yI82OdlNaEUXUFd37MgjBcTt0gdSw86wjMfEKJxlrwi4L1miHBO/gqRaZCTp5uQ7TAeeWN"
-    "OeznygkRPRwUhzqZf9poldgrmymn2gM9JwG1AMzAximWFU+AzsTFPNFfH6WLn2V18tAh2qwX"
-    "hgLk+SAoyiKldIGVaCuagJEjRyneUBQA3vxZxjhuQkE4J0e6J0MgZcLzzA6W2gXpgp/iWNlx"
-    "E/+TcVygTOzzQZx2dshJY7X17HRz2NreltOm71Ni4v0b2fYWhhKMObcFFVoICLcGUWYs67iA"
-    "exmQ7bEekVYKkTFura7s4oBtL6Bfz/mCktncY+yy1UWk2MOGsebCxqZpVmjTXvSBaN8FhkXa"
-    "2XoBK0CtqSrRiFdICmOlYA64ZF3nZM67flVhSbRQ2jHqW3WOMZbFENKW+gS+InTQf8FMt6Zq"
-    "xdNsbGxrMl7oK2Pu/BS4xg+dQUZs0IdOhq1haFrbAIQ2os0z6hxwUPgYQ7HnCEnBx+wlknb9"
-    "ApnCCJiYv2YTpX3PK4SKEWIpBYhY/FSikLUzIyABjasRLEe3+dADjBwf5mo+ia2otUXTCx4l"
-    "S8kU55gigukUW89uXAD3F0OKBDdyvC0YKohZ9pMsdL8p0ZiMBRXvuc55o8rQnXIuwdfMrYMB"
-    "RhQWctGhFBY8jqOCVpk2VpQ2QxMms4hWHhF27CaI1fF6jdwuDWuVeStaSkhQdDp0i2pGZ5JR"
-    "aNGJIBgEf191qfrgiHjlrGFAizNX+iRv8XMnlANBwMg2fmSUEx/xAq4C49SFHLq6jGuWG2Z4"
-    "YFY9iq5i02Ujo7h1d2FwJIkM2z75WetELLhJEq/S83iq+VJp2KMvGWnGVF/+dqXLjubvSr5d"
-    "ksSXNsuqU0sm8ZJvcGsU5XpdBI/Jq7eNOaTaQsYvFV48Cg88BmZzrsB0echkJcl9HJm0d35A"
-    "C+eHVPCE78nJUfDHYTs5Vl6xnCycKxwqPmPfQ3n4SILOecPB2pRjtb29o8+206yO8S0aWThe"
-    "wtYnHi84CYPnLfTmf0eVDHte1hzRDlOa6mfBg7JJZRprQ+mnszC27bQAvzv6dNBMpY64S/RT"
-    "nUbcy6aWeELb37LGNJqN2s1pnQ/vgk4v61Afz8iwNM92LzNEF+zE+KmgdN3zCgoXeJMPCxXy"
-    "cjzSJbZ5zuTAc5m8g3bShByqlhZB3WGMuhklyoNZpnvkTso0qXp26GZlhLH+E87KYOEIFU85"
-    "kitn12mjcQmbBOdqBsEvo2ePIxLzAIbyfd/v8RB+QYDPeDdN5J4foFSd2CJ1IV4UBa5CbAdC"
-    "PUkQDDll50hAjc/CPG6SyWXFwVrACQW4KSAkEYKZMpY2o2oahCx0nQ8qVOUG4HrM8CmbBLII"
-    "LDHKj5VJHarMhNxAQiZgjGIjJJHF6eIbXZIbC77Q+0JCwbJV95QfhhSC8sACHvFqHYMF/KAL"
-    "PRKGEr2cBMPXQpEbKV+hr5AYlX3Pxr1NbJus8zOvEDbNPkZ7IcsTttPZDIljp3s2m4fTk+3X"
-    "twtNCJ2cGEo3TqONmsMDrsq38kBb4NGMwjeqLkpEP6LWOEO6a7K/Qg7USTpRx8fHdqhOFB8d"
-    "HcnBUpnSwFnJ4tC9+KYlDtYFtjhY6rd8lMa52t5JR2snnC2crt3hSuKAG/qHJtH1Sb+ZAKdn"
-    "3Zyjdm9GozdLc/mauE2x90SUelv2vRG8xjJTwoa+Sh/ti4HnnAq3Z+U+2rhFovBm4OWs9Z/Z"
-    "wZWdojdd5vVVfi5vkhdr31ugg6/p4Za1gH4qyiWGGTfsYB4dXk/Tp6sm87jmiNLNdkvZqUnj"
-    "7jlEWgTfuLmXjKIv5FARGySkJQoj47mQWfHF2dImMEscuT4dmVWbLvH3niTTJ29FngnTeI0L"
-    "xU+jv/BNa7aXJU6hE0VHoWF32kJz6BJq0ZlEF8tG75iPrc/IzjzoAw0NjStTvCZxTxwFKw7W"
-    "OitBGnusVAEUIj9hTi4ETOGB5EMVjSGcQJOyKNxhe3CJbw9rMkSUqBgQY4AewCxz3pcQ0W6U"
-    "EPKJm5nl6qbkelAXyCUz+MGzC8EuAMGi6RcOWvDsKFaT1BNo6ucmWxBG8aTu6GZuvRIGGG6e"
-    "kT3naq7nlK8pyrquKX02YKlGDVud30aZbaDQztJ+uuqZ1ZG9a6GxryC0DnP9gNcygsooPj4+"
-    "ipUlrTK5jwq2uYcTI944T5auKyzNNvqfcg6sULE6dSxH6ujwQM4UTtWhnSlgdrZwsPQ5ZgUr"
-    "07Yh4yZVxSlEHkvaW1tyqOxc4WBtD7t7e+lw7Zjfzs7usLO7O2xtaMeA6KgHHwLsltIunF16"
-    "XIrm+Rn6m89mHd88g7ePMjZqz/iXAWfgedbNN6tbGxszZOBmy6UM3dH2Ijtw4xL9paOtkuJV"
-    "+YqZS3um00xgUQGFGlsa2COW+NaXAOMkLmnPAcI0tuGhcVOlwwXfgQFU/LN8ol7hLcSFN49B"
-    "DXtTMt5Ym5wZr652ofuEHuSa24RpYSGx5M7YZbbVerl4LTTssba4Kzhffoeo5KSOEGJziapN"
-    "92BXH627FbBzg/iYbxcvjpsVJr3mlVbsyTSQC8qYqH7V2GBah37ObRQoVcURK98WlAThzhGi"
-    "itEYO9XpkZz0FmF2TgPM0GyqvMBhRIxbBhYz/ubB7FbB/qYdNzmEiApletkGBWE8auk597iB"
-    "g2w3kiuVN82ZRmBalEXqBqdvlxWYBJwvPcwHAihWQ08bpVH70GYVPwQH3ByTr6kky/pbrynt"
-    "2FkFNx7xVK3QcFnPKTdyPV6fXsU0pCqUcWXXYD9TMO0ZVn2mbBsz6mILZJtPHKeyU9dHinC0"
-    "QXCgjfwzFXJG/IhOzhSrTawqHRw8URyOD+1GfcDZ1qpR7YNqcktAxuwZwIE6kSMFn8PDJ3a0"
-    "Dg8PvXJlB4sVLFat5MgdHx/m48J4TAibWtJGhr8AyLHb2tqVQyX5ejS4Iz1293b1uTLsyqk6"
-    "Pjp2GsuYZnscI/Dre0yfpmwe+vI+Pce7ML9ELJgndogpHxvlQnaXRrDcUfjTivHcuGb+mOuw"
-    "2AdEG/tx5tir+ZonXJIqtzegenSVMZ/Og1+0ADhWN1DmeaAeL1Fc16VxWqT1vdb5skcVmgEZ"
-    "7iXFbRZn207qOENpZTMmvicIt9cPMZfpLkUbLOOeEmLnHJZ1x0zTEBUsfpRZb4GfnOwOn310"
-    "e/j049vDP3/wwvDDn/yK4XMP7wpjhcmU5fu5p7bAjSsPht/+wV8evuz2Z4cPXHvDn+vbT5KP"
-    "eko1XHVcSqoZWv8CLwoqnkxEwovWTrYZbfuxhemgZjOJIo7nJ8vHVLogXJzpIHwTAbzl5fB0"
-    "dADkQD7T4ZxBrCiDWTVlBVxSSN/GwSPAbgx6nCedalBZB9FT0YIZFyLBgGM0xHkzsPTqHSTK"
-    "6i0tI0EsGLJxvKBTZN6RBkZphNYgrKQhk4/DiFN2Agw+Cx2GgQw+KwXeQGfC8ZKNbJaJCr7r"
-    "A5YEVp1HPUby0CU6TfCgrfhjjw0MzSwIjKBk1h0g9Y5G4HGWMuTBW52jDVbJJNQNHokO6DvB"
-    "6DILZVW3DivUsWI9FPVGe1cJKzorYYbX+nwiTvZY8bhtxiDMRn/TipAe97HC5HYQ7rFWl3B2"
-    "DuUQHTzZH45wkHJVCf3AZwWKVaOd3T05NREDd5uqb1ofCTk8OPCHlatDfQ6eiKf4HskJwvGy"
-    "Q2XHSmk5XbWiFZs5Q2luC25Cy45HhFLCzl08JsS52huuXD0c9uRk7aG/VskYxdRpc/tYzuCu"
-    "xwv1hht9p0LZfKmdCueycfGqGDu0G7+YNGfD7Sdl9AiW8Ql+/w36svJ6vMvq777gS0+9Ji28"
-    "c3r7hGhR/lPQw6yGZsXBcz4mxFSgwik6GXGiz0WZnt646hy9WcwN/WdwcKuu9KcIzKeiNwAg"
-    "1PFxX6B9BSm6qfbBQYWZGKMRf7UdVrFHunkqTOMaZVGfThDy04ZVF1aLCwYWKNZJCeTvH+0O"
-    "P/O5Lx5+9NNfNvzCGx8c7u/f4BuRGS74wIa/f3nrFnh4cHP4O7/2dcPwa2qPk7Ph6t7j4Svk"
-    "bP3WV35l+E2v/Opw58rjbKzpl8uLJY/9gvb13EXfzX5B6TYdAAAIBLp2ddTo5tlJKEtCuovL"
-    "6EBJaXp3OrPRpTiSHxWp0jHu8aAqqSMGqelNMWhKT8oR7UCMuMw7mXoHwsK1K7d0EbmOhhfj"
-    "VbpefpWWjSpPbBsVG3gy4DSims6dvkFXyJHri3uZfTowESZsnLRkgWzjIQy5QmGvAsHpjMm7"
-    "H3R4AmTLoTMY07Akn+1+E/nit2QTOC2wnArInB85pM49AvJ72/RlkzS0XRtPyuaZVuexIOop"
-    "W1A1ynGOz3hMdzw82X88PHn8SPG+HaxjVrK8CR2nXg6WV4327AztXcUxEw8cni3sAp9YjYLX"
-    "40cPzedIzpMdLJw2nC45W+FMhTOEQ3eqVbLjo1OvbGlka6KWvqqnfBQFHDu+ROAQysmSDtts"
-    "dGfv1Q60rJIdD4e7B8ORnCzSOPun0nv36lVXnBUvfytIA9NzWv8wxlu7YNOakNwvZRfDrH2k"
-    "5xLoL1bH7akMgFlY6mvRfjPE5zK7UKFnoSe27vg4vdDPO5SWNO6MnsKeX+VplggtUYApAYhG"
-    "TjwiGrZCJy/abpVftXOV9OTF5s3Hl+DWoTAvjHUvqYFA2b2D68P/+Ymv0U3+q4d7+7c0joTP"
-    "OEX5he+DxeH9+BlZQHbWdJ1hY9g/vD787Ksf82f3l/aH3/HBXxq++Ut+WitbrxfSU8dubRrW"
-    "CfpDjDnvwSKT8JWBg6RA1rdbdYrq0PQSp7ueFYPBBDMFwUQCn+IAve8GM1yyPd5SvkgCL1QI"
-    "x5A64mRQvYKHm1Byi1YxuBWZMPKGecVKNIIn2lh4Tgq5UEykoYg+tQ+NdHw7h7M+HbKdHztI"
-    "gqdgF0dlppI7OheILnAhjMKiJXY7wsd1DRtB17BBQmzZonAVmw/IFQRo7V0wYmhALhrSuvkH"
-    "TzJrAkVZ3xEjNVtDFv1yxD4vtcL6PORZWegeK1t+e897pA6HfTlWD++/MTx6KMfIq00HXt0K"
-    "nDOv8IaDJUfmSI6MVra8+ivb4Ozg/IBbDtXj5BPOlWi8kqVHgUd6VIhTJScs3iKUg3TM6pmc"
-    "M71hGCGMxGNI7HJ8rA9Fqjirv1ubOqZhW48I9Vjw5FArbjuHw5Z0ONJKlvVSo/Elhn5pHfc4"
-    "i4vHisEPGdULsIfbfrHNQpuLrtV3ol241h2HrhN1qZhSr1yhm9JN/kyI8WYwCErvedEzz78F"
-    "WU33qLpUc027GG17WNgk6rdaBqTClCqHWdqycJbj0GpOD27p28fAo816qKyf7Wn1dYGfryRI"
-    "J3qcDyWA8p5D0RFaPuC0MMkYmqwaxtuZqOo0GWuE84Di//rEbxj+2i993cAqiun6e2hj8H7i"
-    "HbWA2qUcroPTq8Pf/We/cfihT/664Vs++tPDt37sJ4Yr2zWnPoVW+Ak1L0ZHF7HmeTpw3EDI"
-    "InnOlE4eMJdnsccEBVUIdaNtiY6ZKbo83JbwOpSWZLVHuHnjL30pHgdvcQuHCDgkfJOHLL7Z"
-    "N4aZSMey+Haj2K+nMsxdqdUBPZHdsUV6adKBcxKRQubXxCsxtcFIC+6IV/C+7j1/p83el2ar"
-    "sA+2SBsi0ToE8xIRrcOj2HGZNCwZaiw+zlxRAOb8F9dMM6nko88lkgYbyRIUgGyehva0CdeX"
-    "Ord2tpqLbFbsiwqbuqgOrDKxksSjvIODfTlWD7Tq9GjY1+oVb/fhEB3JeWEFC3vx6JFH0Vvb"
-    "WoVi7xSrTlo9woHiUeGWVongiYN1dHTQeB0eHHrlyqtWKj+Rg+VVKxw0tWM4Wez5wlHXY/Xs"
-    "nqh6eji2MxWkPqIYTjeFf7pleewV29rV53jXThX2wbE6Tv2oy9Xja96bhUO2weNMmDEedAUf"
-    "WQ4tUYDLx9W/gmmyE++SEa0U4ym+cySFcJbCMlSYS/hltCVGzwDmOiSfsN1yn+vx0HNah8pV"
-    "DMMuPa/XPN8MO+VrDpeqvzCTZyfVtap8H4/iO2hLdjqA6P8obPaRp2W1ujILM0JhGfLcX159"
-    "fGP4Sz/7O4d/9LkvDRPy/eH98PxZgL6m1a3j073hb/3qvzj8+Oe/dPg3v+bvDR+7/Zmn1FX9"
-    "O7qz6GpU6+3t7Ol2AOqVzMJs+BoNvkn55jt29GDTM/bIWLmZGm+UPlHc5xElBHmeSCcYkdFt"
-    "w2UMQLOyGroUoJ8wUKMpz6Dls9DDzSPMAR+yQaY0PMgBb7wWFFsBgZyMqyyzsR+MG2+8yt32"
-    "mBQe8cwApRP2r3RzAsZKjhysa2CW2v0N0e2IGKFADi/jRcY33NEWQoKVQ0sUwLQtUwnpb0uK"
-    "KfZrulb5m4lTt1S4FL+YExVLtbvkWPmLOdhJYmUHx4g9VjwSfPzoce6PUvrxvhym2A8VjhKP"
-    "/HBm4i1V9ilu727b6YLPkZaVDp4cxFt7Wm2yE4XzdXpsR+3Jvja342DJCfNGdvaU4Vjpcyoc"
-    "ni3glMEr2lVOMY8i5Rf7MFu3Zo5Jt4HgOGVnOhNLsR9hKt4S/bb0jNU2wcXfR0AkDN5Bdzpc"
-    "uXJNNpMAwbAj/aPSmNewmS0LnuZvpdUOrU/CS6GNDffH4phcWOJwMuF9n22cSdDzijYKnKP/"
-    "LITkHqyzHFgFqAqnYFU+59jwUlZf7pHbEOA0llYqRnfIK1lPGwev0nCk9jh0TUYYqVXMaTm5"
-    "Wl2alyBrhb76RyK7ykIM+TCjIPpQzUMjRG2XEy0mjHkjrdJ96QPfPBbaNLrSilZB8gyvyFkQ"
-    "3yT88usfGL77p75peGP/dlspaYXvJ55PC9BPNdV+6uErw3/x47/fTtY3fOgXL60r/aG2PNB3"
-    "/RG1VrBUoA7T9qVXJ9dA8I2SYQQSkTdlK61wshEPNacdjTJN9voEllEjLfqV4BEh3GTiGF1A"
-    "LMYxauR3BIOQoGs38hu9JRWDkMZwjvKgNDRYBQKiSMEyUg1OAtQo1w1TNzIguvWYJ3tomgOR"
-    "TGJKcAbyCMqCZygxCepVtq66gm3cIMtsM4XphVvoVe8RG+0iFE5fZnrrP/JwOcjURRm3urKB"
-    "C4DUqKvx87IkfyTsMcVBLBrPLAp5kSFdofCq3PmqUMbrVhbnbYiJgyRKok8jCYXgrBrnBI5D"
-    "ET9LE5pwFhWrOgf7j+xc7e8faNXq0fBYThabzw9YuZLDhEN1qJWrJ48P7eREXXMlSZndkx2t"
-    "OqGInB2tbh1uHw4bjxmE1sLOEpvlWf06PDqTo8UbhIdSDwdIOkkdYmjpRd5My5EP8qp2dPwC"
-    "xzFw1la92Ui74GyVo3dyksc8JC87aHK4zk7ZIaD9V2e8UUPLs9QoZ04bQyxPDh0rZrRDHVbq"
-    "l0OUR3N0wYI1oQB1n3BVKXGVATpdl5azocYW8xgRbvAIOGmPOxF5vIlJPEan/cgUV+LGuQfa"
-    "Li5Fj8ZfkGgoat3YwKFn62mmk2HdYAZtFyzZlykcFNfEZSOBsVK+oQKEejNEFbY5ZiRfTJUl"
-    "S4PixIy8ElRY5StlE0BxmwCbvSbQRJ1QKOO8haGhcm5TvUi1EmKObPedtLFtPmPa95Xqf1V/"
-    "s0UeNK5nZVYETgCgJ4nhlQ6+5PrQ5aWnR4NAP//5Lxr+7E/8bo3jKxq0Pf776feCBWo167/9"
-    "2d897GuF/xu/+GcvpbbHKN9yM9Q8sU2Hd1dRJ2ndMACZF5SObpioQSIonk8+IBVaII0ddtL5"
-    "s7CwPeiA2YGJwhKTqkz4uoxBmgOwBtsom7Lik5ycj3TRuQ6BpmtJBNCnE6EpIjsxE2Zo9WrC"
-    "x7LCacYrpVRgLPLwSlr4eqAaUHwobFKaVCeiKGGK5vmxxGJGGiFaLgRjQGK4WSOslJtr0GOs"
-    "pGHUsR7rNMWsGgId+Y+EffmUEvygGitddBVHefQtuEsLEdXJxNEU8WhsUwX0Cf4IXh3y3qiD"
-    "3LyOg/VkePiQjza0H2rVSo8Jn2j1ij1Qx0es/rByFc4PZ06x58k6iuWx9kudnR2Ks1wX8d3W"
-    "XijMj/MSP72gFS/eFNQqkvwqOVpxgChao8vJqU5yt3OlN3dFu6u3/Ng/teM3E+PQUOSx36vV"
-    "Qbw5goH9VRz3EMc+8PgSpylWw0517pUW5mzCQ08OG6pD3BW8Dwsl0VrOGnvG9OqhnJU9yciJ"
-    "BJsljhHrghmDNCBh7Cp1XK1Ue6sYsDGuUiZYxduxKNyAArutiLObFbMi6fJd0q3baG1/C+HS"
-    "qQvF2BsRgvqGSo+qVs/XDLgYabWkqKoEHtHfkgZaBeBU1WwMAS8SJTfBK1HxNpdGVFTjxL9C"
-    "eCEgFZrjefKfAaVE3EVGeOg1QukvpdWItZCqClVdZijVz8NqyB1lGLXRq6wEAiNdZfN0Fpt+"
-    "kh6lucw6FTMgSuv/V954afhz7ztXNtF7+qJ+wc+L/eWf/0btxzocfttsJav5D10lPXd5noru"
-    "QBHdazv6b/S4sS/HpAISPQd49cUaV0ER8MB7uiv0taQGZSidw0TCXN6xRD4BeCtTIijCMaEc"
-    "PNezISUBhRWqMpkHtQ+z4tBNRuDPAYOMxupJF9Mj/74Wi6jBXtces9JFUfwMr0wVOlYJcBCk"
-    "Z7X7BGVNhunPbdERVZuvIWngaosyUyt4WxKuXHLujdDDKS7nKW2qetmRpT3lVGzIgSFEc4qP"
-    "ytmjxLELjx9pj9Xjh1618tt8B0daXeLx4L4ckyO5GdrIrrcBT/WID1s3B8c3ZTaIg8EOKPZO"
-    "ncnJ0T4tOT04WMhjlak2zeNA4XAdaQUrgsrYf4UHtHFkXuzbunr12nD92vVhV84Oxz5wrpXP"
-    "2JJz5V9GcLupDuIHrQ8j5bGk6oPuT57wQX9WoHnUiEOntSvhs4K2u4vzpRI5jOCwCoaTd0Xy"
-    "WN2jb/CGoVf9bOqwvccyiochWxeo2kSdxusiHFrbLvDMHsM2bipP/mCE5MAlbZ49MIps+0w6"
-    "8ssmsr1NNeFSWKtMlvRtMkXWp4tLxMxNC0EMx5KxjlW9Oc08v8DxHQaNOo+Cl6w0lvYp+vpK"
-    "0MsYS/U0bFbgG5pgtfrseQuGK3gppeCOM2PPi7T0ziixJ1FiT3lH50m8s+ENvSn4F37im4aD"
-    "91euJrZ7z2bUJfR1efjen/tXhleu3dMZWuOeLObDlaD+wBOQ8BF0zYGsZwSRiTzpIlUi/gUI"
-    "MkpacaKN+AnwGLt4oBljhbgkMFymoZcbtCpXIjBrsoQmIO1bS4Bc4TlPighL8AZTAjWxgAd1"
-    "kHT8GmaWnBf1tViP19e+TxcFEuE0tkqVqC59xS3uafQLxqa4nKqjYKWWdJ0gnJt5WoHr8NfB"
-    "V4UzCOqRIPMlTgIrPAdyQnCuHj64rzcFH2vV6qH3Rx3oEeGmnqXfvLYjR+e6zlPRCejbG1rl"
-    "ejK8fu/xcP+Rjm3Q/iof0yCG8W2dt/G0giD+rF7ZadGqEvumCDhBODE8Twgd1K5Cr71REHLE"
-    "wpWrV4br128O167fGG7cuKX8NTlWkq+Pf2PQK1jjSoVXvuDN3iqtYLEBH8cKh5E68dZjbKJH"
-    "AoehaoLQShx60OF5pAltTCZqWU8qrBKoInr6wRuG4FkiA2QW3IcStloaBT2OIRgAXsQKtE8m"
-    "nT/vssLrPGSX9XPdRcjhCpWMpfpU2UWcKF+l7yBKdrnLsHuXcJa0BHZJSyz0mSWOrpwLqhT+"
-    "Iaef/9wvC2UkUh+iZFLg0rgUvOIl3VVWxR1lD4P/X/pHv2N4XXuuGD7vhy8QC6g7nOhA2O/5"
-    "mW8a/sw3fN9wbedgrJjnKmXdHZkXI81ihGdJAeg2uj2MvWfs893kIyB/fTc1MxFDWWklFQLS"
-    "T4ouH0UEWl7Ly8NxCecFrbjpCUHJnnfjqbJiV9+CoiwJ0LcQJtJGOhhUnUCZoyM3YCCGFqFj"
-    "3ASDv24tc8KZvNXsyHm1rGcH45Db8GZZy7b8Edd1wpaNKBMjyrxkzJtXSZ1ycBGgxBmJ1qR6"
-    "3D69qtkaBkvgufCpjiNFjxdpt51kYx86R9y4w4EwTMQ4ExzeeXDweHj04MHw4MG94bEeB+5z"
-    "/IIcrjPtR7ohx+ru7evDiy/eHG7cvDlc2dnTxnFtTtdxDXs7r8oZua+DOk/kcPF4Tn1FfPVu"
-    "nuDsN8EVQTYx/R3nIY1Dh+IQTTkxhrgsztHitPUrcuZu3rw13LwtmXKsrmoFa08rSj601IeC"
-    "xuoV9fJbhZJDL6gfgw4H63C4qvNfrly5PjzWwXr7+3K05ETuP5EThk81xGNLHC3rfqo9YPqr"
-    "MUrMyk85fnva+O6zsngsif76RH1UPYWwfKQpK1jWeIKbWMEHmyQ+/OAdfKHUxwyCX5UHLIqL"
-    "lxUwLuxSmxwb5SzOtGykSwlYVUi2lR3jHmmEWj2yZZOgr9yIWH1xhESq5rkeHnWa81hQYKLs"
-    "QnnP1Gl4FlHgz6n673BT8ph75lo1AyRnaMaDnws7pZToZBxNVzgAlRaOsZVkPLl/0Fco61GF"
-    "zTirzfPJcm1E15sHy5/xnOP8/V/7iuEnP/Ox952ruWG+EPKaGz+//+LwN//Jbx3+0Ff/365R"
-    "zXeR6SqZ80z0I8aCvhy7Q9KBqie5MzFBZ3BnzokOENTC9cQnrNW+J8gqMOiKZ8a1vEvPhG0N"
-    "lFN0SQXCI4wB6eFbeEKIiTeYtcGhRKpYUjJOhpnro0bbAQN79etImCnq36G35JKUqsPcMK5P"
-    "o6TK8A2s4oMpSbebRIcfycIEL9rJBElTNgWXegZ2SHYrW7mwN7JCgZIKYH2wLdYVm5kKg2l2"
-    "iQKuI1oPL41HjDW8lhrTagQ+Nyv6HfbEqQIKjMdjB3qE9kiHfT6wg/VIjwbvy+nSkQraqXj7"
-    "zvXhpZdfGl564QU5V3Jw+KkZrSydHj7WKtbm8PDRvlawngynT+SgaMXIe5mwt/RBDvu8EBbH"
-    "hoy6WAHpQtuzP0ge0nDCTksFHiVe1crVrVs4V3eGW7dvDXtysHavSLacO86o4qgHHyYq2hj4"
-    "WlnKwOoTHx4jnuxpA70cSPA5dgF7esXuTPvJ9IjTzp1/rDrscqIVLHSHJ44V52sp45UtztXa"
-    "kfwzOVdnZ3IYvboloegfFhUcJbhEn3bOsLwPhTmMTt0hoNgougQ9sSFiTZvhnEYAXGOiYosu"
-    "BOIwsyHFx3EQZ3HwDzIRdDQB45rAWbH1HpECzfpOmcgCPdYs1xXN+FOCdnP6oJjyBIYd0lpG"
-    "cXO4wFkwKlHfG1ueBFNBhEpEXLkqNZtslwZzAk1D4wmcvq//4uN+3nKBWZRR45G6FzPWR9iu"
-    "KBydELese2RHBpQDK+FdyUpSAsyxE2p2KzyxtagFf6TT2f/qz/+WFVbvA75wLMDT7L+ts7J+"
-    "54d/bviim6+q3Zkb48swtXSvoT9UH6P/ZMexg0XaHdQIpOisIBkLHgqCOc+0IsTEjbLuOoeT"
-    "F5vs/iOiYcVHE6d402lLtzaZAuQ/C10xIZUuI0NSqSOqF2vTdveAQHP9PEiSgauGolExxTDx"
-    "v2QrIWSxyjjkWKeOicuDEsxJgPM81KTf4MkgbjUBNV0xbojrE7oNuRZgVDuyKlE8kVk+Vf12"
-    "WVYvKKgPS4jjbCt4UcN1DO3GNoIi9RT6zkkX89E4XRFWkZDO9lW43C9AzZsztmDEpI7+CRq9"
-    "wcd5Vhz0yePAN+7d15uCj3Sw7sFw6+bu8MqLt4cX7r4gJ+e2H9Fd06O6Lck+lfPFkXTH8FR+"
-    "a4tHZrXRHOccO3KaejpWtIhs6xuhdEClMzs1ae5smFPtmZLv4kd/e3tXJfO6Hgtec7yn1Syc"
-    "Gx4P8kYfzk85WLZB2gSTcSwDjtOpHLFtVtv0+1u8ccgq16HO3TrWBv1djnwQ3pEfD+bYFiOv"
-    "ZOkR4+GhelTqzKNIHk9evXbNx0yw54s24LgR6kTf81cSyY5+m3W1YsCqIAG2D2lKGFNMWoFj"
-    "esoV4F1v8FI9dMOmtKnxhWebGnu8QE05+GMQFH4wcqi4skGVuVmUfWgCLd6iY2xRFnf/hjWT"
-    "YJzEbDjnJUZdz8OiTPWaoCiHWgmjjHTgxLVHj8dpUd7T9DiVpnzk1adX+dIXMTdtXFdij9Um"
-    "SGWrpBYHXjQXCImU7RfjHVrg8UU9MRpqkZjZOZdkOcoAF+XnIQVQ8kMf/yqd1H4L0e+HL1QL"
-    "qKHPzraH/+VXfvPwXV/7t1VLRm/2X+qsjsOf+3lks+/5HKzqh3QXek4R5iRUHVkTdetqmgh1"
-    "cqFvEEUtwuWQRH5bShh952diD6VGWcxNKE9A6fwXHrilG0iFlQJMQTpoyDpnmkyryINcMKoV"
-    "X7yDXiBTeDIXj+SUAzv0DpTSgZtmTLhiJYTRsSF7mbA4cUqI+V2GwQKOdSwGxOVpugA1DQxK"
-    "ks4XQTJM3Mx1wMIDodJTrHc75yMMZrq5n6mxcS5wHmPjthwLrSyx+ZtzrXCsiJ9oj5KOOh9u"
-    "Xt0a7ty8qxUrOVesWmkVifOg2PMEHx4nHsoReszbhXqb8PETHbOgN/B8EjqekzoypuWtP/px"
-    "9WXsE22gQrUNVsRRAHcjDzRlZUiLRF414hFh/IahfjdwT6tXu1fleGnflY9nEJ4I6xgDeDMq"
-    "DHO7xkoVP6vDStbZmY6L0D6wtm/LcpEtJ42Bh9q6wKP2iLEXi7cad3a0OV96Xb0mh08O1qZW"
-    "wuy3eHxxdxGdePhmCJfwgFw/j9vUCw1DT98OrStS0Q+9N2WTOBuPCUu41A8jKYle/IdDqaTH"
-    "MYaLMqxpHEswqlM1ThN8btTTryJK+NqQZaEOakbdFZ9HtcQuqzuhn8OKruCVv0xcuq3gLhSc"
-    "pzuyK/Tpgi3GTUZRCECyshV3xG7/htBr1BMGQeB2xG812fRpicbxSI/+f+DjX6N+2EDvJ75A"
-    "LYDL8+Of/Qo9LvyR4aWr91zLmL3HCk96SPYJDsLJ0BfnpKZObSYUacJsr2R70it8OFW6eM1j"
-    "PfaYfIuM8qKML+7IZFLVjcCej3ja22LCRUJM3p6sPalnXvCSHvyMbAGeoFMV6gEfQqVdLiJP"
-    "qhAzFbpu6TiRBgzFyJasYUVP3piBTOElwyoBcsYpucqjZiMcnCorfPLYwpYCKBTqnHUKSNQV"
-    "Wt+8wImCsPGYT/SMov4jrJc9Qt+2FO0wMYHkU4UFgfQhN1Y3623JW9E6hrBFIfixVm94E5Cj"
-    "Fh5r/xSPBNn4zY8yb+l8t7t3rg4v3L4x3L17c7h544YdCvYc+e0z0R/pFHeObXisc7DuyzG7"
-    "r8eDj3U46BHOiPZe0X3DaZIudCXlxz6GCtF3cWao2BYrRFRIuoO+qeMecLBqhYhjEmIVMmB+"
-    "a1CrSXaCsI1rljzJlw0Ep4xHifIarYPPxmLVyg6XwAQbEszQwSnz4UtIWBnH1Q5QoMghi34G"
-    "H7/pKGreotzU5veSX1+KbAvxbmKcCEcwNMw0cPhzMXbE0Lv9XJ71A5Xiwi8SgVaCEVegAliR"
-    "sWCWHQueLlVsKj6PutSuGNyiq3gdrKeZy6CMsMQjStZfe5rCOk9W4VwqLsUmmnWUCG84BafN"
-    "I13DegWlUJ9VjKAVIaVcWOgfv/qh4fOP73p8Pyux7/N5Ti2gJtcvtQ4/9qmvGr7ly37s0kp2"
-    "DlbQMLnxjXjsSkrpn77G7buu4PmmYdjF8uA3D9F/4aRgMdwklNSFSTpolC5iwevm1OLUAhbw"
-    "8WqFKc3Q+FEiOYzSEKqIREpwxKVgfJtWThfTCK4v/rZLwShHV3hwAyDAM2xSvAxef0HGvFSk"
-    "oVtfUFgV92WkCy75UqxJB6y2jOXrwOGKjtQDXOd1cX5BMtwjBH3l3vEYgxMuUCOahKs+NkS0"
-    "Cm8H1qnp+3ocyIoVP9D8RI8C2fC9pU52/eru8KL2Od3VZvKbeiR3587d4YoeB8rjdz/ySe3H"
-    "WrnCMROPR3LO7iu2g/WEoxD0BiJnWEnuBk6ddY2VGavT+i/lYXP3L61cbdGHgLmOnGmltC74"
-    "N+iO88dmdX66ZmcXJyaGrvExC20J0+iK0lkuCfLw9qQIRz7Ubx5yUrzfXBQ8NgFDy0qW8nYO"
-    "cZZiVQ3Zp5zjJUUO9Ybk/Tdet0O4o9W0U1eQNy9jzxj7u6S5V5i8yqTaiDLrFO2APAY0OWpr"
-    "nVVHiVWgwRjjzrRLzQfGNRQE+AQX4ggzwoSuMGzYa/CL7s3EYtnUEX1q2jj1EkvrikGqdNEV"
-    "fsEbo0z08PNwC6/4zvn0+XW4PbzHf7o0XErTOeVqWdiyhxdtdfQ5j2eUnzQiMvUpNYiV+bFP"
-    "fanbujR6RpLfZ/OcWoB56R98/mPD7/nYP1Drx53eXSH1rX6Av1LpFQfLnUidy4RgebaL7/81"
-    "UQHe0EycfkVnjl5cBxa3euTQQ+EXinR0So6PF0Y4p2rHxBsTMJQ4U4TCci5vhsCZmENASPH9"
-    "oGGLblIB+AY/ODKZM8bqDZR4hJE3Dx7hIJRy/dkeuoYUJF8upJUnyOY7gVwmExqAiVqjHsph"
-    "gwaMdHNYTRB1dU3Ae8+EsZahciofnUTVUd49XedPyTHBkWLVieMJ+HHmhw/4geYDOTbHw542"
-    "sb+g1aoXX7w73NB+p9vaa3WVQzz1ONBHK8jJwNHgtwd5qxDHDB6sYD14/EQffviZk9y1r4mD"
-    "O9mHJfnjCk7ZWEVWe6q7HYdsI/dZepXog4dWxeTU8duH+4/jaAQk0Pe3WS1iZTlpaWf21Xls"
-    "cA4WzpGcn/hhaJ3h5eMZ5FSq3mx45xR670ETLo8CcXvsDtFNLB9JG8bj533u37tnOz7WiwBX"
-    "2Ycm+7AvS5paDxysvSsbdgA3N/UbhuLB6iEhRgeY1B2F0dURKT0aDIz+56OiKaWR0cMBhCIc"
-    "riLuK690tX+xBt8yJ4AuM03a5hNQyZkA12dQoSst7QpEngBOj2fgDNaX9+nCnfMu+BJuDyMd"
-    "7VAUXazCOW5XujYZPNcWZ7PAPLmXIYrEDKKsJTucIiv0qZYJFWFwGLE6FhcAS7VgYh2ggEF0"
-    "wKBPhscnG8PPvPrBVp0ofP/6BW0BdYpfe/Dy8MYTPd248kDdonpbdIqFbsJvEU4Dkxc3Bu9l"
-    "SQr8DiftkBRTTfJ+fMAEGDeDKac+B8+RbiyRYsCtXympuNfUyEULHwGsoxJSDNlxwGI8WqxH"
-    "GiEDXqRCPt/CSQNERO37gAchJu4oazSgGz9vZNBbZ3jXNFUOKCB4BT8oKxRm5cFZsonF+TJi"
-    "rrIDQXrq5uq3v9KGOKauI/ZBN9mHfBQrRvfWlqFR1dl28epCJ/eC5FzNC9BXiletZC1W8NYB"
-    "qhlsb5pDf5xrhVNB7ag/vx24L4dgX48EHzzkLcFHw9GTR1qF2tc+olM9Drylx4HX9bk13JFj"
-    "tadjDHb1hiCPu/j5Gj4H+rFl6KF96JUrjjnQxnicKu29eqiYn7g51UZINrpjU7etDMQbd/Qz"
-    "HCI/ZtOKonoSLeFQfQ8ctw/9Rz9jw1laHGJ6pP1g8uPEQytZ+nAqPKtPPhRUbxN6TxjtjjHM"
-    "lf1W0kU24DBUHCgON8WhwknCwfTvHWqD/qHqdcwPRnNEhCcLdEyHyHVARTlYctRev//GsH+4"
-    "K8fzqhzWs+Ga9p3d0GPU3d0rkqoaabUNZ8pjariuVS7GSzqaORG1WrvhI5cjx01IFeLRo2pC"
-    "RnTUKmyUNqWWritWVBreoCq9LviLFPUxN9BxI0XRE8ED2+vTg+FJP1oNcyxhQJ4OLvhNhvUt"
-    "DiCBF9rAxXXMuLCeJi4ePc0SrC8va4BHKB0iN71SJiM0JOx0Hn5PbTIzGFnAaGJllXt8aOxg"
-    "G2SdaRyDQ1vzoWkcilf2KStCgcqzKPAmVzMdISAWvxEqObTzyCXQ6McdEhhq49f2rw2fe6TN"
-    "7SP6FOn93BeeBdTWJ2e7w6cevzi8cFV7dZc60azWKw5WTApdx4YNj5laRxp7m1PZ+xhI4dGN"
-    "5TNZK9mgr6VeDST1b7Ob9+iOEhr7Ab7EY5UahOXwVcVjIoaAQZo3MGXtPNo4UrqbEC0GXCfG"
-    "i6cTDXg/3hDYA54Kp4Enk8VI1lJTi7gGrezNJZKjdQgOnm+cH/Xqebc6mTQ0brBCzLLKPt+x"
-    "6qBKx803+6sfSPFITY/x2ISuR3ms2uyz4sReq/v3tH/qiY5d2Bju3tzTHqvrfgyIY3VdK1ec"
-    "Vk6gB/jnZXT+FXu1Huu4hofaAP9IB4o+1IrVQzlXT/Q52JfzIodH/oskMxHHTd9erHtRtpN4"
-    "tpu3+jbpKKFfRn9yn5RT4t8bZLzJOaHsRHu6js54V5HAkQ88ityXI6izt9h0r8eFfpsQjvp3"
-    "PxdhOVh2xqCRc7Xffphaj0vlfHE8Aw4WcuKRHjJiPDIEGU84esdyqJ7IlvwO497uQ71JqJ8I"
-    "OtWjUyHt7fnZuTbks5olh4p6iyFjBOcvjoVI3aIKrqNPvUeI0BeDiigjMj8jYTvExrg36C1d"
-    "Ugg8LIjETKFZFoy3Hka5xb7idbyLouLC6/OVrrhw1sXgVejTBat4id8cf55vtC4oDonVV7aK"
-    "REA/pH2z0SMhQFIFy0mmcLOonK7IxtWyeoEJRlaPp3TNJTOw9ZrCzobPPb6l8aEV5VXWU9Qv"
-    "pBx17T/zulXbVTwv/wLI0z9/6Y0PD7/hpU9cqjYrDha9ji5dj9/o8XS85qz0bDGkA4mYqFFg"
-    "tesaaeXCROn+yYTsUuLZgEqqJh999Ccvafy26Am9lBE89UUXBi28qz6mFTxwgnnpjAxwi1OU"
-    "hk4UjEuCS3iBvXQNnj3XPr1EcUmY9IVTTAxKUNlLhazTIu6qBRbR3nWg9Mz62wg40MofHuvU"
-    "cjtW+3oM+ECHhsqx0grWgVZsNnR45vW9LT8O5MDQ2zevDTdv3R2u3bjtt/2oEo/VeLOQn5Th"
-    "wFEeC7Liw0oV51w93OfNQX7fTytFvDWoLwXexyTniJ4jl8SOiftStgft4xYnVoIPRTgwXmEU"
-    "lR+LCxg9C07oog35lhF1Y3XoSE4R+u3IadzeeaTzsORgybFhFZfH8LEfKhyj+qmcEx2Syv4z"
-    "ZG+LgwAAQABJREFUPxaUNwgPHLlj8Vd1JUy6SzYRiwj0ADtXWimDZl91fqi6Hx9Lpha4nvBC"
-    "gM4Ng/b6Db1dKEdqb4+6aDrxGV5wUF5ndu3JLqyK2QaqeNXPQsoQVHYeYKHgSHbCaDH+cGR7"
-    "AtKJbIqnuUzprNsU9DTMngL36YUURcUlrM9XuuLCeavxm+VHH492VwuRpp1oO/2Td7s5Lg3V"
-    "ArM8I2fS3IW6EE9pR4R27xhBoYNHGQJTIbrSQliif23/egyb2H64QPUeB2EWFvQ8v8lCzA17"
-    "w6Bj+YZr+lxXek/+JdMec6B+BWx4pIPO9R1Oq/2au/Sbqm3BRDj+3rbGvu8lSzG9ff/Hv274"
-    "9q/8kUupvepgybB+TVq9uvr6UgeDe010rRxa/RV8WYOyMoOJFow813AX1lAJIVaQwFIGAkae"
-    "RhWPGWjo2PiL1tI9b7hwJfiNLEZg0SnBQgE8/I3YycANJKgixACPgR4TRkzykEPBx6wCffFa"
-    "nBcL3wLQ+lBf/qjfGkGlayhLbl04r2wdzbsDd/tJNI9J/ThMj/P8OJADQ+Uc3deKFUcvsOpz"
-    "/dq2HwPiWN3VmVacxH5Vv+W3rQ+HaPpRmpywJz62Qb8/KCeCFZuHPF6Ug/FEG9gfPdLKlVaU"
-    "DjmlXSufW5s65FMGjX1Dsj8rPrwN4WYYGyL2H0YLMBmBQFvVh/7sR2vR0WxMNyV89PGbiarD"
-    "0eaJdNWbjod6HLd14D1YHNfAyhErQqxkxVhkBSs2n/PTPNjmRIIpwwGzc6RyzuA60V4SxJ7q"
-    "2/8muuUjThwsNsOzX2vfe8x0eKoc1G0fJcHP91zRip8OYdVetU0Rwhf+p5pZve9L3hdHQgDb"
-    "0SNX9mrxNiNjLcaqhFI5d7ewjSteF5RSuYv5MmV44JVlC1okzywuATAMwc+M9ZtlFDUPdebq"
-    "9fnz+BePwoHuMtWb0xV9Hy/xiu5c2qm/Q6A2zVRPHulAiHQbC4yTVdQlSOAVctasI666Bkbl"
-    "MpY8fgQ9lJxzL9wR/lAHjH7BBQyjL02YbEeL+R95ZRi+9ks2ht/0pcPw1R/eGD760sagH7HQ"
-    "ETZauZZzpfOVPXeAr2lm0BQ5PNg/Gz7/YBg+8bmz4ef/+dnwD391GH7mE2fDJz+neUzOl5sV"
-    "r2PVpAK+N8LxibzL1j9DZ6oT/Wpah87Bojhu1GBy4+aBBxMkN47gt2SVmKCNJ8KLJ71RDWhQ"
-    "KxwcUeLpXhDQw1JMK2QrRkvjJEc1rQuP/uRkcaPwN1+JsmToTCO4ZnpkR90QTP0VfCGRAd6J"
-    "ZBrRcdOco5FHg+Uwx16PuUw/h4qfBYoPupFOe56nRSmI9LlGZjcX8xzncaxwTA7lGPFmIJvP"
-    "9/UIj1Wn+w/ekGMhJ0QOyAt3bgwvv3BzeFmb2Dl24Yp+z29H50nR9rxdx0/hcIo7jwPva5+W"
-    "z8TS17B9/fZgbGTXbwwe4MTJYZBTwopM7HGLL3l25tGl+mTaLJxxxgcdW86HHBj0db/PtvOj"
-    "uexbwHGSaEd41biIn6cRrfozK1qbW9pjtqkfm96Uw+PVq005POFkVasyZvmhZxwfVsIixqkK"
-    "m6EH+gzsG+MHs6SD9ZfjBQ82xh9qlWpfK3ccSopTdiR7nmpW5RR579uSLfhD32OtjPkLk36r"
-    "0Y9ntfIVTpd+KJr6+Iep4/DU6oNpJssb05kSDYErY4/+SjBUits2BYyiNdfzkCgLOSZW0m1T"
-    "JMo7WfkVCTP6vhy259KBzEwWGhRqkRFfFApnTtvTFQ6wPr2EU3z6skn6HIR1RTSjbYp8ZSJN"
-    "315HATzwmLeDfqLF+gz8W2mk4Fa9p5UJWDo1dCUMQ+AkLOgp0LF//mqC+N7N4FRp2F+9MQxf"
-    "/xuG4fd+3cbwu75mc/jKD4UjdVHFaEpNs/7c0EsuH9LJFV/70Y3hW78+KDWFDL/4qbPhh37u"
-    "dPiBnzwbfuqXtcr1SO3CtNh5IBfJeW7K1UWqTzWdZAM/oa7ukt2Ir5SBwySW6fFRNgMBZgpF"
-    "2LqwAJrEGQwVQAnaEVZlS7GxdNH0G8VKm0fp1IiCH2A/jmHgUUXlwa+VLVQxPOkKx1lea9fg"
-    "caMmbasUTDLYSculEfMWnLi9rdXRxt40dOOT9isiQSqYXuWuBRkFU+ji7JwmcQIzcAOxIMRC"
-    "0j98fGMDhJ8px9LkaUP/kom/mNVkhVWUVjn6+8/KKFVKBQc4Khg4gQT8bbpqpFc/tHTaTLrW"
-    "hIgDgnPAzRvniINBfQq79ljhGLHKdKBjF7bPDoaXbl8dbt/VJnZtZL97544eZ+mwUFZT+OkY"
-    "bf7GqTrSI8V9xQ+1WvWIg0Z5y5BzrbRqxe/0PdS6t3wLWQEdmBHS3mVfrdKgj/uWynBS2Ghv"
-    "24KjvMtNqSZi+UaB+vChbnbWMTMBeKTIOEU5f3Re02ncuf6nR6ZHDD8o7X1NxkMujxjDmWJ8"
-    "gM9md75wEDh7C3yOg9jUqlRbZZP8WPXSY0XZl+Mh2H/FRneqCU9x828uDjozTFJVaSByPtWB"
-    "jmQ/6rS7p5UsPZrEOYTmhn5LkWGlf68Y0tncprZBbBVw3bA0FdIHXPrk5Pw9lHdZ1IOsA8ji"
-    "5Q/0DoETtktYkiHDaLKNBUGe9k7iBp+DW/lSAeyKZ4rMqCOTJIypwDiEjWVDqzzVKJ08JjPD"
-    "uKXA/KIgqpx6uPqZhneF+nJYeeJORIkSr2yTHnEh7XZbgFc93X7IcEV6ROrsyhoIftl83H5B"
-    "EXVUKUoaX4liDkghvnwoUTLcmF0epAwlo/KwLB0bTIl1TvukHtJjpkrP4r2VZmunKvPlHx2G"
-    "P/g7Nobf91vDqXrWlbiixb7f+CUb+mwN/87vHYZ//Mmz4X/+0dPhr/0/Z8OvfiKlaUXsPRWy"
-    "ExDRTd1flWl9TWn62LY7aHXOvobVcQtWnb3yYtV30pAX10mHLPwoqlwoJbm96FAUZZua7sy9"
-    "KuCTN7vMFIzqoZPfrgNJE385b9zwSi/jhKclfVyx0MsK2FRNz5aA76QORp7YwLw6dkWbmM72"
-    "dQFg9AWaoq14Tlfwif4Chl2yFCJ9qG85oVUH4qhOLxw8aHuY6AEVIekK65UqjKeOywFBEbRA"
-    "Np9QS60pR4HHed58rh8rZrWKYwMe65EejwNZSbl964p+3uaV4SVWrO5oA7t+Xuaq9gP59/TE"
-    "128GarWKNwwfPdYPO4sHvyXIm4HeyP5AvLSB/fh4Uw5YaNEc8/CPpF44TrG6FPbCzujvG5qU"
-    "rhXUqkWZEDxC9MOoIT0VLsEpyqK/Zp8uYuHgI9GefOuM3y3UURQHQV17sUKGHBecMX2I++Yi"
-    "bRhfbvB8JNk0koMmPFLE0Tr0ni2OqYiVN+Ra41Bb9Q2nUdZyu7BXjZvlKW9C8rhU/Njsji0g"
-    "kfYIVqxcxmUH6tvGqHGFA1EprjjqhbYUcc1QSQupDGUjT+rVSCTbPbtQHVemmEY8h4ZKc2jJ"
-    "CpVN2VCsVDINIPXsZxpXURd8s54W7OZg9gVqs+oSxsmy4OuMq1r2Csh4LQdvhIRpevq+LNph"
-    "AlnJWI9SqisFVO06gsMOY4OMJWWCKFM93T/HclINp5MX8nu8HFU2blEIyzQlf4rf5yo9iige"
-    "VfIejbViRfhNv34Y/tjv2Ry+9TdvartEwN6J66/T48Y/+W1ytr5lGP7Wj58O3/O/nw4/84uS"
-    "jHnfIyta7T6VaqM86tPPqx8C2a4BVd0tkIT5pgMT2irxAsgGncODFmh0ZlKh8irPEuQ6aBQE"
-    "r6BzhUl6xSBWFWLyikm6Jp5wPII3A8k8FiuQOhV7kXCz54ZWE4AnkUTrtYUEsD+VSYSOXU8y"
-    "SRdtAYvFnBa8SaCx+ehvrK8sk4RU03UmFuFaO59TMspDemnUp8GY50eqsQwcBUXWWcqhW31T"
-    "ZX9EHRTKo8BwquRccfSCVp9YhWLF5KU714aPfckHh1deecknsO/qzcBtDsDUmVFs9j7ieAI9"
-    "Enz44J4cK1a8dBK7NsLzUzdPdFjow0ccvcDjMFbStMdK+4ZYgfINCd1Cy+4aK1AFaKtRtn1A"
-    "bZU0TbUDcaWNRV315z6UzKqcwVzthAakkbOpVVnarJ13JT1jhSp00hUD2pEi3jafGCc4gbFv"
-    "S48X9ZgROyOvbI9zhSzyrMr58aFit7Hkc24Wq4BepdLA8mNBbZ7nUSK/cXh4tKl9b9oQe/VM"
-    "e7Wu2MHd4y3NlBEOGzbOVTnbK/ppbwNbXGLLFi4TDwLqRG10ZUXH/+Lh0vEiq7gsLy4Q6ui4"
-    "kFEgmsouuVOOgZ5ESQcGtHZaJ+i0hQpXwgTJOs/5mkTAUdLIJPoK+UCosRumCd5hm9U6jVxW"
-    "U2na1QIgU5WXcdZCIV6qyVqCsWCJbK0u0wJLnVSqyivuxLh/j3lSxprQZ/kSbEr6/OUYBnKu"
-    "vupjw/Af//7N4du+Qb+cutg33xnV2Sj/B//lzeE7ftvm8Df+39Phz/3N0+GffFw2x8l6F/W6"
-    "TO25J0QPYpTFvFX3qujnUWoHa84wiubQ1bxvPOr8hc84YCJc6nu5oj1hEvTT0ROPV7BuTBnm"
-    "PUUJHiqoydCTrwZH3CAE59u6sYowjBATclS/KVJASxQeeT4EhJN0nZSxMhRkENySEj1oq/D8"
-    "2Gx1SdLzkSntZBdNxRNieFLQHiGQkZaGRyEQGNYeB9qLcrdbFBqjLgFaLWCSn4Yep0+DNc/3"
-    "lGMZP0RMcD+CvxRjrQHHiLfXOHaBtwP5MeYDnWfFBuwnesONU86vXtvR48BrwysvvaBHgi9o"
-    "n9XusKvVK5wjfjuQR4KPHsqxuv/6cI8N8HKk9nU46IOHOoJA+632taH7SI6Btq/rkRunpdMP"
-    "WZGilaNvwMvOBiV557TdbAvsHLamDoRwjrBTZy2bbexrxQ986N2foQjGiimJcRWOkBwcrc7G"
-    "IAefR32yofBqTLHvKsi4wasOfMTIOquAR61sPMe5qt9LpJYc6wAO51gRo3U4c/T1tAF11Bg7"
-    "ljPF/rXTk105WBxZweoiv+94ID4c4cAGeO3ZkozdHcmRU3iilSMcQhwsFLY+8LUTRB2ste1A"
-    "29MzWMBQ0sE2GTMBV/v4sRwYwmurQJk3kKLGHhnBMNlKg0Qg7oLHdKhkklSv6VOowUfWWlht"
-    "KXULN+KmjLPQu24loJAlu8QXiDgsE3WquvTlF6XD7lOsms8XBU5RnzJHDcrST0kK+twma1jU"
-    "eOmL6bNeAZwYkV59+bDE92noLy/pbcTU40BtPR3+3X91Y/i3vnlruKE3AZ+XoKlBjyg3h2/5"
-    "+s3hv/nfToa/+P1n3qM1PMePDfvx496k7s0e2eYDqIPwpW/RwXoaw/d9Pzqdhv4lx5IniXQE"
-    "LFN0MXHk9EF+XU+2DBN46DIIYiAIRtoMuSFEbXzjunCQaziasBMavp4UgVHCuwi+wVsyNbmi"
-    "uY0cYleuqY7hpZvZ9gUrVNjlkkGIroMMN+qiVDqd1q1wJBhc9Ih6S0ZTai6vs0kWjW1T2oFT"
-    "6WatDjLnCQ56QhZ0tqXvqLyZEieocxPn7UAO+uQsJ69YAXvyQEcyyCnQkQmDzoq6rc3X169e"
-    "1T4rrVrJQdrivWKdKM6bbzhG7Cfitwfv69DM1197XccunGrlS8cu7KuMFRltXMW/i/1I0ODs"
-    "6ZM2QsOxdlbaTstovLAnq0jcrIzMW3dy0uibRRuWVE51xrmq/tJP5LSHP9hHqJGHP3n2TPHG"
-    "YOxHQ5NYOeOxHuv/gcdbe1sc3+CvqUEXfORACYZjFW/3xcZ68xUCuvPZO9zR6tOu2+FUfDm9"
-    "Oh57YstjtYVOsde3zV1tYD9iH5aqfKxT53Ge0Ief5nF7abVwV7tgt4R3TJ29bw0HTo6XYN7f"
-    "SD3tnJSVMF/YSLV1/amn+weVmIXATeDIwgCyUDA++TMzP54MeFIZp9J93NiJtHhZu1YQ2KEW"
-    "/Dtq4VT7dtBAGZm5KLIjU+d1wUlYCehiVPpPlVaiYlSxZQqhxQG1NVqdoOLDlFwcFiSbh/Ea"
-    "t6Qjv0AQ9S+OICV1DwKcYc6b9qIeBOoaItYQJ48+Mr8JemPSo3lszccpukefm6C+dzKqKsfo"
-    "fcPXDsOf/84tbz5/XpW/pQXuP/UdW3K0zoY//pdPhp/8ObU1TtZCn3q369DP1Su6WF/1WcW8"
-    "P5R/QnPv7WpTnTIJRkYUACyEsYRUlU6hHd8s4Bt1TEodpohxBlrI5DhNJB9F+v7bGb/4VxyE"
-    "ZYiQU2VwL9k9LEzgqjUFjKoL/Ka45sEApIwiUDKp1CxkDcBpIYhyrvcAb0XzxIRO4iDlYrh4"
-    "VwydPR9gACOuNMWEyMt+oMBLoUsGoL+afw+AbA6kjsks+UExQqb0FHCzBSOcmtALewDnMeCh"
-    "jk3goFB+poWVKw7Z5NgB3cr1uF4bzPU50WZvEfibKm++PZQTtaeVqx0dxLklG/HHm3/swcKp"
-    "QOsDHdzy2qvau6Uzrc4GHdVgh0yP3PTTOSCEfWIzOCszdpjMidpEjWxeJaMfFyycdFZi67EV"
-    "7VT8RBz8FcGz4PTT9gGHtnUsHYreAmNVKcplb40VrwapjG9VHB1hMjWtnSgfu5C8XBKskcUq"
-    "VTlY6AGvDR25wHYMnB4f9SAd2eflx2xyZs/0WPzkdNO/uXh8qiMw9Nh1d1evCW2yrk+PwLHU"
-    "6pb4Y+N79+/rvLAT/aD24+HKtWtCCzzam/OzTrQ3DnzSre9M1RVfNQj2yIhq0IbQEWjf80KV"
-    "RiyaIGv0QVtYFFaaErTq84VNexWjgEX9le7nL2XtNxZKi5NnejNUD1lUqaRV3Ei6RPUbQOCJ"
-    "UvqsamoN007F3zQLuNX/iifxujDXrfIVQwe/FtKsQPp2juqr0IpCBF1RYeOqUwIpd3FDKuQ1"
-    "cTCeY090m1H2uMZrOnSIo5Id8DlL+sui9ll9x8bwp759y0crPGcaLqrzdV+6MXz/f7I9/Gd/"
-    "/WT4Xq1mufuy0PEchX789WpVby3YtjswHajvVVXawablURDjNkcONJ4dVKb/Gi/Faq19xmWQ"
-    "QDXTTrChcCs5MZEU33Vx6WZOrt+cZ1FO4X5spqIpFNwFiOtLSZT5BpWyQn7JiLjn4LQu/eZz"
-    "bFx6j/Ki3kzSPU/T28i+ZPtxI8dSbQrrFNCND906CMh+mxBYMbf+8OjCJNPBp1itYCodYsk1"
-    "j2BkLSTH585QysqC87G6cSCHit8NfCCnCufqsVet+GmCI/1Uy+Zw88UbOvBOq1O6+fMG4Ruv"
-    "C0+rKfw+Jj9l89prn5eDdVXnL2l1RDf8+F28bT1CvKGVF/HVCtaubui7OnJgXzxx0tiUreUV"
-    "3Q31wS7oJWPJatYPJ6oc4QCqQNwxGw6OJ2JI9ecxJQcFWzMQXZZpqODtAaqEccWb2I6a6Oah"
-    "2ROG6CGeOD8wgld90YDHtuoU2vNgVY6OVgHZq1Wb39EXR6x0Kh1hhFPFLwviePGhP8MfD4E2"
-    "eqwy/9yOjqzQYQxeGWPlb0/ngnGivI+KEJ2aRY4XlKxA3vfbmff02483b133vrh6PMkjXPZw"
-    "YUROpS8nN5xTHsW6crooAVPVbxrmeWyxPoyToms1QxQM4yiUGOe4dExb0omWMx2I/LHKF5aj"
-    "XUd+ibQaNTZQXzKEqoGMDCgrXsMiqld1jP4JasmseA35mwbDN8xoBd1/oy2wkmBWSReKbXzs"
-    "VraLdAmH19MFLBN17umq//ewdeklmUuwdfTvClzDikeC3/1vbA7/+r+0Oqe8Kzo9hVA23f+X"
-    "f1grbl9yOvyJ/05PGh6LmO9mz2tQF3Ofro5Bl9PHKsckEN2wyuf1AJ8yYgLpGgwGGHgejyXO"
-    "GmCM+o5x8G0cnYhByE1hhJPuN6hXSY8D4/MHUsovYsW2hRXqgOuSnT6gTGR3ZSTLbsXKedU9"
-    "9tQEMrYY7dFRyDvx5Jgg5HC/8ZtZSruOAvrPXwlDInjlwFlux9J5aPxRLunRNHQrTZP/kk0Q"
-    "MwuhRQ8EyYq4bpanmzC64SPEzV634jyhnMeBD7TqwaZ1HgXev/9QK1aPtWF6U+dYvTB84IUX"
-    "9JuBHLcQh72B9+qrnxs+85lP61EfP2QsejlmV+VgIeO6fpR4V6fm8ZMtW1u7usHf1kGj2iMk"
-    "p4CVvs3NN4Z7j/S2nB5tnWoVZsOOy2ho25Z2oRYwZE+Wz42KOtIu9UiNNKtGgadyNxoR7Vz0"
-    "Qcd1Q6tLo7OTbZw9JXjQPjykZFxFGg14w49VIdoKes76Qkad+YYzjp6UoxvOUTxCpBbIyRjX"
-    "UitSrJDh9PAJGvSNc7Eci4YN7Weyjd/i1ONBVqd49IjTCY73rPnkQbFQYC/XI+2bO9Wu2u0d"
-    "/SakHOKDw2s6roE3Oq+4TbYPr6ht4ckq3MlwRatZGxtshI+VvdBTWfGL1cCwUYwZ1Q/jVFCS"
-    "vlc2L3Afd9g9eEwnv7I9tniqYB3Q1ZqINNrsqfnMhPZaUAfyoeMUMVoVqYkzLV6h6fn2qEXf"
-    "w9alL4MLjtsqx0PpTrZWAat/o/3YrKZsrdDLipKLLWua1h5jLWxDZft4LA0bkp/bqOT2uM9d"
-    "Wgv6r7w8DH/l39safttXvic0XmvCP6y9WR99aRj+6H99qnleaM/xviwPvKpJml0vFtGh4+Oy"
-    "eY9KAuPrEisRxWUVmckdfjmWClExBYqKpNLEhIylif8CGFduL5w0HSi6Fi4jsfgVQZUJThHc"
-    "jN/jgTPPQy+YB39fvi4Nfl82yXu6CIbAFUAdQxC2GmE0yY4bMW2hdBIY07qiXMdB6di7Ap3g"
-    "urCfp9qykbjBjDwSZ6rVNdvftnIZsiy50Ri35SqBlE4pg+d5AY0GPL5J4a4gi1USbqyH7I3S"
-    "G318Hmnzut8Q1EoURzFw0//wR14cXn75zvDiCy8Nd/SzNte0b8crLHoMx1oBp7Lv7G4Nn/n0"
-    "p3x21T2tUMka2nR9NLz4ypkOF90c9iSeNwK3dcDonbsv+9HYtvJ+C/Szbwyv3ZdzJseBPUvV"
-    "eXFesINtSU1tJ/FRe9mhwRmzncayzNoS0LlNialxmoa4NquXgx3OhPglXrVjyaQ+eDNYcIs2"
-    "lXMGrfWXzsfShX1R4ERbhTz2YfG4lY3l1lnLQpTHviadYC9+BOwZdNRPH7/KY23kBOkMrT2t"
-    "9PHD0JIjS6mvscLECpmcNDlJ9EE+8o2orFewOLLhQC8fwHdn+3i4/hhHTfvGjnSEwzX2X8kQ"
-    "wg1CtBB/6cq+LB7nhr0wGkhhPOtIUp8oV9oZrhMgBU8XqABBjC2NQUhiFOTidReobAMTgxVt"
-    "cFn6Rb5WKfVKhMZ+RtDDK13Dv1CrjS/SqeiL7rz4Mrj+cWvsmDZu7eiJjvpFHcPU2C25Km5p"
-    "Yc1lzfNLei7hFGwez+mrfA6/yH4r+O8UQM7VF314GP76H98afv1H1mr/TmnzTOT8zq/eHP6n"
-    "P7kx/IE/fzJ8+jNi+Tw7WbMaawWLDhw3kvFWMsNSlpuiQ9dmopwh1g1ek/VKSQL6AgbPDI/s"
-    "FBZaFabjQqgJsOehMorR1mjOL9QsC2scm4VhyewyaVB7PGXLMQous8IA5lU1yWIexRDaJlzS"
-    "hsQFvLgBd0BwuBN6worWgaafjJJa0aztbBxhY38LwqqR5zHVPKR2Ix9rZyZz1HTAZzwyi8MC"
-    "VbyJx+pJvdmns6juc56VDgvlPCvtodrUrf+OfpD5wx/+wPChD35guHVL51nJuWLPkB+lSQdW"
-    "57DBbVaepPeufnD4U5/7rL7pvDa8/vrr2ngtxwKHQzI3bt4ZdtXPvelbj6PAP1N+gxUnOUzH"
-    "elR1prcJDw+NbbvYORIezgdMxMorQvEGHCBwcZ0QoFwkyLXgdqMsIcgFL+KAhhxgkuNQvCRP"
-    "BtvS4zgWl/b0GG5Pr9zwaFVaSW+OaVCQg8VbfI/1MxX4WKxksdrklRTx9O9wqp/gELECZc1F"
-    "y2obZ8Ud6SdwOLNqT58dNp2jo2yyqYNViXd3t7XitDMc7x4PV/QzEfBnM7242cGTAna8cLRO"
-    "dEfntPujIw42jQ9vPB5rptnSCfSHB4Jd0Z4rrSBubh5bFrLtBIrnNaXp03tayWLVEQfSLxtg"
-    "NDTPWIpRDf0HvEX9AKTIBjLpxRfhg95kRG6UcREH6UbfjP16IGc7nqdHX0Z6JcieWYdV1DlB"
-    "zANzFtWPVbE0E/Ph0xhmzvFN5JFNRRS3YGO3XCZGvdwP58XKlx2KU8+mqKc4hVnMxtoXXpUQ"
-    "L8Hm5X3+uUnLufrQB4fh+/7Eln/a5rnR6xko8hs/ujF833+0NXzbnz0ZPvd5MXzXHxde1Eui"
-    "0rkHqywgIugcZl21n7gKpUc3LIgZxl7SLzzFNbQ70PpkP2KgtexUzDIjbXCpOedWk0kb0MEU"
-    "yiAJZ3BCto7XBOmCjGfD1HWCWsy7slSGG5UnP+vclU/olcmiiHAwgqdvhrrJMSHFzTRQSyK5"
-    "aL6RASlMEzcTtY4zASTZz7+RNYUKujAKaED4GDwrA+6PdMbp4QeLH+vIBDauP9CRCZykzo8q"
-    "P9abZ9evbA9f/OFXho/Iubqrx4I3r9/W3qvrw7YeC1I/H2CpGy8burn5buvtwdt3X9ENXF9t"
-    "dFPmjTefzK59P95IrsdkHNNw+87Lejx1XXhb/n28m1sv6QbOjVoOgByPjY3Xhtfe4BwnbmrU"
-    "I2yMQ8WUTB/WLTRspRrbZq3mMhnNWD6S6tnaJ+2MXfkQYvWpbsYhD37hhMp4YlYWv351S6tw"
-    "u8OdW7f0iFPvV6s+B9rMv4+zotUlqacxgsMa+68O9fiOlSW6B0dMNEbWCdnxyO9IefZOscoF"
-    "MquJG1r1q7bCiYqzx7RaJacKZ5ZHs/S3OBWe1TI9ohQ9ZTy6hIcdMMmnnaIb4EhRa9bLcA7r"
-    "UaP0RUnpzuGv7BfD0bJDIBk7KmJPPE4wAetnIvkpL8YJbWWRyOtIkrpMSmeZ4DVv1xmS5UW9"
-    "5iWqClKQ2RAyM1FyRndemZjliDJRoYaOyTtLEDk9lBQAheJBA5StSKvPdEqSyWCCypwTtwqe"
-    "g1NF8IwR1MtEp3GMVDp07dtgSaOClRYVl8QxL8xCrkLsQb/LsFIseMFGrMLuazDC3vWUhtZd"
-    "/UTN//gfvnXn6u/+7OnwV3/obLhzfRj+7W/ZHD72SlljrOVP/srZ8L1/J1bUv+ubN31S+1ga"
-    "qV/+9NnwF3/gVL9POAx/5Bvj53fmOE+T/xfkZP0P/8HW8B3/1YnOLhQlOxrerdD1H1RwP1no"
-    "LNv17RwTVrkniaY4UH1f9gDtkIqgbF/EmWda6EMNmBpQlPXpHld3hUkWVnoYYvwJjSbmEtsI"
-    "ElATClMzID7xvB/NuKGNg6jRBhaYI4iUslQfomQf5cpM8oJ6BWhGbuTwcIKuyq2EMnIWKsza"
-    "rcBNo7Kj1bFSDUUJPfjJdopaCqKbHrdqNg5XKNuQJ+0yM6SKNREWdjgW8ybBKPO6Q7GllRFu"
-    "sJxnVbqivB0H3UQ5KmFf+6TeuPf68PgeJ6jroE/tuWLV6lD7sK7pTbMv/eKXhy//4g8OL7z4"
-    "4rB38wU91ruCW6NVJjkT+j28Q71JyCMvzrja3dVqlBwm+vH12y8MH5IpNyT705/61PD6G2/4"
-    "R59ximSGaEQ9w7qmH93CKcAh2779knXm8eGmyrY3dITDfTl6+kX4sw0dKyBny49exZ/7/IY2"
-    "wWMq6hbNh/3CFljO9sOG+oCDMwccIq84ipYyHMUzHXugnPHcDpLByhRvRWqNaLiyI4dGK1Z3"
-    "dbbXCy/ckIN1XXvKrovPtlb69Gal3szjmAne0Ds9ORCt9kWJ8lQHfRLQz21E2yuhZlGk3ztk"
-    "r5QyJ3KmaosA+h2zyd8rUGDJDVLd2SPFI0LXBf2kz4YcW47BiJ8OUu9y5xCenKrjQ21/P95X"
-    "Gc5f/LwO62w7xpFsbIIwtQcrXpylRV853pGDpX1wfPwlQfpfuSIb6ciNLQ58pQ6itd1VRpsq"
-    "6wCsBSoN/wrLySo9N57wnWGarWVlgXSotvfcVzrJnuaDWi10OsIos9C70Xr9VUy/cRlpeIj3"
-    "qNtYQb6Izr/YGp3LLESbjbQUjzxnyAvZ0mehaAaSDFcLO0SRaWUXB9UZucBW5ENQnxnXls02"
-    "gHVybEWRAJqC+5JSpoctpFHT43eh7LkBaSxp4Xn43j+27Og8jZ4/8ktnwx/6c/oCx6Zy8f3h"
-    "XzgZ/o8/vT3c1su+Ff7pZ86Gb5eT8wYrSQo/+A9Phr/3Z7b8Y9ABGYbX9U7Sv/YXToZf/aeC"
-    "aOj+rz96Nnz/f7oxfP2XLbRFEV0i/i1fvjF8z3dtDn/0u7UlQvotNe0l2LxllHGVOlmt6YB8"
-    "dVUflgUU1ncm9bLqkL191qRXBkrqYBmiyTEx8uzKV5MxQBBvOl2aW9UYdVQ1IFNfqAmhak7Q"
-    "VMfDMXgHBkhgIahBIqH80iBbEk9nWqr/En2zaSfO9Zz1Guua9QG1Jre6YXfk04nKCjLdr0oP"
-    "e7i2cNRHEP9zodSVTjj51bBUT26OXjUSPeX0Ld9stReHH2R+pJ+3uf/g/nBPG9Ef3buvlSwe"
-    "yx0OD+8/0iSxM7xy9+bwoVdeGV58+cPDVTkTW1duaFO5nBROBxePe69/Vk7TG7r563HStVvD"
-    "nRc+oEWrq74B83jr+o27wwc/LGdIjwtx9N64F04Wq1q6o3t1a0O/Cn/t2k3z3dVvE17fuINn"
-    "HDy2P6GKfl6OoBw+3exxItgPpHucAybl5QIcExwVHNgTAcNC3CgypbrjVIYN+hti2lF8POx0"
-    "KevGo0e1lRysTT0W3JaDdV3O5U2tMt3WK0HX9UPV20qzrHNNq3Y7V+/40eDu1ft6AfLTw77O"
-    "9oo3GvUITjg8DcSxrG/rPLrzRytd9B3mpyeHcsrl9PIG4JacJ1agoo7Q4mDxhqUcLB3fsMWm"
-    "fG2A2JSDt7OD1tQXLjiMcqj0mPKJHD1ozrS5nceRWIbe54352EpOmCllH692qU3YK3d0JCdM"
-    "bRQwVtNOtSqptyL3drWqJkly6DZxDAko6Bv0gl3ddwOtrkv9tMrebBxOQrVccKm2XuQ5QZ1k"
-    "MKOD9VzQX+YzTslcXx8Qn7eQyje1yC/oiQ0WwI3sTSdmtn7TfEbCZ89x5P2mUhrnf/o7N4Zv"
-    "+tocH2+KSRD9wE/JueKHmPMg0l/++DD8f//sdPjtXzXy/uGf17yqDeeF86ocrb//C2fDR/V7"
-    "hhV++uOnw8c/IRy9s0LQmdDDD/70qRyscTEhSp7+yk/7/Mk/cDb85/+9Osy7tB9rZQxS9bH6"
-    "0ZeVr52kUUsQpDO35GcemDiYGOHu5GVHU+hiUpEwyZSDASNKg+sYA2BSp5SYUDihQ+R9h6FE"
-    "TJrB4N+4hi3Mwwp0eOI5fgsMGcaub2aW+vSX4jSlDJsBq7q3+kwRx3oIbtukgVr9wKcB+HTp"
-    "aJMAZUEwUMaYhd+jYBMTJlCIOBw4DvXYiRWrQ21Wf/Twvo5TeM2/+8eBoZxv9US/HRinfvMa"
-    "Lm8K3h2ubGv/jW70/H7dtpykTR77+Rt87NM50Ferhw/f8CMlHDYeVd194YPDNf2QM/t1WO26"
-    "fkuDWGlWbDb/2Sd0bMNrehSp85j8+EoOgZ2LMx31oMeOOiqAM5iuXb81bGgpfE+OCatbpyef"
-    "HF69Jx3FP5ymcJZYSeHkdDtHdvXl7ksQflXYOCaQ3rnyKpEcMretTYZjEr0MvOpurJTxtt6m"
-    "nJW9LZ1HpRW1K9q3tLt9IJ1Y6dHkJ+doZ+em6qi3I+UcssJ0/dYbdgJ5vPaZz76mxhBv6eO3"
-    "/CSPvVZ2CLX6dqQT1nFiNuRsYQddHXCAzuTkqMiOFRWieXF0cJbc78R0S3Xn9Hf4EYAj1/6r"
-    "dA647AGxPl75VhJnDVg4bHIAxYs3Ickf6m1DViT3jnUulhTweWVy5q7qcei1G9e9F4zN9e1b"
-    "I3qLvvq0NaHCqY8T78Kl16MXb1v0gDXptfT0HP1XfdeQeyyGMx22WIu3WCABb1fwnHgB/wuK"
-    "L1JtPTklb8YeJXE958J4N+MzHUH3+37XxvDHdDr7swj6jjQ1l0xnWMd8jsPQW8HRPDIxu3DY"
-    "H/qswr//rVvDj/7yyfCD+sHojXfwdxSb/ktdat5VlPdWsTZwmRRlrTkeTBtOk3BOIie7FQzg"
-    "Zs4NoDQsaZmXDvxNW0cQ3Rf9WAUdKxg3MgX1ZJZygDVOwPThRggQPH+URRf+3CHMKHUxanLp"
-    "ikv3iMEd8ZVZyXKjKRqXX3iZ8XMtgmjChzrNA/ZpcMmlrpWnTCFr2yijmBtWglqiocxrGAU4"
-    "B4Sicxo+srNu2LwFiGPDDzLfZyXpEYdOHupLx8lw44Z+ikarMo8eb3m/FGeF6pQlOUxPlL+v"
-    "R4f3hk3t97kqXrHCyo19V3uAdF6SnKfHnJN1wBlLj+QMRZ2valXKxzHIkWB16wMf/IgcCTl8"
-    "0u9VOVlson/Njk7sfbqjtxKvb97yI8JdrQht3ZTzojrhMHAz3/rk5+RkaW+YToqnr+BYUddw"
-    "rGVXPDh7VmkCdy78lt4BYHVHaOio4Ee4TgkmnjgUhOqPx1oBuqpReVWredtb2ruEibVadMZJ"
-    "6FduDnvXXhpu3f6wYvakaZVKDta1m3f1kcOloxBOzn5RB6je0x4t6S/iTR7piUXUSY4Sjx/l"
-    "wF29ojcr9eblsepZjwF5ROiVLTkzMVA4nR0HK/ov9UJ/Vta8+Vx8se3ZmXQ7Qoq+qSJPLwqc"
-    "8dIAdZPNWOPyL/kImfriVG3v8kiR0+GV12Z43iSl37BKhUN4Qz9keEvO1Q0dt7G1qSMecMj1"
-    "wQkt+yJvMh4W8uBYSSee3SVqezl+cx0vRzViYWNVorVD2Hwsn6QCeQK6XOZpanQ5jiMWfT/6"
-    "f0TqT9RnRHgbU2+1XtBPNZ3m3kbVL2Ith+XDemPwz/+RnIcvwr9E+VL3mVtwEWeGNMta8hLd"
-    "JVRaROH73Xd/5+bwjXKyPsfxDc/Gv1yUtQRkTpwEZVdgQvAm94aIBeaE7lxL5mpUFyaK2iqR"
-    "mehWpUtsQFS5Im4Qkwos6hqV7PEq7bfFdAP0zV91BI4TQABWn5A3UdCgRESbFoJ3h6skN9/V"
-    "KlKHDq9xWEr0EsZyZEUHRddc9RiLx1QgZV68+KeuQFqZFbVdY/LvZDacjqWYAK4agF3pEQtR"
-    "TJpnXpHY1+rUAzlVcQL7Q++12tNN/aWXbg0v3rox3NINFOzH2o/12c9+dvjkpz7jNwgfKf95"
-    "HRS6c1UOj1/X3/E+K95o29u5NtzRRvUj7cHidwXv6ydYeHtuY+OT3v/z4isflON2V46YNm5r"
-    "JYy3Dj/0kS8ZtuV4bGjV5dXPfF4raOz14iavFSH1KcI17eXCeduRkzVoY+dLH/giO3HcyLe2"
-    "Pjt8+vNysvKBP85Jktme4XRU83Lzx1Y8HuSGGPB4jIYkwdR0phFvEHA4WCXyY1V9i9jQqtWe"
-    "VtVu3GTv0dGwe21vuHLzQ8PVO1883Hn5I8ON2y8PN67dkZMjXVXPIzkdu9qndFUOF6fU7/7/"
-    "7L0JkKVLdpCXte9V3bV2dfXr7rfMm5XRCO3jQUIL8ghLQoiRsDFikUJWEDYhGYUIy4hgQJbk"
-    "MJYwCgNWmAgZhAzGLAYLRoDAyGgJI2kGaaRZ3rx5S+/dVV3Vte9V/r6Tf97731u3+lW/1/3e"
-    "yCa76/75Z548eXI//8mTJ9Fh++wLL6Tbt+5zaEDJk7jRX0PEdMSdGUPD6FOcP5fOo8/VTb4P"
-    "0N9a20CnjbEQ9xtKD0xbNDD9zH6nyQa3EEOHkcZHyBd5OatZDPvDgYwVL0okd3dhUpGUuYzq"
-    "Ypzgtdx+JEWZySMU5RtMFvSx/amkSsasG3pCyV26qHPrSmzW0xFMYi+nGsOkRuTAT+m3Vvpb"
-    "6GKc1vOPKsj1UA8+1d9Of5TL9I7/gie/n4rjczoit8+b10rmVOrt9VRMK6WfSzVvd/hv/zD2"
-    "AcffSPleT518bqS5iArBf/OHutN3YSPrzXaFdyj5OmxjnisB1VMLhc3JqQrMA7l0TBoPmFD0"
-    "jXbMjSlMJ4SBom2SaO2iTQo6dgvw+i8mTPONCTVPyhWb0IgP5WJFW5UTNjuZJyYkJnQ7YZCj"
-    "GIEFI+NrTtbGCSPTInNUTCZ0s6C4HRR5AhNKtgBblqCwwEZafoJmczfD+PWl4SrhRuP9NI+Y"
-    "2p2aLxLpYtmcwM1YatpcFLYZFu1k2kbdEGeBaxN2lCnCjDpJQeRL1aoIbqzbPVVFBE3WMxkg"
-    "AmY7cHsDpes1mJ+NtIqS+RanBLs4jj85OZDm52bSDIZCx8cmYJZgoNgG8qqVcRiuwYGedOvW"
-    "HfR49tlKXMGyNzpGbN1ZxJFxLm6GiXC7sH9gDOX3i9SIx/d7UUi/n9a30MlaAtA2pKJHx8+B"
-    "G6kKkq6uEexnQbtbYj1wN3fuaJAUDUy/ekgiczM5NcMpvYk0yPbigPpcIzIL4IeTUGh1mG6n"
-    "5VUvg2ZxZ4tOtfXQv7IJ+JNxKPXme/FHWxFgvM73zFxlJiw3iQY+lQjtU150q2SWkF4NDLo9"
-    "NpRmLl5IMxeupHFOSY6eQ+kfnbQ+lf7dOgWfeUVfhdaZC88QPw4zJLP4QnrllZtsvcJIUhcM"
-    "4HRhcixduTwLkzvJnY2DtNVWun33XrpxG/02Th7uw/SoTxZ6WtSjZfQSaY3bgyBoNyz+bHLC"
-    "rOM+mJ3eQyRVSOkGMYEh0xtSsSMu4YZZUoqonlVIq6jvHS7VdvtSZX4NkkY9oMiuBO2AfYQt"
-    "touXUOwYwPBobD3A/Lp1qsTLEWhahh/SuarebXr+BcNMh4n5Q5KBiR/K9LjdqXMfGbXkJm1B"
-    "RysFD0vfAtmB9jOnbUH01r3kIlSVQGXoK/OR/dfylGeuvVqFmTjSEMb/KLtBdoAqLkqGv6Xe"
-    "a8UN/LX3Tt6StpZzRtsGLJww7XBtYE/+FYn/f/j+rvSNX5jnlief4edmDlqp/9u/dJT+9a9A"
-    "35uoj9U+Bu2Kue+21hPf+ad1lloXcoaQkZFLqAW3onq8b2ZTOr0DqUk//iAjMxwxqRKZB2hm"
-    "QKTEAazkJpgmS+8iy0JnuEyW8BbGisrMI7AiFta4KK65+ufDNC6E4CiTuCgqF1WEP/M8RlTp"
-    "osKKv0C3PguaAlVSl6fQuXwlRMiSqhVXDi+Y2uNq74BYjph8okLBRyHMp+TSgK7QhSRGWJwt"
-    "EmWlvjSVoETJrb1NmKv7S0txMrC7+zBNjA2m6ZmZNIW5hclzLOxaVpdBgHORfZXBmp3n2hoW"
-    "ZqUyd27djhOFt27dCkkHSyjbRjAILOwyP5nRginpRYIDI9F1uzs9QONybW05tuGO2GK08Uaw"
-    "eyWTJFOo39ONlo8GDKvvmxg1hXMKhsLSOE31orulDpfSkcGu0TTlJE5cD+/9N++kO/fWw5Ap"
-    "iIPJsKJyn8j1ZteJ+jQfnI/wlnfw+U8GVUmV/ZFjvCSy33JicLAPCdNAmuS89Qx1dg7Gb+bi"
-    "U2mMk46DnphEZyxLLy2XyubUDUymCv196jBVzJfSWmm2/Deu34E52UNiOMbpzHm2FC5grmKK"
-    "LdQRmK91rNd3I53zwmu24Nh2hauEcpgm6tzDBUqteqSbMsgQ9yKp8mSkEq08VMjLMlCufiRv"
-    "IyP2KcuDJXfSeuVRrhd0MJAcdnWhUN/FBUXQm8edHz3Wh0+v4jlIGO0gjR9XGpFdib5hfdoN"
-    "PcgwOIjmLHoXblPKXFILAW+agLLeSwKfVf3r/ffura0B26VqpSAk2umRSRLD2VIKqSvP/JZ/"
-    "Cy11TJ3g6mk+J/wQyXSQ/tyH/v/NXNkWDu0//y096Ws/zhrUrj/2BBsrzzVtGdh5qs4UcyOv"
-    "zqZndPVueMYkrwssU9koAJRGCDWpTz4vhouTOAtpbCngC4YJwAzj5OzJJ8KZtBuSHxYTXWaw"
-    "nKDzFSPmxVIfOAqDkQ0y5i0kwzRKafKIF94azKQGTr1NV3+r+5sQdV87RHlvPvHJFJqoWiz0"
-    "l/g6rgqISGOlU28HSBC4qEV5AqeLaMbUDh3lz4hynqatMt1HQXkH6+teT6Oe1RoGSryuph+F"
-    "57kZtui0ZXV+Cp0abTi5jcXxfpgrTQ10s4CqEzQIg3AehkGTCIqM7mCRXYOjSjFkaL1seBIm"
-    "YQIL7END40hMBpFM9aQZmQwkTDIai/fuIDVboj+gy8O7W17DMBW9wlKwfnR5JmfmMtNA/F0Y"
-    "OOlcXnL7ib6EZMXCKf1S6V3GTD2u7lktjqMIDxNxdHg9LT3Ajjkj2bsLVYbPNZEZ9apK4pHr"
-    "teqX5J/fbYvc/6IP0n9DEkb57N2DKHXPwwTNzS+k2QtPoWs1DT1TMDAyUW57wlQCKa6QhInX"
-    "k30yJ1SEff74aJh6spwyYEqXetP++jLbin1cNTQWuk1uQVrGESSJcxcWgoEd5PKvO7cXkTrC"
-    "GMHkVCpjmRGmvuz7wdA5Dsw/GEPLTXn8oUOYV0iXaBOjrbNNGCAv4PZuQiVc+tfxq9DuFT9K"
-    "v6IfUjIlZ27FbnPkyDso99huHEO3bGjUewo9ydkLEzkME5pPVEa7ouhvHwjGs2qA6O/QqCv9"
-    "tIp6Sx4dx99bQslbnyk9Jdzp7dKMafra6T4ZU/C2Qz7svaQpz4fB1uOEf9Q09fRv1M9Of/qD"
-    "X9uV3rFwsh7eKO4TGCkow7/FxdCqVUAM/zaYSFODaUHwmF/ee6Ur/X5OMP7tf8F8+yYpvDt/"
-    "151zUcw2VkY4Z3QO81RvnzsP6JMwCXZiKuQ2uzRhEeiPfr+W8TPxx2xqGsJiAcuAES80a1F2"
-    "wgAc+APeN7Hl3woqP6w4YKyucNKlh0VCcJa4HP4kf8lKWq2TWEjwn+YyPZbvDM6yCyY+y2lp"
-    "4tkhbRUedct2Tdaj2WdBXo6tQBXZvTtQG1Uz0xPp0sJcmp1FIRsL7ANseym1csFVF2gPRW4Z"
-    "1n4kUEpftMfU24uka/YSC24eIdeuX4NhW0PEJBPNNhJt2lhkUXSXARrAnpXbhdLvibTFxbux"
-    "/Xfr1rXYkpqZe4ptNhd6F/4emLPRzKyQdy9/129cjzsPl5YqRp02PYDhG0XiJc3m54J+7hyX"
-    "Ybk9BQPT03Mn3b63GdtVR0dZwhMdIerRKsx1aD3KBOX3KjyqtbSjCt8oelNf/Siby4heffZZ"
-    "TExcTOemL6SxMIqKtE+mCg5CpjF6mnirXpfbTqQ5T/PrV7rDs0cm0XLCwKzfu87R62UkVmuh"
-    "P3UAEzqC2Qsle1Mz83ECc2JiIk2du5Vu3VhKtxZX0hr3M7plF1IrpIe575GTdMTsmfOUqOg5"
-    "5CkDltC9GoTpMcx3pV3a7Nrl2hyaMIbNHqcSZayMy3pUeUzJhLm1uO0Bhs39OPwwOroGo6uO"
-    "2TBtMYRfg6R++OQeHhboyU8dukp8bIXEeAlP0Cc1/9799qgB2zW3V9P324PyN4VKxhDfqulP"
-    "fpC55Qm4/+Ad2JlSJwAmzvE6NZvS8xdbx88XP8sHK3ax3Cxw6WA6Tl/wdCvMO2H+JjB8GuYc"
-    "nAb5CHr/21thHif5341B1P/jlw45kATWJ5fNqSTH+twSa++F5/ij//HXf/jEosokftLJZBBe"
-    "xZ1IczLBa4Z0yqU9UWzp2dLSy18wUxWQ6WWkgpliMg89KQKDcSocpkwEf7EwsOBkVy0OvJSK"
-    "cbvGBcHiuTVhx9FpwNKFy/iyIFh2GY286GRcpT6ijlpauCpl7aG3eo08yvtpTwsuPSW/0gYt"
-    "SAJThol4E1iGeOQ6qEAiOuikHEGHz/DnZ4FrPIlTGiKMFre3t7gzEFtUXrLsdqDmFzbQudpg"
-    "221k6Dg98/RCunTpEgYyJ0MK1MfWlgyRW1Ubm0q5gN/gKpuDnajTkGYhnQh9HpkabR9B2Cb6"
-    "W7tKMlDEUVKpLSbD+zld6IJq28g8DXiykKfbTkqldkijsrXMnJIfmbY+JToweD4HWJBd4F2Q"
-    "lZTsYodLHSSZRk0S9CHhkcFS6V38nh4MKRaMxjb6W5sbbnt5/5/1bS1V9SeDgcv9qPhz3/Et"
-    "913rUvjc386jF/Xc259Jz7/7Penqc+9Kc3OXYa5mgyEd4N7EAZhQBDvBYEafc+/a/kD/9s8G"
-    "BFvQEfjp4rH9GjQPgMd7/VCGZzZcW7uHvbHlYA4NGx09F+1ju0q61uB3OL25jtHXfcaADGBI"
-    "q7KIKPKQdv/UVVRy1WAigxCRZFqsh4CBRvW6og1pj+iQTLa2Q3/FTDu8dTJOMldbbDe7XbnN"
-    "bLnHach9bHWRa/zlsVyVmTTxbl3CrDXGR2AzMnvq0q0S9e+fb20N5LFgO3Zy9qH8Zyy+eK8D"
-    "G193rW85xrCHhZf49qep62Ht78Z9enkufXzxUqOPCfNmOKVXf+B3daVv+4qylj3eXJ+b7wqL"
-    "8HfWjtPzT3FS7493p3cutOY1d64rPct37fWV47QAA/ZDKNp/4J2tMGNDXel3PpvSq8vH6fxE"
-    "Sn+a7cwPfWkrzOOkfBpF/4/fPE6feom2Y3550u6bnv3lRh9t9NUOnSZ0sJilMj12WoE6ODt5"
-    "uALbAaYECVkGkGH1wRDhDh5hjHwtfMA6ibshGDpVvBfcPt026JbjFid/4lNvxAk3MjDItEzC"
-    "URHqa5h55aok5RVcWSoRTJuRUJorMIMEriqskQiPZREul6laMRoAhEZE41HF5MAqqgHdyRNl"
-    "I6IFtl6QWiJp1FlnUVdRJ5YlhzfqAnoDr88qNg4HWFeuuKx8prDeD/fcGtvJhkKxvK4O0w6n"
-    "zzaxxO6CuA+TYs8egvkZ1SgmJhPUqepGMuV2lcf2tzEU+mBlEZ0ptvLYFlPvKraBOBk3NDQW"
-    "tPSQfmJyltN2tgM6RK++EicQ1RdD3gOThp0o6NPAqNKlLhigQfKaml0gfxmulO7evoVR0410"
-    "H+KjLihHT/d0SHcs+wDX7kxNXYg+IlN38+b12NpcXfXkYR+L+k7ohkFA9Afp7+8ahhkZScNI"
-    "UYbYbvOamX0ssUtLkeiYG0nCBUNvX4MRCZtTORjmnRNyMHpDw/1Iq2ay1GrhMuVBiX0EO2BI"
-    "+jSroW7a3t5W2oNB8a7AOPUIA5kZHOrGdgG/jJLboKH4jt6UTFcXjGBYqeddepQeajNLKeDi"
-    "zRfS4L46TjtIlTYDzrbzmqJ1GFqtw8towkrzR+2h1I8sy8xok6zrJONl/rFNCEypA+nRb7e0"
-    "XzmWemAQ+3u547AXZoktQk86ZgYNu/MwzmWcUp0otNNHoMNwtxPVUzvoQ3pJbkf0BRnaXUxm"
-    "dGtmn7ysS5XnbWPrW4Y4M872Z/5Rz/Z//6S3xZWGagnkRULa3Wmw7XC+R/oTuXWALPlYWc3o"
-    "Ms4bIdLfeDmDp5F/SdWK/wwYToIUVCdjzhRysky5f3Ss61plRLtR93mOqmdlm1bv8SwvdRhH"
-    "40lnVRse8+LJ6Jw7eWa0TQyRpg7fIKAe+IT9EKFA+zu++skxKtbPd30NJ/P4e5j75i/pTv49"
-    "zH05TNeX/8DDYR6W/lHjvvOru9LPYBerffV9VDxngW/v03aH9j7FkpUNjeYh7JSky7/tmYiw"
-    "HUE7zOmpRQveqlNGDr6zGATOtiwz8Tkw+524qbaKhkJHfPnKSFmSPGxECViWDliuJmrKJ9Mg"
-    "KfGb4ZQKFHzmFWkBEEaszRRVKssg7cJWeOIhcOVpeKv3KuJ1PiyDzKEd1YmlWaaW/AO7bWQF"
-    "ZNotQNQBtEbqijApj3+WQ6y2Q/aRT168S16xiMFYbcUW4DrM0Up6AIO1w7YPqxtMF5czw2Dt"
-    "sfCNYOxTPZrdHa2uo1vFlpwK6jLI6vREGVh01dtSIf4oraRtTQSwLdQ1pWFJzSW4xdWbxsaP"
-    "EnxHSKlu3Hg1GLmlRRd+tp3AYT2ok6WkyYVcZmtqep483O47TkuLizCBa8GoOF36N3EeJgup"
-    "kNe8uJU2Po4M+5JMehfX6txny1GFfEw9jKHnVUnIlFoeyuDAhOxz+s2Kii1HFPiNy30PksER"
-    "fYdFvarM8qBPQhPtYtQwjNUUp/ieuno5LVx5Gj/bgZySHMehascAAEAASURBVERB3fReFeNW"
-    "3h4MrUxWkarJ9MmMlv7q5csqe6vsHkruSPEGYVIHB7D2Lu3Qpn2qIfTIZL7UubIvwHKwLXk/"
-    "JJFbSKvEuU25lu/fQ/n/LtIrGCEMjio1gp/L4w76leDGMLMn2ZYxluw1vtDnooflrdbQi6zG"
-    "iQxUP+YXhjSVQfl6Yf58ZsV4y5tPCOeTh9rEIlMYKc1yiDeU7Km4aHOyCUX5LQyTwm1ZJ/tc"
-    "nZSnVLYmB9WjzNJMmVRxyODaNkREDy8/ZcyX9/K0n7S61nStcR3e2vLpAJGDyMac6uB5rmtL"
-    "IYB1eRYHXIasw+Ovv54Fz5OGsUqlibKFFNbXKKPzm8GE18rs2Im+V8FH0vg5SWgDdRUlWL3+"
-    "fI+/Gv4KtPEoLV6nwcj6e93fSPikPQyN97zz5Hbck872twv+L31bd3r+6lH61Geh+AkrP3Vs"
-    "/7Y+6apzkoy2jtdI40Bvd8A24onTr+s4UeSok7+Btg13HWmVojHooENoCyhJAVp5pEa4vBjI"
-    "NGS8EWa4cIRFevGGxyUnZ2h0iWUZj2i3SPJiktNnHCbGBb7sFTjwlEqogt/4QyKbrvWtGZ59"
-    "ZH4KgGTlUgqZfaWT5Lq0nEgXWPxCWRr9G3WOtrjaJswuwFQ9uH+fLaYHHOjjdNcQW2+jLpD9"
-    "6Eq59acFcpiA/QGYlRWYhnEWfLa4YAJUxPafEoZx7gvcBMd9rkRfh2nb4iZQGSxpOD89h4QI"
-    "hkDdLBQNvO6ljwVaRfDr115B+vUg3T28E0XMdptIg5KATJYF9zLo81MLlE6pUm+6ef3V2M5c"
-    "QgE+zAGQh/pUXUq+aDslX56262FLcHpnHvqwP4USfWb0GBpsFyox2+fuiA0UxT2tuLOtLhGM"
-    "lZKpqGt/mn3DfCxLrlMYROhX8qZxznMT4+ki190/87bnsc/1NArsmJ9gC08GiARsiWLpHl0p"
-    "9dh6oV+TB57aU6levNLilT+23gFbaNrAGlMJvlemlnsJkdp5GfMwtsAGKYdSLOtBfTeEdmlm"
-    "4Vnw9aWlmy+yFUg+O/dgUJAawWRtYbdMo61u0WnH6uBgkDivCtrm5CZbtm4JyijyZ3n7PE3I"
-    "P0KA8YPGJ9WCdCvDAQalnkBU+X0QBisU4KvxFKcQgdjddRtwnzLuRfm06A4C8DFH0v4ys/0y"
-    "aUi+Ig1xhyrNI7kKqakfFOTrw/ohcfQHJXsyctFGuaEkqOHyODYhQVU75nZrgFQeAZrulOHV"
-    "AGj2iRJkXyj+2tN64LVlPrHf1EAa3o4IjBVDM0XT10iZPadGtMF1fD2Fpo6wjxBoWaO8EOf/"
-    "KGMmtBTXutTvPBRtKXwjkrwyeEumJajlWdK0QHZ4EX8tuJHXa4TVop+o12L8gS9VMvxEs0lL"
-    "bA9u8C35uB0HytPU2GuNoNefq7sX3/wlXemHPlNW/teP67VS2jfyCBbSXkO5ThTtFCX31m5m"
-    "8iaqExnbKQviyKe8tEHWe65R7e8N8IrYxnv2xERURlyJqyapeOUTRyobAzX2KcoElmkSR31C"
-    "60RCob69E8cAr76EC47yjPzt/bgn37SRzRv88TsdevlvGYqOWSmP9/ztssira3UfSdAqpwM3"
-    "YIYOWdCnOYk2f2GW012jLGTeXXeAHtZiunXzNs9VFu51pEdugWGFHeVkF9UBJCsueP4NY5dq"
-    "eu5S6NgcHNwgj+10786tKE8wxlwLqORLxmewC7MExFxioZVReXH/07E1qWFSL4aW6ZD5VQKk"
-    "Po96XkpzRsemEgfxomy3br4aDKJ6ddLiZJ1PIyLpiTQ9aZw6GEOaJfPRS7/xme9P5IQk22he"
-    "zbOyvIQ1eOoB6dzBkdIVt7pkoFzEpVIGhNaP+syW4l3s/RsfH+Zk4Fy6fOVqujD/FMr8C6Fw"
-    "r8kJadjZ9oDACn8PYntQi/TqR8ncb2P9XulZ3KUIcxF5OebAbPm9imiU04bquWUDrOtpdflO"
-    "2hlaj3ro90AAhGp8tR9L8OdnLlOnfWnlzstp8faLcTBA3Sctv6+vcYH05h7bpW69meYIOnqw"
-    "ETbE9hyXOO8iYQL2iDoia55Kh3L5S99RwqYE0eEQY5FxaTn6+pVkUk/4o454yiTnehNv3gYN"
-    "5spWJ72mNRzToX/Hu3jiNCJteMBpw2PqJbcT9QN9kSkJlWhKVwjo44m3g3NMV1n5wOU2rF4a"
-    "KaShOOtd12nxFS7HF6iHwFKWgid7c9pOeDuFVZjzo/oNOpukNkByb2kBPftL1dfOnuBskJap"
-    "lCuekQ/1ZtVRBotRajHaSbRUlH2gkbZR1spjp+vgSj4RVSFuCaulsW9GfUlKhc/2yV4DM12d"
-    "c6ohetxeMvQj6YOfZ79+Mu5f/eZR+ss/c5R+4xXvKH38eWA7Or3v6ZS+5xvYOmzT2Xpcuf3e"
-    "z+9O/93fZ37wW6vqFo8Ldx1P61jLGdXniQJbSbDao+qUNbuSoc23CoW9r7ia90RQW+Jmpy2Q"
-    "5QlgO554b6dR+Bpg8bJF5TZRTORCVAuAX9Ux6dYydgA5oMriIEy8t0/Kjq4KrsAWak8+raFC"
-    "zMnYRw85DV89j9IqhhV/yakJV2KbIRYrlz8UktGLOthXmsFW4PJ9mIplFtsNFM3X0hhmES6h"
-    "9bjAKbfJSQxeenILCckRUp5Jtt4m2Fa79sqrmEvgMmYYstu31P/pRk9pH6kRJ9ZgGDKTlcJo"
-    "JpfYwJz0c2rtlWxYcvEelGcG6PzUXBrqQQIDszTAvTFugx0vsKDy78a1V9MKhkiXUK6XZv9N"
-    "zWxzH+Fsvk8QvEqFxqBJHlsF60XMPmxhSuLu7ZuxJea226R5sH3mvXdFSd6uccSWk9tOKrPL"
-    "YK4jbXNbdH1jK62uoyi+xUkVBq+02k3sM42JmLzdEot3cI1y1cu5yYl0+fLldIntwJkLl+OE"
-    "Yh/blGJQwuTdisvLt2FwtmBo+tO58el4alRzfX0ltmaPqEN7vwZEZWCU1By4fcjfDuYsNjdW"
-    "0wTHeobHJoNxUxK2BbO2zxbamDavhmRA3aJze9XtdiRC6G0hc0wPkMg9oO4X763R7tno5x75"
-    "jY71poUL59MCxmH7kL6tcRn30v0NrL6zVYoET2Yyti9lKmGcSp+y7ME40Q0dNvFDvupGKZGK"
-    "movxBbMEl6ZuGfwQ+LK/r5J2utUc7UH97rg9q14Ypj9k8EzjAQb/LOPujiYpuF5n1OuC0DcL"
-    "aZntoDTN0Vik1HlMBLUQXNrN0Bg1Mc4zzOv5jYVZnrHdlcqphdt3i8vfgpG6IqTE+FoqshnW"
-    "2QcjKkNfw9uAsyLP6NohcxM2PxsL1cLpL886+nYc9Tj9BWf4qfNoB58RUwEYWZyNGH3Mdqy5"
-    "xkv21NuzBtXqBTRyis5ZjxJHRXkdb8CTJsKktUrT8NRxPEE/c87bn0vp2QuvVbuvj4a/8s8O"
-    "04e5PJmhxZcNf08gG4Tj6V/9akq/8PGj9EN/LKXv/OrHzyy+nROPz/Bx/cJLlKHibvA9dld2"
-    "tTLi3CmYbk7UW++JTknHaXT0SG1NN0MyfBUmbHtHYzA3mRDTVS0lXA1ekoKs5k/kln8y/hKQ"
-    "p2+/XCiBOIwwn4I73qsfJVlMtlWuTVqAN12E6wdP0Im/4fTX30tEp7ASV3sGZXm2rIW+UW/1"
-    "RZVLXUNmaRolqsKtH738lHqqntZVo8wBAoxFJ17WRb2oPXRxXKxXYSjUYYotJ+wjXb40k57C"
-    "7ML8pat5EWOxdFvriK09F0btUsmkaFKA3bx0V0OjMFlKOOIPiYbMhBcym6WMxBiK7W6DuSzc"
-    "uX0jrrBZXLwNOdla93nqXEmO17TIaE1gtkCleSUx6aXPIFVb42812usAaVaUF+RDfOa51edi"
-    "3s12oHmor3Tj2sshyXJRtopkEKamubMQmgKWtOo/7bEdqO7WygoW4tkW3VDxGz2xbaQ32zts"
-    "mXL9zDZbdqETAo4duC2lOypv97JV10vfU1pz7txoevrZp9PVt70dcxULIWUbwGaE9eCfjNju"
-    "zga6Tyjkw8gNwRwMU14ZNqVW2zCEuzAPcEQQRs9SQiPdFYOh7THzHJ04RxqsnyMBsz97gfXE"
-    "5DwMRw/0L6Y9jKMenTuA0ZoLvTLDe/mTuT0C9yEFUSK3tLRDOXajXJfmx9PVKxfSwvxFrL7P"
-    "AkubImU8Pr6JnaoHaXcD5o6WKxIpOdnQkyF/27vMET79RzB/SrqytEtppHQUXa09GCiV26Md"
-    "o3VoTuiKDx4ZBtKBir6QJRjm5clPtwi1RwZ0MHsj2MuanZ1DAjqMZA8mDMOmMoEeqMhjPbpJ"
-    "0ERg9J0yh0inzv7Z7kpcgLQD5GSRMMotoS2u5FAPzPVlSIltptJXy6SKaMbX8dT9UGneJ/Kv"
-    "w7yGn7Qd84Gc9vB4Nzsbt54n77n9H55XhpFmk8cPeQRWEuqzZqwHYdTBog846GpVU+ouh1Xz"
-    "ZEFRyz7wV+kCo9lVOQjW9JtXLSEx4TqF1cHeBL90fQATCgqBH7f7xU8fpQ//LecBMD9Ja+jQ"
-    "rp0qhmX6M3/jKL3valf6omcfb4HcJtQcxKdftAc9QUc/z/j95Y8Gsn+W0JJzbzaoWV7zs8kg"
-    "kbRKfxhayhVcoxfaIWl5YapOaNo8eApOu28VL5zOyQ0XuMPX9nMigfRn8X2ckvJrxnwccMXh"
-    "bZBRQxzLknF1uqoy+WWrqygMmHi3sqoyRl0UusFTymtF6q9RELgc5hAW/kf9EZekt6c2nCWk"
-    "A7pIUSubecf/SBFSKRbsQqsLU0gRyCRsSyGpcFFT18YFfQMjoZvo4sgcHe5vp+nJwbQAY7Vw"
-    "8RIMw1QaxHCn+k6hqwUj0e0lxCz8fdRDNrWA3hoSCBftu/cx34DOkhOjW0YucrPH2FxSagRz"
-    "1gXj1C+Oq/yx4N64/lIoviMAY6GntEg3pmcvwtBNxPbfIQzTCPAX0V1yknnlpRfT/ZW1tHvv"
-    "PgstjB40aMNqavJCSLJkxHq7YbaQ1vSRoBtG8FX0uFTovrd0z2/9YBDc4gyzEFSc0pB1zE8o"
-    "sVpd9f5ETk2yhbm1nRmrfctBMxyzPaUEaV/GqrsvjSH7RnBCmZAJUa7LKLBfefZt6eLlZ9Ar"
-    "4x7B4QnyklHMCv9+ANhz1jGMurO9goSJeu1GooTJCE9ayrTKNHnyUmX3OCFgu1KHMgwHmFyw"
-    "n3jVzBZmL+wbSh6z2QrK2z+CjavZ+NB4sHwzPVi9w32Mg9CYLdp3wwj2Dx7FyUXT9PWgH0U7"
-    "3bx2U6TpylMj6ZmrV5FUXkojWOCX69ojXIvvO0qN9lc43cg2IX/5c1dpkd0zj1F7cB4b9D2G"
-    "mP1QSMeS5jTCICn11t0Pw0XbyAxlkwwwbjD6sQNLgh10w4boT0fQdojyO4b8Of/QnbZ2oYc6"
-    "COkX9bZLvVs3Nk4fGQ7DZG4cYPDWk68cwNAAnqcoZWylMcYw9AZNdqZCb4fxTKQVH4/sz948"
-    "kdbnidym4hZjcTFD1JKX8OaTSGmhbgQL2sLXhJCxDFfRETAlrAkWvpivamGBk3cx6G84yyqt"
-    "RIi2PAv9BVZ8paytCMAUSIGsgH1YiiAzfhq5nfA4FwlomizNy0hy+QMRs3NmnjPePI9520ZO"
-    "1UQZdQdQVUvNCHGbg7SIJN6bT/ueeUeeeSmQmAxw4reOve4/AfjGA6RVMipSoiqRYH3Z8w/P"
-    "9+6D4/Q/sMX3mTuUqR0UnJPDXek7fk93+tK3tUb+5X/K3IfO1ZtlpNNl12/HH//IUfqp/8I2"
-    "zg4BOVuUh+kTNzrTPzHYlf7IV3Wl3/2u0lglZetTBusn/0nV4K1Rj+3NnRHZjxi1PhknfnDW"
-    "c7WWOwrRGp28kEOqCKunLnE+a+HCnUhfYGtwOai1oZtgBbA8jcmwWTRX0VMSVM8GtDS0xxHQ"
-    "mHzCL5/nIM/hEecsQ0BIyho4rcicd2DF22mQl+xiTDgicpJcNzFJFYiHP6P+OoEEbe0ReTIn"
-    "NytEynN+bWClTUThQnSgtAodqy1MLWyp2MzC7mK2C/Ph9iA6yenyU3MstJeQYHC5MNbNwwwA"
-    "HUjm4NAtNEaIlsUNV1fGC4e7WcguKplwQeV5+849FN6X4Q/IE2bAiXpmFn0nmB+vYjnuGgJ3"
-    "N6cFIQz4ay+/CEODBfd7SLJgfFS474FhGcTsQ30rT4ZM3aWel15I9+8ts8W2SH5V2Vn03aLy"
-    "omdtQPWiZD/aPZUu2ibQ/+orL7PVtw7NDGwYJhX4B+WO6AtK8dY8LanCN3f4bSOt2trep15Q"
-    "LgevpiM0bGl30DzE0AD3/8GEToz2p2EqTT2wwcmL6fJz70gXLj0DY9UqsQrdIMVB5KXS/NrK"
-    "XRgjJDHdKHhzClMJ0jE0hmI94Up4MmOmBAemC7MQZWy5DXoIg7yhFA+C1PPfZEtR5mx0zKt1"
-    "JnjOgAvL6dzXuPZgMfXP5lOaXvqsFNE+38NWaeieIeXTKOza0g2YYJlBGN9+8+O0JO0lszvI"
-    "KU/rdfr8bZi2DdoWm2BsmVrfVm90e3DGqdRqoQodLcoUT9vTtqPtZbLypdw0A22tTp0nCLdt"
-    "B56OQQ8GuPLLSMmEhd4d4cKBMZhby2B+brHeZivYU4RzC55ihVle85TkDkr6nqYcoZ25SQDJ"
-    "nZI0J3mdfRW2sDFcc2jbrwVrc9Voy4WOuOZqGFKdAk9amf92V5gmYyLW+sLTDmn5ypxi20d5"
-    "eZZ+UMdrnPVVNUSOqvJux1vSF9LKk9Qxd7l4RKWcklcgryENcPPOiSL6RKU2cOZof00R02sN"
-    "V4m1jgvGAhtP8ok2DNroe1X/c3xHHXTAlXNqYg5fR7h6Tm3w5fVJPG3k6huaDQHGWErzfNvM"
-    "TmCwk7HNQdyHSnuwbJL++F87TL/EnXxc69nRHTPffeRjh+lf/fmehvFQtB7Sv3uZem7yOR3T"
-    "Pu5A8/voZ7FDiK4XmyR+16U/8T8fpn/+b6DlNPoZqx/5teP0sx/uSp93JXpqR7KMw4Yyc2M1"
-    "FCzbYy5fZq4qGmKwVGO31qfs1ye3CINkExbI7HcianV5sLeGnf6WB3RFUIDl9DEgasnKwK8F"
-    "hTcGVClImQ3aSSqTi/Ex2FsBSrI8SVFCGYEGSS7/Nghp/B9JieefA724XBvl7eSzQX8kqaCt"
-    "6WZGJxPVQiKvQmgVnpOCo0lGFQM0kQ0G0EnaUpRswSM9IWKPQLfBWJSV0qBf5fU2XrzrEXkl"
-    "I7uczupGGvDUwoX07DPPpNnp6ViY1IGSsVWJfHuLLcQVtg+5x66XbcFxdIbiShkYL5kBda0W"
-    "nnoWKZXbYL1YS7+FQVLMArCI9kCrC61SE9N0IcVw22/iHNIWGCmlXdeufSYue166p3SoF3oP"
-    "08wckiyU0HtYlD2J6Om73B9cJz+T7t1dSiv3l2GQKAMLqkVVYtHHnzSoTK4u0gXMLWxx0m4V"
-    "vbLl5VW2AtENg1EY4ooaJ2ltKu0iv95m1G9tKT1CKgZT0xPbULlPqCTvgjzNrLcwCxNzboR7"
-    "wdB/wobV2MSFNHnxStjx0taWbRkmE2BQZAgoYJQ/JDZInrZhsmQM9lGc7+mBVkAO4+QiNsLQ"
-    "0xpCry0MqKKntcefzJJOZtb+ZNn63RKFyVXit6VCPDCh8E2Omm0YGp5EioM+GXFuSXbDPNn/"
-    "rfdjyqfE59yUW4r51OLS9Z60vHgT22Avh4L/+Rksy2Mtf3TsfDBXYyNYfOeuxKV7d5E63kyv"
-    "Yvl9nfo6QCneLzj/Yp2gr0afsV+Qh+0ugxkSLPqG7QcZ0A9zipV2+5/ddpWfLexcebrRDi9T"
-    "KQPm1Ukyj9q2UsJpvTppioNWok8jqUr3kIQdpKXlW8EgGmds37bMKPigaWCA9iRt/trM4yMG"
-    "ewaO8WKqFlfFtYRVYyuQQrlDM7ITqDZ+7QP194gWRGAT+Qj4Fgw5PH4DoPJRHyfm4Rx1InVF"
-    "Q2ShPyoq3ipC8VevJZt4NgrRxMvg4KVGcANQBDk8fDKuzVoIqDP9VHQUcqyPajbO81s7EgCd"
-    "06xbc4++ZNYiKEja0zy297YKeqN4czdHhzSl3/XurvR73tuVvuCZrnR5uiuNwGid1d3A6N+v"
-    "foq6YGo4rQlkXNAkSP/6ExgRrayzbyMNPpP1c+vVbqB7HMwK1ShzxdQXDNYiJxd/4bdoT8ts"
-    "W3Zw1jzngdI///UjGKzTiXgbemr/5od6gnH8lx8/Tv/Xbx4nzmDlvqFI6TE0Ye6fmcjoheA8"
-    "gZY668xgVYPTFHVpTkZXfplUClwJqp5mVPp509+efZ6UYgJqSZ9Dmuky4UEHk0QJj7x5acFa"
-    "p6fub+DPA1LaXGTKvJlByTc8hfLyzImbZS0UWDetMBmyTlGJL7gbhJzqkSb/SsrIzZcOeVlT"
-    "8py5xjI9kb4Cl77SfjIQe8iBt+mhK2zfeSpuZ1vmSoVhbRGpT4RC+ngfCutjnBzzlB3K5SyK"
-    "3UhLlPjs7nBC8C738d1DWRwJgUZEtY81yQLt9TJKlVhV0Ws6ly6GpIYxycJ/685dpCtr6TYG"
-    "QIOhhpapaexmYWLANIaNca/CwuXn4kvq+OjTMICrXPx8IxZVdY2EGebuvKxfBZPFgu+x/ZhX"
-    "Keft2/c45bfE6cYBFmWPwByyReiWlNtXLOhIYpRiaATVxXkL5kpr79u7R2kQaZULlwrUe27/"
-    "wWR5TYxVLhMjI66RVRf4Ee/04/Nybmo8TU5gUHUChX/KMXL+QhqHERlBaqVNLhfx3MdgJGxt"
-    "6LcNdG7xKW3a2cl2uhIM3BH7Yn2aWMC8ggzUMJIiJUeeEtQCvrTYni4mmm6wS3R3s13Lp6Cn"
-    "Pl0EZT6OkBR6KlEnvTJS0rPPp+oOhxU8VdjDlmDGY10hDQLH+Hl1rZQqQR9K7PdufSodLl3n"
-    "8mtsknFKUWOl1tHA8GEahv5e+hAB0KHiuRIntj9hkkMqTFllqEAcdPjMdZEZMON6aVPzc6ta"
-    "Jmv0GJtplC22Ofs0XovJD3Ss9miLrp6DtLnttuBBmKHIVvXpa7i4bojP39UHSF+x4bUhA706"
-    "yKXT6uJRGCpKpj9mbbga4dUXjH4HHVIobbo8XqzZVleVojWQN9PZLroCE3NCeTHC+FIPvuMi"
-    "upZNzj/Phxki/xY0OZ9ABKrcL6tO1QAvsDEXZNAchz+yKoQaGgGkqD5YG0jqHhECF6Q3GKdI"
-    "WIMquZblprzXQOreEl3hbkSVd2iM+iOiPCNJ5F9BExDtRF/MtBGAR3+j7A3Er9dTymnuxe+z"
-    "vPt8g65irN71XErf/lXd6Ru+sCukVa8X6/lRJF1coYP2wyn7UoQz/Sg5emauNZfXLI20MpQu"
-    "kM5uxPds4DrBaOVpKJCbz4n4iGn+1PPV8vs0w/Qat6OdJsGKpiDRayn62xeuznTF3zd9ceID"
-    "MKV/iWL9X/+5o/RLv0UZ/E49RUrWpO41fFaEGYWLnsdaVI3hEkwcq0fpQLwREa8hceFdHPkH"
-    "XLVUgbTABlAOEZVw/NWh6/4qaTwkq569gcKWvBrpwBuoifOpc5CZS3wJ5qD8C4CWxwNRAS7x"
-    "QZsvOd+ST4TkguM1V+NbE0d+pI9w8ZT48oxUpGZRby19YI/FyWR1Z9IIqsLj3TxqQMXfTo8g"
-    "mRZw1BBnuIrOijYXMU+bra9xx9yq+kUrYXZBJXXtOu3zdMGVueg6Rvk5TmdpwBEpk4wCC2FY"
-    "c3chxylJ8Xqcba6XeYDkaBdGbX7hKlKiSaRMLPowCyPYsVpYeDovmiz812/eZBFcjY9hmS4Z"
-    "B8f5BHasJN/FdhQG6uKlZ4Oh6et9FcnXEsYvbwWj4Lbm7Dyn8JBkxbYkWz0yI/PCk34AKYgj"
-    "+gL3H57nc3BAZg+myhNzbK4hgtZYKNfucJTlGKlIFwoHWzuUnzLs7rkNA6tAZZME5sDF38VY"
-    "RssrdJDssQU5O3suzc9NMhGMsl2GUj+M1eTUpVAqV0ldGpRE2TdsExmkvH1hX2VOkgkig30Y"
-    "XZkgpYDqfSFoS5PQ7V2Mg57FhhaNgLqt5zaaW7RuN5pmb8erg7ajjpQ69WrauQ/mkGuH9tGb"
-    "C90tyiHN4hlC4lSYbJli/dJmG9pXIz2QHlQYwn7W+e7naW+vNoKpWX0VeCR52NiKbWUYHPvP"
-    "EocR7nHv4yZMENii3tSRktntQr9L/P5F37UP8pf7ZYQARRDMGTURDI8Ml/cNyjjJFHnisJ/t"
-    "67V1FP2xjxVbhqSRWQZx4A4JFA1PcdAf6YrDB3sH2uzCtASM9PjodjDTo3wo7Pa63bwFDcIr"
-    "FYNR40BBSBcrnBWxUsZfNSBb/M0YIcJcQA0yyluVEwqJ0WVcxmVXys+79WI84y5ihSlhbelN"
-    "W3AI0kDX8GTskT5wiCuHUfPZbyZVmDERnkFqv9Zt7TW8ub5z6InIVmDzjvyr4Fp+rYBtb+1w"
-    "vp+WFXHWr7qeuuhXdAL7gWmingo+QYpf4HZ3anzGncHrfkPa39uRvsY79LjAX77E9THf1J2+"
-    "5f2YsYF5eaPuPNPGj/2x7vT9f/Mo3ff7qp1M8jWfb/vqrvSV7z5FRNSJCKb8ywsp/Si4v+xt"
-    "fMCB5+c/cZS+9385QpeVBEWQRJm+4gtS+v1fnHH/3V+Gmfl14s9YthGmsb/0R7vT9/7kUbr7"
-    "oDP9fFemD/2urvT1v/MR6AfVGFK9b4Iu//7FbxylH/4HR+nffbKi/dFQkSi7GO94HUeuP1Hd"
-    "pa+VJ/GY/Wm2hInyWw2iii56BGWgl5EYW1RVpiY2ZZ5MS2B+ZjQVsoCqJuBWsCqmLbD2Kgbz"
-    "VA8nj6papHH8c6zFBAiw8HnQVXlXD1MFrcbrj/Acmb3ZL4y+UjN4Aa7XT4YzOH8Qmj/xBabU"
-    "KQ1ZUpmi+MvT9GYU80RLYMREmbOv+Vvms9h6Ix9zzqe4skkKJRi7nFDThtUa24HqW3m1zfoq"
-    "CsBsDR7DCMkzHaJfRPKQHpj14tL9NDHBqTalPUgulGIBEmYZJpBm7IJjhZOCKzBMG0hGPMkl"
-    "LfPMcueQhCgxOeSKlUGkMHMwWfYH9YpuIMla54Te8a08G/aq6AzzNQJjpT4XUw0SoHGUxJ+P"
-    "k3+e6pMZvIehUGZU/sOw8O8cZiJkgmT+3Aa7ePEZFtSJKMMQNA/DVMg42GYa4NyHIdHkwS3M"
-    "NNxDMf4AelVQh23i0meV6qPHgJl+hYmPkBoR7raby9/U+ABSK06ozZ0PJnBoCB0nTCKcm72A"
-    "Ta350HeKy5VhWGRgDtBRU7He+wqP7BTOSuDxz3pwkfdggWXqx/K6+miDSHF6YS68HmcDWr3G"
-    "xu3IQ7bTZJJG2C4Ut3ctWtDcp+0LSHjIS/TSqw0x71JUSraDxFGm6ghJ0O7uerSLQjT1vEwj"
-    "wxFkgSV03NhfUMduQKYaSdjSPfN0u24bqedt8GkjC5tg97GST7/yJF/oiTHLui1oNXqYoJtP"
-    "UM1YRG+OYtMzCbcfyExZjqhy4LN0Ms9yKrAjbyI/7XC5ZY09Nv7yIhrFhvkChjZy61aJmjTs"
-    "wrDuwoBrrHR7mzgUdj3ROjGh9XpmeLaetZu1zR2LMqDqoJl2cGiEOqHM0OUHhvVqXnmOq+oH"
-    "DM3R2vQF/cTkEApJuhIb9Fpug9rSG2JY1D2Vb955DjUsoqAjEgZkwJZGClwNxETV4UgmnAO5"
-    "7mJiq+BKlK+WlX+RhtemnxDgRB39yjg7TUlbxy2aKk/TRDevcOZ1JZdJ3O3O+o5QMgqpXKQz"
-    "nypzceuvuSC7es95+VLB8HDOb0uS8QEVNASCDFOxtZSxQlhgmq/ZJ862sFya9tA2oE6vDBLp"
-    "+2O/tyv9wId60tRoJ6DXH/YNX9CdfjfM0zLbbXk9q+GCaEwTPpqUjDQcyE0/9d096b2Xm+X9"
-    "evJBMyJ98w8zVzrwgeP8EwxST3p6LsN9insBf/Fj9q+zu6/+Hd3pF3+EE83S355MWvhm9h7E"
-    "N+J+z3u701egJP9Xf/YQe1neRQu2MzKBLflWZIR6DrT5Su894ZqoaXkLZQewS50oYIUww1Qv"
-    "wp9AWSFpD29BWKUys3bHgGtOckRWMAWyBQ3R9fcC04KypO8QWdKWZ0nX6b1D8gLe8ow5D+CC"
-    "w3TFXwDr7/oL7uKvx5c07U/bSCYzFgwWL1auwKPhS4+3q9yrwvoyRkBXHzyAwchMldtfu3Gx"
-    "sQyV1eu2DDkGEV3ouqC8zn7+2OgdJAq9aY7Jnus/WQg1faDx0K40iV6O5g62+Vu8ez/u/jPP"
-    "kNBQ394T6NaafwMoFs+hl2QzeKffjZu3YOAWozjFntPs/EIax6SCtplSr3cY9pEGmmACXkWR"
-    "XZtXSk1kuNwuU3oxztZcnIBDUtXD9qSnG8PoJ2WK02I0hJIXt8VW7t8NadjiEtbYMabpvv8h"
-    "M5Dlj1qTQYRAJ+19r4lBuqM0aGSwO13SPAW2oDSsOoZJBLc/x6YXwrindrRkaHrRl7LsG5wK"
-    "3HjACUXqYsJt0/EZGp/+zLuMZFjJ5z1vxXFHH8r1k+cuQUd/XGq9eOeV2FJVXyi2CSmXW4XW"
-    "uxItTWg4NmQu9+Ai7CeeJBT/ADPh+emLwHLpNczVNvaq4goimLgtdL3297fYYnWrjIlAemj3"
-    "vHSIJS+29icZDhn2WZjWAU5Hrq1gQ2yTNr77qTgI4Zayhmfvr2yjy+YhAE4Vsp2aDZBSn/hp"
-    "ZsqYt0jFnceATJaMEQwhTNEA26E9WoOn3wpjXB4oStU4CUmcT7eBPcCgPzNnlBkcZWvbbd49"
-    "pKEe0lBfrx+OWZS9SDh6qXP/xGt/dbtRHT0lgKOjfAYR7iLugQEPaBRdMcN19tlghAKQgFxV"
-    "Edf8iYFTe62917xNgOw7wTxUeUam7cCN94KQ9qK/VRXWiLU3W5cnnAWpO1/5yy2TI8JfaMjR"
-    "zRTt6SOmqoxAXa+YQBxUFAa+vawml4fM253AU7/BaBpBuYKMwCuMZWpz0NMJZ9RHnZTIQ3rM"
-    "o1r+Tk1LHpFx/JCmvPNsK7+0PrLjQ5ZvpPSj347U6gleeqy19DFO2z0WB81f+N7UwlwVvB94"
-    "B5dAP4NRUvS+rNr/7INdDeZKmGC8CvAjPJVkjbC99yQdy1r6nq/vSV/29uP0Xf8Tp8tvkNsb"
-    "2DKsU1vvGYZnBstOFyXKvy3mD6qSNpBUnc33/JVSAdTggkGq3s0w0jYQNOEDR4kv8OIvHVi6"
-    "qvziq7AKbxSi4cmJ86tpfC8ZlmeVwZkerWkab8VT8i3vBSfvBhldnvrawQp4TYAQQcJl2JK6"
-    "pGzFmNNnqYB+F56oNhcwvvh32EZaZxF0IVxmC88v9734uveaF5mITFUPp8T8So1cyMJFzm3C"
-    "TRiwO4vLMA2MsC5NBrDtgnX0XqRDLHd8rUymC2xP2U+6j15g8cXKOUyQW4nqasmonJucCb0d"
-    "7/xTQuOircRG5uCVV1+F0cG8ABVgHbhYKK3xGp0+tsjcWhvThpXK0LmwSLHuIjXjZBlllZ6j"
-    "BSykn2O7UAZLZg5myHqgOLGdlc1OLIdCvgZTVzGU+YDN+E2u9NlBuVumAEwsrDAClCokLLYc"
-    "/7uhZ356NF25PIsRVU8jqiR/IU3NXUXXagbp1XgwjjKE0qINqk2untEkwhZMkIyX+mL7KKar"
-    "32SZRRxSI3Td/Gx2UVeSNTAwFlKwBw/uwKyw3VpdwOx26/iEm6hdcYWO9xO61Wt9yMzp18SG"
-    "UpiZ+Ssh5VLytbG2RDjMFSIWJZrWq6tZD5IfpVTWVY+LFmQ0KhdvcTaT9a/RUhku9bUWMYOx"
-    "sXWX05fUI9LP5fubMK796DspUcN2FtfkDAxg6BOt3F6kRaHHBuOXpxekpJX0yp5mmZW0Hfe7"
-    "uYgOlp1FSoGRIRTWdlSaN0D7Dw7SPjSqfUgmyynA+wjVF5ShksFSB8x2MNL5opzQM514rK9D"
-    "0vjRYZ3s7HBxNIy0dPiBot0sGVolf7ZV9MfAZZ8KtLl6SmfkzXo66WR8OsVZRlztUeY1A01T"
-    "EnbGG6nbfmQ8KoS1mPrcG8HQ2cyrBlilthgFS8ciER/hbZGO3TqtMT+3oo+3gKkDFnw12KBB"
-    "GPoCLZjzE86wKl9Dw2sQ4aVM0l6BVAUhpCWwirfPy9WJhwT2w2bCOjENbM34aKAKxsSP6hgK"
-    "cwzlv/U9PekLn3kd6R81v8cEb7EnRk6ndxxmziXi4qWU/uTXecKaAypIj92S++3gvgRzFT/z"
-    "Z3rSt/34YfrYJ2jurNb5SKS3dbUTXaq3dFR7nVVpgmbPipcTPyWN/TUPiZIug5Z4305vngo2"
-    "Pxq/AV/vxNG5m1ikrzBb9XwaCM7gaa+UMySJQdmAq8gJWhqBrR7jmo4EzSIQ7AsQ1cAtUZEm"
-    "yl5CCobyXn+ankWKRcQFxUU19KzWV9G1WmMrR8vcLoTq5qjQ7TF4tw61xeRXPotB0JDzyNXs"
-    "FhbH/TeVisCUIWnQaYcomCMXXBdpJCojKJk/deUdSAi8ouZT6OTc5zTfHRZ+tl+Cru64XHkA"
-    "5qQLRWslP/MXMxOkftCr166FiQThj5EuWB+WBfYqmAbvsFMfaZ4txtC9IX7x7r10B4OXeyyM"
-    "6iYh90CSdJ6FWFMRmUna5qTc+honJDmiv4I1+mWYq7U1LqTmdJmGQncPlFTJkLrA63eh9fJg"
-    "GAXCxmAS5jWwOTXBF6d2v5AyzTyFRGohDWMcdQCbVr0sxNH3mLTV7dKg54P76Jit3GERR+ZM"
-    "+R8s3Yw7F70m6DwSL21NUcDUDWOk7o+K45uYT/CE3/np7jSJvazeda6w4fogihUwMkNrq/fB"
-    "i5V7dLdsr9jypK0tvza2JpVawWRusfUa1+qwXeYFzkqQNKIqjtUVt8VkWmDqKK/ldiswb/vX"
-    "+5SSLfoG+JQS9XMB9fkZLKP3jwPbmzY+/dG4FmkFfERDu3cmHmCqYiQtXJrl4MI01yntwwwv"
-    "pcVlTi3C1Ni0mumwfVWC11l3MkfIGCM/adLUgwzPYTlcAH19MFgjnPDU5EdIsGJsZAZLkw35"
-    "HkOZyVw3dL4YUuILhlki8WfpFeODsaDEbw/pWDF5YZ2aXjjRy1w6PpWcVNlJcNANaNMbgzUH"
-    "138LaD2s4a/QNGocT2ZU8iya05bYRqqOHscvZFqt2YmrYlZPJuiAs0oubCOWOjjhIrIB0YjO"
-    "tDbhS9IIryrBGUbXhMrJfQ+Q9gjD+dcM9q1yemyT8l4LbgvKr00kgS/WDGLMN2htINIDMP8z"
-    "2Y2ICm2Oi4xrOKvI137IXM2m9A++rye966l23K+d/K2E4Nswfewl9EFhmtxerDttVn3iGiEU"
-    "6b9Cl0wdsF/hDsBtPly+/DXsVNXxvNX+S5Nd6e99b0/61h87TB+FyXojkqx6WewqtnZveKoB"
-    "cZb+09JFeClDoB5eOnM9w7P6nXxjf55FypGQcTn5sWdvJo4Ow6tBkYvxGtijfM3S1WntmLIJ"
-    "mqOlyazbgQlsxxWDN2hsAkt3fDw1gjKmdgaxietETo2U2ZPj1V9xm22LrbA1tgFXuUJmE2mV"
-    "C1+DsUIHZx+JzR7Hcf3I7+eYugrb2cFg8NkRX/+UMSQHLGYudiqAHx0rnViOupYB0ZjlxHn0"
-    "j9j2QwEKZmM8XcAkg/xXd+8LnPpjKw5JVpEmuOCd93QaDBBcCZKdMRTF51kIZBC60vXrSG02"
-    "NtOdo7vwbyJB34m1Lqyduz0EQ+AJsNn5zAy6EGphfhkdIJv0CHqmYTZGUGR2e1A7VstuBy7d"
-    "jet31jewhbSKdXp0h7Y4LXiIKQEvPrYxlEyQIYu05hh20whfXXOTozBX59PMDNI3GKsh7EhN"
-    "zFzlCPVFygrrhzTFbU5kQaSlB8qkQbMK6NubbBNCn+3x4P49JEmrbBFOx/U42QgoEhgYF/uz"
-    "5RsenYr4PRTXd3aWMYXwVD5QAHe1toKRVsqxCbMsQ6VCutt+SqysW3Xjxs/NwaTNUI4eJHt3"
-    "gOVqHGFQdvcqnskZjISyJagu1gYMZx8nPocwJaFdMcfPKT06tx002DfVK7Oi1f966ul3xLbk"
-    "Bsz3zg4Xb2MDa3SY65M4WvTMM5cwzXElJIrep9jDrLJLu9x/4AEKDwiQGxUuTstvGWSwZPDy"
-    "FqFbnbQPfdE2Np4omHfkpUMapYXZoj/ojNOciAyUBxCyX3opk4m0V0acSve2h3+aIVFHawuj"
-    "sR4w0MZXMDbRB2hHcNqf/KHLkVfWDRSd0qzGOG0O0IAn+sT47xQi3e3OenCKE5H4cx5iPJuL"
-    "ebEOjt8yWFetrg70sBgLJ6x/zYKGr/nagsBeZEPlenKOFtCelRNkbPwK0MFFsOmNq2ACRZU+"
-    "8IkKgAbWXMicpg1nzrUKrNIJaA6xpWpGVfpMa0EAcCQWwL9OrsB0ijsljLnMbcGf/i/fHOaK"
-    "IZX+z187Sp/F0GhVhU3CCDqHesc3ftEjnFZkyHE2KX3//3qYfuQP9TSYrE0Yru/7qcPEFJXe"
-    "9ztS+k8+kPvcT/zLo/SffiAqspnvI/j8PvinHz1Kn0Z/K9b6elri3Pr8ek5bLsAUPU7nBdQ/"
-    "jZ7Zf/RDh+mla2A+w3Yh5FSu6r+1Cpe6QiEn2fHmXl1SMPCr5IQXwEZk8QhySmS988ZEIGhb"
-    "HqKpMx1WaB5j5Bl4s3TBbGIC9LO+yjCiSwuApJCS8yhE5TJknHnwF381lqMRM3SVhoc4fCt0"
-    "4w1XsstvAuIriHJg/BbaS50KVuqpUZuNwExjLXlHb2RFjBbRba+gkUC/zDW5sOq1Liixr69v"
-    "xAIfX+wsQi5W+0itlApEOpgQWZXSFi5SWdpEXbPISLPSoiO+QpC1sDgnFNllGlb4Y0Ejf6VP"
-    "00hNBlFkP0Z3aHhkMl1cQGemF0Ojx7+ebt29m+6ilO7kq+QBti1OF2qLqhvpVz86S3MLz8J0"
-    "oesD03X91esYrcQ4C3mrLB96Q6RWJ2uI7S+ZviFOC85dQJIFzIvdn8C21l0UsJfVdUYqtQMD"
-    "oLZo1jvTcOjqA6Q5SKs0grmFCYZ9TkaK35NxLr42mxIdpSColaenLw6npy7NYa3+HGJi7jHE"
-    "LlcwMFw5MzoxyzYkOjowCb3EuSpub3APIiXrhy77iZcoyyBp7mJ5EcncCpbwPdHW94CTeDCX"
-    "0NbL6cqRUe4KRAIWiuSU/9z5ObbfNqH3HqfazlEOjH6GhLCf7cZbaZVt0QNse6kfZFtZx6bR"
-    "pIU2yDbQy9reegAMTLTbX9Ayht7XBCYjZO7c/lpZuh1bX+cwKKqtLiVaLjbqeUXvi0FIZ4r/"
-    "/mQmyD6iNEcGzr4z3D2Jdfr3QF8+6Xf9lVewPn+Ynr4yk5575mm2hC9g1BWJHxK7A+uYuP7b"
-    "bJtiPmGP/qQky23ZGFfWP32TysTjVmYOl9mPrc1gamCw3NZk4OVtViZx/epj0Y69lAOygjYQ"
-    "xTPqCVzCyzyHuQ0YLaW3Mlcq5suUKQ1T4hnMHXVmewxxb6Tbh57y1OSEc6D/pFGpbyzQVpIh"
-    "diBcfgtv48c46erkcqqSjnoGTtgSbhqT+n4KCkFa4COg+gmy6pNqFR44I5Ock3Dm25oHpY0A"
-    "Zwhc+PFF/VeIqkfEV3VQYsqcJHXNqIA8UR5Dcx1mIvSXOhWf9R40mpL/Zb4yjh5gYr2nuCA8"
-    "0kUZKtBgPKuonPBhOApq60ICfOcZ/x35Z3DAMmWkH/uO7rBrdYYUbwjEKvlTf/Mw/U2ssodr"
-    "J9JggH7i52Bi/uueNDPeDnBK9jAbfwOr6OdHuKvwWzHfsnqcfv9fxNr6ZxifTG0f/hY/flL6"
-    "JNbX/8n/c5z+xNe2M/in4O0Q/AN/5zD91X8IodLaTl5F///4z1L6CPRfmmoH6IDwEYIuoDz/"
-    "k1iV/70/6LpBwtcoRvSn3Ekjl+iXQbjV3OzPbBF6mkPqK1fz5iK0FwSAGkxJ9tCn8O1oIigH"
-    "Fp2vPDHlwdUYcBWxTsjxFVxDFFOzheS/g9DFuBDXyNIJh0nCYdEouDglmOzLpJIpydVkVOBp"
-    "IPGttQD1Cs3wtV9AW6GruCowTxjSY3gtkxqKZjjxlM1/PT1QwasSkR10dbyLbxmJkVuCm2wH"
-    "qvhrFkpRwlCjkyM9xa0v61gpgCEyU/FX5RfbDRBj/Vsz/hOPPNcOjMqBEgPqH/4B3CxQLG5T"
-    "bE/JWNh/ZBpm59WNYtFmVrl56zYXA6OTRdwhTMz8wWUkKvNIB4aCMeiFOZtloVbHR8XiV17m"
-    "nkC2uA6us8QdbLHwwbzAzAwiRQo7TpRB5qrnwqWQ6iwuwligg3Nn8QGXL3OdyjDbkPw7gPmz"
-    "DjaRXO0gsdpV1womUaVGNj+57oVVHtz7Lp7ATo73osA+hQh/EiV27iRE0jbmdiASqzEYFOmV"
-    "4fRUpIyFUjyNrG6i9D00co7yuwXHViW6WF5P08W2XMAPaDkdKRrGREPaxam63n6kiuhRnWer"
-    "cWSUC5SZnUbHZ6FXfTkkVjBUvYQNcjHz+AT1YFmQXm1tLqZDFMk1xjrJVmM/tMgkbKIT5V2F"
-    "Sqj22ZZUT2wGMw/qbQ3SHpp/WMVSvJc+j7DV6UlEDcY6cWQGpN7Z6FR+VNEW/ikN0kXvIU2Y"
-    "uqAzjKN/Fm1GnYyODmC08CZMWGIbU/27/jSOiQpPdV66+g6YQPT0LmDJn4MFbh/fueeF2WxT"
-    "w0TBR4ObNgCnbJauMTYrf94CY24CRqbTv8zoAMsJwi2uwFEqJVO7D0Nmehc0DxM4rgxXOtnX"
-    "t0d7cWsB48MbC6Jv05fcLt+D8RrkaNI49TN7gROh5zw40QPTuh1MGZVC+WSulLpZJ46R5syb"
-    "x4vUWx7LEN7Gj6+GFxcwvARcFdFMksdcgS1py7OE+4ykdcRVZD5BXIfMsHm+yTlF3vyY2wkU"
-    "BDTpKXg6QBagijjroeEirgAQWo9rAOV8Il0FKkUl9+gLvhEklRlFBchLCamha3oFFrTkG/DN"
-    "6M4+ElToG+kErPCUKAOa/s6YSqimGP7w13WlDz1BhfaSl08Njf7d/5u2UvrS7KJ1kPB/5kUY"
-    "FE73/ZGvKBV0AuRkAPiWsIquW4X5+PR1aoK14INf2hWnFg3/Ua7oYbpCFcK3R3eeHPypfw39"
-    "zCcPo//6qyn9w185Sn/yg68zo4eQ9t4rXenDf6g7fd9PULiH1KEo7KPFZT+0U6XN8ByPML8J"
-    "WBKcfJ4F5mSqRsgpbVkYq3bsMcCcBJhcZQTy04HeFNcHjBnEZCGGzDjkPC2sCwWhPC2jX6cB"
-    "C2ipkAxgCoZsVA5xkS4zY5Idk5MeKtyHgPE8U72ZoIPL5BJRSl6e7bA5PCYaMnU76ohTdBvr"
-    "99kGu53uL66waHjFzQHSK9lulbbVo7LOWHBkYEgTJ8b48pcBNdyTXEoK4mSbTCnZhCSzyt6t"
-    "magxF0DgwIaphyN0oFaj36mXROJ0nkNpg2yPeepvqAdzCZffRh4yTb3pxo2bYSjULRnv7fPu"
-    "pim2B/OVO4ib2S6cn3868qXK08uvvAzTsAKzwLlg8rWtlNpIXOjfILc9PHSbS+vkg3GlzTZb"
-    "P5sstH19u1EWW2YPhWytebseho6REhu2JGXO3ab0ip/B3qO0MDeGfZc5JFQTUQaVutWzmpi6"
-    "wPtY0BmLKfVn3/EEo9KitdV7lBcpDszYroY7YWz6kCbJtKiwPrfwTpgzdauQYsEIPPXM56Er"
-    "dRlp02K6c+OT4MLgKVI/7WUNwKBOzlyOcsqMLd17CUmQStfjWK9/Hhi3FFHoVtcJ2jX/sMsM"
-    "V5S1wzo5ZR6H+TrPqUWlV7b3LgZMtaG1zLU36jGNIYVTn8q2sd2iH9i1QjfK3syLAyB6tmNM"
-    "XTmVvekFAUPVKVmjDse4dPsSsLbBtc98LN3jDkkvx56G4T/kQMTsxafRmzqfBtHbGh/BTtgE"
-    "9yDC9GzwEaDQahOG3awcVyEV8oXsy5i3D8d2H+Eyp118FHiQYZATjV5FJI0yQQdH6M3Rr0Ly"
-    "CgLb3m1nGelsvgHr7nyKao5jkzGioVhPEWbpFRduq2tFOQfQpztPH5ifuxRl88Okp5fTmhwQ"
-    "8cShUmBJzC7XR/nQi3mkirM6210jWS0iwvjpBF/A6unq/hJ/+lNo6yK7U/MAIGAKYBvCEvyw"
-    "9FGAAlhPXw87FUGVfz3dKf6o+wbOhgfohyDvhEtwk8ez4KnhKEEtaZvxjaQt8ae80M8XFlL6"
-    "c9/y+JmAU3JkjKk/SCwXWTzUURDNHTyqc/rUlWpkIyL92W/OgR97+Tj9419iux8Bf1hayaCP"
-    "9KvdwWDOmPpfi7kZ4g7cJ+W+/Su70z/6t0fpFz5GDjKrp7i85ex84B9AfJTW19DgEiDTJjmj"
-    "K4VqdrozJjwVrB1TySF/ibGsQXlhsKJpSRCFCYw5tb8x0VVNHwVmdfVkk5N4UWY2YU5bKkUY"
-    "cxSm5MwrjIhv4snMFRO9C1NFbAsscK/L1bLL6UtAlUkb0kKPWyhuBW1y7YmW2NdXl/kyV+G4"
-    "h0VYvSbsKrGdETOJZaenuqiFj0Wu6Lg0ygZkll4BQybBfMHUlI6SmaV8ak9p0IM1T2FRL+A6"
-    "kIHjnwtgXHvDANHNscAqFnSb8hqK7BoLlVEqDJ+nC9XhUgrWDXMye+EyNDDouW5GCcMFTEDM"
-    "zV8OPaPMCLBggtetyQ10kh6gZ+alyypi72xCC1uX3UirhJVhPESJPayKQ49SN7cED2RUolUP"
-    "uN9rID17aYrrXs6BA4vpbLeNsu02Po3B0PPzMDVKSiiXDIb/3K4i/+0tTkqy/acESxhP9clU"
-    "aXdrFIOjAwNYYIemY6RZ1puW0b1WSKnYDhdpr6NXFeYBGIjqSWXJDKYa+odhqi4Gzp3tVXTM"
-    "Pg2jJLOEZfhzF2GQRtLi7c+yjbgYjJUSlTioABOsMVe35sy/i3fx7yvZRHKlvSylgFMwDsNs"
-    "TYb0yjbmXzCefrhYNhseRiOYSWNlboXzEzUcNUd5Qn/MNo9tw2501GDYsFt2jL2zxTsvpJX1"
-    "O2l0ewwa59IQl0qDMepfY6obnLL0VOcBsPLMKpirMyc1ZejFuI0xZ96OOf9k9LKyu6cIHa9K"
-    "00ZGYcIZ3zL+nijM24riou2ln7xl6DeQRG3AXCk180Sso8u6k3G1n8Ql5BC0xdahhxPKeJep"
-    "3OUEqHWohNIThjEHFPxOJHYK/yqnN0ZvLazEPexZwDuP/IelfDJxhZ6HYW+U9WFAxp0FWcFx"
-    "GlIrpiOeeuBptVdgiA8vPyWo5BsB9fQCVJkGbJ45GuBn8dAFvx/mA5XON83Nn+9K3/0NXekv"
-    "/m/ML0jPTnNf8UUpfd3nV9zSaUAPCXf88q2Z/gjSubcvONem9Bf+HrsDMHZM5yer9yG46lEq"
-    "yX/vN3alP//TjOl8tqoe3fB/0edhf+tLXj/9DUSneGQJ/sIf7Ekf/CRlYsPjtAKFqok4Stfh"
-    "Geo2hjlP8M+NgDMyWPVeWfc3O1/JR/ynORd6nbCZhHiNH2PKJcpOtrack3xhsPKiX+Xtg0k4"
-    "4oFx8Q6szdmaMHOr4MXNn65M5OJnum3CACB8MB8ByTv4XHjcyIhtFfGTLibiDN2o3yrJGR6F"
-    "EkH1S0e7aw2P0gW90qQyN/vEKnA/WOKUnKffRjCeqa6SkhW3NDI+n7G1gQe+MRbWqBU7AGGW"
-    "wwVMxi3yiEUXHwuqx+WVWHjMXTJDn4tFaR0l5zC1Cx094DhiMeqZZwtHRXYkVwNIf+YWrhCu"
-    "cnPCgjt2rxaXcr3Re7WiPcOi34uCfBc6NoN88szOY/6ALSyJGOLIvFtyMgyspiG12WEB3ICZ"
-    "vH3zGvpd3IOIlIodHujnzxFBO8ruxYXMUZK8yB5zYsyyHVCu8dG+9Myl8+kiNq0GMR0Bd5dG"
-    "0bGanH8qrrgJSRQLr3phlCoGiwW3ntQ/85TeLkyCkivNC6gPZd1sI3naw6DnEFIb7+zr4oRl"
-    "L0zWhUvvhjH6VLqN1Kq7awBGgKuFyNMLtq+99DEYMu5xhLEbGZmBQcU8BWm2YbA2vQSa7cV1"
-    "9LK8Z7CHbUNPbUa7a63dXU4MtE7DiM4iAZTR8Q7CLSRmmnjYQ6KnRHGUi5tlGJVqsdFFOUho"
-    "ffFnmXQh1cMb77Rj9HfNxRPAAABAAElEQVQbjXghcl9xyy3HdcNMd1GXXTCFft5duPwOJlXK"
-    "+1s9MPvXGXMwuGy7Kenb0CDp8r108/o1LD4j0YPZ3eawwf4BEimYK/ulfa/Q0tyCM9wyZslV"
-    "bA0CH/0QipReeYLSAwZjnHLVLIl0b3BYwrLJEPlRsReXZzNypZcIpVvi6kefzu1ZGTW3CNdp"
-    "j0UOJQxffzn6lDStLHNQYvFOSHqH1CmDifMDIPKNivMn10/25foMf664HHyG31rKM0A/JhAz"
-    "PWWNekTyz0SQI7TufO9Y7k4R7YlF1AJXMNUAa96c74mAHByICsIqqEFZsyaavkz3adgCA8Ps"
-    "bc+kJ2rrqlDa/vzT39iTvva9x+naIuO3nUgKMcGwff/b+Tg646rfjt/3bab/cRT3v/vrcgf6"
-    "2Y8dpZ//KE2CtKe0hHDBnMjoPYK07D9n2+8r3nWcXrrbmX5tfH0Z9L8eCZw0ndV9/tNd6YNf"
-    "3JX+0c+zRp5Cv3xJzJfWsx+oPJxW81zqx6u5sfvi44RzpipONqxecyW8ej4kqg1SNBUu0Juu"
-    "TK4SmqOEyBiNC8YpKDUMGP8DG3HAhZI2BQ0nvLDEy4xlmBzFC0lJjIscAiegTMQlPxcwO2Us"
-    "KgJGXn5Bm4gKFH8OBk58QTK/j+qkM8gkoRh15ZnfOr6TKNslcnvDY/QqeGNZG8V2F0AXda1c"
-    "q9Br+YUN5pR0MhlWk6cOQ2KFP0svcn5Rb1JhGf3zHyQp6VA6ID1KHDQcqsRglZN5XQk7VnzK"
-    "eIJQe1VacO/rG+YQF1bJkaxcWHiGfqeIvAu7V9fQyVrGb2XaPt1cC4NIWEaHfDT1oM6T5bK+"
-    "IT8YHC849mLqlft3+FtkWxSlcZTWUbPizw4OTaUlZMbBpSV2GYd9Kkgl9qHBvnT5ItbhL11g"
-    "KwhzAzDe/egpTV64GtIftxy138XeK2U+gBmDRJwLtdIOF2jYS6RAGEKtbHRZN7uc1ly+fx1G"
-    "AhMKxI+Ns8DD7I1xuq+vD6OkGhnFVrxM0xF15jaaTNra5goK1RhTpcxL915JR9MYJdXYaO8w"
-    "tsY4NTkyC7NwD/ilkIBtbd4IJmIHxsn6sL68LkgJ4d2br/BE7462tg0oBNuRXowNwwYj2IeE"
-    "LhrI/gpM7rO5ffOYs53tG0j53MoFl3cZGmY/CAkmdaD0SilOWMenzs3HOwqPYRwnZ5+iLB9I"
-    "925+BubK9kIKt3QL5fb7tNUWFy9zAGODrU1OscbJVMdcn5dbwzTB8FiXZaIqTJZ9xD/bURiz"
-    "DEaL9xinpDHeq3UmzqkHh8I6f5qn8Jon7yw8hMH3tGD0W9olrt8BfgCL+V7HQxFhSmHQljkY"
-    "Qpm9Lkrp6AgMvhdwe1jCbPZh4oaH89Z793DOP9NA3fk5H3RKr00ThIU/v2dvjo2ma8TpKeEt"
-    "gbyI5bS4AltgytNwZr0SHc+CwzpucUbUE7ZEnnw5kd7k7emrPBy7DVfBVFGN4IanFuEyoytB"
-    "hUT7oXNyYRgiPID8qWcmTSV1oIqfgOCnRLW/NyErbHWUVRb1oLq/nrbhJ813fg2y3YdsLzVg"
-    "n4DnfVe7kn9Pyi1vHKcPvZ/LqDEGyvKD9EoBR87NKYjvrXB/AP2s37p2nD6KIdJTuIwM2Pb7"
-    "HizG+/dWO5X1/8kvIx0/2c2apAWZhbNoBheffc5ZknexVI7XE8UjIEuJCtCjPRv4yDG2J8iu"
-    "McFXqGoUREgsA9VE78ChqEhMpJTBxqKnhIWfYCYk2MLEwkBjs4ZWDk/+H/lGHtWP8F2Zw9LD"
-    "JM7CLO4K3ny6Y9Tz1UyYyXjkmjKxrnrkl+pXoFNcfQKIiaNlNmpgPyU12clBsNqMskAPYzYA"
-    "M5UwQGssyB6N5w7BroM0ckgcR9utMRkrdbIiG37MU+OwIQ0MKYK6RR5nz0xJtA25++xlcTKh"
-    "Yk/j48g8UgCvKEEVKC2vYH+If9293BWIdOb4yh4mCa4gwUE6wGa8+kVzMDEyQOb38nUuicYm"
-    "VUimwN8F3imkMEq8jqHdO+xscxdTr7ZRKuN2nJKEBw+WKaPX3ezDUHIijM8oGUxKl/ophxIR"
-    "T66p9GzfgDWIxfXyRU6+XZpJszMaMEXyhN6TJ+ymkfxox0sldiVq2xsaY12lLrDLBC1xLx8S"
-    "NqUXvZTlEMZLg55d0Cojcn/xVZgbJB4s6NrBKqf8lhdRVO9GV2jSLSV1oxZguOaxd7UUphcs"
-    "l3pqk9NXYtvw1Vc/Ck18Ebo12Y3RUvKRMdYCvIrqMj47bLHtYdvL7b8drijSqGacfqNOYSPQ"
-    "e/AkJ4ZNsfgeTBD0UuMh6aGaM8NKTdmGdleZAz8WZF7U6dqk7DJu4j+AmZBu28DOLYMpU+X2"
-    "ogynBw7888JoDbQa1zMsjAcWYBjvvpJuXvsk28Jasz+M65nu3V1GKteNmQxE/wwuyyhDMwLj"
-    "62EGmW5Ppyohtt8d07DS5oEJ5wgZpD4YdfFJl+2rXzqHudDZrebYbobWB17dBBPrlmB3tSIr"
-    "qXIbuwepn9fnyDQqdSXHGA9rbHtv8pGyyYGRVZj4CZhXOizbg3vorXkZtoy8DFwMh6hj2NlM"
-    "I+Q75xALTiYe6PfjIerZKmxzjRFu/VO209zpMaelaIY3rIw3MrMlzQ8Ypw9Ba3GNlKcQbbDp"
-    "213gBFFB5Xt0mzpgFdkJdTW1Ah0UxTPmxEhv2zgfVy48/vDXCVmBO+0ZhchlcP6LvOkDzbxN"
-    "SAnsK5FrhtWbGb/83iAjXiuYep50ATQO0u/DFML/V533GX77V+aW/hs/f5Q+9VlKSpj6U3/1"
-    "u7rTVT6cdV5H85Ef6E7f8dcO08/8AnX1FjGcQczr+PmiZ7vSu55N6eMyiB1oz/xLHhv1dT1n"
-    "RS+y7/BTk2BZMR06zWsQV7rSWVK2wDDJtLugwGDj2qN5VyKjC0YhJql4rcAZIMIwQcdAdSAx"
-    "UTsRl8nUARWVUeUdEg9hmMQdWLGHGhxWHmZij/Lx4zP8Ocsn8Nte4JKFuVput2ksj/ovQzBZ"
-    "2YikX96eqNNmwRETRB+LnUrFNq6wIYmJd0Byq+eFjMIrnVEGpOSA0sczFljrjj8XvJBg8QzF"
-    "eGxjlcV9HzHS2sp+un28DMO1h80kGBi2bsZhYAZgRnrYphroGo3tP/1ei/LZz7yMGQNsWJGf"
-    "de1kdw7DV8MoyotXBf6Q8iD9WFq8BxPHyTMkCS6Cbk1uI73iYFh0DRe9Xv7sE3vgsizwimkL"
-    "uuanR9IzC5iPYDvwHLpWR70jaRjlbK/4UV/JE3WmcytLBmYTC+hu4ek8gakC9Gbf/bha5hwn"
-    "9zR46gLtIiKcyuVHMFbjSE9USF/C+Okh25aTF2eQnmyEZGscxkpmzSNzSpO0aD8AQ+M2m1It"
-    "7VxZb4lttc3VRRjSUejiQi8kgMEE0ewyzSOcVtzdzXfoyWC78Ojsx7mvawIiMz3FBENOn3us"
-    "bJXtqw0tpTwaSdXv9TnbWJ+XkVW/TcZAp4kOCIi+4xeNkiClODI15h0K57TXEHa8+lHqd/vS"
-    "PjYxRd+A2fHE6SamMz774qc4FMGF1ptIluhd3r14dLiXBrmY+gJGXGenJwntTutbSGG51mcf"
-    "/Sy/bvLCmvuv9Lg1zRCOjws/BkrdOLb7kW7FdTjUqfURl2ijN3Ws/TbKo75a9HnaQL0rGUFY"
-    "NspjX9c2lsZHOXGL0scmVunX1g+w24bZj7Crxrcn9HFkABweIMlzxzDH1b3+KYzNSiAu5pvw"
-    "SSgeq75yNW8jqtMNGAX+jT4j+8iUH7kDmzOQ+muszrjsa/y2v2eoRnTdE3nUAx4CK1gH1KcE"
-    "VsCFzEgsrXk+KvOXwU0ETewRnyNbfmPOr4eIkrZtdRFYBTVxOuZp4GZ20mZQa+L8Bs/2gXdj"
-    "Z+qsJhA64fgcD3vfVe6OZavOU38/+o+Zi6xG5t2vYkvt931Ra526Ffnhb+1OP/cxPhT5KO/c"
-    "ET43C8ySmb4Rm1u/8UnXxpPOtfUsrsZgdewyr4njLKmEiS8rO6p/uPiSCF/zp+Aqz2BzHFy0"
-    "oh29hJvCsOZxcheeXA0OphhQptMPpDFOuHlY8EZcTIrEy1DE4mIw0hnjIkHFaEWe/BAafzwa"
-    "/jo9hj9Rlz+7IA+umAVV5eq+oaH46vJi3JDo8XW+2rcOo8Glv9xzN4S81kXPratcVzBNMBbl"
-    "z04S26lRB5SQKoowV7Sov1wimyyUhwlT2ViG1KtGtrbkdtyWoR57brBI7qfL1M5kz8VQsHbn"
-    "rR9mS0X2Phb3Hhiiz372Ja7WweK7TCN4t9n6msD+lNKMPRW0Ya4eYDR1ZQWJAlfbbLEAb2x5"
-    "5F6a8gk4F9dQ2GcrqEepGou3C/EAW6TPX51Ozz19mROO58mB8sEInJ+9DCOHMvjo+aDdfJQq"
-    "bSG18kSeC7PExARN3clYbqG1qaLz/uEuhkfREUNR3D6ndGuC7dBD9KHWlrmvEeX2K899Hos2"
-    "StHc/bjlyUIYshGuFpLBsj6HMJa68PS70r1bL6d7d66TlYyvJ9iGUErfS7eQ+vTDhE3NPZVG"
-    "uZLHPKjp6KMyNm7/2usKc1X6crQJMaGAnZsKRlZ9LXsrzBJtHQwLfV+dL1gtGAqYHplKrM/v"
-    "oD8WtsqgMbYIYbxkuN0qtP21/yVTpt/tYfuRUjjL6gm7kbFpGMDJoG8QiZ9MTI/6WUg/V9bW"
-    "saF2Mx1vMwaVPtF/52dH0E+5iM2xS9hSmw1L+y985kVwedI0M46F9hiX0OU4lbn3yEEvUirr"
-    "zb+QNhB/JAwMpAc83EbMOoPMDYwF6z5/ZHkC0qmOrWP6jFvHXoLtycJsKwvmnDD7uQybhzAG"
-    "kV4VZmzzeCvqxH4S46yqX3FnevNMoD/mHlKGc9xU3sZ78VQ4MuDDfzP2DCO6ePenmU3xZqBa"
-    "XA7wt46lI0ATtIKuk14wtIe1JHocL3UyH4Iv13MrQK7SNgpj8nIdAHEDt/Nha1rfBK0B+VI5"
-    "0zYTBK4msgIUz699bxOuJeJNevnVl47Tq/cyhS1ZUgQvaP7AO+nfHSQyLbAPeRlF60D3lzDL"
-    "gJm+0FFSGPj5VyP4xM/l6S5uelAXlyimktdy/+6V4zCU2miqkoAAr+CRfu8rfDPcV72nO/3I"
-    "gKeSya2tWcs81aRDgBNU1yVYFagwbciaSF6/T7TlTyzB/NDLT2RFANMWa1BhiEhHzy+kx8AK"
-    "GBFmMXLEKfYHn1ssgV/cIo8nk7ITsVjyf5EGXisqKgvYWExEGwgKs8GSE7QYmKsm0OIPuBMl"
-    "yKEB/Eg/YtWV9L5nf8wR7nuycMViJetg9bBwsrbEFsshHhePjY0tOoQSIpgbJEeelJI36479"
-    "VcpcGCyQ9pLesplLbBsSF7kSF1tKkTGxQZqMKO0iVYRbz30sWuqx7AQj4iktpRie0DpI0yiy"
-    "x2lBmIwjdHimL7DAkV47Wi+9/Ar6R2wjIUnY4BLq0bEx8HUjTdpET4dtKy6c3kRvZ1tbVkjN"
-    "9jwZCBFu2QajCJ3HbN3IWO0gBerF7MJT85Pp6atPcQoRJsrFldN3E9PYtJq7wvbZOaRQQyGp"
-    "8TqbTSybqxDuxdHSGk7akGo4mrzv0HrSvtTmyn2YQ2Yk+pfbnjI3oZS+gESK91VOB65iukFm"
-    "bBPFbrTD2IL0+JBSI67NAV4J1uDQuTR36XmunlkIiZlX62x4CffqGrbBtPh8HknYDcqzy9bp"
-    "U8GkqdCdaYMe+no2y2A1Om4cI/R5Gjor+ud2CeYr2susGUkuDLYnZfPkowr0SuziiiIYFyVx"
-    "4rO9leS4ZSpDp3V6SKeeOI1I3dnvDuhfAAcjc0DdoGEVXWMYRkur73YXrctffu7zqUvz/bX0"
-    "m7/xQuoj7dTceHrPu59Nzz//Lmx1zdBP1E7oTuPM0mvYqdKUggJ1Tyla99Jk37TPqTPl5dDq"
-    "XOUxqmRNCSsSLvTbZCQtt3GWOXS7qDjHhMxYP8ohoInyyVRt08dkIh0vjo9sikFGVomZYwFm"
-    "jfL4EbGLsrx9bAsmfwvGNNeRenOJ9h+GwXe1ynOJYyMyoiIaUioCzTtcedp27UHVe6dHI1k9"
-    "TRX4sDhy5j85ZcJa/Z0yqoW14zWqU1hJYhYPiy9wj/yUfBvacuSJrMrHHHHVw0CGSC1Af80V"
-    "OINsnwxcAzC4UwlMWE9cJWkP4t3voLfyrsEf/oeH6cf+d/tzS7FaXt7/vqP0d76n95HvC/Sb"
-    "u7gXbh2nn/w55p2aeOYa55g6uQec9F7lWp2zdI4f/8hh+kFOEfp9d5p737uO0t/7Uz1J6+tP"
-    "2j3PDSII2rn6i5zamMM6T9Ck4yRNVRXVIuzEr8PVMHRMHYyRM7DOZ2PWyUHl14Ujx+XF1Ek+"
-    "cJMkM1oVDtLH4kHnN9449XqUkhSGKRYh4mKyVpxSDZRMRp4UG/mKj8lZmKAVrL7LSJTwAuuz"
-    "oqLFV48/q7/Q2MQYpanhtR6kBfohXImLl/qux2JOuOV1UaHdtHKtZEfr5s4fvWxrubUVFrFz"
-    "LeayNYm3tFVeUcssVoSwYBWdnSLhi61DRpmLkQM4U8lCQf5KirxC5S7GJGVENHLpYhc6VhhM"
-    "6UVSI9MzNbuQ3vkepBnohb3w6ReRZC3CoO2ib7QeW2dKMnaRhm2jY6U9K7fXjo+QPshYorvj"
-    "nYoyyv4LhoCRODbam565ynUtMFeTKLEfclKvD6nVBGYXznFKcETmgH872NjSNpT39ckQusAq"
-    "1XDbyTJZt7a7Wz/WYfQBGIMjtrxWFlE0Z3tvavoqjAcGRjVRgK7T9DyW5llgF9E9GkY6pvRo"
-    "bfk6eW2km69+MuxjWWaZztjS5OShiucqY3sHoWUax7jl7i76X0hHBvon4qTiPoyZUkr7qfWW"
-    "TwAiT0FCE01nhK3G9nDe2pQJUQ/Ki40ti/0i/9EpYitwnbJ7QlEJlIzpEZI6ORQZE3WsZKDc"
-    "CtQExyTM8fTc5WjHxdsvIWWDUQR3mIeQkaGOZXQ9PSlzY3rtiPXBBHnSrrvnQnr6+S8Io6hD"
-    "I/1p7fatNDM1ykEDdNLY2u5X+d5tRRTyn34eJkdGsotLqmlrleFtD7cdZahkvFVMV6I0gFTW"
-    "coXeIO0SBnVhCpU+UejMTPFRMczFaRoade7oZ5+iv99xrY4e10qheO/4sAdHO1f9vSus/Nsf"
-    "6PvWL1LGwA+DtX+4QxhM/1YeX8bJmI1inNZrhKLMzh3Qlpm9PJaqIZf7EjnWneU4q6uaO4Pn"
-    "gVclzf0gXip8huQpvBmXw5rv0bEKcXV8+DtRVUtZ5dv6aE3DWyE4aMozTCsM6YMo8eg5PQfH"
-    "oR9ufnSHo7912v0QReTUjiqSydAGQGDJ3xztgJKRac0Z+U592KwlbyPEl1H51nRMV2gjhPJ3"
-    "M/DN891eOU5/BYvrdMuOOkOFkl/8NQ2NHqVvfb9j4mzOZlyCSfpNlNZ1P/j3WWM28fhtgZPR"
-    "+pl/e4zxz+P0Dkw31N1P/JxXfxFSwdbj6v4V8P+lfwxz5ffuQ2A/9nHudcRi/Hd+TWs+dVyP"
-    "yz8Kw/zcBRisO2BsY7A6jd9cO625I/dvBusrZGcmg4ASTYRx5TXQtAykCiAiOv/EpN85qhFq"
-    "Fw8aREfL+ictctD5qzB3d+lgSo10xpvGLpNh89esFPulEmVhAozxTpiwuYLIzUEV6XNeIox6"
-    "iPxNIxMhpgjINFR0BWRLhVSJRdJwAAgfuVaBEmC+LnAsIPpjYgZGg2sSEDRBs8+wos4C7Eky"
-    "bfasPViBoUEvB0ZABlD6VEJ3wTxQiZhwr1gxbTfK+6PaDeIcLa+QwoLKiHAhlmkiSbh8Wi7n"
-    "GwQQqpQROYLk8+Jiz8Ii88WfzoXQBUwGCNY23ecSYGRoGJy8y4LPQkvoNIxOF8riGJ1iAR4L"
-    "BfO3Q4NM3Gde/Cz31a2lbgcrYfAPMAz+weh40kt6KVYPjKOL2tYBEjNGYFf3LlKhlJ5920x6"
-    "++WL6Rzl62HRPsDY6Th38M3MXw2pleXYRlK1xck9DXnuI4mQ5tgOknlSD4c69cv1/DS2sNj6"
-    "k/FaQVk9+g3p3Z7qg7nY0Fo5ZGgYdBhL7HZIjDWg44X9LPSt1FW6/tJvUJ/eRXgXRXYYiImp"
-    "tHH/dlo75h0r6yqua6NrlDsOp2evILF6mROXw+gvzSD9WsPi+hTSLC9nvkMd7MbVNr1suYUk"
-    "y25hheiqZ2yDISHMtLqIRDVGm9m3jimfulbLKOVr58myyzQcyXxYpf4BrT7cPlf79GDAb+7S"
-    "26DtKu2HWYI+dNdGOWywc526QoKHXa04GUp9KUHcBWc+2chpUhjQEU5nskdIAx5ibHQiXX36"
-    "3WmAfnlt9NfTzjoXdd9+FeXxTRjfhTC+OsGF1245D8BMzs9qnHUn3cWkx9J9mECuN7JcfhzY"
-    "x4ax1j/ICb+4w5BVBNkSEip02Dio4gIcTBblGYRGmR/hZPL76Udu+2XGB2kvZbd/UeqoAPki"
-    "D2uoC6fbY0vYU4i5XsBMJXnVlGYfwvRIWg+aKTA4tbHFVimHDAa1vMhACfMmfszpd3zG2Adx"
-    "aTu9/OX5B89rONs8JDjCgav0AYdkxhSe07xVZO4b+SVyb6b1tbi6vxFmYKeIPKPF/AiNWR1D"
-    "0BqstJvWvijBRlVP3/MHssH8M12Jo23iI8+vRAKds7whoprheZomz0HxUn5ass7xUc/Um3lH"
-    "PtBimDhPOLMQsHoInyf/iGgNz2/NX7JDiJ5clN8KR7em75FzjdTT6FCP9ZEcDM9HfuU4/eyv"
-    "Mk5wCLlbmSCqkqtX04f++8P0Z7k654ufw2wK3zA//W+O0l//CHXIcHgtp906y3A2+qs2ei2k"
-    "jyH+aZT2fxHa2qu1Y/8pfaeWb28ZsCVM0guyeEbHpp/FYClQzWfAGwdw4dXeaPHb0zsgTojk"
-    "AGIYxr/IlwVYfsvJyEmtwHvnnPFZCsXTwaarnnliyDkWJiggiI+BWIM1TQ4TooKu0AmmE1M9"
-    "KN4jr3poBcQEkpmVKv+o6wwn8+MCc8AXuoujEqsNFL698mMT2z0b65ssFDJJLEAwM9pq8lLb"
-    "MMLJghLX4oCjZ5UvfhbWERZy4fr61U1B6hWMUkwh1Jl0VzSQvUyVdobylzwxOSpodeITVPiW"
-    "EhFG1aNDhT7TIbo9jHYXYct3Divjw5zaU9FbKYz2m9wiUvn9k594MT1AutTVNZz2MDrigiqj"
-    "5VaVdS3D4rU3Gs08UpLA3X1Xr0ynd7796XRhdgYYmUWslcP4nMfI6Rin6bQ0r2RHxsqLjj0h"
-    "F5cmy70xscpkxAROGTxNOAXzM8VWora8ZGalcfHWKyEVciC5UHbRj9b9FIPjszqK8U5s2Aed"
-    "Wk93YR8e1qr6LBV0DAN1DSZkAyYY8xYH69gHe546QNIFQzqLGQvbYXnxdjCDswtXQjfq/o1F"
-    "6OgL5fnYfopxZ11T22acf3J/ZtB5fZJjUz3CGPQBA5nU3Rq2tDSfoKHTaHPCymJtM1oXx8fo"
-    "uLlNCZPz/7L3JkCabmd93+me7unpvadnprtnX++9M3eRhDaQxGrCYhCGGGMwBlyukMRZKpUU"
-    "VU5CqESOU1lcpFyB2I6zuAgkYJvFLhKW2GBsYSSEQLqS7jb7PtM9ve97d36/57zn+77+uufe"
-    "udKVuAK9M1+/73ves5/nnPM/z/Oc5wwdOxc7HDV+qjhyfR0dNH6KTq0vyxF2wKANk5Er5/FB"
-    "bkzY9OgZOJc97IjUppikrHju6MlnQsR487VPptuX/4gNC9MAGBA1ffXIyHnEhUPQpgdsT2Gw"
-    "FACGjtjMFKI4QM0W+S1mR3o5zsaO7CJjEZtX6wC+AhatFTLj/+B0WR8uGARvmiaRGxZ+rScW"
-    "MNaZoCkTtmMFYa1nnDZwD+4XfUDO1ArixFU4XooWA2CRiHUpF80E26HLhG6L7WLdCmJN37Yj"
-    "O/XLzFWXT2WRUty8h48Gf43f8nPVuPFSng1VnptD8M1y7QIjj/PfHN5367UJjBBn7JrkWxar"
-    "EZ//TSsK0RBPSYpvcZVb3POLfx3rgsatBR2sh1pk4WBRwtkH/zVfOXzlGuGzrzIvmTVDmc+Y"
-    "FJoiCHc94FG/it5t03KaQaN3vzdfT3y+X3PAt+D9BAcg/6Vv4Dw9uFi5/poijYKndPFpDY3u"
-    "lfsm/02vju01Mmoih/DKmH0fTs9f+6ktFpKqrfCTUSy4eoLkDiPy+6t/piX99K9Q3wK4vcIw"
-    "Zp05m9K/+f69MhC5eMv/HGVX6J7XHvnbQX9VoMwmaIrBugxKbujsjfH53fdy13sm+nh66/6Q"
-    "vhOFce+qcZxznnJOHDjDPgO9KVaNDgqE1Rim/wrA0i2Hy9m0D5eVlGlF2avUIu1SmqZwUfrG"
-    "iCp/zU711ErMJULWY0xYMSiRxx1p4UUOhqAg7CehPL3IFn0nFg+t9ay0BbaWz80Jstjar4iF"
-    "4iI0QQyC6ItJxTrwLLatLbfgy6HAMKOcHiedij6dhMxv5Iw/5sV6Mi/l57cArYRxUshcM15i"
-    "8DN0fvab4Tc3WtMMyu4ba5MBTFx5bsAtG4Kb0AOY8XLn2SEUzy8yqDqwXr1+EyvxKppj4oEe"
-    "adSrcJtkyplXRYOrgCR3r7zr/e9MZ86cYgcZXAkAzf7ekQBXh7DHpJFS872I5fCZqYfBtbJ0"
-    "kTdGCEHEOqYcFGEKFA4Ft+t06FIRMMopaDh05LTBOEfvfoCLVgBcC+JKQcwScTvRuvOur5+d"
-    "gnL1mFTbARXHT18k7mXEhGMcUzPK+YbohT39fto5pds3XiSuyxyd817KlTcfHBk5F1yqWfw/"
-    "evgS8awDzk6kY5zlJ4Azn1ZvBk5kKIgr/pA/3nUi33F54xmKpw0APewQnBi7TT3KoaPtAInm"
-    "NYLZ7ohH1YdbRjzpRGJ7HB6+ACjBxAf+3WE5PXmPctwPHTTLF0CFPNq1NHZqObzMgiBMQOsu"
-    "yX2csaiCfNs+zDkECxLdKcE94Pnqyx9PB+DQ9XP4tCN2O7SwjgX/FQ6utr5np8ZZVNhG7D4k"
-    "z9bzMmK9FcSUAh7BrmJi73KLMm1mMWKAG+jf44H2kyl1r+SkesajZW0B1+3fvwgtkTRE5pmG"
-    "VqK1ZlyCLpoSTifcKuL3q3pna4B1d0GaX/W67Ff792PGAe7YkeGRMJxrGy0usMEEO2CbLIpy"
-    "c9DwVOamK5imK2+s0Vf9otrDf92lPMWX3HY2elx5ZHFse9zlaBbf9ZKL+jivj3dnPA3gUfOR"
-    "Iwo3CaWiv/yOp+bs4D1oNMYLvkfwEqcvFrl6Ny7jrK4czvfqF8A+l7vRX/EPsdWK6ZhukroY"
-    "T64Hn6vY6APNVylnxFKVK8I25CnCVHE0htdLf6UA3uj+pXo2uz/5w/vSNz+/lQ11mjButYv8"
-    "DXS2pA+zM65Rf6nnQAu23zIHqub3cQ+N8e3lB3L3ih2DPryOqE+wpmClC4Z3uf4Gh0l/8Jmt"
-    "pI6XLd6c/17y+h3vbkkezPyluvrI415Xpk2+vEFWmM2ag1eFk+hptUxsuRM0+izBjD+em4mw"
-    "0bPPFcE2Ohu2rC6Ku3HljlG5RAHoIHvEb06joMRdnn0veTaGUACuOnf4DcfwEfk2/ShxVVHV"
-    "LRKvpRlx5nLWOF6lAsLnm/2TU4E/RaQF1Dj54cJW9g1AwBKgSqONc9jnWQJcrbCK9iBjuVZL"
-    "i5gtmF9JM7MeYKvYC6ACwUbZo55z5uRcWW0bmyi+82B5nPC6uuAMxQCTJ13DWQf6jT+8C9BK"
-    "m+lsjRneeDx4OWqDic5K9OxD3XX1vsHRPfMoBT8Y4ziZNvSXVCZmSTN8FDCjDSXC7RPgwDnC"
-    "XAoApDVdvnyHMsEtWQNkMTkr+pR75wHOrYgEX3j+XHrqqaewU4SeFbpCm4g8u4lvEJDUi2ht"
-    "PwB7c3kKkeNk1JsK6nJhBN4ZDCgidRed3JwW7FFdQBR2FvoAUJJ+7NSjXKbZinjq6KlL6Fv1"
-    "plE4QNtMvK2hB4bIkXaZm51kAvYcxoOAur6oHUVS6mGtrAAwb45RD+uI286z+3AIoHMDvawV"
-    "8onYlIlYcKP+F09pX397cCjHR2+x27CbfD0DF0Z7W07oclua+Ou5MaIt8FC7qHYAAxxN6k2a"
-    "175VgEHcbJ+Y0GUNcgW9BxhHt4q+cQRu2tDR85SHugWcTU8+SJOPbgfIt4160WlrD+vtLYgv"
-    "H0JzcPIQqbXBGbJ+1d+Sbjycen6TsgNG+tgN6fFBGDpLXeRJcezpZ746g+XFR7QBmx9on3l2"
-    "Mz56eCeNIi4dffAAcxyIwuHEaprD3bFt+7FJxYJiDhtXlk3upKBJsekB7L21RLuwUKZstQVA"
-    "B20efjPAkiMXHBLE5WtxQLT6ZoizpUvyJTfG9mvfTz1RPyqyrwLo7Bcepu1OV+2PqWxvPWqs"
-    "1vKaj3603T1jU6DXjs6YnWCezQt+F5BVzWW11y7dorPUXKoHwuS22fkh9zYb2P8RuorAL4+/"
-    "ss8qRAn2eO97f2FciXGwMSnjKu9RzvKydxS1LPu5yseOMToiI44of2McuMUEkeslFsLxTugY"
-    "gxrTzeOPY1aM6fzJ/okvoslxyXGLUBG+MS39VXFEgKqIBtvDb8TRFLwsXJucv2Svpv/h90jB"
-    "T36hrpg+dLEl/eI9yl4BpCcP/Rife1VOk1dVRb+OdBsNslrN3/6uVn5Nnv8YX7Otvsd0nqZy"
-    "2k90Kr593sXB8mPgEYndzuPPqykyY3FiZDRnHMkDyWP9ElhgsvtyYt95xXCgY42oc5ajWzTm"
-    "AT/6LRN7jigC5rCRXn6vAwjeiTdAkvHjRx9xVUEbX00hPBiXYIIr/FfhjDfnroSq34t7ueeQ"
-    "vnlFLNWjabhyzvaGVtjppW0mOVSLiAOX2GG1xpJ7jUFfbpWTpdKJTSY4s6VSuqDL7eZ+18gi"
-    "vBZ23iHqUundQQMbQy0t2TZQ2MliMnISjuYjF2UAiSoxd0QcZcMPX5k8WM3XPir6yfanPI6I"
-    "5MmDq0FACP7D8CYcg4TBzWUO9p0YX+LYuIdY+cYIKHkbPoZ+FMBFUNPOdngPKb50CUKEG/Ly"
-    "y69hiwixFNyGVQqpYvm5M0Ppq56/lI4fPU7ZmPiohwP9I2noxDNM4uhCYbRyCzHWDNy9GfSk"
-    "NhDJrcIRCa4PtLmNaE9uRAZquQ0FXta3tKNeUZzTR94D1ODFXXOWexA9KSfqKZTYNW2wHrvP"
-    "NjAeOsSkepoJFrGl4AK/WmY3fx0dg+kUBzzfu/WZdPPaH8S5fAKEOKh5bR4jpTcRE/bCzRuA"
-    "M4QiO+lp/PT0U+y2geumIr6bAgR8UucmOkECRIFx9Edph/+5fNIyZQw3/lIewasmFJbC+GwW"
-    "Hduh3eUXYmf7Kv4UXaq/NHz8Alb3nwmF/NXVOXY1jgb99XFmpOCxSzMMcJmcmORguehafoAx"
-    "T0BUh0tfhhA5R9bDJnpcG3DdFuYmg2Z6+jliJo4BwjguIFhx7oXn0NXj7MI1RIH3b73G7sEF"
-    "zHFo/R27ZzPQvfaoFuTEWh4AEbtJLR9ZDhpv3bdEvg6kQcxw9GBo1PHHXYHSpwdQexcsWdbQ"
-    "AxTMM3G4K3BrqzsWKXKq5jAjsc6pBy5OvKRpgaIAzDMx5zjs2Thc3KxBj2EuA+6c9SDnSxGh"
-    "Ivup8TF2Th6invqJA5AHbSnGlNvWgUhcAC+dNV+5z+x0zaNDfcSofcUpu9bjCb97eK2F8YHv"
-    "kfQe6e/w97ov0Bj1sOOq0nVIoMKDHvP3ev52+Jc+m64YT3ZEK3C1L5nn7D+ijkf/lB+PhAv6"
-    "13PtahyL6xOdrv6ThuIyTR4j/VpYH+w7IgzLI71V6e3IY0OAPdzftG5TQ3R/nI//yXdgFPST"
-    "njZBLprWc1+UfDF/ac/3PyLdt/u1xlix19VMP0Ev0o30U12GbGtmX8fnKs7stXoJ1FWCcsc5"
-    "5NMqiFaXiZhwEbkV93zPA1mjm5nx386LiHWqbvEQry6lmnxWnaB0J9M2D3F2ml59519ZyeS0"
-    "zLgR5vxUSeWIIz5cogw7E5M7EFdkN4fKnXx3CcIfwcMrLzkIxGT8ETSLrWJAdvXMhOjBskuA"
-    "BK2yL6PILrBS/0NwpU5IBlaCjgymJE25TIIHRX0rgqvgJLWkA3AVOhgr1MlaZTKQy4BPdhXC"
-    "gZhVyb0FxXd2wDH4t7FDy1pyhQ5sY5Ajg7gbv2nilckJQMaD7W3+nVwMy/+ob+OztmKSsoz8"
-    "YCwQZl/YsNrGjtCKu75ClIn+EbvUenqZkAB67RjY7MeY50Ump1YA1Ss3bqLoPJ6OHTyUnnv+"
-    "venM+fNhgHNmchI9/c50FJtTWj7XttQWoqRlTDuogL4IAHLyd2t9nEMZk4IABQVs8iNQcjee"
-    "iwInyFnPn0Nfq6vnKSaQNup5KVZwZl+/7tZ0wO/lwGV3CmqriqpPx04/g8mJ03BPUFinzDF5"
-    "UicZsCIKw08Px+qcOvvuAEsqXx/A4/Tk7XRfa/G0SSc76SbH1tLBQXS/jpxL7ds9IZ7TWKuK"
-    "+ETG/yzqc4I2/25KCHqjXJnGFWGZsH/5F5ODVU+bo0iuuNE26tgPmAXvyqnxIqYwcKoy/+Gj"
-    "p+GyoSMF4PMLlMJRF4ORf7l3ij5DMR4ajWODAFXbxmscKFisLCt+04CnOn3EDFcxDJMi0hNz"
-    "B2eVvGtENQ7CRhm8bd9puJdtaey25zReTZNTD+JQ5kkU2+cXEC1Tf1twQLMyOmUmvGY4VrEX"
-    "pshQrpYge6C/N8SxW4xLqxjajR2O0FBnt0SZadTyWgdZXyjTseYe/LXtB/irLojumOOF5LLq"
-    "IkUjpYj6FBlKB9bTJnpq7sZVfJp1/rbgtqKXdv8BIE5gAMcOkKwoe+LRfSaqJegD8EdW1Eez"
-    "Hwioii068xVNFw/5j7SkI80Zd//Wr/zVj+73iMum5yEf25VpIg/6EUHlSfKw51e0EhQboSgz"
-    "XiIO/1RhwrH6YNxBEyVPtSjjIbJRBYt4nB/Ke+2hHtfO0L41fAvOEenIrSUP8c97JMIfFhHS"
-    "pmWxnbznsjbHirtOtXz4EpHkMpLH3d/14+W3KqA36yTmvJyPEs48+akZ4Ok2wzEyX47Xsydb"
-    "0v/y77Wm/+Dvb8GhpmwVznzLy2JT0r8HD6X090hPMwhv9wt10D2vGm3GV8oRTb+7PLvwqsSd"
-    "uU0Nnn00gnKvkgyF5yZid/BvCFn59LY38ZnergunZveKR7bLa3aoxxH9wlcfqsu4YmDCyU4U"
-    "cUdPsePmYhW/cY9vxaWa0Eo+iTti9k8kW087h4ivfKtKYH1YR6Ybz06eObBcjXUm8gAJrIYX"
-    "GNiXAAyhVIvoLzhTgByxoCHgITBhcEcXQRFJOyhGBqKT4CoAS8Vg3VRwbwNUMTXwzXwIxABg"
-    "TABuU1ecIrjpgsskODI/LQKruPBv3nl1YmoEyyFOkyvmZEGY4Fh56jKXel8OOg6EAfpIz7g3"
-    "ATPuwFqUi8MEaT6sOBWgFfdorVx9KEV9Tz/LhMrEdJE8Dx89RUcc4cw/lJ4nZ9PBEXa3HRNs"
-    "9ZMGccL5mEFcNcuBwu7ycxelOkvBbaNu3G3p5cHTBwFwsxgFHX94K0Cg3ByPuVEJXf2c/sFj"
-    "0UaKuNTTMn/7yVuIC6nw/oOaWuDIHCb3Xna+6cdylInLiVhyU89HpfwOdpTthzs3gD6Vbg9u"
-    "fS4Ax9DI6XT2qfcx8QIw7r+CUvd10vGYG+xC0R76L8rkngnoijoDQ2iMNjFfedDnkQR1YW6K"
-    "S+CkH0GhQDjqmfZTtOe3TQBuBkxy7zbjWKORk5ei/g1zALtXKmxvAPLkms1Nj1Gfq8Gti52u"
-    "xDE/9xBjqdepF3Yc0t7BBZT2AD+RV8R+G2FeI9O65iZmOK9xACDZhSK7wEba9fxCxXaaupiB"
-    "UzsxPhk7UFtAgtKeIjpgE2dHbqcBrCP2ANDWAD+37o6m0fF5dDxa04OHo4SbQJyadxfKMZJL"
-    "1c6CwU0ELsXlgAWIx13abGVhoF5WF5y39QDeirbpJ/SLqBvqYROAPs+xTCrXywFr5wQCN17I"
-    "rdQYbABN6FhTH4rqXTwsII7twRaYRwh5wkEsdGgOD9023VD6j/5C/+A9+le0pw3IjzaUfryk"
-    "7XxF60abViNJ/lI+h6cy1jrGGIcfd3gIX7Fc0jkAg154KembYj3xup+IKcdV+x4UF1Hu/hNe"
-    "s//6R97jf7N73UfjU61eIm+OK5bPAc8sO95Yf1V+qcd8VfXUGNGOZ9M2nsjIji+7X6rOFL6z"
-    "f/NUqkf/5dlYd1w4jCIZdmHhGP3ldilafPpvtKT/9Z9tpd+7DIcX7QGr7C27qFoPm1Ys+O9w"
-    "zt/54bcy8rcsl7siuje1yyk71PoPr2UQ3qNI2MFuvnQphOY3nkvHbHSOYPXhoBZE77WX8BQN"
-    "lSff6r26hb9dcdbDNEbTkFItknrHrznF4JVXirpVndEc2VF0qtLzFjhnDyoKv7V8lQfvubbM"
-    "t/mpxWm8jZe9sFQjd/3JQQiAwkTlqtjJSwV2wVWIAlVgRzShjST1QwQlirc0BsADoEZgYqpO"
-    "5gIcdtYxcXSE8cWVABjqXFk+dxJ6ydHRTEP3AcAUVt11DdEGuxCdntva+kkrW78OoFUNZqbH"
-    "/+qSCwQHA0CkcrHAqIg3HPA8V07PKhZHoKrcghF3gXkJFLfWsZXFqn90dIJJz7rbSEdHTsbu"
-    "QuORSzTI7sJ3HzoedTeLntPog7uAnxPp7DMY6GSX3zaAwzMDN1EkFzAtanoBUBXaSqSlLSjr"
-    "SRFNL/al1GfqQdHcSdHyCPwM5+YBjztZYifm6N3XyN9CpHPgADpDZNlaFjxsIPJSbGQ4J2DL"
-    "vqrtJzg5nmNovyqcorBBhcgtzu6jPIrQwo38LAMGO1DAP4E1d4/QUYfLNtYmF7AMMAawAVTE"
-    "BAJYzPVL2wHcMmDMI3bhxDjp6NdL2uJvgCoBhRwld7DJ+fQ8ScG0dSI4CAAIMBTYdiOiPAAg"
-    "UBRp31S0t4bYcBFzCpNwYQQF7qwUdKm0PTVxG67brUhHQ6v9iBA1O7GKTtvko+vU+TwiOnTS"
-    "AGrSuu0i59RFxDg6aIMYT+3mjMVOLb6vkUfOhVTkuGF7rXlkzi1AMXVMO7a1rCO27MUMBwr/"
-    "J46nbkxG3Lp5HSBD2wMel1YEQWxUAOS5eUOA6LN2yA6kPuhAHTdolXqQLj2r0FbdpC46EC86"
-    "S+qnE3DWwckHgn83j2hQVA6ZovbQqQpgxY5O6qsT4K/lfTmWofiOPGhZnTMWRp632H9wAn0s"
-    "QBZcVsGn+Qq6pm6lJ+sxwJVtxT/zULuqxwaXyG98x5/t/URX+N0Zi9RRuxo+7aCfoCF8macG"
-    "P4arvfpQ5oEdH3x5/FUL3+Rlr7E7e6lyXNKqIsiLO+uCf7RtyXJDDsn+7tQith2V0JSRHa+7"
-    "w5d62uHNl+a0aKJRuD9TGNZ0R9yX4yVH6Sf/CtxW6ov1xVt+aUG+udre8kTewgilseujOwF2"
-    "Lfq9mlg6a3JHarSz8+bO3+hWQjS65WSKXlUMAMw2QfSu1KjFZpoOF2u39IzyXKKv5bzhoeFb"
-    "w2PNQ7g1tZiTjEnYEW3NHK5ik4ff4uZnv2YftUgj8E63yDsdvhZn9bkeUy10xJez1BAHDtYJ"
-    "03FMOO42UoF9SY4VoGoZcaC75hzYNfYYx3eEeM6da9arP5ZGxGE02vXZZmXd3cWKGT0XuVRt"
-    "+9hZuITIDHHJCuBsPdoBRewOOEVMFLbehpwNlliCB/V05uYy50WdljDqqCjDf9aBvYwrHl2W"
-    "ka4cq3DgU4iHo56BCHoKv1kHSD8CMgcnJ6PQW0F8pPRragpF9u1RfDP5k94Q4KcT0ZGcLCfI"
-    "1pbldPfmayg7L6aRUxf5PRciQmAedYMYCR2hpflJRJBw8OAQuCFALoXAcZrDegVqp596AV2v"
-    "C9SVwEER61roAKkMr1hwFNHUJvmSC6gtJ3evMUeHYraTtWf/LbOrTZtNAYwpnty/sKuEsUs5"
-    "Eyppt1AmRUGaoGjfzkAlykyeNPngbjhBxAgK9UvLk2ls9Ebo9ywxKc+xk67v4EFA9jQ/wAl1"
-    "0DNwmHjlz3PZ1lZ6NUELlql0fn6zl9rxc3tk+ig0oqhWANNOfS1RxnyOnrv72gRLACxpSR0t"
-    "db7U/zKf8xwdtEi9zs2OBUg8DLjq7Tsc/qbZ5ahphR4UJzwyyN2TbYAeD3ju7FyjrhBrL6I7"
-    "B/fGNpTbE7s1aXDbZhuF/ymMtboz9tDwWcAGYA+a6kEMfPaZdyIyRLRIeS6/dhWa2EjHhwfT"
-    "JfaTnzr7DDbGjoRpjtmZiTQyfDBo3Dru5cwOy+FO0kX6Twfasj3qrUF70pzLkeCqct/CLIMm"
-    "SvbD3VLcLbdTepfj5dglkC26jGuKC4lffx431cVxVOoHqmOnnzXoaRkF+GWOAFpazPTt5oyt"
-    "7W5AHpww7Ji1tefNJYI4TW4IzB1mW5XVRrvyQtM1X3s4NXt5/fdCM6/vK38Nv5VHnjNQN3u7"
-    "c1FzqT08SQJ1P3sFyyPGbj/22SByFobSeowz+YHnqt5o4+yvHt6nvfK+08fn8dZYT1Xw5ryH"
-    "M1mjW6erD798AVapHYf5zobdfcX9T9t9nPMWb41R6mpI/nzKz6kg9dB2hDx0Q9zligHdiX13"
-    "N5H4HSnyNwf4THohcirhq3v1yV5Q+7JXnLWPDQ+GaPZbJ3KeyktEnSemnEw9LZWEG+Oo5bUh"
-    "PxGRE1o9mKWLcjnBNYaPZwtV0q7yGx2/Ci+Hw0nAFRcPcF9Y8WIHaG52ipXvLNwQgA7ilRV+"
-    "Tk5yevSXwYtCUcAT705GYpyIy3zwTxBkvNq34pHVOCAJsw0TUzOI4phk8M+cijsTKz1G6+jq"
-    "leSWJSz53eDdenCSautj1e9KH46CIMtiRdl5KhyrTdIuz+ZHzk6IirBTZTzxi3CCMbld6DJR"
-    "LmIgMiYnVkWhT4bOSiuWu7dCpLadTp5+irBwl5hEH9y7QRrt6fiZd6RhdvLtY1LcZNKLbf+c"
-    "8SfoWaL+tA22DldJ7oT1ah0NsxvO3X8dgJ6s9wJHRDENeQmTGOT3MBO81wN0gMge+Yd7RP4F"
-    "AHOIHFVAkJtkOUOvJ9qOABaYidLdiW5CUCQlmJPjMzVxNzhl/YMjTOIc+4N75nypq7YP4HYy"
-    "nXtmHzpZY4CacdJFB65vAI7Sdrp3k3MI4W51MJH3rwxzbuNF8gutmiR1UhZAvhuXHC3rKhoS"
-    "Ws3kl//ihTg1b8EOS0Df1PgcYHEJQIMyOqQVoDfABO0ACJx6xM5NbGXJUZUzKDfKcCfPvQCQ"
-    "OhycQJX7BSYHEdfK4TNP6oNtbHGO3woK4IANRYFyqhw7UEuPOg0QBei1jNYz6uOIdDmDEjrp"
-    "x9Bo/k7d9A2ns+fU8ePYnN4uDLOOpWMjh9LQkSOAGy3lyz3qBYi9K20aEeBtmeOT0DKknTZR"
-    "iveYncwtbEMEad9ZA0QKuKU/aVRlc59d5EiXcrWowdSmyBBg1r5CfTuvQ6PtcFcPHOCQbQyb"
-    "dsLllCuqTp/cYfvpEnWkyZB1RONyb635bUx4CNQ64GparjgQnPqxHwnuPQC7pxddvE45iZ2k"
-    "6QaGen/mMeou9zjf3vgyvDRRv9un+UcZm6/ip9G91lcr/68XbneMjTHVn/dKx6+vF37HN/Pi"
-    "YGZtxILWwNmH7SaNxNzifa9YG8reGO/j8mXenuQyfLmMt/yKW7mzbg3x2gewNfWV68u/Bj5z"
-    "G1HpLOVg2Hmiq5HoqgBtuWNlEoq/8afBZ8NjcyISu1fj3/zSHMgVR3FzEMgxOSDXRgidTJtv"
-    "e3aeHKT2V/BSC1DlIz7aQfPHeM3p5gTjr3/0Yiayc/jLf3Y51Jz35RG45jd8PiYO43YAi7JU"
-    "k6LHp0xPjHGI8STiiGzPao1ddnKunND1r5FDxTjZKKJr+vy+ziTBnBEgwrhjRWzaiA8d2J0Q"
-    "VDR2EHICntJ8AyIo9bCcSDxI1zicJARf6rO0tbELjHDGZ7gDTKKdXVISqQomvKjHAFQMdjlu"
-    "3onHy/fQxSIbTtz6My65fa70/Xl0j1eIjBh8zOMWq9DZWXYDrs0QFzsCmcSc2xS1jT28hwXg"
-    "xXTs5HPpgIcrAxQEcIq9PFBaZeQBFNyBgugv3UoLcFYEB71wfrSDdXjkTIAbuVDOmOriyK1T"
-    "ZGx+MzcNvR7EkNahRjgFtgIp29eNBor4YiAHSNhm1Xgf4ds2nGxtF2oJUwAdcDXkgiiSFKAt"
-    "wAXqA2QNHj5FnQjAXAZSX4h6+/qPwy06BvdtOo09eA19sPsAGg7KJr6T2IRysn6IIj3sltjZ"
-    "10o+KBz1QsNLe9He0WNI37YnXm9kJvLIo/6yOLcdQHQc8ITJBMWDAA/L6aYFwZdcJQPZlm6o"
-    "kIO1jIhPDtVJdkBqg0vFf3WK2gEDFDrSMF3FjQHGVuDwEVauosZcBefa0hJouYtQOtYkhyJt"
-    "j3bqgNvayg4AD8jeolxuVOgAjLa0Y58NC/Bnn9oPl+lAenj9lbQ48yDdvXUlgMzho+dSB/EO"
-    "Hj2VnoJGjxw9DVcN225wax8hbr6NdcOWfWwGoWyC923q0ToVYMnh3OL4HfuX1ScXS7Btuf3F"
-    "7kfKpihTrrAK63HmIel0Y6RH7pWVvAqdekC0AEsaUT/Ona6KwYOLT13KGbQOOgkjF1qr9HKJ"
-    "VwD/mujQCGuvIKtLeiS9EO278SKoKQPp3F1syR3XXs5CjOp/+JUUghZ2hMwvfjPNoB4iC1Iy"
-    "cHX5LV4jIf/kb4Yoz8Vv7V4jusoLXsswXKLJ6fA9HGoh46EsHGquJskYkr3mOcLn6Itx95lx"
-    "qNYX6vmvxdHw0JhklK/hW+1xRxmIr/G98tQYTy3cYx4s729+Zjv92IfN62M8fRk4v4rJhv/m"
-    "lzCzM7Wd/vwHW9K//62I3x2kG64pVFz/5i9tpk9f207ve6Yl/cT37gsdqwYvzEEp/a1f3Uy/"
-    "8+J2egZF+v8SK+/HMYj65XL9+qfpMU4lTwqwgmB3lo4Z2olLx/qdKHf6is+7SS0AlpRUfap1"
-    "1F2h9cMv/vOnXA7cpF9cshc6lz2VOGNA0K/x+7Hpak6vgJq86wTPFZXrz9DxPQprB64GnKY4"
-    "c2J1R8PoN4v46u6PewrxGqlVSceKX12b6fHRNIkIa4G9sBoqXFz0PDgUehl4VSoWoKyGYruD"
-    "seYI4DYBUjIgUidLoUcGCoKDUFRHdCGnJg7BBch5pEhfX0+E2ZpDzwpdrSWMJgZHDGDlDkHF"
-    "hNuCLNJexTJ6cLVI27gP0h7G5UTtpCphMB/l8vNgmawP41PHxfYxjwIsnwP4AZechJ2AdLPu"
-    "gtvDPStFu/InzPo+tuYz2WzfZYfeLe5y2ARp6s+gGD10P0RIHanfrAXQcuIU/LXD2eg/ciy1"
-    "IdpUSV1x1n64WwIleSWtiqVIQ3ChaEer9E74wfkhHx5r0toyQrpYOYcjNYA+kZPwfo6GscyL"
-    "HEBtWZ0wBVCKeYLTi6O6WCE2pN7nOeZH0NeJuYCwX6a+0eg1uJILYRG9AzMH1mybB237IDQ0"
-    "TkR1WjhXRHnv1svp7vXLUe+tgA31vqwzOUxOLqabpx0BkWBL2sriV8sTtr4EiAAnL/Onsr76"
-    "UBoyvX/npQBBivMEBDarwDMvjqADLONrxFOu3/Ez2P5CZy12c1kBgGE5v3IalxYmoVs4VnDE"
-    "5Mq4q3ZlGQ4ZgHgZmj4EqBzBUj3EgE7WjQCL5reDQ7flGNluchHtR4scji24HsSgq+c6Qu4h"
-    "Zj114V1RJzdeWwaAXkUvC6vva8hdGCNGjj2VhofOpb7uI4jmZtM8QG1m4iHf4SYBpgTP+7Tq"
-    "D42brpw8aXdrkw0NcM9CvI3IzvZ1AaOI2CODBFqODS42tlukIeqHP9kKvKLnTYyxIhZER8vN"
-    "J44asbmEgRcbKOTNhgXUAaJdIOV+KbDzaCsPllaEyfFR0KJ1sAaYddnTjc009fIkDGnVdo2M"
-    "4NJ8Ufxdl0DRUS1/cgw1VvJC+XisX1VYo3cMhYp4sP3rXmpPEa4xMM+Etx/vuhq901thOgAA"
-    "QABJREFU1T4Wx5KH/L5n+OY4G5MgszE6V272h8iFYw+//F5L9E095JjqZarHV+XS+osr+3xT"
-    "aUFen7ua0mv3t9OlE7nsbypzbwPPmKFLP/J3NtPVK5AR5fn0q8wL3Vvph75uJ8H85z+/mf4R"
-    "x+Bw+EZ68WXmEvrJT/3VnUjkb//aZvrbP48fhqYXX9lOY3Ob6Zd/zPH9bVDQN8jCPEr+vwnA"
-    "Yvh78muPJqcKHbCNIxNUvFcApxYzn/YIi6MdoQpaeQ4yLTRaiwCvsverDiJRS+JeQcA+mgZ3"
-    "36N7Ve97d84Imv3iXz8Rp50vIuJvQ8YanyOhKt16PsIzroTXcwSo4spJPfnfqmwBOnheRXl9"
-    "Chs/E3CvNL2gvogAa42fk4BbvAUemmTQMru6PoIera+vsaNpeRm/TAQOxHJhnCgEMq2troSd"
-    "ODC+CChSX0Tdkg5A1uAABywj6phDmd1z1fLKkt1STCYCtlwHgDtmW7PLFBDxWB99ff3BzYqJ"
-    "ncnKydgJx8vv1k+4KX/kcqAPd2ueUTvqFH/es42hDArlENS4YMFhYILGWvf9h9PsAsR0AXYl"
-    "cjxYEV+7mboGBlIPRhzb9mEAExFRq0f8kJ6TqQrbHYeOsTvwKHUBF448uBuzhbP0gogsIqWy"
-    "nIIQgZkrX59DNIXxyAd3XguRmOIald4tl9vrnewOdHUz8edjc3TXbR3wJGkFlwITBirJb7PL"
-    "bTYOUZ4hXnbQUdeC+ymUxAUiQ4CCXvSVgqvixgTaUK7QidMvUIYu7GvdoT0+xUTbDhg6S3kH"
-    "0wBlMr8CZ7ll9htBSeYQViMTdatY1/rSfIBgaQ1QJxdMrpE6YpvQ0QB1JADRaKimEtRz0+Cr"
-    "+Yw6gXbkbklPmfM0w8Q/THh1pABVWINX+V1zGPOIbwUJJAr9LgWwcvRpb9f0QoKusZ4/fRdx"
-    "6IkA1LaLnByVvt11aV4twzbtZx0uwtVST2sYG1wqy3v4tQrwI6efDbGccd6+9gkWJZwTeegs"
-    "dWH7QcOEUdR6RzMPjzB6Sl7cqRriPzhR+tmgDdopg2LzAMih7J/pK8wuCEIB1NpGE6Cq+yiN"
-    "d7LZwI0B5o8Yc37Jt6BdAL0GDUj1prGf/tXGDGTXjOOc+LZOfF4xhkQ9qVfJBhTilHsox2xw"
-    "kKOSANxyODN31iFYGssc4LJrtD4iZUqOiJv+OO6Vq/G5uJV75EfiDXBlHylfnuAe3ncHsD2f"
-    "6DI85dt1NQXXR3HyWcxZrjIu1PLNtxJl8dYYvoTb617817/V8xZxEHFxcQbwKu/1MI95wiPr"
-    "tfSzH91K/90P5vHxMT7fts53xrfTjfuUGcZ1FJxh718CoH7o6+pZdq3/MXYahh+KaVv8a4AY"
-    "08sO8PQ7hBNcadFdoPLp65iyYBNAoyX5eqxvr6df40DsUTRGXtca/RNk2ZGE/3RwPAeXJqgp"
-    "HGvBw6lG/jXnXLMNrz4KkuRKNV8OIHEZtUTcMBnHzFkFqHVGOrAdKwYOo9ujQ9ug+jffEWeA"
-    "uJ1ea/FV+Y/OKkVwOeE3Xzm9DCSINGis2U/zu9nLMeY4I17qQD0h9a2mpyfQuZpnFYwOB+IC"
-    "J8fMnUKPhclLUcIy7upjOQhbVFfDK3Cf/Amw5MK0MzDHZBggySV0Pq/PLeVOEiqru/JWZGiG"
-    "FJO4nbyUaVUbUZH5/FcTDKsCEGz/tLawO07dGjqPNoa62couyHKisQ5d+Zovy+Zk5I/g8R47"
-    "BhvaJ/zz7oSqf6s72sf65CdIXEcRP7cplrr5HjsfGVVVyN8CaN648kr4ta6OoezewuTpZGhc"
-    "ZRKyLQUKivcED15yL6QtLwGV4KhVURH1qvkEHNLDB1cxH/AwJn79Fp0r9aI0ADo/g44cPyfa"
-    "aEsRKglLw9pJ0hjlIjp0gjV303V298QBzwLK/Sh/K2rykOXRe5epv32hpB+giYk/7wxkysav"
-    "k4icoxNnnuW4lafIB0ri6G9ZTnfFyZGw21hn1hV/a21pA/tPEDaPHbAZrK/LWXOH4OHhc+xM"
-    "7ArgGOcfAqJmJkdDX0quiXUqnWU6zYZVLaumK6YAY2GuAfDvzkAXAXLToj7JjCcMWA8qqHvw"
-    "tSYYZjHpcP/OZ9LD+1fYaKCVe/SxKJui3dCFMuNcAhPpJtMCBkKJa+z+ZUDWUwGyVIIXZLa1"
-    "XqT80nIn6c/A3cLCPNzWWc7jfITF93vs/HzwYDTNYoQ0G9ml3amnVnZxhmjTBQe7ZhX3xZiG"
-    "wrT9RvMMtvc83F0V1bV1tgoIbNMUA/WtCN0wHepo0TjmF2gNGM6cNwvl2JZtxVn70hngl7Ku"
-    "knfLalP5c2ETIkWBP2Hi6CeAlmYfnGxUnJez19IKIAZs5daNasJ/VWERu/VGAl/oFVEGxWS6"
-    "IcW309WYm8bnnMc8bjmt5PHb93od6Wd3mL1LZ6gdfndGs3egKsyTeJXr8wsf3caI5nY6+iU8"
-    "0uWxGX+THyS1BvKTvAOWN0Yjve91PQmZPi7sXvH9cbmpCv13frPCK28mE9ZLE5GwDsOFGo0p"
-    "qapZJ6ZGn7vJuUr1MTUacTZkrLE9Snp5EHH20GOVK2/E6cTslSdQnk3H2XxH1+CdHhfxuMqP"
-    "cuQwheXut1KWPEhREjPDn1Baj4nTlMql//AQDnbooDbiKTsmi0/vZfecz3r1sgqDowLnYI5J"
-    "egqx4ByachlcMQiH6E8uAiIExCuKAz0GZwV9HBVnBVba5tFmlOIJY3aADg5G8BtxoUoURW7C"
-    "YSI1LAbBDWOiNe8eiqw+lfZ+ejEmKmBaIn7PKNyIsjHJkclQkidugsWzR5SEAjOTb9jZIi11"
-    "UJyEox0EKxTSOhUgWV6/+XPPlhO25xAWDluue+MifspiSeS0yNmDSRyKyLafk9gsRldY46c+"
-    "FIs3NuAO8Bu7P84E+CJ58riUdvSrzgWgiUN0iVTRnGIx82ZawbUBmHiFkrgJc2WQhRvpCBgF"
-    "I7ModhteW1UeVCzAGj5+hsmvA12q0QijcnMcTk2YMGJK+XWzbY3HCliYZyfe9Dh6QScR+V1I"
-    "D+9eJ+wGFsY9Mqc9LbM7cGLsGgDxBfKObg5g18YzZ7Z/ByYNTl/4qlAod9bdDydL/SSvUKAm"
-    "DfNpn8m6J3wIN+oNMLXMAdN5N+AoeZkCQPRgN8zyrGMS4h3BZdPsh4cqKz4de8AuRsTVAsMO"
-    "uDvqYgkybCR3PVpXM1P3ec1l9G7dShehbwVokHs4dOJMOjRyhrpAdEobdKO7pd7W9OR98s95"
-    "hNSRCt9EHByn1m30uQiXd+tpNFRRW6afeTiA7tg8yjmOA4dOpn1yk3oxp6BiPvGMs/NyCbtU"
-    "szOfxlL/eJqemgBkPUpjj9iBS9bXMfEgB0sACy+KdACtgEx3Fbresu9Yzi5oS4AluFxnAdLB"
-    "br8lgHCYspBjRYYg4eAEH4CT5bsgaQPTIrpDwtRPpm+HjRU4e8FhpI5CTMiYpRhR8xvWmzpv"
-    "K9S9ix9yx4+FBAuo+TAwJP1gOFeOG/l2J6oLBP3k8SeqLtoaJ+LjzxdwGd5/XvbbiJP+ABX5"
-    "9rpXhIv0m/zS75pcHh/P63g0V34udyNpfPZj+Z4/5HTzEqoqj4H2uHKJX99PPfJ6BLX06k6R"
-    "dMPr4x/JGMN++p9+bSv993+Zdv4TcJV6/BNQlCcqwi99fCu9dBmvct/ezLVHReWRxUiiEz6O"
-    "GHeQ/I4kM7nXv+/skNk9ujfxS7iMIPELwGDHjc4bH/iTBxgHmZjUGbQCIEUY46pfpuvOICnf"
-    "FfVWoCGjrrpHxEHKEcz4/JaBWwQiqsxV00PkjHt+Nky4RFjiMHAtn/U8GKn/SnwRioFLd88y"
-    "m0GhfZbeFlbZ4URpTsE8u21dpeJFDBW6PrAugqslCvFQYfJh0i1sWZcx08XE78GyrrRdkYc1"
-    "d0Z9DYsapyLHlcpwCVGRBqt1uFk97DD0uyvzZb67eghMSeQFkEYRSUsF4RXiATbgj3volmwz"
-    "MamonAGZaRcOhPUcA3cVgSt+QZaiLUEIWYj61Y8cLu0LKRJR76gFWK+INFEPAkHBn2curvWg"
-    "DwX3rLUFzgNpTk5Mp8uv/mHsJHua8CPHz8OW7mZS1L4RIrzIg6Ic9FuYDImQuuXHpCWAdtL1"
-    "J+hxJ5rHEI3dv8ZEOBegYY2JXjByaOgYky/W1R9pmVvDp+jjEI+6OjOYNraNFQlGGRWZQUfW"
-    "g2B2QxDw4A4gYwCR5UiaYxfcMiYmBCxtbYTHUrnK3EeOXqD8mklA4YgwcW4gHA3tYrW3ETdA"
-    "yvwLWJyzNbEQdUlNBDHwLR7Il3pRyxxrMw4nTi6pYkcBjUcEacxU0K6h0NitB9gg0dg96W66"
-    "MQyF2k6KBokq2tZzEeXwZdtd0BeAEzsgAcoUyW5Sf+6MPHLkOPGcAYSgnG4YgRfK7rPsDrQe"
-    "u9D7kvvmzk6PGxJQCaw8JcD+oHjORKWPsE3FcwecNsWYj+B+uVTuR8TYEQZzMIZ66mzqYGfh"
-    "6NVX051bt9L4xB3MfHjcEJxgmGoCPDcFZFG0fR0ao7ra2lw42N9U8Ef5Fq5YF2JfyzLPETmK"
-    "410IdHEQm8BV+rTSD7A3PThYLFAUg7eC4BYQ8atXZX6tJ9vI9OzmtlP0WxZG64CnuVkAL0rt"
-    "QfN0RLlWq4Asiks9KEJ2J3E2orq1lY/iiZ4OrXZ00K6UR06iacRQZd+yjfj+xFez1z3eoz/v"
-    "4kvkFPwmvcfFrVFHtpaH6nPt3YfmdMpH45DQmq5Spt1fmjyaF8KHmRI+RTLxvtOf7s1xNb/v"
-    "CFF9zLNSyTy0qXupb/NdnncEfv0XxWI/88+30w98aDu960yJ+/XDfOXr26MGJue3Ud5nIKLP"
-    "vulrD4KzN3NBwHwM2uKtEH98qrnulSIEWetZFSFJ/DUg05BioTPv+HFwirCRaE4/RljSy4N9"
-    "0WfIHBTV+WP3E8Fj0mRCZ5gLzkTktyRlxHHxLZ4zaFOx2nzl1TnTd+QzB6qDBXJEh7IuYpiJ"
-    "vDmY1ktp1KV+QvxQK39OVZGQE/88OiYzHDy8DGfKA5lXVrJlc/PgAbKx3RvQ45Z9LVfHRAZH"
-    "aj8zRDc2ftx15S46DSM6OXSAtAQorsjlSjhJzMaxOohOZhdID+E/dbTOESbb20wcDNQdTC7W"
-    "6SqgYHFZMUfeVq6iezvpWMbgRlHO0M1C78tJICEGa9vHGQE8Opk7eQc3g0nJ8cbdgU5Km3Ca"
-    "jMtLAOgVIjnb1npkZhFQOiGZX7kNCcAohyPELpRdcLSEDaU5yrCEzhhzEsrMiGx60eGh3pi7"
-    "0+XtPyAeJ842OFmALNq16PQJBm0dFeRNSz+0dIA7G1IQHRwt8j43cx/RH2AAcCe3yom/m2Nr"
-    "Dg0dB1zdD7+t6O4IfmNHIeK+waMn0Js5weTbH3S3iLL39OQ94hkjepSa8d8Cs0XQplHTgcPH"
-    "ADE3MXeAgjtpb2+0hZHOAcwcdHYdJmd5Mmf6DsoJzh8K0daXVtDNexwELXiw/imTQGYjyqlN"
-    "qaqc6HDJgZuDq9Pbz9mIh8+k+7cRq7YiIkR5fH7hbtqeSOTjcOiU2ae6ug8jjuzC38sRLqyp"
-    "i7iJ01u0GQ2kmNl0i/mGzt5euHCXCD8Ydq70rDK+iubuICQgYfLCoJVde1nnCO4NoEN9L22N"
-    "eanXFrsSKZjtJqd2GUvukT5ujx5eoXa2YrelYKO7E4V7uEYtFwAngKeJqUdpfBy9qxXNLmSA"
-    "Lb0LRg927ce8Qx+i1h7ioM45EmqZ8wyXVmfTgbn9cPbsM3BxaRMNhKoX51DU2wdXi/F0HVrO"
-    "4kHAtf9oW22HdcL5EiCFWRD6kcrxAnaBnR+An8SlMrwLnWV2wgqoDwDmMefAT05ki6JA2lvO"
-    "p3Grz0UrQ1P07V6s/ivKDD0td7RCzfpjYeBCQhoKQrAC3+Cyb9IY2ZfdmH9epTz5A1mnveNT"
-    "1eY+BwiqgkYclD880UYlnhI+7iSWx1DemuIxHzm084PkUYt4RxR7vkTgnO/83cjrPuMLf3ZI"
-    "FN5E/PWYc94CKFtCP8RHR5OGiw8F3Om641uDtx2PeJLk/+Of2Uy/8ePsLM3aCzu8fOXl7VkD"
-    "/8UvsHvyAe38Bm1m/6xTg4RjP6n6URCTTkgGuPmUb+GlPFdOtW/l/fO950xE6NIhgqBzfKZq"
-    "Jw9ujhOTgwATqSAmexdcUAgJ3h//FIt5xEutAxOJg2EUlvAlGQFZrDrDjTidrUlb/BWlDY8R"
-    "MOKOGHAr4SNvxpo9h59amnpuuDxWxF1c84gFBQ5rTjKukKtKV1HY3UWKEORQMcczMPOHQfUg"
-    "hieHD2Ny4PAgx8QcYnAHWCGmC9EUQEfOlFcAMkCZhkqnp6aYdCbTI44NmZzGlhHgKwGkjFvl"
-    "91Z0PORuzcyhbIv4Yh1ABFMr7SM/3QAw47Q+tTxtFhV7yslaCO6aIABbRf1spWfbum0hkHHM"
-    "F0RqWsFKcVIo4sJ8z+1kHRu3bhlo0V5MZO0oo4f+CWl7qPUCIqAV8rYGh2F9nS3+1NHWFpbG"
-    "UWxf4Hn9/iTV8yJ5IRyinUMjFzhAWsOPeWdWERvKsfDZdL2cqDRIKiBTl2gRkZ4Tn5O3HLBW"
-    "Jr/+g0O0B2YzqEtFNQIyd8Z5nT7/fBpgt6KHVFsPKmtrIV7l+kcPrmFL6zLpUce0jYBtdvoR"
-    "drjUJ8JeF3H29mlFXqvqs6HU3XFgwFyRn/qk5bNk5d+YWMl80L4TMvlWvGodq7Njwbarutav"
-    "ulb6lYO2NYSu2pkLeGXjwJ2X2VTxCmcKHglAc+zk84CwkaiHToDiENy00Xt5t2Mnemly6gRT"
-    "glOV4IO2yZT1KQDsHxhB10rTFh1RrhVEkwsYfA1xJGGzvTDqmfzZPmsAHk0zKMIdoH6HsE+m"
-    "+Qu5Wt4jXttVvSXoVX24hbnx1Ek/nXhwBbclDJKei7GgA87jIfSxPLg8uEUc2Hz5yg3SdoMI"
-    "QJnDn0+c6kwXLpxMZ85wADjGUe8BcJdW7tOn2tL0w3Xa6jUWAAdoX9MX5LBYYwQNUSK6WnKN"
-    "gMpB/9KyulRadtehB7qX6xrnegLQ5ul3mmwg8hg/gqtph8DO3NZWtm0nV1ZOVuh3AZysB8Fb"
-    "5l5br3AQodPDh4fS0eOnoTnAmWYd0DMTpAmsVM7P4IqkvlSX/ZV/FUFyY2zw/bFXHhljWGzw"
-    "0xyi+btei58cQz1w83v9y+4n49D/48Lo7lXS8rnRbwlfvqvCQJPzyy5ljC/+DP/EF8PQi6+k"
-    "9BP/cDP9jz/iQvfL9yr101iCZrfmd/02uzW/N8b3dnj+B7+zlf7RvwB4vwG4irJBI419I4/o"
-    "/A2GQ1VSbhXAKsXTWybC4pKrqZBq3bX+tDtE/VvjU3McOXtlevEtT9ro6zDQMm8wgOVClEnI"
-    "2JxQnAQDZFnIqjOUlORyxdZy/Kn7EPHiP7gJ3HMnInKvYCYIDpyEXdHkavJTBgp0jCrb0TFZ"
-    "7kQN8WKyzSWy8syrStBFH8NBVnFYcM6ILrgRDOA2hBO3orlOFI+PHjvB+XtH0/DIUUQaA3AL"
-    "spFDB/fY3s4kkCc+pgcG6EDQhNVg6dHjKP+yo+r2nfsArsmYIPYhJglpA/xqd1P1IA5Rp2Qb"
-    "5fIw1UBe5VrtB8S481AAqhV4/agLtrDkhIHNH+pI7p9b03sR15gfC6/xRSdKwap15Q7G0LHi"
-    "2XxGfVdi2xAtAqYEDE4y1qI6ZsbTyfLOPCzBulKnbJtJRpGm15HBvlDct40fPXjEfPlHHA7d"
-    "ls6R78PD55mIMkenBR0cAQcpRDjb3H9R54G4bSlpBj0quAvd6Eg5qU4jzlPJ3B1s7uT0u0cX"
-    "qZc0gk6V9rLk/GimwPPo3GmnWQ1FcsfZCahNKzlI7eyUc6JdW0PXjuNcNAMhyFYUJnjJ9KDp"
-    "B+smA9qgY3IVtF3ySDmDy8Hd/CkulNZVMl/BXIF+VTw3/jBoSpkVPbbCtVonvXs3XwaUDzBZ"
-    "e+TNLG1yANtrKL9TP8+8gPK44Ib89PQOofvVi62pzwKUpgGC1Af1o3kLAak79UJMSP48+kY9"
-    "KdM8QNxhcgQL8IIgLZXrT+OcikQ9UmcRg6XuHuztP5QOY7+qx+NjqC+BohsQ7DWKSqUb21Va"
-    "OAjXb3zsZpp4eDNAmwsiaan/0Cm8Z7pXmf7iu/o5KPsgHIV/ll57+TK7+LbS0xfOpEvPXcLq"
-    "+0XErcMAm3k4u1Pk9y6cyMXUAcCl5tPDsTH+ZsO8g4P9cEmPkC/7hAsgNwfAuYIk5WoKMt04"
-    "0YYel4uj9X1bGEHtox3c7cuxOvwUvSe4alk07o5fT0eQW6eh10z/KrTLteuhDhW1q/Tv+GEY"
-    "TXxMsygagnsqaN9CN9OjszRiurUFGJO28Wff/1Jd9hn/2yZ5rOEeTvzZ88ru/t01Fhb/Ed6X"
-    "xjjwXQVodG32VaJ4o3tzHMX/Xu7Nbo3v9k2JIJuLyYvGyBN0Gnf+PLac4WPnH0WF/+DXt9PZ"
-    "oc30H377lwfIolvubCqKztC/46Jr5npoqDxIHprZ4Y0+tPPdaPYZ+G14/fPPbqUf/z8ZAJrK"
-    "+risNi9+rAr1ifkDpdcrZlfvffPFf/MhmjNtw0jDTiZZ/McdQm9FPJAznEM4IIdoygk4CsK0"
-    "SRjDxVW18BYDbwze5d14EZ85YDnI1i7SVAQRgwp+DeMVg0v1DCSIwT6HoeosrkArwENT2YlD"
-    "e0tat5Yj4MCttXZ3zLk1W8OfivHUkTHL2yj/9h/sTydPnEqnz55jojkcoiV1ZQQPwfkRsDDp"
-    "ReeP5HIeoy7g+rQDnvrhdh3k18+k9uDBXZSAxxioTVPwg5hDgNWtLgwAA47aMhOBoCkwDvlQ"
-    "v8Tde94XEWlqfd3wkQb+1J8K0QXpu1PRwV/wmjlTwBoBAt+cODLrVCDJM7/8jQnYyTtEnJlD"
-    "4ER0ZGggnT41EhbBr916GLpP61TMDOfMpVFMBAD2ho4MpF50yVZWt9PDe+NM0p8AxCyniy+g"
-    "vH38Avo6PblubK+qvaMNbSbymDsCeRTgURfqBKkQz6eY5M1fBn6KeTjgF67fGuYjujhUOi7a"
-    "Wi5K7KSDruTCCLI0Q9CBLtLm9P10YF8/7b7KpKtBS7b7Y8YhzBo4cdOWq6vZOny0oXUEbVs3"
-    "0Zz4D3cSC9pn4pb+1jiuR06aelECPI2YauBSTpt2v4aPX4LbyNmDcGaOnXoWm1D30u0bn4YG"
-    "ttBVe4qDkK9i1HMee1zH4EAeApgJ0NxJNxj0K3g7fua5sGi/yOkCPe7UIx37iBwUOTo5bftc"
-    "3l3Y0noPmoEuqraHlBkwBefoNnG+ouBLq/Qnz8kxG6KOMjhyd6L1plX9JcCPgE3wKYD1MOr9"
-    "7T3pOEr5hrl/4zPojyHbpA7k1A4dfRrwBucM0OuB1KcuvCPqQWC+yhE9z5w/l06exBxGLyLY"
-    "7kMhNj1BfgTKq0uX03afoLIrzU4iskf/SqZ9d5f9VyAJIKQ+pcUDnSsA70xLAkdPSBDkabpD"
-    "uvHMTjlmq+RpE5pQ9J8XI/RzxiNpyIWdQ5NkqPX7OMOQ9lfErzkNOXDW3SYcZW3R3bl9g7K1"
-    "BRfLfKjAD2UA9lTGZ+FFee13Ln6arxijmh2/wHdqJfqx0ZjTDK6+sEir0aopEmk/qL/mnv3l"
-    "5Mtz7eMbPBjTmw2zV5T2SeOx3c2J76VCPq/4jYah8SM/h+kXbNz96Dc3zD18ejtep4+0pHdc"
-    "SOlTL5I70AFknb7jq3a2FSSbvu1dLel/v0mtSJqsm/4sfhhid1wffk9L+gS2pKJS8fP1GC3l"
-    "7Pa33fUvX9lK/9ZPqzNJ1p4QB7tQjY5uaaQTOr3YQtyS6UYn6uSHf+C7PqKfckVV7qjP8lLu"
-    "xeebuTugNYfP7w76fnLScQdVELmEzjtZzIXwnYlXtyK2MHVjqPvPE5OuAbpKeNvXuBn5Ik7e"
-    "DRgcJB5Dj4o8WEeusGvp6s3Jl19k3cR0M3B53lWm7MfdgTNMEiq9rqLcrnjJdPZzLqCT5OyM"
-    "59yxPZzB95mnn0kXL72QRo6egJOADSomqBBdsJPJyV6Ro79QDqfjB5cIoBYgh4HfSUtla0Ug"
-    "3XBjVKYVIHnYr3kXyEXTE8Y8hK4M+ZcjFdwosuz9AKv1rq5sS4vKYRLJgNSVetmhKLctiEbu"
-    "A/EqXgwARRzWr+DXtNUnc+VvO/i9KMabE93CBhh1ffLEkfTUMxfSArpqr7x6I8q0TH1pM0sl"
-    "+2WUttFYAdRpS0klYZT1Ebsus2NOw6Rt7DTr6u4lnLsJM70EcVf0IzBRDOVdgO0uNy2PayNJ"
-    "MKU4pgsdLMV5KrwrihUUbMBF60G8dxDjmeY5aA7/DjaOKJkTw2SK/s/szD3eBW6dlH2WMCei"
-    "nj1ixjYy/PLSDG2PPhdmDUKZXWILpM5X2kQ6i5jl3PCurp1A5NHoVXTDbiJCu4/+GPpHo7cj"
-    "D8cxWyEHK+u4MfHTRnKF2qGvcfSYFgASG5uL6COdT+eefi/tscJuxtsBbOTYhXhU8M3PQ5/V"
-    "R3I3pH3Rei5tap3GTw4h4CFE65aI57C/Fe2JmQj0sFYRGx45dgrQ9kLsKNyHWM/Lsgmu1Dt0"
-    "h+Lk+C02d3ju4RS0sBkcLhXmbSeNo/aiM7a8jCHR0HFjkcA/FeE9r3CDfGpCoq/3ELpzgCF0"
-    "BdfRiZMeNJPQCifNzQy9cOjcMTh4uB8x3CCHiqM71rKaHo6yy5EFlXjF9takxBp1I50tYY1f"
-    "TrIgS70r+5H1QHNEmyl6l6YFlPbPWCzQH61723g/bd0Oh0rr8Z3og/WhW9WH7poHaktT9sM4"
-    "9By6X2ATxDycvg3MWczBaYydxhxk525VNwu4ALMfSY+Cu9JPo0KrP7vH0/LVwakaoIrTnnfy"
-    "Le1ZwIYr3nWzWOXa6aW41u983xFPk39fm3+RduVuRE1BoLuGDOQqjjRMp/YzIFe858cdf0ua"
-    "jY4lHTmJ5Xu55zTzOGmc+T3Xk3GUsD5fmRpOn5s4sbOe/NB8Ecii/DbWzNv2b6cPPtOEQpr9"
-    "/zG/M/Skb34+m84Zxur6X8f6+vd+9e48f+0ldgp3I4Ggm//gt7akH/suVCiawMl7z7WmQ6zn"
-    "WmEufPhDLem//n4W+08gfvtSVsE/+YOt9G8DrlD/3SXPe718fNeZf50btoFOJdM8Zvrkxbj8"
-    "w9//4Y/Ec62jlY/h+vp/YqLAf+MdgqILNP0zqd2XBCsRR6bwYTQiwAyQsv+ygy9PQpnEJX47"
-    "qJfhs0iR8DtSsaNAGHiL+FmZ+9nnRm85XzkP+QN5Z2AN7g/hfc4dutzrZSt5yDnNf+24nlXn"
-    "oKl+0aZK4y5jyC9MIvLENl7s8GwzIJ8/eyldfPY5ttEfDWvgiiza3cHECjo6uEXMGYyJNV4o"
-    "rzmIizizQVPADtTdDigTmMxOTzNpuI1cjpoiQRVmBQEoXOKnk23qPnsQdNRZRMckweRQ0xWh"
-    "vtaZDPIlF0OuIXVHCPPmGW5yvPxZNrMphyxawTziJgDzHmIUZpht4pNLkk0QbMOdOpRGhg4B"
-    "UibTZ1+76lQaopL92iUCEMZRPygUEwu6NnLAsBGFMrFmLRbhXrRhoLSn/yBcE0AWE5FlNCO2"
-    "e6QrO4G8SE8aK9WkgeKzwjFaguMiOHMCV9TVCVjLuye3Ql9L4NrNZB7+oQNZwIpn95G/qG+A"
-    "mt9UcN/edufdVhxRo6VxAZZpa3hUZWdtbHlWoVwQLaVTo9SYACaDe4FyyKz5EnUHYOrshHvX"
-    "dzTEjY9GUQBn0r3w9NdiwPRpAPwdgNedmNQFd07uPX2IvSjLMmVURNfTk0V6mjrYROxrXqcm"
-    "bsEJ6gUEHQHochg0dNgJt06O2RKW01sRycViBJqhMgAmck/lQGYRmvpEpmU7CpJmEZGqK3jq"
-    "/DtCXCnolRYsenANoYEljJA+vPsKwI9zDwEPbYg0iTmtYAfLPHQC+hQ/2gYt5KcXsaJiynno"
-    "YpVdiirUd7OBoL3NczfV80IXjp2BWu9/9OgRwOkm1uFvQzuzADEUx3sAYPg/ODiU+gU56PyN"
-    "j96jT8oVlX7QSQTYLGGc1bMl3TRiGV3cqIcXtAPNaFsuDnb2SCCAj3UlDR4AMMoV3gTwq6so"
-    "h0mx4D4AnqCsA5FxXy/iTBZQxuXiUD1I6dbD3Rfom/NzqBEQdoV3V8P7qdM1FhcuoQ2jUr0i"
-    "aR4DEMdxUYI56xU369f20W++50kwc/PjY/jFi752/yOc/8plPPnNexW++phTKD6re85AhIlw"
-    "VZDit9x3hNJPeOZW3WsOJdpyr+Kvj09NeTK/RlKPqFTKjiTzi2F3/jJ42uk1+rn5qtI27lIv"
-    "pXZKepefFGCZBHGa+kfhCt3k+BnBydsNaJjNcvXB4f22d7Wmv/DB1vTcyVpDlc9xZwhMH7rY"
-    "mr7vQ63pg08r/djxOV6k0/eebwk/3/Q8u3TfRuAKXkH6H/7pZvrxn0H/kaFbbt2bub7r7O/h"
-    "3brxV/W9oJuddLrvh77/Oz8SxNNIqE0d7HEJB33XAEidGPf2vzNh/WSipQvVOhOOeIt4K+Jm"
-    "xGJAyY1c/BXQo+fM2cpxGF8ecHIcWURm4Q2fJ67cieqrFD/lfOAlyi1oYQLlV9KJe4k7Zy4n"
-    "YJAqTO1OWRRPyMFyi/cquwddMZsOY3A0hQrdhw4fSRcvPsu5eyeZEPJOIkVXwZ42japOLE/m"
-    "sjXUH274YCIULDK4C65YcatHNI9h06nJCbgzWql2As8AQ5Gdog+NkGrnJ7akwxXowM1dY4oM"
-    "XaGri6IdLUUTik5Ufjd945L7on6WIFhFXicZ7zEImU+5ImTM+BQJmsdsz0uOlj8BmMALMMHE"
-    "e4CVfgdlHnvEmXJ37wW+aDWfVJTxyMlSGVhQIofDKok0SGcRLsAyXB639GsiQQBVRMBRh1Fu"
-    "AR06MQChsLxOPDNT6F3BgXACl7OgyG3o2GkmXhSMEe1qakDRkfp/cp5U5Bfw2r6KF4PeAB9Z"
-    "mb4FvZ8hvqGcPXqHNHrYpfeO0POaQ+Fd0pCOtHw+dPQ07cwBz9SjejXSlNbW5WzJldGulW4h"
-    "auK7HCKV6rvUOSL+h3dfDT2jYyeeTeMYA71z89MR3iNXiuK44KgbJe/DwydCTP3gzjXqzaOX"
-    "FiO/NBHWia/B/emPnXruQtRchGIzy6HYe4adgWZcxXX1yQKAskxdAkQqM9Iu1yzcpUVApMB0"
-    "6NiZdOz0JRThjxE+c7lCFAu42ILLKPdtcvx21OkG9GS5FBkK4szPAuJJ69kzKbXk7gYH67Eb"
-    "DqLtPkt7yTHU8rui13bAjfUqF65L0AUoWgQ437n2GdpvBg7iMGU5Tr2yi5M0JsfupmtXPpUe"
-    "cGbhygp6dHAbHVztD15rgC0Nh/YCiHr7+4NrJN3H0TjcBUDLcLcCpEPv6lJpxNR+pM2rOQwI"
-    "q2dp3dB8sbGkRy4YdWbfE6DNcVSOulv+ghNGu2+ww3GZnY0aGXaR0tfDIoFNBNE3qJc4xxBO"
-    "uEcK6Saws15LX4vKI/8xEuC/jHu0ULjpHn65h18ru/EXpW/6E9+NtApb3Uu4knZJq7i/3p1U"
-    "61fDi3VjE5QxXU9+Di/mo+GKbEVedCx5YxFFhdfKWPnPrdoQWGKJX2Ocu30ZIsdVD5vLmeFm"
-    "c+gn5mCV6IwAEPLStZR+A32fSydTOnW4Mdbi8Sv3L3YNXHm4nX70726mn/8txgHhQcZHbyrZ"
-    "7zr7Mfzbfs1tWNzyPThYdsboJI9NYmegWsS5h9hL4lc6S60DPja+/CHS9TGSN40qZlba4RYu"
-    "PNK5GuOOjlB1wtxRq1V/DRQpusogyQlZUCVgKG5Oelk/RHc7af7lDLgSZYLDT57sMtCKvOWe"
-    "XuWq3HK+81t+dvU5j9VprbevYGpAMVtO00EBQMOEf/rMuXTq9Gl0X3pDLJN1rtzhxGU0Ub56"
-    "3LU6Dac8yGTg4y4u858AVzPpwb27iD6mYyJ31Z2/4Z8qLXpQcnrycwZc7XCzLGvh7qmcqyHG"
-    "dupAYJTBlSIORIeACycbs6FyvGFNuwxZAhAHPtsl66hoRsHJh7+0iTu7sjFVOGvbK2zNn0hX"
-    "rtylrlBIRpm4ncjAVRGGWRDat40Eam753wzwJph0ot5AT2wJTlbaXgr9nO5eds0BSmxnc2TZ"
-    "AyzTnmZQALvIQcTqU2lEVH+hUE3+B7Hx5BE3ggRNLAjSnNTiqJnxOygk3wtui6YYFH+5XT+f"
-    "rYipB9zkfh06cgIAgEIzQEqOlRyeaXbImV+ttQum7M0CB8GxoELO1zT2nTwzEedog3ymojUq"
-    "OHbXKUrrABH120bZITc1dScNHzvLLsd3k0cAB7WVd5hSZiZr68yrbwCzDGefBUyNADTuV8ZI"
-    "oTfLBfdGi+uxcxLOnLshFYuqUOFOS/Wv5PbJRdlHndJ7os9Yn30Dg2wCeDqNnGDXHnF7zqH1"
-    "FhsNqFOB2sL8BKBT8eZD6pkKFtRstlIOOVKegZl1FEPRHLGtaamvdoDzG6kE8siBy70Ho93k"
-    "Pm1uwf1ZmiCPB/EDCJbbRV56+txt28W3FWi4JR0/fpYduKcDBN69/bl0/dpn0717N9FvQhS4"
-    "SjlaMYHCRokeNpH0Ix4dgAPqb3AQcxaIoo13FZMiAhzFyHEFTWqstIt29tBq6FsOFxzFVWjJ"
-    "/NpnBF0a9+3hZ/sKvuaRPSh+tC/iiF4pFQHwM7xtaxrS6fDIIZTdB3ADePNdI6Vazdeci+Bb"
-    "u1zWlWDLuqZB/C9Z57tjsM92dDtk7Wf2BF1NV+V/h6thnvAqY/Ab3o2vMTtVEpGnSK/k29kg"
-    "j2slC9lP9VYVNI+DeSy3jPFu/JU37zt/xrqHWxW2Mf/6Ms3aZf4a32sfFBGOPJmIsCGMjzYd"
-    "G7/TL//+dppDr/Q951hoyrz+yvVFrwGFMP/bb2+lf/fvbqUrt0jOepc4Po8rc7AaA0qLRNdE"
-    "V08IsEpE5qYQoLFV7tU9biZQvL/Bvfj0njtOjn0HkVdx1ICC8TtxxkBeEshuBTjpN56ZWOvh"
-    "nGx5Z1COHwNRmRBClOE7PycqwZfx18PmdHJnflzpdM9AT1HHAiKIuTkMD3L2YAAs8mJ486Dp"
-    "haNHj2Gv6EhwU9TbMK2ouMdET9CGy/rKrzmvKuPOxqHJj9gtVY7cUefDNF3VWh8B4nhXJ6ro"
-    "T7Uz2bqzw/is9wKK3NnXjS6Ku6k0BBrcMJPEn7tsnCAsbzljUD0xRYHqeJlmAWGmGxOs8RNC"
-    "hWkn01X0bLY3F1DOnsbERKVDQ5xttm1kxjQEGIpNcr16ntsqXAPrUG6Sg5+cldkpuEVMQt1w"
-    "IboRd8nliJW8ZWVCkuPmJbfGyUqL64q1AsiQL7l+Tl5HRk7RZqOUFQBG/Bm8qD8jIEJPiV2H"
-    "lqUPEVaURuDAZTxd3QPBeVHEpZV2d92p3zU1fh/R4BDis3O4g6DIk21tep6pd+2VjwE6JgBB"
-    "wyGqMz7Tl4bcgWZZBWyKK6cwhOpRNyfOP8vE7IHLmNpAZ0kwIoIxnO1iPcv56iNO+0oX9rc0"
-    "gtrHBK5V9fu3rsE54qiZuQdU4QbuQxEfTQ1gIT50f+ZQWrcc5vPoiUtwWuFSDR6FOwaAQZdM"
-    "5fRWxJihy0iC7s6UBlYQBwqsxh/eCFG5ZXXThzpPAgaPwjnz9DujrHOcbygnUY6ifrSyfwCu"
-    "WBcctuBG0gcHDmGIFY7rBPpn+5CxrwI4BKO95Dn02SDI3v4jcLz6oq3XMI8wC/f4Lodc37n7"
-    "crp1+woc0iWOq5KTzAYNwC62QkJnSj0puVYCO8W/ckk9/DtAFgAnTJ5Qmyqrq5MVelmU0UXH"
-    "AgsCgZjPMV5BCu6k1Y/jiOJAwZVAScAkTXfQN0L8TZ24W1ERJD2P9gNgDQ1CVwP0Pw2+8uOb"
-    "B0PLPVtGRGn7yoG2PoPLhYv0Hx23+dn3z+MKao6+1xQ4k3mQfPli/wpC00GCa/w1uvHBT3td"
-    "jhP1X/HheEV0lC3q1bvovMRPXsxivdx6Nmzl38cdV3bfEV8Vd3Gr33PA8l6iKe+NdwHWSxOw"
-    "oR5XuBJ4rzsgC/ydPvFySr/KmXeH0Ey4eKI+pu8V5CtuX1gN/O6rAKu/v5l+9jc/P5Fgc+p/"
-    "7tzHgwQz/WYGh3RZp+dM2xlgSej8e/wVFF19rj/HUxU2Inai3hVJk4sE2eRkECcCr+CimBsG"
-    "KQeTAFPxnDlJvvvN9Kr5DT950hJsCCK8Z0BRgEsuX3AzGAQjfGRCwMOAxQQpoMpggHcGQp/j"
-    "Mq/kuVQcD9lhr0LgL7giijQAPFonX0RMKMdG/rATgsdjOBC7S8mjTQ4wuOcBXj85nXho+pN3"
-    "LTpY5OqzDJEFHNRhenD3NuKfB6SH7S1FewzU+lX8oDgkD8y5TJbF8rUgUvIuGCoiDpN1V5TK"
-    "uxoPVSdLMZ0rbd09M1BRX1HWdjIw7g4AgGDA9su7JFW8Jm7DABZ0n4fLMMOq/qkzA+lbvund"
-    "6QNf9Vxq3ZxL9x/d4RtxrtJeVf1aPPPUwjlycn1asHAv10NxjIOTPDTX5QKyTUDXMkrD2yh2"
-    "K27TKrvt4CSt2MwhOnPn5DSg5+W5doie5CipVKwy8czUeACaoaPnEWGxc498u3NP/aHYtg9Q"
-    "03bXLCI0waG6Tq0AG+tPsENiQauUgniYsKlTOZWDbMPXfIA4UeBi8eQKjd1/Ld268klESX0B"
-    "hlTAX17i/EPiFCBavwFeKKxiPnfYHWV34KHhk4Cq4QCVd67/EaI5D2fuIE9zcAOvUVJEbIhL"
-    "Vcy3bHJMaW0m6ql06+qnOGCaMwmxy7WJcdOZibEAM0eGL2QwSd4UlylOFYC7K9D8qtPVCbdH"
-    "8GVbrrmLEppwwhE8yBGTw+hORu2DyVU0fGwmgA472CWYbWM9Sqeefp4dkM/SRlhXB4DK5fOg"
-    "buNYBUgshti3O8R/sauS1u8lXdMTYHp+oRsA7A992OeSXgS4+wHM+9GfmpmaTlcuv4gI9TXO"
-    "LBxPE4/2wUmSdlhg7AfYQEMrlIGMU1ZJC7td1NUCJhIsm2kKrORghd4V7dvKfnu5kPYnAZVm"
-    "N0JhPRYAgCTqyAWJnGHBj2J2y08iVigCWIAV45I6jkGXBDAddb9osOhnhzEd0XuwF5GiCxAX"
-    "NPYz8oq+lqAvc9Ny5/fsQmnWAUDazmNv5hoHCAhX/NYun8nkG10W0J+ZavgZZ3GPvuS34q/c"
-    "G/zXvuFmTDkub/ktOzU8hwP5q+KKMlBv9tlYMFDP5V+OMI/nESxHhl98POYX8Rp39T3fjV+n"
-    "pnCmZbqRPZ/rqdSfttOVyeH00uQpIqi7vqkniis3awYG/P/zie300Svs/h1I6dzwE7TTm0ro"
-    "T7fnF29tp//057bS3/yH2+leObw5Q40vqGL+XOhgNUVh0zX8HBf2/fBfzErukBJfnbIqT94b"
-    "rxqlVRSFR/3mcPGQJ4SIZ0fA2ksZCCINovHd0al2D58CpwyYwr/fmUSL4nIBV3Yxc1AAV+FM"
-    "qexcnmvhI40M2AK0VWkWYJaBnHHV48t5ylnP8TDJ+0pY033cZf7keMwh0pmZnoqVrKIta5Zi"
-    "REhXZGGygUhaBVwAGSfqED1Uq7VIv6Euc3mzTo/ARfGUukJTE4/Svds3AVfomKAvoqhkCd0O"
-    "gY9XKH5zt9XMulymspU0WpLBRK6M/mplxl8cSs0gpy5JsRG0gqXxdSYmN8A5f7jrU+5WxI2D"
-    "R+Ao5FQ8EjZBAEaCsZn5pXR/Yjb1H1hL/8ZXn07f8IH3pEuX3hHb00dQdN/AAOjY2HhaXGVS"
-    "x4SEk1Q7laXqUwcTl+BU8aTmItTpksum3aF2vjlpmZ4ckGXBEBNoL9wMdZP2oWwsl9LSW1+W"
-    "bx8Tk9yPBUS46kl1ofuyHw6JW+NnJjgXD6Cm1fW+gSMx6Qte4mgYWk4bS+48FKT1DhwOjpU6"
-    "XiFeJY0A8HB13OQQbRmAGgVQxHhOzHKkltj1dvmzH4WLdBXjnSj5nzyX7t98Fe7ja3CyZtCf"
-    "uwuQQeSIGKxw2Lw70VgWgUYLlvC0XaVIq70dMAL3TJq7d+MlRJK3mewxy4GiN5mgrXJfGrv/"
-    "arr+2u9jm2oYsLEB8BhLTz33AerpCJy0cbyi5A2w0nyDIlRBoYuVOKsRQGjdSqd9GA6VcyYB"
-    "FJAtqJ2Zupfu3vwcdSGdwQ0ijnn6gPpWggO5toIL4xMcyGET4PagjC/YnccelwZa11YXwraY"
-    "i44eNhhI49axBmHVu5rC3lvsQiTuTkCu5yBCwoAnDImiwxV2zdBdunf3frpzCyC5wdFLchUh"
-    "2kX6hhsSWgHih/o70vGjPRSDhQO05Ti2Rjpb0GtwpRDVZbAOFxFadGyQjgRdccYgHKoAsfQH"
-    "FwC9LJZ6Efd3sxO3k5+bSOgh4aeD9IN7TB+X+7tsnTAmrKFwvwott7dvp4GB/jC1Yn/y4Hc5"
-    "xtK6upS+C/48I1TgL9fROjRPLiYDhFgJZFHAQDbzOBNAIQOwAhjiox72uDKwsO8KLMovx9Xs"
-    "fe8YmnwZRy2thhAlbr/iHHmOZ9+b0ifKUiajyvGVuPSfw5hyec738q0ewlDlp/98NfiL+HX1"
-    "wXD63vu6Og0H6wsBWCVaJ3t+Tv6/+PHt9LuXOckATYKzQ7St375yfV418HEA609glf0j//dW"
-    "evk6zWldZv7C5xVfc6DvPv/7Mc451u35iwC04Y9gpsHJu/yL7uRYUrvySxA5q0ZpjjirHlx5"
-    "qt4joejaesvEGW4iCwg2AEywJghnz4qoc/wlOcFVI3dG9+xDgJP/BdQJf9AmcQc44V7AU7lH"
-    "nKUCHCQb8xn+iY9BKv4Vf1W85l73AHY+4T9HELG+zh8S4X/mYLFrjYE4VsKushXlMNDLWYjz"
-    "/hhM5E4oiokO7eBiupFRHqwi6suJSSd3Gzmoa4dJjsvD+/ewDaVx0WmAHIq5rHbXASjGUeIx"
-    "vBOjXLOwU2XO+Rh2qmSrELH1FZmmpyviUJ+kp8cVu+KKoseVQaBclRUmAS1rrzExCXJeuTOR"
-    "/uzXP5cunj8WIMQt5h5JYrkfjmKZfWMsfec3Pp8+/K1fn4YOdjFJ3ku3blxOd9GN8bzEkZEh"
-    "doHNppsc8LzsBLdOm7K8a0Mny2WeR/KsAa5WUQyWg0bUsdIPDo1cOPzsZ8JZWeD4oFnFhVm0"
-    "1aUJgqC3rJsUoj4Cd2DN/ODh4wCLB5hCuB1AJUAMca+vc7DwNGJWRDNycjxORo7UAYDY8NGz"
-    "oUul+QbdVb4O7mfVRk4OikBV/lYUqb6aXMIC8hQzxkYGJsr+g4cx9PkaxwFxADTcldWVaaye"
-    "D6db11+M9LS2bpsI2lSGj0ajmQRAmb6xI0U+ugEoC7Nj6cblT0IHGhVldx8cTQFj/+BwACw5"
-    "jwKWVUDS1Dh+4AY+/fwH0nPv+hbAwABGPq+ke7f+CHCzGFwhJ23zLSesE27gEmBGsa7gx6sH"
-    "bpq6aa3UuZwY68H6XwCozWLLSRoNwARHaXBohLaaBzTNkCfADmWan0YvC7GYRkO7MPrqjsdJ"
-    "aEJl9RXqQ46gxxcJwuSCWWfWZzYQ2x56XRu00zr57R905yR2yEjTOrJd3DQiAJE+4rgqwLec"
-    "0xlE9qg6pQ+871z6mq/9YHr6ItzKpXE4f/RTaE5Dt3lxhxgYkNvb527LdgyFdgKe+gCgiKXJ"
-    "/zr50y6XfVbgpG6W3GjNMhwcHKBOtb3leaPuGuRga9o7gBChtaO1jP4bXdllFtbbMUPSBTeO"
-    "zRXHTpwifQzgTs3AUVsgvDbp6M8VqGqFmyvnTkBlWeWImp8Y1qCNvHDK3/gQVwyzeIjxmzDS"
-    "qP1/r0tOdgAcPjp+h1+eHUNKeMM5PjW+5wjLqGOOKhfHMzOw4+I9/uc7Hng3rUgxv0badXeG"
-    "nJwf43V158XNMdFwltvnGNOMzwRqv8qzt6Yr0ixpR7jiocpP5dbsz/erM0fTy28FwCpJOvlT"
-    "hrsPUvonAK3/90UWjUg+ThxCBN7Jh69cb1gDswylv/rJrfTXf3Yz/a1f2U5Y/uGMYqrVtc5b"
-    "XIXfc+ET0Q8COwSGyNmL91piAKy//H3f8ZFGApIwc5fdozxmVkr24m6HDPGS9Oy3WsS868aV"
-    "E+S1gVh5ye/RD/jjt/KrwkT4iNOkiIVOnu+RiXjOuj051ciXeavSCb8BonK4yE7Ek8NHfn33"
-    "X+Ve7jjU3PRX3i3P615GHf9YmTKoL2DbRj0MB0kncIGSyxW5OooAnJgchBUjKoZZxRp3FkFo"
-    "/R2wxOpdXRzdNeQ4x8HRAqsJtqY/Gn2IMUlMQRB2hYHYHU3rcJgEhFmnKgMn34M7BRFkXRDy"
-    "SL3YHpvYN8qAj6GeiWKQyeHo0GFW9kfSuXPHmdDc4TeWpqY9my8fzKyO1TqThwBqG66Hg9rE"
-    "wmb6nm94Nn3dB7+Gcsyn26OPELusp8vXP5fed+lI+ms/+n3pm/7Mt6D/s5F+91/9VvrEZz6V"
-    "Fqmf8Xt3sT5/HZHRcRTED6ZVgME03K7ppUo8RvaWKdP8Mqt+wRUjLXrtDDxZh0EbY25tN+/a"
-    "8ZIelgGa03CmNtbnAQsDcBTYZeckDTDJwMHJAbEmLdEHUJCzNT56l7bADTCj5mM/HC6Bg0fC"
-    "rLAzTXMOk2OIp+B+KCYL0SJ1IL1kuhYIVQA0jilSNEpMHvFCnMFxgLMlUFJf6hCGQtfXF9Nr"
-    "L/0OxyOdwTDoM3CubuG2mo6ffGfoS2nTKc6xY9lVuG8hXqK+nWA1dLoAmLx9/ZPp1rVPUt7F"
-    "dOHS+9L5Z78Brk4/dILCPqU5sL+H9BFbUgdDHD8Tdq+SHCUUw9ETFFB6+Pjog+tBe+btAKBK"
-    "UadK5J1wx6xfuX2CBq3XM+OnPsCbgF/xqflysu89eAQu3CT6V/exdP8M+Xk/uyefCt0tRa0q"
-    "vmviYpudfCr/t1BXinPt2wePHKXOpLFOjMh+A9yrI8EVmxy/SXm1KA84o45tsxW4jI8e3oL2"
-    "p2iPAfJyDG6PoB9ap1660MWTO6jYbgWdrAecArAwfROR9HD6lm/5xvS+D317OvPUu1lE9MFp"
-    "foTBzzscJL0MAORoKuioA2X1QcJ3sluwp+dAOnXiLPbELoXZBQofu4FNJ/TFAF/609aP9ayo"
-    "3PDShX17AZF96EJG/yvic+qWthHQyZU9gNJ9F+2hTqZjwyj9Z5JF0xzjx5ImIlhQaavM3bVn"
-    "zp7HVMdz2Bt7Gvo+FAsBF0HSojTMQ4yBjnd5bGOSCeAk3ZjH/HN85an2HnTsN8I1X34rcUSo"
-    "iIP+b3z+a4g33qs0cpy709EPCZNM069yq+VRH1Va4b+EiUy6YBeuFz8lzubc+96UTu09+7Xu"
-    "ot54LfFFqEgv+2n+e3X6WHp56lSOuvnjF/Kep4g0MZnSb30qpZ//2HZ65Z6GShMiRO2tfSGR"
-    "/8kLS/dJn7y+nX7q17fSf/Z/baVf+K3tdHeMZrFJvwjAqtTgd5/7/fIY9yDJHS75Zd8P/oVv"
-    "/0ghaDuKV+6jdIMg7nyPD9Jw9a+8VyRJJxNsqdeQ4yhhw1+EIWxjfEHJOb7sJ3/3eQeRVx8d"
-    "LJqvWGEZp//sDFX84Y9CGCI6D3c/x1WlW6JTi8HLv/VPVVrcaulW8UdEj3k2D4Z0MNJUg6v2"
-    "RbZoy96X5W9sAi0HBrkQWcSAuMtt4Yr3MD0wNfUojD5q52leO0PT40w0E6xqAVcI7FWc11Cp"
-    "NrbkEAWwQszgys64FT0KNCy3P1fktok7ngRDZTWqWM3xWPHfwYMcknsEJduB3nQYkNXDYdOx"
-    "04uV+qZiSM441LSE4Mqz2QRsa5qBAPQIck4fbovJc2t9Ab+LgDLtQm2nH/mB705/8Qd+EGOi"
-    "78YoXR/mBeCUcCDx9Ohmun1ziUltHevj4+ld77mYnn/nezhjGi4WHLnxOQZ0QRQ1tq7dK35I"
-    "VCgHbjSUncpnh1fLFAr4TG5axRbQeETKIhN6K5yDbnb3yQkJDiT+s4Iw+i2AGRW1B9n5p3K8"
-    "5hsWmdA01qlF9qzjooI+OmiIn9TB0b6VitmK8DOjynwAAEAASURBVBRtCZCpUHJJpoJkqHOU"
-    "yEmFOmonH5OAn48BTsYADOocDQQtCAbaBT60wUPOydM0wsY6phyGL6Vzz7yPuhxHhPg59Jlu"
-    "sSMOA7SII7Ol+LxjVJGX9LMKZ2iWY2v6sK918YVvBqScBxBycPbMwzSJork2p3p6AIRwXmx3"
-    "TRdo80oQdO3VT0JHDwD/7lBcIL9dcGwoExWv2QS5nu2I8BwTuhC99QGewmSCOkwAHOvnAOYU"
-    "cj1loGnc5lXu0/HTz1Mn6uRh/LOrn/CHEOPOh1mGNkS3Hj00+egubksYKD0fbXFo5DQK9U+l"
-    "LkDs7asvIjZ9lbYAcI+Pko/1AHutrYjG+Pfw7tUov6LHAQCW4sPMcXEsAOjAfXTHYXe3OncL"
-    "qe/AZnr3u+CyXnwPbX6BMmn1vQd/ti96gmucnUhbCpZQtRNDRlv1cBj0ufOXUO4/jngTLtj0"
-    "JHQwT5ngWIWCvFw8TWwoZtdgKgZ36Y+a9pAb7FgwB8gKsX0FAqVdKDj6n8dVue4SMCsgmJ7m"
-    "2CvOFp2Bo6uJB/W9BE5if8vy7HMvpBfe8yHa+kTQnOTnLlNBlguIuOzzhIkxEYfgeNFPynjJ"
-    "g//ju35qP+g4yDjHEn/5WvnN3CiCBbnHgFmew2f1Rw/hKccfgYu/8q0WSWPA+nPJTwSr8heR"
-    "Rrgqh9yC805Zo5z4K2N9PSafmku082t501ddeiKFEdLK9bfHdXXmiwSwSlqsANXRQgASIq5f"
-    "Amj9Y4xiXsXEAMzfNNiDSF8G5p/CizV0+qMb2+n/+G2Ot0EM+NO/up3+8FVMvsDBCntWgtS9"
-    "m+0tqy1FhE9ywcH6zo/k3OQJOXeoqjM1dr7ac4623gkYLfwWHTH3rEzoPudSxjuv9TB+yR2j"
-    "uEUnMepaOnbsCNRQV8ZZ/5WwuUNX/k2VTmHKJXyE8I9X4z3SiiTD3eRq3xv94uhA6cdgQzPp"
-    "+G9HXnWL+HJ9CGgEWYtwsPKW9KwXBeTJAIsJL9jdRKO+1ArKrXKiBFACBBXFtcWjvSd3Iqq8"
-    "7gG07hBcwkCh1tDV4wixH+k62Ah8zJd59T3XgoBE0WKM6kwA7ohzwGa7PSKQI+xeknvUhjFG"
-    "9Yvm0IXxiJYVVs4txINwknwhaiEfHiukVXUPkVYBXhTkrqd5OE77OTj6tRs30+WrD4Kl/Vd+"
-    "+HvSh77um9m2ji4RXIl9TNbtcAfmEGPduXo5jd5eSp++sZR+4M+/kL7267+RPG2k27euwyLn"
-    "0OpJuUnMcogh18m3VS+wKnVu01A8fhkee0j0GqI5bVftZ6JSR0oA6Dl7WxsLiOMOBVcmxICy"
-    "Q6wj4su7SCkT3JFhjt3pgfPjkTLLgGIVkLMSshOgxjLnqCN1wRTPPkCsqFgIMwLE5SCcxTb0"
-    "b87/29xYgrt4LV156feifVbgfE1P3Ad8aEYCIID/ffsU4R0hbRTa4Vr0cmRSa4s6RrfT2MPr"
-    "TOTj6SQmFgYRAzqBC6oiLJUhR0u9JEHEoaEziBY5kJoCTXCe352bn0p3r38W4Hwgnbv01XBz"
-    "DtOeAF5mb+lCQ5wHDx0LcwFTmIfQBtjxU89RPsAxgGeWfM5MKq4bzwr0oT8GZwmxp3pQc+yk"
-    "VPdOy/DuMJSjl+kJcRf2vuQCuasvRIhM+KQa7taVYlkNsE5iDkOQZ36On7qUOgBwNEa0xyzg"
-    "0PRXltHLu3cjRLCKLrWlpW7c/v0o4APuJsduUfXov5HG4ZGzgOtu6gQOIe/SvqJbDap2oEPY"
-    "3ZkVz5eh4Qk4kXL72qBXdddUlB9iR+/R40c5tulkOn0Su2aYhLh3hzzSfz1vsJv8qVM2RtjR"
-    "B9j1om32qfiO6NJdtIqo7Hs92rMjb+527QDUdiM6NC+es+nhz/bxrHLAAot4NzBbsQEXixYN"
-    "sLVI/57DjIVc70UWXCuEizGJPiiHTJtv/QN91MMh4m0HiGtDbA5APUl9cYg5M3LYIiNNqJL6"
-    "yaCjPGeneMOfPNy9rvy99gVazT3G6KIHUieS/GNmMJ0f86kWp14Iv9cPxz2CmycT9b9/rA8X"
-    "j7kM5qvE5bedv0is5hb5xk/MDVU+uEV4/vqY/xpP9Vzibrxfm0ZE+MXgYEWqDX8sjoCBojI1"
-    "pE9fQVfr97bTL3x8K33yGhucABUCrf5uxpTHNWlDdF+Oj/aBOxPb6bc/t53+59/YSv/VP95K"
-    "f+/XttPHPpfSpFZ6rCPXFl/C8j8xwPpL3/ttH8nAoAIIARTqACsAhSWsOld+zF0uc61K98tN"
-    "ZwcIXYAqHsMZh1dOR//5CiKPb36v0uC99s/nWtgSvspnLZwhDVti5U6F5zgMQ3pVHNlTldaO"
-    "AA1hzYn+a+maHq9MBpFEQ3GjPJSzlM9YnOgcvPwp3hMsycFSr2StOt8vuHwRWWsAHhVbY2s2"
-    "QEvgtKY4DNGY/rVc7i/0mlwdgzQUI2RdBAcZjYxqSoBjZOAGdAGAujkmRCDlzwNoHfA9vsad"
-    "gQItdzj19vWg8zESHCmV4z0k2vPQtEBvnrX2ru7H2pLcNzg1DGiKRbQ8HmAOgOWkrYHSJbhY"
-    "+6ByIEBaZZI7OtSZDnbvS4/uXgEsyb1BhwnRSWf3EXRyjqUT54bTV33NhfT93/+16f3vf39a"
-    "RvT5+7/70fS51wAXUwCjRSt5P5OWejHysbxsBP7zc+hrA1wJshSH7ocb4oSliMndhl1wF/YD"
-    "suTyyc1xgtYgqmYGnJgEBHIc7JgO0ratnK3unsEwQzCErpU6S1qr1zRAJgXPUNQoJeAPsKMp"
-    "ASfooAEyJodMkPjw3svpzo0/5H4Z7uNkOnn6ncTTll75zO9RD1pzVxQmaNS2EWYIDp4CRJ2O"
-    "3Xfzc+PEx2482kDF+pET5wEiUyiPvxR17o5DdyCqXG5+bc92wKvckHu3PgW37A8DhPVjRmIB"
-    "DojtM8XuxId3L8NBQikfLqITsRw5RW29WH43nrs34KKhF9WGWNJji7S5tMJkf/QEnB7qRFqT"
-    "G6YxV7lCc3D7VtAjcreg5VBcqL5TNhch5wfuIEBSTqDi2OAe2nY0qyBN7pUcvvMX3ws9nKFs"
-    "cH7oHxOApgc3X0mTAD+ttwt8pzBCOzs9Cog6lobhbsn9YnZN4/evhrsg+fjp56hjbIrRNv5s"
-    "I+tJkW8HwN7jcwRzitxGx65hIf46/WKC9uunPCMAMThvANGDmJBob1lDt/FOun79NsroACMW"
-    "G5PjbD6ouMhTtOkCHCz7t/3YNhRoCmzso1KnoDnAFelHvyNtaWMOelwG+Etzcle30L2jayL6"
-    "tv/LDfZ8Qw3DugsYmqReugHyLmqk31YWELafumcC6Bm43dcvv5QejXH4NmGsC/XV5KSRIdJg"
-    "NLaT2GfsNL7Hg7nEQbeGqzaOFnfC5St85/A4BNBoDlx8NkYb4U2TPOjOvYAUHiK+5nvJV8lC"
-    "RGs8kfdyF0wYZ/ZlGMek8KOXHT+/1v9lPxXAMk78GsJ8lb4c2abTx1gT6VZpxXP2+5brYEU+"
-    "3uCP2ajAFuuhdOV2Sv/fH26nn/vodvrFT2wFVwfhQZSpc/+XL4cL/kG6Bqfut1+CS/UvttJ/"
-    "+ytb6Sf/6Xb65X+1nT53PXGYOyRNw9VAVW7EN6i8t/bzd5//eEOEj89Am7taGi+9Mi7HZSGq"
-    "R9x8Km/5eyHw/Cl/i/BMXjmCHELCjR1HVbAs/MmT2//P3psF55Vcd55JAiQWEgRAEAAJElyK"
-    "a3GrnbWpVm1V2iW77Zattt0x4/ZEdHSPX+Z1Qk8zbxMxb9MxMWOHo8Pt7nG3LVvqklQqlUq1"
-    "F4vF4r7vALHvO8Blfr+T3wU+kJQl2x1jSVOX/PDd797c82TmP885eU6ELEs2gFEkSNzStyRT"
-    "TAyLy1DKZz7dfFMMm4WwZDCf1h2B/Ukyi+LcMyzUXf48khR05d1T0TQCnuAq0YgrOc3WsHoN"
-    "wGUKzgocrEps4rDgTANIauA+LFkqKJqK8LVyMmLhzXUNH2csRKwVZCtHinQjf7kfPs/95sSi"
-    "WQE5BQ8+uD898sRTAKqZ9MZr3+UkVReLINwlFrs5QJsI30lX8UVdPdayEQWKnTwWfosFcslN"
-    "OWTj6HjBvWLBi4WY3fLexw4YMR05fDxduNKNyIP6MJHXo8NSAZXbC0M4aB5EyXwloOTcxcF0"
-    "7vwP065tcFEAUyMjF9KjT32ZRXInAKM9PfJUO8yHaURn19PpY++nH//wlTQ2zTH8MQDBJIsE"
-    "4KaSnb0LvSBL8SnFo44uauoTCaqi2zhtyG9KsNx2n7mF7sJwLKzr0GZWrDc0OJOOvP8mCvAj"
-    "saiv3/Ig7QeXIzpMuqQd6aswqBkn9BCl0TfNbdtjsQ5wSbsHlwb9KfvPOLqL0bzAUoCj3DPb"
-    "agmL7U2Mp1Ysq0079uwFNF0EWL1O3+HkFC6TBj8Fc7EYkL+ipFRBuzNpbt7xJNwIDMVePRZK"
-    "5FUAp4unP6JmAHPSrwE0e/pR5fPckfIWBc5TUZ+1G3Cw3LCBQwO49mEhPvLB91MHpgp0At6C"
-    "eYeJMcROgN117bupLzRGG7ZvewSF8750+L3vp0ZEe21tu9Ohjr9NKxtbAd/7OKF6HfoZgwuJ"
-    "jS5EnOreLUWsumXPE6kL8Z1crO7rZwEJszic3kebsqmgTQK8EhYBK20CEISIWb6inaXjDYDO"
-    "tDmeUHdAHbpkXZ1n0pzyEEBjNdyoMThcm3Hs3L5lX3DAWu0P0rPsWqYPO2CkK7fSQwimxiue"
-    "ZxDssLbvNJJaD+dr8+4HOUnESVDEoZ6mvI3+V9vGvTgM3w+dIRK/NYTI+lI6evin6fzFa+G0"
-    "eqwf3ciJObhlZ6k3NAPdCBIaUGavATQ3YcDI04sCvptwpyy77x1jsdEiP017rEYEvxw6dtx2"
-    "dfcz5tGv5OBGZaWA0I0XYIt764S0krTZoKziNKLgSk4YYkv1J1URGB/tokxyAfvjvScjLZe6"
-    "iOHAHSOuuggS4C6RC0yzl7aGUTYaMOYTvvhtq5Xmf+ez/NCmy5cDOy77btEMach7Xg6n4ipi"
-    "OG8ZPgDc/EufLE5l3i1aETrmO/TVAiRmwFNEd461v30X9EZYSnl3mnfkUQoU82mRlt8RN+qY"
-    "Sx2br9LzsioV0cuj/tPcC7T8cInr2Q+k85dup//4GqC/ChEivuq3rE1pN/a19uLuZkcbluNR"
-    "mG+uX5KQNP9SXKj1pgHm/E70zbSufgJds5PXbqfz3Sn1DbLxYDqQBMTnUdfSnP/LUHjH9zxp"
-    "RSEXl6rAK5XFTfF6Edkvpv9MhT4LanTQ8OPOML42wzuuO/PxtQMkJ1CEL0vM8hOgSGshflmY"
-    "ReSenxu+iGPqxbUQv3iyUE5jLpSAuyh/kY9vyiaihejEcZAX4fKLyJtH7lI95u3po4ZGdG8Q"
-    "nygacpeq3tQtJtY5Ti6Zc61KsryrZDKuCi4RCtKAIHeiIQaLIpUmlMiOP/wvTga6e/7SN74B"
-    "V+jF0JdRBMLSm378/e+iZKsVbE8HsgNmgl+OzpVihsbVjTG1KrZrQam989pkGuTE39j4DfSo"
-    "0O2aHkz799+fnv/cl9O6jZvThXNHsYp9GavXWs2eJF30WtBvqsGp1qqbADUWMxV22UjDtkUJ"
-    "GgX5qx1L01lEhqMYfty1+wmUeDcjmsGoJDo8nXAqjnz003TyOM6Jp2vDDlbPEMfkQVIKOm8B"
-    "JCTiShYvyz5He8nNUheF5uITy3csKircpznazzYDtKrH4pxcj/6MXCiKm06fPI3Byh/Q3jdZ"
-    "WOF4oAPliS3b0UVGToTcFsGsXMLghpRoKXMcbHgmL7gKt1kIBUpydOKUiuCXBXAp5hPaNj7E"
-    "t1zFGgyX3hdua7qvXUQ8ljlXvZ3naadZRHNb4XTAkYK7qbjWk3T29dIlVdEf6mVNoIS+Emvm"
-    "O/Y+DlBfT94APNrAcFJkaQAFx0juUfPazXCWRtLZY28CAmew4n4/gKsZ8WRHunjuEOk8GqK/"
-    "6urmEJmqZyenbt+jz6STh99KE6cPYVG8nWrOJcs5MdWLCA3Do+yGd+5/ng3DBgA4AAgfiWs3"
-    "7KAEt+HUnUOUdwHoUxGW3bWQn90aASRZ+K1fcLTjBBydQpvepC+XGQ6Q3XX1XJhlUATnIQCN"
-    "eg7BIbM9l8OxExyG024Iy35yTExNKBLDmTYAQoClLp0AxCvAM/0RV8wfGdDKrbM/+td2c2Bk"
-    "lHwASGu2gT6WAKAupM4rx9OJj9/BEwL0ymbhxi1EjFhkn4B4JrAhNj3mZugGCxfW8eGmrVuL"
-    "fTPEunprGIK7JedIK+76F9S9VOHoWyvzzhEeslBs2MjBi6sdPYTDH6nzDGYiPGWowr+0VQPH"
-    "rR7ushwqXU5JG/oElcPtCdoZxPFTV0eg8XM4S8cIq+J6xxT9okg7OHfUXzMeVXBBbSNp3rFE"
-    "y7NYqVeY552ijewTx0GGFtL5L3bdFTLYCnfHdW6765p/NH8TQXIZHGkLZSrm8wgZaZXicB93"
-    "BC1Kf698FueQQ7h6lV+Lf0VzWIgYYnfO8fHijvjlaf1/fm/h81QWWTsd9gNQsDqTPjhq41Bb"
-    "3jPkEqbW0lo0G9px09POidr1OHReh/2tZgDZasSMCBsAYJn7hUYEdPv3q437fgQtnJblJD2W"
-    "6semsPXF/NuPXm3XUEqdQ9ijAlBdQ+R3nd+DI4QjDMtVJkPrInn6+SUCVJRm8VVOMOX3i0OF"
-    "StiiR3aH4YNmix8+k5h5Ec8jQYmbm7gvRfCeACGW43b+irhFwPmn3OQ0FxLh0b0G6b2iRjI/"
-    "60VZwaPEPytcLkvML6UgUT8fl0Xx1kV2/ioFUgRTBHQXFe3DJOgzxRNOfJ5mcjH2mLmn/lRw"
-    "rgpFaq1Guyhr24gdNFTppKwfwFhEyc/08pUzLMqZ58PMFndSFTStRFG7lsV4CQuGvtgeOPB5"
-    "FMovI96YgIPEVoAyNQCs1jEpaz9JkKTOR2MDJ90YRas5waTexwiLywRcCP2mufsew0ZV/8cf"
-    "pONHj7DDH4jFXVClv7YRuAHL4LIpTly6pA5gxaknuDKVFHB0HLEHg+bUwEz6eutjOAN+jMl+"
-    "OaIdDGyeP5ZOHj2crvcOwrmqIM/KNDDKyKzEMW8NCvNy1BikTszTUywo2AvKIgAADiCxkoVo"
-    "WYCRrIOmyJT1h3xR2mchUVzlvn0OG0hNKO1XwRFRb+34kQ9ZgKbgpqGYv+0xFnBtM3m6kvC0"
-    "taJYgUv8y03O+9KCRJ0M5wKuvaibgJPr144AWEZYuLdwcg8jnKJLgIbW3LWnJWdmHBGfZhsU"
-    "5/QhAhOIjqE7owHS27fwn0i6cj38rkEJfv/jX0gXTr4F96grbeVwwIaN+1MVnMIoIGNDp8I6"
-    "pFbkBAUEnWVxocrpHi5IYYx0ZX0djLnKdPHsx4SZTY8/+w1MYYylE4fehDsHR2fH43AfrT+i"
-    "uvufhbO1N00BFo4f/D7AjvKtVgkf+1eYTpiAY7Jpm7ps6jLlU41ViNXWb94bYGoIa/Wjwyii"
-    "A07XYfFd5fg5xNXRXoIE6uehAlvXU4KaaBhBj60LEfIkYjvbVG6enBltiGmDbNOOh6AFRJro"
-    "QWmLzG2s+k1uTPp7LkY73mbsNCPOte2kj9uC8hJnNy/KpbalT5byvBqTICOcZBxCFN56ex3K"
-    "8xwgwa3UlctH0rVr5zGR0UF/YS8Lbmpais9BfGXevMXhBhaAqRtjcOfQjUQHchhn6mMoxPgZ"
-    "QqQqnlPZX3tXteh8BaeZbvLwioBQsb1zpfXUfIacqR5OAsuZ1a+hpw3RVEu11Z56XRk7dkX7"
-    "Y4xFyJ3x7Vwgp0a+ayX0wxxSqV4l4wGa8KCJc0XmjOkguhSeeleRXm4b4Kkgq2iroG97BIon"
-    "LgkHjf2iYMIod10xAfK0eGmaPFsAWPGAh5RFQr3jiryLx8RzenUsFmWytF5mE+tR8SOe8qeI"
-    "W/ye/y4KNP/gHmGNfGe4ez0zDcP9zMwM8E97WTw/0E55jWQQdwF2urpS+mi+/W1fwgLA2J8y"
-    "52edLs5+JFQXYzPLHhV6y++lx+hP4phEqKwIqJSEMI2iUcKBKGgRhi7kHx8Z9dg/Zr7ju3RF"
-    "ni6ppXL+UoOpotD/gO+7OFjSTVS+SKzUQw5Er9LPu+6LFxkf2XJll5FItJxcF+7LUyzlHQUw"
-    "hPH4RJkWh1uIn0l98dvyX/m+GKSR5h1/Fr+znGWUYAEoj5PW/FVKXv2TnDtfAJtcpiwiuBWL"
-    "4TI4Six0a1xAFV/IHYEab2MUE9a+IEBdFCcRJ0F3q347+TgRKg6zAWIyIc/8zHfEJB13tTaV"
-    "5Tj03k8RbVWm+/c/yxH4q6mn+zx5wDVDJ0nxYFPTSrgTrQwOjq5D/QKHerYrVYCoiYlJxIWc"
-    "IGxuTf1sfaqqtcs0m06eO516OJ5vMXRaPTKqPhkiOXbNjZyg6h/AUj1p1aB8q5KvCsaVleiO"
-    "MfEbLrYl/K1G16WHo/uKzM6deR89mJ7U24ttpAnAFANeA6bu7uXwzaF31tiA0U/0VT6+0JP2"
-    "rIMr1IBS89BMmkCsZXs4mL2WVSgWie7hF+1lm9APFCMUisW6WjLXb6HAYGx4On303ocs+BqP"
-    "XJbWbt4DMF2dF65SW0d3B3CJLKLt7YdZdHFq4dgJnIcwHdBx+Tifo+iwwZE4dxjA8kjavOtx"
-    "6s0so7I9ukJT3aMsfvQ1C7pmCWpo7yvnz6TnvvC7cK/qeTcZi24WPSHwswzQ2dr2XZwSa4PD"
-    "spFFRn+I6tdAHyzWUmFeJKkk7aVYSR0m0zC+IsS16/egB3Yonfz4Tex2bUNEtQndpov0LZbe"
-    "l07SR5vJvwmQCFeQ8s5M3YA7tR7giMVwiqBYTQOo/f2X0edbkZ58/stR/4vH30xNAJo6RIjq"
-    "FqkPtX3P0yjVH4HjdQFOU6bNde07magVeQOA+VRgLkEL9ba5ZiH6UV7XFprgSpMKbl4EoNL5"
-    "xm17UwucJgGcPj0dG4LSpTFOOEV19G0Mwl6PcbOUsdW2aXfU+SYmQNzE0PtSQnRejFnStG1u"
-    "ApAun/0wdXYeo15d6QgnQgeHxjlBii4TLno6cAY9MuwYxNUSnGfHr2PgBvKXldB7JQrs1TT+"
-    "rMBakx2AolrofslSTtciPmxavZpFiPisUtO06TSrjTqQwYVFt41iIMoBcFEWjYq6iQon0rSP"
-    "ZlxUoahEtiM3ehxl/DE+boCqSbv2Jlw6NjKO96yLeYsxq66Wbo7kHsulI9/pJejcjcYcY37S"
-    "AzzWALwq5OdntqgzlZ98xdxe2izaB75xpEWIhT+l0KU4grhFT5zNuMofzt8v5FXkW56P0Yps"
-    "LGNcPHADa9mk9+Kaf+8NnwjuvWGKuEVgv4swZc9yqmUP4vaekTP4vDOov83zV+2yyHKk+Nyr"
-    "9AIhP57tiA4pmr34nq/vXQ/m30TCJl5kUNw7XS2E+pW/ixa4o0IxhO6oGWYaXv72omdEmo83"
-    "fyMYzsTso+ITRCahlX0yGCCshM0no13D5GBF5BxlIVwRPsKZRwQwWg6zqIylMhTPLE9xRTos"
-    "RuXpO4GHrJ6HRT45/bLfEcffpHSPcHkGKHIpfUc4g5tfKS3SCbEeu0VL74Ish6EaJVxPoWW/"
-    "bMB7ErzJpBCn8fgl0HKHO88JM3YpTdMxvBON84gTp0Btjp2rJws1LQCkYffdn7qvnUxnWAiP"
-    "IvI5dPAQQGYYAITYQUvRcHOMp+FJuVgrEV9oGkKxhhOwdn1cWIaHNXMAN2tU+1ezTPbjqbe/"
-    "P/Wh39TbN5I2rl/Pot0Qk74no4YAXlqcplikDzhjIdjU1pha1zSlZo4Tj4x1YPPpXYyLovSO"
-    "yYeu3llk7LWAKyyRoyCsIrlipQoqVwWH5jp6Kk2wrX/3C/vSb7x8ID392A7EMjXYyOpL14c9"
-    "KYaNIfJT+VqxZxXtqo0gW0ExnXW8jdK7C884QNadey3cxFq4BxpiVTl7klNq7sY00aCYKdo4"
-    "2ja7PgmOJe1vmwfnAa6VS8jZY4g1D/8kOFieEFVvqKejI20BYDXjs89LZXu5lvWN6ziduAM9"
-    "qFY4Uh2pu+MK5hSeQLn7GcIo0lQsKXeTT3xnPRwVy+XeaDFdYOJCYz3VuVKfSW8FmZ4FBNn3"
-    "4W1AiLaobuFn7ybtr8PjNYj7BjkVqEsdfU5WAhy0RbV56wFAShcczkMAufUhSvIEXoViLvzh"
-    "dV8/h52pbk4otnLKbx+AfJKwxzBSeo78Ulqzbie0iW4VZZYruZpTiXKsxjmsMIMBUt3f1CFK"
-    "WwbNEyjaTZ1Bx4k6flcvHkHUNYkYa3WIQTV9saZ1XdpB2zRjN8ueJHDU21tPMNqm16+cogxy"
-    "mQZDHLb/wIvkg2V5NhFhM8wxTHa2p+PFcWedNNlxCfHn4Xdew+ZZB8Zdq+H2cPoV2r969Xq6"
-    "cqWLscgJxSrANqDd2S6fpGXsLJ9Omzcu4TDGzrR9+4bItwcQ46nSudlJ6gtnC9AowGpao121"
-    "2wA23kGDupmSiyUHMDiO1EmvAfaPJwXVmVIkWIPspoa2UtxnuT0Uo+hRX4RyLJdSP8WIuigS"
-    "2DHTUGd0yBDtb2hv4x7RISBcrq8eGLRF5/vgzLrRwwabIkzbI8CK8wo5lV/2Up6r81xm+8f8"
-    "w3Nu833xjG+pMb8wwN/x8ZWJ35nhHY8iifJ0eE9TlP7ETWTnEy/LFvO6hYuA5ZG5j+d+57C5"
-    "rPk5f/PlTfHxSXE//80NbVtsePP8a1kwNOopwoH2UhmN/GtwzdebujDu5j8lUFaAs7/zu4hX"
-    "ntavQdPcWYUvb303HlnNgry9v/MCYH3h21LWYpBQGlyITyTMGGhOXv4u/5iaQZz8eR40zQPG"
-    "dA7rg/zQHGJAFGNGTo3p5t1U0HHcGy6iRdI5TISLpHhXihdlIuBd35aJK9LhrxdjJN8ZPp7k"
-    "hwtheGogL8MSDpiUv1kULKsR78qraJN4ZxvkOJFOgC7uSMuBycaUhQwBN7/nWCxm2OUqQlMU"
-    "YPLmG25+SmAtuBVEctIMzoSJFmWkMO6uXfAVF7mb1cChYa9duRA6IZfPX0mHP8JSOFwFTzW5"
-    "wNauUF9Djg4TNp2kr0QtTWuuYQX6IxqOdNLyhJ7Ppymbbmm04aO+2DRcrAf37ko7d24FjFWx"
-    "E8eXH3EUJ7q7tk5yirasX50e2rs17d+zJXb51671Iw7EbQnle/mlL6HH1Qj3q5dJHwVnRIBz"
-    "NyrYqaMrNYrdn5nB9JXPP5C+9sUnWdhwowMHQZLbvuO+tH0znBMcFHd0wv2j0YAdAVI8su0C"
-    "rogG3EL7Ih5kocsnszIXhWrRRvqIU7cLMZA2yji11+jpOuwhqTt0k0XJRUZ6li5DOZt8XLwr"
-    "UBqWi3Xkg1diYdVQ5eULcHjgbOx58GnC6KrmCOVQIR1nxfSO+jCeaqzE4Oj5M+/S9TfSo0//"
-    "JuVYSdrFQglt0B8CcbmK9rGLsfeaI6A4tAGKzPR5AAYAl5hFjocK4o7bqhrSI95NFubMxfG5"
-    "oiV0k+i/ZqzCb8dye1fH2dCHm8C45gAuddo2bhcRk74nGmkXTjDW1a9N7Zv3JU8iTiL+7Mds"
-    "xNDgNUTNVzlR2JS27X4mxHaGtUz6oNCBcg2nKjWtMYY19xuashi4jihsRYhTZ9Cvsn6WOdzP"
-    "YLpjArDci0NouVPrN21HBIlIkFOZswwK205TEFplt7KTKOjbtkP4rByGbqTf3Q+/AIC8L9qO"
-    "mtNm6rLJDZY0LJncvRn0q66kU4d/mA4Brq5d7UCUqTkUdSBvB/dVsyLLljdgBw6QCM3op/AG"
-    "hyUqoIWmhon05JO70gsvfi3te/hJno/C9dJFTxvlhtMESNcoayOnKFfWyAmt4kTtXJhaUKfM"
-    "TYt6VAIqh+5KnEt7I4dKcyiaYFGPUn3LPOfkfpNzNTIiG4E+JA0NkdrUjscZOMPWsbLqRmpZ"
-    "w8GEdevpv8wxFtzpgHqs5Fcx76ipC/pvWZ9LnS7kPSYmnfthcMX8ZgH5L91EYeN3MTuXohiv"
-    "9LEMiz/QsXPXnf9M8B6fAHqkUX4V6RXhI3ejlwWyWJFcPMsvi3k5BzSVIoaBc5l8GpcJcMkt"
-    "X3TlpHKlfOFroxMu/pXeW0fniEsjzelo/6aF8IsS++THr3ULQAtfuw9L7lTSMeZ3XEGc/s5r"
-    "vpQWHCyJaP7iNn6VHvkVn1KY+d/zEXjvO1IzQQdFMXgM6+XziBcTH79LRO5I8V0OETeRlkOi"
-    "VIpcliJNHkeaxCtC3PltmvMDrkia/KKMRTy+4yoi80NQ6BWPIg3vcz6WLxR1eZ/rmL9LUSJW"
-    "3Bfp+iQnFHX13o+Lpke65Vyo7K7Pt2zCQdMMLOLqFjHZ5jaJBOYLFgrQtF9xetCJUX0ULUUP"
-    "DnrSa2WYJxhHb2McoDLQN5VOnO5HxFMP9wzwAABQXKXzWLlTw1hnt07Nrc1RGUGSyuTqjKiY"
-    "K+CZhjsT4im2LE7uYxMzAKztaePmdhZkQBr11KyEnKRq6lUdAAZlyYYV7PwR/7ELV/youLCP"
-    "03wXO0bTC089kA48/QztMZ0uXOohBRef2XQVfZwH9tal3//D306f/txX00hvT3rrte+nkyfP"
-    "pVNnLsH9upTu33N/2rN3N9wPrIVzHvkGyvtZl0MwlFttmsVMFxNgBhYj+w0wCsiwzvZoLX7i"
-    "FKMpVh3H1pOGLuUSrMDIZg3K24JkQaZiJftLsGNFBZKezFqxagULfU/q7uxITWiLCtA0q9AN"
-    "WEhLJtPJj34AYF2HjtVW8gBRonQvXL+F+56Wtna4QtsyMcBhUxwk54gGiHwLahNw2bZejqds"
-    "zNP6OXARK8NxEyhewXnz+VPvAWhwcUP5fR5iOepm/dR3asAsRH3TOk4nnkyduObRoOia1i1p"
-    "574XEQ1CIx/9KPq9EVMRy3DKHKcp4UrJ1evtugy9AhIUXQGktCulR4G+7nNwSjntiN2wOqyJ"
-    "T070h+mK1XDDBHh93VeJX0m7dOGEuTYsrcepm+B4QeOUSxMM1egHtW/ZG8rxoYVLO8l1kZsr"
-    "4L2BCHUYjtX1yyfQu7qGvtswYHFT2vXAM+iZbQZMaIUeTpWKI/Q/t1FuRe2jmJ24hDPtw+++"
-    "mj7+4G02HlfpI0wsjOuqBlMX7E1m0HtUod289B+o+ycOawKAx9OOHWsAVp9PTz//m2n9lv20"
-    "LRzUoR5A2iXGUmUY561BiVyfl61rceuDSHOSdEfwJ9mPrqK070IctrIASc4/jl05UNq304Do"
-    "GF4LHPeelLWfs4gXemVuGIUr7G/tbDmL6y/RMehBEqgFkIcdO04zrm1tJY2biBP1X6g9PWxp"
-    "AbA8TanYUJqShkNUC824yZO+za+4bLdiEzk/Nxcv4ztTY8yh888X4s8/IlhBw/PPfsaNdHzv"
-    "ixRoqyhfZFEaCRTScno5lxqm+M6ct1K4HCL+3vtPRL7nq/IUqEhcUWfzsr0izwzYuibq06Ge"
-    "+2LuvGdinzz8tW2BSqwBfOW+gyVaLxGl9EmNgyYL4uEBhkYVEWZqCqItXt7RPEFodzyLn0F8"
-    "JTozkxB3OBhIvRgRBMwDIgOqxWEUkeRCxm7KHQfFKeI7ybhQxUKag5VqcfdQ9nWRT1HUIp28"
-    "u/J9Tj/el5UvamACfBz8ub550hOIFAqipjf/yU0aE6mFthVL43L+23xMK3bVLJzqGvnRavRN"
-    "uB0uhKZtPTXaaQrWP06KlRKMRdMJibKpu2F7OAn3o6Db3z9MeJR9EcfJQbh27XqAmoZ6T6iR"
-    "NgAj75DhBDCxu8M1P/Wo1iNeqEXxV+vfAqtKdGXUDXMhkONgmOCaMFELoLZu3sBR/pZYdK3T"
-    "GFbuFA2qV5Ltb9XCwVoa4g1t/oyGGMS+Q+w4ip4XEqOxfmwareYGgHga7kFfXw9iwbH0r/7l"
-    "b6bf/Obvwyl4Po2wML/9+n9NZ85fRk8LTsH00nT+ch+mGGbTU88+zzI8iy7XBUBxdQAfCgsv"
-    "LwMpXeoIrmxK85W0/PYEmPbGbGfbQ0OhGlDtxk3O9NQQO/wliFG1eq49pUwnclvsi3zBQSKf"
-    "eqyGt9+3N7Vv3U/CS9K5Ex/A7WlKD2OGYglK4xfOvIPRyh0AKQAL/Ww9b7IAruGEX2Nze3CU"
-    "5tDjESDFtF3QGvnEEI0My2iM8ko7Onn20gaXdCPpVgEs5maH09kT71K2pSimb6AdAGSIhOw/"
-    "wVtw0XinCHaoryvt2v8E+lXb0Zs6zQm+84CdlFrb7ot6629QUeQcQNx2aN+GeBCl855rV/B5"
-    "iEI+dNcNwNDAZ8u6rYC3TdAyhwgAF6hABQjQzplt23n5jMwDuE+D0Cy6QLStoE1aVvdLR9xN"
-    "nCoVbAkMBJWOK81dyJEcxn7XNfwy9mJ0dQTzEtZn+94n0pZdB+CYrQjQ4OEBad7DBYpSBYAC"
-    "5j70D08fQUx+8A1Ojx5FHxGbXZyOHR3TpAHgkfbRr+UQx5sUrXmicCVmEZo48PH8M4+mTz3/"
-    "TNqwnpOCbZsQY67B5yLubxDZ1jWuZlME1xfumzqH9eghonoPwGH8slHQftwInNEebXchXreT"
-    "HKeK2d1IjfJMoO58IufPjYlj0YMbywBZ0WD0q5uaEYz9WLawBSdHNjYOcnudL+VOLgUM1kQ5"
-    "ndMGOTlrvAkMBI9rJInL9nb8al3ewzCKzeVkOf/kOYY8uZyP83wnsVOARdf8ACiFKV4uPJ9/"
-    "Yof/glfMy3eFzWnmsvAyisKfRd+OTT/OkwufeBjplZcr3ztWjGP7LtTzrszznB3hyt5FRIsQ"
-    "hShlA+d9tiq9eW1XWcBPbv//0AJKor606WDa1dhRqm6mi4L+JBfn9eIK3vM8QRdP7/FtMgvR"
-    "7hWASQZKDvDBhOC3mckFECwY2YHsZBo7+1JqsZNxABAGYQrzDj/8T1jDhT6NabFIZHa24i1L"
-    "w1Ui/vxj8V9DWB7TEMAFu5w0FKnFwOR9tgFmmflRpMmt74sJQLGGi3LO0RYo5c2dC6zG/5jF"
-    "AmRFErmqvo0rYviCNJ0IQ5SF6Ka1bQMToMJtRIZzPZG9p4Em0Xe5fUsl7DwZWH/Fby5MVlfb"
-    "UE7aXd19wZWZAU004kBZkZ2AShMAc7hdacDOVQPPO3v6Uk8/4AZxzTJEci4MuBtEvIeRTP65"
-    "OFnXGcRQfXBmJjkGMoOBEutcjx0vRY9jYxOxCKxdu4ZFFee/cM3GAFAaQ3VxqOZUoWncvIGx"
-    "Tswz6FJnlDgjcK+GOWnI8hGgZ5T6Xe4YTv/Xv/vTVEXaMNrS5194OH3+pZfSpvvuD9Ha0iU4"
-    "V2aBXrm6IvVwAvHq+SWpw105C9jnnsMnHkfiR4YGAYa0AynPIF68iRguW6u3yWlnujnIiGYX"
-    "YCkC06yDi9S1zn7aV+fE1bTZKgDPBOK784TBeTFH5e9/5CW4GZiwoP6KefKa4ek36sg/TxpW"
-    "1TSisH4bXbcf0g6DaTOAS07SVRTfH3zs68SbSgff/NO0duPu1Nb+CGmgJwXYiXEGnWseInMY"
-    "FA0qHmKxDVpHVMdv6+Blm1J8+maK+uKUuessoOgsojoWSNpU5X19VmqdfF3bECJDQAr972Lv"
-    "uDNuADMWc8WEjz3fkC6deS8d++jV0Meq57Tektv1nFo8TsAjAInbadceRG+YRtDB840pgBRg"
-    "sRpkfAUzD9cuXYBu1gJEW6GRSRT2P6KdPkInawNcMcASrnhU8m9csyHdh0ua00ffSTdWIEpE"
-    "zOiJSl3irKzTPhk6b8xUgqplWL63tsGRhdOiW6FubGIpYhwDrMBLpA23ovz+AOVopJ/zPCNI"
-    "johUsgratp/GMCp76ewhPkexP3YYa+xX4VihHzgFKIUQPIF3i7aYgsYH0TMcBMRUoKS+Cl2q"
-    "lTW30rb7WtLmzVsBL9WA/1OpE1+aa9vZVGA7bc3aXYyntenJ576Sdu7GfhgK+nKiTh8/mc6e"
-    "B6SjYD7FuBHMKIp2w+J4VUdRNQB1LbXM7lyoWNB3uqhyPnCeqgLkybmTU+XpwuVwgCemoDfn"
-    "Uv75bR2g7OhXucKK7j3Nqz6l4v1JtJMFWTFfcYL0FvOTDNIZRNO3bmWPEopehYMrEOlKa3K5"
-    "pJEYv9Dg3Zd5Znpc/M7niy/LWb64LH773+CXxbg72zsSvkd5o/hF5HvV5ecnsRAip7OmZpS2"
-    "c55k4/Nzy7QQ+5O7X+0WYKimbQ1d96jEvYkgu8op0VwAD+7vQaJ5cbgzWWaJIDcXAnMufTwq"
-    "LXCKdAiT2c86rwUsqHvEROoEI/AJ7owDm8BOsrHYcF+Aq3Aoy2IXERy+xMtgCwBCecyj/Cqe"
-    "BZeMdAOgEb8AVfOTBREVR+TJSDBnefmUAKDltwzuOHMZeMtvw2WOk6KtnHvo7VCIAIu2SV6V"
-    "o1gRgkLJllcOaRRFGE5uuhWR++PuVvFdcKdYwI1jPaNNIhX/qKyqqAlxQCidD9KWS9MGjtwL"
-    "fDSpYHkUPQyzcGgI04nTnfBoiOksu2LC0tFx9LIEbrrmGUKvxKPnTtACraLNnS7r6nDHAnes"
-    "ESV5y92vnzTCilWz1WxYF4BWC8t+3FJSL06QcecOXW6B1tbFDSOTnEQco++XVqdj54bTzs3N"
-    "6etffxmR4iqUrq8FuF7OST3FdVZ/eryT+vSlnVuXpv/+t15ITz7+KFbHL6S33zuUxmbhcsCR"
-    "gAkF5099GzWyWELBrGA+OISUiIb0udwpGQRVvFzOfRguZeVZVY9BU9poFj2wSUQywyiEw+AI"
-    "sZd9Y3vJ0UHTC1qR80dmLtL8s4AratG7SVPYUDoXIq+9j3w67XjwxQBuI/29cFHeAmyNArR2"
-    "BOckuDfoCkmLobxOX9pnMT6ih+13Cson+l9a8h+LoHXxXhMFl84djAVcsZWK9pu3PgCgeZRn"
-    "ABc6RrtRBI20Qy+Je5W2q6pWUs6G8L+47f6nwrfexTOH0pad+9Kehz/H880ANqAs8dWpkutV"
-    "A6ipa1gHmBgDZLQhztuCqO1S2L9aAfezekU1fXIY0NsJ1649AK3K+fWr1wK2VwJ6BjlB2QGt"
-    "TsNB6+RE5RB9itsYjKrOYrNrEptWI3CrBtGv6iPd67Tl2HAvOkoD9FVV2vPQc2kTXKuluBbK"
-    "JkncfAA47AsHCvQmLXZ3nAxx55GDrwN6jiPK60Z3TEfqGYiEDgDtqSmRHri+o4i7Z5mLKqHd"
-    "lvqq9PLnH0+f+eI36Zfq9N5P/5o0DsIJw6F61zVE7lfp63pEre0AXb7harUCKKWlns6ziB8v"
-    "cRIW6rstx1Mwns01OA4cDxbUecPv8AnKvOfGpIZNkdwkRX2rOFygLqQiWUV6zgWK6D2QIqiU"
-    "cxUAi/T91tiuG5nmJvwtoj85gj7lwCCGSNHr0hSMJi1q6e9l0IjzbUUFOopwvarQ52psbAqA"
-    "ZXtaLk8+qpMZnDWb9K4LAuKybguX9+Uf39MRv+BVzJ13B4fKi3yif6X6vL44Brx8bZiFj2Mm"
-    "v8t/ix8OGseS73lWih9hiiBl0eKRYcrezZelFDn/po8xHP1OFwZ859ATLE+3LL1Pbn/NWgC6"
-    "qFg6m76x9b1UU6kOtFfR+ZlogjYLAuJRpbR3B00F4ebIC3+LZGKmLz0OYjNFLu8zOHEiWFg4"
-    "jBcDl/nlliIrOTFGCKAiAOIFg1sr2K5bt5nwBEdhkZl3BagxnWKxc0GPMpe4PCY3fzkK+TiA"
-    "BXB5ILsDLJUpz3cRJucNMLDsAQiZCAEdjrAwPFmUg29FFHkCMc08Xt1NWpfblCPK42D2d/zK"
-    "JXJ6IGIRgXSzjo+V1QK1nCzZjk6Cs3CyYhFmYZ+cdFcLKAA4CSgV0XkpjnCnrMmHJgwdtrU1"
-    "Ew4ghQ8z9TY8wTQwiDsUFqTW1tVxQmlc/SM4cWxumXjZJRN3HA6TAFMF3GUaOaFSk+yc7Qu5"
-    "A4aRG7G8xGXzCP403BJPRbloy+USkKoE7y54OeLFJbAJFcfF8XFMEtQymaukriue/k7ci1h+"
-    "0unsnwqA0N8/nv78T/8MeytDaeOWzXCxNmG/6+W0afvjnLZ7DtMSaxEbYh6hDt922Hh67/Xv"
-    "pjd/+i6G68h/TrMOuDIBEAThoN1u/1RwwlBwNQvtODHDJMFwnhzG3MbLFZHQBy7iV67BoWlq"
-    "Rn8NUxrUqbt7JL3/xiuUeQbA8WkMSbZBf9GD5OHgEugIwult9JLqccR84NnfS8P48LsKt0PQ"
-    "cPrIa+QPB4OFs7vrMmkLwgR1OFSGhjzNJf2YjqA7xM/QpvSlIr26cp6YqwCEaulfZVxPCGqd"
-    "XzHbvsc+G+3edfVCKIbve/KLMa5MM+KRVyXpCH5tD+lfg6LqAtlPdataEVVu5dSffdIBNwrL"
-    "7IrdsEE2cv0ayuSH0CXqS/fteArTE09Dl+jQsRDft/NpOFxL0TF7BU7W4fTpL/0RdrAehXa0"
-    "OP9uev/1v0hr2+5P7dufhEY054ES9oY9cMMw9wBwunTmY040YmATEdYy9KoUXznu6nBPo7X4"
-    "vq4OWliI7onaChTwd0EDn+K+JrhAoRyP0V5pVnC65KacA13HDIUo8dTRd9O508exTQYo6h+j"
-    "ve0nTxfSxnAMx+HGqSPVi76iYMX21lUNHZDWt9VDf1vgvLWHPt0cJh2OHb0EBw2Dn7TZQweu"
-    "p83b95Ldo9CJ3M0bqef6KQyT/jRdAvB7olIRKS1NeYHjjD03YXI7BUi6oKJqwQ2Ww+VWpJYh"
-    "5yEPD0nUAkQNoE6ZwMsNjZxp7cwN4dhdbpVzlSJqjeq6MZpCbD66dCZd6+imPoo/x+CqofPI"
-    "Jsl2XVHjARC5U5Yrzzk7d+1P23btpl44tqb+5i1Al6sVHgIYu4L9BaAFUcXlt6O3NPf5zJ/l"
-    "lzQdvVf+ohTP+U8C9crJRBnjd8TL7/JI8+9CGo6TUA8hsGM45vNI1tFNcsbnz6I4vMkpFOnk"
-    "9A2Xy+Hz4l2UIv/JwQiz8Nq5vCh6vC79UF9vTxMqDpPYOSxL4pPbX+MWgGQ21PWlhuXYG7Sa"
-    "0IL/4uIrKJIxJJ3Fc55V/O5vfeHbd5JaQX7l3/NUlpOLZF34vSKcCwGD3x1RBlhMlY4Is41F"
-    "SefEKkTzmHixGLtwlACWi5diDalbcCWnq+Bu+W3EGHqCGPIyZW4i87iPmD7ksiylyse3QIsF"
-    "JxeUpCwjacqez+H5S7kMY3jrJSs/wB3hovzE8Srqwo3/S3WxHIAyJi3z4HFZGX1UKmepoDZ+"
-    "VqRWROQpM0/3aIxRkMWulW+NkDqxmp9lUdHZBdP2GmIXLieqZc1q9ECwHi2AGRiMj7ofY4hF"
-    "YoFrWkUcTkvx23o56Xt0vAZjiFUYJ5Ujow0f21qxY77PZfPkl+DL3bTiQJVnXVgUQd5iNfH0"
-    "l03iLr2e3Xej1uoBUxQxbUZXq4b0DWC9dK0zMITTajhYtmKYp2D3P8bzrn7qcmN5ut45ks6d"
-    "Ood+1pK0aese9JdIs2ULi8AqHEOfReH9lfTDN95KA4h70hJsElVhk4rFbBpx6JinwmgnTzAK"
-    "IMfRt4p+p86KBlewcw9FWHuCZ5qCsM11UaL1dsFhhUAS+tPY5iDOiBHc4rIGa9jo3mR9KdtP"
-    "OhS48Y/+nplF/EkclaT7ey8gMjuMAvzlAJi25+Yd+9Peh14kbS1qyyWwbVkkae/gwkonMYag"
-    "ORpOfSKNlFZSPnV7UgXgFTAxi9h4OWI1HU3LhdKYp7pzRz98NU1jz0knyIqyKRb9BZCYGKSs"
-    "in55xkPzzhsV+o00BGJLAKe9XScAsVuw9t6arsCFunb1HdIbgyO6Ex2qk/RXL7bRtrALA5xC"
-    "i5pd6EXBvR8r7zv2PJ/qmjYSBl+J+EHs6z4ZnLSlcIBm4dqtxOGzwFpZbSPhWtZiNqJ1A+Wv"
-    "hpYwcgtNqZumGHCaDcAK/DTq53DtxvvSHjiBbTiBFkg4lqQhwYX1FzxKZDfg+PZ3X8Ch9hu4"
-    "+nktnYJr1YGe3tAAgB4TDDcBxs4YmksYGp1OA+gL9g9h/BQCdBh60vT2TcA23b5lMx4JarWV"
-    "thwuXSucoduIprUjNpzqW2fTtu3r0v7HPgNHbgObmD7a6mA68vFPcKlzFrMlOmUGlJAf0Cfm"
-    "FUW3VDzGoP0ix1nXV+E/j9zlmtbWVsG1qg/61gWRSvGjWO53c6NNOitu/zlmJ+S20VY+dOPj"
-    "M0gpPqoU9A8OBqfae7lXzhWrEMHLYVzG/GKazhF1K2s51LKW/JfHadJJlOE1lOscpIkIaTDP"
-    "rdC3uxRo3H9RGP7+Ypc9VnxyDFO492UeC28YAZG/T3K+1tHZ0p70IX+j4hFg/lmUcr6svDN7"
-    "kzY8Fz3N3/mH+R0LoW8NEt++Li4flILHvFn8iPdFQOZkNvpvd+7MYYu4n3z/2raAa9uLbYfT"
-    "9oa8GQxapLaSZEb63vAR78RDxrwAi6d/51WQVHmgIMpFD3jiYGBRFRBFBv7mE5M7uyQnBik6"
-    "AywW2ljAnfFcXPy4JjM5GlYAFGll0OYg84oJIACaE6jP/FiahbtiYC2UgQqTlkNKwJIXG/K1"
-    "EUqDcOG5gzkDNEFEwfkyfYMaxXQjbZ+VyhLlcoIKUGnYPIAjHun5/+4rLxymoThFcaE2h2bg"
-    "FHm5W59iIcniBdIjTcGXeiWKFVvgYFXDvdIq+yA+B+QqCcBcPCa539zemlpbmrA4jV0cCiBn"
-    "SbGdXDF9H8p98BSTE/RSOT9iDOpgWAGIFfa7GkvtFayynrSqxriiej+2gzv11U2rMbZZExyx"
-    "Veh9PfvC81EXdUEUUSremMIYaZiEADTekAb4LydLeK6Yo+O6traWpjcvTqffevlh3LLAueCI"
-    "fveVI+ngO3+VXn/tL9Lp8zjovYF1cUwnVi5bEYuuQGQZ97Qi5byZusZmA5jW1cCdII9ltOsq"
-    "9MO0kSV4VudOGmSNiroJXCfQY/F4u8q/mrKoQCdIUWkXRlEr0LFQ8b0aMw5y7Wx/+0Jatf81"
-    "nGlGKoSvXtMGWOCEXeel9NgzX0/7DnwZ7uRWFMDrAKWK2jyiL7cQ7lLEzXo4eVOR6d7n01NY"
-    "CB++ziK7Gt2hocivCjAZpxl5r2FRy7ISzs9Q37VQmkeAFLbPBnsvph5O3A1jc+v0sfdio7Om"
-    "bQtAEHtKLKoCK/XPgOmki3uMDbvhxFwg7I/o8RupfeMDGNscgKvUiu7RFjhOV9GZWpPqcNMT"
-    "44Px0NCIqQw4QeeOvYNxUQyMdmkf6zIW5x+mnVZjKf4VQOYV2g3Dm7SLjsZnsX21DOV1DZSq"
-    "n9W6fls4km7btCO1bb4f59+7MQ2xG2v/+wE4W2kmNkCADoGIbZ7ztr2hQyaJUcxGXMGx9Ufv"
-    "Yn7hvXfS+XNXUmfHEGX3hJ4bAGoIncu1GsTcwQjgSk8JDP2ot4NRsxTallpZcyNt27o2tbRi"
-    "T4p2rGE8bcUv5IOPfS498+kH0jOfeTo9/ZnfppxPIyqcBMj913TsyA/TWU7o9vRg/BZOM3xh"
-    "RMtZl0y9PeelXO48lwjgpS1Fh2Qdc5F6Xm5MMuAUQEEjWHWvhvMpHVhnAZ+neZ0PRhjzw5yA"
-    "dPDI0Zm2PgHAsvFRrbiHUjy0ro261Sjka1/rFvqJmlcZxdTFNRyQq1vXtKYVES/mK04cDWv0"
-    "WS+VzRAbFsvth2141INMyPMfc5XS+4WSMKwBFyZL28I6e0W7eMPropzl30W4InrUw/DxYCHN"
-    "/MRE4mX+433xyQHueFn8XIjUUD2BmHBrmrzB0dN/bDMVyX/y/cvZAnR7BZvSb+34Edxn7Vhy"
-    "OU7zXb4XWPmPNSGP4V8QYBVp3PUdA5EsSoOySNSZTEDjJOF9AZqM724665zIQpfzkCejeMaE"
-    "IahxMgw2tRWY/xi7CCtIY4FigXQQhQ6UZSmVw5Dee5l+lCW4U7lcAbAAcLFjYxE2vmUNezVG"
-    "Jd34HVwauRbmCxwgScsTgIdvH1huF2pP8kUdSuFi4FsALt5G3Pyr9LuUjqJIOWmKTLQbpIhB"
-    "3YisfO7RbMw5UFbLYMepGG8ZdBJdgwjONlShXK6VnMNKynMTbsM5FNv34u1z54774BRg2JNT"
-    "Rh7zHkJvqY7MFKJXAABAAElEQVSz6E14Ax3gFJWT+le//hLA6NkwECm3SqVc/d6pG1LfgFNo"
-    "9aJQsm7B8KRuYlRu12RB61pOFLJoqMNViwfRx556IrVil6evG39ugDp3xQI+lYH1DzjJRK+t"
-    "IfGN5ZxFhANWAbihvM7CuG8Lula//z/AMVmSzhx5NR099EO4NB+lnr5llBvDpBP4Z0Mx3RNU"
-    "wZ1B50Ul/NssqEextXVf09JUV3U7XRji1F4Ni2ipb6VBaYduiotmDOBnO7qQ6Cj3BuVUb0Un"
-    "3HLpFKtNIHatRixWi2hKgBAK46Qj/RQW1AUuggGNYTZzGq8aG1dnTrzF+xH0kFrpE5SVR3sw"
-    "dPk2orbROB2n3SrFwwH6KWO+BBCIsuCQnMNQrECtu+MUCsyraJ/V5KHCvQtg3pjITVqHGK19"
-    "K06MqVDv9UvkMxwcOC313//gpwAu+4IuqzhUYdo3GVdamNdSuxyXhChzVSM2yfoupP7rV9Le"
-    "Bz+P+HBTunT+3bTxvkexT/VI6rt+AgOi+CQEHEnTFYhG127Yhp4cnCj6dVXdRkDX+rDE3oVP"
-    "wirA+AxcsE4U/ptwB1SNxXg5pXJJ9EsYAIQ2l350lOxHY6Wm7Tjwvf1VcLPlmoZNuCg/gAkQ"
-    "efTgq+nDt19NJ44eBQj3YdOLU4KTQVX0Y7YXpfmFfsEV9F4FkQnkHecxH8S4hasDF3j7lur0"
-    "0ssvIZp+jjLVwgU7D/2PxinJ7ftfxA3SDgC5tt7QG5uBy4rphxMfd8O5Yv6C7txkKCJUn0ua"
-    "UbwcYnPydMPkIQb7WXdWusWxngIhOYLWMcydQJienJTT5BxCEPq8Br2vFQGyPLBSBWd2Ce0i"
-    "TbshkDMt6cihk9OnOYcVcMUa4IqtgbPt2BWIC6QncAjXeb0zxId9eNHtwWp9b0837TbMe+Zn"
-    "5rkl2soyf+Yx6dw5K8/feX4vEek/4CvP0b9IRPOMIWoDxOX45MOYi8vnzoN8Yn7ld/l3DrTw"
-    "13c/64qcyl+XsojwPvf3/PtFP+aTVEyYEEEfH9g4X8T5l5/c/Fq1AMMiPdx0Mn1q3dFcL7o+"
-    "rx9xw7OMM4I+DRFryy8IsObpLCd9918IOUBKvMkZOqk4UTr5Z0CTJxR3pQFEKJDcIQsS4MUC"
-    "lgBWcLpIK082Re55+BnW55FGaQDNDyR/lw0+751AFgCWeZR+s8xnNyqK6ZipKLZgxVHlxGec"
-    "4MT5onSZT5z6MU0bUN6JEzfhY7JkESnnYM3Hc6QW1eBhMbjdQftcgGZ9ZO3XYhtIXZ2Ck2U2"
-    "tofRVW5Vr8Ij3dZjCsVlrVGPs9BNw4maZaKtLun49CEWWYs5hE3rPfE1nc5cusoiNMckXM1x"
-    "/lXscOvTpz71aPrC176Utt+/l8V0Gwrz69nZXqbGOAJtb+fEIPomiANtwwB/5D2MJXZ1sxRR"
-    "VcHN0gzA4FAfAEyl+dl05uSx0AfTJITcNuviwipXSB0vih2LnAuCdWZ5QKR3Mw1is2pjC2Ix"
-    "FrHzp99P77z9N9jxuoQl+uY0OIr+GYuF4qHl5FmJwq5d7ZH7M5dQTE9d6Y9/58n0ra8/lw7s"
-    "bUtVs/3prQtTaQ0nDcdxjuviLjipgZNQtTwfiacpY6GyYXVrouFWOVz2hUBrGaKucXRgJjCc"
-    "eZvThdXYc6rBqGQGAyUaJF0BgH2haFeuW8Oa9aGjdP3KafR2HiFePTQzlc4cfStdRA+p/3oH"
-    "Ir6diMPWEA/6pwDyCqQtDYOOcdru+KHvwwXqRoFcP4FPxsKvlfZlLNLauop2k1YBKvnwxC10"
-    "pwBC+BBUh3Djtj1hof3s0TfTNURdw7hOWkHZV2FiInQbISoPRXiCsnpFE+Y6HgxTCMc//l7a"
-    "tvdpjIl+Ko3Rp1fhEvV3dwL0LgCaz4QNKs0yCJjqUYjfsOWxKMNlTu5NTvWk/U98Nu157KuA"
-    "kvb07uv/kfGEFfTtj86LaAQblt26Onpc2KUZuYsCHzs1c055GW2iHhGcIfp+eLAjXTj1Vjp2"
-    "6HWMvb4LJ+k8vjH1NOCpO31RwtVBjDZBP/YNjaJrhViOdGvRL6xC5FetLJBhPg1NKmaTG8aR"
-    "EABWVXriaU5OtmxmAzCZrnedxt3MRbho6ENR1gH0605gvf8aVu+7OjrRuepCd0/vABWMCblN"
-    "GuCdjsMiHhjxdKEucdSZdDx7YtRNkTpwHvZQtK9JhWlsfEk76l7G/AgNKdafhhtNy3C4pC7i"
-    "Kxp0E1EL/a3gdK3jtmVNI06nVwKiatks8YxNUDOuDzwZ7Mlfw9rOoXIA4BtB9NjVTZ44hNbl"
-    "1SCncBnClAfOG31iuzAagh6dxwKQ0+aLL2egf8gFfTtYf4ErZvgIWoSHJqCL4hGzN7TiX4pM"
-    "mqZb/slZGIc7IhX5GiOn6N/8sniX4+TwESgHjPj5j+G9ihf5V/G3beVQerNzW5q5iei6CFq8"
-    "/OT716MF6HpPmP/Btr9Jq6ocn24+cmf7nYGWjxfTiCFCRPiPpgsT9lMaDBJ07IxKmVsWSdzB"
-    "LEBw8Fsow3gVACsmGgcQC0foXcjGjwmZ8BEuA5EANAAt8zHPgvYNExdlcQB6BcByVeeKPEv3"
-    "ltfyZI5a3q0J+MxvoXxMOvxz4AeQKqVpWjmc4MwdH3XiW6BWDNwY+AbkipKUxc1PfZHBp/pn"
-    "toHlU39DQ5/LAAMqlGsYtPBppoKs9+Ytp0DOluI3d+LexyJF+4XRUtLmP7oqmF/oR3wCl6sG"
-    "8UP7hlb0bnRzU5megWu1ZcderJpjnZqj3nLPLp8/BRiaBWAsD4AxjoJuHcY1G1bXsYhOwInC"
-    "RAI75ZZWLKDDhdFkwsBgX7p4CZtVKOSqKxQiTHbpgqpbLGZ12FBSEVfOmBxKNuukr8d2OE4r"
-    "KtM6jqtvWVOHi57xdPLC1fTjt68A/p5N923fn46fuxBmCVifUGyXu6GIK2E/ayq9dfBs+sLT"
-    "Delb//zzacfWTekWiuQtLWvS3n33p1W3h9MPjg6kTc21aRDnuIoTPfWlT7cA/bYNZOGiPMuN"
-    "4FWgdQPdJV0GVdIPOikegys0MjpA2yR0ZhCH4t7Fk2ZyCz1ZKGXHx/6l/5ZS0A1b9qQt2w5Q"
-    "7jUsmBghRTTThf2odZzAe/S5r/K8VZSJ+DAvhLaJqUiz2gBbhXhtC86OrxMnxIxwsU4fex03"
-    "PT8BlMyiM7Xa0PR55mpJm4K1xqaW1EoePXCzTh1+A/0xTqg1NqcRRIYdlw9TB4xTKu4D2LtR"
-    "sB3hkfJ3GXpvD0BzlXBXsHvVcQ79ozcA092puWVd2vnAgXQFm1TD2DBTvCdQmkSUqUhpZOhy"
-    "unD6IOKu9XDNPkMfAbI/fgt3OEcBag9jEBQOKn0vCJ0HV9yruO/AiGaj9pkLTBMC3vImSvEg"
-    "HBpMVGiB/vihH6c3f/RX6eNDH2LXipOJQ9PQF/bgAFhaN5cD2Y/x3EFOzNq/9oV05t6p2hN3"
-    "3nBpqkPvBgkfjxXL5tKWjTVp797H4FhtDr2jzmtX4NrhhBxatA7nz34Al+waOoLXMMUxhCie"
-    "MTc3AniRa4QxXsafgGmUwyXDADv1IykAfaRZFO1+MRdREOsvpymfGM7crqgzjSCX1zGto3f1"
-    "OB3zHoaQDgX+GuudbzvqYDqK7OtXrYwTxK2MRfML0yOIHr20d+eGRptY/QMDjD3d6Eh2N9HF"
-    "wm0UnFo5XG4YvOSU39Q1D+XQQK3zYsxhdkLpmv8tsS48Ll7f89u5Mzryrre+yYnkO+9LTyJP"
-    "M+Fyfo9vb5kvS78XA6yy4pTKGynPlz2nnRMq5cka8/e77h1ef6gNuFP6sGcrBfz7pfhJ6F+N"
-    "FpB79WzzB+mJ1mPz47AgLb/jPr6h3yATv/Mn62CViFYCDoKWUO745Ig/u0GMW5CgyTgQMrjJ"
-    "JdBGj8eBA9DEQMoo0MnUySWXjHv+uWB4aii4XQIXdlUWKDg98VulUsAQ+ViRiFuqkCXMdcwV"
-    "nC+xZWLiDfa6HCfZ4OQr4OOGSUvg4mRYEj1yX5qnIw8Xp+IyT8PJVfD0o5NfjidIMn//lcAW"
-    "v3/2RSjKYpAAixGQtCibx7etr4YDdcjrgihwcoFwaRTcVDOZOsn7LltdRw+DsOpfjU1oHV7d"
-    "JsQWAIkGQIzmHDS3oJ6HE/nk2HDatmMnC30NvgtfTz9+9T+ljw+fBMNUxYQ7MzeOGLAZhVms"
-    "VDM79/UOhLhwdRN6SYgzaxB1aZV+AAfRXd0crUe8eAsDfJXs2nXqq57X9p07EJU1snDDzQJI"
-    "qie2BIOHijeXAWLkuO3euTFt3NACwFD8sTSd6J5KX35uf/r0pz+fVsK8usLJsBnEkiusL23y"
-    "Fz/6OH3p2db0P/2PX057d7an8x+fSm/8+L106NSx9OHHx1JbS3N64lEAw2R3+j4ga33jcsoP"
-    "t4CGVqyjc+kpgNUMDTPDwznEZVAT75dQb1wEYapiGeAvQCwigGmMr47CyZqbwZI4Vrs1XSCH"
-    "cSl1F2yESQz6QW6e42AZJ9/UsbnBQvzBG/8BG1JH4BI+lvY9/pU4RXf84HdQXB8AeJ3ntCFg"
-    "Ds5V1lvE9hhcpuZ1tBmiuk34N9Ta+RLaaMktFl/Kf+Lwdzg1eAtdpe0AJcYco/8G/dyKg+hW"
-    "dKo0Fnrozb+E8/VweujJb6TVpLV+4/50+P2/pg36UvumhwA3LuoAERZ949+i3Prsa2nbmXow"
-    "Pnrl0iHiY/YBfbQh9LCmoJNhDlGM4BRZ7liccLQtAT+KB13sTnz0k9R15TB1fR+QfjQ99Zl/"
-    "hjubl8gDcOMGhL6lkjFmA3CxIZD2Hb4xfqANQaJlqsDlTFXtKrh53XCsfpA+fvcVyv8uIK8H"
-    "0wu4ohnRmXIuu9bY1U0aGMY7wdhMiAMz1xSxHKCqmo2KohznCnorRmboASLW6yXeM49sSrsB"
-    "gnLRdJA+0Ifj56sY8B1AD6+nH/3EUbhaGFjtkmOsOI5xBQ0nOFja8ZJbNQRXd2wY34FsIDyc"
-    "MgsoqiLfWkCPc4x6b2ScgRQ3Kp+vRCdPR9qOQwGhIkwPoKzkZN8SxoU6W9WMHx22T01nA6XO"
-    "Ox42ud7dHZwybWetUJRIWtVhoR1aUGEeEe3g8FCMR42cjo/zDBp2jhGIurmqrjGPqhjPpque"
-    "Vzio9qAK41PwrNFXQWIsBrRPbGydr5wYbVAr9XOumCud40uh7e/8cX4W9DpX+qw0X/rSSbR0"
-    "+XYBWPkr/86APMfN5TDhnJp5xidCe+/czbfFNpBX5GE+f/cn47BSnIiY/8RaWfrdXjeYrow2"
-    "pZ4pNj4LRS8L/cntr2wLQKKrq/rSf7fjO4jpkSA5lzGmg67FC6798ck0kjeHxTMkXL9TpuRu"
-    "JGLesy1+xuP5sHfGmidAIjoY3BllXYrSQIISjeMEpOJq7Ei4zwVnUmTiyROwA4RJmN+GjQ/x"
-    "Iv1IwPd8SnGjQP42khcDKcALk4JxirSiPOZtuj5kYveKgVueFqUMBfxYDPJAJbMom2UqJp18"
-    "b/lNpVSmUhF8UozruC/7M1/O0jOj5Loj0oIDofsad6OzKLvLBbIO6qfF4siCoYHRcJOjyI6d"
-    "Zy3gyZ3wuhZ0pprqESPg1BlbVnXoEa2AY6JSrRO5nC9FVz2cxDr28Zvp7Z++nk6cOMtioaFR"
-    "bEEx0cu5qo/TgYgVsBrvsfMmlNrVDwlDiyzmtYCsFXBYBlmI+gZ62W3PpgbEFG1tG1B8bifv"
-    "Wnb/nSyMOp1G1AHnTS5SiAiZ+CYRr6xu5BQXoj9FHv1wAVzwTx87nZrrl7DQ78WNTmeckuok"
-    "nVkcR/+v3/699K0//DdpMwrSRxEZ/eV/eDfdRt9rdKISpeZbcF/Opiefgou0pS3NDnami934"
-    "/WOgKEZycZ0BXHmvIrTzbNAP7R5tK1cL41rq4y1n0VPUI/B2Ie3suEq54RStbgodKpXP6ekI"
-    "a/9K39KROlmhVM+3Hb9z/3NYRT8AGF0JSGPhRnm/48oJRH64OtmwHcAGRxGumFwp7TspOurG"
-    "tc3FMx/ANboc4W/f4EQcHLYLiO3qm1s5ofhoiBTnEDXJAb0B98GTavoevHLxTcwsPJ5uYx/s"
-    "3Z/8GfTEAQV85a1u2Yie2EbCzsLtwGK944E83ShoAd3fTbjRacc1jGBNNzVy35ZWaLR2bbrv"
-    "/oewlbUx6gQFxolHTUs0r9sSnNCaOmxmrVqbHnz8c2kjvhqn4Z64GLupCp01xwufKUxuyEnJ"
-    "i7djhTFIquqFLceI6w3o8vyJN1Bi/y6f1zC/cAUaGgQwsIEAWIHVY7Ok4U49BIxyClGxH73J"
-    "JEh9SGwJ6QfHEpDlmufE6OQnqNbUgX1eCTf0wMO4DdrzUGxCLsC97bx+HUCjXbXlOEHHi8C4"
-    "HCNPZFptAUGer2h0wuFzESAzwWk8QZTgxhOtcsiqq5fA8VwVwMf5x/zCHhzxLMsKgLNiw0nK"
-    "LtfLPGwEmfqODQ3bumkagzPmO8XXivymAPYTgC7jKjpU3yscrQOcIL7gdnX39qGTiRsewKcH"
-    "W6YAWZ5ItgzkQNoYnoWLrTK8wFcwJfdeMw+aexDoKtakq+gvwbGbUYCVbcAf50Np5c7L9DNQ"
-    "oipx7+jwuldY2jInGPU2SBEnotiHplFKwWdRfG+KvHPiC/FKvw2ycPGwFD7WgSLuQoCff3dn"
-    "upQ1xk6RP2nev/p6eq97S5r+RFT489vzVyUE/VuBvbN/vesvU3NNNm3iHC9dei1wUaHleCb9"
-    "509+x9jKrnIWanwnLRVv5om7ePCzvksBc35M39yI8ApulEDIwkRBGKgBJuTlM9ALkBSIkNE9"
-    "P1iJ4zPjxDvDWlD/RNQSYoxHC5UsBpaBHFeRp2mRdgHg5kGcQ5mF1DIs5MGkaBmZXJAfxHPL"
-    "aRwXDdPI5S/Vg7hRoPlycFNclvcel2UqLu/kzCkesAz6LdRGjs0zzUks9TeshyIluYNyrwzn"
-    "aSNFBKsAUZ74U1zot9y5AXbXfX0cmwcwNWDQU3BlnfSD5iTdhfLr2bMnmIiXASDwI4edIHUz"
-    "GgkrENLx7BTHxBVL6EetBd+FKuz29fRSHsUxmClA4XoloMuFYHikK9LdsnUjoGoQjtgH6dx5"
-    "nAyPIPYAsDSgQ7IKwCeHMwNXbUQpBoXbRpmu9w2lHoyRNq3C7c/ls5zYOolFd46TT4ymr770"
-    "ZPrX//bfpCef/QKiupbQV1E89dGH51M/elqjU0vTe1dG0/TQrfQb3ziAWYC1nHDDp+FHPXAD"
-    "MrCT4yEXU3Fo2LgKuqPfafvoCUBXBX09x8Lkx2f6L5T7aXt2d1zj9N4VzA6soy5tpKMVexY/"
-    "TujZF/4WwLhgqD/Uir5VFUrqPhjsO4OdrB8jkp1M27GYvu/AS/hVHEunOfJfTR5yvdRvq0a5"
-    "2T7qvnqKk3oXgtM4O9cP+L0OR/B5Ttw9EsrwY4DHOqyxywGbmhiG61YNWKtj4V2RPn7nB5yq"
-    "uw4om0SP7XR64vnfgxO5Edc+P0X0dTCUuKvxvSgQFBhYdkGCyvSKQOfg4h16+7uUeyp95mv/"
-    "NsSeazgVqb2k0K+kYVx8FZVqR2lZTV2AL3WZlqGLNo14OOAb9ZDEY5zRmsF55ndwqCmvC5Ug"
-    "zJOYctEGMTh76vBr6e3X/ks6d/IU+mwosQ9OARhUHtfgJmOEPhpHjD2AGG8UQK94N8YpwxTG"
-    "UXA5hVUCZJ9bN+PoiHkcTqbpQNqphW5pBNwrolMvqQ8jukOD+s6UUyQIV2VA0aa6dnKZ8pgX"
-    "tPSy4ejCS8IA3wKhm4huBVbgGMLdxlE5ovg1a2LeCGKgJb1iDpKo9D4A2BsDwYWtK7mfcks5"
-    "+SgNqDQ/iX7lrMBZDhj0JDFKa1QHcyY6qF7NBgdDl7YrdXADZlo91CPGF7StDtcU9TZMzGPR"
-    "LkvSurVNnABu5L3icxqN94MAvaHhYca1Xg2E0GzomGc8yKHo33a0vwVpURj+ll+Ctbyw8JZO"
-    "d/6Oy0nLwi+6Sr955duY2MqCRJQifGwoix8GFSpl0OrTmEPL5tGFkKW7nMFCPjwOsBVPfLnw"
-    "udfzAFMWqPTJuZflAm1VV8zhPqUrvdO9lY0b+gyRZ1mYT25/tVoAWlRH+g+2fS/tbjwffT+P"
-    "DRgHmb6l8cUfx4jPHAviCQDWgpmGINS7BkJul7+LfstbLsZIkYEDLjLMICXui8LNfwuaGOCC"
-    "GyILWAQYGcAQj0nNeDFATZd7w8czflvpADlWyIKUnsV9/Cw1ABQfAM5KuysrgaP5BuJ5lI9U"
-    "oiF5v9Cggj3e80wOV8RlsZ3/XSqP4YuBFWDN8hRXUSB+l91GuuRYhIrv2CEyocekzsRWBedn"
-    "Gv2nMU5Fmb67XBclRYAuDopU40g7u2vLYJuNcXLo4pXrqRtF4BpAVTOKsavgSJEqE+h0mHVY"
-    "haPaBkSGAxj8nJ2hXksQB7B71U+a3DMndsGIPtcamYypenDDBFhOwoovNFhqmzQ3N8WOOnbB"
-    "o3AbsCx96swpuFrd4Q5lioVQ1x4CwSZOOcnNmiN9dcq0QG3TqfA7FtwIQCSLDWsMx9Nn05un"
-    "h9If/MZT6ctf+zo6WyvSLGBL/3DVKziZhVvD0aHj6d23B9Ip7Go9uHpp+vb//NuAkC3pww/e"
-    "T29/cAyuhQss3Ci4geriCBYVXbno5gU+N7+94By6nNVXboigT5tV9pi+FivpZ/Xi+nBNcxPg"
-    "sgKOWzUcPAFFtkNFZNL2FJanCgUTcoZCSXvoUnrntT8hg5QOPPdNDhXsT13XTqSj771COw5j"
-    "Tf0h6Em9I8pKO6gc37ZpVyifn/zox/g6/Gdp7yNfpkwjuLr5HnpWKHlfv4rosoeTnjiqpi8h"
-    "Cj7ohDRtxQhqE65W+uCi6LbmSdqoN509+RY6ZR1p94OfCxtjt25pbgP6YbypML+EtoEHFoDF"
-    "IVm5/FbasGlPGFxVJBpgDKXpLPoHWFFO6U46mYE+JWOtyMvtyCJ4xpppQ7COLTmvceLSk4M8"
-    "F8Rp6qJ6ZQNgYgCO3bs4Z/5u+vjgWxgMRRzYP52uXEUHDhqT4yhgm4C7OAIQn5Yzo04f40AO"
-    "nWPFMeE4NZztnDktQERAxiRhPcHqARENzS5BbHgDruBy2hxqQxSIyBbdLsg6RH1yBJcvZ7Oj"
-    "BoHjgsm2ErqQk9nV3Z+udnSh2zhC30kfVJH85hS9goXq6yrT/bu2pbYN7dGnpmXZLKMFy+3H"
-    "vf3Fb0V22ZeneluMLdp4Er0r84pDCZTbNpVT6SbFsSONecqwlsMlbgA8oaitq27EmuN8B9Bh"
-    "PshGSj0VTJ2hLfPUXpz6W7rqUd9LTpfczyG4ZdrSciMnMHUDZ38lXO3EwQ/FhbQvteXj5X2+"
-    "7B1HTX5iPUtXgKHix8L3QkjboQjLdwFi4lt69hGpU26/8+/MwTdWzMtRtzyWc3zTKdIyUL6P"
-    "bOb/xA0vfv61UMuFsEFjCz8ji/rlY2l7fU/6oG/LJyCrrG1+5W7pcDdW39r+anqy9WimPyoh"
-    "rQXWcH5jzfN3+SfwQzwTo5gI4X/nN1/+toG8iu/4ccefUpA7nt77Z2TKKxd7B5K/485vM+Z5"
-    "ACTDmIR/oHdJ3ucuZBYu74Bc+Pkw4A0YZSS8Y80Vf1686ORhiIgXqUZ6RVn8EffEid0030XY"
-    "/Jz4xPWyDIKnfG943wn+qIXxY/KBVeg9+RbxLWeUi4ikXiQX6Rj/Xpdxi8sqKT6IU48U2HJ6"
-    "SimLEsY4Wt0fE6GToROlSt8qFZupYUI+LAgkSa23u6NtbkIRFltYq5hQ5axodFSr71qJ9rnc"
-    "LxcKzTxMTo3F5K4OjCIK3ebYbh7dlvPUiHjQ4moUcYwTU+7cb93G5cyqLHqswV5UQ109z3Fs"
-    "Sxh36OPjnOKibPpBDL0xdEU8gWj7uks3vRW4W3EC1SK9SsOjE3Dg0C8ZDb0pRGMskJtaauBs"
-    "vANX5TvUrQsAWAvwa0OE2Zr2P/Ji+uIXH09/+M0X0jd//+th9+rVV76fXvvph+naAO2EQUnT"
-    "qEaJuxWxaQ3cPUWZcmDIlrzldqgrlE8Z2p7cAhixBM6KOQpYVdfFRSYuwEhvTwe6T+OI1Nah"
-    "OL4OwFfaCCiqIT5q5KTPghsZAFr537p2N86WX0DENZNOHn01nfr4ByzQGApd3cwpth0A6dUA"
-    "FAAr7a3enW5OWvALuG7T/SjJH8d9y1vh5maO9lURXf+NPZxKbEZBuxbxnBbXoVywEiALUV4b"
-    "IE6F9stnj6NbdJX0EHlhmqMJm12znCA8deQngIlJRJ5YrIdbY1+7cGiKQQCyunkDAHwLQJ4F"
-    "mwYRAFs3+0x9umWCE+qn4r39yeOos30pp0MulfShXSvBmM8NJ1BzhGiuwjx7r59Nh975G8SZ"
-    "30unjh5DxNkFZxUOUe8grwVnGIUFiI8B0IcBV56WdW5Q30mdIstDsQLkCLj8CJ59ITCbxBXS"
-    "LN8rAeSrACSKEGdIQ27jErgNEyjsn714Pl262p/q4Rg7jtRPUsfQ04KW28MevehnCWD64KjK"
-    "ddXUQh6LWhFTzEZ/UzXF4BvWr8M2GnqFAEit18th8nK8S29yUK2bZVTML1iqZlPjCUAbRUO1"
-    "tq1jxM2ApxGts3ORagPqaDn/qGyv+FA69bSwiu2KEN2EyaHNtt/Mx/ykRw3rcrgE23UtjH/f"
-    "u/GxLo5ZCdVNj/lUo3LgZuzGTeSk1E96dPNrHYxnu2TwE0XmD9lIQ/Mfbu66fJbnXkFZcQV4"
-    "4nf8I13bwLfxO8Cpz0zbvuWe72LejW/qd+9Lqozgpe8iz+I7Hv/MPzn24te5XNYiX8W3ZdNH"
-    "4Z6GznRkcEOaxadsVGJx9E9+/RK3AFMvc/9M+lf3/zA9uTYrtUdx6dtg/jDuxAGO23t9Mi0W"
-    "2AJmx7d++4vfLh5mwic5IhfPiu97JRbP7misCD//zCGdyc+7fJtBSBYzlPIxlHkWgMXf82lY"
-    "nkynAdgEO148U5TjRODEYwzTEF1EOJ/5u3RF/jlU6UkpvAnFcx/nZxFvvg1y+i5csTMnP0GV"
-    "YWNXGPkv5FPUI5LNSUZZvb3rotPKZqM8FuMRf0gy0vKbPFS+vt6BLhIs/JhcSMzyyGGKk4WE"
-    "0z6UYgwnPhV76+CwrOZEWgO6IGJW/ZRNKHZAZFCcQHLR1UZVL/ZxVgJ8rJM7aHfOKvT6yRMK"
-    "YhMWlXHsW00B3jx1qD6XBg0bGhrjFJV9oa6XrmcEI11wBCYxJbEaLpl6Sxva20KHy0VpEqXb"
-    "ORZIuWvqhrmwuBhOoJSv5e1hTohpVkGR3koWhHdO9KZJ9F3GJitwY3I+3ZrpwZr4buwxtaSV"
-    "Deh7bd0LIAKEYQ7hP/35n6V3D+JgeBazB1Ny92qjDSvZlQTdYRhyGflOKnIV+fCpR+l+JQBP"
-    "ExCGcSOQJ30XN7iFnrJi9bTOWm538RrkVN2NuTGMftaGnSgXV7lAgq0Q49KGnkaUk6VF9oaW"
-    "DRjmPJfee/Xf478QRfAXfx+R37OAi+/Qfh1p87ZHRCj8Nw7AgfZ0MWlauw3R67X03k/+77Tz"
-    "/ucApI34IzyS7n/4U+n+hz4LJ60VQ5faHPMwhBwkT5FpZV6RE6YMxvvS7gc+iz7bpwAGveHz"
-    "79KpIyjPazV/H1wKNw3Evw1AY0w5bFwoPQEqADMdwYh0nxXRmWz8zXNJ2NNoXraXm4IoO2lQ"
-    "GNpTUEo4flchvlSMvLwa3TWBB2W7cv5gev8nf52OHHwPJ8/9tI+n3jCk6xoKqFBPbgb3UKNw"
-    "MofxDu5hBwGHYjqBVizFbELsj6VmQnmQ1BGXeIgCkYCR163Uvq4e3UAM6wJYxgEUc3BILw7N"
-    "pBceXJG++NnH0m//xpdS/fKZ9H/89ZG0mbDaGdPjwNj4cIjNensBVgAseGW0M4rto5j2AG8a"
-    "xrlFkZwueGoxcrtiJUAODwvamLO+cj3lmtq2eQNlY2XOs21te2lPzk0NM1D0X4heaT8n9eC2"
-    "hi2xqC0hBFrmKhiSOwa9kjbVphxuCOBCMW7kdsWhGOzN2Tf2XRgUhj7W4Ah+08aNhKmBg42R"
-    "YsyMCCJNS6644uZVWNe/eSNv+G7e4kQwp1YFdm5qi7kpZmMzJn1ams+dl/kWQMx7PwYv7vN7"
-    "Y8kFDv1S7gWfpsjT+OQ0HJsMssgrXkaOhTjGMPZDEZuU472lmv9wY5v77s4r2p6Q5f+KUMWa"
-    "EKmTR8BV0nHlMTXLlNsEQ6814+nxlgupcwIH7dNwlktB7szvk9+/RC1AHzGEUtvK3vTH+1/B"
-    "DdJluu1uKnE8+gnmj3Gic3MXBy6wr7mkMf9U/C4AK375hP9BQAyyfMUvbu/xLUEVoYKoTc80"
-    "cpZxz/uC6Px2Qi5+Gy7Y2GXPYodmqqV0im+Tj6rGjWUhiGCMsPHPghiNZ/NXcUscY5TnbbgA"
-    "ZfHtvZHzdx6spXJatlL5zKAoe/EdbMKctdlHPvFuvhBRrLJfd9zeUc8oh4W1OPlP3Ft2xSn9"
-    "PT2pq6ubRUYr1+xo+afYQT2KEBc6+fBMEagigxpOGtZy2k9FbRdfd6NOQg2YTVi3rgVQo5FE"
-    "wA7iiAlAU/uGtbH77uNUYLarhWgh9OOiNKFrY16KJJo4SajZheWIDeoBWOpxOIGrP5IJEJMD"
-    "iDQFajt3bEsbN21k0WFhpW7hNzEcUsMpAIz4kRY8xTQ0gqIt+jbmqLV3J1yr1bKKk4A41NVy"
-    "9sGrs2n9isn03Gdexu7URoDaRDp/8ifple/+u/Sdv/ouRkm1rF2PiAsDjYCmGygeL6d8QsVp"
-    "FsdbFYimAFIqSd+A6+ChAMETa1yUL9MHIIVFXG6IZGU9DG8feWJLReQ52rPz2mUsm48GgFyB"
-    "g+TwJxhtIHcnT7q2uVbzBTv1DS20I3bJjh3CHcyOND7Yj6jwMuK/F1Jz+z7qSh6SCZm6yHo/"
-    "B7epHvMKS2/VpmMHvwf3cIA+aCLIXLp09m30hjrhNq2HM7iKCqCLAyfDk4xWpr6xBaX1PRxM"
-    "aOSgwjVAzElsXA2nrbse50TkRrhIcAJJW4V0AbvGLM1TjlOYD6EcwTHgmX0nkcfkQt0EjtZN"
-    "MJmBKwF4b7wQw5Oe163bOBhXvMS0IhfE+Fcx+3Acg6EfvfNaev/tt+Fi4agYcxojcAulvTnA"
-    "0STiwHE4jSMAqwl0k+yLaA+ATHCOIm3Kw3c4K+Y9GJ2xkQGP+keNdZjNWNsQXCK5NCFeRFF+"
-    "AtHeZx6uS//iX/xWeuq5lznl+Uzavf/htLV5JP3t995no7CCNrmNHbBJPA1cTZ3do/jMrAT0"
-    "o3NH/qFsT2YxXCmA9KspkBW63AmwRBswbt3MyEn2ynQFZRPWcWJj2abFJwBCpEg9oEc3T9ZO"
-    "MBLOrXnHLXNZVrTVrEZ9Qx2GRXXejGFRnhvHek+wgZlGhSDmVPrBsuW+ypuHeurXio6is+g1"
-    "xJ3DmGpR30tFernijaoFYITWDZt2zzS+u2HjZmzoMe6hdxlyjvPMZbd2uR5BAKU65Hv+WuhF"
-    "V67Xokfx485w1r7sIh3/xbNSms6NMQ/TiHT/XZfzSMzpvI+5ORo7Byt+L3xbh4Vw3ptZfJdS"
-    "nn/P71i/Ivzd6dUum01PtZ3DhANz0+iaNIdR5E+uX8IWsH9LXKsvb/4o/eG+H6PQDhMjKK2g"
-    "XaiuRFxKr6R7iCLTYZBIEMkddEIShKn459/43LedHOc/xWDwW4L9WZ9SW0nwEaYokj8dCH7K"
-    "olME8yv9yW8yAfuw/OKdlYn8S9+8NjUniDxYGTSlyXs+86hwTivnXLo3Ha5ikPjrzhwjQPGH"
-    "l3e+L+JY/vJPrlARMX8X+Sx++vf4VZZ5eVrqQgz09QGw4OSUWPohqmSXapt4kkhukzoXigs1"
-    "ShiGDpmAwscg8eVgeVqvkUlZnQ9PQQ1gI2uQk3v9WHWW41XFAjIyDJeLHXfuRxdMbe4gIkM0"
-    "oeL3SowgrmZS9/SXk4wNptFTuWu9PQOhCyIwNa21ra3YUkIRm4na/NTbEogJfCRUCdd/ilBi"
-    "cQDEyK2TU+Fu1LbXHtUkiwa0HScjO/Ap98d/9K30xAtfgwPybjr49n9OP3rl/0knT+BMeA7L"
-    "4Uswysjuu36VxhrRI7k1yok3xFhw1ToxU3StZzz1DCOKZKFdV49rHJTjbwQ4zXV252+1FHE6"
-    "LrxXtOXOXn+L0b6Imlx8VMzXddD4cHe4DNLNjAZDXfDtP+PKWAnXTyXg1dy2DZHrGgDzJTDH"
-    "WNr78IuYSNjNYn4+dV49BGh6HwXvd8LXXuv6TYgOV8KdqQjL7Lv2PYOdrAaU1d/FCOooDp8f"
-    "hetzGkOjx1CKxzDr9dOcWHwouETmOTdLe1OPafrn/Tf+cyyOjzz9BTh+D2It/iIW0f8WcNgY"
-    "9r2ioLS3feelCDXAlM+iLixmcuhYyL0EWAX4kg5sI8dl3uhQaa6gIduPk2jL4DBOT42kI+//"
-    "TTry3g/T6aOH0+kTGPZUiR2O0BD9OkOZpzGDoF6QnCbNjMxC04qk5CSqP1Wz3EVTdTeBBzQC"
-    "kdjObgb0oecYWI5Ni7Y1NWl9KyABYDSKCYc+OGMTKMdPwxF7eFtF+soXnk0PPPI4ABMr9XDa"
-    "VmEkdtOmrWn5ze707nuHABkeJOH0aB8HTAD7ihkFZlWk5xZ0HA6sU5VTbRWc4FrGluIDy6PN"
-    "OcefmwbNUtg2ErPtlYFJ3hwZN4tNM4i3TW3z/BGgysUkn9j0KqYA5DF2dVvViKK74kU3XAKN"
-    "OsypqFIgjQrQBjkEYLvoNcHsYzNGu2reQc5iBS81CKzZh2Fc6Njt5iN4DWvwbIhUK4BplT77"
-    "8hfT/fsOcKq1l02EZdRlFtxSSuhp0OCgFR1hpsXH1uH+7s9CkCKoYQRD+ZPvfWYm8W36pse/"
-    "WAcMT6H95PYyTvExnfw+b5JzGkU5Ih3eF7/jG6Ja9Dve0yh8x0Rk7pYv8iNshC9txnluuDvj"
-    "b6nvTc+0nU01KMFfn6oLg6QG/eT6J2wB6UmMRD9ULZtKz60/lf5o3+vpwNpzjBXFEAtli1vH"
-    "bYw/10L633mRIFJjcdnvi+IZgGeVWfEyvwvyVTZQHrJI4R7fQeQ8L77NhKUyBnIUzEznr7yb"
-    "jzAMFOMUg6IoauTMn/JYRXTfxfiKB3n3HLNbKQCkHRWOJdkVjZ28Vy6bO1t+m29pQc95lyLH"
-    "l7mW6n6PAtzjEcHvfhopRDuUp734/u5YC+9z+Sl+KY3chNZOnYgsTptiZz88OpFWMHHLTRIQ"
-    "LAewmK4igDgNxgSrnoe6NHIjQsRl+Abc8TDb6p9wEG6RCrtypVQuv9bRl9paV4e+UbQPBDhL"
-    "HAGWpwRD5ADAUvdqAnGCdn5msMvT092FJeuR4IS5uLkoaCk8T34VAK8RFsLM5YjdAuXVftYs"
-    "i4mcNwnRRacRPS9Fhz39w+Spvo/1Rs8E4q6rXZK6x26mzot90VhXrlxMf/Pn/3s6ceQt3Jdc"
-    "YRVpw0o3p7bY1VNtyopoClqWQ9fYtAHzD1PpgxPn0mf21KcDL+0BTK5MHxy/kP7q3f60owmr"
-    "7Vi5nmTh5bBhWk4nqo+lsrJK42DNoD0B1hDg83bqCxpvbdEsQSNtOZmO4NJnCj22F+HQbNl5"
-    "gDIKNCgIdZsDVFqeWkRk0+jjKCrb+cCn8cvXjoX3H+Eo+gq+7d6nnpNp0+bH09p1u1P19pWE"
-    "b2QRXJFuUDasMNGeAGdOAnZxsvDqtVfSy1/8X9DpepmTjRdxcnwBXbj2tH7z1nQSF0MbMLWw"
-    "unUzx08BJ7Sxrnn0qXfwp/8lXT6DY+fzxwE2feh6zaY3fvDv06c+8820bv0e+gOTFtKehMfH"
-    "RUr6CW6avwVQEhp/PEwR49he4re27qQb05Tr4QwmDSwLZ9fY2792Mv30+/8+HUeMO0Vf9vVM"
-    "oG/nQQl5i4B3xHyaFJiEW6VITddKXsF9gax0lr0M+ta21RxARs6ZrmIKIO4AEHg1N1RhC62B"
-    "TQRAiDhdvUNYd9ffH+9WVaT72uvTvh3N6CC1AMam2bSci7aYpP9uALrn4DC2r63E1yf9NXUb"
-    "0SIOrSljPd1Zixi+n1O1ZA2I81QdoIe6hyse2kaRnOI+bV25icki/Mz5tHzFHKY4UG5RGAjO"
-    "U1WEVUcq7FDRlupHGr5yTqOyLuToChJvBU6btZM3RTvpQcDNib9XoP9Yiz6jOo3Na+oBlEMh"
-    "bl+ByQiNsUq/coV1cj6ELt7RExcAaBqNzYdnwkUWi4eiQQ2RLgGs2Z/OHY4Dx78iOnUzVwHK"
-    "R+eGSYsTpADJQoE/iyqdBUsXdeb/XVdZiHjvb8f63RfzGS9jSudmKR832rlsJbqT9gQ7zDt3"
-    "Xrzi8k9O27+RF2LjnF8uSZF/DmWcfBXPbzOPGtP2MCk3UPyIVCMFyxUhCFOKm/OEfqqn0zd2"
-    "fJheuu9oOt6/Mb3fdV86NdTKqWd0EJ0jjCcNRELx85M//y1bwK4qkcZtNg+1WGPfuqovHWi9"
-    "mB5suUz/ZPqXznLf0hX2rZFyd0dpnOtirrGzfFeEl8js9LL+K71KS77z5/9bpowigN+/8JUD"
-    "ZxBDHkHNDoCcfP6dE3NgxiTMQPC9QCdEEhFnIcNSigsPSnfSXyZn6mF8/jnhzhfXBiFMPPG+"
-    "lG4uC0/5HSx4t5ym5ftIJ37O/7FRYwde1lgmnOHbfLC4IbpJ+DJf3EcdS3mXni68XPSgiLTo"
-    "YdSrVAtelMIwmMPB7pmT6cjhI6mndxiuk4qnuLBh1+wu1l26E6DiEeuwDEXlbEcLnRgmx2EM"
-    "IaqvsQaL7FqL1w5WT/8AOiaTTLwJcw7jxK1Mm9Y1R520T+VuWj9syzDbsGPbZk62oVPCymL7"
-    "yI1aiY0tQZ9+B20GHdZ6jN90llOesH5PWG1KuaMu6uPpJAGWHDcXCQ0uunA4i2pX6MTpc+l6"
-    "D3a3iDKIG5Qm9J4EXBvbV6eN69sweNqfjp3sSLiDS//yszvSrt1b0/uHz4SpAPWJtBtWxyKU"
-    "RSIpXbw6mtbXj6eXXtgDgILLQvmaW9ZSnor03odH07f/5IO0pRGdLHT6l1XcCA6JLlbq6/Bz"
-    "SCGmVKaGAOWYKH6p5zSmjq1rWMg2bmimbFAjIpQajDfu2r87Pfb057Fi/jQ7fXRqGIe2meKb"
-    "Wx4aYEK9zSLmBuAKLmZ6OzrS2vXtiOu2kl4T4wKuYu9l9NxGwwq64rsb6EGxNLLSIsqkIB6h"
-    "//it7+LK5ii+GdHtQml9M0ZJFT/qtuba5aPopdWl/Y9+IZTnBTyKiJdjlmFkoCO98+qfpQ5O"
-    "MD7y5FdQot9JP8+Q/2aoDb0qla8BtIIXTwgGeTt2oAXvA7jy7ZXHihONb2gDx1PZvWBMrtU4"
-    "JiQunnk/HX3/tXTk0KE0jqHQIfwHKq7zJKBATV2moZEp+gBRNou284OT2XLoxFFgunq70Tck"
-    "ZM5vfDwSdxDdLDE9ZEYbY20f90ib1mlQt45NwyQmPoYx4TFFv7n88m5NRXrygba0desGbHft"
-    "AqDdSAfffydduXLFw7Ppcgec3mFOT66rg94QuzK25AidxMjpe2cH0NNjfmCC9ZSroCrX2/zZ"
-    "hOCPs6EeP59NcHg5oadfS2lsxkMCMSc4Nm03draMjwCvtHU+1Qp4sALUVi6XaevNwTa8DfAU"
-    "SDmG8kaETRC6jmO4wBHIylmOgyPsXvoxBqzvT+fHzs7edA4XWdf7AM2k7GWemq+gyamb6dsu"
-    "AlfE74xp3fC0rVsPjaOHxpjUbEdf33VAf3U68PhTaTOOuQd7e3FfBThnPGg9vpFDGrUrV0Hr"
-    "AG5yiqqao7RQqm/OvfRXciFk/pRK5sZe0OJjH5W+7ffgkvpNW2Uak7Oc53S5f6ETxrjKczpx"
-    "y69IvpTH/PNMW3c+NeNFz6hIITWR1n0Z9E3ZCrFkUdhcLls9PzGr8vtIOxLPOUzfwNDtxKrU"
-    "hZ5W53hDeqNjW+obR19rcQlM5pPrH9kCK6vH8CF4PslNXFs7nFpWjKDXy6ah/KKzom9LBBCM"
-    "GOmXXgzJELsz50WNpWeTJY59esvwmeCjw4MCiFY8dwsaAYMaSre/eCcLe0qhI24mMJN0t5W/"
-    "c/JB/BBPIHW+owAEiErlIPE3p1D2oOx2fvCasB+u2Ehkyg/UmWtpuqWWiooZPIeP9iilWTwr"
-    "/SyeilsWX0R1sr/zyqzisqckbpoOysUXL4pOmH9hmLIBzfsoMdmYVa6XgXO+ghpBiEYhK1hk"
-    "3HkKXNx1emKqgUlW/2Qeve8bHAK4sNgwCQsENEjYwK70JgupukQ30d0J0YWYJ+zxCABw0QGQ"
-    "UNToqUBB2diEogY4O1iSvo54srV5DYqwKKffnE4vvvg4wGZPeufN1+EADML1qmeixlkyOl/q"
-    "d2kF3UXak1FyuTrR8xDU2WZh14f6aoF64yb8HUK4WoP36PnmLZtDZLJkySkWg4rUzkI2PIzS"
-    "O4vy9vs2pj17dgAS+slrJv3oRB9H0ifTV7/5zXTg2avpT/7PP+NIPqYbAGRAIkxUDP+/vL0H"
-    "lF7HdaBZALrR3ejcDaCRI8EEZopRlGhRVk6WNZJ8PJbjeuX1Oq/Hu2ONxz6zZ8ezM8dzvOso"
-    "W7bl8WhkKw2VRVKBEkWKOYAESZBEzp0jutFI+323Xv39dwMUKY+9D/j7vVevwq1bVbdu3Xvr"
-    "Vnpp15H0W//rHemON9+RDu56Ot37tW+mw4NTob68+aZr0hvvuBVJxNn02x97NG3mTDfxyXwK"
-    "TE5mTvRu8YdBpBlOs/oPL+CorVz/9jN506OZjHuZ9HEIiwTs0QdQ3SEZ1LZp3ZarmKTaaTPt"
-    "sTAwph0UL2cpUUqXXHk7jJgiZyU9izh/8EB64O6/ToPgYuXalemBe/9Lest7fzWtWHcZ0g5d"
-    "BIA/VGCQ93Tr234mLbvvsxzUvCcOdp7Ci/7j7MQb4Vic7de/HqlGQ/rGFz6WXvfmD+A09Cry"
-    "V2Iyhd+s5emWt34ofe8bn4JxOMm3i5jMkR6h5jRfpp5oB/urPc82UWWjsXbun4zCWHXn76eZ"
-    "+FVbqUpyQlZ6uhjmvglDdo3Bjx56Hri+mB687x5cVpyF+RvEK7x9EOEaDDZyMBh0POWDU/uf"
-    "dML+r8f+ZurqkUoKD8SPklTdLKhym6Hv2xbSGddMqg49emkpsHnU08zMSBpCyttP32lUdUgd"
-    "pC2TSH8HUZ3dsLwvpI/fe+DB9N/+/gUkMtj4geOZWZgPoHrpIAdIz+5HesVGDtxILGtZmtZ0"
-    "NKQB7MSaYfrckZiZQHfzxkBivHFGIM47uzBwlzmdBWd5dy+SLaRVebJG8sVYDRsrMQ68Sxkr"
-    "qttktGqLEpipc0iaGvCppX8smTyPs3HzyBSLItW0zfoRY8xlGzhpxrnYLazrFRn6np6VaSVO"
-    "affuPZT6MWSfob31H3YKSRbDg3TiD4kdCPTonXWrN3IIfFGt4xCWseWB0GPsGJ6axj9d/5fS"
-    "9dccB5azaTc+6nrYVazjYfvzCuy5OrtXk5+qdDePQN2gKVI1mboareWZ/4EL6d/cxbMfSlB1"
-    "jyDoW06f79J2+6nxI5p3k+Y/c1lWT3nuWRBcaLSAxiUuZHCBLf76kMPse7WLR2HJZQmuMFVl"
-    "k7Iu5rznkl4QTdXSeDpt7BqOnyHvu+Rxb6/6ChhzwQFnZj5JTpj/eAgYhbMwh4EtASBOjVmV"
-    "aTW+/8FJjk8c4uX5bT7jmvO2BpFkHry1Np4fOu/t+75EpRbEqAoqnwJ/5WVB1BrCz/teoCZB"
-    "fOOPE2y82mb2J8JyUITnP4SCq8AJfSD6XeCXr8Qt6Rh2ESdO1jBr863+hKPRgtQQs1YNUguL"
-    "dxvp/J9ACJMFxXcDvAIL8RDhEaOkL3F5d+DNlZnfTSVspa7lOZfj1/wt9Oq55Cgv69kDkhIa"
-    "edSHXKgO88MC0qqEKKr2Z14+VQn1HbCWT5Vi7p2UUZlSo5Il9a3yibgEW0a5DIsLBBS1zCQe"
-    "owfZyTTJylwjWcXkOjfUXgWaHy4ZVC8MYCfRP8DqlrQNTOoSYg+FXcYKWwZLJmqMyUdVjB3B"
-    "eli6Hs6XsrNsOa4MVDlqKOv5h6ohl6/Iq6tLLtmc3veBH02XXX19WsvkrE+r3S/sQuXWk7Zs"
-    "3YaaDwINgXeyUE3irjuP2Ql1CHmVHY99OCxdvXYt7yc5QHc/TNRY2rptE+WsDIeoq1Df2BFC"
-    "goH0apEqQyo0iIPTZcs0IF6E3dhI2rd7LK1on0k3v/6HqWNjevq5F8FJSp/75tPp9svb0u9+"
-    "5MfTe37i11D1TKe/+OM/YDs+BtPUcwBD+j/+/Avpxm3t6cZbb00tZ/rT3U9y9h5G0c4/+kxS"
-    "cqVKZQaD61NIxoLJAibVLR5J5MHKAzBx2rToLR8gYQwasfcZZafe7rBT6+5dG+H2cwmY6jYN"
-    "vk8zKcm0kB3MwHja+/z9aQdH6Ox/6cn01vf+GtKV1/C8A9cU30Hth5F6Gy4cSLsUFaR+t2ZJ"
-    "s4bw9ZuuQiX4beyZ7k0btlwa3uFnpnE6uqQVO66HKXtJ2rjthihL43p3OTahely74RLOOdwY"
-    "PU5brejf9IOQCMhUwTRJdux7Sr9i9UaY0oTwVM+3Rtp2Ep9nEmuN+GUaFuOkVBu0MQ5n3oUb"
-    "iHu/+km8sd+HVG6S42ZG2UyBwTT1mOGnf6oJ1G36tjp5UmJWESfa2TltKYyR6sFmmCd3u8rQ"
-    "yFTNgP8JHIHK+KqyW9mDfSAiGdtLNdg4jPxBmOgpVIwtfPdoINtTj+Vt6IAbkKqtQJJreU8+"
-    "vSvt3D+ccJUGAwKjRP1mqQ/NzmYJzjeEsT8yOI7EZir6wWmkSTJBqgVd2cZORjJat7oD553L"
-    "kVplW0UXGIFc6qG9oRIrJcziSGLupEdVYpHkWPebuLWNhcu03rUDVGqpTyyJvT7oZIw8Msf+"
-    "FIyaHZa4LmZ0pdKKU2Elw6fpt45BmVJdk9iG4lNv/5apPyxPe1iFjWQf420FvtPc+OICSGm0"
-    "jNUQRySdQCLs4kHp7SCLG33duQhx56+gyoi5OcPjs5rcAMKCgqKog5N0PVUziIrxi3/eX8Uv"
-    "kBEpyDOQ6t2SuUjvPOIiJU4EeDX5Gcd/3HMW1bPvkd6b36rJNcJynHnwVrCUsPq8StjC+xz8"
-    "UfT8P7l4Qaj95keoe4tOUuGAZ/uO/UNVrYvDYBj8S1gwCSWpScyff8Hw01AljX1JeEvWtTlV"
-    "VJRf4P0CuOC74zPilbJ+0Hspo/5OHlHLACrDXYOlPp7P5aoLDzxUdY7PEc86VrBG5nypT2/E"
-    "XGiO56t4BFfiR5pYc9VgNlX/yGmqjCoYWChKRnP+uSxRv7A0Szz/iviyb1w5D/PKOZNtviz8"
-    "ZfIzjtFyDvk51pmBzPovVV4LbiHGs8SqsChSynzeBQQ1gOY+BpJrpZdw018oj/L9+99dtZ1/"
-    "OQAW5loPk4PAVJnwziudDzJAHsoaxq0QUSebUB0Q7vMZJutxVrXTEF1XjzNMLJanVEFP3tO4"
-    "KmhmomnX8B0pwziOG90RdwpmS8mVeun8zqTnsTwQ4FBXMAm0sHJvY0Lu5DiXlmWL06YtaxmQ"
-    "qCZbOtPytZvTig2bKXs0Pf7QE0xwunHAaelhVE64yfaYHG21dO+QmdFs2LsKp6Qa6J7gzLR+"
-    "1A2Xbt8aKjvrNILDR228VqOmUBS7d+9LTHx6sW9M+w4fY0JFvYnB9jiStNOnkSSwce7f/Oev"
-    "ouIcx6M5R4ew2j83O5Q+/vvvT29+x/vwlYULA3A3PHIAOytXax3UH99bneJ7Ju187kC6+oYb"
-    "0u1vuCW9dKA/3fX4eFqHpEJjaSdchFtMpraphJy8JWS86RYAnovQRazmj4ctzob1GLgzwcyA"
-    "8x1PPYeU8U5UhycxKL8Wb+6d0Qd1bxDuFMhkMXmoTtUu66uf/kMmwea0/crXpz3Pfo/1OcwD"
-    "TNW1N/8IDOsaLbriSKLpqZEEu0O7y2RNBbPWt2Er5wc+A5OzLG27/NJ0z+f/gjZ8Ml11ww9x"
-    "DMztSDwxhNbdArIZGd1Tk8ex5WIzgISYthTvPmuPFNIpJWXBADi5nxBRH8DkbQAAQABJREFU"
-    "IaWS6fJ3FmZXwmXatvblmfCQe/MypVanw0j/gW98Ou188mHaH59oI5zld2wMJierWvUsrtRH"
-    "hn6avuoiQTy6M1O/VhL8Wfu9+OYfBcQ5jDoLdbODzM85mIcemOFOpI7EpL76ZGPnKoyXaWg+"
-    "2iq7anBHojv71rAxowMXCvpl++b9z9Invo0K0UUFFYS3ctzJnEsTPaRZ0ZlMxSz9TAhtc23A"
-    "tHkiGipk/ESRQHX4Sry2d+FrLib5igYFE0VdXNDIZNmfradjzSvGLuU4nvzlhY5MFfZOtEmQ"
-    "LOoaPqfoh0qviIZT1GHwNhHOg3uwhYpdrTKYjF0PfjeskfIGcL2i01APXx9DqqrEtY3F0srl"
-    "HeRzBmlVZ+TRDHPsJoRT9NUxjN31pVV2zWojdu4sUldohf7MmhrOpr7lnpeIk12OepLZHhwY"
-    "jT4vAl10afPo+ZzuHmWknEd7xbOLEePXX0GPMyGsDyYeEQ3nVk03oa0IyYExL0DbaxnwjZTz"
-    "LouthZW8I6QCyI+loHkpX81LJH41Ef+H4wRKRI058Sf6Ee0ls2Wtsx2l0vG8gPYWqCJuZhhk"
-    "xujLLBa1sRTHnswhDXBeUGcemiDiu0Dk7wKYo+Qc7uPCzwti/2NfzbYSOP3jyrgQXCWs3F8G"
-    "OMerV4kWeAO/arQUkJQPJTwCIjh/awgutco8Z+JffwV51cfzbsSJKDleTmtK/+XBE2G1Py+f"
-    "X0lrEZG+PuC8cucC6B75pSpjjomyrPmZzH2rS28P/Se/qMH8ogNPqjLmX8bLEZ0Q8ueFcUxh"
-    "nBxXQ1a9urvazdWDwcJOQ9Hk5ORYGL7rh8dVaBhVu8LERmMEuyaPcjmDjxxXw+bR3dOWxvZx"
-    "VhwqiDDcY6DF9nZg6UcqkyuxCNcNa2Cw3HWIeqvhdPrcZz6TPvLvMK6+9lYO330UdwMPpaef"
-    "eDQdOnQoJBfn8JvTiVqyncnGoz6UuDVj7NvrzkNW16567XPDQ0OohkYZwKeRwmxERTKLp/Fd"
-    "MVGe4HDa2Z7T2A/1MKFvQmLHgdeMfwQGYWSOZRaraiZG7C8mccGwcUVT+v2/uT/Q+7Zre9JH"
-    "PvIb6eJrboEh1HM9pIbRuZoz9rZf1Jv+7f2HYTPI61BKN/UtTq973VVp8MgB7KH24c6BFT+r"
-    "fSfqNuypVBHqKsDGUWIhzksLOdG1IAGQKdAwe/+BIyFV06O9k3AbLhN2YC939NA+JFIfSpde"
-    "fRtMjcyIq8TMjKhOO4nrhg4cpr7hTT+bHvrWl/GPdYiDnFfHeYPXvPadMFDtGM8PpcPYZR09"
-    "uDtgmcXH1fW3/4uw2fJcvy2X3RyM2oPf+hz4QoqEOvC2N72HnYmb0/0YsN/8xh9LK9dflqZG"
-    "hqICqvRO4bLcI3GcaE/j3yikAEzSZyG2UU8IqgwOkYKJywQZ4k1DyEQ10hf1kaWKT4ehZ5DG"
-    "jQ4dSC/s/G66/5tfQjW7C7tBjhY6htsNbKscqUqfphF9aGOlz6jYpQlCHQficxF/lHjosDN8"
-    "ovGu9LAR/LthQ4mXzJXEvh1mX6ZllnymYOBVM56FuW7WJ5fqWEkQf9rpu42NHI4N06Fx+ASS"
-    "qOf3cMwTiw9hcioamERNFiwTZ3CStyPO9KGaBAdx5I7h1D3DzOkGMFdrVvWEuk8muY28vQfu"
-    "gFG3J9ZRGHVwK9OoSt+VbxMcncbhHt1j/GUsmryUiPld/2TGtd+ap3SuAYeoqh2N4/FVEyxc"
-    "zFsJse0ZEyCw6sNOhkw3LQSnaTZljMNgHTrKZhaYQb3i68RXNeZyTmfo6uyKOs0i/fNEhf7B"
-    "Y0CS+7UTtTObOxPFrUcMuTiTvrS29YZ0W3Wt4/IoPsxCsmkSzA46u9k5DONpvWuDxkrGOMo4"
-    "9nXhFcbFBJIq2iG+V5xETPY2Dl+kl4AW+UVQBNeefKtdFwytaK92vMJ0/lRgKqH4Qa8LlvaD"
-    "ZvIK8a28sDFzBIjOIJlZCiaL/h8fAEVao4o5iB4LRZ64rK9pcxolV/YrR4MLyFi8s7K0Txlf"
-    "OpCfTFtw8v9HPS3vn+Mqdfg+eZfmr6opjfIXOANf55h7IPj2xMD9guiiOK4lP/GBOUejJZMf"
-    "7E4hNkD5WSSZV/nncIuqAHw1eUvs6+NFhpFHzqdkXh+nSEiMZqcrFY5kVX4+xwc/BowFyvhS"
-    "/ak+VhEtI5e/ACa+l/L9Xp6NHklLllURrCPq4pT4Zl2evdud6995ppMz40c8j24ZROIzyvmC"
-    "J5hUmOfiu3n47upUsX+4QqDZPU9Q4q5kawS/U5McJaMHdw3YVQHocT0fTSNztST1si3b+0wl"
-    "xVK9sGHDOuw68F10NvvUkUHD5Dbt3fVI+vJn/yp9/a4vpS/ftQM1ThPlY/jNZLFqzSomGFwh"
-    "HOuHwOJ3C5Whrh2mUTmqvtDFw0lWyUeO7Md+ayDt3LETo+fhqLtH6rgTcmJiOCbybuxIPG9N"
-    "xmQpqp0edhpmQ+tzePWGSaCjT+Gpex1qIu1UNizvAtYT6fH7v5r2PP9YlNeBM9JWDMgvvnh7"
-    "esN1nemmq3vTr3z4/ekXfulnUdVNpS/c+aX0lXueT0cAoRXDX0AO4+YuJHCYu4GP7HE+ROkS"
-    "JX7aBjHn0zaqqTB8ZLCp5tSWJu+4xL8X0kJt1g7v34sKtRmP7StpLydhd2ZhB+ZxOswSSpXW"
-    "bL4SlR+G7tj8jAwOMgl3pKmJkbRr5734rtodzGtP3/q0mgOuN2xTIqaKy+37MGzk0dW7Jq1e"
-    "vxU8d4ffq4mxw/jMup92nkl7dj4Azvs4HmcTk5IqLiY+0kqUo69SH5kRCWv8nJnjQmKDejkz"
-    "Vbn9JTAh8SK9Dka1tToFDo9gNH/vV/4u3X/PF3CIi28vHIb2D0zByKhu44f0Q1XgBO07jSRR"
-    "NxzwELSx+ASNMiDkzf+Ay8nUcARdEaaKjyyQwjamdjZ2uFNPFWD/CDtauSvhW9m+OK3pXQzj"
-    "0JCe7UdyQ9lbV3VjrL4KmPG/hhTnGOf0DbLrU2ZPGJSeXby2I924fWPqA/dKBTX4nqZgisww"
-    "WTB1sC4y1CsxYu9FxRiOfJHEulswpFswFKqLm2E+s51Vro/uJbIUCkkaqjrVfC5ypFmh6nci"
-    "k2Bz0TzRJhQdV8a3BvVIv0KSqjRR+8p2mHg94YMnAHUcuOtQKaiT5DguPKY451CpkxPoBDZ6"
-    "u3FToUSuAxX76j7OIkSdr/TLyXUQf2xDI0qvKqeo1eQR0g/KsD2Mpypwy5bVqZdzEB3PYccF"
-    "pJ55Og6NQWTLm+pMje9dDHq8Tu5m+U5DWEcb+rwr0z6R4L+MDCKJlBLfPmK/Ndh/xq36bjzn"
-    "0Bwe+ZA0YlfFRrr8LBiljEhrORFW/rg8y2XkD/+8f0vxr6aUGCdUTLjj2fED4bK/KFm2D1jz"
-    "eOep1C/PMXxxcHFJn2WSHePSE+MVjPkU83rgN+OhpMvxzMFLJoNLQCoU+vpPdeW8yY2855f7"
-    "jy3hVQBZFRpVEsf8U3ItPu1vjjfpYFxWmzj5l4NKCUs+9GOZwZpjahwAJfL8u3HmfSOvuYzn"
-    "4ortEl7iE5JLrv2di19jjsz+vHg5ZekY5mKcaPgAh2eZkOp5Lnvj1P2Ik/9V6U1giMTNevlc"
-    "H796rsWu4ohwr7AtCKZyYboqRckr8i0MaBW3giWDUBdmflGXuTwzbORJfqqWRpD8OJHLUGmQ"
-    "LeHL3/B4DoPVgxsGV6rocSDA+fDgUYjt8eGpmOwnsXlxkCgSXooY3yMzupA4mdZ0qi8kjNQw"
-    "mK92GKLODlUbSFvYwu4RNUePckD0rp0sipqAhUkqbF88QkNiqqoJNSOMxhS2YjOcxdfdo+Sq"
-    "FcYQAs4hwDJxGv/KOO1DYnPoyBG2yeO+AIZEGyM9y+uRegVG9e0aGMPoaYsFyKjJUMvASHkw"
-    "rZIKPb6r8lHdpKHzS4cn0lce3sMuuaMwbi+mFx/5Ojv7NuOIczUSrY609Yob0g13vC+t4RDm"
-    "XY9/O/31X308fecxVt/kgY6RScS+gB8lGKg2pXYMpjNMwhIs2BmbHqZ1cerABcAyJA1xbmF0"
-    "Co/XwUga5tQe0IKkTukCdIuwaXbODREX+7bV65H4sOOKf7R2MIsyOy7Ju3pXw2RdE6rVycl+"
-    "0i/D+/pN6WJ8X63ecClSiWXpyP7n6a9saFi5PvqDYvxZpVGoj5rRe/au2MyB0g+kPXhIfw0S"
-    "sC2XXI+PrB0cKP0gPrNwT9G9inZUeqVeTKJRqRToe5nBcvzrAkHmTVsd+ySExDuoCZ9NpLMO"
-    "7sZUZfnUQ19LD3zzzrR713Npzwv4VBo9haQDdTN9yXacRlqjEbsMlqiyz9rNtaOT+TBQeq/L"
-    "AzcS5HEopm0Lb4rj85jTu79+ndx9qC3WIJLMDd0NactqFgMrm9JFbJrYfsn6dMeNm9LmFc3p"
-    "hb1HqcvicFlw6NggOw+xnaM8betk1gbo0+/Bk/sP3fF6JFY4Ih3vD/WWm0Bk6hx/jcDZSlxt"
-    "mZZS/lo2NayAkV9Kn/HwdPuyl2PKtnQzijaMEmOJsniLiYkHCbOMiu/SEPtXlhDQI3gPx75I"
-    "gGJnHOmcAP1u20Q+5KlBOj2H/pZdoXhszyhnf2oTKO31pIVJGCqN4U+yOGjSBhMJWzMG7foH"
-    "8ygf1YPuPlaapguVY9g2jqBmpzh+uQ1CMkahMsfWTcllA9LAzZuQsOKIdJJdoNmonQURksGh"
-    "oTHg0lDfuNAR+ySLiNiNCtz2+ADQNufNv/VXtLaV9Kpu+SW/is9I71+e/Rd9RRzyK7TzQmlL"
-    "duVuvgvLr73XHiyXfwUmE73CJUw5Vc6/vrxXSJo/lwQ5mwsn4Vsux/rX4QachB2fjRi4kvki"
-    "DvGjn9UxBdKzwGDFgNvPTJOLL0CQdyy6ch+tSgqYMk6MV6XgJsjlPR79c1495vKuxXmFh0hR"
-    "Jfu+bZEBePncqu8Zdy8T7bw8iA1eRGdmXDPOM4NV9bkqqzmcEBD5MFY/pCd3LjtStJYvXAUN"
-    "5V4fVv9spv6iISEQUYhZBZ323WxLLnP3kibyqn33DchyoupOEO8Odh7iJ6yhI66atAYsX32W"
-    "KJq/nGZmoPIA9HNcxInyiZwJlwPfMOObRZVeOKorBnD1bp4NwmMZprMcn+Pn88JfFBjxTXPB"
-    "X+RkYed/j11mpHOloWptEGmPx2GcwvDU3ULBhNED3GLfg02KYSuRErlVfAL/VMPD4xB1jzsR"
-    "j6hNILYtEL62ttYYeHHeGcVOYoyu5/flrMpdAB1CpLN5/QrUfctiJT+DpEh7ls7Obr67E0pv"
-    "6GdhdrDTAT6NtrXhOI5asK8PD+Lr14UBbHMTZxTiFfokdiPjGEX39+edSOuxHeok75de2ovq"
-    "zwlhBria0g3s7rvjzW/Gu/blqB72wZgNp77VayhCx4hIGGI+O5OOHufsRCdkgHWClti3wLz1"
-    "deJGYlpmrSvd/fx4uuO6VemSq25NDUhbTqJSO7jrwfSlT/xB+os/+yy+tTiAunMFapMOJgxt"
-    "xbLqL5/zyOYBmC7dWsgo6Ett9tQiJABLUg92WvB8MVmGugt8Wb4T6zgTnDvZ7BfNbCwA7ZwZ"
-    "eBhGayJgV33Y0tJOWzNwYWScQJXQSRw9GLizZ11av+361Lf2Yhi1LqKdwi7rgfQwKsCpsf60"
-    "Gxst7yvXbA34bCtVdE5qzmE9fWuTDklnOOfw/q9/CmlXN/hbl3Y9dg8uH6Y423A7E792XLiR"
-    "oGzHUpwxB7zuLNTOys0REleZZSIFsyXz0ATcHl59mm3L+198PN375Y+HSvBF1LuHDgyzcw/J"
-    "ESqsGZh1+8ok50qOEDZN39HA2jo7WdNM7MbjEO0m3QY4icv05LHrKFDCJCPEnBC7CZexa9b2"
-    "19nnBEyDTJs+kbatauZom/a0dW07ByxvTus3rg/3CtfjUmDlqpXpoYcfS4/tG8OWDp9R9JWc"
-    "r2XDmMr8UNbKbtTl9OG9+4/AqJ9AjYYdI/3auEsZU63YIa6EoXI8yXT39nDHtYiSwNj5B95s"
-    "dxlSibeTV96EYqegTJh/7bDyqQX2JZ2hYgOJOlbHhS44xLUEXLWaksEsKQ7UEw8JA3k3IbnT"
-    "bst8ZOIcf06Mo2Oj6SBOY8/CSEqXpE9uUDnOWY6etNDMpggPhe7CvYiLKQ95buNdFaPwWgcP"
-    "rT7OTkMlWDpSdULRbs02cCGnfy+RdYo+tmnDWnYUr8Wp8GjgSAN8pVkTuBaZYoPBMsaZE9C5"
-    "c7qLgMHDXYXuOuxrp7HzWowPKjz/2syRZyF5zkl5MhOH+Wffs43KJVwEBa4y8+qLk57MOuOo"
-    "RKzupvVbJDKv6tn8z7sizHBT+be6m+ZVXJFjydYkkVXJZX4GwrHwNz/Gy7/lIiLzyMMn29Er"
-    "Fkyu6uKqyqAesXml6htRG6Ir/Y5FAX0oq4NNlNOIr4Jr6UPevVzQmL/lMub+VqidC+Apw2We"
-    "Bld5z4vxKl5IW3A1FzvXt/bOazRflONz7j+UaLFxBSwmq95raRc8RDyTZaBjjEUUcRKMaKZT"
-    "sbGC8RtXFM5Tyd8yiJ97eQnMUef99dOFrkgiAPyPzmqFGDdzwFtCvvwuMYgQk0SauW/BPc9F"
-    "D0zVDwDjG6c+rP65VimzBLA5mPPAM7hw6D7nOMKbibhBfo9GhDiV74KU8UY84kogohIUEPBU"
-    "JVULMmJHiro7j3GVcF98/kGuwHTAZqqCB21SXFGLh9L5JJTD+LvyDDlVBVBaCH8zkzQ+npg4"
-    "9ZmlDZR2Ha66tQPRMaiOBZv51rd8RQaMIoeRIrWhStCAVybU4z5UNeZjOhJSCle7s6kXld2R"
-    "IwNIFPSBxWqfCUBnoQcOHOdw4750KUySeB4dGQyHoxJybYSUap3B3UMnZyXedstt6ZHHnkyP"
-    "Iv1Yj18pGbrDB3ajYjyWHn/8KRiTc/jgacQQvjcYmokJYGdyamkehOAz2VKHRmwGxAWPMJr6"
-    "58HgGUaH+Tld/fr3pJaejWkv6rbH7/9U+vbX7kkH92ML07mOiRYJxFJstZj0ulC7HDl0MI1h"
-    "16W7CXeIPbG/nxwWpU1dbCbAAFRmaxIp1eLFM0iwtI+xDbRjomAYIbe9O7kMs8NRdUpL09rU"
-    "xMS2FG/sB/cdwhP2Z9GgnErX3f6etBQ7Fges+D3LxGM/t0udOjWdFvGzPqpDdz5+V3ru8UfS"
-    "NTe/Pa1np+DTj34hPXTfnWnl6q28X0N5SHR0YIqUUOlIRycONFF17Xz8obRq3bZ03Wvflo7s"
-    "ezbdd8+XUkNrT7r4NXfQNTSuZzcYKsTwPI90QibNHY6eYyih1iWIUrRzuPVoWNQMFjyHrjGd"
-    "GDueHv32ncDxvfTM009jD+Qhw6iZBieRpNmv2OGHtEopkztcnfSZ+8EfdaWKuk1ogqlCmxaT"
-    "eEiuaEeZrJP8FBRK5FTPuoNQezjHn0ybcQJH3C5d15ou29SFahvD7dWr2PU3zc7FF1HzzaSe"
-    "h58Lm61ZFhbL8M48zWLEchx+DnEZNRmotb1N6VE2JJw+81z4PZPB8GBlmTHbwzZo178VCxdt"
-    "pcS1iy0/uhiQ+bEvykyr9tOW0NMOVBE6zjwz0EOxG4in+jzGHZJd89bhr1IsoAL3niNp2+u5"
-    "fopydMtiv4Rpop857nUILEMWrhyQRJm3/U5P6qs4mFuVvlLoJcSLnb8ulMjcA7eXUCed68Zu"
-    "V8rzzEpxIc3QTUfABqOnBDsYW75ZpnRbibEwKnHEyiDatIejshYvOcQB2UdgqBbDSI+RT0Mw"
-    "Yy4utLtT9R3+xxbD3HVpF6Y9XAswsZiIHMn0vIuC+f+yn+vix3gx7gUiR3AV1zYs19xTCVl4"
-    "r0+58Ns/3XtM4vXZvTJgtdh54nckOeFyUb+Yy2ivIpEuKLHvSF9yNOYx6VR+i7/mVRMe8Bx5"
-    "V3efQ3UPbZBB45WmET8AW8FbwA6sXQB1GdZcYv7LuMo51Af+0zwvLH/hu6VcKOxCpVuxiJtx"
-    "Ut+HjG771XWruRwW5M9UxLUgcC723NPLRiGD0PNDHaKxmNQlNuUqDa/RZpH05AaCQECs6hvA"
-    "MoIg0FGyDhliGHnZ0FnUHk1sS5er7rEEiYyCkEhfgRMMEpEyt14QlCfmgqzw0CvyIL4SGovK"
-    "+Wn7UNJYUtUCVfn1nHKG4wKA5Q/V31oLzgu94AtRGTrxSUmDthaues+chdqpTmACE5f6ydnN"
-    "av0Eq8i+YXcZoYpCZefqsanxFNuwO0N1NYGLAneOuKr2cOZVSJsk2kxBTK7a2kAMZcZQg9k+"
-    "qrp0DTGKjYUDTklGTFYQ/1VsTdfH1TMvHEYihlGvdhdMKHv3HYFxa03bLt4Sk3j/8aMwVd38"
-    "8LYO26Mt1qGD+5Gm9abLrriCZtUVwhSM2zBnCn45HTl6kBX1GbbTL8PWSpuOxenaa68kfRfS"
-    "EA+sxscWq3h9J03BVTl32iZOymfY7WWb9aO2eMOVjenQSy+kY/t2pa994Y/TzmeHqdO6tBTG"
-    "cBmMp/SmCemImwFUt3XiN6gJtebDLxwNfP/U69enYRw6fvEJjqVhIl/Cqn8QSZfMVxfe5VUd"
-    "NbFDs5F3+5VSiVAfk3ocB5e7dx9Ka/BppdRAQjeOHdA3vvgZJG+n0o1v+iBp2VLPZgAlEpA6"
-    "xghgSCj5eYnrTRffkjZtuzEYqB0P3oWa8BDOTN+bejk8evakzJDb9zl7EBzoO+wk+FG68pb3"
-    "/2I6MTmM9/bPpv7De9M7fuzn0kVX3kbbiyxdX6jyaqH/SDy1K9A5rIyBHsTp+9U4dmeRkqux"
-    "oaO4W9jDwcz34P39yzicxK4PadLYuP7V8MwPM6P9n0y7uwMdU9oAytFoLyhzohDLPrUUyhNH"
-    "2wCJYy3bYtmO+ggCn1Vc1a6OQ3d0eniz/c582uib7nRbvaIzbcLGaopFxaM7dqS7nxpPfS2L"
-    "0vHp3H4raJsGypOhihEJTI5pmasuNoTYf6QRrRy/I5O4euXyYIhaOUdTL/Ou8jUK1/Gn6jQl"
-    "QTHp0N4ys8FIgT932y1CvSwD5bPG8BYk06FrDMPb3GUILlTvW+eQrlf0Tb5RZkYj9OHRQ2E0"
-    "vwLmb8libKqQXnnJDDHc43LObABPoZZvhT6e0+5LVxDZP5519dlKn4ZBUsqqSlBphAvhpdTJ"
-    "Y3K0FwOQ6C+q3/txOAyfFrDJvGX/XTJy0GsWT+0sulQ7noSJFfQhdjROgWOZdXc5a9PmJgWG"
-    "AVI0cDsyAZwH6aOnkaJuhE5xiLbMqzQ5GiTXxx457/LbeYFzMfK8kTMwWqH3czHmnuqzeYVs"
-    "5xL9cz/VA/UDlWVCJ33rbELmpPKPAMeKfatcsVkCRnwR/U982+diPiNOjHEycpxLmxh6XJmh"
-    "KOktJHBrp9EGsCrXMuuvCqr6oOrZTEtc8zI4Cqq+/zPf6ooKSDKgr1xolU48e3mzz/mTNksD"
-    "Ml4yXcl/I+q8P1lFSKHRYavMjFEeI+N5SeZ/sxBVV+HsLmMvYkd+5BtiSAiOxCM6A3HksiWO"
-    "FpJtmXJpkZffEDlrAxLiOCsV696MGeObMCpnw+WkuUxLMH+IomVEemNHHhk58R1YhNlOIiNn"
-    "XEWlsZasEGh9JArZsG2O4bPz+i8XzF0QgCHKqMrJHaoOsBp09WH1zxHhZf8U+J3AZS4mMV4d"
-    "GxtnpTxn02KZ2v+42nRyG3LnFgRZdQJkGIkOEioMW101axvlVmwn7x7OtdMA3Ukm2pD6iWNV"
-    "Q6K6C1uLLoxhh4bHmEjH+eF0lB1JxUfWJdvW08in073PHOG8LYg5hNgV6gySESclB/gUDIS7"
-    "rFYh0dIeIyZzytNvjgT+BPVxh9faNauZOJciCcEG62wT6ZCo6CCTrvPC/mP4O8JxqofwaudE"
-    "O2sr1tOJqhObqGPUl3ksjSMFmGAiXkKicdId6T+bHv7qt9J9X7+Xyb+bOm1Mi9gF1YyKT5oh"
-    "6wrUwKkUgnRMot96fE/68Du3pd/+X96R3vTDt6XX3/66tK1vSfrMd15MPagHO/Cl5ITvZCID"
-    "0MJk5Tl0+lxahMSFhXs2zqY/eKzRJPZH1tMJKLboM7sMHj9Eu+A5u28dkzZnyNmRia+EIrqX"
-    "Ibzb1xob2/Dc3Z0e+PrfxrE4t7zhg2nLpTeHtMgz9NwhulRbF/ChmqQBZs1+rdppGC/c01PD"
-    "6cbb3502X3YrY4txAYPrdxmrpRqxV4sXXUg4PoLg8s0r+h7SrsP7d2LA/g/pwW9/Od17z9dg"
-    "HjVaz0euqDY9jc2fh3RPIL1Q+qMBuc5C9b9kT3fcNMEQqCaUeXJXrUyV/q/0X6UU8kwwV57p"
-    "p+TUGVj6wfl/qBenyI9HLu3W7NGcKTnopobGdMW118K9LU3f/u6TeHtH3QkOevGJ1kJZk6j6"
-    "QCPxxWWM8MijlT4jM9eK7WGYGyySuepFPd4bqnOlU9qHdbA5QXoSzCEMqNKepdhd2S72bRc6"
-    "sdgJGpIXjUrsYiEiwAEz/SFoJLTNePzEeTDS4DsM1bmrhnHM8Zm+lG34bC8XHzJqVsT2yYbx"
-    "Mm0stFjMOHaDLpoHz2WSdTJ1vOvLTjMC40QZoFYGXNvGXuwcOzizU1qi7eMQEnDbnILIJ0uw"
-    "lDzyP8JbtDkD/zOM6WOcqDAwyCHRqIuF27LsO+HoFDyJX1XrUBPuOi2ejc0tbR1sRIm62Da5"
-    "LUleuyzed+9e9d+svyFAFzDmfBwrWbIY/TVS5T85fl3AP+Ix8PEq0lVNPR9gKlEP/6vI5hWi"
-    "5NwCDf6pkOT4ioWvfYtfPcymsF/EQpy7fTfmMZPHGxEiQ7PL82RJbzoZdftLfCNFQFAXr6S5"
-    "EODnfStI+qdFyoWKjrCAtlYWD7Xnl02y4IMJMtD2pfgxGAKfjH3vcb1Mvkt+othg2VAvE6mU"
-    "eN5nCpRQODEHQ8R7tHf+E8mCwYK4GM9LACM+YXERVyBL+GlUWdonBOddpSmNVO45odWOHlJe"
-    "o+klWpmAKVGQpM51GssQjvAPxRKrvGdmqg4+YJOIxe4KiKsExjx9zztpIHrkLNwFJu9Wfg5H"
-    "PtX3pvJcAzfyqH97uefIG9izxI9cwbfHYZwVTn5usbauElIdYMrkEBwETzcOgqHdlUe8TMDM"
-    "jE9gK4EtkytaJ32P4nACadBom0n6JJKwMziljB1R2G+oznPH4Thbw0eRwOiWYIqDeJ/C5uZN"
-    "t1wWTM+3HnkhdcN8yEgr6dPHlm2v3YqTjUS3q6ubXZDDQeQl7gn/OoND7IocHQBettL39oVq"
-    "YwxCP4BzRyUhSoGWc67arTdckTZtXg9cTOwY77obS6N4VTdOkuMcNK3Tyduv28KuMPxsdSzF"
-    "fUMrXrjxO7RoaXry+Mn0yx9+W3rn+29LTz35PZgOJD4SftV4MD+qhe59cCj1tc2kP/79n09v"
-    "euNr08TIQHr2+Z3Y7yxOV1+1Pd18RU/6+Fee5oDo9tSJ/do0TOQ0RtYa9jbCnNn3TsAInIBp"
-    "CMekdCmlaR5Y7A5OmaxO0kKxaLMTaeDgS9hETaLG25KW4ajVnZ1OhKWnRP+mXQsD2L18U7p4"
-    "+62psxcnrPQ9d665K9BDrJ3Y7Neqfk5hZxXjjudOdheu33gF+OqmzJMwX5xdqaE4xIGUlMWY"
-    "cCEB7HExmcekB3OmLZBEeTdOUL/06T/F19l30r49R9Ls9DJ2nXHUEtIOVUAar8tEjsFgOeJU"
-    "JQm2RDwIOC+ONSdmJ2Ir6M7CaZifE6h/EYjE4ngZO2D1ki4soWZUakV7K32SV/EbGVZMfErX"
-    "XboG1jj7aDrKIeM7nz2CE03tRfDmbt4VU2Za68ktV5FMVFP24KqgE0mqq3elYOvXrqZPNce4"
-    "UMUmrLozyDsDm+ibjBXTwjw00/+ClkAXpAnZdsoNB6qJiQOj7l0JUPHOLj5U8+mbKi8ys5Qv"
-    "cAVwTpAyQc1NnhdKn0aapfG54zoWSnzLdkYyd4HpaCuaPhYXwViFGCIzZMJn2nx8lW3txICK"
-    "lvbv6tZPnScXnESl3BHOgV1kTEEbJlHjm85xG77LGNPBwMDE2I4ucIZx+TECM3ZCiTc5u5hS"
-    "8t0OjVHKvBTaIiMKalHZTiK9wlzgyqui/EF2F7fgPkO8iIfSKt5BWVzixFYTh1VQFe4Hfv53"
-    "EVF9DebRwkoGxCrpTOGzd68Snt9exd+6POtj1+dZHx7PpRDuBca5OI6HubfyZF2//5VrYhtY"
-    "93graQizvcWn38vlHOXPxVRWFZrWsWD/mbtyGsLoYwGHH/nJWKk1kQ5ETSK8+hg51D/P5Vee"
-    "ou4FRgItt5ZPifSD3kv1LPoVrlx+XaRcfA74fvnUxQvcRNyMY+m8OBKn/uKqi18rjTAkWO/8"
-    "vYUN+3JwLwzP6RzsSgAkFgFFrAjlen0/44TvNyZbCZ+EX/VUtB7IDpsCwgVaqVY4PYu8stTI"
-    "wevkIaLibmNRTIg6o7F4Jixg8RPfgvCRh/d5Kxvimb8TkQ0tcoLQBTzC4ioR5oTvwmJReWUo"
-    "LBIcf+6sKsyOCAY2qVZUXcBEb/yp8OyzH/3l54Ink2XYveffvKSkqcUlggRPCZC7/8TIyZMT"
-    "IR0yjruvqC5hrjaZ8pmUVGmoslNk78TejK3EzDRbt7URQTLUycp1AncKS5nYtC85c1Is50lA"
-    "pqGD3YNLYE40fNcJ4Qh+cpR+TTMjSuhHUKls37oWv00r06EXdwZR1geOl2ord3v1xg5CbVU4"
-    "YgQ11tr17KKD8A4PDqEiPIjKbIxJ5DBSq35wgERKT+6oEjWGvf/pQ+m111+SbrzxOgzmN8SE"
-    "7VZ7cqeOMHJM2La3ti8ykMGkYUwv0+Wk+OFf/oV0zdVXpb/8zDcDpq7Fk+md73l3uummG8M+"
-    "CU1NakEiNk29P3nXg+n3fvGS9K9+93fSOnbs/fdP/mX6m4/elfbvO5j+8hOPpeFjz6R3/ch7"
-    "062X96S/+OJjaRUOK12dawytr6YZ8D+ORAcTnlBl5clOw20nECV5GCOzlb0b+zK96s8iZZzE"
-    "Ruzw/t1plMOet1xyRdhpycjniz6GSD6Mn60k7dLWgd8lDIbdTWo/CeJpH4FBCiN5+qy2Ekth"
-    "isNWjkjGMbKTt31Y3Bk3SyV4t+ORv2pBN0mcQVUqrEs47mZ06FC6584/T9/56p3puR3PoQbC"
-    "yeXQDO01iq0bnQ1iHKcCoDINVwmULczRF2l/hdZhWE5+9kfdMIgXnYzKVMGL0E88d0+v4EqH"
-    "6J+ofmWqxOlIqASzR3dt5PSw7rjtaV+SLmYnm/188sTp9N1Hd6evP3EwfJgtlrGhzsPa+lE3"
-    "MWeZgFo9y4w4lsQNu+rYFdfd1YL9VTdjBckmkkivZtTwLkDEYzvMdCs7OFXNhySJyc08G1DJ"
-    "yTTZZo7jsHfhrioviC8MhLiNXb2Ey3SZhz/HrOM5DkWH2QtmgThKs+y75BpuE4bpM0p/XERk"
-    "swAYJCWN4FbVoX7k8rFZ0grr610pmMwaE6sTJgsea+/ip72jA7MAjrXClm5qCgehHIEj7e3m"
-    "HEsZ6uKUdBxJZAfqb+nJSfLSyF2VoT7MrA8Y5RkGGIYx4KUI8b4aKbU7DAVC6e709GD6kfd/"
-    "ML3r/b8edVvGruUW3Ln0Hz3GuFU9nXdbCoM4Ey/+8yq0rzwXOi/erM+8cMqOOUA44gt/xKeX"
-    "CCnPOaTur/kYLyf0LeIbSpr691KmUXyOb/HXJxmWPA8FnNVzRL3AH8GZ+5muVmyUa5J59bc8"
-    "irGkkn+JI+68oraRaXyJEJlY+410IeYyI0XZMfkEEMKtFFdmSiasGMQ719g+9qMoU2kjv6qk"
-    "KiwDnuGy3LqrCiwgFfxYfq1u1qmqmGXEZVjUtC6vV/NoedUVZVGQfEKB13K9yrcMQ05k2PxS"
-    "M76d8+Pic4DJnzAxMh/gLfTVOIGbyM60PsBTuIvQx5y90fJzfpr/t4KvFhhpSBw7ERiEAmMh"
-    "Mk0SoCLxKYU5AJVMafzodxs/OECeZWiy5CozazI+ZXWTmTAbv2pgKmblSiNEw1TAWVbm5J10"
-    "MqeZKwcDx0Qkg+V3GQR/wiyc1lpmyTyFJYdlJEv8MnOVJ/aCWDulE2BuxMgiI5k8MhYXYqyG"
-    "uuohN+vC0FprmA2XsaLu1N8yVQ1IpJ0sT7EalvDJ+LmLrzhCnIEQWh8dhDITBiFvhSkwzZRH"
-    "1zCJucJsQFXitm8Nc4sBpGoHj9VpxieUK+4mGCPb2DPytMVSuqD4fwwmoQt1zsaNq9nRtSjd"
-    "/+yx1AGz5mr26OjJtLq3A7Vf9kEkfB6Z08+KfBBnhqOjg2ErdgLJx7PP70k7sHnavLYvreTI"
-    "jlVr+lAbTqRe4L3u+qtYYbcjyRpnR+QEk4RtldvyFHCEhIB6OiG2ybgwa1s//X1pg6atyJG9"
-    "L6VleKC+D/urCQ5CvuTyS/ByfTzt2Tea/vt3DqTXbDuW/vyPPoJD0J9FZbIxfeNzf5g+/v98"
-    "IzUC/+kly1JHd3v6wuOD6fr1DekNb3lLahjfmR5/biCNY2MSdkQ08zTSEtvI9qE5GFsERh91"
-    "fPg7i4Gwxr9jYZckk+kq3zj9xw7D14Mv/Fi1MNFL1GzzUFvaeuRpv5bp9Igd+69Mlv2X5Fz0"
-    "3Yo4yigppcrE1LbFQzc74zwzMFa99n2YhnwkiwbSxIX4Gk9JR+PSNjyvH2GH4CPpW1/+RPrC"
-    "Zz4KfDO45sDVRz/n2THhqspTwqEfsuExPOrDPDnu5SXtQzH+BItLVAijikntnsSFu/fCHQNh"
-    "qgwdT56HN4k0cBp1oypebaKu3NiJVNRDiNm0ATOzDieu27dtShvXr0WKQrseG0lPH2KnHPl0"
-    "0IfdJbt//FQapV+qrh4XLulTBQMoDBu9bs4RbCb/ZhiedfZPmMJ9h44AE8bhjJdQQQozNCh2"
-    "7Ylb+lihM+JRVZ9hjjFxX6TcWdKEJAs6I63zXfoQ9lMAYHPFs7gADzJK4TEbhk9sjeNewTEW"
-    "iyP6iMbn+rNzwZrt9MAPki2fZZo9piZLz7JRvbOA+LcMc7R8v59EjSf8enl39/AQu5G1l+vE"
-    "0ah2mKr5RjEDUKXbS38/emwgHcLhr2pWQYRc5D5o3uBV2uxGEhc5lgd4ad3aNbGgijqRxon9"
-    "2LGhdPkVW9Pl172WDR7H0ve+eQ9nZd5AXrPpwN4XYpOLC/Cgo8AXfVQ88ex48pfnD/uRNRIO"
-    "IeLOP/8b7txiH4xn8+F7LX48RwICuV/oygnmfynlEfpyyeoTlPLqw+I58ubJuxeZOb5zriVn"
-    "7zniXD75PZKVP9a1giun4EOOFvn5yXBx4bi2/Z1jg8ESP/7zW3nmXVoRYXGfw3vgv+r3ppt/"
-    "BUARlEHLNCBqFjD4x/Z0DrWl5v5lGOIvUSJyAG158VDS82baKLsKiza21FqdfeHiXcZnrpT8"
-    "ZD1r1xzIEVTgiLwMoYy4iFcfVRiFw34edeHOQ8Ce+13+XhIbx8vbnIowf42/pZy6oAuG53hU"
-    "JIiFE3xeyYkoGZlTDFqBEsA8AWjnA0PDz7ShpuCbzIxxNcbM3KErTAg1CDMv0yqiLJWJNrHS"
-    "FRpqjUSegQjSRXoR4j9qapmZgcsifPM0nwKP8fJEplhdFSUTeeBJYiIhzAiWMbS8wuULU1kp"
-    "R+Ob6bxr4fvcx/Oi8snu5JXbaK6ZQ7rG12AwSBi7A5EseaSGErdJbCKE252BSk080FUP1M0Y"
-    "ZTt5upuLcQbcqnQ00s4HMWsYO4JfrX6O1bAv6gRRdZmEvUmJF2KLxbGKaYidcRN4hRYqJRLt"
-    "5P3E3v50A04ateM4DCMjXjWoHWKy3K5DQgzr9QOlSvIb9z2cPvST72JyOJuee/ZpGLc2YM6d"
-    "9vqrtqbLLucsPSa9UQ6rdlLoRq04pV0PribGxvDezoRg/eNOHTV4dhKzISUStoMTUUxqPO8/"
-    "sD/t27eXI0JGMB4+m1a1N8FkDaa/+fS30tCh43iKb0n/1++8L/3ib/4+LiFey867zKAOD+5P"
-    "//4TD6ZuJGoNrOJV+R1lG/9bb1ifLt9+GZPgSLr3/t3pBEbNreCoTWN5pS6VSkq4cs+ba3sZ"
-    "sXYmdm23xmEUg7mljhpJO7nsfPIpducdC0PoFjyj57P97KuZ+bFPRF+zvzEWJBwx2A2nrjJ2"
-    "oR6EyXZhEQsUmGIZqdxfHUNMwkg048Bw8g0JGWmj35KvY+bFZ+5LD7ND8P5vfCl995tfx25q"
-    "FW43JmOC9Rw+paFTSI0GR/BxRtu5+FFS4Zx32vEmkbPadBL7iT+nQ5krPlMWL/zUXLuT0DFH"
-    "NmGD5SQuo3VR75J0CTsEV3Y2cDbkovTIAfw60X8v3cBZf/TLEQynD+PTamjsBF7eoSO0va4e"
-    "xnAJ8es/89b0uusvZjIfSFtXdyOpRYKEVExHsJat2wV3BbbBvEMScDeg5KYB9fdALChU4zom"
-    "qBb9i91T9isHTsDtn4xvmSvDZJJiIiJz6Z9XTRLDILZPhvqMDG0X+0aRvpuHUgIZXn8yVvsO"
-    "7IX5mQzVvVJlpVVKof1ZnoyQLkRU5UujTNMMIybDLpxBE8U9ZcciF/hkgrIDUqGTdlimPu1Q"
-    "kXJkkogZRlV/nMWPfu82bFybVi3vTjMY+ns49ggLYoZ7Ps2AHMRlC4uvYCqpUxOq2zVsdlnB"
-    "cUHa9OVFD5stWOyM4n7lBVTMp08eZwHUiyT0ec4ufQjpKAe1M64dq624LbGfO2oCN5n4CWxc"
-    "GeuCmZ+smz2r1NXwPDfMMVgmrMWPZ0Oqy3zMosqvBEcb117m0kep/im/ujj1j6W8+rDac2RS"
-    "vfEcTEPt4/yHl8/HhPNTzquGZRAgDu2D9uuYd3l2nAWeLLmGL/Hmr+CNe/UufYl+Hd9yX89Q"
-    "ZtwHFIE/3qv2Mn5GaVQwPxt9wZXrl+PM4TzDtSBq7bXAXhVQC48H6x1Xnj19LT+L97n0lXgS"
-    "Xv5bV6+go6XPcY/+Vb1bboyloKVZ/Rr0VWLGFd/Ng3fLkIaW/LzX+cGK+PEnFzv3Xp7OD8/M"
-    "RmTMQA6JkwCSQIYpGCkAdNLLK2oIEkRICZaAKcEytivHLNWCWOUWygBDjMROcNcyWDR6/mxg"
-    "gSpXssJiLTAjAYSQRyBIxo5yjZdXfDk/CWSRlAWBAn7hEVHCGBxwlFUVKEjCbqd1oqs6oHAZ"
-    "XgEIHMav0tSgmv8QnXR+ULzlbkJB8T+/UYmASbhi8IBTJU0yRKp8pmFgtHvSiFoxvolVZ+iE"
-    "09WwDJarWCfEbKPFqh91gSqEASRTR/unAPc0qhoYLAajg3Mp0i2JnmoCJ2PViaGiYwZVQmbt"
-    "xmEYNq1ox4B+BQwyfrqY/A5in3PZmu60ddMacJ1F1K7Cf/t3fjO99Ud/Bpugjexq25defOkg"
-    "9lvEu2gTq1x9PrWG2lBfV9qFiNsJJFEa12so77uTmNI3+0L47wIv4km8a6g7hgRAQ3i7TjvG"
-    "+x4+7YS8/zhSAfDRjenXlpXtaceRyfRv/7efSu/40Z9LQ0f3pXEOJ0YokJayol++amO6ZMVQ"
-    "+u4Xn0kPc2iwzNVv/csb0o03X5+eevyx9Mm/vydNTOddOcKkfyF9JYXxMSITDbSVzDCvhWG3"
-    "49g2aoar0Gml0kK38wu6+MmTtUwSPQJ1UAcbD9q7VqCy00+RKi0m+Lhyf7I/29f8qfaLfsd3"
-    "NyZYjg0jfrxkeHS9IHNV3kN6RT+SWbXPOz77Dz2f3KH45c99LN3/nbvTwQO4wJhdlvbvxxs7"
-    "E7m2OO6yG8MlgzY62lDpzV6IZuGQ1Ky1IzZyPHk5IauyckgEwbE/gpOCmyalH5QN7xP2UjJg"
-    "LYB87eaWdCmuFzavaU9XIfm46ZbXpJ/58Tel9d1L0ifueTotmh1Lz+wbDDtAtLLBXJk2DNLx"
-    "qfX+H3s3NkDdaQjj61Z8VWW/TqqzcHYKnJ2o31Yimezp0mVAPtaph2OjVDG3YmOlnZVjxHEl"
-    "XlVHyahYB688AdG2pLX24cKAOPqUsrL2QZHi2MtjTcm+TE6WQkoTy2RnHJkUF0Yy4PJs2ruo"
-    "zm9lt6JlNAazl43mhVf66C7EJqTYlqMkz92wSqmldTJTGpsLreVKV41jHZR6eemElFaJMa2E"
-    "eoQFzRi+tGQorYNuH7p7ewMf9u01qNy7oQuAkhc0pPbYItvew6I3bViHnWRP9DEXxUrWlEr1"
-    "D4wgJT6GSnkMadVOcN6b9u3dn+66+6swXKpHpZ+ZTgW9Ybdy0YIIn/URHsvxKv08t4UzB9+N"
-    "4riJuaEwCjlNLX5Ja0aRGX/K3Yx9mfdegiIwYuTv+TGe/bTgNwdpFa/+VuIaxvOF49pq1sXI"
-    "L3PV8GHFjWP8nF/kWT1LlxxfGS/GybipUoAz3k1tfvyc5+K5Kt/0c4xXTuXf+sv0QlxrBwHx"
-    "zUCvMmaqMkpZJoo0QkAc/1UpTVT9rzKpy8vsgpa4iItfebfMEjFKnvtDuGM4xy/POX7mDUpe"
-    "5c43xk1IwyItz77LJ3C3nKLNijKjzhmO+G6cKh6R/wcZLOpkQ3jNMTQSbhkbgaSAioBHg4FG"
-    "vwmshF2mK4gAgzEID40sIYrVuXmS3n82jAOwDCTLK50pnsmnXDlOKScTt8gnEJOZk2x8Secj"
-    "kYgvDFYmTJnBMo0wBjzUUaLoZbgdz3oFI0J4Zh7JrepIQveqrgv1iWiwnN66l0t5nXjLuHAi"
-    "yzYWoTqAuDuhy9QqYXKi9zgSO1ZIomCwQGvAHLYwMCgnMYwPQ1nKs62g9SGlOHt2hmdWzuzK"
-    "cteP1T6JysUjL1RLDeG01OGgWlJpTLNtA1PhdvxBPDm/dGAAj9rL0qXbNodUqx+no7fc+pr0"
-    "r//Dn7NrcGl69rFvc07ZqnTldbekHY/fn9as2cgBsWtClacUSJ9Lw2z9HsPPlsd9eJ6hUje3"
-    "uYtXqg0O8mosJipC7We2nYyKfp30w9POKdBKx5xgxnDKum+Q7eKgM8MNA41fpMUnx5HUfAG3"
-    "EH+dnnzkyxyCPIqX7s14O1+Xtt/w5nTHu65K73v7DelXf/JtadO65elLX703/R9/+h3UMu7g"
-    "UqqgzVJmKOJ4HMpv1MUFjJQ4iQEWTZnxu4S+Jsuqx3n7nOrdRiZyz210LlEyNzzQn6bGOSoH"
-    "jqW9e2X0Mf1TmVdInCR8dgr+2A9tu2D0qb8DP9wuqCbk55iTmZpFCqkDUzKJ/OxDi2nPBmyO"
-    "TuNva/DYS+mBuz6Vvnrnp2BwkWSmNpgopJAjSCux35Fp18eUdlZKRu3vMt8SIfuTzkLbW2Hm"
-    "CRM2UULXiH7ieGwyPm1oH3EnoSNJ5ki7NaWDMhdrOOroonUdaf0qmKsNfew4XYHvLBhqXGf0"
-    "YtSvevieB19MHLWIupdwEUZpkIyQkHlO3tq+tpBaPv30sxhfn0TKNQBDqGsRFgIwhWtw+bFl"
-    "I0cGoQJT4qN0d/b0NNKYxmD0l2CXqPTKTINBBeeWEYST2gRBJoTHaPcigTco22LmySroH2H2"
-    "x2CyWBTIeBpfuqHndWmcC4T9Bw6nAwePUC5qUVTcLdjYtXICg3GV/GoQb3vpkkFa5JhVNS6z"
-    "JN5mOGC9HUZSswHbO+gsjSDMjn/HjjQrS5Wom3h3k8oUGxPAjYdGn8Xubhl2UZ4h6lmaZ7Gj"
-    "nEUaO4oRu+ce2l7aYAEG0tqlMErL0kZcj2xcv5pxxoYPFmrSE+O6OBLuiQkOl4bBGnNDSsMy"
-    "ztNsQYJ9H0zaRFq76jJUsTr29RB3N9tQF2B3XCsttxxxZ719LpfvXtLsuFsZ/ud4uc3yc5Wo"
-    "xCdyTlsy4066eZkvfLeA+vS+119mFWmqO7cCX300QuN/LSxAiNmrFrTw4cL5GCsqG2Msp8n9"
-    "LWe5ME/ewalp8kInxy3pMvC+VeHW1f5uZvwyHqEv1jEq6t0rSsuP8RwRqvecRSTKCWvh8x5I"
-    "kue2eIjnePeVdP7Mw/FWcJHD7dOZyclRctz53/w+97PceCev+BffcrrgRaCZpcySd76TB2Up"
-    "JS7fvUu3Y2zZBwGz9BFfMiNnYL6Mz4j7/pfojHwWRCvhFiYSQhwJE6SEKggMmTvYQ73H7G2c"
-    "UPlBWIIwReNLCHIFJR6FaTGuzM0Z0hUku7rCpVMgS6K9GCKwGOIbnYi65oawYQQ0r+TO4r/H"
-    "dLorCGJDmcLkJfwO01xW1ZH4do646jhiEieWDWlct/Br0OHkEgwVYcJIRJ6MU2Ekyo+g7/Mn"
-    "p4HK5jgWwhV/LYYn/8UcnUPTWcqJg1BJchqcBS6B14OUu9haLs7dTTg5qYdot8pnPzWN2B4J"
-    "YuAW3Mt08AajwUoYQuhCWJuTZUz0YxgrnzvdFIbwk8C2BCNwHZOqpjh1SrstVsuIGaaRZLRi"
-    "e+UOIifJPQc5ZgNirIro0i3rURf0BtMgTD2o+R747oPphtu+lq679e1IZ1bhRPSZ9NxTDwUx"
-    "tn2VSO3bt59JQmnnYuy0hti91cuk14E0AgN5yh2AUVMKJ5OhutS8w62CnGHV6e1DPRi5y6gR"
-    "GEznwNAox6UcT+1MNNr+NIBrja27lzWmT977nGhPvYuWpaFzM+mPPvu59M3u5em2H/15GImW"
-    "dPmtH0zbpofSA5//WPrbj/5p+t6L+K66qIc+4Tl4M9QdNSv/TqMOHT3HRKW1D/2kAS5gEd9s"
-    "OuQG2JLR72C8EKKE+gxeIBiNkzBO+/YdDsmjR694BM5RbFYmxx/hPEXOOMSwesOlN9Ku9AbH"
-    "SWQIvmCWVPsGcwUHLAFxAvfd3iNTZRzvMqH2ee2ylsgkI+VsQFLguBzuP4DU6mvpu1//anru"
-    "mWfpJ02oys7mnWvgVHxqyK/7BRkp3Ss43ouamtHCRA9zhU8qpVkWH1IWpCJKlKIPAxHZ0K6O"
-    "G2AnHyVeqheFi/9hb3Xx2mVpRTfnNfZykgB2UU89+Xy696F9ac+Eo+KLMKYprUJCNoE0tQk4"
-    "ToXNErWNu7BxEDj9d/iF/SEJGh5ncQFswZyjDrt0ywoYASVVnF7AOHCjhrTjDLjV1UBXJ3nA"
-    "xEszZK5ipx9FW59ztKVMpvBq6ydEoZKlbBkd7f7Mr8WjlWhn1XEai5/BN1gLiwqZNiVF0joX"
-    "RHpIj4uMws8XiMtSfVvPnwuFk8F4HcEVwiVbN6cNa7fE4mHixAg+yVTDoaKl3CUwXvCFMW5C"
-    "sksvdEJ1MeZuR9vq7GL6AXUyz+kzOrCl/9EflJ5Kt5YvXwnDiUNZ+pF1YBsCdndHkDDj7BeX"
-    "KdYvL2IyI93XtxzbtfXQhmbG5XDaf/AoRxGNIfHSDsxFEGUyrqewOZSWKWl/Btcu73/j5Wnb"
-    "to1p13PHwCPnqrJY271/PxK5E4RvhTZMpvbO5Yx5NjDQT06fxfkuDS++vcrdPh0bPapQaYgR"
-    "pXN5HiAulVTalw+P5ruVrl3G96WE+ZKfzcOPpe8aWvL0S+0q+ZUsqg+WW65Ix3uEzRVBhuZe"
-    "Eng3Ti4nR+Ml/xeUfFVwRdwqqMBci8ODfSc2NVgAaVwMR51MX/LyUdwYpyo752vfMYy3eMhz"
-    "e06YM3SDl/h2/qnPwzR5DixpDbnAc1VALibnWStUQAsApo30wJQzCpgyLqs65Uz8Gpe0aeFl"
-    "drlN5TVk2HLdjed7VUokC16GWpTWsaxMU+Mz8cWPdVeSS/2ZI/WxZ6bmZW6+RhVMy79XtMEi"
-    "fu260HOpsJGK6MwSgqhDsDzwVmIejFAABxLIyO+5gQKsIGShL2bwaJMS0iOfgdhyfc/xM8KL"
-    "pCpqZOFGMqv8x4dAToj2ojNkZi+rB510ZI6EGXhIJ3zCFEgVQ5QrUYqVbM4tvkW9IFzaTijO"
-    "l9kKGMWsMLzqK8cPkKuElm0WkY0ffPeFZwmc5ZRLrNj4htm4Tg6xQwlpVSsqg/Y2D1+GiMaK"
-    "kLoy8MphujlNdibaiR8pDXmncU4q2ffwV2YtVqPuUNRtAP6EmDAsWtWpzLE409C9hyNG1qzA"
-    "NxU7g1RpdHA48lo8amtHJefPPBiwefzIb/6ff5neccdVqRkVzEf/8PfSr/3uf007XhxIV25Z"
-    "k/rWrIABPMuEcjgdOXw8reFYnKuvvXkd1CYAAEAASURBVIrwPpjjbDNnP1K1ZvuJc8uwHnqa"
-    "F1W6qwg80C4ykyeZTCxfKcVJCL1qvjJ0JEJO8Ktx5bCyTVXOqXT5hs50aHg6vf0NV6Tt17ye"
-    "HE/joPSh9Ok/+930H//NJ1Lb2lUwjkiUGlrxNt+Hqo8+hA3WDHWbBkZbrYnde0rSzuLWYRjn"
-    "qF5LEJt12Q4whTIXGonbpyRQMWDpfhr6y6B0wACEbQ0G6dMcOXRo7y4YDpyzciyJaU5p4F5J"
-    "s+yvrqbso/aTU5wv6N08HSveVQs2c/6iDJXwia/o43jg3/3M/elrn/5Y+soX7kzPPrcHyec5"
-    "JrwT/GAUyYfI4BDGcQxGDRhlCpbYCcC2aj5tnlR3atOk9Mb8Zd7HppBG0x8lPEpYiMJd2yeY"
-    "esInkayegMM0L9cySl5ti+W409iAlPDKa6+AWTmd/sMnHkk9SMVWtDXCoDL2AWIK3AkawpVY"
-    "HDWCg1n7PnmNcx/jeyO4h+w5zUTcPtSBG9ezcWJlT0iIxJf9xYnCvqP6XKnm6PgosGBbBPMi"
-    "7oJekW/gghQhPaY8+784tI9JZJUm+ey5ey4udXugXZ04cREgo2aZ9lnzMCwWO+Th+O3AVcIG"
-    "JEEyPKfBg3jX91te4OkTDA/ySKhOnxlljCKFZdPFMsbjZZdvwYHtqrRn/2Ekcnh8py+axsWV"
-    "jNZqxqFnecrQTU6Oxz3Gje0FLLMw4NIMf8afYfyHupBdix7UPoG7Bs83nMZf3gj+6E4Am7s7"
-    "25ed46Do5TCkHJcFjo/DAO7YtTcWHDKXMdFE98lSbuvs5iI3Hqzuak7XveZqJFfsBEYV3sYC"
-    "qp/jeQ4f3Yf9obadSEiB3/pKX12NmJ99zr7rZXu42Ig3/mR6XeYTWh28lrg85Hikq4WRl321"
-    "9sFMyxXx8zjJQdYwl1uieDfE/Bb+5uLkMhZ+L+8RjygxJduhuapbPAeI+an+sQoxcqk3OYiP"
-    "6ieKatDyYJ4yzYabKOJFjlFyjuAX4uQ86H/GCyY90yejl/zjTntIu+aF1cFQwoO2Ee48EM+C"
-    "UF2+S7ty3Lm8gn+QLla/gIvyHCc+R9sLn+UJh/nEtxzmc8BvGuJEfO5ixVv+noHI/aqubqSJ"
-    "K5AlwnLLm0+56p8jLz6FAIm5IGKRzDa2EXw3KWQyv5RMFt4j4cLAujS58XLGEnYHtOLdICq8"
-    "h2qPSL4vqsTVPudWJ3e+Of3rnK8wURYXkxAIW8SAcwebzEwgjeeAPCL5J5edH+ItKmT6gId0"
-    "PnuFyN5yZNwYiB6JJbHzMu9M+DKCgqACmwijuYjgitt01jEbjucmEIP+ftDLTjCXpr7xcri4"
-    "yVW1fEuoxakSCpsN7V2j9y5cIognj5QZ0U8NthUD/eOo3DjnD/VTiE/Mh59SqRkMWE9gsKxq"
-    "RxVAGy4Emt11SF0PI97XWF27lLFxvFiTfydSpXacBLa0jGMvheqFnJxUVMnZ7q72Xb26bbuJ"
-    "SUB/OdpMdXR0pw+88Yr0v//GTzN5MrHRP153+cr0wLP9nHfIahaP6LEiOteaLr9sfdqybVPS"
-    "F9aBAxwtwzmE3T0r0iWXXcokdpBdSbhzsFzKyW41ZBpyOzl5KQkI79rAo82ZSJaBxEVW4Ek8"
-    "qubSMHoSSRxsSlqFA9PvvTSUbr+oK9389p9i5T2dHvjyn6U7P/OpdO/dJ9L2m7fSURqRkIAj"
-    "JCDmr8fvRWdQi6J+7OlsYjfbGDkj8uO6dGUXzNiKdGSAA55pn6ND00xMbvFHUghzoorGubQR"
-    "oOyTM0g/jh9zgoehgBFYBMw6fDyGbdzQ2P+b3vTO93NMzpvTMg6+Vt2XCQ/tTllxViDxdd+Q"
-    "HYXaH8w37xTc/eyDqRe1p2n1fD/Svw+HpZ9O37rra2lwYAI1oGogzvdDlZNVCUp3NKR2YtQH"
-    "Vd4sEXZO4F1VjpIPNosCp0Qvq22nkS5m56swEdaNsZ4dhjZGfXVK6iRtPq0wa0q4GpBoTRLW"
-    "Bh4Oc/zRmolT2P70oVraHXiUOR4YY/zDkMGb0tdz343xSIxZaEErfU4j7Ev7WtO73/X6tAfP"
-    "+Z/51tPpinWdcX7gcmyE7Jcy5Hb8bHNpn5AmuBCkr1JOM2dXegJCQ8MU/Tz7bstSJRhJmKql"
-    "jZzHWQEg8xS2otTRPHy3bXXmC4oZD6jFkHTJwE2AS1hPys9S/Gxz5ZE3mQY5buzH0sQx3CYo"
-    "qfVg9K2b16YNG1ajkseVwinGGnhubULSpA+rnv701h/5Vc6c3ASufgdV3lD489L1hy4QVrMw"
-    "UfLs+JMhFD77rGrCfOUxkR0AG6IDY84gBA9ZEppPb9i8cQOMaR/Mlqo8paZs6GBzQDc2gko3"
-    "9Ud3+MhQGkYK2If0KtzDINFmj0zQJRdh0hqSpSvXdqdv4ErjX36oNV188UZU0Yepx8q07+AA"
-    "+UykJ546RH8TxrzwW7lqPQu7HvqxdoiqJ50kpZl5Qg7pFO9x0Qz2Cb+5I5NG5e579T3HkgAY"
-    "sbpsu7qr7nUuXSmTRPO+k86868LMqcwzudhSEHA4eS+IG1/5U2L5PepWB1I8GqcWyUL4ETAH"
-    "41wCpXW1q0rk/GBy8edV0s1/rwow3wKR5fJPunzBq66o+F7FN3nkYZZVHOfJTLNy+QUG49Zf"
-    "tfC6QJmuuIC/wDzXFyyMn+3tFXjJj7W/NZzMFVb6UIXMHBVYc/6Wk7M1RRHEBKx8kC9w4SjT"
-    "53xTWzAxfsW0edTD94pG7vV4rH8OqCIgh0bGBvIa6kKITWGaXPHFysK7ADC51ZgcwoLIsAIM"
-    "CVZMDhAFGTURR3yJT2HUogjCQmdf8uO9NGZBBKWQlPLKnTIzA6V0rIJDWKpf+VZWQLFKdbUa"
-    "TOIcUxUMZEUccz4QW/IWzn/UZR8JoG3U3AnMKT/WdQoztwNV90g1L35W3YAtiLnEPRvpauCq"
-    "bYQHspb8TSb+XbnmiVX1FZMVK8cuDMTtNMdhsJwgOmAoZomnjUcnhuqueG0PJ4xjx4fTABO0"
-    "9iyygEpgWtkpFzZgEOwTOCPtwEi2AZ9KZziMbllLN8b4ZzmyZw1Sm1PYbGFsi/THA6KPoRbs"
-    "hoHbfuVlGCizKn7qWexuxtOq1RwavWE9uS8mfBjC7W5QVFC0vX1C3AtP7lNKBfLKxuYIKQID"
-    "Qa/zno/YhVRPRkcDfc+88+cKQ3xPMkls34an+bNj6Suf+cv0D397Tzq39IrUe/EqvKjj6fpk"
-    "drinvY6SBj3VT3uWYkdfenDX/vTBW/vSb/zUbWn72oZ050OHUzt2Jat6OsHjNNODnshRJzai"
-    "mkRq1olERp9k4jKIMvDL9LnbUWh6SGc/dAXmSs/t8DIjTagMlUhJNGOHG5X0GKQWnJSeGB+K"
-    "fmR/1iXD1ETG1SySrR4kYDjLSjsfvTvdfed/wRv7d9LhwwO0/Sl2RGI3g6f0M0h+LHsCh6hK"
-    "rsLGibwcZ6oHVevJcIlXLyVQ/tPP1QlU0xPkoe8q/ymV0t7K8WGfO6H7hWqyjfyCUdLPFX0B"
-    "e6Ot2EX1wZRqRL9zx8705DN7MGZnBzISmewbSyIPI2fBFQAyyDJdgjNLGRdv6Ek333Id/Yq+"
-    "PjGaNm5YhZQFiaA4pu/E3MsfV66gm4tpGzzad2Q+3IkXsKKuclHgt8KUxSLGMe7FzTwdYzIw"
-    "2jHt338oHdh/nDAYNhjPEWwHg2bBWSgRM1/LtT9mCadMgmMw0ydV30rDZmen04Ej+4iHzzP6"
-    "6gyM/kkc0i7BHrK1aRWFn0i9fWPpHe/58bT9OhnunrRn15Pp4UcewgM9R1DBXKxZR39Fmjww"
-    "MADT3s/iigOZGWPSN1WVjo841ofcpCVKrkWpTGSZjGWkVMW7qFqGCYJG9O3QhR6Ol3KXYXiq"
-    "B/nh9gYJxSLGo/haCuNt/ZRgyiiJc8PCmz+FHB+fSXfcdEnQi6NHB1gUtsFczQSDqMG/k7lO"
-    "hZWgq8qO8rGlLBOiYyHPH7lfiUTx6nfDbZz4bt345s/LsPxsmCH5XuKUux/n4hGR9xiDVqT6"
-    "ZvqAJ/LI8WvpzZm4kYfxfRe+hXEJC8YlZxZ51/KP+tTnm/MrZZS7tVh4RVkBZ+7nxrUcYfIK"
-    "2GingCy+VeXUwVPyz+n8brp6ePJzztBM889bRI5bCTSxH6rL14Ant0kJLvdoO9qq/m7ZcVXh"
-    "PhftVW5y4pc5wDiOqbpfxHd+MLL/uce4M24VP3gRv5u3d8PzW47je/wiML5bV2EzXvAO9Pta"
-    "3pQfeZCmMgaoEl7gVo+f8rkUThG5EAu3khQSOskqovGsbLkCAIluhXXdAZxTjASYAkk2c/mZ"
-    "mLTaEZyFapmGWFEJ8wvO0of6S2CFxWoH0vOzcIU6jbCMKBFuQgZewJ5h9Fs0qIjjOTOBETHn"
-    "GWXxbpooqmq4eIuP1Z+cpj5krqfltAV3JU6tIxGQ+1TGfH42VsZaiEvFn58ZLMFEimOJD/ds"
-    "yyZRx4ZnugUiJpMo151VSubkahjIfQxpxSSGqbFyxV7I88i0udBQm2qGimBxwyl2EDJxDssk"
-    "5SNZWiHCPahfPJutDcZMODSSHR4aTk8/tzu2zL/zjutDGuBWchaiTEhIXPD8rUF46kF9QuUG"
-    "MaSWoJ7FD9TExOl0zXWXw8h14w9rOSvxVUxQeJ9HXaH/rC52fslwHTvaH0bP4kyi4uXE7eXE"
-    "FseL8E17rkbg62YX1JMvHGHHU1vY0LzIzsDXbOqNo22Owcy9OKQBeEpfwubnSw99PLkn68Pv"
-    "v5ljdpA8VKsVGUcN6LVtcvflCJKVux/enV67ZXn69H/+2bQOu7OOzpb0w+98b7rtDU+nd/zP"
-    "f5K62Eq/ZkVbGuRMRA2aR3Aj0NJ8FpUhfpiYRCcwvPZAZO2JNCVShbt3/wBwN6aLtsgUoWoc"
-    "GEuPPfRomuBoJCe0i664OTW3dmHDhWEzaqVjB3bBtE7gQ+tiNgpMRas6Idt4TUi1PB5n5NgL"
-    "6YkHvpru/PtPsBUfFxgNLfiQQqpJO89MY6sEc6FbFQ/slinS/5nqTFV1SrKUFsgAejkJy2xN"
-    "zzjeYXLAv++ADkwQFNILhBOTEpVxmCttzuwvLXCzxnMyhodJl6/uCYN2mcWX9hwOT/ADSmEo"
-    "h+gwezMh3a7WsEGsKIKqoVak3C76qMcUdUC0n99zPH3hC3cjcW1LW5D+uCswGFG+LUHN7a62"
-    "gBccCoPdRWKvPy7f7b+qwu0zbtaQuepDmktw9Cn7mmNEhl5przB7qQLWh9bmdUvSlq0Xpe1X"
-    "38SYwG/aZ78YixftvqRtcMp5sgVnQdPIL6u88w7Ek/R/jdxvuOY1wVSN02caaMeWZjz/B4P7"
-    "QrrltivTjbf9NH7c3ghzjmNdxvj1t96SPvf5v4WpG8XesQep5ADjw3blYHbaQncMU6iglZr2"
-    "9nYF7h0j0r3sjR7VKhsIVJVqrG57ZvxIK8ER7zKJNmosKLmLh9Nn6CvgYsP6VcHkPPfSkWCQ"
-    "Z7E/VJ0s4yPddTKja4HD3H/GYPh6kLRPwcgvbVL9LKPM4g5btSmY4xOqmE+zaxhppnjT3mwJ"
-    "alHbSvqm5DpoubARFu8CbFtYL/rWGcKDLkRfoQFrF/Hyf24ZntonHjJl5qHKL1gRnnPuOaZv"
-    "ZBt9IofM/Q3abNkmiLIF0u/1OTgGXCAVptC+Z45Gq49XguaXn0Nf5m9dWXkes2QCzZ4yvUq4"
-    "YTm6f/0BV8hgcnSDSl2rEJPnqwK3vHqPIqIe4se8clgw7c43tJ31VI0ddDti5BwirY8mWnAt"
-    "YZEfV+1bybmCmsTRbuW+IH1tfhS3oKCGa+LlZ2EiL767eM9NEZlFTiV+wEw97IOhouZunbwC"
-    "pz5ILKyjz1yOsVclwYoEtQrmxLl6BUjuVbb1QEdhFpihru6+m85Vkqn4F8Bm4mvcuTyIWFVE"
-    "/ORGqioR8WQTqviRadQqAIx8+GZhfgouk7yi3LgTyBVlRRzjVYPR96rcEOWbAQCUxoq8qzxy"
-    "+sjK3Cq0nIesEuG8e0BBdO/5mW4dyXMec41HhCoc7UotvkEObCcQO8g5GK3SWWbZYaS9gwRU"
-    "NRSf+YaEQzG+mTigKGwSW6txpAfuHOpEoqARpqveGaReS9ktJ95HIw/tSxqCocp+dxYzqWL0"
-    "S1aqEl2FP/3s7rR/dDbdgm+sLVvWBX4np9h5iLH0CcoZGhpHgtWa1mEXM3D0YKjdJIad2G8d"
-    "HxrkWJpFaeu2zdiXrIXRO5mOHjmOunOY99VxvIcSA71RK20bw0bEySJ+TCZKF8VRIUnWzfbR"
-    "Dq0FpkWfXB4XdBY129bNa+JZce+bbr4y/fiP/nBaharvqRcPh6TkP/77X0xvfttt6RN/9FfY"
-    "hG1i8hgPVabHixw6Opru/M6O9Ae//Mb0K7/5c9hLHU/f/Po96e67vsWOvMMwiTemD77l6vTR"
-    "z96HzdYSzkqEYWGSkUdRWuTZekp9NIw+wW5GpUDugpPpoBmxSxmPXXfatskonIBBPcAmgFm8"
-    "8CvN6updSTu0oHJfwm5LjlIBT70rNzBhtXBsjuwhu72QBnoM0L5dD6XP/92fpM9/6h8wVseZ"
-    "JI5BDx4aYXKmH4Brx4WbFZTyZePbbDtzAkZHuMSf7VvsGXy2HoAfas4T2iBRXhe2bJ0dHCrO"
-    "RD1FX5qmPoPYRHViaH4JLhda2Wm4d4z6wixcxA60q7dvwZZtOXmfSYfwSXZoYJwyUupA4tEI"
-    "87mquzHddOXW1Akz2s1B5atgXnW5gA1+SB1baG/PrdToXAnbepi1HiSsSm9cZAhn0ItqTIbU"
-    "hgEWCwk/Ep4XadqO5V3M9hfVn+ahFEumRKZrCcb/+QQHUtHfVKVlGxIdfY6n97zrh9Iv/at/"
-    "k2563ZuRdnakq17zQ+nq669Jzzz2aKjR3IiS8ZglC+Gag0Wj6julsWHbSLvCesVP1Zqw6WKk"
-    "Efxt3taS3v7eH0m3v/kn06att3DodxuVY1MLDL8qwaFDh9MzzzwXjJD52aclWZ5X6gHweseX"
-    "EXGBonuQ7K4hUxxpsG5MDhw8jhSxF8atASZ8OGjKUvqtl5Ji8ZHVNTI69AeIiS4qZBRkOJWE"
-    "2T4y2DJe2b5NqRhw0o8a8Bw/CAN1w+UbUINvSC/tPsw3/MsdH4yFwWJcxNChkZL1gFsYaKSD"
-    "ZznM3t20tksLCzvphGnElw3ssxO4ZThxB+NYzdKmKZfPMjU5rjQvM0E53G/lR+cyX7+Tdwk3"
-    "bOFzyWv+vdDeTFely+aVpWDmaz7C4XMQ44DWvC94CUsQNOCKy3j5l+swB1fkYaN7VfnxNf7Z"
-    "s6L/RVq+E893fxE9/hpcwnJ49JCKvsa3SkBBzCrF/FvEIaiWj/k5j0JjDPMKPEYc5+Ic1w7l"
-    "1wthIeZcO5xXTpCf694LNBdKb5/IeeSypAkRTxwJX2QbgPBa1Z97yUv4TU/k+G+a+EgEsSuu"
-    "XXgU/iJ4GuMQ3xsMFkfl5GIMqmpZsrcWXoSbxizLp+pBoAwScQWJxswFzAEXZRpqVlHpyDDS"
-    "OCAjRXzzDxUyiMgRN79kEAyOhq4QF2lN4/+qIYxjhtVVEFfupQrGAuravxw9lynCRK5xIl1V"
-    "prCWfLyff83lPv+bE1X+Ft1efBEhh1Xh1fdoBIJKA5pPfMp/atnGd94kME4AitUd1KbUuFC/"
-    "WNOxKsRRI3Yh0iX23ceE4o4uB7yTvLv/JBSzuGHoQSSvCmQa1YROS5fi6VsibjuEQTeTvNvZ"
-    "3U7uKh96AVF1Zx/qIgzLJZjNVOyqyy8K5mAGqcpJiOUEO7zGOebGlbaC05UY4HpcznF8ZmmT"
-    "JRHXLuw7z+zF+NyjdWZTfz/OCLFLcSJZtXodZTFJ79kdeGtje7irdAm/HVDdeCCJJhOn1kes"
-    "WkfrrF2NE6fOG/tWdIa06CwSVCfnXlQfr/2h25l4GtNd336MVBjHo2J7z499KL3uLTelT3/i"
-    "U6kZvCxmwnn2hWNp6exg+tif/ev0Lz786+nZHfent/7Mn6SpwyM4ED2VPvaNA+kr/+3r6ec/"
-    "/O70ntu3pY9++ntJz+ENSBL09s7sg1G8u+jEvwbeQimjw4/+xHDNxuU4f3XXnoyrBKqFu84Z"
-    "jx7cwwSPfVNHJ6v7Vuzmlqc2fGaZi5NoI0bRM+Bs984H4nDmj//J/52eeGIXNl262MDeivYW"
-    "ge6WmwkmjwmYiRJQgEc8AoFtiVQqpBnkLA7tqzFOY0xmeEdRbW3AGejq5RhZ892mGMcgehRD"
-    "dgRX2KItTZtXt6Xp/ol06UXt6ebL2NYP87S/H4awqzX6whM7d6cD2KhJmCyllZ2Cx/GQ/+47"
-    "rkm/9Fu/EQbcA4cPhu2bfQzhGvBizwWcqtaWw3ht3bw6bN5k+stoDoAByvfYScwYCRyBe4ls"
-    "8QsmA+LB5w71pUjD7PNeMiEeC6VURMnS/gN76DscrE2Zs7MTtIebSBrT615/Y3rTuz+Q1m68"
-    "FjwBHMbb+1/amdZsuChdc8N1ae+Lz6Laxns/KmPrmA97VpqmbRQMCPUQz3rR5xUYcX2C5Kyj"
-    "3XaHscBv2wd++hfSa9/4U7T1GhoBoq0YD7bWDSjabx1mM8TTOx5lAbGcccNGgzEdlWYP/TKJ"
-    "wjyCnyvzNHwRklGlpPrsOnDgaNq973B67thE2oh/uB5cWHjOqQbvqvZEmqrhU2yuUHXZiL3m"
-    "YjduIIXqw7loM/nJoI7gUFQnqKbR55j9WU/5bv2WTp6che6wg3EjtlivufmOdPDgofTok0+z"
-    "OMCRsYXQx06Sj6cxuNFD9bkLsrGxAWgZrmdg4LQBDepG9c9QT2le7EyF1kmHbN/4S3leMjf5"
-    "yvRA04fMmBjZuUxGKP+KSkzGR/ox9ytxSpjveezOxZn/Lcqs8gigBKz6ERzjL/pnBjNHJwLd"
-    "Oz9Lu0zvv0hgsH0k9+dI658ImLszI9Y+maLMT3E3bpWXCzPnWMe8OUY+PIUbmHivwqv8KnRG"
-    "vJznXJnzYIgGMNP8C2hqiQ3O6WrwVO8lXJgybzB3L03onJ/jCVv+7iJEBirK454ZOb4xmMsP"
-    "tHGJO9MAURXfuldNUn3LaaRB4p3AHC5hCDjNJ19RO8IKc21fd2ESC/1IByfinX9LfuID7/i9"
-    "kjDfyV5KW64CYEFa5F4+WrbZ5LuhuRICV34G+uX8K+IE4qp0pYdF1Ut8Ach55Yrm58zoZCQR"
-    "Ep+ioKos864vOF6rLOe+iM65K0oiojj1g2kCJB7iHy/RUN75Fw2RwcuZ8FxfzlzOPpk2h3jz"
-    "OQZPDCTDSZwB8Gv8L3fLiTYxofEdKHEvhIIBD/FQgmS4l8TElZ5Mj4RP8bvE1qwj+6iTxDOv"
-    "RDVodyLthMAJ20mkX54ZJ4ac5LND0+w/6xQrUvGvXYZHiygNs7MZpkf4DqQu7rRzha6hsDv8"
-    "RnEYavknmODdnbgWiYPxd+B3qYtZ0wHkGWdjrLY9NFpGsa9vZepdvjwdZYu3B0V7QPTICL6N"
-    "kFy5Uj+Fiitvp8/2LeJFCYV5OXmJT41zIbVMksIpZiD8satuSdiHeb7iI088k05OjrAKP5Gm"
-    "OMKnk3nh7qdwnzDwDBMSXtb3PJ1GTmAAjDf4jT3T6dd+6xfT697zP8G0jqa/+E+/nk7sPZfW"
-    "rGdXFYbT2zasTI9zrMzN25rTNeyE7EpH053fO5LamZhc3QeeYT7ANsyV6gwwDLzQisBXSyU1"
-    "yAchY5/CYdftSLJ0gOnWfwfx0UP7YUpxVwBD0c6ko5+sJUgS3eBwePdj6d4v/l363H/92/Tt"
-    "e+9Lx/p1MulOshlwI1FwstOGDClapQJUHSh/ChipTdswCIYTD00QfQLSUxEM8UcY4dqEXba2"
-    "HZsZjlmh7wxhXzPEzkkPWV7Gtys2NGGD1pRWcs7fW95+IyrPNenW19+SXnf7TemxB7+b7n8B"
-    "GzAm5Sls38IOjrIlSnSBdJICVrCDcHJsKB0+dDQdONSf9mIMnW3qzqVRNma0w2Rcc8lq1IHY"
-    "HMHsxJxBgwdDHe2cYXXsKN21bzhm7XOhLofhysbb7FqDi9HehyhIv0jMXXViC0cZ6cspLRpN"
-    "v/Jbv5Le+Na3sztPKQ+MBEbkujTYtGUjGwxwyzA+TJ9kpyrJzf/w/hfi+dqbbsap7iEYtKNh"
-    "o8hwIzyr2WSuJMxKNByv9g/fNZAP+gVAjqG169an9ZuvAHaYFMazDOJiTxlgQXJ4/zPpiYfu"
-    "g2nSiH8xLidGOYrKRQxaeGz5ZOz8SbeOHBkAV3kjywSbM55/4UB65sUjYR9Hs7GTk1211W5L"
-    "Fywe4C3zKXPlOHJBJfPTAXOv7zY3sujMNxZzMGTieWwc7/pIAWVYpC3Cfw7YPFppgoXWmuXL"
-    "OE6nCxvAQ+lrDz6b+pAaq250I5OuMJaza3YRjKo4sQ9qrjCMbWI7pzDI3FmW5yiKC9s2mpo/"
-    "0iDbL/AGfmOBZQCXbR80k+eg3OAif4nPtT+mfXU/J4hcVn38kJjWTe6xQK8ArI8XUATMFyqP"
-    "vB2IQnpenDzZWwc/1udZnkt4AEg8+3uRIEWu1D0zK5YQ2eS8fK6QYv4lP2Ewz/p845v1PA8G"
-    "w+b/Mhz+NaNy1ef/ys/BrATcgiEtqsqgbr7zJ3IX/PpSSmn5e/WFm/2mXIYGPrg755Q+FcxS"
-    "MAIlphGqdHEnJvHt5473bCOecSIUOSbj10583lUPZfVcH6+U46d6YEs+1jlXtSJ4c/UpUeIe"
-    "yCnfcmbVYKiPZgQ7Su7UlpjzLvWdD0EeSCWOE4XPxMnsen3G85+r8m0hU8y7CIj6m4e9sIqQ"
-    "G7cupmkLcuqC82NOlD9XGfhi5+Ae4bX0JW6JRw58y+UKg8/VNz9FJ4usYlUS71USJ10nAg+x"
-    "XbRoKgiXhN3BL06VPtmBHYhKiCZQFTUuVSLRmIZhirraYWQQTeQdRG6fxvgYSYnnEtokbaj2"
-    "JIwS8elR/FVhU7VtYz47zZWtUjQnvXwwLAaxDI7n+yfTG5BYrfPswaUvAbgTPB1VLoPL3UlW"
-    "UiIpAd++/WLsmzB+BSo780kMt12puxJXPFsm0MBP1U2iTjFhaXSPMfLURDBW7gLVuD+YLFDY"
-    "i1HtiZme9NDjTyJBwzfUsKo7DrFmV9offvLRlPhdvqo5/fDNvZytiAQDw/ZNF1+KYS/wsqq+"
-    "+fo70h9+6rNpx85BXJmTIfZiXtuIM6HhOfX10tZqNZIzpQF7jo2nLhg3RkehpYS7gmUshhQk"
-    "r2at4+H+0diNJ5OlQfvwiM5XJ9PeXc+lVWs3IbVYk5rYIahEYsfDX0t//Z8+kg4cPoId23rq"
-    "nXdSelC3akm7jdIS1cXMW0gUgBfcgybSY7PFr5UdfW4wCb9VMDJjSJPsanpu9/7/MfYeAH5d"
-    "xaH3qHdpJW2RVquy6pIt25IbrhRjAgQICSWPJC+8hPCSPNLb96W8xIT0fPlI8kIKBJ4hBQIJ"
-    "PSYQY2PAuMtykdV7211tk3bVZen9fnPu3f1LlvNypf/ee889Z86cOW3OzJw5xplCnGlTZLAn"
-    "p3px075j2EPp/DNicfOkWNrOESzsDG2ZMyNWrV6FNOtibMZr/57DAzEFyeMYDfKQ1Ngu0ns9"
-    "b/Zi8ZFxmwuT+fSWg/G1pw/wBfUjajKdsw7CYKqaXN6GQ1LUi7OwrVMVZXu3Lctc0zhHuob0"
-    "9b9q7VF1kuXXIe9wLg48h48kpHdSh6kgXCYHdjXhtsNQ9Q3sjcXLroplq29hl2NHtGIbuHv7"
-    "luhjx9/hg/sxNp8RrfjxknmdOp2FAO8zsIfa/vyT0bagM97x7h+NF//3h5G+HszFCqUGR/xE"
-    "ISmS+bWtgma2YxcO9hHVkNa/kqTHsJ87c3Y4bn3123DSuyC6D++Jgd797LA9HE898hA7J3ci"
-    "JUY9TgW3tmC/yK8fH1M7d4EbLkKU0C6Y34bEDc/2bDyxv27esj+20g5n525Kyg/99RmnB/wm"
-    "fNfpTX4cdlJHumHKMLhXUmb9z+MwZ9maAc4tlOlqwu/cfNxFuNApx6OxeWWQkxiQ2irJkolX"
-    "9amUtAnm/fmte5F2fQ7GjUXWzHFIPIfY+IH6l3Gntbl4j4eHKotFclLCuHjxfOi/lPEJtyED"
-    "mBFMOI3PLBZo0Kn0/bK4s63YFurxz3cv69XL9p9MD3fbnu/1RdGq98ZQ4Rnj0rA6zX/mXuYt"
-    "05uDV3lOFeEI3JL7CN7MM+l3sSTI8ozOK42wqgh1vMvg+Wps1ad5JeOWAdRlsQEz5xyhqnGq"
-    "RDRNiQeh6qC8j+BYlcc2MYKRD5ddjNAjJb/kUyPYOl1jmJEJr5m+0UxKhrJUdTIfTFp8BV6S"
-    "S9LOmAV0Nc+K9BWubBt8S1p7599oeV+awG/+jF/4o4rODVHHvettr7vHj/WPBz6bCISv9MuV"
-    "RQFYEKnEmZlJHV7gqbpKrtAGTqMpiBjnpb96xZG6b+JfEseigotxHCh98b3mOH3OsLyVbwQQ"
-    "VP3EeeRbQ7jMZQIqMAuMy/KuYJRmBJDRah2FX+eTYErZC9jGvMS3fq+eG3Gq8CVSgZs0I37S"
-    "IiP6h28VzlVaboUuMD1KsKR5hrF6zHPLGKDcSZgelpFKOSBp42Gnkz6q2E6wsnTFeo68prkq"
-    "RQKlvyntIGR8Zk7XD1aRftT1VHZT4qyUSaLsErrI5H8MA+FBPEtPzR1HxlWN5+CqfYYSKpmu"
-    "PtRIaxa3YPOhsesQhu7D4AIsZs+T4LGIHWWuclUtnkLF6IpYevbgmbsf9xPiPQFv8zJb7n5y"
-    "EFOaVphEpWtlJaHhe/o9Y2Bx4sqVD8+urGXmlCbNwpdXkbSxa2zcZODjWoJ60mv54uYp2I2c"
-    "i+uXLYzX3LmBVfd2JAkLYs48tpArwcAWbPGaDTgfnRSzTh+ODXPmxY+/57vjD97/4zERidPf"
-    "f+Tj8fuf2h4rWifDHCCZYyJpb5sb+GjlOCEO2kVy5+Qq06NdnL/a9mkyE58e0qfCXJw5hXds"
-    "6NeBvyQ3FXjG28EDB+Io9l7jcSQ7DCP3+ENfigfv+2LsQCJx9vxk/BMNIk04TRlhpIBLFjB5"
-    "Shm073FgIIBpXWNyqjodn05GKqSndSiIuliGhzTahpHYQXgyzNV0GMPpU1Fn8bzvMLY7R9lJ"
-    "iWrNMuiTqoONBMsWNUVb8+RYurwzjhwdjP/5kW/FE9t64zvPH4lvbtwHE4M/MwZF+AfyEhfu"
-    "osP9PA86Ep1Fm5M+U43IN9vfLCb6lew4lOmZjHQpdwgyMchYFSkQALmEVfq+E2mBa6BxLP8g"
-    "KjSNz90JaBv1bD6ZBb2iK209zmHKSkCVKNnOx+GI9uknvsFu1rboXHUDDJvqO9oRu/60fzvO"
-    "Ltip2ObNbV0QZ1DFT54KE8m/prnzoufwftreqVj/iltjeLCbo2JgsqhDJ/jccSdTSBHNj+xA"
-    "0/5fM4z2YZ28cqh2bzc2i3uJgFf93i7cbHwqvv3QV3Ha2ws+05HsnqBcx9POUKbKNt1GWzuK"
-    "BM4+P43df8I9gJ+5Z1/YG90cxq6Hfev5FHSRcks5u7FZQ/hsIzox9oxDacPxTZRv1eplyfD1"
-    "IaWWQQUZVLizWGSprkdSyhhkXts4hBsrtaxXQGW/P8FCyzbkIk46H2cRpcsJXYfkYglcVizj"
-    "9IcZs8DTjRbu1LwY7/yv349LinfFs489DC5TorVtfgz0HUmpjCdywIlkHZbJzgVX2b3qu1cJ"
-    "95kfYWSTYTaLRNB4/DKeteZr/SkbXi2RqeJUcY1Vwx69OyFfAtZcrnyByGi6+hkK1QgAn+qi"
-    "r5bxTabbb/mPcS2fK1xG4EDhkrwUwvA6XhbKjuED/5lJ+DSar8xFiV7C7JfGGrmquPW7w0fD"
-    "1zr4yvfGiCNgGwOvnKyEmqBc9mlzLVTgUYTzKrBGy1OXi+8ZZzSvAqNKVt2ENworyVO+XFZm"
-    "GmYJb7gX+7/Sf1NSmHSr8SL8v3yfDFY98Ze7nb9muOp7mfhHJ/8aUfMq6f02+pzMkHAYwJIp"
-    "oIHwdsm/NBSVCSsJR+KOwqnwsFgJq2LYMkJjfmRMmUbxkBCFScx05mr6y375rTHMeOBb9PEF"
-    "77r8hfErHtRrJjDLaPyG30hZEm4NA7j1PwdQBjTjpb6f8tf6/0Kr8i2/J+2quA6CDe/lu7Qj"
-    "fxgGReeqBL1bLicdV5QO0Kr7VH/JcLmb7RwqojxglgZk3q5orXMne3eUTUFFMYmBz/ejMD/u"
-    "1Er3DHR2G7G2Pq6sbVAyZsLURYM2HYfZfi2MJmyebGZKBI4reeBboRMr5aEzHNzbwq6rRRi9"
-    "98cTu/o4h64M9mco51XsoHOgN+2zm7dy1t+k2LlzH4O6O6ssHmoe7MCcFMVjGgzh4s6FufL2"
-    "IGXzcYLRmFg6yXA5Uerrx2/66aI6so24g2kqhv1NGs6jKjp1cjj2Dp6CmVDqdj4n+d6Bgfin"
-    "+58hvbsZz8Y9v/fpmHlhcyxbtS5mzV0Yy6+5Lu747u+ON/7ge+PaV9weL2z+Vvz8j98Tn358"
-    "KNbMnwGzdjaaYDqHULloCD6vbQ52athksWrXnYG4UA05+E9j12dbk9vyoR64TkYyNAMVWC92"
-    "PMMwnG3srkxnq0zwjrkPfPX++Ow/fjI+98n78cR/jE0DuD9gstUeSBWvTIUMrszVKQyjTDOV"
-    "A6ynku9EyqhEqv4V1eBYGF0O6WU31ykN8JkgtQ2bDs20OXKCEtYwkq1zuN4YD22VXAEWqdz4"
-    "2N53kl19Q/Gq19wSK69ZHw88tJGzAwdiTdvkmInkay5xdDbKvJ7tw7qkivLFMK9Z4KcUSQZY"
-    "upiH9bl00TzUXmzbB4d0AVNJVWScZfBs87ZZ67xAL4sPGYacbAi1LdheU9qE8Xn6qrJ90gdU"
-    "02ko71mWMmGqv8VvIqq4k6fx6P+tT6GSXBmdKzfAVMwGFm0Em0SddJ52AwLqs2lIsE6zK3cs"
-    "OwAnT+EsTPx6dR/enX1m/c13xKmh3tiyZUfaddl/xNNFh3SleyVNLKDt2s+trfNQB7eyWeV0"
-    "HDl0IPbv3hJ7dm3BG/rBOHMCtdl4VXRKdpUO4z+tD4kQZXBc6O7pT4ZyBsyRkqtNz+2JjZxq"
-    "4IYK3VxIJl1qLOCYIp2AqmptQfolXsMwQNonqq60vbnjUfstFzU22Jnk0UJb1DFxD+4gNHJX"
-    "JalUup1Fy6EjfXGExclJGwftWEGZTMJ5D0iHSZ9E37TerGNdQaxcsYSFnFJqjf+t/7EwgwfY"
-    "Sdwcq6+5KTnl3Vt3MKadQg3ahWuHQezyPE8SFzDUvQvGwiSMTL/AKvVdJl7zh8j+8oP957Jf"
-    "fuejUap4NWOT7yPpKxgZL6Hln7JwASbxRn9lsTf6TqKR5MRr+FfnkZ+NBpxcFAovcxDuaH6X"
-    "P2UsO3jGH41Y0ljfRWol3BEcjJs/apX2MDLvQNN6vjGf0qdKnMvzrd/rOPW7d+cVUo3+Rt5H"
-    "8TOecQqe5W30L/FIY58Xvr9Szvyb0RK63zKf0ZQ+ZR1bWNNf+ilJQHDG8WMKJ7gneRgnZG4v"
-    "SUUeeSUOBR9pJCBVhCMb4hJyiTruHW+96x4jCVxpheoj4ZSwS5kHByB15Q7aObFnuhKnfGMn"
-    "WxbUibvAMRu3Kwr/cpjml0QjjvGVLBjHMCf+8isVbXjil+HCruKwUkoGxQZhWMWwFMJUcRLP"
-    "l+afMKr0iZuwLdvlP+Ba3sR1BC8Ia9n4l2U1jyoOMTPMjl+Xw7TiX+hnPtBSelrmLLfMY4mf"
-    "5azoZfyyQi/wR9MLq9ChxIG5gvEpOKpucMKQEYKpYvJwhanRLmgkaRw8pXf6xyJIg2cnk8lM"
-    "gkqkyiTu7sFhRP6nUtKRx4SMtjHgluN4nCAcJN2td7SPs/RgHGaxEtUpZ5nQsM1BkuWkoQRB"
-    "BZGTvLTpYhLQCNjuchKGYDqD+/qrl8aLMIYteIl/81vuilvvuDVuvHl97NzyXE4a01mNJ/MD"
-    "EzcT56juRNNPV3tHB7R0tyIMRrZjaORqHJhps0HhlaIVetoeVF8gSUF9p3GzA7T2SftxjTCF"
-    "Z+cG6WTnm8TA1Tt4ITYdPB6rF8+Oj391V7z1jmXRvmJ1nMXRalPbMqQFu+NTf/M/4wfe93Hg"
-    "TeAQbHyIcbbjJCboIhFhhx20uUi+ni2nwfkZ8hYHGQMZnLkzYCQwDJ89De/6MGbDGAdrW6Oa"
-    "V5sYpRSz2A0mbU9Rn3p1PInrCyey3J1IPWus7+5FGawhJlbITllVCWJDh9hIr/FOBqpKs2xI"
-    "Epw3LTvCRRywXuAQb2gHvaYhRZqOZEt/VFb9kN8w2FFVZxrV27pfOMe9j8AblmN7xzlzLS04"
-    "TKU9fP2B78Tp4dKGzzGxH0ftqJQKnoBJl0GMcvue5efddtCCAfw0pDC2Tdu2OFuWSUjz9ENG"
-    "tJzoaymcRqaGWSb7r78sGH9zAwa4y6DlhEVEmbdjx49l/5AGSlf179SEWsz+6GW7USpqHjpI"
-    "HjsWY+7Tk+Pxb305Ope2xbI1t6Xd2xjgnqL+T2CD1XtkD8bfLaiz58J4YbzNoDtjNmovGAEN"
-    "9WXyX/GqN8RQ/5HYvHlz7sa9cF4Hpe6ELP3XOI4n4t0Os7Jg4aJkIpQaKY06Bf26juAEmDov"
-    "NlG0bYzPC0OmWjOyj8jsWOf2P+3vNj23K3ayg3eWIkvIA6myfufPmRyL2nVZUjZ82Je1udR4"
-    "3V3F9lFprtp4gE0SUIINJ21Ifudkn+nt6c1xRaZuDnVumT16p721JVrpm81I6zziTMmWDOlZ"
-    "kBrEXYn0tW7HEdbR3srOYtqLyHPZV3RJsmvX4fibf/pGtEw+mq4v/v3fHo49e/dygPQu8PCw"
-    "epz+Mlbp7gc2ONvEKJNTJkin4/zPZKk5Qb4TMK7adWi707jbOwNA4iBTlUyHjSrDQUrU8lfg"
-    "OeEnuiPhfjfQND7XaauI+c1nvvFH+hfGhhbPt7rsOUDX7zZjrpHWrNgo4RgqoMt/hlNCgi8S"
-    "N48Toi0JwPnGuaGGZj0m8yYM88ukxqXRUEfOdz4nU+Y3gZA+VfrEt41aCPGWFvXlYylPHZIB"
-    "mUciRk75vUpb4po//wDkP8tV/zPfjFNlUjOc4pI48T3nZvFLPEjJXcbKuMarBRcZX7Sp11Lv"
-    "xpUSZulMbjr/GFDgCqtcthz+Jd6CHYVruJlmu0mmjO92Pq5x3/+9d99TCF8SJXKZSwE78lcY"
-    "AuLKTBOgQMuvjpeZGE9svap0dR4lsPxNeJk+i1jS1O9m1fCz+P5LuHV4BUwcvEqwUMt7DrZM"
-    "KjJPdZwqSbmVaJcECf+KwVcItIhZz9z9XOdR41lIUHBO5qtiiGwQBbeK6bMhOzFkpZGae820"
-    "1RVZlyUbC+UpZaIvWD4GLyVXNRMrNnU6w3V3oHdpmRwZD41jXY2Kp76PEhbPnq3HXIKkQhWD"
-    "aiAGXaRiQ6xOj7HFvx/v4pNZeboTz5WsbUn1gZOXE5MMmCvJAZgyj9vwnDons1q6YJvTFguU"
-    "c8Wr9Oo4RtwyN8YZ5ve9d21gRf9iXL1uZfzUr72fzsBOsXls7W5bECvYmfjcpifo5NOwcVqR"
-    "6hB9+yiBUqKRK18kM4MYrp+E0chOlMwV7Ys2IqNlPclYJnMPQg7yTipOUNJC56mDSAtsaKDB"
-    "pZTGHVF22IuxaM5EJHIa5J6PX/nl90Xr0uso02A89C9/GX/4Uz8Xf/yZ7XHXuqWxgJV355L2"
-    "NPjvH9RAe0z0H8MAmAnuDDZhniN3HL9fp2AenBRkeuTlpH85168Yog8hKVL6JzOjhMFJVqbG"
-    "Y4lcuGzdti/2cMC215Ae9Smj9Z8uIDRiTzcQlBOiJ8NIHkkDyq6RPSSnpEh1EHxqWK/fKj2u"
-    "ewxO0zQOQXZzAAb1OmcdAJeTcEZKI5R8MEfm4NQPYObiuGWVkse5OIydFn/1L4/EF+5/mp2j"
-    "qkYrGx7xsryML+JA1pm/z1NpJ8bzXEM9uHfB5LZSt6qQ9mLTgywSCR3HAcGcqsKelBMr+1Fp"
-    "e2k/RR9Kv1K02dojeTJX1WR9jDZZpKgcTE47nTkTlwWU6Si2hAs7WmmnRdqpNFc3BdoxGV9j"
-    "cPueq1MXERcvToyv3/fJWLS4NVZe/Ury8igi1OzY3um7qbfnAIwPUkdsBh0bVNvrr2zmrDm5"
-    "C9SzHa+/5ZUxPNATu3buR+qKypdFkO5Q7Ev2K90zzOOom8mTp+KGAxU6vtp0VfLAw08nI9Tc"
-    "PBuKOQ8qqS0qMt+P4TtLx8Hi66YI4W3feTC+sxUfY7RXzOaS7mUBmPMjtnJKi0r/tQ/UanwZ"
-    "en9nWARYjjxMmjrX+7uHNJ9A6nccR8BN7DrUAWnTbHbZMnHt23s4n2eyCBjgNIZkrOg3TMlI"
-    "rrC7bJ3NRhB2k1YSXZm3q9Yso9zlvMbp2Bp6DbKL9oUd+5Agj49nn30h/vofvxGrljSn/eAJ"
-    "VgEyWKeQFCqhd7ExCZWxbVnJvAzaKJNkzHJZDq+UdJVH36qnOp7v/9FvJOFLHsr4X6etPpOp"
-    "2VZTlE88G6fGqorXeMvvxCFKebw8PmNRTvQFlvD8Z/lqqM4xjskXGVRG5h6/VkRIhpL3es4y"
-    "exeqtqlc8DufkN73wqBkhBxT68LU+V6Cui+JdBUq6lzVLR8S25GA6ntDES/7BDjHb/ErTM4o"
-    "sNHyZpqkSYEnDglS/LPMvPmfNmq4P6/6Xt5e+reRPiORa5jALbCBQ361OrdALTUx7gfe8cZ7"
-    "7Bjl/L/C1RohiSeSl/wKoMLFmcZJx8L7M4Ny9zkR549PmTkdqCBQBkSfR2E3wr08T/OokHdg"
-    "Jg9tazL9CIVKGvPNvOvGZ97iSF52OnFN7lXmQFj8E/d85u5zDTvjZT4lTz6OxCsVTvyqsVqO"
-    "zNe7V93KRx8yr/qzsDKJNDCPSrwtnqLklTDLQz4XWlse8CFxdhCB2JGywpntyDe/ZZzSsc4x"
-    "eJ/xYOLqV8T+RYWnp2vIk4PySSYWJ/EpDGiuYJVGaZsildyBaEMa0KUA6hUnsKIqgPFgojN/"
-    "aalB6nQ8jbsd/PDR7jjERJVbvhncU2LmRAzXMpyGtkpukGSQ9uBxJGyMjq+7fgXOS2fB2GH8"
-    "ikuHGXg8n86OpSEml9aOTuxfro19OzZG95ETsebqtXHowIE4sP9gSueGmFx6kYYN9JMnZVWl"
-    "KSMlPax7Jx3LUFeN9EvyESYzWex5KGuqNC0vTA90lOnhluewzWSCcBv7Zra0f+wPfiJe/dZ3"
-    "x7ZND8Sn/vRX44d/9fMxo3lx3LRmCdvX50YL9ixOck3g76r+UM/R6MQ4Wmbt+UPHow8v6gtn"
-    "my/qGJgaGeqJTMzMcdBHaYaSpiJZ8psSnDJJYScG8zEMszwNtewxmLZjMKmQkfjF1YXSPdWB"
-    "Sn5Mmwwudy8nIciC/ZPhPGMToxowdy1qb0W8ZrzNt8z2kG9wc6s8jNVxGDWrvxkaTEXKqdG5"
-    "hvlTUIt1YjN35wb8WuHfaidSh69v2hWtxGudwaYA8jlMWT2L7jgZIbDIPNKtB3lBWsoFPjzL"
-    "uOlSQYnpcmytlIr04B9rANXoNBqnNl7SZhzqVaUXMvrWr+o961Zm3npWSiizpT3VQTzWD7Ax"
-    "wFwOsRvVn8zTFFRb0kw4A0zmSqp62a1mW9FXmncv20kacNN2TWP/mzBxbnzpC/8YC+bNjrXr"
-    "76B9KFUbx2R/Oo8yOjbYhY0ekqFl1yLJwjaJjJzwNHzvPrib9jqEr6zbYZRPxZNPPlrZK3ow"
-    "NBtGWMzIYM1vn5/M1cEDh+lyZ5H09sROdtyOxQZLeslU6FZCqbSXbdi+KE10MdGPb6svPfxC"
-    "9LBYmEabm5jtvTAR0sx/ShF14fAi8Js4k7R9fjO2j6j2+a43evvEdJhZyJiTtf1gEirs4/jW"
-    "k6buqHSsOI5UVZw8RqsJ20kKi1S6L11APPbsrjiCwb22hC6C5nDMTqq5UQMOw7wOMbbMoz5k"
-    "XlXdypC5u9NDzy2Dm1HmNbdhIC8DgbuJgZO0i7nJWGki4FFatExUtpOpl6mMYeV0BNt9GdJt"
-    "YaJEYYlp2XKeMlCkG37G+M9ehYKX/k1Y5c8IGEeckjdZgVDSHhyk0ctefhcOUcpjA5IJ/2XS"
-    "CrMqp20upYSV2UjNKCVQoSdI8JdIXCkFksFCcujOb+shGbQKT9P7G8GfNpXPl5U34V4WJnyz"
-    "qy+pdklA9YEueMXLfLyk4+VpR+AKsopX4hZSMAuWdBW+9OgydybES/9cKftGmHXsggdvJEi6"
-    "8mg8eYd6fs6PhFc2WFXSipiNDcGE/kqj9FlgIAnCyZgItCpc/S2R4qVOV1dilcvITRhSuk5v"
-    "HlfK2++NV75W8At+BZ86Hwtt4QWcMIFbFa0RzBWfa9iXf0xwVWBdEWWSBv+6sdlYq4iEWrSk"
-    "QU2vkbKNVHbmNlL+Uk7DGmFW7yVqgddAs6S1mSZSJXMZFPN35ZHGuzAcSrE0WneFqg+gmRim"
-    "NrNrpxVD2FZWxEodmrAP8i7z5NQ3gQFRWKeYJNxJmIfqogY6D5zpSDZ0wqjkzV1aTkJpSM4A"
-    "N7OCc+b0qdh5aDi6sQnSm7v566ZhCBhDzO4DOKQ8gcrjmiUtcQOMyfz5LUlLJ0ldEAyjxtlw"
-    "6+34GFoRzz7xYHz+kx+Nr9z3Dc5oW4SajB15StdYRR+DGVMK5cRkeRYuWpC7oMxPCYA7lk7x"
-    "rHRCOqkqUPJRylkmUelox3GHWTd2LDq0RDMWJwwDH065iR4kPIcGkKJwzWMy79n/dPziL94T"
-    "f//A4Xjb7TfjiwnV3UzUFahsxsEtWAfHOWTaI2DWYG8mI/2N5/fGz73z+uicPTa+sXUQJgsV"
-    "B1yHPrI8RFkJoY4ZX5TB41mP+lPwv6SbCVU2Jzg/cjwqpdNMjB6Uu3s/BtZMrEp6LIP1645F"
-    "v8tYOdGMDAilZeVfW4o/oiTDpbGz1wzsY5QqmGYI5qofWyxp0YyqcDnlmzcXh7BdJ6IbXPCw"
-    "EBtWtMfyZRxGTdPfgZ3cE7t7UEOhMqTt2Wb6iff6Gzvju191LR7az+IGQskYuzWR9pgjUbOf"
-    "mP0xGMKpMDYe0KxU6RgHAD8HgzSD/puG9vZn4nexW3USfsWUsDjBe1n/Xk4U7kg7eKgnduw9"
-    "QsCFZKisa43jZSiUUCkB9OQB+5zSMOnU0jwn6z+lrrRPd/lpgyQ8mQNtmZQ8qk5omtUW//y5"
-    "f4xF86ZxODie1WmvE7Cbc2OGjFY/Cwz9mC1aejUMQz/tDZU40tKZqAx1RivTtGgZjlSR2Lzw"
-    "/FaYcc86tG+OJf4JmKVJ7HBFDUebPdLVHbvwdH8RNaJD2352Y7rbsrkZR6S0Q1DPcU4pm/1x"
-    "z96ueOi5fZxIwAIIgkk740hj69t2aXmdWqfA1Nvf5sBgLVzgoeuOG8V84Dj0dzEl46bKTsN+"
-    "81MFbV+XJkoCB9lRqIRLqV3XkW5+XekcV6ezrewknUJGZ5mwF+A3az4HpquW7erupa3iMw0G"
-    "UNs62+3uPYcwSTiGHdlA7DvUm+44psLAO89or7p9bw9SzRn0s2biHqYgLuxoh4xvGvZPYZek"
-    "pg26LLFxpcdt2xexDChjZQYY+DIXCTP+y3yug412+TWS16UfbGPS3Mbmc15WyMtdGYmIRCmP"
-    "Jqrjl/CUSgHDflp+BWveiEq/ZxUlk3QeGiejlHNi+VbToszfBbb9Js1WVN1St2XRXmgm3ZKR"
-    "AIbPyUTkXG2pTD965VsiPRrmU2OsTNMYUEX1bNNSTsta/4gtPFHn38ulzQyIZ6ps7KO3Km8z"
-    "FJYRLsWnhJQc6+f6XtpM/VbuNb0To+xbmWvSJfmkhrKNe9fb33BPjbT3JKBYFHzyXogq8ILg"
-    "aJxMUeVeEvitMErGlfGRaSo5FgYDKLzXzEbmk42tMZ3fL/0Zr4AhXAaFXy15Gn0mjAHq0jwL"
-    "HIly+ZU4CGskL4cc3q/075J4piEf8irlIF0pYrklPHOrYZfn/FijYWEqvXK2iixfBcQ4/Oqo"
-    "pvaq6ZhwSJ9lqiK5uksDd1JlByC+nUbD8yLB0g+Wxu6ugDE05TiPJlaCOuCcC4PVzGCuofp0"
-    "tlc9tbYeAABAAElEQVQ7odA3k46ujB2oXrwgA+WABtPBncyY2DUwLSouDcpdMTHm0hnHwKg1"
-    "49ATP1Y4lZo2CcN6bUxojNpczGQXmjuWrl46H8ajPRYvnJfSHieI6Ui/VM0owWnGpuO5jU/E"
-    "N//9X+Mnf/1v4v6Ht8Te7pP4QNIwdgIM1exksrq6u2PdurWxfOWKZPaOIi3SjUQ728edqFQP"
-    "pcqT+lLKYxnsrDWDb4eUjLYbV9LtqDHaZk6OQ3hUn8Gkeee6Jag1WmL9yvmxeuGseGF/fzyJ"
-    "6uWLDz6DCmNafOAX38akcoDlCrYrMDoT2eEIl8WxJX1IxHqh68z49P2HonXaifjL3/vRuOvV"
-    "t0Ybqsap54bieQ38sf+RcTmJrYwqX+YfmFC36KtOUx3HQcCoaD3TT8/vquqUQCkNdIeg9jOq"
-    "vU5Qt3k+HN9yBU8bcXL1mRs/+4yld4LlxlX6RTF2d5eghFBFexSp4gD5y7asa5+MXRSTN7vm"
-    "li+eGt/1muWxYXlLHNo7iGQPOzEYkSc374mdRzkoGVxz2iOvuUgVlFz9xA+/JW685ZbYu2sf"
-    "OY9D1YxvL5hGmVmH1PrqbJ4eSzrmMwnPSaZ+OxOuUjivgn+pp0lM9N3aBdLmlZa6K8+6lFGw"
-    "j8iQygjoE6oJaZS2Vc+8sC93w8q4HUdysmPPgUyrOlIXBDq5VWXYh1pL2yvpKSMmk64HdCUp"
-    "qvJkglQB4nU25re1x733/mN0LmR3I0cYzeBcShmkk7Q36/EQvrAmwZguWLIWSUs3ZYfhYYfh"
-    "bHYXHu3ezYHmfagLX4cbhZnx8Le/RR+ASZNhor/1w7R49+D2GUir9Ha/rXsISQ7SMmyO9hzu"
-    "x7YJh61IjJRmncQ+T4/szzy/M33LzQAP61qpn+reqrrBAFry80gzlwqLOFVhKky1UrtZ2Eyp"
-    "Mneo9GxGxzfdPVje6ezqHMZtg21Hemli4Lsq0NbWVmBMZZF1LrZt31PMA5B0KUV29+EcFkOt"
-    "SKZnVzt2xXPvIV1WTIj113TmGLKNo6z6kZoFKlQlz44BTZRLKeqx4WPUGRLf+R71cxpj+kkp"
-    "Bdu990AyVkobrbtz59hcQFmnTUNti8qVQSrbd07LjNfOE4UQFJDyS4uaLjw2XH5pvIx1WdiV"
-    "EmaUS+PVc4v5lYuE/K/fGnMZea7jUhE55ud7naK+C6PxX120qr9TjxcYj2XkZbbyqpIKrp6/"
-    "pFeZR0jHWG4aGbJsBERUMmv8ZLDAxzFSUwtVuhaiUHEEc4MEPhpwhafEuiGKj/4a5+h8z7TE"
-    "ToTL98yPj3WNXFINxivkNXJJTZiwyh/uBGed5NdL/zjGXI565n1pNPrlKOxafWoehTZlYV0n"
-    "wU0DDBZEzn/ea87UBpk/wmQmDLeBGtN4hNUXb4lZSnQyXvXN4IwvA2JablYQaSWmQYWLNi9h"
-    "WqGVtIkyWIwSXn+v8GjIO4GOxKvxKviYtnYAZn52xEvK5CBEA8qyiUwmK3gId4RTByc/lnjl"
-    "ucYXgCJp0rznc75X4fWz30us/Fvqv0zyha4lfQ03aSwtMp2goUGCKPj5XOKUDpKrFGKLSV1m"
-    "E7uyT8aK3XGq+pTkCGsKE8Y0JhJ/OlnUkajFTKkQK2hX6jYk8XElKjMoM2XDVc01gKrGqdTV"
-    "rRObK3QZJM9mcwu3ByLPZvUqE9SCiL9z8ULO62tN1wzNqCHcqeUAfAp1ofBlEN0lqBdqJVIP"
-    "PPwsXronA2NWfOHz/x43X92ZO52mILnoQ02wb98hjtHBJQGT3tq1q3EJsDxVho8++kRs3bon"
-    "mZqlK5Zi+8IW9v6BnAh0caBEzrLm7ijag7YbvufqH5o60Toh56TKGOIhyU1I9aRbS0tTfM87"
-    "vjd+/md+NI5sey7GMXhth6n4k9/9BY4xuSM+/jcf4oiaZuKew6VDb4rav7xxMJ7bviM++Mt3"
-    "xnve871sq98Xf/eRv+LMQf35TMemayaShr745o4TMYdJK9WaMIG2y2N5fBGONZEiDcJUWd/J"
-    "21Kv0tyZ0ioZYLeWE79G7KrttI9ShQfvEDPxPaTdncfi2Dr8L5vCZyQaGcIOQe3MbFCoCmHY"
-    "ZMRUH7VNGxvXLZmR7iqWL2mL17/x9thw042x/sZb4jVventcOHc0Pv+tbZgXn4ujuF6YSb7w"
-    "ZHmJnpI0NzSMwQ/XxqeeRX14JLbt7cbQHSY/pQ9I+MyPONfhiFTGKs/Oo004Ybs4sO3OQG2t"
-    "M9O6DzgMJXwkk9oIyhxMgTFWilozltOwy1MFnswlRNp5aDB2dh3DpcRY2uJ8aDQuHn9mT3Tg"
-    "8FbmO6nCgkQYMkm1PVQLi49JSFFk+F14OPF714XBOA4xb8Gj+Yc/+plon3M2rr3p1YTPpI3h"
-    "4gQVrudWqhJUErlg0SrOkxzIetMD/6ym1sT90P4t8OIvxjXXXgsDuou2g3p7PPZM40/mIchx"
-    "YUp0LOqAaR8TT2zejTQID/yoWgEZO/AnN448tK3ciyNTpVa6QJlJZcpY23cdNVT7Uh0pLZTW"
-    "kC9Vdm2ognf2sisPFW6r/sBYRCnJctfoIH3wOP34bNJ3ZvGLBV2Uiii9cjxVynyCseKkO5Q5"
-    "YFy1oOOHUiXH2tOEOzGrZtTcwDECpFD9HY9nsBtcyCaQ9nnzYD5P4fLjcCxE5apU3PYqvWWO"
-    "HdcGhzliizIvRYI6jYXVhvXXwVi24P+rJ/OyI1w4z8aFQfo5fur0zTeVo7TGsTFBoYi2k15O"
-    "hvYhUE8aZGDDnzL2loCc7I3IZbjto1w+V5ePDb9MbxDpHIdNZta+11d5oj54oJuVKyMWQCUd"
-    "f/kovFJzJVVGT1xIJmzK4vxZX2XxVPIU3WSYoJ/Hp/lsGUouJa3wHWe8XBAI1HjuPlea5Xzg"
-    "eFkWouJcGLWSrspbgA3lKzgaxo8ry2OuvPstcSR+JrGMhEtr322r9b86ZcbLPAQhUGLwnmTw"
-    "XgM2Tn7lT+ZVIBEhI4uzsfM/z1V0wuqrDqnilYQil/DM2cuvPtuWHFvqyzKYRdr5UicoJjPp"
-    "uB94++vvSVTM1EncWP6vfj7UBE1gAqniGV6nKc8lbp0pUUcuvvAsEtQaj4WoSj8K0zQa0Y/5"
-    "P4NMJewR4lYRDWu86vwtcmlM5Wvmm0CEU5iUEpf3EQZmlFAJN2GLa10+8S14CDXj5EPJo/y9"
-    "FB9iNX60SBlSp80ObFiFQ1ZQlaL+VmNVpyHjUZgNzykORqJkOhtwYSTLir7sIOQQVRksGBgl"
-    "WGKimN8jQDyo2QnBtBrgugNPJkcj8dxBR9yyqnbQK6sca0P1hxNoPtMJJ8EsqTKweu2cJ3Ag"
-    "6MQ1FQmPu6TMz3JoiOvOQbdxP7YNg1gmTw1b9+w9FA9s2htb9/XEHFb91161JNUIQ0gD9Isj"
-    "ztpoyOi4NXsOUoXjqF6+/vT+eP2rbszV9n33PUg+Y+PW227EBcTSLK92WvrLcQCR2bTtqh70"
-    "KtK3mml3sEGChcrJw2K1J3OS2bS3L2aj45Dh/MoTu2PD6o60Adq2dWs8/AIqKK4jLzwc73z3"
-    "j8Xdb3ht3PvRT2OUjyQDRu0L33w6fuJVEX/5F/fEna97a/zLJz4W/+MP7ouzw2Pjqy8MxFO7"
-    "8GHEQdO/9P73xJvuWhYf+8ImJsGJqNFgUtmtp8sGGQnIzqSLDRIP2Q7J0/HSn9KuUufelVZQ"
-    "Bmg6lbT6tHI7vOmNZ9oU/ZPe9xnYxcxCmkgwkiJsl/hpG3UMpmd56xQcxmILhGRtHo49b7zl"
-    "pjT6//rXH4nvPLwpNj/7dGx6dgdOUzlgmgykaGFurKnSX2WENFrfhif252Eou/HyPUUP9Ohe"
-    "B3F8KnP1ipXteGRfRPnGp2TJhbFG0+4itD1uO4K9GVzldMpSJhAZSPNg8UAZ9jM5T7iAtANm"
-    "SjWRUjG/WpfWt1JVDztetrA51i2fzwRdNmhoKK/X/C07DmBcX7yyy3S5YNClgd3LOEpGHDeU"
-    "usyF2dd9yVFs4LT5ceJiCuIYoCXxhS98ERxPotJ+Xdpa2Q+GBvtpd6gkD+9DVdyDXV5H9nfV"
-    "9RJ91myOOOJonWeeeggG/R1x9bXr44uf/Sy00DmqUrmJMFnH055MVf++3ftT9autx1na82QY"
-    "2r34U9vNrsKuY/ijA+cphDlXJlNFHjLa1ntRoFJHYGy99yMJvWHt/PjJ97wh5s08E/c9ikH5"
-    "JDexYDc4u5wacIR+umrFcpgrdyQ6thRYOVZBIKVX0sYTBo50oxZkI43tJ8cf8lEVqATKtI4h"
-    "XrpzOIDat5sxpnkG54POmc0iS4aN47Dwi+fixrpTZWg9DtJmZPjbUL2rSldq3rFgAf19cu4+"
-    "Pjbk4eUsJNi17AYbnfB6XJELqEnYzBUHqWXyy/FfvFV32jizFYmVV4kjrbz8aiOo7yUk38pX"
-    "vvm98ScjVdIXIBm7EV7CfEmAoXlVfGD9mqCrL9wqmADNuZBXy5OXGfGe/QNa5z/vMgEpkSxp"
-    "63m7TuR4PMJgZTrHFCRYMliMgX63LpVkCrOeV3POJsx70qWAT1pVjyNoJQ0ylrTkX+IPuhDK"
-    "Z6+aZuKX8BKSH2XVGyD6SLB4la+8l6Dy0IDHyHcfqsv8Ms8GkPW3vFff63jeC26XxMr8Jbga"
-    "Iq+yiIMh5bnsWGf8Iw+zQYIFgwUkX7y/3JVf+F7HKZVI7MTA1EL0njRIAvgsIQ3PxjDyvYZD"
-    "OA3dhpETPA0iCW9CrkxbF1IYiSXwqdhkTGp4L8G7lKPGtVRHaXBALcBLiflbwg3N+MCUU8+8"
-    "q7g2rNK4GtKWBBWshltGEWp1JbxCkzrIeylbRQfjGFb9+JgN3ABxqsthusYaKjhSwQwYDuR2"
-    "DpdFJb4dAskFUhYd+51iletKV8ZBKK7Kp3HGoCt/Jxbbth3SuDI17p5ygpJ22l74L+kAbXKS"
-    "ThyVUhTDVH1nqcoiGnCwW4L50gWBnUaVzVgGevFy4nQynYTd1vqVC3GGOIfdSMPxrRdwmglm"
-    "q+bNjKvXdDI4TkxGz11z/RypYhXrkkHpwWHOtrOOpmO3crAfO5ELZ2IZzkDXXbMqVq5GTQhD"
-    "pW+enu6jSMBmYzg/O+a1tyXz1M8OQxks250SNGmYtgqszC2XbiRcQXvWnBPZSc9wY5v90iUL"
-    "OKutCTujnRgmPxb7OMKll6Nz1rU3xUNb+6Nry2MwDhfSd8+TMF+nh8bFvX/xS/Hun//tWLry"
-    "qti15ZF4209/NO5iUmORHgtmj4mVbI//9uHB+L43rI/v/4nfijuWn4sP/8ujTHiTgaWDRr3b"
-    "F0ZZJsk5AdLC6DBhIdHQV5AqQooQU9KVAowzdSVTpRSrLs9JGKczxEsVLTCcmOfANLbBPFkn"
-    "PZyhaANw0vGfUicNXW+6tgMbIc4UhK5n8Xn1vg/8czy7uz827xuIxzYfSuZKeyvtxawf/qfk"
-    "i7k7J3IPuZ6B7RgZMxmjGob51cN3H9KuxS0z4rbrVkR7e0sy86pxm/DMPgt1qrZVet//yuM7"
-    "4pbVLXHLNcthRruwzwI3ftad/6SNDMUemIzJqIO0q3JirfuF5XdnnJO2tkQyyT09A7Fx877s"
-    "D0vZ5TkdqaZSq1moslQBml6GXwlrH21FiZXfnPC37zqQNPLQcCf73FnHpG6fWgDz9JlPfwkm"
-    "63hcd/OrcDyKFArc3HFn2Qf7tUvqxRv8BtJy6gHHLCntmjK1iR2y7bggeSJWXXNr3PbKO+LR"
-    "b/87rkPsT9gScQhyD05jn3p6Sy4wHMxtC9q4SW+N17UV1NZKydMQH+1H0+hv2g4qySpsIBIs"
-    "4qjdtA1dtYgjf3Dk+arX3Bk/9jMfiO+6/aY4gETokY3PxTvfeTd2jPNj9+4B+tXSpLe7CZVA"
-    "pf88xguy57INQleY2ief3pk2bxr+y+iOdZMM55jKZDkuqWqVybK92aeP0KdfhG7LOerIcWZo"
-    "mB2JbGpwbLAPyuTaXq2zPEnCukYV3rm4PfFgyQHjya7fnsNIqybCqM0BH2z78Nun8+Lz53Uh"
-    "w1mqMGQTwMM+ojRMZsH+7/ulV5mDpGlpzLZp3vz9J6/RmNWTyRvTjrwU2LZhR/0al/LemMDs"
-    "BdLwpcbbYKPyJ9N7p06y7RPHyT/Vvc4JXJZbzUaZa20Dtp/CYHk3XZlDylxXMw9FIlPG/pQA"
-    "gotMl4vnmsESD381aub3cpfFMZ6/LJv3+ufHyy7xytKbzmdp4Y9/filXDeGyxL7WUS7/dDmy"
-    "LwMiaXtZ2hpv8ckfnaFoe2ConEuTUSxZjzBYicsVCpjh/KkL5rvEd7KV4IU1KLFKwTNGZphM"
-    "SemJSVHjkzgruYaXjBLhrioSZoW0hEnCFtD+TRwyvCZwXXriWkAbiAUm4gi+uWqhc/qvMCAF"
-    "jsyH71kG8zQD7jUOPpdQvvhM/IKzjEJhFkxypauG5bd8rv42xk08CRBm5kseXqMrq6oM1Sqh"
-    "bvDGybRGz6SW285UJFhmlZ2oipci/XonIVIpV8Kmd6eR3p09m8xGITjF+2c5hkZm7AT2Fdr4"
-    "GJdumAWxU2rj42STK1rpCv6DqKjGwvAUKZUd2QFMI2fVCTBpDuxMcKrj7JQOcNqVaDvjCncH"
-    "x6h043V8LgbQq5Z1pDNJdzFZN7pgcHI03UJcHzhpdTFJljJfRLUxOR5hG3p706TcWdiP7dVz"
-    "z2zObd4O2Is7O9PwVslca1tL5u2OQ41h60t6eRSQk4XSPGmmmkhHk60cpTMZjkgbnFQ3gpfS"
-    "PcvwIvZF2NBjxzI5HnjucHz+axuRwA3Gr/7QG+L//ZX3xjW33BVT8e59+uQQkgRWgv1Px989"
-    "sDf29bOKHzgfe1Avet3zGz+L5GBSfOurn48vfXNnMiKLsBVS2rINZlKGCBJC8zI5OrdNBF9x"
-    "PA03o6pPz+8yVfynTjQqxkgbmy19Wg2ht3OnIElwhwCTi4RLCaR1OIhtywkYANOrRlQyMgup"
-    "UzfOQM+h0rrjzhvilte8PjZjiP3AYzvjOs5cnIhkqQ3pg9wUWszMTwexZEu9M8jwIL4+a88l"
-    "47OwrYn6w55I1R1n3l1zFYeBY/N3iPPxnHxboLNn/4l7F4xxBxKnX/3l98Qb3/KGWL12dVw4"
-    "fjSe2tlFfRe7v6JfcWJQhhRIcqAl6jXhOMG7k9D6k1E6cgRJJ9LRA0h6ZuMNfunCtlT32r9b"
-    "sfOTAUujbeo+7U9Awv7e14dKESNuVWFKXmyHqgzrsSs3ftBmUn0OHovw9P6FL34lxr3YH+uu"
-    "vzVmzWmDxsUW5hSOSIc4W/EC6lLVhfYPfdONg2lRNadPuec3fgtm9pZ45WvfEs8+dX9s24Gv"
-    "rKkano+NB5/ZicSMjRBWYkVnKS7DRdbJdFFlsXre9FjBMUIUIHpQxcp4MVplnNNElPn1d9t1"
-    "q6Kzsz2eePyRWNTRgYH+lPjGA9+mjx6j3Xnmp4sYvLjDPE1Eraoa3fbi2GeYuy7tL4Z19/TF"
-    "c/u6OYUB6eNUXFTQt+0voJALK4aD3FWptCTHE+jbiu3cNlS2Kxe2JP0PsGCZhKQ7mStoPcT4"
-    "Y92qKszxjhI4R9gvpP8wzoo9hquPo3OmU6fTOYydw0AzPr2EpqBjZXyR0Z48KH0KNqeAyzFO"
-    "+uXgWR746xci1n9thJdco98vCb7spUiICCS9OBYGpCHSCFi/j4b7WH4NgfXnKwQZWfhZ8xVq"
-    "vmcxJFpeZc7KOdcP4lNlarpSDyyqGhiCen5MeldwUqokDrxn/TMOO777K9Kv0rauhKZoXB4+"
-    "gqbfKnyM53X5u2E5710GxHLU/0qhjfky12VpL4nlt/p743NjpJqcDWE1noVO4iity4JnlC4l"
-    "QTJYEt+rTlg+Xfq3/iYwByENqi+tiFKBxtM400nKeMYRer7TIfLdTk9FGdcBQimLu29qmFlW"
-    "iWicKl4yHoaNUGS05MKUuZJByDxzICBmxi/lknFyVS6T4GVjsjN7mYeXcbTpEFZh+Iru2kom"
-    "i5HKGKmLQrZMW/8ZabwEJIaZsP46ek/a8Zr0Ev+qgkrxCu7GtuKS6aNMQvTdtP5T/eG7uGbZ"
-    "KJP0yU5hYi7pMaomPJnMkyv7CQzsU5VgMfiUuiAuTNoZdkC5kj/FbjXpY9wcKJNGbIhmwnRH"
-    "kAOfuCqJsuN5xp5EUh0os2J0ffTIZOmbx06h4bAd2ryVFKgqcVUrM+XKc9nCuQygbZmvq2LT"
-    "KtlwJTuIO4IOJg532nV391FndHIkAZN1kMjk9PDm/TGdFesQO5+E6U4uy+XBtIMc4bN7976U"
-    "jLjy0j9PtiNw8pK+WfdJK9soYdlOZESLu4dejI6drHXT0NXdgy3ZXO74PqJNuRtKJmsJBx8f"
-    "QVXz5ldfjYHzFryr3xNDfQdi0XI8vqMOuub6GznXcHzMHXcGCcKYeMcbb4w/+f2fh6Zn4/d+"
-    "6b/H++99LlZyGK7OQZ1423H30MzB14f78CnGJAs/U9oUaGu4LPZnkFjYMtJ5KAGqU87AXA2h"
-    "ghtmJj2j7RVVgyYwpunLC+5HO61hd0Ri26U0TKmGk7DSL/M5CmO2VmZoptvw2aqPKvkLn38w"
-    "dnUN440ddxxpbM8kRlonWlV1HmkDyIILuInTTAyyV7GJYdXyTuxppuduPj2xz4ahsfH0cIzO"
-    "bFS9Hg5uO9VlRS/2clddtTht3ZasuIo2ij8p6n8pjPfkF4/HN5/FsJl2pbRUxrKc4ciRQoTt"
-    "x/AdvwgJUymYTJZ923a3YM70WL92CZKmllT9ufM12yBt3f4ts+BuWduyg6SSL6WYGsRrQG4/"
-    "0Mu7dwunbYoSTne3ueiwHyvJW7RwQfz7174ax7r2IMm6jXMLO4HpdxgTGJ4jBw8gnRqMpWtu"
-    "JPzF6O3eh2sHju6Z3c6B4Sti4yP/FktXr4sbb3t1PPntR2MAJldpcxdG7jqTnYH63L5UdT8H"
-    "kJRc5QYG6nFRG8bk0JpY9IVTMQS+VLvRcrfu1Us7OEgb9xbZN9gAgAH61756b/zt3382mueM"
-    "RUK0BnzGsUDBlirrUZuzk9mXZVztJ5b/NHT22XF989a90UebvXXNAvy/taX0SYZVo/3iBLaM"
-    "Z9qAah+1Zu2KWHf1VTBXTWxGYZPHpGnACtK54CiSV53sOjcowaJKoHUZy+ajRlRN20sfNo9T"
-    "Z07AoOEklrYqq+2Y4likKYQOYM+cwY6McxwnT0INzC5Dy/TiizKIsuVe9iJ/9AFoUp7IMP/z"
-    "h8u6fenlt0vDfXPsyDlu5GsCGo1awzJindwwfvVrY15lpDcvL+LY7xNG5gaahek1bCR9fi94"
-    "pDYG4tqHEkL9rUqXTlYpt5f1mcIDnpmRMswncbNglktmP5mIBgaripg3cWj81d/qEtRI+l7T"
-    "tf5mu778sj9mufmbdCWO8RpKO/L98rT5/lKQWZxGHM3WX41HYxKr6fIr4/Ih+0IWCNqIJ+OI"
-    "O/TH2FgJNym7CCsbLKEk5IK6j42//CxkLlVSNm4ndSf4xK5EyGcJ4Rld9cDju8bIDqLGVVyZ"
-    "0StY7nJT3FtLoKzkVFdwz3ikMeuSe4VDNobyLHyZMxksYdT4WBI7jYXPI2OQzPjdVCU+Ax9p"
-    "HSi1p3CiqxlDiaeqKBkxvsnMeAlP+IWzNgegJRqlJgpGRJTeOUmXZ9PWl/h65Z3n+l5/9y4c"
-    "w0slloA6nd9HGC3iiHPNXJquZhgBkN/OwryeYJDUv4xnB6qy8BDoqQw4bg+X4bGxm5craetK"
-    "qYLqwrRjgX6qY7xkelSbOLGZRgYr8+RPYViLFMUJyMswDYadsKSzO7TsoIaXDnYRe6wepDR6"
-    "dG5JyZrw0zWEzAvPMnXPY6R849rFSBQ49gMVwAlVCDITtBvhKKVZBIMzH6/Q7Qvbk6l0gF3Q"
-    "sYDJEJuTvj4myxNI5jAMRlSuBCvr2HrmZxuxbNqVSDcHkhxwwVmm0fqs3TwMD52NTS/sZ3An"
-    "EAbD2jwLd9E7cC7a8cT+yQc3x5cx/n74udPx6S8/Eytn9eEv6VYOAZ4TV99wa7zpne+O7/uh"
-    "H4tVVy2Lb375i/Hm9/z/sXH3KY7VmZYSKXIHJycUDMeh10wmxN1Hh3KiBDXO6nNyh840RVUw"
-    "aADTgNmlDKSGecLuiLt93sm1Zbq7DIvhM6REUoWHftJNh6HKyZp4Onk9RZ36e811nThxbYIZ"
-    "mROPb9wVf/Xph5K5WgAcdzI68cnYyWC581AGS3wL04dXedsdNOlABekOUfFQ6unhzNa97Vj7"
-    "mOLsE5spaKj6ml6MVHMSTjznx7r11zOGwPyQ+AzSCNuTzmXbZ+Id/qkdqcYUrtVF9ScTrrTm"
-    "wDHaLPZ/2uhpQ2X7tS71d+WYYl3nmGAZgK+vJxmt2u5Qg3SPzzGemy/8qQpU2urkJqzSbsuz"
-    "fa9MOowEtCvVuvNb2+KJJ5+JQ7ufievYENC+aC1lpk6G+zEKPxbdhw7F8LGj5DuZnYRHObOw"
-    "jXY/LZ769jfjg3/6R7gtmB6vePWPRDO2UL/3Vx9Flb4cH1390YPbjDk4fx2GeT4DE2HdKTmc"
-    "j7NSPe7r9uSkkmf6+Lx51t8sFhPHsi0sapka65Aa6oriKO49xk/ULYiOHHAHMWcp7ibaGQtw"
-    "qcCCywPHlTbb/l7Evs22lmMMjUda5JE5yeROSPcRB/EtduNaNrIs6cgFjUyVUl6dkipFPIf4"
-    "1EXbItTsK1evAj71dPBw+rybBA7H8KPlbt9ePM2fJp70lP4u4lxcafupu5DaCa3uM0bGMvDT"
-    "Rkz/ezYE25a2oNLmPJ3hSNc2GO7p4M98RFuYPsNDou3Pzg3UGW2vXnQ77+RgRtulaeU1Or5X"
-    "AdXNvkaz4/KpSkaiOp2BPvuNrMqDd0JBsUpbwoWUny6JV75ZHv/Vba7cBVMyy7SU1XD/6XzY"
-    "b372yvRGtbMYw++U07vjoKcBuOiV3s51CQe6JIYJSyi88exPn3724dxIxSI3w2u4JeoV/woq"
-    "f3xNelRpTO9V3/OlhBCDuHXZ86WiQw3M7yV5Q7I6gDvxLP9Lr5oOJY4ZGatwGw2xq6RCbPxl"
-    "jBqud/5nG+K5VqnWdMHR6BvuGUldwc6PINd4r+GJtExKrhRgskzrDqzkfC04uaVzSyZnJ32Z"
-    "qVqKYiUW7reoJ6h1JjQmUCZJpV4yJMYRaE5u4uBbwq2IAiJ1o8mvRPC9SHHckurAA6kIk9Ew"
-    "v/xGHjJZ4/imFMMwdymZNlfD4KFYuaxQzasQY6SjU2bLlo2LwV6cKvqXiH41T+7i5bMRCpNl"
-    "uF/qhl/iCbs0/FLGEieTlfQjkH1oYLZ4M63lswHK/DkAWskl3wLfZ+sibbBgsDynz8HJFZ6c"
-    "to4NZbBUFxpXmNarDJlqQumRcBngvBw4VYs4WeogVHxlsITnQOg1iLSKaAmzqAR4AbZtQYNh"
-    "O7EDtv8cOJ1UNz23I8/ba9ZJIWVy9eqALGNWaITaiNX4KiRYSxjEBzkbcPAY29ipS8/N01u5"
-    "jMES1FAyjpZnSediJuqFtIfzqIiO5O4sJ1LtZWyT+kNywJWpkoFT5edqSRsQy2I9W5NO0Dpd"
-    "VSLid8vgAD6NCWEAesLL5E4YSTQeA+5TwFrM8SMLmrAX4fy9gwOspPcfj7e8424VF0wkGDWN"
-    "nRRPP3Z//ObP/Vj84d8/Hx1Mmp3soDvD8Sd0JSY+mToMq5HaHe0fZqJsjmbsgtxxKf1VN1oX"
-    "Xh7GTC+EJVMyBaPEBG9VKJWahbRpNj6nhKmfLTZjxSDxdaOxGv9NU5H+TcPWzYFlDmrQq/FH"
-    "dscNK9IW6gi+jO57dDsT2alYPJdDf4lzBB2Q6kQZKxmbidTVSZ6TUqAjDQxbOAenlbOBD+yL"
-    "7Ba0bzvJ2fZ6Ubt5LM0YbJhOVe1LZrmVo1V0NzANexqZnLNIHlqxTbIfKlV1jGmdv5DjgY7H"
-    "fQ88kQcVW86cgLnb3cx/OgzfIRjgMYw/5qna0X7hGARq2c5t69a3jILMfB8HlNvvZd4FZPvO"
-    "NkuadFdAQhcEpnNc8mdbkAEoaiHqDYmIkqrinPU8frwWxKZnNsahPZtxKnpTzOtYSt1PyzIM"
-    "9vfF1mefiD07t6EmPIO0czfSznvj1/7kU+zanBCve8NbYVTmxuH922Prxm/SN1qQ5CLlRTo7"
-    "H/uvfg/xpudYx3Oh1/7j+HtDXb0INfkUNjf0wWS2ytwuwkM9dJbRgARIIydRbr38c5QVUsSJ"
-    "2MgN0I88dFlVvAbheVFnHr+jVM/dbC64HCta21qzjiy37lauv+mGdDHRhAuHlhb80hGuxNe+"
-    "U2ypWIwhSZKuyzkoek4zO2xhEmXSTp1DzX++OFfdsWN70m/ceE4qYIfhMIeb5wKNyre9a2do"
-    "a1c96vjhRhf7ZT/SvVYYxjnsVC7G7I5R9A3iuVB8xc1r4qd+5Xdi7dU3xMo112Zb2rV1B0b8"
-    "zcCrjfbl0K1Xx+xSfPv96Nzn55K/OJQfccGtfgdUPudkb4O94o8mRXrbUMa3MRrv5a6RT+JS"
-    "Ryp4JQxo7ZVMoXd+BcuSx4gAgHLJbNr4S5lq+ylGDMKsY5mCXLDTpl1EOG7X7bzMw7Z501m3"
-    "+kY0TbGnMz6JEgFH8xGiiJCfuDUQtgQaJrb5sQ4ybZUgbxV9R4MK/pm2SpPpS578NfeX/C7N"
-    "uyQWT+OKnHcXjOW15FmAlDBpN9oWqmcSKusUXevC9KVeLVOhd9KP76OGKJnFy//JsvC5lpwU"
-    "4AxcMFkvUkEC9My0stIpDh0dFB2AkP/kAGcaByG6Slak5+WpHsxJVEQZ5PzJSzoApo4XDEXa"
-    "0thosiAW0LC86ruFZZB1lsGhYZ60DqXMQyZDiZu42Ji8zKcMuuJtWgdMB1GkWhmnYqKIp+1D"
-    "2brO4Fs1VBtaVpCoZc9KIFk3mYF/RC2/lRDxq6+R54wjCqY3enWvyioDVieTeayLLf52/Jpm"
-    "3q0b2Z4LSStzKpNAwkggZRBx0FIa4+Cup3U7Th65wSo7kQAn69PBSmYUsElbJxUHIutmHDBq"
-    "H0VOKh7aqt2PUqo+GAPLrjsGV6PjGTjFT8NV7VqErb8pV8naUpxEEtRMmIOn9aRkQeYnV7DA"
-    "9JzExTgv7UI1+Ipb1qMqbI+tO/YyEY7DzojdVOTvlZ0fOMc5CHaYiUPplyrEVDOoKoMG2W6g"
-    "rbZoM7Db0Dasr9ft86iJmBwk/0T8DNkexEGCX2BXku4C0vEnOI+DkTr/Iq4tyHeYODKMSnSy"
-    "M1LwE+BvmbKNgNddb74pZi9YHeNgeHZiZ/NPH/6z+I2PPBWwE/GWWzqZeJG2MAkppTjcdSCZ"
-    "uBNIIyYwyU1mwnxhB0eqINnppNzieagLhtFJ07oGX43SbUYaPmMCk57WHX8971AbqZPQ7zSH"
-    "7J6iLbYh6ehcMCXOoY7Z3FsGaZLGG29alX6Kzpw9ES9s3Rub9uGMk4lKOpyCxl1ITd50y6p4"
-    "x/e/KR5/5InYsm0fqt2THOR8NFWLMjcaW6uSWot7jnVXL2eSZSJFkqGndN0IuENT7+xKR48P"
-    "c4wKfpxa5ramw8wTtAMPNJ6F3zQZ5N6enti86dFYsnxltC9ZE0tWrI+N3/m3+K3f+csctDR2"
-    "V1JnwS17XuDgTksN7zcfOQ6NtscN161Ecjgl1XzGse3Zzy8gxdMtiH6eBjCkU1Ll+GBvs8yq"
-    "Lh13ksGuJLy2R/uAzK19kewYK8qgLEwPDrcNuGAbwrv+sqVXIcnaGR/4lbfHb/3xP8eqa++O"
-    "vdsfi2c2bYpPf+4hmCDwQo25rbvUw3ve3BlvePM7Y27L8jjWt582jK+uyRhvU0AlPPNgoOZC"
-    "222HqBukbEpfDuEf7cN/9D9w/9GFE96HkYrhZ6z/MGOWUk3OM1SlpndzcGJ0RC3bF6tXL2Jc"
-    "hOFO1T0qd845XDK1PZkay0cRsuwa8nsmoWPpgo552GxOib6jvZStL52JumFlwcIllPtC7Nt/"
-    "CBw5zgh1v2dlJhPNOG6fnT7d+eBi7N+zD/qNgeFZG01nmjm/EVsrHIseZAH0qttvAScJylmF"
-    "9N397DKWaSUZ9QXNQcrx5TjqWpldJehXr1qASnY+/XJSnGeRJb5qIVy0KXlbuGxJLF5+Tezf"
-    "voVNB3Ni6apmJNm9jAc9wMZuawZH76BVVroY9LVSoSOtCWT+gysr3yTGr/vRy6SlEEb3ytZy"
-    "SbTGlwpoxiwprItsALzWbVNgMkeNl3TKwcsbaVLgYUTGpjH0h1yMV3NRvfC1nfvz0vY051me"
-    "DVOFWuJZNjMEBr9cUJB3qiopTUk/CkdY9SXq+b1kUYJps4b5r74KDLNopEX1dTQaAdWL5fOt"
-    "wr2OUlLnlyqxEUuoAcYbfasC6jA+lmm8QEvYDWmJlleBXsUhxCj2+TxvmfciUClxRe8/zWAV"
-    "RAtg0ZT4KV5lUvQsvAu8WwIZJpmsIk4vXPJF3s14VMqVmBBXo+rqLDwGNycPpQncsrPn8T1U"
-    "ZjIdJqHzW3CiggJ/fLaAVjjvhR4wHQ5+fPPfi0yA5uMAWFY3ZTJOpomMnNT9ueMiGSzCxvjL"
-    "LMpAqjrRiWwcthDjs9wQVCRtvPyr8SNJ0iDv1R8bTWIitX2qSchzfY189yPxM80IY1a6cN2Y"
-    "6jTepVfinxNGxTC6kpY+0ts4gHTys86SYZIxRIGjKkz1mpIqmSj9+sj8SgNRq+kqbR24EgKB"
-    "vnul5ADgrvaT4YIW+r6yWvzWi/d2JySZLG2iQCdXt3pV72FAd8u7UiHzPs7A6orXCY9aAg8H"
-    "yoKLkgVXCBqyDmKcrjphHkfOnD1H6UBrCtKOk6ggpoKbqp2LSKz27ulBZTABA+nX4U7gOVxA"
-    "9MQCnI6qJlWikUdy0M5sw0q6JlKvPd29SRMHW+u0rGoctMuE7Mpc2qhildFyopvPqn1wf1+W"
-    "VzcC+pDCfjyGYEi0SSo1F/Gau2+PY/29cf/nPhH/3wf+Mp7omRJve9XNtHGZtimpNlWyMAdf"
-    "5zGmA7UR0ps5F2PTFnbqsUPO6zBSmcUnxsS1V3fQ7ubEo9u7Yyb1Mh0d4GnytX3I4GjErvTr"
-    "NBIrj78RJ3eTyQ5cM38mUqWLcXD/cLz9rdfFOzmOZSzn5D34jadiCxsN5lGeR7btz/z0aaVE"
-    "guQxlfRe0uAEk3K6QiA/1UBzcFJps+1Bdei1AlWUHtJlpk9i3N+DS4OzOCjtWNCMdGoqfVPG"
-    "D3Xf8tUZv/fokdjBmXN9/YfiunWrofx47JJ62cXWnn6VLlzYGs3zl8TXv/SJ+N17/ih6OSZy"
-    "HgZl+gi7/LLN2tZxlYY93hhoB31xgLp21SJozDE0ML7aedke9cU0CGO1eNH8lGTJCM7KUwxG"
-    "F2BlI0RRU5uX6YqkwzHIycZeRR+TTvwcD09gWO3u3IswEidwP9C5aHFsfe5g/OUf/lbc+upX"
-    "xYc/9NH48sN7YgVOVY8ePRMHcZP/xhs4Yoljom597atjbusKmMEzsXPb4/Glf/kkmwJ0W1Ds"
-    "F5dgn+ghztPoKzb+GUik+smviYOXZ8ycjcH6M3lszeIFs1iEtCB9xIUG9OjAnu4Y9dZHu9q5"
-    "7whtHnXglOn5fYKNxvU440b2fTsVpcpx1k88t7Q0pzrzwL4DqBz74jAq/YvnlHBrcgANO5fQ"
-    "lpGk7d2TiyZV8xfY2asT40Uwy8Pg8dCDjyKlnB2rr1pDH4bhZkemA9VRzllctnRhXH/zhti1"
-    "fW86SvW4n5VL5kM/NoNgCO/mDduYfyZRB+5U9FgfnZheRJ3pzkZ9iXl+oW3L1n4SKfif/+nf"
-    "xo4tz8V7fu4emETORsQlSvfhI3HgwG42USyMzuX6w2ODA4uPc5Qn1TtZo4UGlv7lrhxiGz6a"
-    "4uWuenzP2cJGyv8ynkvgK6VsDMtKGImX9QKAWnIl7BqE35JOxHYO4Q/fGOcyvnSp4DK3WN+p"
-    "2rYtEeziQCbL55pJEEat+qrLlowV4Qm/FIS2niWswuqYCaqE1UUQL350z3wqOPIo0jXi+e3/"
-    "8sfo+a9KW0dPxoCPmYuB5jaaef1kn5A0jd98y6t84NEI5OI833AJPcPzgT/CIkQaaxOqgMcF"
-    "+FierQ/8YKEivOwqxLsssHr1W41DGqWDQGZA4VQdqtpx4lcN48Qr56wESSZHsW9KCQBQVIMl"
-    "XNo6+RcGC2YMiE68wnBwMU8JalFKpXDnzTAbmvFsFMkgcZfpKGpLVrQwcOJpOvHR3sj80mZJ"
-    "PE2fk2ixKzMXyUUC7mWSlFAX8EQuToq3lUwIo+CSWBG3ENTUiSo3sUwwNbYJvOSQ8Rr/ANB8"
-    "vCxX/ZzAQMVPo2HlOctLGVJqKBPo7GUjk16EOy+mao6JRUN3xeZKiGSu7EyKh/1Je+ns6evW"
-    "k6rTUyztlCTJJCmZnMBAqbGw0irDZKxkQpRiqWJQAma4RtOW2fsJ1Bb6GioTE22BcqWncZgg"
-    "cZbOTrpKXfpR+8lknHHHWzLFhcFShSfDJaOlTxyPkpEZO3DwKMetsEsK+L24g7gZA+ZFrLIP"
-    "HuqKu193W7znZ34u7viud3CMybXx/FMPp7GyzJXbzc+AVxNnorUjEZrN9m5pYFlPo85QeOkg"
-    "IsFlpBxgTDOIekaXFu66lCTuLNNn0glUN0eZ7E+BoyWaBXPT3uzWf7b1s1vQq2vb5vjCpz4S"
-    "v/vRb8fhExfjB+++JSZMc4t76SPnMLp1YaJrjKk4oVyAHdmnH9gYy5vGxm//8lvjl9773fG6"
-    "m5fEx/71SXxKHY31qxfgm2sSPqzw24SEbjpSqTmc+zeDd1uddaJbBt0znKINzKZuNnTO4oxB"
-    "veiPiR//ie+Pq65eFWuvvQ6/TXfG6eM98ZkHnolzp47HOCY9dy3aEj2PUaN3j92ZCE2O47Li"
-    "H+57LLbvOAg9htK7vOWzvpe2zYhrVuDKYiFqPf49/PgL8STnEnbiQ2sJk6WX7aOdsq1YuTTW"
-    "XHMV7fBsfPAT98U1S1vxt7QQ6Qc7wmBOqOo0UJ6OKtHdiz/+S38Wn/yXr8ehvtOxZPZkJk/6"
-    "M/Bk/sw7L55tw5bfcw1dVU7h/bASUibeFo6V0R5I6QclS2ZcJl+c9Jrewnl4qR5OJho7RPqB"
-    "7gT2H+jJXW7CVjrrWOGEYr65ciUv+0GOUbQV/cH5zY0PTvZKypqaZiPB2xcf+PPPxfYDg7EI"
-    "NxxKIBctmB133bgkbr99PfS4DilLcxw+dCCeeOQbsQl3Cdt39OWRUJMw0NbQfO5cVZ4YqJPP"
-    "LhhXCBizaP/3Ig0bc7Ir1q9fw2aO/fHEnoHoQwLYwSYJXU4cwaP9C9v3cR7msXjF9WuRVM6k"
-    "vWnbpsrZ3ZG6bJmWtLGvlrKUMvrNMm/dsoM+x6HRqMU9y/H2O2+jn4znwOp90XW4Kxm/WbOa"
-    "sDErZy86jSpF0t2KjHk9DquK9JD3IdqPC+jxOCZeu3ZZtM3vgBGjjHh71+xAL/zuYi5uHlzo"
-    "ULP8WvA8v2L5ovQefx7GyDFE+h9h48nuPfvpD9iVAVdJ+Xe29MYDj+7CPoxNFTAQH/vQn8c/"
-    "fOpfkQxPSMnZWQzkp6Bi1ZXDGKTWXjmmZ+uyBwDfNpZfGv/kyF4CMkqJZOiVYgukHrudD52z"
-    "ynsdv/Eu2MZ3YOd//nClBIkGZtuznWXcvBMto/jHby6G6ce8JrbQxHpUKmhC27LmFCmlMgNT"
-    "ZZrSxgsdSlrRKTCEW+aXEj//8oe2Mhrg08hVoTbyng8GVjDL3dAMyM/lzRwNLriVDxlCWBW3"
-    "FLhgn9Ea45qi0N1ojb8CK3Pk0bHOCCXUeslH7/lTWFMJbKow25u/IvDhG+OBcdzV6mJLRr2M"
-    "E8yzV2KwMisKURWnvJb8s3BZPv44Icux1ZXhZO4A5sov1U5Zga4ONFQuZ1c5mYmMhu3aQckI"
-    "5GqQgdyJtAyASlucfGSylJRRqZQ6G5UNFFySDITZYLMwWeBaolOYviw0UhoJlYwE8GQszNOJ"
-    "PhlBYBejymLHlKexsxpTx5w/V0dkaFktZ+aXBKRD1gSq7zWNLrmXj6VDlVoEnSxBXakZvQSW"
-    "irNCwbFUMGWFLkVaRZgp+eZ7hhO3ZrAMT6SIVMeXnmkoXqlJlQwBLhlQGU6NfJ0I7IymSVjE"
-    "1W5LpkN1IoVOZkKVgHZM0ttSyfycgJHw2JOyxZ7GCoy0sYJWNsITSKwmk4eDrKoTJWUmLjsL"
-    "RXdM7uySOT/CpDAO3z8yJ+JRpGQyiaoE3PnoCusC28L7WY0PIaXBiSO7HZuBveGaFRnvNz7w"
-    "G3H7XW9CLTQD25OTuYtrLqqYb37jIdJKvbHRubQzt/6rPt6/7yCqEn0VaVuGNRPwrW/rWomH"
-    "O59YHkfzXBgx8lfCWlQXtCkmN+k3B+/S06BlpzZgDAirlnfEa159ffzQ214Ty/A+/YmvPY/D"
-    "zLPxppuWxh/8zx9hFb0t9h44hudytuDTtD0iR+PxORiWH2O1//f3fSf+6UM/G7/waz+LywRo"
-    "eu5kXHfbXfEj73ptHN7+aHzxOwdjLZ7VZQCHSZuqUG3hYJxVmw3imsE6lpVogem6evEcbK2w"
-    "C2JCf/0b7kpV3G+//+Pxx3//tfj6Jz4Tu5k4B/SFBUMlzfWdBI+WPqd8tsJa8apvvbfgJuEi"
-    "zLMqGuOqGl3QOiNWcB6hxy0No7L68iPPxzIM5F9xzTIkfTOz79uWdTJ78y03sAmhI7bDdP7G"
-    "n/xDfPA3/1u84wd/IG595etigHrtOrIHRshdhuPx1N8bX/3G02xguIhkDG/t0KqLI3z05yR+"
-    "9VXqC/QJIEqOE76p1tdPVh/qzRMwh3NRT7oTzj5g/bqw0P2C/agZ2g/i/FInmLZV25wqtFVM"
-    "5qqRa9VZUQ06oJKDGfKz72iXp32nbZ+cCaMPGge2ewJHRU3DgHz1InbZsQu1l7Mup004G0s7"
-    "xsUdr7wp1t90e8zE0H33jl1x/9e+RlvoBzAHeSPanT1Hj+RId9mgYv+zLzrJ7oDRnikjQrtZ"
-    "zs7Tb2/uxn5uebz3p9+HLV0rqjB3ziH5RNX275v2x3IO4n7FjVelE1c3bbgT1PH3JPZOLho1"
-    "FC8TsmNNKZjjgfRatGQhNDoPLA7ORv3uTsG5La2xfetuGCGYORim3p6jsWRJZ0qXB1gsuVCj"
-    "haS0cwbnns7EnYoOSe27E8B7wfw2doYuRoq0GDXjQvKWycHxLdJP8dqxcz/HAaFGpqJVQboz"
-    "1jGgI6VXreCI/zEYbQ/13rX7QDwDLvY9zQGG8Wbf3TsUzajVV2Do/2efeCA+cu/no2nSeaR5"
-    "rdCFcwuxKdv8wnPU83Daoc6cNZf2YP/WE71tyJbkODDyxweDuJwbfYZOVZAUE/+RAJ5GL9uL"
-    "TEiZP4xnm6vTjsZ76VPOGwV4phch01e5k4CPfs+n6qGKYwY88mO8hsHKnZO2Hxqnbb8weqUj"
-    "1XNowjaR8MSZ9ly0VcIqaXkYKXqJWfKp8cjE/vFj3VEa7uWxRrrQRoClVCV1gVuSZ2YGZ1H5"
-    "U31M2pToievonFlgFtqZiB/0LvG9U2bCfPfZn22+vvNC9DK/XglmMldVeuMKx76Smi7mMXmW"
-    "WmCUZxGWjMEbwhOXyDBN3JOQ3vxB6LwSsJ+K6sTO4CpQFVtKJUinykWJh4OOl53NwT8lSAxe"
-    "Sq9q1aCVZ8OuG4HMDmdwJAGc0ISThKXA2UiABymIb3XQUKuC5rv4U9AkEPfzGrFDOAs7kZWf"
-    "+diQitFrwVuGy5/tPZlFYCtJcaC0yDlcUrYXEfnXOyjGmkY8q4aYhaz+XNJAC+JJ04p6+eyf"
-    "/CexK3pK7ryIaHAZ5HwulSdcLwd4KzNBc7e8Vqw0NrweGEpk4sqoMFko7XJXpKqLlO5BB9UD"
-    "2pOMdDbAWp8atao+dCKSodAGQgmVdiCuaB2g3So9FclJE5ITpShKc7SFSImTdQUClkO/SgOs"
-    "auFF+F4kf6aXMdHbe8ImvBknnk5k+tRxaNOm6zwiCsujx3hdQ0gzVYz9TIT7BjEep9JuXDYf"
-    "O5tVqQLSMeSYc8Oxcu1VcfTwrli0EunVxq/Hv33+M0zcfeA+JW68+cZoQmp1YN8+VGV7WMkO"
-    "c5SOh0WfYdAtA+wJDqbWZYW7DpuYeLQ9cdL0GBvvFu48DLftQyeUlmFZZ0eqm6bPnJQSFg31"
-    "tePxUOydm7cy0Y+LjXv74//5hf8ed772dfHC4w/lYbYvYsA9cZy7OSfH3/7bQ7GBCeTej/1R"
-    "rLvx+vjcP3wkfuGn/jY++9nH4jf/+p/jB7/n5njXj7yXtBvja0/t5KgRfDQxURzkyJS9HIDs"
-    "cTqnkUxMom3afmnG2IgFR4xMxDXCuLjzrjvTKP+nfvczTH1j0hh9G36wDkJLNI3JLNkOecxL"
-    "CZFSuSn0m26ke+5S81ieYerGTQUzqVTb6RtfeyNp8E7/4FOohvviWhjMhdjG2M5kWvUBNYkj"
-    "e9rwcH8ahvjBBx+JD3/6gfjKJ/8g3vwD70OCdIj+yfb9ddfF4X1b2fnVR1uZgPPKHXmUSxv1"
-    "0gtjddrJFnzs0/rxyqsaB3JwBt8cPrhbN5bFy0PKj8JknUJqoksI/TQ5SDpu2Y5tu7Z1Fw9O"
-    "2AfwPO+uww6YEvudqjYldrY/mVrDTGuejmm20Ry0yVSpn4yd/Uw8XYo4dbipQpcOHiV1EObn"
-    "9a9YFj//6z8fG255JX1hZjz5yHfiiSceB5bex6cwdmHEDaOigbh99CSMvrZpqsFlqGfQd1fj"
-    "qPc0jJce0O/YsDoeferb8ZrXvDLe9d5fj8GeXfHBj381mqjY63Dcu3pVZ6rsZIrF/xxMq+O1"
-    "fV3JnvZxvrvQKTZm2EOSj7aK9tv2BQvT4e7GTTvjgY17adM70kmrG1OU7Mpwb9+2g76Cu5Ll"
-    "naRjPHLsgK5uZtCOy3jS5DR2Z9PZHastnpttps2YHZ4fun3btujq0iHruZQyeYj0UeB4nqJt"
-    "Uk/8CztQa49BSggDrnrxsY3PokbEGTBlOMXiwjFQptnKdz47xSKpY86UuG7lghy7erHBamOX"
-    "Z2trBy4ihpAYHoIx5uBwxrA5MLnjlPDQNqxb25Dz0miPsDVloGsRs+Aqf4ugRSyvfElzf145"
-    "qTuOXHYpmSx5m4s4CNs0/C4D7diakz/lLRcBRgPpzIbnkdQZYAJjGo+P2VYzINMlPJmKApho"
-    "5ZvzZY279xFeocrVm6j5K/MS6QqwvEtHv2YQeRf4pT4NTFpYhpE0PmsLXXBxHJa3sF3Kl5g+"
-    "53j6HwEjv4KXOF/6c5NTge28yehhPsYibcmjLnMFN3GqygAsy5R5VuElHyFQLsIc/4Sb8UCn"
-    "XJSPz262SAbLwCRDVgQvwK+JWhJc+a8SJQtuJ9WmSalVDgLaKsGEWDleOcmDqJIt4aoytJgy"
-    "T6oMFVXWv0wjEWjBTvzJEJFHntGW0MDU/9nwMyBh5pPpgCzxskJ4l5sUdjJSNYMFQWS+xKXg"
-    "qR0JAy6MSK5GGTSFn4QFloOSTcK448HZu53X9C+5CgoZXGhaaGBllktYRqrf6oc6jMaYlWoZ"
-    "rcOGcJ7Lq/cCJ8sqjjQkwwpONuuSi+pA87YBFBVqki/pKm1lOuu6opjUY1GVOrCmrRLpbUTS"
-    "Q6bIX+3HSpuVGTgM1JbK7+bqBGd+aZNC0VIyBtxhBr3pSLpUMQo3fWLRyfW35eTmIO5Zf6ex"
-    "W9m0n4kFtwIpIZE5p215+PEg6sNBVt7Heb6qHTXF+hUMuG3pW0f7MR0i/tHH7ot1S2alzdPD"
-    "X/9SvPsHfxWJyrZ4Yc/ReMvdd8SylXglZ9Dt6epm4hxiW/rUWLZiSXSymta2yzannyxxckt7"
-    "Yb5LR5K2tnl/0nV8SjopD21p/4EjudPLdNofDeCp+t4vPRrjzxwn3gQmS/wp0b//5uNfiB9+"
-    "+2tjw43Xxef/4eMxb+F6DrA+Ec9v/U78xa//ePz0b/56dCxdF+9/37vjtz78cFy/isN8m87F"
-    "9DFz4w/v/dd499teF3e/dkP89Se+gnryXMyGwW1B1TXMxgKN3FXl2WJKXbDLk8n5+a6TOJbs"
-    "jJtvWh9bnt8SDz19IFbOZ1cfBsOzYV4mkEA7LqKWlmk7qJrl7To0AAAAQABJREFUdAaJY/S/"
-    "//La9XHVUmzfoNmdN6yJ61cvjmVI0ZbiXFND5m0cfr1oQUusWbmEiXdaYjDMNv0LLJY0ZJ8x"
-    "c0ZKCv4UleC73nJtfPZLX4j5i65iQ0I/u1uPxsE9z+PRfH50rlgd+/bsxgj84TjGRDuFBnWc"
-    "iVOan6V966Fcg2d3sU6hLYmzE3CWmXAXZR4TI5M5lW12Mpy2a73A98EgnkTFNYs2q7sQYcoI"
-    "l3GgSLP6MHr3HEMZLCW4Sly0CZJZPoxTVA24ZXJS0k56+xW3vLKfWHLezdPJzoWY/cz4Lj58"
-    "noHEs+fI4Xj9976B9n8iPvGRj8aO3Xtg9KaSuvjncvOJErVmVJuOS8Mw/bqK0Bhfyaq7ABfi"
-    "AkMbx/nYI83ltIIpMOl4/8LFxYZ48jv3xde+9QJHMN1Av5pLHy0+rAq+qJHp3/YZbdFkLJub"
-    "54IfeMMSKjVShWQ5XWwewxD9LGryBQsXxJrVSxC5DsXTbG44hT1kK/jZlzXWv++xbfgqG47F"
-    "7PR1x6Eq1nHAcNzxYOg8k5DxU0Zu//5DHGDdlZ78naBUieoHSyem5m9ZW3G70oGt2qrFbbG4"
-    "fQ6Hx+PkFqbe9C7id9LmtuGLzjbsIkf7OtWL7l5VkmWjkIEeYFel9nGDgydykdixoC0dKZ/B"
-    "l9chDOx1POzB2xfYdNEEHR2LyhxV5gAB0aTyyrquKvyS8T/DqkglasNfG0jVSEbuoyFGzBiM"
-    "oYyYvmZ+OfYDUmbO743Q7d/Z0+sP5u//gmDCMIXvGWRIfq8BCa36ZeHMqDEHExhk2Us823cy"
-    "JXkv4fX3WmWWMIxf/cqNOUiGMuFw8x/9pk7rvTAohBku/Pw1xinPidNLvhVcLoVRYGUhJAB5"
-    "CDvT1/kZ9n/5FfpJw4aftAdkfQlD4hZYCoIq3oW55CUMlunIlsGHiq6hJICEUcPMu4OFoJWq"
-    "iMB4JRMyV9z9VpKrSnDlX45VMGGqCxkI9QPjlk8nIO9O9ildIY7IFhhOZkXaZB5O2HkXeMnA"
-    "dlOe871MMDUzUZi4wgAUhq3YesmQFOkZzBQwa5FgoVv1F3j+K+CLzjpVjeCZX6r8/S4drMTq"
-    "wbe8ShQrV6rW30v5smIyKFNXyY1rQyDMxMAsFVju2cANq2DZsB1wksEiXS3BEqLpbHR+zzgM"
-    "1HYSL0FL31Rt0BCkqWJLGVPrR6a52EKxCgWO8WSeHYz16uxE5krXQdg6cTWqlNJ3omc+gBfL"
-    "dCvgCtfJzMlNGOKmZ2ysAUn3IrvnsL9hEmhHdbC4FeeSyCqOsMLUjogxM1rx9XMDfrCuxVbn"
-    "2hUd0YlPnTmzm2Cgy1E8ThYOirdtWBWf//xX43/94/3xr9gx3b5uPvBmxGR3BhJn87NbohnJ"
-    "j9KzflQ1t915C0bCs6KbgXbL89sSl6vWrWECOp04uhOuTEpZFVmuQnMmAe1WoJUG1O5+un/j"
-    "7hh0yz/0fu7gQCxpwkYLycMLB3D3zijZydb5PhjIj/zdl2Ls0BHUeafi+c09ceu1F+PPP/yh"
-    "uOO7fyQ9Xw/0bYsP/f690YZabgI0QhCABIFjeg4fixsWjokNN1wbc8cfjC89sj/Gn2dSYi6Z"
-    "DlNwEimTtFd6JeOhryslTVNQMT26rTvuvnkFzOSK+OSXH+VIFyUhHASOJOMcbWKE/Se9dVZf"
-    "zdgL6QLgfe99e1x1zVpUbdjgtJYJ2wldFweHkA56vJFnCKqGsB3o5HM6Hts1bJ44cXpKJ7sw"
-    "jn5hT1csnzcubnnV3TF/yVVID4+wlR/3FdgZDfb3MDGeTibwwaf3wmSrAjuPs1XGhtI8Ey0X"
-    "r+JoH7TtaZdnr4f/xhEnKlvUmATn7skiiZYpph0CpAcmq6+7nx18qgvxbUV4gaSfMxhWGCgZ"
-    "fSdd1ePabsmMKZHRqF+nq0qtREAmZJRWlVQLgKUPlv6q1NjFYZGYFRWWzM3TO/rjf/3vf41j"
-    "B7bG7LkwrudhbF4s/UlbVU9SkGnRy7y7WYdhuGaQt+3dcCWe4qXK3f5kv3YcPdbbgwf+vfH8"
-    "c5tixdJlxNEBp/2/SACyrJRZqZLt2l2d2iNKC22RFqMOdAzu5XgeF0Ouwh0fbcfuOu5EOrV6"
-    "zfLo2sO5oRigH0dFqPubHnxr/eR/vTs2XL8uXsBuzoXGdbTTPEsRhtBxU4ZRCeBMpHJ5lBN0"
-    "8VgnFzQ97E48B42L5/zi0d0jcHTdMYW2If10L3GePqwDU9WajlVNSNFBEfqd46BqHKfys6/Z"
-    "F2wbjvHUFDgi3aW9D+GrZN/+7thEX29G/QoI+gwqSOqkt7eLIRC7Thi0STC7Yyu7LBpXtpMc"
-    "IvnjWJnjr03Hq2oEhl/+r0S47K/x7agvubIx5qfCzBTQZUbLRCP5yjDmvwqOuOVFtHyswov7"
-    "I+Zf6jrnOMpqeROyc4Hxqp9j8uW/ZFpM4xghDH6mF1bjr8AUg4JnfR+V7jTATlwgvLH/g7z9"
-    "VlEkcSy0LVlkuoQw+udKYdaJC6n6yjqynq7wM86Vwi8PS74k+RsxKldtn+mbfbSYSTFHvqsy"
-    "cjeigLJ6rCRHJJNLdP6VbwQZWiHnN+MJMCVFTLrJLDFh15eN3IIXe6aymktpiJIgGTHi2glE"
-    "ulYXShDTFSO8skoUF6UJxsn8zZd44ua3JKL4i7aXMBgglJC5iqrT1Uyb0TJvmaWKWK426+fE"
-    "CdzGMTDUzJ9EG1VniqNMZJUhZRy9aiQKbpa/rvzEtyFuea8amgAa4ib5adgleoFRwyp3G3th"
-    "imSgfB5phAVUrh4diEoHqxos6Il3qkwps+VOladplO4BSxWhkiZVhPZHJ5VanaKKT6lXYVhL"
-    "/Wqv4gSVdZh1qSrWAhVmS5WOTNZJGDFtsTz/0DpyAtTJpBOykjGNyFvb5jLJzWHV2hxrUTfN"
-    "nsUAC14yeDIFSr00ZnXnlwN4F7vOtm7bx5bt9oSpIfB6tnBfu3xeGvQex8ZqP84Q+/E/9PCW"
-    "g+ws2gTTNiFuu+2WnKDu/+rX48GHHmdgnRxr2eXU3rGAFTvODFEfpiTTOuCfg14OfDnIOKFh"
-    "TIsaw4lI4+0WGIpnOdS4BSZyw6pFfMPhJTY3rU1T4xASLG2XFjGoT8Dtwzc2d8WuI6fjg+9/"
-    "T/y3n/mVmInaUrXSZGx1aFlUxK746889F3t7T+JL61wyVz/82jXxjh/+HnZbbYlPo2Lb0Y2B"
-    "MguhrmM4hXVCoV6z73A/BpOzZPbUuH3DitiwbmlcRMr21JOb89ieLrb070P6pX8hMkpjcVDL"
-    "npQV1vDH3TD6usJRPbuwBoojSrbpKd3xUm08f14zzC07LKmP46isnMw6kGZ5zp+LKyUL+/cj"
-    "4Vo0L/H50Kcfj70bP8vZkStjGR7N4yL+uKZxZmTr/HjwK1+M3/nQF2MpvsSEefu1S5FI4IwS"
-    "A2gvywV12C2JDY7PtCF9P1kHLahntRk7oAdz0joKaaSv/yRV1cadyvtxJCQHD/XG3FlTkPzg"
-    "vwlmwMWETl0dyzwpQKbIzQZOKMWVA2flwezYxj07U+bLsieTZUOH5vY/27UMknnlhESYvU6V"
-    "opsYdPK5A+nPVCQx6bOMXQgd2DSNZzep0uH0vA04fYbJpCjJcbEobVVtCs2+poTt/5D2JvB9"
-    "ZdWd5/W+yZZlWbIsL/Iq70u5XFV2ufYqiiVUCAECBDoQQjLJZLo7a3cyGUglM2QdkjAEQhYy"
-    "NBDohhAIS6CAKoraXLv3fZNkyZIlWbLlTbbL9ny/574n/eUqkvRnnv3Xe+++u5y7/+45557r"
-    "2OY3Lyc4lb6vcB7Oi1tfTif7B7EDt4i82T9zXZXcNPu+4r+GWepBLYixoKOjM+3ffyDqqrGR"
-    "8/7IhwrtLrrIQkwY58w3ixjBWB06axMBO6fggO3jQO6H7rspNbEbcNtL2ym/boDzaexeUaec"
-    "BXoZkCyX136vHbrgNNF/BXJdLKz6iUPdK3U1tTlncXrJPbP/0apj/FKHz7EijBWzaJArJxjq"
-    "glM2buw1OF41bJLA9AVAsOTCnUE9weOZjOYsIFG7eR7LtW5ZY9q8aQM0oKh/DHMYlKcqBL3d"
-    "mHHQDhdgfCLGcGUYFOREOUhXgA3K2/rmLe7WC7MB7/6GrxifaUNGYh0ZxLsmdnyJOCqe87v+"
-    "jbEi/kq/OTLoYGwu6fBuwYW//Bzv5dJpRHx+l5YbfwbPNN14zzkqx79MV1QU/k3TXzBSjHfE"
-    "b/i7cQzP2AXI0Y32yJ9cet4rf86x/gs352eenV+o0IwZCkwRbnlOrnR3jo95irZnHMPv9FG+"
-    "jfxlDCJuKOf/kXEVaZZxxjyXaQssQFadp6y3PKeS9qsBVtFEIMaLMFF++XVk49FnXq1ZBHYI"
-    "9XCYeAsQJEgyc1E4uBmZIEml6gAugBv92IliYo53CyIXunH5LNFaSS7B21AFkEHr1ohLYOSb"
-    "lwUn1yUKkLRVTI48EJ+FIV3xozCDc+Z7AEToD1CVAUT2k0WYOQ0LP9NLpDmx4q+NMkoinHND"
-    "lUD/xVUUZr4V34c+FJFwc7VWXsMN3XrA3f9xL5+z6K8SYOnHvHIrGn0GVhFXdKwc1jIPgBzl"
-    "YeMkDJ3UuIKDxWDkxONkYpmrf+Wg5l2A5aUukhOJE4Lb97Vzk9sAu0cJKyDRXpRiPtN3e30H"
-    "4qypTDACFHcaTUZ0qILwRbg7rjIt82qOuNF+lj9Xva3H29Pzh3o4wwzdGCYkJ569+4+kx7Yf"
-    "TYc7TsHdWowO1LyYOEzfY1g0Irlg0fwA6k/tbk+jObB4/RK2/6NzdPbM1XTrbWtTLyvn//HV"
-    "R9JP/eSDafMdmzC4WJVajx4Ld1fd0qxOR7S5sqNT707EntvoxO52csFZfT2iGswgbD/YlTau"
-    "XsRuq+nkhW3uiDr2ALwUbw2whX2qx8/Y3gCvyxZNSI98/evpd37uI+y4PJIa5sxOtXPWphXr"
-    "70lv3DI3LZ18Lm1ZNTN96MP/Kb3rZ94Pd+fl9KYPfBxwdSXNrULEBefDKcjy1fCkNT3A8+tv"
-    "aU7rsBQvd6MNG1Tt7PRSvPqDHe1p3vSJaTbcsVpsi12FBu0LOQWrbyUosd3IMVKZXEAzBzFk"
-    "Ty+iTvqTB3cfa2kDZFwInR4nzgEmvrCrxuQ5d25tAC4nRRoXAOB6OnH8YLr3vlvT//pbH0lv"
-    "etv70tqmcemPP/n91LHzG2nVmpVp8aotqeXQ9vTxP/49LJd/i9Q51mVhbVrJrkR1l3oAqscw"
-    "+6G5iWa4kXKp3GEmjWfJKyzWNBMQe6jnHMcDXU2//YE3pAe2rEk9ACWvAerHMNJiGx9LWz7H"
-    "s2cUTkNcF8CKD4KqrCvF5gxEci4wzJftSF2o4OjSN+YjmvPQaPuA5Rv6WMQZ4JvSc9Ggm/7d"
-    "/Sr3SCB+FM5J16nzIdJUaXsWnLYjvC/jfMeZnKFoO7Pte6kQ7o5suaPGq5FZj4SxHcoJFmQI"
-    "sAS69iPHJNuqu3CvqcOF0ngN/q9isHU0iwnDeeElJA5TEOPOxLhrNwBnz95D7DI8hH8WAIjP"
-    "3GgyCqAznrpWD3EUu4gd19SR7OnpwaRJN/W2miNvlqQBzI8cov9NZNHwXUwxvLC7My2eW0M5"
-    "Xkkvv/wSxz01opeFYj+cLo8eYoCJvE3gAGaPALIMNZchV868CqqVOghS5VgJIF3YufHAScsF"
-    "X+ilRZ7zGH/4aAdjCAAbfTDbo4s1y0Ouo6c40AwZVxA9Uie26WVNLOAAiM3NzQHEOqD/KiB0"
-    "7BjUHQBVcrfdcT2DjS2eYag6QOi+ohtkvVrOFEdRnnksjU4T5ZvHdf34y1wjn3PZl+4lMBp+"
-    "108BeCIyezJuPg8HjudwK8Zxx2vj8ApvxUOOF7pLEIb/4D4V/jPAymHDb8RQ/jG+8le6FXcS"
-    "cX4q06r0ledy5/Phn4XvYiNAEXXifOxl8fkccyr1qh9dK8P6bD2GH/3Hs255zo65nTjynTiK"
-    "+Cvd7U/xDh2ZGZT7SqRDW8iArSJd3YLe/C2YR8Y74lfQrb+C5sgjWVB6YeYyMwY6f/ptmmnI"
-    "Hr1HYVMZ+bL4+BYZzUNvRsn5a15d5CIeypwZMWF+AhC/RorGIYosCsGwpb/wa9qlb4Na+Pgx"
-    "rNyvvAuCD7pE/H4j9nDyT5ESj4bLGR5OI6dd0GUkXFHgBR25AC18CgUwpn+Bou+l2M10y0YU"
-    "6RatLOiuJIW4y7yEjaygyT+RbNAfL5LML8Mf7jw7mPpgPcSAHZ0OH6SdO03+5rMlZmOPTQQM"
-    "5sZpnqLcIxrq0Q5l52JgiA6WozfZ8Btg2EYV0zSDNKIud4MOonPhABVK60xGglB3Cqqo6oDn"
-    "oM5wQJwOOnmFGmJCRa+WH+Umqz7yAY2ubtSpUn/GlqQCtt8Ve5j2FFaeTmhn0PFxZTaRCVF9"
-    "E/Nn3dTPnJmWonTsGYAzAS4D6IV85wUsQBPNXdiGWr1qIf4QFTDAnkGM5UpXkLho8Twmpsmp"
-    "dfdBlLjV+brMESRT0x70abpaWtI9996efvKtD6WZHATdjwLs7p27zVVavW41ecWmE+ITz62T"
-    "+2UdOPDLacrHKHkY9eQ8qLM6VhethrgbEUE6oTpx96P3cbQFPQ/AY0y25Md6vcREMQ7A9a3n"
-    "W9Jze7sCvHzxBwfS4ce/kh54y4Np6nQUehesT7e97i3ptvvfwAQyOf2/n/hE+oUPfZ7zDNHL"
-    "Qlla3SA5Klp2tzipYgx9Xk/3b2jGjtRsdFTa0tef3pNa2Z4/mjqcVT0+rWyaGWcz3nPvLeju"
-    "1JK30Zxdh9kAuCLTMeKleQ31lxQbejiwO9TcSaftIbmaz764F2XnKo6igfPDYCJXww0rLk7q"
-    "Ubb2tAD1bQTF1dMmA2I608/9Lx9MP/FelNm721MVu7XW3fpgapjUl/70s8+lUacPI9Y6lv78"
-    "jz+a/vv39iSOakxvffAmOIKzaAsX0zefO5S64ULMg8Y7ydfSxfOJd2pq7ThJ22FBR76nA1QO"
-    "955Lv/be+9Pf/f3H02333E8ZMzkDLro6T0Kfq0oHaIEjYwLPKr7jnFoAWbXT2EUHQMuTJyJn"
-    "uCJhow0zGiqAyzWNhQZ3uSi588BFA4A4kJYLEIE91RvxCAT8qVPUhR7X8ROnUjc7LAWFpk/x"
-    "yhxChIutOKztN1AXti/7qKJzAYnxKSKTO3mRHbEeLSRIPEVbrIVbE4scE+SSS289aGhTExH2"
-    "IcVlKu2PCxEielXUq/ELzCZX1aSjR1rRHWyjTwyktYh4N91+O3RhCf94RzrCt9mc2zh37lz8"
-    "9DAeslBSp438aObkHEf+zKKOGudzRiTg6lHE43WAkSmIdSejE3X67AD0Tg77cye7+smbOlIA"
-    "PSrBjQByxxRv2rfkQrmreJA+a56tBzlsjjEZPFJi9DnHEjnWHo6teFpxtGVvnq9euwhIraON"
-    "XicujKVRlmdZzGh41e8aK5bTqfHdOji7dVj5n0ifcvOSuoL9p/vhKo4PMbdDqUcMDQ7iBkd9"
-    "WjVcOMYS5xXNqcQmACdSGoJ1aaXLecwApgBgJViivAVO+qFS8j3chsfxoXHdRmHjKm8Rry83"
-    "XCPch7/bfoIevBtnbmk5yYghnPIc6JgawKW8GzZ+Fp3zXJ47g1MUc2R2z98Ets6RAp38CxBD"
-    "mAA0xZzqnGEbDbfiW8ypzq0RfiRw8VsZX+V9BKByPi5oy/QW+SFN3ctf+S3m/SJvJTMnvuHX"
-    "8sn54R5xOnWab8cISjLKQRziT7/D3/SX8UEucb9b5vqJePmregdH5bzpYT/yJeog/hbPuvnu"
-    "LyPh/BzuRBSVSKUZaZnpoIs/JUERqXEY140FUxRIpXskhn/ji6ZjOH62F+85HTIqeItGlFPQ"
-    "L012+CU/SUkRLt8DsRaJGB8fR/yieEyHPAXNPMedRhFpC0bie5k+aRbJElGOK9L00ZLzl0FO"
-    "0AjN0h1BynDcy7z4JYco3QpPFX6hoIjbqDXKmYFQBCzTK9NksCpXORmwmUIxMBC8BIyRR+uH"
-    "b9a1k8ol4hWwqFOj+E7u1RQAlqI668x4s3HS7E/wEtw3BtBoE9FGtA+i+NJJJYMLxxHFNq5W"
-    "Q6RCXPqRG+ARHL2IF9xFpUjGVbMTg2n7c0DWUOG2XftTD3awpoHUNqxZHCJFlVZd6ctNc/X7"
-    "6PbWtGrhLCYJFG5PHk6tXZrscEU8lh1400JRd9qYayi3z0JsyLEk+/dHWirz2qn3oqehJevZ"
-    "KL9bJw66MbDQBpwEVe51ha8tL8GGoqPJ7BpUhKI+khOZIMvrCJPMBMIxP4YYy/JWQje3GmDC"
-    "BAujLq1eWJe+u2cgvff1a1Pd/AXpKha43WX41c98LN391t9IP3jxUHrwpsWxA6sBG0cehH0K"
-    "i+H9iLzk7jC3pDfcsizElc9ih+qlo52YsKDsQLQUd5StZ+5RpdQfIiuAkEfheKDxRPJziTLv"
-    "gwPi+Xb1gJebmtkZCbfGibGnl3P0mIiWLsIGl4cek5b5deIR9DagO3ceA5lf+v7LaV/LSY7+"
-    "mU4buIYy/xrA1S+h93Qc/bQuxEXnAFkz05KV69LEC4fTRz/7dPqnbz+bjpzgOKEtWIr/qQcA"
-    "0DMQ2b6cHtvRmlbDDbkFG2frMcOhGNY5ahIc1Fp0pRTBTqO85Vz98ts2p9/9s0+kSVOrU+vh"
-    "PTH4W6/TMFD7nWf3w+m7xkHVHutEOdEnBBIebm3fPIA5gPqpghl0svjnYsCJXk6tnNBJ1PMc"
-    "RJ7Wvf3BuldXKw7OBkQ5LvjNNl5ybe0/mjCQa3WkewB30odrKx0uMrSyPgg4YDNgOtQ1kNaw"
-    "G1bA4SJF1QgBlnXigsbNCBrC1NwB65c4ALq+juNeiEfQ7uVQIxDT7fyFcwES5QJfoo9Jp5fj"
-    "hLTKba2tq0t72An4CiZAuhGxNbE7T1MNe/ceoT2cDc7Pvr3HQsl+aXMTNso4FgqQIjduInpP"
-    "Tzz9bO6j6EFqV+q5nYc4n8ONQ9fTjrYzaT6K9ffcdRdx1iAG7I6+bVj7lRIMhgbA0pmgV260"
-    "oPYctr4EcPYny7GP/paBLhxLylPQLsCZUcvuXMBmL1xVF3vak7PPK+5zvBBgnkek2gfQmkAB"
-    "u1Cz3XhdJJ4aAPksOFgCKSWsfdBx8SK6hXCap2Ic1d2IF1hgZpHoRXQ01deDgwmAncB4IBDM"
-    "oMnWwz8Bk/VAA6AJDF2O6dZLjNe4lvdwDF/Wy/AvxmDnHecY3f1PBJlZgEvx7r38lsPk+SpA"
-    "CeUbYahnx3YXPv4CDHEPwIMfL+Ot/A3FFWELsFLOe/rFvYw7AFKlP+iOfmBahb/sp6CH8JGv"
-    "wl+e842v8mceR/5yXJV+iudI4wb3It0ch9+Mq7wX8VqyFXkp/YyYB/mOpygjQWLpp6Q1PhTx"
-    "6CvP59R9AGhxQW4LjiFj3v2Tr3/YhuEvN4hckCYQgW1Athp+FkrmLOXEjUhf4c63Mkzcw0uO"
-    "w/eITMp0L37xtYjbT+VlhrxyxuIpaLNzVqbvdxtITs9n4VGQGm7ReCx0Gpp5yJWa/UUaERQq"
-    "iKP85dTMS/wP94hfB2nligKNQvEN96HLRIxLh5HuhjG8XTCiKf5k53jJNOavRYyFu2/5Md+J"
-    "2thLOpzc41gX3CIfRdp+D8ATgTMgHKKDbz6Hf8rHsrMxB4UMFgIeJ5Py3C87phwsAYdgy3DW"
-    "v9wr2aIqqAYYY/JyEnOVqn6KW9ONS+6Vq29JU3dG0YzXKSZ8z0iboAiHAdjBNzgGTAwOsq5u"
-    "/SmmUbFeS+rdvZhygObjHIC8cl4thgfnxUr3AmId6RU4eG9lYlNhfs3qpdieYqcaXIRJpGs7"
-    "omTSRMDcU3va0gXEHnk3pErbZ9DLmYH4ZGbqRC+l56R2kVQiBlCgX5Qn2cEAe1Mx0aDyr+Ug"
-    "N0kgOMjAbr7dCHCZMlHEJDfrOAr7ck1sG+jtxw449dIukk/Lxc6oMvzt86elX/jffztNqa5L"
-    "2x/7avqj3/4v6Xc+8e300Kbl6d5bVwHgpqU6aLNMBKSmce9tK9OtgMxVi2ZD3yiOsUHJuZ3t"
-    "6HAStHKv8rdHyyiqtRlVo6sk56sN7k0ru7D6AapnsB1Uz460OUwmDYiWGgFN6idpZ8sJuAYD"
-    "kAuaPLgZgILZjAHKWkDS1DSbssOiNhXrxF3NhFbDvTGMXE4EwFGeWL1ftHw9/U8QcI7z6E6n"
-    "utmL002b7mIn6Ox0581L0n/99V9K977udenF559Nn/jbr3Mm3fl0++qmtBw7SdJhOav4bb6d"
-    "RBWNCXzOol9XX3U93QtHrgpO5bkzfWz7R7xMeQpU5sybG5yvA7v2YdoDLiPtRttd1oO6ZeN5"
-    "8HeUDQQzEZtOQ38uL0RcVNpCqSPAuum5M3Q6wKrUi7K9Ouhad7Zx2yvFE7pWbR3daV8bx8pQ"
-    "/k5ncgXtM4JXnsIYKk60FXdHAq7ZoSmYsp8omnbzQDaLMjEAsJs+PH5Gms5y2HkDHFfTUoTm"
-    "mOglwJLjow6Sq2u5q36zn9s29W/bD70tXhYsaAzL/J1dfXCDscH19K7UVFcVol/HA/P55NMv"
-    "pCXYOKueNh17bXCuKG/P1JxKOzyDqP8Aba0KLs/mdctTB3bLRo0eTHffsiKtW7sSWialrdhE"
-    "mzxlTIAm+6w7eB0BFfkJYN1M4DWFvDm+uEA6zRFMVtCoUeoYuTPUTVOMUbRhQXs1AH9x85Iw"
-    "1XEae3j2N9voIHqT7jI0DU25aORYvS85zgw50UbljsnJElDyiFmRAcY+LL8jFqzm/Mxx0KRN"
-    "Lg3Eqht4SX2s0VfgYrFRhny6mzJUSShX55UAANxtB9Ic4yjP1rXv5dwYcw90lu+Gu/FnmIjP"
-    "8H4v34twZRwRjok/5kPnxKFfTle6Im3iyfFJX/6VaQb4IQ+2j6Ff0FTJkTKPJS2mY/zEaZjI"
-    "Y34P4GFYytpv5bttMECVg75lVZRHlA11XtJU3l8VZ5QDdPsvyjg/ZzBU5LXIV8RR+CHiobgr"
-    "n4fSiXxAU0FDjm/4PfyZJvGEH+nnovsYXX6IN5+L+Zz3YGTQf+1vzglKO4Y4WGXiOQbDGZ0e"
-    "iZQnJ9iysniNCExjKJyOXEFEPGWiwq2MJNyH/1hcr75yuvHJx+LBKMqCiFC858ofLswoED76"
-    "3edoTFS4LhlM+KSHiCETaxLldaNz8V5+zhGXcZSuQSQv3knHf4VTLsPSXxEuXqUCv3kEj6A5"
-    "TA5bxuhkFnHkqCOkYVy1qrhuQsr4BVcO9ubLwaYEnQbIAEuv2a+J+Vz+Ik9BTUTPH4EQAIs4"
-    "FREq4jAOB305NiqX+2xnkAbBVViLh5PhxCvIugwtBDHDMZgbX4jHaHwWqTvbquAmTIe746pW"
-    "UVDVZHfuZH0WlaN7Tg3EIKzYcO/+Y6GncRK9F1e11egOuWI9jlhIDpUWuaXTiUMgpt2iM1pe"
-    "h0vz9L6u9GP3rI+ybm1roc3ARWCFeg6RnRbB3ammlfY7t9yUli5bmlqwhC2nTJtN58+j0wOo"
-    "civ7BbgIZbOxHWr928lALpWTl2VlHxFwWnZO0irhO+Gpr3OOiURR3gBsqymEP0OZXOCn1fTJ"
-    "KmkzSXdjlqAZLs2KNU3piW//9/Sm//ARzq67mN76unWpht1s9MKYXKwPd1JNApTWTp8Ch60+"
-    "9KwOH2lPO/a2pGMcED0bcHWefNoHog1R8g4AZR/WSKvH6cixWoheUzPgrBFl9UXY8xKwOpnt"
-    "P3CcQWJ0amajgekp1rH9CbpmsRHBbfcX4WpdhPNgPi9jS2wRis6CLq+JiNDOMtG98PRWFNxn"
-    "pSWrbo30NfB6+tRJuAFV6aYtD6UV625GfHgifem/fS599DOPpLWL69OtNzUjoqoPcCtHxTam"
-    "yM2ytg3Zv8cD5mZi2XvD+qXEhSmMnq6kmYcZdY2IPAcQ+85Jszlkee/2l9Lnv7U1zVRcRNtz"
-    "svXKoCc/45wOdQL8psJ1RN+KbhATqenFqp/8aRqh1LmiB8XkrV6aoEjaXBj0AowOt3al430Y"
-    "8LQ/8rM/4iX0xeYjnrLtn2ainspiQh2325fPTqtWNofozXwpxhQwCLDkHqrUPhYRneIqu/1Z"
-    "8jYLgOXlQG6d2tkcBxwTXVyMhUs7GfGi/cv6UUVAUONFErR5D3nO5hm0oH6ExUcTZx26G7AW"
-    "7qt+j7WcgAt6Ko3B8OniRe5InApXjg0A1IX24eSGdqPnduhIB7t/a9PCprn0Y05IaKyj7V/A"
-    "rEVH2D8THCs+s434i3Eael0wWZ7qTNl/Fce6S1P9PvuRwFz7d4JQOWMXiHMyO3frGxoyFxfO"
-    "shyuHs5XlHt6qK2bw60BcYwBiuAnUgYkS/kLKhnX6HsXKY8q2kENdanS+xn6t/pWKrZr6qKm"
-    "tpZnzfgAI6Hpiad2prN9R9KCBQujPXgkUaisUIYCG/MS80wBchx/S46R320/+fvIexYvjXQL"
-    "8EL40r91WT5X3h3DMqiq/B4zW7QD6zeXMXfiiB+OuuVnwt0IkHgv0ygBUtz155IgIs33Ms8R"
-    "XxFvdEr+GGb4Mj2J8b/f7AsC0eyjMvwIGos4R3yvcDOCGNOKeOyrpV/j9jmuijDl96Fvw0QO"
-    "+8ct+xv+6DxmX/dfPOFgXqTBSc5/RWpBk2+2dX/W/Zh3vfXBh8vJtvJu4IjTqCwkAjq4hpzZ"
-    "RAri+YDXQgzlC5ekRHiTN54iopIQP8f1KgeDlWFyZnP4nL7xlO+Zpvxehsnfirgr4tGlLPP4"
-    "yjfzEdfID/rM7qYVT8VfbuUXH3JD8lvpWtxxysCIT0FDzpO0D0VXuPu9wjF/jm/K7UmfUdl7"
-    "rKh5jrIv3AxalrvAwgHUDhJUFNFKR1lfjvD52ZV5rkcTjMZiWjwbJ18ZQAFXTAAOMIoV9O/A"
-    "EVwBBsVgmxLS9B1snTDlpAiwLvFuYdspjceBUaLCcCg02m7OM6mo5D6l5PowIHrO4DSMFLoD"
-    "UDLkTpxg8Fa/TF0SRVXu6lJviJQxMHiI8hmV5s+uYSBVhIASq5MJq3cnJMWVlt0pBt4NzY0M"
-    "ntOxu4NJACYhxl4mLBXsr3K23VV0u2qCM+Hgv2wF+ksLmpg4mCTb2gNoKIKg9Mi3Igq5FmND"
-    "H0ag5c90BEjSqhK4HA+5CQI1B1v1RgQwllUPR7fIsVg/f2ZqhGNyrJ9BHrtepy5gjoD5rwsQ"
-    "80lsXH31kW3px+9Zl9atnAuoYmchnRW4Shrol6hsS1yHDrXERLwb/bJnD3ayO+oCuwpR+FYm"
-    "aJ2Sjra3rA9BgOXqhK+o5QjH+LiL7f6bFqWFHGWj9fwqyr8eg6+KblpRjG+YVR0Tp0rV0u7R"
-    "Kg4aS7Ebpg7a33/tybT70In04f/6AcDpAsBUL6LOiYhrPbuOI1rYqScXRf2xxx55lHocjWjw"
-    "lpjQamoxs4Gxx8P7nkmf/thH0nt+8f9MW3ccTm+7ewVgTMVodsxB6yBtwyNQGgB0ZCqA9XTE"
-    "ONPRddNu0hQMmKocPR7lZNtjH6JIjeLOXbg8zWzgDMNvfjF98Df+Is1FUT92sZJnsGOIZxUR"
-    "Cqw0WKv4VvOVB9kR527QWbNmxCSvuJwBMLg5gqlScd0ytB16aRJAcW0P4sTdx06mfsDrRGh3"
-    "2PTYHtu/l7eZLA68BPeX6A9Wz32bVtH+qsmPImyraxTir9OxC1NzBOq0qf80EQ6X4voBuIJ1"
-    "2K1yDCr7ciw+6XO2u+6ekwCF6lQ/u4H4rqcl1JftXYvrcqBdjKnjKPdo7LgJiNAb0lW4Yn1Y"
-    "u5db1NZ+KuraDSw//9OvSzffvC7t3YP4HHH8coDgALtW29GB++6LBwGyg+mm1XPStt17YpNJ"
-    "/awaFjgDAXw0++CYYH24U5AOG+72M8cqdyM7IQmqbH+ONe4i1E37Y4OI/KfSJtWnvIqe12xE"
-    "vmtvWs9GkHlhykMOczZei+gOICqY30v9aebfM2PlPGfFdvs6wIuyG2SsFGCpm9aDzTPbtQaK"
-    "G2ZOxWq+YwuLPPyNZnFWWz0h3XnHuvT2d787bdxyL5zRaenAvv20vZm53zMmWFdArZgjBQkZ"
-    "pAi8Cje+lnNleR8CMjSQ4MyUd+IyXIzjxlW8R1zGN/TL/kw6u+U0huI1XIQnDuo9wFSkUcRt"
-    "QDiDhMo/3+OZm3fTqfhXftMtX8afvYaTQfwHkJUG4855zWCq7CeGzeWVY7nx72t+y13sBq/D"
-    "fSo+DJOV/dmJDIe77f9fuyo/j3zOc+9wmWfayzo0SWOO+COtPA/YgYMJQjuzv4x550888LBi"
-    "HAen+Mg9niN4xFBM9IIo7bkITCJq7jkZI9Qt57P8xntQ7LtRF6BBAsof4Qxb+ZOGqJDCDx/5"
-    "TxxO1DmqSMe0MmCojDfnIfvTc5FW3Cv95biCemkv8iS9/JfYoTtvkb4GOHNhlvSXafEeCeb8"
-    "l/k07QhrhJEHyrjIq2Aob7Et8xCJkh/9ZH+Rt/KZ+omBPhNX0GF+BEp5snXFlxtTSV8GVHkA"
-    "zuFNP/wLyMx3lEvpP4Mu3R3otAvjXfAmB0qQlztwdKXIs34zByvb2XHXkxOQ7cIVlqBD3wI9"
-    "wY8gy77sDqopgKLJgCkbrOcJGq4Xzss4BgQnAzlD45jQPH9QkObxGoI874rqjrRyoDMDZRXK"
-    "rhMYyAV0FzDfoEkGRYRORJoh6AO4rGiqS4uXLcFadG/qQB/EsxV7B+A+ARYUE61eNDf0iLoR"
-    "I5722A9Ehm2s3sehGHUFxW4nSgeqcyhbK9ZQXGTZqOxa7jTMOiKIOakP6fG9iq3fTmZytAQI"
-    "HtUyE50glc5ff+fq9Po33J4W1U1Mq9jVpKXprQc6E+Smzc2szDnEds1CwOOkq+g09XAQMxN+"
-    "lKs7qS6nHS/vTMsXzUpnMdS5t+1smoUel3meDBj0HELtCznpnsXNSdzLVqYZg3Ps5LypeXZa"
-    "jd7PvHmzgj6Na7qC70YkqlHLmUzQ6rvZ9+rRp1HXTLGnk7E7egVbTRzs/OCWVYgsa9LCpctC"
-    "rNre2o6+zpmY3BW17tlzNH3v0ReYTDHVcOwIStBX04Ytb3ROSk8/+qX0X37lV9Pf/+Oz6cc2"
-    "LUu3rVpAXPnIEgc2250NRp0vJ2mNgM6ZrSXvUeljn38EPbGrYT3ffGpjybFJzklvN5wM0vvb"
-    "P//T9Osf+W9pMVyuU9S3ivv2eS/rVAOl/Icv6EVd4ii/+yCWwTV0q4mN+AItloPi6Zj88Gsf"
-    "tu0qatX0wpGWrnQIMbBxTSQegZVxa/hVkbBlL7DzEOLTKF+b1gUc37y5OS2EaxjWx/FjPxOA"
-    "yKmdCofQfMiRVe/LtuZ3dd80YyLXzH7vJV3n4Lja9jbcvBEApV7g5dTCjk/FtU0LF2Fn7BzH"
-    "D3Vj9FWL6p644WkKgFTEc4LgAUR++zr70Z+alraz6/XH778pzaG+X3h2O+YYeuMg6RqA4OIl"
-    "i6FxbDq0vzVtWDUPhfNxqZ3diMsKUb1lPI4dgtfY4aqI7torHmpOv2Fl4fmTmkQYP446OdUN"
-    "96st8jEdO3eOOZpXoFgDsFrGHgBv3pcuXZTWrFtLPsel3dv3ppNdnZTDxXQKMGn6dXUNcLcA"
-    "9+hXnUR1oIsyVuxNh4y6Uxme0qXPUxfUTYxrmplg8dNAfpvmz0E8OCnqYTwgU/C3bHlD+pWH"
-    "P5rWbPqx1H5kfxo3kRMX4LKf6u5I02iT167a311coVMHXXmMNPcFwKCOhyfoCoCkO/U1NFmT"
-    "4eFn3P0ecYhiiE2cEn68R+z5Hm40It2KOMJ/Dl2457YnVUOXQfBvv4mwfDDe8Km7L2UA75SX"
-    "/4L7FC2ZfpQDGOhVV3winPHnkIWXMs6h1yKfFfS+KrJwsPcEIUOfc/mU5STNGRQGefq+Ia0y"
-    "IFmJb4b0KrOa33Xjh2N89dF/vlf8zFNc8V3v+XvM65ZV8dPbmHe+5f6HnXgtxAxi9EBwfuWE"
-    "HHaU7JHFL0/aTOiE8zk4LTS0ABeCAiblAGM+F7/Yrhp+9Z9/JpQBCe/E7Y+P8T3iLYFAZTj9"
-    "xHsGDTn9MkwlkCgBQ+mv8m5aZpBBEC5Lmf/IDx3SjhL0x3OZh5zGSL/GWdKTvwc3iTwbd8QX"
-    "+S/yFZ19OB7FZh4FkP0p6nOnWY4zxG9FvgVFlSJBzf+bjuXlCiyAEJO45Q7pkTfpMlzOkyIr"
-    "v2VAFM8RtwO06eWfcSlmEBDIZvfwyjwQSX/W4xDk2OGNK0SThHd7u5OhRiJV5jVfcntk+at4"
-    "6rdLgIJsd8lmxqDEd3cQOpkIwDR3IMdLoKVyr+monGocF+Gm9TMQKq7SnzsOWxDDeAly8iCG"
-    "vhH+5GRJW5QD38fzbBqLlzYR95X0zacPhVVvwZ4GKuXi3Lp6sWvQdAlgMYUD78Zj80mw6Hlt"
-    "lrWiMc/YW79hTVqC7oc79KrRSXK3otyp0JVh4A1RCHmxw1mGTgyKCe1LKu6qo6BJgyVzZoat"
-    "pbHY7pG2BkDFu3/ug+kXP/jONLr/aHpy6+HUDifuzfdvSP/5tz6UBtll9/QL+9lC3wAtGC5F"
-    "ZPrC4Z60pH5ytIHjXeejzBEIwp0jToEj+epHzOGEPw3uh9wbajF2Bjpsb8IKfgMiQdu6gFE6"
-    "BctOLIpuyAZtJ9MdAJbBRHtUTlSKauuwsN2E2K+Wif5E+3EssvemeU2L06KlzenZp5+hvM6l"
-    "uQvY8cdura8/sS21Az5WIM7tON4KxyKlZx775/ST7/tdTty7lu5Dh2ym3AMmKdtSrIIpQwd6"
-    "7ZV5nIochUZEhl2I8V58aVf6gw9/MG2gPtrbT9AunNwyyB+FiYFnntmZPvR/fwGO2FHOMKxK"
-    "nX2InKwX/jlk+ot/xQBJVmMy0I8gSJB1CCOak9kAoUkAOVeG8o8cwHLBoXkODx3fdqQrXQTs"
-    "qN+lJ9sz3uInh6zy8j2fpcgkz4f7b18F4JkCeNfOl5sn8rE9p7A5po6b7eM0FtNr4Nqp5+Wk"
-    "pZjeRhVmDWjThgtRFMQvYSExdvT4dOhAS/ryV76L39MYBm3G73RACHpb9PUznCc4DjMJjhvj"
-    "Ymcgx0Sx2FmzdjnK/hPT4zuOpKX1UwJsv/jSjvTy7hNpLmf6qe92gsPU5ShrPuVq9JFLaRdA"
-    "aw0czMY4CUFQbtuxvOljxOsYYG7HjEKfDBtUz257Lh07dC5tuqMu/R9/+EepH7D0d1/4FptV"
-    "lkbfMR37vQs0ubd9/ecwjTE72ujLz+/k/NDjtMVxYX2+73RPWgSwmzChKu2A7pqaSWk+Iso6"
-    "8jEFjrDlZZt1XC256XSPaPcTAdGLmuox+9IQpiSuQ6cGg50bpqNX+PK2nan96Etp2aqVqX7u"
-    "0rTn5Wdj7HrsO18LPcgpU7FdR+mbBsIgqyHojwkXt6wgjQeuAE00inIyLlogQSr+ld91K56t"
-    "59yqIvr8POSviDvf4m85uXs35kwUNwjN82uec4lCYnUs8uCooFOZtm+58cY8QqXq3bad4x76"
-    "XKRjVPmbIcukcwzFe3zwE/8on+G08nMkJ12VV0nn0D17MF7De8U9vserDrrGS6TBXGI+y4uk"
-    "izBFuhXxhH/pw815xTILho/RGUURTxlbZfzmX09RzjzJCR3z9ofufTjAj4VDpygD8j0uPRvO"
-    "4bkswBF3J3L8RBxO2sYTYbxX/Iy7fB961v+NP/yRcgCDinhEhzkNV4ZFmrhFeOMz7Xj3eeQP"
-    "T1HeugcgMt7i2fBlZQQXyHj8x3fDRbxBh2nZMUm7+L0W7UPABs8ZuBiHQIchxnBMIDlvfh+m"
-    "Zyhc5BP3Iu1w161Mt+LZ9AMAMZn73cq2jEMcFP5z/DkdQRTfBEQMODm+/O6EEZwovlnOfhfs"
-    "lOBKN69YvcfKK3fGMk+Z04VVcCZqG5X5tHE6WSgmc8K2BQk61I1QB0tDkSq323iDFU6rz4YI"
-    "mSihQ4A1Hl0Vw8q90O7ROXS1Yls3gy+EojNzJrhYclcEp/rTAnupJK+pCcukH0XYVxA39CEK"
-    "aGdCVKdjPACvC47XEnYOzZ9fBydnJlasZ6e7Xnd3uvPBBxC1nExPPPFiKBbLidlwy7qw+O4R"
-    "O+1t7XCWJqSFixcG/QIrLdifR9clA0UH88zdspzVzxIUen/8uX3YvkIExvtFVtmKJxS3HMV4"
-    "KIILRDsz0j89viNthKv1xUd3pvs5IPpt7//lNOpiB2cSPhY7sl48CveOWaKN3W/9cPjkWJEg"
-    "bSaqKZtYoMomU01ag5+B8rdnwgWIxNP8GZPRq5rHBObGAo4tOd4Voht1jwTNlr9GMbVNZJ25"
-    "k07Qa7uthxu0HsOlba3HUPz1nDzSAPho4uI0Z+dZNn+NhfLrbKWfQH0s4Aii+25fgyK6NrTg"
-    "atCWvvgPXwKU9aY1iE0XY0ZjCrbHXNFfgbtBcyhAVgYNtk31Vdxd+tSTL3JcSm362Kc/nhY0"
-    "r0zTamagK3ORuDpoQ3COEE/uQQftX7YeSasbpzPBshHiFAZec/FQOAyauYhIhn/hngdT+43t"
-    "0KJ0Q4ACwGNwQmrYMTcZ0Vy09aJvSJM7BPcePJ6OoAfIaalhW8uRI64yEV7KcTl/yO/W03R0"
-    "xhSVz0CcOxPOoV+sD8Gu5a+YOQMsD3rGbhz6ior35PLIRZWbZllmHR9Pp7iKiKsudvvt3LUD"
-    "6/pt6f5716eH3vLWNH/hUriHhwFHxwHB8ynL8QHwp8Ahs33azzXDoFh38RLOLASYPLm7NY3h"
-    "QOWLHBwuIJnCrlL75At7OtK8hmnQMpl3xXuT0poVixHdz8LvRYD12dht6+HUCSX1OK0DMOdB"
-    "1Vc5iqZpfk16/wfexeaDlO59/Zs5i/EdqbezNX32K99HVD8jOHD2eQ2rVpNn26RHcu1CDN7S"
-    "chzAJpC5Fsdjacph1qyZLHiaEA9yXiQW4Sejy6lhWMvRNC1/+2Tkk4KX5olwvutox6uhW3Mg"
-    "jDx8l0sJd5zFVDe6fO0AyROdZ9OXHt2VBjufSxtu3Zy2P/dU+qlf+L20fJ4Hm0+izC7Qpjkk"
-    "O7HrEbMgLgCtR8FD3GlP0aBtaEEJt3/lCu9D/sowRZsaES7HP8KJF8ecMh2f4xe0OG/lOci5"
-    "04Zve85zgHxxx/bM8Y7wfi8it1/Yzpwb5cbb9vO8V/Qf/ZmWsfhfGoywvMqIyve4S9sIhyim"
-    "EeFu+Pxarzm/r5Hma3ku3DJ5FTSWxRzfbyRKsjLAHSL41V5yzFEG+TGYI/Qpy5hdhA8+LKFO"
-    "nv7sRP5iRwD3YGVSSeX3yrsIPWS8+jcco+2w8l35nO/GE/EWfvWvW2V8lc9DNJW0FXHnNLLC"
-    "fdAKDa4ws7tpOBjntMq7eQnbVsYVP9ItngUC5SBl8WSaoLn8Lo08DyFu6fY9fj6P/EUjoRLK"
-    "MLZvG5/1Ej/CESjXBJWb3fN3K0TRePlZTzZwPeX0cjAdLCurPw+QcsGyCA9Ch9KOWHMCEUfE"
-    "V/wp82BPCi8QalIl6DPeDD5z2q7SyvotyzpYxgQquW6x8xAgpKiKqGJXkEDCn0YGFRPFAOdg"
-    "jlhQBd6cv5x2KH4yuSl2cdUp/YoLrR+5QSqlqhcmLdpcmoKMu7OHrdwAMQdkJx+vKzFBKa6U"
-    "R0CeIKYTfa4+BmC3mjvgDiAmY/5Nd922Kia0DTevSjfdcivK6H1p4bIVDCbsWkPU1QmIu/d1"
-    "d4WC8fe+8wMG3ZMcsQN3A4XjOXMbQ2wit8Hdj1QCADDb9JHzYZtRH0zugOIYV+SrlzvBjYYb"
-    "4OCMoUW4M4K1bsSXPRx0veW+e9Llvu706I6WtLahKv3557+HyHAKIKYx/dGn/yVMOlwnX3JS"
-    "jP+ad/KouEvdLqEwznAisOmDKMiyO4Xox7rVXpT6KTW413Oum6Km1jYUw5sao0ykSZMAcuam"
-    "w3nyjLsZ7Cycgf6a7a0Fg47v//n3pAfe/HbCV6VjRzBOyTZ9d+vZ7h7nEOc//9zjcXB0NXpM"
-    "73rv29m92UG+JwUI27XrQNT3vHkATAxdyrFS18r2JKC3jmNygljr2L5oQzLtjvb29M53P5T+"
-    "428/nJqWbUgH9jxHXQ2k5Ws2cHxPXzpy6Cgip4H0bTiUE8n/ALp31rHlBA8xOHm2PcuGKLny"
-    "WGDZeelW9nlFiepnqZfVwi7L63BqBBKCaDcstABIDx+nPaFrNYkIoi9FLK/9J6c3/M068tie"
-    "msksPBD/11EXAXZdeNCutILuLsJayt7FTg/6WLVsclAE5phrm3LDiaLc4K6RR8tuEqcAPMVO"
-    "wIGB7rR1f29610/cnWaDZD7/6S+zCaKFttuRzrNIWdK8jMULCwzEhe4UtKw97uYC8apjuJSD"
-    "oRvgAD2151hqpB1YDcfYZVkzbWz6yYfuBqTNS+2UQclNdlHlomb7joPp28/tT/A5I8wEuKFd"
-    "vSejDY65PjF97/HH0zveeXt6+8/+brrtzofgfi4g/9m0wl9+6jOY9si7RdWvM277tDaqSm6w"
-    "bu4SdIy65dZ1cK7mh7mJ6ukzY/ybgskO89LBDs6t+4+nth43p2C2Bb20QfIVYIGwji0LWVA1"
-    "whG+hm28y/QJFcdPnjydnnxhF7qgAG3Em5dB2wvqq9LXnjyann/kX2JH8cZVTdFGD+zbB9jT"
-    "0n41mwlmIDbP9ghtCzGmWel2uqj8spUNt4H8QfeyddDew1ul38rvlWF1r/SXv+WRoIjPGxH6"
-    "T3pcHMU4zdgooM6L//ycx+DcjnNMJU3FG2WmeQxVE3K4vIiWdvMbc12R1giyIpqRcRlj0Plq"
-    "8nNi/xN/Tdv0/vX4MhAsoy3DlO8j6B35Ungp6DetGy5dSte446cErpnZw+LkPdjBysDGiSwD"
-    "lQAcAWicyPOvtKIuoHJAzBNfBlgZ6OTwghlTzXEOA6gSBBm2/AXwqXjXPQCbbvTqDN4yQBsK"
-    "g3s8s8rJbtzjOfsPgDWUjyItOo8Dd4A/wRbfVdg2/mgggd5z2jk8fnTTb9CRwwznyfhy3vQ3"
-    "9Ex8Oe8ZjBg2p+tOJEUd0pPj9jnHp1/jL8sq0+G3iHfInUK1EfMr6fA5Og4dxs5clod0hx/B"
-    "H/mOMJFGWfamRzoRF9+LvFjX+aJRld+4K4ZT50JxRR7kAAtFfuxk0WGhQfsz2lLy3e3V7lLK"
-    "tqu4s+oWUEzCmKW7ANVlcOC0c5OjGDQd5DS+6WrJQdDJRa6U211d1c8oxAWuTj0Sw5XuUTgh"
-    "ZA0uw1jMDVxABwtRF4OJFq3dJXce5dnzTITjyaMcMg8QduecgpWH7loPUKtlckIxHV2P61cv"
-    "h+mAjpYD6fvf+g7nubWFiOLW2zenl59/Oe3cs48ddvPTzRvXh77Rrh37gu6lzQvC8rv2ccy/"
-    "nLygmzLWxpS6NOW5fbYJzz6kSElXkcQYrEUjM2PWVfSyYMki9KpOp63bj2AyYWLavKIhffhT"
-    "32aF/4O0bs7k1MMWdgd+lXcnom81BTnIeUSZZ2kC8gmReqSZACm5g64227EUfgb/6pqdBnBo"
-    "L2sM5bODHYKzsR7egDJ3HC1C+ar46wAheFUfS1pdjTmoCgCsk2tX0PNBj2rtrfem+YsWYaW9"
-    "NcRbW5/Zkb7yxOG0mjMT3d3XfQobXV0dHKJ7GkvicFzcsYUtJduYwF2dHC12C+TtM9Jqm7ON"
-    "eTmJelXBxTiBsvzmzSvSf/rdT5DfGs6NPAZQ6Ev97Dw0rO33IGLTf/7+rijXqXCF5OIOkmeB"
-    "0rwZgF3SlNNnrIIb235wiXkXmJqqOnnu9FRPTXMK7gL0OoFYdjxt8hx5OHq8O7VxFA/FHABM"
-    "sJQv/fIzAR/Le/HIbcRltt3lOYtdhR7oLFfKPiOw2n+wDc4ettigR8DuJoMZmM8wSscJL0Xh"
-    "ocQNMLW9CZQWwn1q4mDk44jPj2F3re3QkXRg7364QG40cBMAomMAh3UyA6VudaHasdMld4wi"
-    "jLFCjqZi70bMGCyYNR0uXTvAfFJavrgRZfe1iCCXAQCxrM/GA0V56ijqX0V0jewuwCDtcvrD"
-    "TA5KV+n/aWy37TvcldYuq06//ps/n+596APUDQZ/AU7TZ8whPIrsiIdXz5+Y/vBTX01rl8xO"
-    "nV09efFB37ftCSQdr1yQPZ/trdAAAEAASURBVPrUHgAk5Y/SO9CIA8IbUdYfTDu2CSzPhKmI"
-    "V+BsaXOsG38eEG59umNU0az5XIRpl3nkbyI6VaMQC7pLeO+BYxiE7eXw8hmkwwHRHE/lbuje"
-    "0+yYpfzcNOPGm0sYfPXw7N7T12lzB7CdxQJhNMcsTQNksfnlFdqJ421c3PJT8a5jPDrpW5vl"
-    "lZ9zuNJveeebn8vXCOLLCIdwjSj5k+PO4XLM+a99OauBZNWP4GBF/84SEuOUdJkGPscim7Jz"
-    "PL6kqRJ+IYHhq/OOFOS5KM+vQ/n2u8SY7KvJHC4fPv//uSI90oj7a6Rj3JXFXEnfa6f7WpHk"
-    "snutNCp9++wvypQ2G+MaiY957zsxNEqri4KiEfpsZL7zEs/xnQbuBJgLdNhfWSGZk5Mn6wAl"
-    "4Vf/+RfxGveIX/Y/0i2nUdIQymslSAh6jMOGwM9/3uNnkZXPBd1D33JRlHFGfgo6CJzjsfMR"
-    "v/mL+Cru4cZ7Rupl3BaP/i0raS7SlgrpxC3oJPYIz920vMUfnjOAJA4G9Rwmpx8AqSj7XN6V"
-    "cfNsWsXPhmyjtyXpdwi4lXnPCVLztsQi7aAxx6mjZBUfeY6X6BzFU0y0JUD27kAXAJX0bEjZ"
-    "BpCK8XCNADMxWRKvk7K2bQRncm8EZwQJEGWirnrtAKbphGr508xi4nMyVyFYbpYK2+pkmJag"
-    "RMVUgYBcoTnsdBuk4x85eT7VaLDTdgrhrkqdQDVoaj5UrO8EXDmZ3rtuMTal0PuBM3MRmtUj"
-    "mjN3DrveulJfb0f63N9/Kf3N115M18+O4cDpE2khOlcLFi9AV6MeHaNFARb2wI1ZhoihflY9"
-    "kxQ6SOjJuN3cSa+OyUV7WOpmeXdHk/lT5NPN7ijFHu42DIOL0GsZaEerncn785//p9TS1o5x"
-    "UPW4FJldS021WJ1Gx8gBfxCNaXACdrQAsPxOn8cmFW5ybergWk1DlOPVx6TTj5LvLJSH5wAw"
-    "VqBrMh+bYBR66Ko9cOcaAB1HqVCmlqViToGgu8CmQicwKNrlVSblseTpti2bOMfwfPqDv/km"
-    "ux9Rpof7submezGNcCL97K//ZdrfcirNZ9fVZWhp7YP7B5FvvGcjXIYFMTkdP94ZoNO8W89C"
-    "HUHoebkm5EsAaht0MLdf2a5tL4p9vvjdF9L25/ek29Y3pgUrbw0F+8HzfWneoubUtGQ9gKst"
-    "ffnL3ybd82kOpgYuADj7oWPu9HFpCeJfdZZsT/1MkhRdnmwZ68R0l0hncd2UVE259Z3DxAeO"
-    "NQJfK4VLrtck/J4AVLWjC6Tu3oSij4Dfoq3JJbOtCbbwHpdefDQWfwI47/TUAGdy1SbjuJh6"
-    "8cMkFgz23V17jqS1a5ZEn3MjgWWjWNw2bv/evedw1NNUylG9uXKhJMgZg57a7DmNAICZ6RSi"
-    "8D0dfekoHNga9AqnsQNuahWHcZPuZ765Nd192/K0dPnymCh7MQlhmcuh06SDdePiZyHi3VXL"
-    "FwBO2SiyagkLgxo2V+xP27YdhqOXD9TWmr0ATtHdeES0tZypaX935+MjT+xMjRxf00kdv+X1"
-    "zendP/+7aVrtcgqGiQeRr0er0RQiD2tveSDNGn82ffPb30qrViwL0bVGV22fcuccV/op/zO0"
-    "63Z+u490oow/gZMaliFeb4P7dDJEghr2rYHrVsfiYSFgb8GsGRiYRReS8nNRshyx9NIlTbSz"
-    "hLgdETvgSkX70+zMbKTtz+QQ8OuIC7u62VxDeY4afSm1oMP39jesQ9G+gbaHWROA7JSqaenI"
-    "4TNp397nGWOwso9l/IlTPBqLSqXPWp6M8JR20RAs+OKyHeTWUThErWQ3203R9Ia9VISNEEbw"
-    "Gm6l6M4Ichr6zlwmAwhWQ8+XzDPqRxzl/OEc4hyWmSzSncGCi2VB2WXKLwAWcdvGY46EWOf6"
-    "POeQ74hymDDzEo7eRlyR+rCL/vwNEz3yW/lW8T1HHX+jD+Y/pceKe0VZDc1tfi7dK+KsCBWP"
-    "1oPlM5yPynId6TvIt9xzoLg7Joz5mXc99HAJggIIEFsGSwIJgUKe9HOB5sL02XiGODw2JtyG"
-    "QEbEYTwVP+gpAceQe4RzQsxpOvRkwFIAjSLtSvoy4Bj+HmEjbtxiciWr/I+8MDCW/kk8A5rw"
-    "kxt+TqsAQuZ1iN7iWfqCxvyOh8hDgD7ji/echmGtq5xeAZggxDIM/xGPZZTz611xoHHm1hVd"
-    "IWjAYcRl3MbhLw+o0FP8u8aAHzpSQ9+z+DTAm/T5Kzq6T5EWCec6LugkbJDB95yHXL+MbTld"
-    "aFVR1bwF5zKAEnExUAZiZ0AJ2zMAJt9VFjY3DtgCCScIuYylf5VNBWEqr2d2NXpfvIcSapFz"
-    "49HtPNvZFR9ZV+6oKsU8Z1nVqtM0A1s58zhCpxquxa7jZzB54PEkKPIywbv9Xs6NXJvpbOe/"
-    "H2Xq2zDI2dBQF3kRFJ1ELNfW1gHAqsfWVG167rlt6X+g+3T7MnSDqsZg8HIg/dOjL3HWYVPY"
-    "39mzYy8cgg7OYmvG9hLn8h05xmq+HZtBXayKG0Lx1slJYGgZaNU966jJjctA/ORJziUMpfc8"
-    "GFNo6J5gTJEyckeldoi0P1QLd6qfif0ik5VFep6DgV9BpEEW2W1I/gARcq5mAXZmC8KYSDRD"
-    "4Y45uXUD5H3DsrlpLVbQTa8eIDkTsVMdlrAFHe7YUr/HgblBYAVHQzHCVRsmdW3/rsfv0uXN"
-    "mA3oQwT4bBqHrsnXnzqcZoy7nNqO7E6f/tsvpZbus2k+x82cw35QJ3pl9SCHX/qZN6HkPi8O"
-    "82052gp38AoTv5Ov5jsczDOwdCecwFNgGpwy8mCblv4nHn8ive0db0y//+HfShOunUkf/K2/"
-    "THffNDOt2vggu7jqUnVtQ2o9tJMjhP4uPbdtb1q9oJ4jkAZCx+8n7mxm0mP7P22hBx28HsSk"
-    "48iTbVNxquComvprQgS0r+ssZjLY4EGN3b1qNlv9B9IMlKhtr/YLmmEYI/UMQ3uQYb1yn8nP"
-    "gqvYhUg7hfy4BFP+DOPlHUycFGTPwd7WIsRUmrGoRoFdQ5aCgHPoE7r5QB0mxdpfe2J3GkDM"
-    "hmw39L60U1aD3bdJcF/sP6VtMBc9xzFbcAGA1MBiwbMNt27bh3mKsWlXOyJtiPXoon37DqS/"
-    "+vjvIOZblL7zje8BFhbAwaqCS9jDLjp5oC7U4OJRLxdod4KbcbRJdb76EIVfA2w1YKVfsxIe"
-    "l9SP+DK4qXDQFBUGyiSWI0ePp8OIU8fifyJc2qMtLRgXHghgPnnS9DS1Zja+GGdo+2MQFXe0"
-    "7Em7Xnw+XWCnrmJAD4UOsMLY5akODpbVtE85v40zJqXmuVMBQ7Po/zM4YHoneYAjSv+ybXm5"
-    "uPMAadcoJ0+epe/AUYVzvWntYtr+5HQQUHYAGhEE8j4akwwcK0TfUUTrOHNm4HQsXEcDBPtp"
-    "1zc116c7791Mvk6kyYA4z2ecMAERcvtZzIgch8vHIgFOtHqBmiugG0X7sI3EpBtU5WfbwXCr"
-    "KD7EzQm6fOeBlzx+5xB+yRO4oXHzfyQwHG8ZPEJEAw1PES7GZpElAbXlFXMkn/MGEcZY+ly2"
-    "65c3uTivODY4RmsrLBZ86L9ZL6Yr3DCJmPMIG/FGmlIqbbjxLi2RD5/jOyHpg2W55Lw45xQd"
-    "J0LnP9l/kW+cIsxQPEas47DfMh1dyrTy13/HX+IJ8vBqPQRg9Tl+5ra8TDT78W6YcDE8/d90"
-    "bdfqCI5570/92MN6+vddOTcmXhIS4SKFovBGfBiOtUy4LIDhu36MV/BRVsBwuB/1ZGYj2Zy1"
-    "eMnvfCg+5gLOMZTpGSj+RYnEnygQv5t+psUw+Vm/8WicN1zRgHDPDYXGVoQpvUmPVxm0eI2a"
-    "0a2yysLjiD85VI4b2iJzpBD05zT9JvjwZ4MVDIZok3uZX+vKq3znYei5pM+7tOS0wnd+JrDh"
-    "DOM3n6Ujg8h850NMyoIIbWEpynPV6aWI0J1nTp52SmmRQ6HSv7sFNafgBKF3OTwi/qCEm/Q4"
-    "cOt+QU4X4bR3pYhEoOJdkwwqZctVmw1oWt88LzXAsRnH7q/FjTPS2qWNaQ0ih83rlqQ1KxeF"
-    "KKS7B7MG+1rSwcPH0+O7jqVrbOtX4dvOMBlTBe7M+uHz++J4GfPk8RmrOR7mb77yePr6d59J"
-    "mzFq+ZZ3vDXK4CgimEWsZkczEXscjyt+yE6nUIBW30wQafFZZg78/mLHIfnoAthNZ6u3ARSB"
-    "elFtqQpRjraJ3Pm34/jpsJVFpQbXyqHxLJMERRLzmLbEZsJ5mQJ3zzLpQ9G3A6vs7nnzwGcV"
-    "veXczGIVr5FMaTFNxasesOu5etWIdTzXbjyAK8TdRI4whONkxqRGdFFmjYVjcGh3+soXHoGD"
-    "g/kF/E5C3+Tbzx1J30YZX3C1uHZC6jwDZwzk0QAoVYlfQ6QtAM8eJln1uDz+JtqX5VG0TzmY"
-    "lodn7Mn9lD5FVIoTjzBpfeRPH05vftcvpvnLNmPLaWHa+f3Ppd/7xL+kO9ag0zVvafryZz+Z"
-    "Xv/WX0rbDrSltVhCf+7QyXTX8qnp93/nF0Ok5q6yhQs92qcK8REH+NLWVLzXkrs7/qy3Y/0X"
-    "0vvesCG9/133p1/7j/8hLcS6ed/x1rSX42vmIL6znbqwEZgparJlx1QCrZUXVYK7/UQolIGV"
-    "bnqzdr0LrARxy9E1mjtbMwtXwkiuitq5f2DjijqxvFywCFhsB+pbbdm8kV2Us+Aw1gUHuQ7O"
-    "qUrlTgJX4Eoq5rbN9dKuFPUq4lvLUUcvYFusGV26l451wjG7lD768T+h/6X0Vx/7JJzBbWlJ"
-    "4zTsvs1LoyiXbkRz4wH5AiwNf1pPHjot8JV+udCZc40oF7psuxoEPgeoVtQtKNbch+Dshe2H"
-    "aKvYsEMlwB2sp89dTQOnjqYnHv0iSu3H0kD/ibRvx5Npz7Yn08tbv5f++mMfTS9yzmUVIOV4"
-    "exdc3K4YGzRwa5k6Dggo5Vr7Poedgprm2Lf3COLsaUX7cQGaQYJ9TYOrVwH2P9x1KDiqEJzu"
-    "2LCIcfJ6+s7WfYwRnOkJwFWvU4mDYlavzIlXD9RdkICNy9gQ62XX7qJ6gCbiMspboCyIc8HX"
-    "jR7o/gOt9MGzjHkT6GuzoJNdmpdV9IdYwFiM9T7yz8v58NVXpVt+jnH71R5jLI5K8ZtR6t0O"
-    "VF4857c8F8S3ofSLsZ6CtG5j3MWzbVDuo/WvmyDBqGOxGzvKNfqaF/km43eV5mNeIKz9pKTJ"
-    "fMbcYQwVZBmupKx0D3/4GZ5/9JWvHEf5Nuw2wr2If8hNosvLxvI/cVUWYS7YVwcu6TfZSJo/"
-    "ph3pk1yAUtqfc10ALEkoaHx1bP+GS04ghy4TifiKBEu317obtfk3U5Gx/CcKWv/G42Xs5XP5"
-    "bsAAHX7Hr34ieJGTCB+EGNgGZcji4jkqU8f4kD/m18Kt+Jb9ES5nsYyBu4AGxyKuTLqFnL2M"
-    "pEU3m1xxEbfeShdp9SrDBr06BG0j3cM5PpknBn0mAAGWfgP42MiNnf9+L39lOP35k5byWyB1"
-    "3Oxs5XNeYTidZEoNL312IvOduX+mlTtgcLAAWE5IWUSYAZZnjGks0Y4rLJBW0xFYqfsjADCN"
-    "sgykqUwybFkJsnBSX8WZQS7NMGcMe1bog6i47oqsBs5PPTZ/VA72SJOsdP9KiKhUOj9wsDU9"
-    "gk5IF0DkDFvsb15QlzZiMXzdTSvjAOSnn3kZDsK5dOH0mTjjr7F+WhyP8grcomYAVGv36XTL"
-    "qkWwyy+mL/zDVzG6uDjK37JY3Lw4dWLItBvulBwGj3M5ixK5Je3kJ+fPAd8yFFQ4WWlMsUbd"
-    "GjJomel+huNYVP6+h9UydrjTU/tPxGA+CA0DiCdgYiV4KyEOjE0DLOnPM8EJFDQ5oaDtIr/1"
-    "82vT5k1rWOVXI3Y6irJ+bygN21NOdPaEIvuihY0osM9g1TohzGC8woA5BronJ7goE+D4XOxL"
-    "pzuOprGX0clpnAqXrw5bQB4wfRmxE9vkNQwL2Grpxwo31buogTPimBBPYheqD10ibVpZJ/Zk"
-    "8+tK2PSta8GDW/gFtooJHdBtI+eZ0DWq+fCf/GFav+l16TDK7K6w5y1BqXnhvNSy/Zn0+5/8"
-    "Rmp9+ZvpI5/4eloF0OhBn6cdna/f+fn70k/99LtCx+jrX/9Bmt+UlelNezrcG8W15xATCrIa"
-    "2EXWemYwffYvfjX9yoc+klbddHPohHmw77y5M1ML+jX72EWm2QJ3vr5i/7DTcFmH0UztGl64"
-    "+8mW7M9e4U9g5U9gpfsCTAgsnYsFfMpIcKC+zorli2gr6iNeiXbgCQFyWJ3UBM0CjNWrlqWl"
-    "zUsAXZcDUDz//G6AwXi4T030J7lYjgGmgKiYuPoof7nBs1HibkaX64dPHE01VS5QEAGyieN/"
-    "+9Cn0sHj/eln3riGxcb+EFsvof3OhIN7igWIfdD+7C5eL+svOOKAFy/BzpVX8gHfkydNiV17"
-    "9mlFlII7rdDvPtaVagEn5qMX8d5K7K3dyiaSa1erOWfymfT8c99NL2x9DltaR9PWZ16kbYxJ"
-    "c6HXHYA9tJ0F8xtoH9nop3E4+ZtPRYD2pcNH2+GITg86BfEep5RNMQBi8WeY824CQP9vIW2k"
-    "lvK6AHdwIaZFFK+2t7ZFHToOdSNaPg8HcxJizhxukL6i0dMx0CBHdXQ6jC7j3RsXQScbVIin"
-    "yt3RLkoYdwbYFCJn+YkXjqcZVZfQC2OXJX05XXNBqDFV2r2Nhst7fi4bTzj/yD/h/zW+Rhxl"
-    "FGW7pKaK/9FIMwfJwGWaPFK3uQ+i3sF4WqqX6FfA6M+6tn3nX+ZiZX+MPQBcdSezH3JGu7O9"
-    "CLzUMzbuGMOlqaRPEm68MqnZ9V/xl8tqZOAok6I840uRVqQdPRFX6Y9/I8P+W2+V0UYkrxng"
-    "BoKLvGSOn8QUF5EFwLrBe/n5VXcLPErdYiwCxa18MQSeooBvCB1hi+Dlsx210m9JR1movg+5"
-    "Fc/le/nF8LlCLU5coaUMXxaQ37MboYsIJNlGFf4JF1dJmC/6q/yFh5F/rNAbr5Hpm4Y+/FNR"
-    "8EU6UlzSalxDgC0izf5zrgw+9BTPserArRxg9e0gFPGRXEmZZWzakSR/8soEt3imgzEQlcDK"
-    "CTBMPPAtVieGLSMaQX92FssFOGBwDSvuTLweVeOxFIJf7ViVR+vkFbr0FuYfSEsApShN2qIu"
-    "SMxcWhbSKfhy0h9L5w3uASBEfSxXqRGG9FWeH2BnlPR6BpliAneoKWbqQDm6jwNhNY7pTr3n"
-    "XtyXzqH0PpXwW9bMjyNg5OwECAAkTWRC+cETu9It65ekH3/jpvSN721LVUwSgwA4B/saRErf"
-    "YJfWd5/clt73zgfZdbgxdFac3Pbs2hcDulw3uUSLly5iskHvg2/qN8WOQWgLgIkfJ33depiM"
-    "PHIm6oPyJhso3LYx2U0PZfNTx9vQ/8FOFQBLuFuPMv8szCyo++LuqFJp/86V8zjXb2laCDhY"
-    "sWBWWoDJCTciuCr36BIPZFZk4uQzGbe5HF4sN0CugOXZUDeVA3Axu3AVgHOhM1VdYcfluQHs"
-    "ZqFzBwAbz5J9CmmeQddHTpCD6TEASA+K80tnsqMS/S4nKw9BXgu3cAX6aZ6t56QosJYrYBsw"
-    "La9sciAfb1RuALiIDpsiKcWIq9auCT0XuXmDg/0hYm5edx96MLPTtu9/N31/JwZjuQRX77xn"
-    "Vvrj3/ut9OBbfhqL8d9Mf/b//GNau2ppgG7blXon2lNSoV9r3+blUM/59KvvuSe9/5d/PSaM"
-    "ixyVYt05gSi2W7VqYapD1Pnoy0dSNW3gkjp9kaJt1R6Vr8pn3fyVXaYEV96Xz6Z8EdvZvl86"
-    "0JW6sOh//6aVwVk0XSMVaApea9Fbsn3ImZrP8TPqVW3H9lcPBlSt1403L09z58/B5EhHTOSe"
-    "zXcS7tNYaHcBpGHWdrhAbW2t6TY4X7fcvDg98vhLqbt/MD2981haCNBjQyDtjs0Q5HXvwcMc"
-    "gDwNkDIjNiJYV3mhpfgO7iv0OYa6CIgFlvmH5FcQUbuYmDDuOuYMXk57AFW7jpxIh+l3czEN"
-    "MgjYElzdvWYuHKcGuGGaK6kCJKFIPraKNjkXEKOdrImp6+SZMB0hN4rlW3DB3ckqCLCvKwJ1"
-    "8vdZ8yG7jpxMowGoS+AuD6Jof5LwnifqhhzF7e60FIBtumMzJlY2pGXsjFyysAFu7cywkt/K"
-    "Lkj7tflSBCo4M8/WneOO3NXpADHr49RpzmQF5N8FwGIZwAKll/bERhV0yBTl9mPsd95sFnWY"
-    "iDh77gyg5UxsMpkwUTMm6EQSqfHmsTmeeCuvssWU99I932M+GekUb+U4Hy8G5XKBXV4xn9g4"
-    "45ddzWtZnlGfBVfKr4LJCSx4AiQRj/Ub/h2QCGfZeJfbnrlc+CGcfYsPEW4sC+nIqBHiZk4j"
-    "fe+Vl2QNe8zP4bnSU36OfN7gHGVivsqr4jGI4k9RJJIx/Fz6f417GUVltD8qZCXtERWBs2RH"
-    "YOoYnufVIQ7Wa6T3I52MQGLKTMZd37jnW64MX/Vb/soMFN7wqtIdlTZ0iXx9gfzCc45Rl5zV"
-    "ynt2HI5/yK+eiGA4HePMtOSHeIvvpqO/TGMulJLeEXeqyIE6UxGxFM+mKjfHbwVyJ9KyUUhK"
-    "pp5bSVAQmqktm0HpX995YPOJizD+G1HWQ4WTK9IGniexDLBk70pPZZxFZEVDiwwXz+S56Dgj"
-    "8it5uWCimP1Tkj3kDy82KoGQqxuBlYORelEiedNXROghzg6MIzhYAeTkZmFVHLMAihCG80jE"
-    "pJdXyVl8GOAKAqYxgEmWYkjBG7eYtA3bjwhoGuI9j3CZzCpe0xC1iL/mop81HVMCGsfczc65"
-    "KUze9Shjr1zehCiGCQ9QowFSdUycbLSB1HHiZLrjzo2hNP/YjtZUP02L8wz65AtVLvS8XkkP"
-    "bFnP+5X04nMvc+bayeAcCFjMs9vE56IYr/5VB1wtjwRyUnCbvYDLCUuaw0YYE6lHlsTBvLip"
-    "B6FxzhdQJq7l8FmNefaxnf4a49icGZzDhk6UYbVwfx7dEPWs5Gg9ePd68sPEDBdI0CiYibql"
-    "MF1thggJ+vKuTiYq+p4iwfHQ5q5OJ6pRF8+maycOpuvU4Xk2BFxD7BMrVOK8DmAdPchxRqzy"
-    "z7JT87FDcFoQBy4EmE0FsJ06dRZzD7PT+nUateQsP+rQvGZlX9tI1uXQpAPkxwQmTSpyd5+E"
-    "a0Ie1LFxZJeb882vfSVtvHVjmrNgFW6jUabvYBIcTM1rbkuvf9N96a2I9X7hA29P//mXP5B+"
-    "/J0fYLPC+fT1f/xS+iFGRjdtXE0fyOdakvUoL8tMjpnW2d2V1zANBXgUnqdM8QgaRYGIlFDi"
-    "v4yuTi070yZw9M7Z/j4OQN6ZqgD1g+Ql+gB0Vl6Vbj6XU5zTjtCyHnC2csHMaJtd7Krbhdj3"
-    "1uZZ6Z5bV4TIWpFbbg9YU6IcPfJFMxkCTduj7aLteAci7ZYAt+vWLglAvmfPgdBvO4VuXC2b"
-    "KjR90Q9nVs7Lec5u/A4K5gIBtPLCRMaWW9aFAVv256Z57CDs6IWvxq7ZceMFzhMBH01wYs7R"
-    "hzFfQn0LVAJwUG7WUx4OnGCzCGnCWG1bTQ7dvOef35oe/o13pI/8Xx9OD96xPn3pnx+jj2Cq"
-    "gUDrKGPPKJyMPuHxjhbAyyDiYoy3ks9Tob91NfpbHTTVA4hcnLlA8qig8xc8CJ6TGuhT7s6V"
-    "O+6B0iq4XyDuMQCspUvgwtKPHQP7EXvL4fZyMeGxV7alF559GQ4uB7f39GLRHttr7HK8gE7e"
-    "QY41yiJgwCPtzvyWY5p9w12WPXAUR7M7UHHnfZw2MK16RjrW2kmatXH+54GDLbRPOLiwjsdP"
-    "kIM4PXV1KObmkOixLJ6qBcsc+wSAy4ti22OQmB/Kl/JefCpvttvwbuMqw/mo//K9aIR5kZpD"
-    "Vn7Xmz/HVOfcq5SJSutyRKVL0CRXSnDlWOFV9tcISOCwkxibbkgs/+cu6JZzKmcLSQULManN"
-    "c4Q00htKGsNX/hM5qnQnvsrXCq85n5UOPEeZ/Ijy0qttNSIs6dTx37jK9EdGa0SvdZW+i2++"
-    "GhDvlq/5jxf+hpmGwlvF7YYIoNYCdkVeFq4rGSeDjPwZWKiY2G2AcmIkhkcV44K1yLOsVCd/"
-    "L9mJWUzkLhkrmYZNeEUtQZueipxmUZWvuaFJWWQAj6+4swpxjYHyd4FFRtahMI2NmdAJcnDU"
-    "D/GLKhVLWAG88h2OCw1H2j3fzXdpdvLULQYZPEeaOXEpIC65RRJqLeaKiEbNs2Gyu9+lne9F"
-    "frJL/pudyFdE4R+jMi985zniLeLWPXOVqMCiEk1HcKARSQNZrlkpP0dg0KCbyPLKJVd+6VbG"
-    "6d3OJ3flFVaclpEdzEsyCmLie3CorK+irmICxpecEY/7EISEHSyUUh0YSw6WeQqqoNn4bTdO"
-    "rg6MDm7qbYUf8uCqWdqNxytAHO9uo69SxwNgJs2KyASTiiFtJycZlEPRFRoEMzgx8WZFYM1C"
-    "aKV9GgO9YhR3WmlZ3nPk9NfV1Zc8LFmdkm2tp9K9m9fFoPHki/uZkKakM4AKr9Ns/abm0yNb"
-    "d6aJtJGGQifGEwFcBV5ALOGKuK5+JuKOfsAIh07DyXHg9rw6dbxsD5ZjqYNku1HsIPixHiy3"
-    "WizF70G/ZDpgaR7nMHqUiNwfuUQ7jvelAerJHXCLaiel229eGlw4JxPbv30p4lGRnbbvVngb"
-    "u6ZGnTiuMglfPA9nEDHGqOvYvBoPwGw7ms4dPQhNKLOSv0HK0LakqYKr1Osl4qhbOD+tvf0W"
-    "DLLWpsn02yujsE4/ajA9f3QgjkxZzrmJGmukBUe92DZsQDYldbx0V/SEE2XFgdmAA0VCKqNX"
-    "US985j8DNeWgTs9Lz/wwLYAjN3vOYuqIuCi3KxwoPbtpZWpsaqbvczwOE/KxQ/vT5z79meQx"
-    "MPMaZwNmVZCmDcFzsk8Eh4ha0x6ZYsJrbPFfs6IpxG8gxzQGcxe1HBB9CXDlrsTJU6anT/zx"
-    "H6SP/NU/p0WA2rOIYDXb4OXRNz7alr1soT47zVhW1jMaSWF8dMPiujQf+hUFPrMPHSg4Z7et"
-    "XhCizmpFp9AWCyLqTPMkxiMwHqR+NEWg2Gsi7bgFzpDnQ27d35nGA1C6sddke7GNC9zVdZvD"
-    "QmLu3MYYG7r4Po7I5qHnpQ7RYz94IS1rbkr3bFmdpqCk/NTetjS/diLi0otw+prTfQ/chw75"
-    "mFgMjKcs7NvlKtz+pSV9xbSWqcrdkzmkW2K3PbMPm1en029+6FfSj7/vv6T5S29Ny9duSm9/"
-    "8x1p6yPfS7M5SmnTbWvIm0fyXAjgL0fV8VezB3Z4N8AoCnXTiosmF5T2bTeveKh4/+lsR84D"
-    "oNswyaKFfTcrTIBeujH1XYN/DJ6yQzKX29kw19DUNCcObH7yhy/S73rjDNMLxPcCdq4mueWW"
-    "DFQxJuzRzAvpVSHjFivQ6mmb1ociSeoBsxZaje+nDdy7aTk7V9EF3H4snaKM/+mJl9n0cY4y"
-    "1nbfJTiuE3iuQnx5hpMm4CiOwfApokm5XWPHqOOI2DBq2TGeMmbMyJx9xm7mR5wcsOPuc8wn"
-    "OBnGfSd2HPOq+/A3v+b33EKLxln4t/4sU+fbOAGENC9jdHmQxdJ1+pR17W5mQVbMz7RFGqYh"
-    "IkzMZdDkeMItaDFtH8UEXoJlAZacbrNX0uNzzDF4Nmz+RSThJyIhfEhuIvMR3avyFnEWeY64"
-    "cXAsqbwqyyM+RTLm/NWXIU0ufj7rJRx9GL6G4yw/5nv4H/YWYaUrMsitDOecNOa973jjw+G3"
-    "/F5kpKQgewYsAWTiVHYmQhtFoGUqJwANJSc7+wJWfDX2KLdCkHKByUWEm8GVFad/6UA0hHLx"
-    "ec7O0vK2lRDouQBg0hMFWdBU+R608seCk3vjga+mYeOQFvNpozEdB7bL0BOAKsKwo4xdNqaZ"
-    "88BKmudB8ib9gittqBivPxG++bABlMCFaLnyQOqzVVhWY5RV2ZLCX+Wf7LvSJecyu1gGEVvZ"
-    "Irjnxpkd4lmv+Mt+fcw7FQRGDuwC3qgXkopQxZ8MUnO4yjj1lRE3nYV8CnbcyRT2kEgn8kNc"
-    "QTmNJfSsLBPaQLgSv+IEJ3EnU+MIvakYOLJZhjDvQOct47I8Q0xGHPqXcyC4UjQZ6RCng5v1"
-    "70G/crfMWxQP9AqwBPeuPK0vV/pZx0kr7p5FyATKYGJ8Ktd7zIuX4Ef7Oi3HT6Y6VryT4FoY"
-    "52lX/UzIAsNewJXhmcPSPMw/OCD1nTiGX0SO0DiAUr42tdTh0Rr9JrbTr795LSYcFqbt23cD"
-    "IsaxQp6Xbtl0S+R3P1wGV/lO8patYh/zHpMK9HjArfGaB2npxYCpgEp/TjqW8S4sk6ukrYeO"
-    "rlNpd0d/Wt80EwXdmrSa1fs6aNASuOXrz1K0jrMuRW4I1x0wWVNMZBCXM3B54nXsWC1O1eNR"
-    "ZO5u53iek9je6kqXmVyv0o8ivH0RmukQqRoQuWrjTZhIWJ4mT+dgbLbrz0bktXf3/vT04XPp"
-    "PW9anxYvns9uR9oRg7b938nJevFycPaXaQT0MrF3s7OLrFNmcDrGUq9T0Tt6BZ2sS4h6JsGN"
-    "nFhNfBPS1qe/nzZu3pRmL1iJX+ynTcYYJYdKX2KC6OvuTP/wd59KX/j8lzlvz7Po8k4wiiEm"
-    "DevcvikdlmknZ01+iR2htyxvgKM0iclQzsw1zDycSGdOdYbO13QOof7Hz3ws/faf/gPH7ExN"
-    "Z9jVZvsDW0S5IBUjxtwn7AU+W1PuMFRPS3A1Dc8bOaNPgKSV/O2t/ek2zpe8ZcNygNAsAju5"
-    "Oi7mXW+2PY+YUsQtd2ESbcbyOtHZjd7brLQMXb/LgNzrgJKn97Xb6cI0gu3IvKlf+JkvfJdd"
-    "ifhd0YwYFHtj1HldXXXowQnkbRkNs+vQ5VqEjp0i/fPp9Q9sQY9wGf0aa/4olbvANM68+OUY"
-    "HerRsc8xIZS2EalpJqW3tzc98ewT6afftyX9yof/MN1857sYdNX9aqUfsTGkcXE613uEnXrH"
-    "os7NCwREOi54XdS0w+W1nlyAZSO9o8KgqqcyTES/TzMP6p/ZdwSMB1q6UxdgR/6U4SAr9ULP"
-    "AqzKT4LbeAX7K7YvF2872MTShEkVz2P0SK06Nqo88Ib7o3z37GtlmXEl3XrbzRwhBHBnDupg"
-    "cTWDXYSSSXMIsbnqAl7n4OSOBRhrQ279MnYJ17NTdecRgNrBNKd2TJrDjkoXgOcxlzJ9KkdP"
-    "ATm1aXbuAuJ1Tz9C5H7xXC/0DbLDEKvvxGWby4da50WtebTMo12ZuRHXje85/zHXlf70Et6M"
-    "YeRlmdhKHWdijGf8dk6UseE358oAV44RQ/xXQpCnoCnqjjgKunAmjPNMHmdsw8G9AkSHwWGT"
-    "H6In94/yb0mZYf1Xumcai6/xzTj8blSmHY/5j8/FN2mMK95zjGWcEUb3VxfJ0Kcc1vhyNPFX"
-    "/5FGcf8R4StChP/hPPGFMNax5Zd3EUYCBYEQlT3nKMq0BSIX2LUlahWpZu5VBltGdoGGKttR"
-    "4hxgrUxZ1TGBMMmVAEibT2739JuGGZ1wAukx+GcUTwT+jx9/eMnlVxbgMF12pkvEcYUGY9gs"
-    "hiIEjUaarkCzeh3SPC5Yx3AsoPMVGpnyZhuKjc2BzcIYAlHgNMMLsrxLe8imaYTGXV65/pzS"
-    "guRMdFnppaehu75eo7aK72VjGQoelTQMpiAkhy7vxgbNTmSlKMbGXjb+TJHhTTUii5RMp4gp"
-    "6M7gKwMswZI7uFQOt7RHM1Hk+PhOB5Xrop9ystRabSi1Q0ekQjIOoIb3chDIYJfOyzcHeb8L"
-    "fHOHN06eKWO/unI0bkWCxmeJCcCuAGb4HwPZZOuRD/o1HyVIsc26UhZ09SCu0jaR5eIk6hEq"
-    "EuAW9m4Axlx2VQlAzJO7trIFeAYU8mO8LeyWW8O5eStWesTIcVbXg9Q7NpmYbB0MvTT9sGHF"
-    "AsQ2pznehnPe2DW3cPGCNB09luOtreml57fH5KGBS/Ok+Mc0BVruWrKtOrCFLSPidKLU1tdJ"
-    "tuZrNVy/bhdXHPHUnjYMXPamOkR5q9EjWb9uaeyiqsMgqHbGLkCf7dc4bZOKneQC+mz5jxvL"
-    "MT2Ucw8H9t52W3PauBZL9efhHh3dk8axCBrn8hgweoXbJMUETjK4V7Pzb/7qZWnRqhVp+qxZ"
-    "HFqs4jD9B85i7fQp6F1NgqYpqWo61tzHaDtLEUMezAW75iEWMpSXIMX+pGkM8yzgsT3NbmxM"
-    "t27ahHVxbAtxsHVD9cV08/oVqZa8qix/ZdSE9NKzT6H4ja2yBStST9fRdKannX59Nv3gO99A"
-    "9+0gR6XMKdq51Uy7Ic/WZRa90XZpB3s4auW7Lx1KD93alGbXs3sMZWnFwnKAnSB9bm85nL70"
-    "mb9Lv/mHn0nNiLH64SJdJK+2P5ukbdjLFmCLp7gCXNl6VWT3vo7NBVoJVyfxMazxV9P+tqDT"
-    "p4FaRcYBNvBnHPY1+5e7OCfC5VTHalxMwNfDbIN5Od52HE7NqLRwwWKOIzqbDqJbNQZukud5"
-    "qrvnrr1n4cqoOH/zzSsZU1GyhjurVfYB4rd/C9B19yBvdREFftXs3FRnRrHg7t1HAJ+9AU48"
-    "89PysvzsGxdYCMs9vMAuQIFDD7vp3vjQlvSRP/ubdPcbfi5NqeWg6sFToSc5HvMHEzAfcQl9"
-    "tu4TRzl38kQsUu3vFt4ldKXUjbIPaIPNw7sV6yli9vIYJHcWu+hxJ6LtrIuNJfvgWsX5pfix"
-    "zB0LbNv1cD0FyhrFdQhxUeKxWBPZJHEK0d4s+sf8pgbaGOXBQvwQO/1uuWVF2nL3JjiW6oSx"
-    "CYV+88SOQ6kHnTh1LB1TFFNanvYdOdcaLMYiAxs3TqYODLN2dvZhIuUinFfOSaWdMwVhL2wp"
-    "/Z1tKXLd9UveOjlq6fEdJ9Ibt6xJN22+g36vzTfiYoehNqUmUF6OW9cYswJkWgiRw3iIP9Hk"
-    "inbnN/M9fB/295pP4Zcc2XAJ6F1Jg/Om8YzG9E6eN+2nAkrij3GDj0NpArsY+2ynOfG84C3n"
-    "BkXG9nPBVSlefE1aKhwzvpC4nIjvQxfPFW/hPOxzyFf0xcgXTqV/52pjNAaj9F7OdcMhC/9l"
-    "oMoPPle6D5VB9uSnys/ZNTuGO/4tai9pc14DYMHBCqokhgjMIL/sERcp5XI1n21huMph2z0F"
-    "awO08OUQXTh/lopTSVRZ7HgaEtwQJjQLfQKDhxUoKFO8dRHZusAmAyEaNB3aCnQnmG5RmZGV"
-    "XFA5W3mFEsTwR1oDBJGO3CdFH+5WI4Lw7mpMACdt0jjOlRmT+0UGDMGf+hjGcRkxlcdEGMgJ"
-    "OrNKM53BwaIDmtfMYcvI3dRzOflkLMVlWZUlXLoN3S3HCr9D7vmhbCxDwfGqW+luvBG6vBNM"
-    "kGL+zE/mYMH5oRxNaSQpOZ7huMrEh2XoiuwGAaOKHARB5s84vQwnSNXwnxOndFhHDhZOGCol"
-    "61XxVa4TV0v6skwzJ0Yw42X9m1YWJdKm6PBlfIoInJDV5XJCU2yicU0nOGnxXxWr27KNlpOo"
-    "Udu2DD8FPS3FT+qjOIFL23TsDKm8LKeySwADh0BRhWILrXObXwd6j+YwP90ozc9i99jmOzay"
-    "Ku9N39vWmqpZ0fazgp4CwOtl8lyELtSC+bOhlzMBW49zbAuT34EjqRUL130oriuGNGPS7aSi"
-    "qNC8BQhGpyMaKR4EoZaBdSlActJ0l1+2DZV1pY6cOJVqEDt6zI62rOSU2Z8MowJ9gCgGONuC"
-    "dSW4sr6i+ng/RZ5rOBh68z3rsPKO3szOXanz2WfSK9T1ZepxgP4zEYXdsbBfXqGOBWhNcDZW"
-    "br4lTWuoRwUqT465L6mLxgRMGcwEqFTXoDN0irbBJDMGjpjiW/MmmLCOLQTpUVzqocVa+xd8"
-    "VFW/ku594C5Awe3BWRtzHc5V1WCqR+8MviNGGwGlUy9R/lmM/IXPfYHjUdZj/XtW+taXP5M+"
-    "+RefxP5YJ9y0abQVQZ0c1ryBwnK0PQjirIe///Lj6drlC+n73/k8XItFaff27fRpRBqMAYIc"
-    "dUf2cizMH3zqG+npbYfSCswotDE5el6lZahZB5cM0U655+UEE3rx7DeNrGrMVQOcxztOpV1w"
-    "GresmJvWrOKcPhS8raPYmcc4ZPsVZCs6rgc4OvKqcH73vVvQ3WvEJlVncHDkTBmura09jIQ2"
-    "Igbsbuskb69gRBSbUgx1Wku/+84N6T0/87YAC089+VyUyRI5VYCvYy0dTOS5HLrYtXqJigq1"
-    "jIB4mSZ1jWoAPHKMJkCfme6A26dYzuOSPNTaRYptrae3O920cRW7T2cBrLFrNg5gzTE419lF"
-    "56HbjuE7n/t++uzffjb62zSAsnOBk7ocMetGrrZ1Y3/tAxDJuXVccDE1Ay6PY7mLtAPHujE7"
-    "QtqUb/R/6sL60CL7eer7zfesjzjbseHlAkVxsWOHRz4Jzg8dbk1L4azaXvfvO5Q2bbkN/asl"
-    "AKUeyncwNqbsZ2fx2950R6qj3z3L5hKNygrMBVjWUx8g22as6PTYKaQazHNnOfh9GnbMHKP2"
-    "dmLmZZ67Pjkg/FhHOsTi6iRldAEAtX7FvPTXn/hQetv7fo1dsDdjjuLptP2FHbFBQdGv6gSW"
-    "mWO7IljtZ73qIg1Hfse+aIHQZBn8ey/HA38xnlNuMXbS562Hcq523szzs4CLMYryrxRfO386"
-    "zuU4spkGx/8AV8z1AnXnTb//e66gocLjiHDmr+Lbaz7aESuu4fB+qCyfKLwKn/kx4q9MJAfL"
-    "HfxVvv91hwhKXEZnOQ9HkssdEeGbHo4oyox5j5+NOVMR71SygEPQYgXEKtlBHpSmcqhgygKX"
-    "vW0lCXrkDOnPihQtWymySs+eOR1xq5chN+sKk7YTjX5Fwj5nGoZpkcaSnqCXP04wNM0I70rN"
-    "inZglWp1NRRDAhNYVeXztnRTPOiAZjo23OBgQWsuHGOmkND1cNIVUJJoAEqtDg8heb2ZSC4e"
-    "Q+RHyysKWQ+VV+ExfFa6Dz+X6ZfBc13lStJXfDch4ij9OnDIFQiARefJk7dr45zecFzDFW9Y"
-    "/0VMjByGjRU/5Se3T5Ah50c/TlxOkvpxpa+OlaDFy3J2QIvwJBdgD6DgDhzD5E7JgEFSeZpl"
-    "AoZGAZjcFt3156Aa8VHncmy0Jj7O9sMA6/b4/I1VHv4JHgOf+cp1rykIjeJJR7GyIvsaNw2A"
-    "zyQW3Dj0RtR9YhRPx9pOIJ5BGRXOj0rp+jvFIC8AFIydJ4/TCX+SQX9hUx3Aqz/tONgZyu1O"
-    "4oK+c9C1iqNDZiNyuYS448ihEyhCT0i33ryuEIsrDsztS8Ofi9hOPx+dkDlz58ClwgYV6V1x"
-    "wUKZuvpWZOaEI4BRrKVuzRH0wWoRZc6A27CEQ3CbURZWFGgfugi3xYnXQc3LIUl3f/ZRdQc1"
-    "GtqLPa4+zDdsvmttWomtr3NtLWnfY99JZ7tbmTEwlkh/vU4UYyj3S+Tb8yFnzG9ISzZwhBBK"
-    "z3Ln+tra4f4ywFL21ymr67QFaRwNKHGCqEEheRqK4l3dPcx8WvTWbhF9knyXoMIdbpplyHm8"
-    "lDYgKtt814NwETgg+FxnunIeLs11RP3ntdAvgGGBQ4I1M2o4sJnjSvo4CqZqajq8/0B69okf"
-    "wLHZiSmFRsAMHAPakONOnhAgkrJwweaEazf4wdO7093rF6R/+OcvMzZNSbUNc9MMODy7MEwq"
-    "CJ1MHO3o4XzxezvZDTktNjS0dw8ApOGwQbMnAVjK1r3t2J/ASh0nMGWIrFbOrWEX5vToN89g"
-    "VmMGuw/vgVOi2FQDvU6P9k2pu0LdWC5yOjUp0n2ym3JPac2aZXBCa2M87EY0aB80gKK+ao5h"
-    "2bv/MG1lWlqOWYfWtjMJHX3KBeOZiAN/9mffHse2/PaffAEO4HWMenakufNQLl+6EGCE0Uza"
-    "sgvM02cwPwIHt+b/Y+w9wPPMrvvOy17QSBAAGwgCBNg5LDPk9NGMNBoVW7biFkeK5X2cJ85u"
-    "NrvZ9XqdtddOIpe1N97Ysf04djYukossyZJsSaORpo80ncM27L2ABEGCRCcJgn1/v3Pf98PH"
-    "0WSTl/zwvd/73npuOf97zrnnYt83jUzpLowbVYH2H8A19HAhonG942U+zmfdWTgN6eQMbLlm"
-    "ssPDPrl755H0L37pd1PjlMOpbclSxhFG3MyZM2fXp33bX06/9W9+PR0G3PSgem3Clkpw5SLC"
-    "MeHl3GAfEWA5Pj05QHclBAtw1INx/t4eNj5A81ror2NYhrxTccwbpiGoXcBB5h2o5G0bN6bM"
-    "o79ov+juQzdu1HEe5q7dhxkHA2nTvWvZmduSDu0/hK+wC6FuPo2rhgce3oj0dAUOUznuBzqd"
-    "YmxONl/mAOcn1ZnT4HMj127jF21yaiLt69fgG5T7zAAHUjN2jl8YSceQai2dPzutWt6VOtvb"
-    "2c2LKhj7vjVrceQ6d15I1nZvfzedOXmUxdj5NB9bwdk1uJJhUaAQwjlscgAsK1l+rCk153/U"
-    "nT+ZB/r+v/EqeFJQUCLaG+lTAizHjR/zz/w3S6FK3mto35XgyVxLQYlhwv0O85a8wH76flfJ"
-    "q6rfRfrUsSxTrhMlgwbVeUebR5mrYwc5Imx12jke4SxkUU/5RPzOfyqJSJKgYJl2/ChpnL8j"
-    "DM8jjUrMHM935RW3/Ilv0+NjWSyb/bJQEeYHZaT3/WYAKQFStOklaHJSc0U0zkRrQyjmdhBZ"
-    "gGzwripAVYcrFwxvGUFXsNMS+OQGZhUg8y4kSAIuJUWBoElEY2AHopcd4L2X+VshD6J0EMsg"
-    "7TBOGtpaafzt6nQ6k74IXImHeTnAS8eKIZWDKXnJqPwrUbWRcJJz5RQqUVE8g0kmFsQk4wCC"
-    "/rLCXn5L5Lh8ltPyZ+4Mvqz++Kv8baj/ylVkU+YXKkLKbr2sU7nqKIsTnYM/8Q8yCph8lj9O"
-    "+zKO/FympJ8mz/2qSJsMTyfxtwzT3VeK7m1L28+OJMAK5kMY72WkAiknT1esZXwHoM8tm+nl"
-    "eAI3mHaUic5IG83CoFTpkn1glJXoVSYgVYbXqCMYKiRIhjOO6jqNPnUIGAe2kvYUmMU4rgec"
-    "aC2rq2/Vmq56XamHk03UIv2I8KWLBbL8ThK6jBgjrhOrwM2JeRi/VN040/T8Po1dZehj5Pfo"
-    "vSuhOcedwIh/4AcfSz/8qR9JT/7Ip8I30QvfeiEYqn1l84Mb0gLUYH0cEn3yeHdILRbgNuES"
-    "KvIp9Felgo4RAWMLhvE6xFStqQuHMz194TCzBtDpUSqW07EU5+wRT6atJDbTn8pTHa+rOEMc"
-    "5niPpdhqPfjwOo7ZuZZObn07ndm2DXUMO/WwP6OW7PKif0LfKQDe2QC5jk1rMVTuQu0zD6B5"
-    "JR0/uD/NAdjMbW6mb2EkTjz7mHSbTPvqr+sO/aYGQ946VvQDSFNu3cErO9IOj9gZQdU6hCH7"
-    "DGynbsFsalDnfPjjH0lrNt6n8WO6dO4YO8EAGJNZ4MCwUBLD+Dkzj91tA4CySdglqQadPov6"
-    "DFxP/aO0DzsJ57JL8SZSMFVPGl7bl7wXMNsnpzLm7et/83evpH/9859O/xI7oaaFHahuD6cB"
-    "zi+876GnyOtK2rv3YBiM/+3Le9NSjti5yVbN4/0syqCL4Mq+eokyaLzeDDO3b3s6gIDLWbCB"
-    "PnPf2sWh4jqGrc8xPMI/ed+KkFrpqkM6uWhQLeOGDueLGsCE3sLt3yfxcN/Z2ZIe+cCjCdvz"
-    "dPTAgbT1rW2UHZ9VMHj79WUkOG7mcIflYWya3DH32GMbcMtwIe0DGLbiWuNPv/oKznEPpZUt"
-    "M1GLYQdEH925c3fEWYjD0e6TvYxFpIK0yzM42PRcxUVIpqzfDcaGfV8a2hcFPHYkpV/aL6pa"
-    "zItRFyDWHDcQ7MrdfM/S9FefeyOd2P9C6j+/g/oNpV5UrF/4kz9Pn/vma6jU2HwwiG0j2gp9"
-    "sQmG9Xtn+wT4hhbO9Uod1Ygo/VaarI3ZIAblswinMbvjniEd41f7N5dceswPWzjOBezEkayL"
-    "lOvYY/XjP0seoNrQseW4cFGiSk7btqNHTwJOT6cnP/o4Ktg5ALJmbCa70rPfeh71f0/6sZ/8"
-    "IfyUtaTXObR6Gv1H4KkJwkU3/kCTWqRYR/qu4uqFfkh+s8hjmDZaDNr92KPrGAP0XXsHfV/p"
-    "+J6Dp9P/++VXUkcTZ3dufjgd27c3bdu+l0Ox3+L0iSYWEC30g2z0b3k1n5F3ZSjv1DTB82wr"
-    "+UlcxTjPj/xbfooXPCnvihhBd+PK45yXnDtiQU4/FPD7rARa8jyTtK0qn3iQAb/zr5JKwwc/"
-    "jMJlDJF5qDlxRTI5DRKqpBWF4508oZJ+8b5gBmV0glIT/kcWPHXeL68c14c+yfw4vyPWe56R"
-    "XZFGVQIWMK78rPqN98Gzo1xFsJxRfl7gksice/OLPPmj0EkhgnP6lM/8ZJUnd0MUCcatmRRp"
-    "B5jhnYd7GjEGHR1YiZaDU/28A8X4NpzhlBb5TDAD+QNYXcWGw/AEywUifaVYMjUPgA1VnI1P"
-    "g+f6EzaI5+CeuCSu+fhtpzQNozhZOJkJBBW/zoAp5M7kJKLNVj7TawY7lWxgVYRKgQRmIUFT"
-    "UkXnseKWUzpa1/wOxE+HLNvlrs5UPMxAispZQZ9ByNxJsn54oiV4LZHL92ZYuXLKOaZhTM70"
-    "qi7i2YhZRSjAchWRB0sZNief081qFCrDVaLriXB2Cu2ZsI1jkjPDLM4HiAqOobOpCIYEGEoH"
-    "HGTeK+kzvSziZ3VOnQUBeoQ2nnn43vCxU4rBLF1dLfvJqsQoVQ7DJOa5fPaZWajCalg1e3jw"
-    "DOo3GwmL5QmjUNK8zaGxtk+AN9InWfJDOkm+gjgPZ5XZSCPrJDDRhYF2S0dP9WE/gY0ek77n"
-    "EcZKlbxvYG+hb6l+JvlbgC0n7usAS4+wkQYXMHZ9lGNz2pYsQJ06Fiq7n/2FX4OBtwGijqSV"
-    "6x9OixbXpu988wVsizYhpZgf9ZfJjiJB0G9QM44kz3T3AKYuR9/UJkmVmv6gpJ1uG7xXGqRR"
-    "usDQOihdEBb7TrqqcpJ+JbC4RnnHSLMWH0QPYPfRit+nK32nU887b2J0jCuJBpwxUgfpZWUc"
-    "I3WohlQHtq9diQE7BzXL9LAVccw1zsO9AEeRyHiHBwfDjmV2LZIv2tAxFgwB1YYMRYeMM9mm"
-    "PszhuENsgR/miB/Tn4T9zqXL19KWB9YitXoEEDk/9Z05nq4NHE11GrjTTtryTSbfOzCZy6PD"
-    "qef4iQBgdvnpSJ200WkBAPXhBHPSdH11AbbpO+74ckw77qWVTFRAXFNXF3S7PnAu/fZ/+pPU"
-    "tHhFOnPqALSeioQRg+ldb6XFnSvT+d6z6U++9rqdLy3EMdQaTgKYRnlHaf9agPNVmD5Jx25N"
-    "mek86KrEUmeva/B7tAJ7OMfonkNn0gJ8gT2BY9clbbh4oN/5PMYnZbKN9M2k7y93inrotfZA"
-    "X3llZ1qG1GMJbgwO7jmQjh1lQwNOcnVNoC2hbT4DCdTg0FCA2zm036lTZ0KduOm+DRhoX0nb"
-    "jvWm9jkcGM05nBQNOzbAJfR55/hQGhvsBWxkyZDzqn7hTiAd8gim+c1z41gehhHjPu+0nYVa"
-    "TJW+c50LLhfJXo4lwVXMMRA7Fp4octfge60fJ7PHjpxPB3ZsSz/3659LW/d64PfcdAIVay1j"
-    "8hy+r24hcVUyneuVF2jM3qEGlVaqSw8cPYtj1+FU4zgnnlKrqxTO/urMh9AoLsGuzxdzBNCG"
-    "dahBGTejmAPoJ6sG9eyeg0dCypadEQM45zfRPycl/V5ph9Xa2pja2zuYX+qwaRtIzz/7ElLB"
-    "tvT4kx8OB7U19O+lqOFf23OM47HaOA6oJsqzainqUOaVLtS0s/gexFZsjDKuxRP+Q1u0VpDn"
-    "AABAAElEQVTWMB6RqAFa169fGe2jLeV+VNjLW+alv3pma2qtHU2nT/Vyvz9tWLEYp6dDjN8B"
-    "Dt1uor820kcA7wgrwnkpPEbBg1zAdOlKmQh+F3Swf5VXhJFKhs1/KuG8yenES9ITHAmwskbJ"
-    "hVPZrt8HeBjncRX5O+f4sVAxh0ReE+XIgS1BES++/MMT2qC87HNRrkirfGqyE2HKpxGb5yHM"
-    "iNdlmJxv5rdl6Px91zOCK6TJoV1My69yGXN28qccRpr7IwQR9PlSS1Lyt/gdzwFPkSat4HcR"
-    "1tx9Ln8L7wr0j+ymgUSrKzdByIlKKy0R2WbmqJibQYAdleBEaUY4KUNFJ4NwAlZlKHhRPSdA"
-    "MZwHljpwFTmW6NmGltimK3gxrGg+AF3QKxOgGs3H4+KPaVlxJWl+m76TvxRVohbgjrLaqVyt"
-    "hdqQ3wJCCWcdJGgAQcCgonMnGDuJAECRvnWawepPEGbdokWqC0F8r/gb94Qp+0HRtJXfPs/B"
-    "I45/ctBKhMpzB1F0lqrwlc5DPmEXpwSLeoco18FCPcsUJzIiAf8X5ay+t61dwdhJZPTjzNJK"
-    "w7RdcfKTLlkq6cozG9Q7Cdv+TgrSW2bsFbZb/LIs0tAw5unH9nSStlPbyZ20A5zRCWOwRjkA"
-    "UEiO7BPuslGSJXPVDUMdK2qNwAVJrnpzXciX9KCElYt7bXy8jJPzm8RqUymfKlBW0LzTX1Yz"
-    "ByDLcCzDLJiYdbnM4cgmo7RLf1nafwliBpFiXGGleoXvR9e2pU58RsVgI6wStDqY2+KlqzBW"
-    "xr8OO4YO7X4H26GBtG7jBozdd6Wd296Nem3afG84Oty9412M2fuD2dZhbK3HdyUGuU4AVICU"
-    "tkEyD+2tzp/vD+/TjhHBVIwVaGyFBcVSwPGl9GHDptXYNa1O4yN96Rg7vcZOdQNcAJq0qQb3"
-    "trfqwNvUcWFXe2rDkL956ZKg+enjx3DfgHE7oMrVvwzFMdlLGiODA/QRFxwAbMaoE7PASONj"
-    "JxnHbV09OyCnjIcqb/ya9aDdsKn6yMcfT2s3bMQ4/WLqPbo7zZ2JCg6gof3OLR18UX4nYEHo"
-    "FRZsNTW1aUFbW0jJ7tjP8GA/BylBc9MMjKdH0k0kZyGlAmDbV6SJ0rLT3aikMJT2eKbt2/en"
-    "fReups2d9UjMHgSA4avrwlnG9+wAwft3bk2/9/tfSJ143f4YB19Px85Mh6w6x+zt4/iX6Nd5"
-    "JDmihpFiKMHwsODVS+eH1O4CKtjjpy9ia9OOG4RlAd4Ffs4XMU8C0JR+27YDqJ88JUCA7STc"
-    "i0RzMvV9ceep1HPwEHnj6BPDeufYYQy0xwDZG9jM8KGPfTjNBpyc4tw8PZBPZxH67We3puXL"
-    "sO+Cmd/A3OLd7gucz1cXmzFOQ58Wzur76Z/8aPqBH/4E6uhRVITD7GY8l17edYSapNTaNBMQ"
-    "UBMSW8e00qMA686d9KcwFdA+j74v+FHy5EJEaZbvPRLrDqBaVwtuChEsXbp8O30UOk5F+rjj"
-    "xMXUyDi+SnrO7hfxkm4Z5qNGbUD6qJmBeToH9J4b4Iij3lC719LWOhZ2Awla1rSmrT7NR3LY"
-    "O5J3DyrJ4lWqY8HVyUaCFvx/9XCotRs4lJg7Xy7vXIIRej80x3CevqnUXWDn7mNtypwXNPR/"
-    "d9th3DecTx948n7o3pz27TyGjd530bDgqoOjg84hkVS7oTS5Hqmjtl2Oh/Y2pNHYWJ4HYM2b"
-    "MTltwbmv4F6QuokdxY6bd3cdYvdvd2rEjtOFqtKwr7z0bnoTY/rH72GzCHXvOX2Nvn6a/nsl"
-    "5tladiDK49ScMMyC1+hGwTpk3kfl6RvBp4vvuIe+zmn+ie+4r9z5i0tulq+Yi/1NGpWHVe+k"
-    "oePRj2EDdNEuETzytb0tFmHKRIv4pvnedPOcZgDTy985eM6pzM55xf6QL3l+AXB4ZsgAMiSQ"
-    "511/8zG8iXpP+PxdhKUdyjABqvwNn3DxEfEizRzWNHO6vIu0cj7Vz+O9ZSEfeZ7jO96TnsCs"
-    "cl+kZRifZzcNUo8MKwQqqskjiFhSEWIzqTo5uDJ1IlHU6+pAFZxAJjN5piMK6UQtQHHVZrql"
-    "pCgOtC2AzzREtyJ2GXz4nIIIgjUn61wR1Aa8i3JUtWY0Ir8NIxO3cpbJNEIqQuUEQ06q2mVZ"
-    "A6vhLhbDxaQMeHAwCLAkuOFNy4C2mcQJ8MW3IENDfetvh6v0ExO1QaSXkSoXz800rurnPHjP"
-    "T4O8z6MiZu4kdwWoys/Vu6tc6y8jVEokkLFYXhap7OCRR1nG4nmIgk0POgokZerl7i/BVQAs"
-    "2mIyYMPL9lZqVa5mTU5wmkXM0K3o1LaZk4J5Gl67LNssysd3CbCkO1EgVaa56UzXjo66aPDp"
-    "5JTros1UVv844TtBW/aybmUYv11d92F3pO1MlBOaOPmOXGI3FJnJUAR/ejJvAmQNwpiPDyCh"
-    "wcbiCrZZlwFSnql3RUDmN7894mTD8lYcDa6Jc/1sWxcLqj0akPp85+nX0oqViwEul9PvfvZX"
-    "0//8b/8oNdcg4VjVzm41pRbTMWxdggrtIvYre8II2e3yHZ3tsRA5cpTJGMlF7tdB6mAQ+jpy"
-    "d5Eg7AIGyqF2ivbK3QsSR5/1IGZ3it3/2P2pdWVnOrP33bTrS0+j3kP1QvuNhwo8S/BUpTVx"
-    "pt0KpFZL2peGTZHnrF3FAH0cQ/waJB6za2tjAnGsXDiLDRYgRrCnHZRSaZ/PxiO3m0LKlZwl"
-    "8kBny9GIVEzA0wYIeOypDwWQ3Pn2O+yk60rdx06mGagFW1oWAmDz4sz0Lp7vC1DdgjpVtaeu"
-    "AZxaY6HFzsTr4zc5b3IB7TqW9h+5CNOsIX/mDdqoD0ell0ZHwteTffL4Mc4mXNPOQcdT0m/8"
-    "6bdTW81ouu/RjyDZQyI3pyX19/Wkf/2vfjXt7u5Li7RHgpnLzIZQHb+LDdUIQHoh7eZk7BmE"
-    "9iuH1CBlWARgJHDauq+bMl1PH3niXqSZ1AWm6djJqqksNVWtK4A/wbEuTi32TVXPDz32IDZ5"
-    "C9PfPPMGBvVNaWc3O0Q593Gevp9QEU8DED/x4Q+mVWvvQVqpY9RraRu7UhuxMXIhcIHzBhtY"
-    "JGhvt2ZNF+cJNqZnURHOxRr84S0rAFYfQXK6MF0ExL/9FmAegD4wOIxbD9w4tDXhvBZ7vqZ5"
-    "IRm1XZVQClKVHMf8y7jzchOL+YVdJWW3/N4731xhF+ctwJQ7DN2xJ4g0Hf13rV66KOlUFUKF"
-    "mk/Z7zA6vcuAPcGKknB3+507P8QOwWEOg0ZSCZF1cyHcrgdAbVy9GDUm51cyZs9dwAQFybSX"
-    "Csw5WPc3Is2rQ1Lp0Tn9cTSQjmQ5mYBFok5Ge3ou8Dsv+KWTdXPjyBUWUXv3HWbckse9m9Pl"
-    "4evpK19+noO1T7G7tIFnG4JnPP/qu+k09erGvuokbiLGR69jX9WWejD+F9B6bV7lOZfYBh4/"
-    "EzziPLZzz7/wVtpLH9LFzDzPRYV3DAxf4Rip2rQEG7qTpzmbc9444LidxUINTopPUU4O1Z6O"
-    "7SnjyfDFpOeIijnBxUz0QQa8c8TEx6DOnvZOQ3s5n8eNd/EuwjgnG87/xpFPGKySnlFzRJ8X"
-    "SRiCi18+iIfFfTy/+08JTmwz+0ien8uImc9UJZSTJU/DOY8YxzLIj4I3gDTLdHIY3skzTLt4"
-    "Jy/Jv/Nz72PcMu4MK2gT7Hjvx/EoOMqfvCkmYwYk4vT1AEuV9xkkmWYJqKyb4fVhFmWKd0Vc"
-    "7nP+xsv3SLCyH6yy0YJkEhrCx4d732XJSFCYlWb2pSETFVgJokLqYzhnElrCidhLCZZE0OBd"
-    "YKMkKNtqKWHANorBLOOVqK5gs7RoBpMHu/sYsMbJZYvkivvoGrmD8DcjVImQwYadVGN7vzUy"
-    "zapEBmdIYLJ/Hu1EvKyLTCeXu1ALFsSRkE44Mhy/DWNZrF9829eCJJku+d5UpZ3fXvld5TtH"
-    "z6/u+luGm3hId6JT3P08d1qThWHCoJTYCBwEJVkqaAZl5sb1k39X4kZ0U+ctcene8S2gLP1H"
-    "yeS0Y3LVFiCXUCFxIl+lTOZnen5U2Wn74H2IV/1mrDg5C7Asn2G0R3F7b+QcImPrUMQhgvTN"
-    "UjNUxbSbICqLWgVotBUd39W0EizBRQZyVIL6RbNwp/GpPbCHc+Y8H28mdbD2MrawL6HSdn7b"
-    "b+HCFoylF6YlzfVpGZP5yraWtIrzCdvxgbUMw/LNa5emBzYsS6tWdMRBu3qld/OGk4F2Mbp3"
-    "cHGxmNX0np0706f/+S+ntzCqXb94YdqGv51mGLxezRdg0Do0MMhxJ/vSveyE6+jsBGz140fq"
-    "cNCsmWNxSiYnYPZsOpmZXrx9Ll3dXShjlWkIHG07fQhpKN/FxP/Yk4+nJs5cO3PycHruq1+D"
-    "WIxF1JraWl3HceVNxp+7/pau7ODw5C7cLiwIBi2AGmcxVAvzrseguRbgYr8n03BnQmWhFZsE"
-    "AJLOAQKfSbShRxHZyFMAq7anfdE4jsV66lyPxGnV+nuRetxAcjSQPvmp/y4tXb4u/T+/9rup"
-    "GzVOK2fy1RBOx5+Cq0nkU8s4M77t7Ph00eCkaB7T2P5/4UxPOrP/IA5edYaKtCPyy/ZCHi10"
-    "uruH9r6T/sk/+0z6qf/h59IDjz2EG4re9Mu//7XUVn8lda1an77ztb9IH/7kz7JLcDgtYMfp"
-    "9ZtX0wkkmUNIjLafGALoTE5P4WR23eoOOvCN1I1rBKWZjgsNro9fHA2m+wSSi0ceWk8rpJAw"
-    "ytgvo4JyB6tz3Rx2w7mZYdeeo2npkpagnXVTCqsz10VtSA+xn/rWG7s5/HlOem3/uTSOymrN"
-    "6q70Q//wxzHEb8YYG4D02pvpV3/zj6nX7DjySTB9BSDfxvFPlwHg9vsuQPW9AEqPT1pOX50J"
-    "+N26dTenDOzBXg0DckBvM31cVXMDO2qvovZ2g8IQINhFzSrytE8NIGXyBAQl1o59D0IW3Od4"
-    "nDNJH1T1Zn90LNv/7BMCl8tIvHicujjw3HhvsCuzgTE3A5cJd5A0KukcQgp4jB2Wd+jTZwEu"
-    "Z9nJVye96EpeSo5xZ0X4FNIfpuU4BusWPpuGCeQ49pDu+5HsOW7dhencolQqmytkx532X6WR"
-    "7jK1zM4rLsocT/qZU+2v0b7+7QbxfTd71pTU1rYAn2CrMT5fzIaBY+m1Xfs5q7QptbfU4WZj"
-    "OYC9i/GOxBEpIBAo1VDu+zd2Ur4x3HGcSTdof3desuShHhzXRVvIV9zMYj/uuahTXO0t3f2r"
-    "m4qaKP++/RdQGQ/wbpTxdB0pJeeY0taOf9s25spi/g4CS+QY/Xz5VnrFN3+hhW3DKMzfjJ1y"
-    "XuSh/3MY7qoXqD43ofj2vrgEZPbZADCCHj+kGd/l76rvABe8z3EmgI+CAAGKoMh751/TcW43"
-    "rHOHApvgHz4nbORJffK9PMLnOe14VoTJ9zz3HZ9ScmR835lPTstyO0+RP3mWeZVlFoi5gSeA"
-    "XqSVyyZN5WlECKoEfb2HsBkLVIjFb810aDTf8dj3FU/u7w0s06pcRiLRkpGXb9zmPBMgk88w"
-    "EswUKiryD/FYiO915udKOxvBK1VyAAucYlsvA8Z7B4HSIY3SBWuuanX6OVWQxHs5ai57rpjl"
-    "9VPUO+4z4zQfdjMx+PRAHMADcMQIjzJZLcX2gi9RfDQ2iZTpZQkQZbE8gAvTcSCXz6tpUt0l"
-    "y3Lk9yWF/GXalVjc8KM6MD/za+tz96vcpNVxTS4/taFjAMNgA8AUNJzEhGeCpmnQiawcfPmh"
-    "cR1NubM4u0lHO3O+j3O/WNEKrqRDLiDxi4nQSSJLy2g73ocqKUAySXGZvGWKzmnH5Z8TsuBJ"
-    "oJrpkfuTq+QAYYSx//heKVa5Q86Cxj8SdeLUgF3jXyWneRVW0I18g47kfY3JScePI9hRzUDK"
-    "oYpAo3GP0RjBcD4PKlbUqAy1yapH9RLHy5D3OAsD7WBk2K7uL1wcoF/C4HnnESZmIjNVIqAB"
-    "vWXTcFlpSt2kG6F+GRwZZOV+J+07eCb14r/q5ImTTOSD6cmPPB71e/HZl9Ozz70JnW6FEe49"
-    "G9dR+tuhKrT+StlKGzjpeRnJksxM2zElbjIwparacGn0vOG+jbGQOfDurnRndBy7joXpj148"
-    "mBbNQc0K3eZwduEynCq246tnTktzmkw6N5hkZI71TOiCpxmAnVu05bmTp9IQ9la1/Has2s4Q"
-    "AJqzixS1fyMG8PU4G+3r7UWNhZ0NDNt+6OSp6wNuGVPsYiT+8MDFdPzwqfRPf+H/SouXbaD9"
-    "xtOJg9vSn750BOem52D67OoD5IZtH9Kh69D1CmDPtbWqp8n0sxnML1M5YPfwgb1p75uoWq9O"
-    "xXaLvkp+TA7pOu4BphOmHyncIw9uxPHlb6b2Fetjblm66mFAZW260XckffWrL6et33sJVwxf"
-    "Sy0w/nV4o1/IYd6zcPtRw2cM5v/Auo44w9D+oD2jh4bfpDyn8SZej3pQg+YmmPkP4R5gKXZT"
-    "A0hO9COllFEbUFXnGly7IKslDY3iF2KkP4JqUPcVgmXVvaN4ZXcObMEW7/rIQNp+7Hxahapy"
-    "d89oun1pNN2zoQumO5i+8sWn0+e++EbqA6R+6pMfAEh14bzzWCwwmrETcswKHNyM4XFQqvWV"
-    "JnV3nwvJTiv+nxoBV6qcBebOrx5K7Pl/umpoxv/Wh5AwGjdOEWB8HcQ2TNCupFijc1WD2mXa"
-    "98OFi2OLuUbHozro1f4uzAiQvlwCbCgpOnnqXDqFVNE9gy5sZkA7D2ufzthx9+VF6uPc4G+H"
-    "MkOH3g+eZezWAlzG+O5FCt3D5hIdiS4EHLbUzUgLG1G1Dl+NHZsCwUiDMe2ljZuuUAQmniHo"
-    "qQlLcLwaoId6K+nyveNLY//e3svsMNyTNm/pwgZuMX1xMePpEup8znwEfDeymFrGLuJWdgMq"
-    "pXZ39WmkYj2oeul5aQ02WbaBNNm4DGN1QJNngyotdxrVrtOpM+w76dtKwj3PchLhambYJ8bY"
-    "6TklfH99/fUBgOYQ+aglIXFoU1vXQF0yqKCimXfxiiaP+asEO6XkJ9T3zkYG4L+Xt8bNoEig"
-    "QDrFbwGFPLpcwAYYIULMjdXgxfnbOJWPYbIEqAKkTMc4RbxIN4BUBim+y+Aogx7z9Hd+Dvii"
-    "zXKa8ALmGduwTEtAVEnbOLwr62OZgs9E2aKyUelc1uI3c0nQBH6QacNz+luF32dmFL/ldYKk"
-    "zOuzsEh7bOdAcYTzZeCCCFe8L+JEXO7jPeEiHb7zYc+RCRlbJq/yd5QkHvgwMolfJKTRZKwy"
-    "A8TkBLOkiNITVnCjqk9Vj9/ZV4bqJiUtACo+ZpMrqtGduw1hwIT1kplaWAdEpEMFo9BRthJc"
-    "SayiXBDGNDNAy6BMgCSxrJiD0bzKvHkR99Yjf8wnG+SH5MvJHQCZVZ8SOauoyoaJQga9MtGi"
-    "WEHAqFTO01dFeTNxM20ynb2nTNI4guU6xQ//RFxf5CeBwhkAUZ+IKuBAZM9kKJN3Es2qOjoC"
-    "dcuXiTjo8i+LUrkn4ehwhuBFGJvz7eSZVYCWjAj8D1Qu24OW7toyHzudwEpjdtvdjh4+kEKU"
-    "Xwz0yF3bvSz1cheaIMtyONBV7yitcEIv07a9lXKRZMSz5Kady459Bkwqdgxi3aFUIehE2fyO"
-    "yQG/A9dRR8TAI+4o9h+zsZXQBUFuO7fKs9mBCXAUZqbfrOxagAQo14VzQ0gVDqZdgKMd+7vT"
-    "FBivh/Bu5WzAXQdwOoojxhn0kxOn+lM7qiFX+trWqM4bZoJWwnUe25/62vq0tLU5ne7tSTtP"
-    "9HHMxj1p+coV6dvffB43A4fTwxh9P4AR/IpVK5BUXMShZG80jkeiOEEICFVt2Baqb2Ry9kuZ"
-    "6DDMTu/SGkCPYjMizY4cOJL+zX/4cvrPn/vzNNrfl/4eVcUi3A5Mouxda+anzg14QodRjEPr"
-    "KYBTtG5BU8eIY3KMXY0jlENwrSrKeujEl8YGwGRpZh3AQSe9F/rOx9gUgLpZxEswZD/SxQYN"
-    "R/vRj2RFN0ZQW27CD1cbZgOXiHsiffO5t1IT57OdOnUc6V8DjGZJMKXJHCdyFcByh/j1lMH+"
-    "dfH82XTg9R2pe9+JAJZybbp9QvmGNIOJGDuu65T5fPfx9A8//Y/Thkf/ASrAU4CY7FSzfcUW"
-    "bLLupP/w+W+kg6ezaufJLe0AanaW0fe0aapD9blx3QpAdSM18bgjds4BDFSJ62xzXs0U1M5X"
-    "0/2ohD7AGZRTaP/jx3AtgSG80hOZeSNuBhYjuZzLxgAJ28uxPUojO5ZRN7EgcQ4f7UnvYMy9"
-    "sB7VLRL63bsP0U9q0nUY/1EkHF0Yyr97ZiR9+Ruvp54jp9O33j6M3RfSJuJ3YFS/fjOG7bRf"
-    "L+cZLkTFHdJimLk2p0NIn9QAuFNXNRyyh2CeAiRVTHZu50ZBehzyjEG75+nZt3/rt/4KCeco"
-    "zlxbQvpYR5ncuSqop5vwDUCjnV0khRqUPuHiQCYpKJEGU5hzdO/wLsbhbx/BEN95l/E0DqjQ"
-    "3YpjD4wZ6amAFFD5caaKsc33HPoz/JzrTmoDTNUxbofx+N+6cC4S5GbACh7+Mc4aYxPCNQCi"
-    "PracD/Qp5VhRumZ9HdtzUN1pK9aCA2B9bTnmtR3UvoyZL8b9LHasPvf8Ts6cHGHDA4b6OKOd"
-    "QRoeufTmodOpYxEOaekbyNbpD1Pwb3Y+nRu6YgHTg6j4BNIH957kVAUOEmex0LF0ATScF2Bv"
-    "kI0eSjPH2RTj6Q91pKuEbgB6dC6Cz1CW2AjE8TnXUKte5ED32zevkZ9uWqYEwLpzm34iGPEY"
-    "BsEPHUlw4cWvaP8S5JSSGue9vIAkHPOIEiM3TGQpktIjAItpMohK4BLfpJt/C3jyBiQXVZXw"
-    "5O37Mp38nZ+5wMq/izQEZZRD/hLzsN9xL1DL9/Is7+MT9YlqRWewr0Sn4Ct4D+G4jTnH7/hA"
-    "y7jzXfAl7UXFIZmPeh94hHChYi3ehZYnNoMpPMhmNeYR0ieBkeH4lEAqu6jwWU5X3hrvTMP7"
-    "+J1xRpTSYlHCCG8ZwtGozyx2UeZ8wyNHF5lnQjHKnZSLzHPhy8xyoYwXxCnSKiseQIdnFiwj"
-    "RMOZ58QVWfPHMF6mYx6Cq0CPVMRIOV7+hra5jFFQ4sosivLFPXEim4jnsDKCyVDxCJeJFMyA"
-    "fJScyayy2jI3QKRHumXDVX+X6UWilT9Rk8qvfFMpaPEzl6Mo/F1ho06WswzCWzurg8ZnuTPk"
-    "12HYLMDieQYm1of8M5EiiUp6UCLflyWyc+f7KLF/+B00h+GK1qOuPI5OJw0JUA2u4j0dzzxL"
-    "WuTB5ookJy6t9cHjZO3KMYM3E2XFKkAsPpZE0BbOXqF3HixIGClknlSyuNgJ/hoTVkwkTCCW"
-    "wfpaLvPyuRIxbWdiUPOtFMt2VCqielPp0GV2NlkmmegwTN0VsUb1JMORJFfTJz54L57al6KK"
-    "aMEHUXc6za44oexcAJllc8fS/BaPqHHD2/XwuK4Nm+e/uUV7+NJ1bF3YcQRQukl65zG8bcAm"
-    "Sp9YHRzgvGJVFwyiLh1HItHXd5Hn7exAa4XxozaDaShBUCJiHWxbB6yMw34t4JKZWmdV7ntg"
-    "1KtWdKY//I+/x1lpa9IzX/x8eoUzFDtgUmM3MNQFTVle1SXuslS9Z2vm1WIWz7ugkf71MA13"
-    "W1280GeTBHDXU7v59vaciXfaaTWgTlTqJdiIidjAlNURJ62li6DCxcvWl19Ii1oXc+SOu+W2"
-    "p1Nvbks3p42zik/p7NunqPscJFxtGDwjeaENFgFEx5AIdaNCPfzKjnDwWsshzabrJD8TcDAJ"
-    "1dMI4HIMoKL7lMZ5S9LTX3sZRjwZQHkfTHgobOKkUXvXPemTT21OP/zhB9NG7JDOY2A+gISk"
-    "ga36zS3zsKtrpu5TgyHbf+2jOoftw+5tMUCmg00N61YuoS8sCDXaBXaIzeNw4iv0IT9LANrN"
-    "SAYb2Jl3A3p3447ji89tSz/xQw+zYaAOgKcdqt7Za8NA3rY8zZFNr+07jWRmVmqHMU8CIBxB"
-    "YtNKH9GY/kDvEDZk7ghMqKnq2QV3Lg1dvIC6eT7qpdlIz4YqdJbWSsQEPY5bAZfjyoWDizDp"
-    "Zj/3Y1jbfpiFwvYdB9JffuuN5GHUQ9hH6T/LUwTi6CbGkbRTWu1GiwD65KGkSCBlX5QvqD48"
-    "j7QqG4/PDKnfnmM4NyXudRZQs2ib2JhCegHzyJ8qxcVtXP4WNjjF2d/HmTpW4Fts7Mqt9PAj"
-    "K9LqtZ04Xx0MSXQX48cdp8dxPWFfUPIs0LP+zkOON4/ZCWDMCQuOI3cwWj/v5+I+QzMDw2s3"
-    "1oTD4OMnzkY5mliQCCI9ULoZx68r8L5vP3Bczwd8rl+/Bh9yg4CsUZyLspkCG0yP/KmbfTs8"
-    "xs+qJT/mpn6kiLqBsX76wbtB+abTLgO8e3B5Y9qyeT1z2kzicqB7E1JM5vBxzvocHroVu3U9"
-    "cP46v2fb/tDNDQUlYHGezUBI6U2WQmX1GGCHts7vqr+zSizmS8PToeKeMpVA7O5v88tASKJU"
-    "QBDtUt5ThMoVz/hlXeXT1fwx5mZ7G+1iv/OKe+eHmCOcJ/7/P8EHivAlT7A/ByaINPJ8I9+i"
-    "BJFeeAEgXTIp8inKUIanLUIIUZTJfuPc935lidES5S/zIVzU1uSNU9TNvCiDaeV6Z9oBsApH"
-    "o1H98k+Rsz+59VdOiMhlIfmuVLJ4RpI5ARqDCPzPBQjmF+HLAlWlH2nn9CsNxOB0Qi9BQ24U"
-    "CRjJxrd/yok8svM3RAo1JQ2d32WwZthc6Vz53EDc2yCBYgUU2vyUdZJQ+T7qkRMgEROa+Ni5"
-    "vv8qA7z3TVXYu+KV4fN3TpOwZXC/i0YzhPelWFhDOxmtQQSHuTPaySfqndOJmMbmMu28Iqjk"
-    "wetMY+lT3BdtF0g8R6y8i05Ee1Zf5mA5yjYoJS9KXJy0nKizx2DL5zQhaMwSLJmAiWsg7O7B"
-    "XI8oSGVQEzomjxJgKS1zYi07tK1JInnnH8+jPBToBnVtYIWrNMT3lkdbKg23B9gub6F7LyCe"
-    "Vy1Ev5OOyzoW5b5HHWWgR0/04tQQmQk2GO6s0hh6y6YVrDIxNAbwOalLJ9VF97B13AlrB16o"
-    "62CUAVjpl/tgEFt3HE6P4oBy3cb1IbXavWsvXrp70/qNa2DQnnF2AMnEgtTWrsuHC0EfmZMT"
-    "pzufnGQFcxmkqu4RYE5GKjSYnkLV89gP/GMY3+X0rS//ZXob6VvHXI7ihXFfx/P02MgQjHEK"
-    "TL4emuVdk06kXvZ1JbXSfQTHqnq8t9xzOXNQ0ZKrf/uHK3bV77b8DKQhSrNGUScO4+1er+dK"
-    "BDy42z6cGQM7DgGu9Rglb3v12bRgWVdq5TN47kT6u7dOphXzYc5Ii47hlLINKUAXIHGG6sfu"
-    "7rT/ze2phyNcZiJBUOKiO4cp9JtaAIng+TRgpOfsZcAsKt3meag3YUbU4//8d3+WPv1jH0rL"
-    "Vm1m52Mf/vAu0+9mpM51H2Ab/eL0zusvc4j2CTYldATA1au8IPCm6hvqL+h0M4y0aAFA6xJD"
-    "Y3WypJyno166/xhG4ud7HV16mK906ceG6tgJ1MF4Fv+Ff/5jodI71X0inT99Nq3myCElFgc4"
-    "J08j9g762CZA29df2xsga/XKpWkBLgF0b+F4mIva8gqqJW0Iha1KpY6dOhNSxY333kPbNNBH"
-    "+vO4J13Hk5dtJQCPvsLcEGMduoSakHKb9vm+flSNpyPs6vaWaFsZjJKNPlTiNQDY6Nu0b4xU"
-    "2lRAZR83bZl42GqRr5JVpXeXaYcYj9BtCoDh9BCLFoDqFaRXFs1Dsh2rqgG9VAt6K7hyrCrV"
-    "0sAd3Jw+/EBH+u6es2w8uZGe5IBqVbBHaLNaFjfPvbIP2o+Fqr8TYBqLJOosrxD83QDE5IWS"
-    "Zxjqgy1rHvQQ78LFsavN4xXU3bqNcS5wg0kPUitp5vynzZqgTAn7fFydqIY/AaBrAUQvxO3K"
-    "2+9iQzhvNqB+bqgN5zZwODvqwosDY6hH+yItAWeehx1jqHLpX+3zatLqlYtQIzcxpmdQll7A"
-    "9dKgoU5Qm1C/b999It3gnM0b13HhwtEKDXPmRTrO84zUoL2SUcsqvQNcMTayuxsoSkcNHlJ8"
-    "26cd3zG/U7mSJ0/89ln+0MAxB8oT5b/OARE/+Kk8deKTNUH5t2PF8IENuJ/4zpJs38WnSDen"
-    "aV7/DR/jluHk0fRTChz18Ln3fmcpbS5HxhHOUvldLnd5n8NGGQ1Bna1nlD/qX10me6ZhjFud"
-    "D2QuaFahHXlJ9/yblirKXAWwcmKRol3e3u+j+M6J53fl3yKAYaqikkdc5F9cOVz85ln53HAW"
-    "xsj53t8THSGIJOEiTlG5SprRjzJh41lRlqLQZRwLUOZnRYrs+KaBbJwoqxkQsCyEkbiiAQgX"
-    "9bGs1ZXMQYgeCcSviTsTi0IVocqviRA50fK53+W73Ejxu3hUFivKW0SZEAfD/JjMvAQwZSeZ"
-    "qDMvIp0y/QgadS2fZEBXVb/iRU4DugcNYJhMskGmSDAHyrSZiBB0JYvcuQTIDlJViKoeHShO"
-    "o65UWUWRXmVVRUJ2YAeqmxKcyGPQENY88oSRAZb2OuMwxbDDoiyWybBOPrpMCEDCxOML4/mv"
-    "TgDEe7dae2U3E9k2S+NmmVjpq8gVrhOXEi6Nze00a1a2kdatdKR3MNWjxngSR48yIMsss/Fo"
-    "Dhn0hf5LaRVh7bu7DvewxXw6q19OfKVc05gQRyj7K2/vTZOvjGBvpcPd7P9KB6MESnv3HOKM"
-    "TuxYYOpOqNq9WH/pYTvPQhIiANQZrOH9bf6qtv7db/81O9yuc+bZU2n4won0te+8ntaw9V+b"
-    "MskxCuOehANLd5/pyypoZtMVXTUWFLQXDRCAQzDgrsJz3T0wGqVG2FsiLRvFu/voEA4docso"
-    "dmUayGvHNWcuR77QzrcFz6RrX8zUxw0GYEGA9NLT30gbH3oc8LM8ffMvv4F3fFQedZNTdz+q"
-    "E0BWE+4DzpzpTfu+tzVN4vDcWTA5DXUm01dU5SquH0D1cpKz6faewIfZTVSIZ6+leW04QoXx"
-    "q9pajxuFN7773bRpy71p/uIu8m5A3TUvbX3l79Iv/68/h40R4Ap/V/lIlauAJ6SYMCz7uc5f"
-    "BVf2D22WtFOx357DlYC70ppgxAJ91UV6adf+SUmIzP04O0E15P7SszvST3JW34OPPpyO4qj1"
-    "9VdeTvPZeagNno5sZbzzkKzoad/zEJdg6P7M2wcBI3hzX9cFA5/L2ZPdYb9UNzuflykQVsKx"
-    "ad1yyt6ZmmDyHmulkbr5O2687I8CISW00kowpJQlABdlG8RuUKmc0jMXMxrF30AtJYAXdAvY"
-    "7VcXWHCoamxAzRa2MDy3T15DAqSrBqVjAn3BmjZX8Q0dRwAvtv1SDMbvYEMryGqgv45BR2Zy"
-    "KMeCKnKwtObkqEXly0egtQD/XIMYs//oRzenX/z5f5LaoNvvfP65dOLQ+bRs0dT08U88ltbi"
-    "m+prr+xPP/rUfYAndoKTiN9ufNE+UyltjHv7IHRxo0EY5pO+0jalWNqpNbGjL8YtdVAFqpd8"
-    "663qzt2Ig0ipzpwdTl34Otu0eSP1vhrhlQqOYXt3uqcnLUPqKj36L/bi2mEZwGooncC9gzuY"
-    "NWK/Snk8q/DSVVTRAgMux6DqSw8uH2Mn5pz6uQBzzmOsx3wCkO7uygHylpC3cWEyGye+2seF"
-    "13fAqvOmG8ecawM4FOAgg4QCYBTPMqgh3+Cr8tL8ibkV2gSPq/5mLjBMvCf9Mvxd4eJ9XsTH"
-    "e/pJGc543/dx/i/yKN/l8BPxyvjv922coFvU13vikWfU13RLOnAfoId3zmk+54//i8ub/Ml8"
-    "yncTnwhr2lXPIg1jRRr8if/w6DLJqm+f2fe9Io2gC+X0qByfRxrxeuJPmVClkKQw8ez9YuTE"
-    "JcrdhXtPDkU6ZZicYw5jXk4UEyWi0v7ixUQFihjxoIwncfLz/Df/yHEI4w2PohEJEDWhs/is"
-    "BBkTsem8JBaEMl/D07FzrMw2In5ZoImI3Jlvzvuux2VYE5ugYhGkDP/9AKsMGmVgooqrCK6u"
-    "XLG/dVOVGisO8s4UI0aRV2RdxHlvXQU5xo/0+Q5GW2m//Dze8076ZtCilCIXxe/IkTYLmvmL"
-    "gAGWGOi+tT3dZeiEYEZZBA3AinvyiMRyvHCWGhMBMW0Ds+G9/wQ++pC5KsAKiUMpwaIdATG2"
-    "rStxJUgCrVJFWIt0xneCM99pGxE1I3+BqU5GR1ArCGpc8cZqnolXA1YnbKVWR46eTn141X5w"
-    "Hdv/MXw1He0+nNhVRwzh4HLnyfPpEx95JM3HcNtt3m1NuBJAPTeGHcYYjEPVj8auOiD8wQ9t"
-    "wYv0knT40AnKMAVD2zY2reEuAiYlIyxVMHlSyhOK9PCSYcrUwss2zMUw6zDQ/uXf+Yv0wIqm"
-    "WMn/zd+/mDrnAroBs3qeV+09OoARMN6vawF+s1Dz0DJBB1fD/gvVOKDNdrxB3QdQpU1CUlgH"
-    "6FSF6EHP7pC6ye5J7c5mIV1asATnnEh4btHGbBbLDJn0TMvVptJKDzHej5+hg9uPpbM93Wnl"
-    "5s3psSfWpd//4ndTe90cwAX0pxvvehlgcfkiqjZW7QDZWxgEzyKdqbTJFdrgbD9uFI7D+EYA"
-    "gbXT0q4L4+lnfoYjd3A74Xl20wDnSoeu0JbPfvNpfBx9iDa9nv7iD//v9BP/9JfSlrVdqPw4"
-    "+JddeDR9qBZjJyj01x+X/VCbOqVW0tjNDN0wzNvsyFyME0ndXcgIW5Bq9OJ/qQcfWC52WvDv"
-    "5LEyy5d3ssngUvr8d7am/e+8mmZj0d2FMbzOcl1s2EcWLFwYwGxgAEeggHjbuQNQ5RA4yFmW"
-    "yznSqBk14Z7uizi0VD08OZ0ZvRa+n7bg32xh6yJAaB+q5VMBGKSxbSMwsPz2SxmroENwcYwj"
-    "l/St5I5DDw4XOKgGVJJ7nf4mmPTSrlHpl2p0x5lqLoGHuyFLZqa/Nr2l7z1wMvqI7jEcAzrY"
-    "HEYa3IK6tfv0+eibK5cvTdehxWmcgOqGwd2Bssd6wGk9AMaNKIIqwVUDdVyOnZWLprmzJmN3"
-    "d4oNIU+ln/iZf5lWLKhLz2MnNfP2cPrFX/slynY9ffnpt9JGnHUKgO37SnGkgzQIGzGYuuNa"
-    "mksHQUsjKuazSPw0dp9O/qdxPDq3UDs7pwjCFuCUtAc7q/nz5zCeVkQdP/f0G2l+zaS0/t71"
-    "2NqNYlt3nuOdRtMnfuAROtD0tIi227B+bUiu9h3qoXw3UHPj+4xFnYfOD7NQcBajaoBH5hfa"
-    "qHHu7Bjn9bTzVOwOz3BuZXPzbAAo8yT1GR+7nY5g43ldZ8e3OB2BzSGzZrEZp6Ex1KPO+yWg"
-    "ck6w7jFv+0388hPAhnmv/F397RxX/TsLFHxWJYmiPJE2z0q+YJy7AVeet2OuZg6Ib+ft+DiH"
-    "F6CItPwff4rv74tDgLvimx7/HKv5uWnly98+zy95H+XiiQOpuCz7+19FPsYhHROJPKKHGiMK"
-    "eFfUHCKCRtjMs6qDmGae72I2lf8w94aRu8HMx0JG4hKnvOdJyRgNZ+pWOsJZqqhQUVkIEoWt"
-    "qmSUhqc5g8i6EtVYVjAAFVEttBNWTPjeV6dDOHhoxDU57yO+pSkIVQlvZYqrQu4oqxHLNyaQ"
-    "w/mVP/62jIyGyD9/R6TqskQSEhSmInPincwqN9ZE+uXvKFeRl6n722LEe/M2ShSgjFv8juf8"
-    "IbB0MbyfyJN8NSxUshFSItQcsaKxkXOKEc965Lrk/HKekSPbUjNoimwKukTZLB+fSt0sI13D"
-    "MniRNfd5hWheEbWIb1vmwQ9FLC+/XVFbtgBzngkC0zUNXTRkQkg//hFeFa8Tg5ID45qs7WF5"
-    "nFCdDAU8sVOQiVSbHePpU2kyO/cEb2HXZd2I68RWOxMVZQGqLJN5WybjWS4Pf/ZYneuAoFBD"
-    "oY5xpWpYpRMDHFT85n4O3IUG61e34buNXa6qC/ko9biCzdIVAMl5dptt6GoNO48dr+1EZYaU"
-    "jFWpx/34zpVt7CxDzbVyOTY9MF99ZM0DUMxtnAPT7gnAZtkEFzIJJ0LbL9pNGsCYSumEUjYZ"
-    "ZHk24QPrO9N3X3w1nTh8KM26NkDtMS6m3uXlBD6EVGEqUosaAMrMWg3UtfPiL+k4IdgnpLVM"
-    "eir1rEVqo9TMvqbvr5mq/FCZ1MxpIn4DEVXzcuYjQMaelyWW0hsJFnGOHjyYXnju3fT3r6My"
-    "RULRsbwjPfftV7Eh6k9X+2XGqLjpD5Mn08Yw19tIUqRbI/YnSh519jqAivPo2ZF0qBepVUxi"
-    "tCsTQD9HAqkObF/Wmc6e7kPCwmYJWLYqnSGMkV985pn0rb/7u/R7f/Wt9D99+inKia0LEj1V"
-    "1Z4Bd4fOEX2UNG0Xqh2SqymUQQ/65/F/NBcbn0UL54VaSpWQ/WL3u4fom9jjIWFRXTkXiVTn"
-    "ihUh4Xn11Z34ssJlwW22/i+owd8ahyWjch3HT9ea1SsBpaia0Y814MPpCOpCbeOWLl0IkGGX"
-    "G4eM95y5iHRscVq+eF7ae/RcGhi/hXPK9nQfDmTd5DCAmwZ9ZSlRsp0ERdoJOaPIBLWhE2Sd"
-    "AxzX1k5Nqzlw+C+/+iYSR9qWsZEPFc7SY/u+Tjp1o6CaNAY1Y80x7HgYwTGn6sKZgE1dhLjY"
-    "EHQeZ7NAOwcc2zd7zw+GTzkXCVfZHejOuu7TZyOfpZx2cINFySBq4DzQGXekPZN+1QRdLwEg"
-    "5tPma5cvinF453ZWhS5cvIgNG19KtTcv4sPrfHoeR70LUceePHY4feHLL6b77+nCButc0FAJ"
-    "np9ovKCCuzU9QSSDLOcSXaocBWjqvd7xoqG/7egh0UqTiMZ4YyMOgLKRthwGFC5pw+5uw+q0"
-    "ceWSOOpKu8P9ew+hEr+ILdaKtPHhR8Ov3RjAtZYNLVvfPkIfGU4tSCSVhvUPXkrHzyPdBcx5"
-    "1FfMyrSX53bews3IGFLsJa2L0yloqT1fDXPQJfLVSL+luYF+DMjqYeMCDlyvc2wVrlyZI1CX"
-    "N2CzdR0gBO3tg7cxgFcz4KkWwbOhL5NF5eOzABryyOJTAivDOa/Ehxwr9z6LsM7hxOedYf0E"
-    "3y3u/e2/eMe3GoSIR5wIW7Y6QQxmH/Xby5m9eFx88+vuBzmgcSp33pOH5eBOnFBeUaRIoEwm"
-    "l83yWOYoK/dFKeJ3PCve2X8cT0rBvCJ9fkcq1rPykY78DjrnvIxnjHwUXOZ7JmCcKj9YOc9I"
-    "vCh3ZGgmkWnxkABm6v8gmBGK3/HMhONZ/uO9+Tt5x2VBuQlQVYSM9CeSj8rlwFV/owxVv7nN"
-    "Kd39LDIzQz5R8fgmjM+iMBExR4pwcGDzjntvjZtf3/2XyFEGE/Hen/wx2bjPnSrH5QGX+Vtv"
-    "w2UaxuP8x6hlvoY1Ig8yzQ1ydyEiDRvVN1HW7DRT9UasRhxw5pMDFOlkYKIkpyKBo1OW8c0j"
-    "p5j/GnXizl9cFoOHUS7j+i+Kyp8irQz4lEjlDmmkCGPUTJyYwJz4S+lVlppEyAhrVkXPiEEa"
-    "E4gPucw7mD/55V2HrnuR5ABEnEj10ux28DgrEUaZy2HeTJzEnY00xP7mStfLFbpgzVVrqWJx"
-    "IlGFM4JaTBAjw9DrtgDrGqv0QXbYNQJImpuY/AAtGspq73EJQ2vttMI3F1KAi6zqN27ohCnh"
-    "Mwc7kkaccakq0DDfAagT0zpW8XMweO6DaTWhHmwAXO1+d18hNdB9CDYpAZhzmwpwlHTYDt6r"
-    "ttGmRsJJJyVzGuLKHDSkHsaOSsZyGfDnrlBtTTS+jYmBNK5wdM2tmzBPmH099kPMorFzz4z1"
-    "zq4Uw3PoPO3gBru1dJeiakJbpNkAg3C6i3TmJmcc2j88524ShriwaXZhYcs1DceSQ/3pzdd2"
-    "pG9+5Ug6euFGmj9vWjrQdz3dux4A2tyU/v2fvQig4LidAGi3YXhIH6Qfoqw7gOUpNN4lGPb5"
-    "Qc5ExNaqd5gNEfZv6nUV0HEVcH6J3aKtjTPSko62tBR1jWo4VVdKLHSNoLSphr7xEO0h/TTG"
-    "ly5BS0pbAlXHUPjeglFrcKybA/3AzcfFgj6ernF2qr8FcF/6xtZ078q2cOWh3Zr2d4KPmxi3"
-    "LwAYtLUvTM/iTqIZR6V7DnBUzew7SPlacXT6eFp+z71saLiAV/Zz6eHHH2UHZQt0Ul08Bq1n"
-    "4rB0cUjMXtl6IN1/7wq8lbdgn1WDWrCN/qukKs8lgoOQXEsPPtZHyc1Mdt0JwPbsPQHovp46"
-    "l3FsD+qkUxhxNwLglOi4nd9+5JiSTRlPQOKGGVX5jokA1wBkgf5e/LktRDr35FMfQPrYGyCr"
-    "lY0c9rl3dh/Hdo7FAZIg6epOa8vS1dma3sTdQRde1ZWCHeTgZlzSxtjzLMcRFibN2DQuWzwH"
-    "4KQ7lNnp1JmBsDPbiQ1TG24ZPv74xvTbf/ZMep3dux/a0J7W3QOAvcmJCWw0UC1ehwRWGyuB"
-    "pmpKnbG6IHHBKZ2kl3XxklZKsgYwPPeyXnEUFc+0rVJ1GEcYIaFzHvC+l8Oj3UHnzkrrtPXt"
-    "naGyn4ed3CO03Uns8Xbh1855YhsbSrbhbHQUVxRK6GiS1IMT1Sss2BBasxOQ+QZ6e1n2mai9"
-    "W5Fyg41jXvC8TUHyIId3C/SNryq5hjntQM+QFaDdrjIueU7ZNE9w3Nlnp7GL1pSlv7uvHYUu"
-    "GsqPieWcI/v4w3om4lc/tx+FdMrJh/vgJXzny5DeiwXsO3Ebz/Jv53vf5ZcVXlM8qyQTPS6n"
-    "FGF9wSffm2Z1ifjto/g7UYcIGy94k6PneY0f/CyufBfSM27lWV7GtZzOc9JnIkIuf3Avn3sR"
-    "zFgTqfq8eFd8Gay8IrkybvmQ7ymf+tGPfLYsgJnLfEKKRPJhQKeooqi4k2xmkLnAkU6FKKbC"
-    "c5kogyhfImwL74rJFRTP43d+VpbT5/EuJxj3ktR/+dtoOUz1t9lFeoYs7k3CDhTp+bAqTBEo"
-    "4kS8Sn2sl2mUdY1IJh6f/C6vAHP9CzpQ11wvJ48CBESapEV9fecgFVjk94Yv4xCeEZZ/kx6D"
-    "JcIV8Us/IJX3Po+4xCdsSHNgfk4odpzoTFaXepRxDOPH37aJbZHbozqMzwgT6fs8v7OeTgb+"
-    "ztt6sz+SSE+AYhniO6ef87Te/s7SpjJ+WaZMR+mc85Qm3EZ4CBSd2RYPqULZmfku+53pOqko"
-    "oTKeKyYnBcXxYcxKGr6Pj3XmN1FCchQTDmHLAaqPGZlE2IYBKIJG0oDwriItjaAs7DuYYPdz"
-    "5ts8toVb5zwHGQewgrGsk7uSANM6yMT6Ax/chP1KbXo5bGsAG5zHNi3ySHF+mSqhdqRXtwAI"
-    "eh0/c6qHI3ZQA8BkCQZzzKqbDJKuYJC9LI6AOYtaw2cBsqiYbWr99VfUCuPZ8tD94X/pEq4e"
-    "BBqqOEmOmmQ6u452NT2KyvIy0pKp2EDVYOfjbqrJqDuUZAgCPSJEY2/VSOHkcWiQVDD+bWoK"
-    "5quPOg8kNu8pxBOQTsU62XSuY6ty9PBRtr+/lb71vcE0BYeO03CTYDla6ialvv4ebK3m48C1"
-    "C5cD4xj/40uKg+bqkGrI2LWFu4zNyhBqsX4+Z/pRTSLZ8Cw68FcwKpottvzPhnv1Yf/SgESw"
-    "rWMp3vJbMfgfSLv3HU1r1nbAjFCfAuBkWtrexEo+aiKmzJOtfUom7VzkESi6wNDoua1tEe2D"
-    "d3bA1xj2Ty24CZjLzskHN68EIM4BzI3YAdPz392Rth4+y85T7aGmsFuyFc/q89J33t6P3yb6"
-    "wP6+9A8++mDqWLs+ffUrX0u/8jtfTYs4Cgg5a1q4ZFHsPtTTOr0tHTp0ChA0Kd17T0eof2sB"
-    "s9oEXrjQH3ZiSl6ypE2/ctnhp2ptFxj+7gEACcbWrEGih/PUPft6sFfaSXnmxhiL+Z+K2ocF"
-    "0briUOUWBtm0J0SJNrCPufCIeQW6hNocacmrr7+LxAogVNgyrcBQfyWnFTjOBTEhEQvApgr5"
-    "Ku3cECrXm5eQ7mKrNwfw4VmC16C5bb8aaa+gQo/sOuzci0Tp4VVsMGFR4MLm/rXtaf1yfFRh"
-    "YygAicPXaZ/Z+CV0rKnG7UXtZz/U150LLMestPC9QEtw5E5Dx3c9gPs8/cPFiVIt7ewE0EeP"
-    "9cQCzXi63NC/nHU6eRIXIQeOMka7eT+NMlxNW3AUfIlTD/72S8/H7k/tNJUkteEFXpcu/bjz"
-    "cLyFo1H6zjh9b7rAFazXyHmXC3HF4VFdAtuEf71ly5Ziz9VHV7oNoJ8XZR9jDDlPC4oXYBh/"
-    "GpvDwSEXRfCLm3jIB2xp/D57dgOuT9j0Em3F4ICuAgL7cvlROuzl7+or3tMW0q7kH+XcmH8T"
-    "x0ARPcfOaRcp8VWGD35PuAAtzjU5UrRFGeb78o5y5rKWpQveVGRptn7eG9/fJR+JklTVoShs"
-    "JasIW9Tfh2Va8spc1hy0kp4V5pPTze/KEuZfRfiqOsYT40S8iFkdNE35sU888dlgjnTGjP71"
-    "fZHBQfi2sFH5bYeLLfiEyz4v+O1qIVYM2W+G4v7oBIAKw3tfSYMOZD56bTWceQlC4jfqBSf0"
-    "HJZ0i3QiPvfxO8pQpBfp57y0sYgVKGAj8i6BjWkbrvhWhWE61R/F5WXdLK/3TljvWyeMnDNg"
-    "yuFy2Fz/8rnxzDPqVZax8p23w4fX2qgL5bOs5msZoU15H78jXn4ftIc+4ZOkpIff5Gfdc7MC"
-    "REgnAwzeEb9SV+tEeBmh37mdDSP9pWmeICfiCGKMY3o5XsS1rAW4inzifS57tHfxLufDc34H"
-    "2OI751uWr8gv8jAf3wvs5FmCrwzQSqDmwPGfNMqOSQFYhJUphQrNLs1olGl4I1012BUszILx"
-    "+zyDAcLLRBgMrubDTotJSSmYda2DUQsqRplIZRj6tpqLRMiJdxz7I9Ve1j/cBDBIBUKenaeE"
-    "yx1HlmcQycEmdgotxaP1N597B+fMgiCYCvFqMfa+xCR83+p2ZD0cjYJR9gc/+EDawOq8HgZx"
-    "EWYhElFCYZuav8xhCWcFXjh/IbbWq8ZQfaMaNmzGCCtD0L3DQjzGz8G3kepGDejPn78Y9bC+"
-    "pbrVcmrXQ7PGocN3sO9oQEpSiwokJltpCQ0pcoCoq6g/Qf+xy1AVVSntmMXkDsUJo1dsd7rd"
-    "wtbqfHrj9W3pb75wOO0/PyW11Kvys38DiEBIs2Cw+hnatx9fUHjaVvKhvdFVpE2nOLLEDQSz"
-    "Z1tWART0pO1uUvZR9u3fLuqgj7OrfPr5tLGTqwP12l8+vSPNxhP2ylWrYDz1FNxDujk/DyBo"
-    "nWxLJ2vpEACZ73jAwzgLEjofPHSKe72lt1AGPJPTB3QkqxH8pi0b0qp161AJ4Ukf0LZo6WKy"
-    "wFgaNaKOUecCUtewK9G+eBTbqBaOv3mMA4Bfen1fmkpHPXTwaPruK2+mr724N+yNrmDL883X"
-    "94DOh2CwS7D5acHx7FsBlDQQFwjY5+zjLiKsi/35wMGT0W/td750t5z2hM6rJ5BSzcIj+WNP"
-    "PAJYv5o+983XQs3YyTE6jimN+q22oMTxaRylby5eVG+rQtcBs73Y8eflWBOkutni77+3l9MO"
-    "5rLbVmnPjNTR0YrNVWMAGMeEfVy7O8eR1/m+IVRltUhq6wNEncWu0KOnBFdL6mfgBb0LIKsD"
-    "zxsYetfFZpDNa1vDj1QLKvN3dhwBNCHFoS36cPxJr4ijogTgFwHCnlGaJdBTQ5Jl/3bjgMDK"
-    "cW2dnSG8LJ8LJftB7BgEyBleaZV11RWHNMj8KfMp4+rby52HznXf23WcNl1JX5+Z3nxrD9LB"
-    "hWn5qk68v68MOpALdUXaSZ8bQiLZQBsCZUNyPB3QrFrU9J3H5rMbsZ0xPZtTE872DgDGD3J6"
-    "xJzom26ocFzPZGFSi8Rce0834ew40Z9uIUm9dhXp5NE/twAAQABJREFULNJhx7BnKCpFvcbJ"
-    "AJUFduSQ50v/Bg0yGSRFXAEGqFsJOHwoueQfQbYq2k0AtKpECGvKMVdD21gA+ySC+JJeJH0Z"
-    "e5E2f6piZzBiZ/Qh32U5zNZ2rv4XYSKV/CcDmfJBTiPCV2dQvJ5Il/JEPta58rJMhG9r40VK"
-    "ZYDikWm/7+V7X1WV//3CTvnkRx/5bMnQVQXItEvphafTCxhk/Df4VBi2TDeYbQYAxo806EAB"
-    "augglTSDgRu+/Mgc8wAX+TrYSyYf0g8arJJ2ma75k2Zm9jJ8mbLlKu8BHzFp5DKq1lAdIKjy"
-    "W/Cm758AMFXlDnDGu+yqP4fLoENwUH4ccHcDsfKdtLKe0dGse6SVyxllMw3LaT3Mt6h35T6e"
-    "FfUt3kXa1i/onmkW9TYsk6F0zL9z3a2jk6KdxAEcbVSEiXvoFhOqAyHaJ9NesBJ5ka/hcvsI"
-    "TCbqbT5O7NH+0t+0ivYxTSVJuUymxYc0M41zXvYjQVIApnhv2xfSNPKVKTuo8gqIOjDoXT07"
-    "OO3oGRiUg4J0mFwz6LMOTqK5kzupOpidULKNBca5gKVG/AXNYdI1Hevht2WJyRfG5Y5FwZg2"
-    "XUoONMh2RSoIcHdhSHOQTHmsRss87SImYfvRx8TIjjZW2dozaShsuZz4VQOOcaYhUzkMGjcC"
-    "3WdhbKyoEe3XwPw0zNfubMWyBRzn8tPpM//if0sbHnoMVwaoMwAfY7gU0K+O5ZHW1tEzC11x"
-    "7959IG15YBMSjyZ8AuHoE1qpzpJeeqh2pS7jlqHNYbv3AN69v/DCLlRoeEKPvkG7QnvrqdpC"
-    "JEc2GNIyOdO/9WbuTkENjaWntBge7GcyR3oFnT36yv4yHZWThzFL+qkkNIN4ly+Npv3vHk7P"
-    "PrstffktdmixUq+bNSkcLGLmY7NGfqOjt9I993ZhUzWevrP1CABgDhIa1Eukdu4iuyqhXf8l"
-    "1B7w6GmArXFA1CUMfgWFFkLGeQ36KQ/zQOCFc6an1UhsVi6ei9d4/AgN9EMrzqnDMFvp8HVU"
-    "erRy0FFA7TCxX6nOFQzJdN1Vp1RDe6F5bN/XWazMVvcPXcs5zqa9NW19c0/6jT/4Gw4I3p+e"
-    "f2tv6gTYrcU+pwb3EXfIZ8niFuI2Rp+wU/7BXz2bfuwTH+B4lbb08rYDiN7u4Hx2PC1FoqUx"
-    "/YoV89Pq1gZ2F+JLCxUzXTO1ty8KKY2qUkGrI1r1nrZi1wDL7nDbduJ8agbwuSAQ1DdjUyTI"
-    "O91zPlSh0zHwf4bzDb/0wrb0CGpMfSk5rgU+qtPt9wIhx5fSE/uwNLUdNfwWzEkkJVF+y7RL"
-    "teHixppo83mOA2jYey47pZWu9j0lXvYP35FkOsgBziuXL4y559jxC2k5fq3WtM9PTeyKW7Oy"
-    "PdwgKDV1e73HorkjsglbJPu+6lIld4JC5yyPtPIcTn3kqaZWmuQJC0oeleoJNo4ghdLGSrWv"
-    "i07npWDwlEVJtXFKqZb+6/qgpzxFUG1f0HWDdVEKqcsWgah10S3IXNSCbZwIsIJjiNZt2gSw"
-    "mZsW4ER4FOB5EOekLn4uI9Vqa1+A3657Y0y9ylmVU8lb2yiP+Rmhb0+G/vdvWsUxPtimsUgS"
-    "XHpszyTmkHewtzuMPdZZbLduA6jnAtbs80q+XXDNBegewibr9jVsI6EZxgbQyfGnPRm2gJx2"
-    "wECGnn5HRy9sj2zJiQ+3aHicyZQE5bnX+ct52/azj/A4X3FvWvw3TS7/GiIW4NBP3hFzOmFN"
-    "w0Rj/i7C5XjmNnExo+d/pBlv4puoRT7GqXwiWqVEledRx4kk424iD8PnNKI+lok0o+/zTdew"
-    "EpEEP++6Il+fFM+jfNUh4rmRqx/mCN/3iMdT/hEqQnXniucdWLGTiMEYfqHocHk3kNvtiw+d"
-    "ubw3vB8b1U/E91mklUX+dnJ/5zMB86D2iBzFwDmO74v8/DY9wucjX2SuVJFn+kIJ4+lI3zJk"
-    "qYTvwsFXxMllyb6wcl7ZlqWYXItyluWNukY5rId5V5epTD/XLTe45Zn43Il78gwOAnn9tr5+"
-    "+85WsPzcuzvONGyZSviio0eYCG1dc0cIcBF193eRp2Ei/dyUIQFzgoSeYVwsbahDtE/cS7Pc"
-    "DhEv6EvZvEjbcpLiRPrmk1/xzHIaJr8P43P6Q7Qn4cwjM2KBCh/ao5QUGcbwud5lW+W4uc29"
-    "5wNNMt2LvkUapuMk6WSnmiB2OVGoAIdMtg7sDLa9V9KSfVu5gyjypamdJPWy7beSAFewbpcu"
-    "qh0TC9FikDkRj6FaMM2gVZBWRiSYc3WPuJ74TnIyZEHhcXaPjaEadGKR0WmIHeAK26DZSAL2"
-    "YnOyE6/v9UzS02FelvMiPo2mA1oe2tQBPKhLH/7BJ7DJuZ8VMrsXmeCmsdNsMs43r+DVeQUr"
-    "Yx2PzuMokwV4B5eOXV0dkV8fxsuxXZ6VtZIjJ7hhdqdlw26OWqEs+gY613su3RkbSe9wvt4c"
-    "JmL9aLnK1p2EjFSfUdL6Bsx/lB1gwI6Q4M1CMuD4dHfdIIDFRYMTKkWHSWH/gXPOSbTLTWy4"
-    "VPOc6+5Jr38PW6unu1MPjhJbAFf6wroCLWZirE7vCbqPApT02r4Ue6kFCxekcZjTtr2n0xI8"
-    "XwuC3HHXzUaAh9csgPlqA3M5gO1lJF8CAPsamIeFnvYpKTUBSmdB3zYkTvOwlTvfuy/9+Kd/"
-    "GmPxFg7U3pfWb9qIuudSqE+V8tiXXQRE/6Le7sA8ha2V7d/FodSCFtWqbni4Trvfs2lNpPHm"
-    "q1vTyo6m9LnPfy59AG/8t0dPpB/85IdhuhivI/nyOCF35ilV1N5Iht3BLsO//tKz6WHC34+6"
-    "7wUOYl6Kqsc+dRmD707Ou8SGnzpNT/sPnUQ9xqHNG1bSx2/ktmA86V9NhuU4u8M4EUxsWtEa"
-    "Z+z1c35eLZsUlK646/En/tGPYOR/Ln35pZ1xjmYnNlJKNWKBQ5s7LmxDx5AMpxzzAhh/Cz54"
-    "BcNnHJCnY8OxLM2M45hzPAoKVKFJO73de4STRvAeleNYuUZbQc60bcfB1MrhxnPn6MpECRjH"
-    "28yvTe0AEFVyOqCl+8X9EC4/5qEK60PaKi09RUBaWq46VPJzOcbHRVU3/uLO4qtqGv1E0HOJ"
-    "jQ+9Z8+FhGfSZOz7jpwFYNVAJ0GpUjRqSR4uqKyPC207cQ1uK24BerSLHMBmbwmbEOTsAwAb"
-    "dxY6/zpvZIkcEnDGmIBv9sw6JLTD2Fj2cerCGezaTqXBfscb0clDaZUHnOu0tnn+vPS9dw4k"
-    "un8cr7QGj/CPYVO3AhA9SD76w7vJRpPoL2wcmIsdZA3tfA7bwZUcmbQe1agSVMhO3tneTslp"
-    "K2pImhFXEBdiwaZdlraUszh7sqamgVdIfAHU1kGhgOe52tYBfPmOC2I4ZwZIKrQ6bqhRCBEe"
-    "31lw2hkUBgR/IC1j5joKLEybBS75KFm9fs35MQtiSgFD8A35KmEd/35He1iASMLnuQw+IvEo"
-    "j+/ee8WjSCfHsTDFHUG9K8sG64WG0djmZxw/lj/iGy4v+M0vwvFl+pX3ReaRZ3kfYYsffEmH"
-    "oIVokCuyilLEy0q6+R0z26c47LlkmgGMGEgBWhiUwQQLRi2xc7iCORZMNsBQcR8AKxg6YRmg"
-    "EZ5KC6Aq4CjSy++CAZfpl88jvGWgYao+E4DM/G000y3TLgFafucuoAzqClAWk4UNUJSr+I7j"
-    "b4r8A6SRbsQTYAq4TN/3RZm+/5t6EVZ65XDo/mHo+YzFIl4RXwYR8QNU5PoHKIq8MhAKBm8Z"
-    "yvT4LukWgKX8TVp2ilhx0JJuTReMRHrxjjQq7SUjzekbptImZV2jfDl8gKigTQmYjEf8CMN9"
-    "xMntktPMg9U0DWeZMgMryl3Q2frkji6ztcNLL8LHfc7bydD4MbHxzgldoGU4h1+WWGnYz4qe"
-    "Vb2SFp8FmIJBCKQyrXKZHDr+UxJTrhbNQxqUlwDVAWIeQxhcw4epo2oUjLVJ0zQEMNdYZVqu"
-    "OdhV+XEiucAWbCemUDMCkK6jCtRjs+DCQ4FdqV8CVA1i0Ku0ZS2T7OaNy+IwXLe7b311X2rB"
-    "71PHyjWUbyQd2PlO2ondTg+TvExiBE/bF7DNWbRkcUyIJ44ex9fSSdQj7Npasgjmv46wveGF"
-    "eiEgRboKAIexadGGahLlUPIxGUbbffEq559BSynCBOECTukj1SYaNlyUU+/z2mTpzFGnmU64"
-    "Oh11MpqOEXs2vsUfEvYvdwAKHl69d9eh9PKLh9OOvYAttrKDvwhnWznWZG60sOCGf72o+Tat"
-    "VK3UHDsR4WFpH4ziMh7VNfhf0bU43UAN+7GnHsAfVCcHYx9Kx/HkbRFVU2ioz/+0uGU2W+Pr"
-    "sU1pQEJZByMaBVDtT5/+6Z9KH/+Jn03b33g9feGLL6UNG7qwR/PgaiR7ACH7is4jIUFIrfqQ"
-    "WnVgkL6QrfnujFNyq8f1fnwcDRFeKcWOrbvSF779Vvpnn/lhpIIt6dTJI+mejatQySJNenNH"
-    "egdj9GVINTzLr7u7F3pad/ySoeJqRArytW+8mJ54fEtahef+Z985mFDIpQtIM1pRkS1HitOP"
-    "BHT+/MXpXlSQV2FUNwA8o4Dlc9g5KZERWDqNu8NMKY07Dq/STrORqC5ctCi99Oq2kOD0YZB9"
-    "CICxaK7gRWmq9lC2rWPB+USm6FggNcE1DeSiSN6htMzxYX/wvePOy/AlOHFc+duxrbRZ1akg"
-    "fz4MP45Lgm7jAOrh4SvYfG1P67vwes5OP4GOOwsvAghrOAJGdeMlgIOOX5UQeS5j41xPDkAd"
-    "y/M4X5EaC+4CDFMJNxf04ln96Tf3cb7hMGdC3g5VoNLXSxySrBH6VcbeUVykdHK+ZFwcl2Vd"
-    "XPwIQC13Bh72z+jSlGMcdwhjqZ22ERwqcZs8+SZAaxgQ5Hmf7iTOi7bJk6YhWR5Mz2zdl7bj"
-    "oqJ2Mo54SR98Ag0B+uyObcfbvwuQyY79+fPTCKq+o0hHF3jivGOI+cmNMRcujnCPPSL2aUoD"
-    "pYN1dAxMoR36AevOQfbJOB4IOuvEVeAu7R29LsjeONiXZt6xfpxVOorqmkWUan7BgYDUOdeB"
-    "7iJQPhodiT/RB2xf5odIi/nN+cIDyEMzFFIpTU+wZ6OOzo3lHOw4JoHoM9oMj4+PAbb1ySdw"
-    "dz7OAF6bMEGp/N0C2Yf9+FdYZRqRlh0wnuR5yV//xWsikYkgkSh/4j8pRp83+XgR4TIwzM+s"
-    "h33Z/ENrkqNGuFwySkCZLJYpmE4uE295EHOnk5ulL/LwK+6jLpHUXX+mfPrHqwAWBZAowQxF"
-    "fuWHVOK576o+Qfz4nd/7uxoUlfcRrmio6vsgTKSdC2xBIw49zMY1r+rw+T4/z6qku8tj3Gpg"
-    "IaCJ9Ip0q4FLMP0y77vKlstgOpYnQBnfJVGjjEW8nN5EJ7wLREgLyw+YyOBD2hjW8hdxKF+U"
-    "12/D8+EleeW4ApGJe5/leKQQDe+AsDeU4CoGlXWJcDmfsrxl+U0/0inSsjxR1+Lb+magkssT"
-    "dLLM/rOM/KsMPNvJ/Ch/BoDl+zzBVcobaROzyBuyxATPz6BvSTfTKqVXAdQibUeNE35WQ+qO"
-    "QYCllAE8E5OxdlNKsAIAWlY7PdFyH8oqoSusWEsJm5N3vgCE5kEcJ6V+jHGZPWJXkulpBOul"
-    "gbRqEMGakiJ96cgMz17A8BbR/ygfAd8N4iKoCVsTdxR5XMgW3Do8eu9ytssvhVFmx6Ay4Wde"
-    "6Ukzb7nzb0rau/319Nlf+ZP0VbxU9+B3yV1fzewIfOKpDzL53Uhb39gKsBqIgW9bC/o0PFaC"
-    "laV1OFx04Nt1+HMOL/CqDa2nKkFB6SFAVguMwDMZVZ/NxHVF9F8IJYMZo+ACkakw3Lp6/UCh"
-    "unHipR7uLLyDEfQUGL6SrR7AxI7tJ9MzL/WlE1cAXUitbHkEMFGEaHf6xh3AlZTW/QV29Rj/"
-    "30uZZ8BYcSFBI00D/MxFjXvoeC/Sh3qYxPR0lPP6lNKtwR5HP2KH2UU1nXEwv3F6umftApj0"
-    "FOhYm5pY9R/cfjQ1LZyBf6TPpic+/qn09S/+efoff+X3cfT5AMwG9TCqwnP4LdImSVsrVUWH"
-    "jnRTxklpxfK2CtNTAqPKWz9RVmAJ6sLlKzs5n/FK2s4ZiO9gKP7b//mv09Im+/Wd9HWO5DmF"
-    "lNITAA5xZt0D96/H0eTitH//4ehzNoWe1hthmi++/BbOZztQh7IjEfo/ft/yoOXCtkXpvge3"
-    "4Ll/Eeq/i5wveA5wPGL3CzXxHg4Jb+XolnqkNVfZxKAkRUljG8cv/cKv/wbSzfnpDz7/dYD8"
-    "7PTdd/YD6LKqzHrEPBC1ZJ4gPdXX9nEvGWteFMios4rfcWI/ctw49l0Mernbzv4mY3FsBoNx"
-    "vqFtdQ/gYdGPPf4Qtojj6T/97eupdtLV9JFH7kmd7B4cQcU+FcAhMHt++xEchTpuOAQbCZI7"
-    "HC8htdMx7AXsq45jTN7RoaRWOzBUc+Rl3y3nIhcOragPOxbgoJV21MHuCEb0N2DwCxfPD1Xb"
-    "fvpQFwcwZ+e72lUiJaOtXERZdw9dXkGbqmo8xlE+SusSddAbv5K8BlTrjqkaxKMN2IRlh6XO"
-    "O9gO8kw7x9tIDNsoh6C0g/Z+DPA8guPdQ0dOML6XpfaVK4Om7godYy7RV9oASHCYBUz3Bc7k"
-    "RLW8bi1uH9iVWV8HuAJo2jZqZ/zU19ShKjydetk5q6+5ZqSe5m2fiPYApLmhxzpOww3I9hMD"
-    "6QrgddYMAty5FIuQhoa59EHnAx5R75ifoWcemTkdQZf9QLo4j6n+V0qvCtax4VwSNtHQrtxw"
-    "kPmAAJv+wzjSNEX7zFAP02bTlUryzz7jKQ/yg5igzZl8ipzzF+3sP0rIJ78rf+UA/+W/EZo+"
-    "mGOSCg9KHh/pSQo7vRdfJW+RF5uXfUwwaBDjevnMdznV9z6PEP6pXBGeOGX8yov3uZnyqR//"
-    "2GcjpKGrIhV5RxQTDKkDhYyC8i1TLmhTSbaSMU9ykb8vSCWsNzndXOnKPY1RuY9ECoYeeRdl"
-    "LAkFSYpi52/TjPiWM4fNkjzv3ye/SCeHjTyjIxDQBizayHLmxqgu18S97++6jBdxiwRILmfu"
-    "7wyMokyWrwhiiPKWlCm7tK3OIxIpylTcM+pcqdopHARZ3ZknxkjMYJFlztMfJa18bn0dfBO0"
-    "9ndOO/K2UF6Wg3+WPS4mrfJ9fu5PO29Zhxy+CM07fkde+Tt+R77mPQGCzDvy51kZxzRNx8kg"
-    "218pvfLcLu3lmPRJIHYDMTG6Qsxtn2OZdtxxo82NKoEMDF2BZYZjPk6gZpJXX6hJABQCqlmk"
-    "6QRdlkVQ5K48f2ucq1PCJQsa02LUG43YIc0CyNQCSpY01+HBfRbnGLal++9biYSCnUGsai2O"
-    "IE7JiavYpYsmszX9aPq1338uPfutY6lz6dQ0v57Dle9MT0eQUk0DBE2CARzYd5jJPfs98kxH"
-    "HT1uR7rjVvgmpEGXULXpokHJg+3gOXQa++pqwCN+5nGMiav420yko6hV5J0aNEsLQepVJv+g"
-    "C0zz6jggkYl92lSkcDB2bYAEJcBPAOQN8h5Nhw6fS1u3nk37D7OKR2o1Cz9GVwW7MAq3n6t+"
-    "if5Neje5H0e6cAHp1QPLMeztWIwRfj6/8VzvRWjTGEBHdxKv7D6JI8jhtKoTWyQY8BA7IWW6"
-    "DXipHOfA7klK1/DrVAtTBs6n/dDgv//ffzr9/Gf/fThf/M1f/rfpN/74K+m3fvEzqQN16hjG"
-    "57u2747ji9zG71l0qgS1tdFw2EvJje05wI5At/DPx4dTW9tChke29btn47q0jvL0sYtvCRKH"
-    "1946wA5JjjOavyQYooDQEXfw0InYtbh8OTvCUGU5V2pLpBG/HsNffOmd9MjDG2OX2BIYcyP2"
-    "WrPq58QhyCeOncIwvjv6sUDC9l3MBoAu/GDpEkSp2/69h9O33zmaDiKlWdGGo9TL/enbX38p"
-    "XcOlRQ1+lRY0ecyT9WE+CHcZeSzat/3IcFywePnbcZYXUXmQ5HBZlegTx5HjSSZtmuU8EWkR"
-    "37R0CaAvOHdAHkfa1k2f/dhj96D+bY5zN4FqMV7e2Xk42nDdmmX0lVlpCDqronZhc+JUL5Ka"
-    "q6ho8YNFmrORnNoeMvsS0DnmVG+7804ptYb9DthB/Jy5QcMzAkeRRh0E9C9vzbvwbgDorZ8S"
-    "fse1fdeFrtJVnaG2AqC/+/ohNp3cCcmRgFMgoyrZxZNG/JaHaSfmXOutarMVf2jOCbNRizre"
-    "2jBUX8Tu3Sb6VCM7TO8AbL73vbfimKsmpJqr2QE5B5vAKZRjCEA3D3f9jdjhWX5tprStHIQe"
-    "0liv/sNINA8jwW5m8TPEoq0Pid1ixohlUWIoCNY+8BKS3juTxtM86HngHKYKSBQJAijTETC+"
-    "xOhbU1gg3mTOyi1sPbJ0SYCUAYj8Q+llVhMLbAV81sv5INsuc4A2YGkaakrnFtNy7gy6Elf/"
-    "e9rPRV+yANDLy7AZ2DE6SOv7Lp7Jmvx4kWTlPj/5r/2Vx3CRjv3F+zKXMs1IgYdqdSKEechH"
-    "7NQGKiJE3KKMd8WN5Hkb70o8kCOWeZZ5WAFpWpQqHpd/kGB97LOmMfEpEy0KHy98T+JRmiJP"
-    "70uylM8NEP/jZZlHfFcKX7yKcnMfz33Gx2cSO/7Ejc99yZWRUg5fJBYVZTKIb8L5XQlPyAqS"
-    "jQSsfvU/t9mXnY0AEdW8+JB+mWZELeLHO99XPrkg1fmQK6/98D8+lstwxYOJBAlZpBXJ2Oks"
-    "X47vm1yQIlRBh6hjfsOEoZG9UorsxT1WrkSvlMc4NjzfGVwUgCoAjjlMdJxKHMtCnOLLIHEZ"
-    "P4pQ/PZHxPE5beClEXXOi8Hmc+sX7zMtIpB/eJyj5LL5gGAR973N7oCOMkDDPCG4eUFGotqI"
-    "rdpMugKIrNqwTHlWzDXI6eqlWoPSXF7zLplNLq/ARwmU7wUII6g29IBumvrXsmzhx4aiuPKV"
-    "5tpyeK6fkhI9WbfieLG1tSk8fneiLvD4GpnDnr1H0zNvHUyjMCBVJjIG66EIfQY+bDatrGO7"
-    "OhIUwPLgEMbxxGlkAj+Pp++XsNW4jJNTnZJKYz3GN7IC/8Ef+mBqX7YsHT54OHww6ftKu5hg"
-    "gMxyWfIwJb3FcT3uC6slPXc1DeIA8wp00DWDdPWjukFyOHnD1+K99mUzYAxKgHS9cI0ydeNZ"
-    "fOf+C2nXwbF0GWnU9FomYcK75q0hrCJ3zdx0AHqNNKPdSZiqhnHvRjzNawhd35DVIr0ALNth"
-    "BswkfIvBQHpwtNjBTjVVd+fYhXbo8CnUgZwzCNgcARx2ckbjFXYcXh+9mP6Xz/582vDgB9KL"
-    "T389/fBP/St2ZE5O/8fPfYZNCjPTQSRJRw6dgum4XR+v3WyDt67LsLXyoGJ3WMpsdSjZyy6u"
-    "y5duAGqaYJINPPOYEhg4oEsbqM4VndjUNKRnnjuY5mD3dA5j+pms1mvrsLeCNhdggu8gPXli"
-    "S1dqX96FhATJ2oHjwWBMS9VPK3Z0Z9m84AYFNwg0wHzHAJHbt+4PhmibulPPsaOkyo0THi8k"
-    "gKELpieevD/9xz/+o7SuY1761T/8WySH29MQ0jOPFqIFgxlOwdYpG6lDesY31Y3+4HCzH8sE"
-    "7ecuUKSFwNkwMV7pW6ogDeOYjX5B2KvaZBFOlbkMM5gT6QkM3FHqmBoZGQ9V3JY1rZDtTgDV"
-    "Ojz8d+Nt/luo9basWZzu37w6JFMD2CypDtMVRi8He7eyw7GBI2VcHNbiIFWpsTQP6Qp9w/ws"
-    "nztXyw0d9jP7kWrHSajI5i9oZtyMpWMcZbSuc0FITuxzLpLcRXrf5rVsFOlIZ3Hg2ocUaRU7"
-    "eNs7O3B0OhsghG877MRUJWrmodTL+vpxTnWcCgT9zRfPUMNDi3rUv7o02cVh2QITd/kaZjc+"
-    "u65x/E0zwFobqjTlNirM5jQfANaM0Z1+1KSjUjymlKB3DQuGWaiAVa9u28ViioUQBAjgDsbC"
-    "JvMyaed4NBf05iQGdt7OQk18HbVsPeU53IefuB4kWOzYvYa7kOnTUaPSp6ZMUYIoDYlYufKc"
-    "6E/nSsuTTTGQorHxwfDaYt1w8w7vZ83iNAroTU+J/87FJcASnOVNFEW/IZRSUT9O8FOhp2Dr"
-    "vVfpzDOe31249wZ939/2CedDv6uv+O07/8WrDNatk7SL6z3lMVguo5w3h8rjIo8N05IB+S8n"
-    "adqZj2bGVP6VPBEi51P8nfJpjsopSmNW8TFgVgcZKn55U7nKwto4ZZpOlqGSiwoQIpLijzXl"
-    "v6umTADvJ4heTSOjGNb0496/3vggHuan/IqfOftcPt9MlBRySCXD8W2+WeJmehNpRIDqP0Wc"
-    "CgEJWgITg5l+LlCOVDZwfm7SOW2/vM+f8nk8tEBV4YowOfFIPWpG0XOTlvXI4SLvIm07Tbn6"
-    "iBWEIlmu6AZFGIlUtqN0yBSJYHFvdS1rSSsnVn5GHAOUz6NeRd1yGcry5LTKemdam6YFyO/8"
-    "623YD5hh/M4vBQTVV/ziTyUrXvos/84Tv6qDsJ0iVYGEk7Ir27JP3V3L3NfcQaiPHCeMss5l"
-    "GV2N+8x0LY/tbabjSDfm4izSCdZdhNmPlSDvdjiGlFIymlLq5u5DP1fw1+NqWADxty/sxHD1"
-    "CiBnEr6dbvCOswexQxFQzEZV5lBRxK7XcSUPnpGm+uEaE+psGG0LRr7HON+wFVWBW/dXru5I"
-    "mx++P8T6b7+xDaZ9kbJNT2vvWR3G4xr9apTvCtyV/g6cRPZjjDyDNP8/zt48uq/kOtArriBI"
-    "YgcBcAH3nWx2sxf2KqlbrdUauUdq+1hSFG8ae3zio5wce2wnx7GPZzIeJyeTOPHM+NiOx5Pj"
-    "EzseWZGXGVlWa2t1q9V7N5du7iS4giAJECBAANyZ77v3PQBsyX8kj/zhvVevllu3bt26devW"
-    "LQ8obsIu7DgH0t5iht+ITRYTdnCocAROqbP2I/bh0VGWDbCtuHMb+w92Qx48eK7s2XeJHU5K"
-    "VLQ926NukZZkCE/cEbhuEKDh/IRSF3fxSq+LMq4izDSQpg2BVO2Edi620xDamiY0Ay7H9ODa"
-    "YAKt1X4cP65byYHXvUtD+DvIocRPvW9b2bp5DdqjS2XHvZvLF//bXykNCEr/9Rf/u/LHX3q+"
-    "/OJnP1re99QujJDPlTfZtacdk4PYFfCtP6gV7GBbtgxbHY2zwY9dZQmCWxvavc1b15T7WLZD"
-    "Fgsv6ovJV+2T2sLzHIo8Pj7KdvwNZQVG2l97ZS9nB+KXinbS/YeHJi9b2lJ+45/9DJqPJoz9"
-    "X2KwXcVvWek7firwGkIk585JY9r2LKKup9HcKACqlXHA1lhdOnapVrvQ9jY0JXfSncLR40fL"
-    "T/6TL6D56yr/6ct/XQZOXyq7tq+kLTVy118SLgiCDlOAkh7tC9K3P/ukwpOG6mo/JG77olpd"
-    "hWqXA6NP0Fp2NHlADLIIWKZXS+fdQdN48hrdF7ixYx6wKhB68PWqXiYXK5bG0uBuHJBOQj8f"
-    "eWwbLhC6Q7BwWVBtwn5o0t3ba1bhCR7BTwFrIbQqPPa7HEPUhLqrTe2Two11YekdgYkn3ucg"
-    "pE1AXXqOR4uLjdIRBLod7FoU3/NYmlzF7k+FNY+u2bxtc+zG9RBnBcwjB48h6DUCL5Mg4FRT"
-    "m/an1M8lLjQ24jZ5ivZbTrZcavfsSSdcamhSIDsHDZzheKBTJ85h5D4Wgo8G4GrrPGlBHu2S"
-    "XifLqQr3C9nxp2sFBZgFxFGLehrh7xUmU+fQuraAE73dU105XxlDyL7IxhcnV2qq3d18FV4y"
-    "67YbgHI36WKs6a+Dp2MIWQ1z3e07EjyolY0YszmKp14irscC2zMvNInk4bttbn8VX5oBaF8q"
-    "HhSwtCkWlrhoI+MqWNWaRgVE62J7Jm3pgglaDqG90iBl6syHrMjmBy5LsOb5b6rEH4wHvMGn"
-    "6y8SJleM23WYuRBvuq5THyjc+P78bnj1PpWPYXnl9/rNMkgQaeow0tbp7v4QEeZ85lmWCLns"
-    "iFHMjMh2tkycgFbDb8Bj3MRSPFWVyaD8RuyALmfKqQGxIV0TT6YetXtPDUxjJ0khJ5FWw5dI"
-    "BZbocJmHdRXyJBA6KGmjngBBTJNmfJ5DPUrDR11hTFGGefHzEm4JJFIS5AG/ghcMKyrlJ+tV"
-    "3SFIL8u3LAm4Coi88lmGlsGBS/Eceamqt57Vtyph4NiyhT0LmspLJV7AR3js+qDzmoed3XuV"
-    "Bbcq0zpz7tEWlGvd68vPplOwEHbxY5mGGS9wyrMMznLVUJl8isiIGwyZwBpeS659p2Q5kYD0"
-    "qsWZMQUsFQTg0nKyDsDBcwV5DSL36RBx7OVcw3ZWQyGTET4xZl7ZBnU86cFyccWAvU8wBuph"
-    "Ne38ZhcarypXlwrMQ8/LC2Co82EYHizt8TkyWHFjHl6eGejxLvqQEmoNUR1APBBZQerN3UdZ"
-    "FrhWmhE0XJJrxnbIieBKfO7oXdzCxafLf8f6xspaBpyOdnxhMTO3PS1rDCeCi6jf27iG2LK6"
-    "C2/lvbF76dWX9pAao2GM4SkcOymWH2DgCnZnWKLSRsbt6/qYOnJ2qFxSa4XDzW5selrYrXj2"
-    "EkfOsBzY4IycH9UL3GsHIk6so3ZTw5eulb17LpTv7OcIDyelfFZsohnjohi0VcyyEaAUokBf"
-    "4Mk2sW+JS50sNiDMHTzHUR/s7LStFeYc9BUuLlFf6U43ARry7j56vvRj/N6MC4RF7CacZABa"
-    "jtH4r/32/1w+9blPIYjcKSdPHC+f/qnfLP0Xb5Rf+umPoUFsp95ny749x0MwtYw+jlKR3lat"
-    "6gHfnGWIRuEyziw9qHkNGsGVq1agUbzJcu0gOyMby4at2/FYz5FGDNTGESkL0fR5WPc17GmW"
-    "r1xW9Cn1HMbqXQgE7hTdjD3Usz/+UfB0qXzzue+XP/27N8vS5nllI76ROlluPMeuN2lWISgF"
-    "+TvhTFSaXIjmTpryfEPh1dbJZSh3yfX3n0Xw5AglNGqHDlwo/9Mf/sfye7//H8qraEO3r+ZM"
-    "RAQy6VIcu3ROcp5rzY+8wUmIGl6XuRUQ0oZQTZaG5iH8AkPddyRpNTi6ZFDQodnQgqj9IwwY"
-    "FXIUThWu1PIkj5R3KPQoHLp0PY5Ai+0Q9Xn5UH95/L51CDDdLGGzlDwbX21oC5/H99em9UvD"
-    "7xRQx447jy2S/yrI6XxTLZt0Y9+Yj/CmzZW7YpkCRXnhZBdGaB+7jWG2S3OjnEyghrh36eLY"
-    "Uf7w4w8Tdw5anfPh/mHwAscGMVlx88YhBLwjRy6wQWEPmkmcfra1lQMHzgLfKOYBVxAQr0W9"
-    "F0Izcd4p+EueL70Ch0wY3MnxbFddOoQGHdzZZn67Rt9RmPVUg+BNtI3LlgosGCaWF186VF58"
-    "91iZQCD7Jkuox9GkTbAaobvb67Sb/UMhS7YmrcDdyxi0PIIGjBX5KNfdqG5MuI5WXK20E0F/"
-    "+/vHy0KM9XswTdDv3jwEutlsgnLcVSDyHkzDsYtyhDfqxGO65VGDZ37sXGWSMn9+I3VwY1Dy"
-    "PnlDjDfgxXHA9pN2g2eJFdrOsUm+GpNftVik9vIexRGnpqH4MPUtBacYX/wQ8NUxpu/yoKmx"
-    "QGL14mab1K8ZCJ+nQPtXRACAaE7exGsK7hV0wsQ/y56WBzI/YY5wHyInOT4FxjtPdaHV94hU"
-    "/YklQp9NGj8iRVEmqgMNqV+rTCM9gVlw5hAF1YURFPlU+UYwf2xkkRvv5G8RM694f2+gETID"
-    "brmOWjdCfa8rGfCIT+B0BkOJAaOdxHehEsl+Dxsm8hXZXvVgO12nCI4/xgAFM666iQ0S4fyr"
-    "4b474nQlqwhGC7jr+FWuhlmPGo9WOeslngXay8xTaHC2YZrYPQjzrAW8jDHd8NOw82XqJWOZ"
-    "nwKWHceQGo/ZdpZbFemtikekiJvqfONE7YnBRfyomw8Wx7fAr/lwRVm04dRloVwRDm0YLdNH"
-    "8gSXOBnNhwrWCMs6xkTAdMYOYctolkEk2l0NljNXZ3LGscPJjKxr3ckcjGWM16VPUs7j+0IG"
-    "fY/PUasUOGaAqQUHBzGZqNoi7TbEX+ABTZTLBh3YWuzgjLXbzFT7L7GshmZnA0uI+jsyrrur"
-    "cuejRuDXcTa6iiWsnrL/4Ek0Au4OypmlmJ59aw72Q0PlFRwStjC4N2EsLO1KEvIOt68LQ0dn"
-    "B1vX+9n2j0aMtnIwuokh6hCCmj6h5nssDXDPRzK6rlDEskYDQhXVCk2TvuIUBhugJQcXNwaM"
-    "48ZBuUthSt6sokHMurQnvV1la75KK/GoDYuCr9+lm8WNc9ECcqYgmrPlLMUcPTJQfv7nf5xB"
-    "aREG4X0Y8Wr4jadqZvAOohrA79iIFoTB7uWDZ8vBExfKMxyKPc6a5Drsm2R8v/6r/7z8uz/7"
-    "Rnn2yfvLpz72cAzAetp2qa+VXYUaI+tLbAX2ODqQvMEg7C5QLH4RYJrKrkceQINys3z1r/6+"
-    "HHt3qLAhEFiOh7uHDVs2ISizFR/fUnorV7vo4KlwoCZiI5qse7DJ+ip+sagpS7nzysm+U+UP"
-    "/vJ77Oi6WVZzhtyJk+B/eBjj657Aib6SGH+4wC2bBNSGKly6M3OcQdJZv5qkwBp2OS5f7npk"
-    "U/nHn/ts2brjgfLWqwh0i29j4N3BLsHF0LJCiH7b1DzZF3LCKv4hK7tH0jUNoCAlfVzDTsY+"
-    "oBZTjYlxFa5cFrdfeAXtCiX9xnQKUwo5V6EB72oZbVvpp2ZFxhH25B1odhGwRtCwbIeOXVrW"
-    "4F5N1JGjp8sbCIcffvJe8llAHmh4cLKpQKUg7HeXTBUuxZOwuNPQI3Q0ntYUQuHP9teFg8u+"
-    "5xHMMSwMzafa6bewN9zMLsJHHnsIVwqD5W/+5gXorCE2pTi5e5NjbVav9lzBLvqGGlo0Q0Pn"
-    "I/+vv3SkHOe4o2Mcutx37lK5RPrOdjSrlG/9G/QRRn+6imbHOqvhVAhRAJVvHT12tnz99UMI"
-    "SBnXvikrEo8KVW5UsY+30AcGcPPQghD+IJrT73KkUTdCUKPtRMPZLzsQ0iboZFfIly4aLEzt"
-    "7yIE3cboX8mTG4GpFa12B6cOtGGUL51a7oQ4vcARVGwAmEt/nzUbGzbiNuJmgh4auHVCkzzW"
-    "AkAjbeSuwUk0aNpUuQNZLZvLwOHmiAaPcdfxFDiD7ni23f2BnOCZ9fgZfsgIt+7z0SZmWVFU"
-    "/IklQvATNEdbx3fvfM2/03EjcMarj5HOhwQ/o0R+frv7lzmmTGMSr0hPx7irfHIJXitxm0f1"
-    "bobC9d4rQqsP4sMr6vGeiGnk/p5AARdxduQQSiK9DZtARYmEOXC6I0mHm2YOaNF5VKkG8FW+"
-    "SremNU+JwI6XeSUzmBm3RtpMkKYqyIOVuQER1I1pvECGleS7ce3Ud8NOfYIgkrkELL5XP+OG"
-    "Q1DeyTgQbTl1fausfxC0Ci8pIVsyAREmVNOXX2rk+8zL9MepJ8IIrxtrKpiHKL9O4wu1VCuj"
-    "mtm6W37OICyekIibgPgYT5nJFByZS5ZimTI9mYYCsOlroTNiELn+brmmtZM6s008CXvmVcef"
-    "fsuSAueU46BlumxzE+Uv5CHfzCryij9T2VqOQpC2GP4cMLQfSiaeQrIDhwlSEExGYLWtk8tu"
-    "xjdCzPZgZrpUyAvGbd7QpZczJK9mbJdy4JJR6SZArQNfKcdBRw2IXrWdwTvTDjpghuvyklvq"
-    "pfXjJ3A2iq0EvLHcv31tLEvpEsGZp7iU+Yn3traFLEWtDseR+1gGwrY7jKBdqlyE5ucGg8Ig"
-    "2oJnPvIQPrJ6Yep9pNN/DW4B0F6tWbcabdAl3CcMAyPHprBEeYgdeeJtgsFkZRdOLdFCHB5k"
-    "mzx1k/m7nKdRfxNbybXpuAac05f4wYWDhiBcaltkjIyvIogBUPel4iFn3E7sQWHgXsF0MULV"
-    "Iu4+t6A96EA4WDT/TnnqQ09hv9RUXn757RhAFarcEq+QJW7bEEzdQXkdW6vFCCHLMSxevrKl"
-    "/Mvf/uPyO//2/8Sb9azyiz/7IWzeusHVMNqss9QlNWOnTl+gLeaUtQixagmvXmOZk/rfvDGr"
-    "XMSYeMu2dUFDz/3dq+XHfvwD5V/+298vH3jqkfKVv/jr8uf/6TucjddcejnT0H41wDb7xWgI"
-    "7VcKMyO4zbiFkLV9x7aykR2BL+GiAmm87D01VNYxGKtN8GzFgxevlDVouhTQhlkCdTDWMa22"
-    "egovahldphwaulIWQTNqDXW87PErg/gd2/vOCXYxrihnT/SXP/z9r5RDnFvY0oymyx2d0Imu"
-    "G6xTCOdKT+Ddgd6ltTwNQZtM+W0aqMeh4bwrCISAYBrbTf5h/yVcg3W5hPj3Wwyc9BXttLz0"
-    "JG4Z9tmYCNHOZhP9jfiWZQ4KbQ70+uzqRcA8x4aOl9D4NSNkP/nEjqi/rgp07TAH31WAgE+o"
-    "wxwvdakc67+EM83Z1BX7JDLXy7mHqe/ec7i8tfcQ+OdoIi53Hur+Y4hl9dZmBTy0Z/iWOsER"
-    "Vfdgg9WB0L5py2YOZF5fdty3DXcW3ewI3cDyNEu4L70ZBu4e2v3O3hO4V8C4HSHgHnaULqZ+"
-    "tkEvAssQS3LNjQodHlfTTP9JId2lPnETRvPAaD8TJ26Q6MdAHRM9aBmrR/Djsq08U7s4bZjG"
-    "MB1wCF9Ev3jqg4/jPLW7PPfi26UHW7DkZ05U7pRVLDkvpi+ynwPTAHZdwgg8YseNDF3sQmxn"
-    "h29Lk7ub9RLPTkP6voeR6+7Co3VaWe68PXkHDetQGYOebt/CFQabcpqbO3h2TLO9oCFbDDpy"
-    "3HM5NHYEIpRZPydm2sqFZkqBgyv5rzwrl3JtccdNBTPTKHhKB8GjFdJ4WYRdnYLyD7vkxO+9"
-    "pCHHs5mXef7wyw91LvWY94Mxzc9/jupxkSyyrJPOyMUPwl3H8+6bUatQg+IyzzpQ3HhNpY23"
-    "/DPnM+4inHFFZLU9IG0c+4trrkUrYYeQ5GA+XZTq4CujnnvmziMcDNJYprHzxtouRGihDjw6"
-    "PjOvSQxo9Z1hPaJR+JaDOQEBKKBXsNclBYoM44PwTeD92BllvV7vgGfcOt41fMoYx/wsW0LQ"
-    "54lCmcxY4UCCmsB2QJiE391Trj0rLBrfcoSvFlzMf0abxJvg1toZYfaKhqyeMyT/BvKrSPG5"
-    "eq4bz1fDjTcV17AIzG+Rk4USUxxry+BlHZPA68je84q8SGN9jOe79fcyVmTHXUNS1/i9zMsB"
-    "OAvPejuzvqJmhAR+V7Bx8PB9piBaI8nwOm/4BhcDHQOJ5+Y5aw6YoSlpS0iMa76BQZ6j3vEl"
-    "oKw6rgfTKqAhCJKp5UYliGc71HSQZWedzVgNlwNgaLCIZ5kuoxkvBgzool4eVKUsLB5to2Dj"
-    "s+n8GVfDeh0EOuDISIdYKtR4VU1WA4yUWDCynLmfOHGOmfUgTG8OjLO9bN64Ckg1VIV+gUdv"
-    "4ZPQ3/AITgXpS6tXLcX31TA7ojC+ZceRlzv9xFsTgorH7GxCM3MPPrBcfgFSbK9WYF+yjn43"
-    "zm60vuiDCni6mBgH1+cwLHZnURfMWm3DeQzdresqDLfbsTE7MYJdDpo7l6zms5QnZdj3rSei"
-    "dmj1xAH/Q8ByMHYgRu5j67u45QNNJP7Nvxlhwt1wDvJzMNC6g+8GXVssYnnmMvZkn/3Cz5QP"
-    "/dgvlJ04Xnz1ey9E3YRX9xHiRdrUqasDrULZGHW4ODhRHnl4Y3n4PlxePLEN+OaWUyf7ia9B"
-    "b0MYFLvU14VfJs9zU6AeQ5OiF23tsM6zO/F+zhBsRHvyyvffKod3D5bf/Ne/WdqX9JbXXvg6"
-    "BtBHWIbEJcShk6WROojPBQyQHskinTph0xO6/sv0Wr9x26byML66/vaFt8sWylTLcRpjb32e"
-    "ffjBdeXJDz4aMJzHf5N41OD5NEuP3nWkeZ5DinXY2YNWSiFH32bPPPOJ8sVf/w0Ek4Xll3/7"
-    "T8q3Xt5TWhqHEDg9IUCegINVhAGFYJeqACvaSRqG8IM+aYmgaZftFKYcgCXgcOkBzUafg26d"
-    "5CQvlK+Tsf/5ycOjrfljX4qs+eA3BTH7m3whzQJySZIWju/GcVlJ1qKmy4OYja9NYC+axCVo"
-    "V91Y4G6+WGYMXjwLYVjv7g3xc6OBu0R1hqvgKW5Os8x3FC//jRiMe2yVbhYUzC6hFZ6PdmbD"
-    "prUs9WHPxURnFrjWDkqNl8vm5/APtm/vfsabceLox+xsHK49SLsOo5W8dQvv8SzD3sJ+sAlb"
-    "sMKuRHGzfWMHQu7i8pM/8/ny9I98grFhvBznLFLHAvu3/s6odQiCCnhOrtYi5Lhj1MmCy2b+"
-    "xIUOiJ0IKXja5gqdR4+cLK+9/k4ZwI7sFpM0JzpuFOlAQpP/gO2YmKh9d/JlQ8RyINophXHb"
-    "TB6kz7rZem8n3kI1YQjvHi2k9nwClx5H6TfXmRi0AlMrhvcuw8/GkF0H2bGSRDni6hqC1QTj"
-    "4S0mFrZv8Db7PBUIJQTlyxOMm6eXpHbcMd44ClkxOQe28DcGbhYICxs6YrxNFiF5Tl9BV9JW"
-    "9ZMIuXibjsOTE7f3XgZNB2d646TSRYbk5T1p1jxtsfoyrTiUPnOszXKleaPZpwy3v0T/qhNy"
-    "r8sNOKuXOk7kNSOuj1NLhDPDLUi14SgM7CrbaD1/SWRaYAg1AkwH0RD2CsdzmPFCOoY+NS4z"
-    "07ADqh6sJXwiQPAM0FdY50bwUcgiiAbHMRt5RkWjcjPRMAMi4lqXgAsJWiYXQh1ELNGn8Fcj"
-    "i0ME2Mbq1m8b19mDak/fYxCAcSqcjGP74m4p87TD14O7Z0lZZ6/0cM8sxZf448P0BV1H+kSs"
-    "EaYbcTqWTzSH9cunuPvH2HW20882/FQUnm3KGXmDW1NZBwnefGtfJfUS4XTqfDKFP3FNwyXR"
-    "mI8FVWVpa6IApZM4cTbdzplarctlOq14kqmkRitV4UEX5CWhBXgkkQbyPWfEQqJQdkXtDUwj"
-    "YDGQuGqD7KiJR8tL0GoEKdg4m3a3TzAcPkhbrvGHYCWOrEuVThhMQ6bE9B+z+UrAssIyEevh"
-    "F2dcxjWO6dRyxTN/23BVYL4Rl57uUgQ5h8Yqlmgsg2LdbeWSnzv15sMo7c5+GAFfJ89fLgsR"
-    "SHo5AFj3AGov9Lye9ibQMjPbCWaclznMdQVHvphv/8mzMMoGhAs0q2SlXkntxAKEm5f3n2Ip"
-    "Cj86zMg7ESas/zmOzuk7fpo+wTIgwoqCm5WxnRS8hH+UcrjF2XiXWfZbit1RF7ub2mDMR7Cf"
-    "mUtdPC9NLEomLsmIlxxMc2lQoarWYlEU36kl9Cdzb8JmqhkBRiHrKoPGdYR/z2BbTHh7K3Yu"
-    "+w+Wz3/hJ8pHnv25cu7UIfofrijm3iqvvfE2vMJ+iiNNmLID5yBLdLo4aGQA8TiaFo4qOYmm"
-    "aPmyVYHn48f7om11sHsO7YcttgytEYFMpHLS4bLgAIfkzqu0YB2c9bZh6wa0YxyQe2W4nCKP"
-    "3/kXv1v+1//wJVxtLMTAfTjq7CCjILN2/VrKwlM9uxkXonW4Ttur+XQHnIPIit7lZRNewPe8"
-    "e6Lcr1NT4P/khx8qDz/+AHUYKSeOnYIfsmQEnfadOl+e39tX+rDbWonfJelW+y7POXRQlB66"
-    "aFMHvRe+/Wq5xJmU7r5jmMLXE8I87i8UWtR6xpIZRHELFx6SfNK92gSW8+C/Dua2nYKdLEfh"
-    "Sv5hH7PPaWMljRmuQCWduOIgTMaRxq1n0DffpAFpwnfbWx90ueuWCS5fwrEy8e3rgB9wEh2N"
-    "zWT0Jx1qXodwNNL2GCd5svR5B/jVijoRUMPX0cEyF/aL1sO+Q3WhZc6z5GBthZdull9dplSI"
-    "ExenTl1CAJ9dtt+3BV9oy8quhx+IDRcXcBR7mD5yASef/Qh5sxHMOknr5HEErZd11n7SySH+"
-    "DaDNJupMv2GCtBy3Kx0IWhs29JSf++IXy7b7HkOoHomlMpfSz2ErNYJCwR2e2reJGHd6au+o"
-    "DVleLgvyDL+g1RIv4Nd21ov7SwfwAs/OU4UrU0yAt7VLOH4K2zgnfU4+ryAs5oHz4AL8u1x/"
-    "hzZXyBHPCj1zsf90443j1XUEQCczukWxH2lnt4zdi40IU/vOXC5ncEI7Z7Y7OOmrizhyCLsq"
-    "+bdChuO446MKC9s9jNWhBcvxcmyWf0xrMOXT2JUSR9oTJr873osPwxcg5DUyoUrhXSpJjhj5"
-    "Ra7/8B/jzryk8fdejrte+U1ayUjJufNb/uUbkfw39c1E1M3xxst6+myW1stvgmA6+0v1GlDN"
-    "BMU8I7DKw7yyL/o0fbFE+PHfql9rpIJzkIbmB2YzisDkjGm+avipH4aPqN9HsDVw4FqEbYN+"
-    "NyavYgyL0OUsxZ0Zof0xM36euTWJ4OPJ40q8Au5Ojqg8LzaSgaGCBKCAReSIEN8R+BJZMHs0"
-    "VK4Xq4lwppDbsZXMYbDAMIbwpM2FHdadXtcQmITLtXuFRdeYJ9lOq3dqpWy3diukyIzF9HW0"
-    "CjKW2BkmITnY+EFQhKeGK0GLxgkg/UY0r4TVuPle4za/+Z3GnHEZLRpbxFRXNCLPElDgCUJI"
-    "fMjMnBm5M0dDVAZGiMHCotyAMTMxzwT57vIcmC3Jv7aJM5jJSfyogCN/5hsw2cfp0H5XCJPR"
-    "5kwXwcR2I5azfcu4Bjz6a1GYdnkmZtEwINMLnkKhTgkVBIRLTaGMToZtei/Rkh1zRl1oL7VW"
-    "zi4ViGSwKVinIBjTHMIcJITbjuFAYxtmJ8kByHevGs8y8xDuCPbbVRjZTXCsql54FjLwq63R"
-    "hkNMyYA8Vkcm7wzSdjHMPJyQiA933cwnnTYS7pLrY5D3GIw2GHcHqnoZ5yjG1gARdBkCHvY7"
-    "R1lieOqRLWULtlhDFy+y9ZxJAUJbsgFKB4QxmOxmBgEZ8Rm2pV/EbuTsqf7w+C6jE0rdSDgQ"
-    "6UKihcGjmYnPObRiFzAEvkN9tb1SG+EySCsDvEsgi6HvI+wuvM1y4EKP7KENYoZLhgpSY/ix"
-    "crFonCUT01uO9CM6XQpsZZlDv2HOvscpfzbt1eTACaPXlmP84kT5kWffXz74zGfKwJmT5fLA"
-    "obLn9RfKCy/uC2NeZ/ckAdfYbKG1uoBGxwFLn0XjOJTUBiq0N+DOpTrt06ynHs+XohnswqBc"
-    "bd0w2gs3JCiIXLzAdnkG9y4G13m0hZODTvC/buMm+MbN8jt/9FflzNBQ2YSD09eOsYkA25yP"
-    "f+rx0r1yaek7eBF4rpa1aEfmswOwH+evLntp/2PlR+E9wrGsd1nZyQ7E1SzZevCvLijGEJZO"
-    "HDsdtBizfjT3C1nvWcoy4uY1S8IOR6HTfmq/cDB24vG7f/q18uf/z9fKa/sOl63YErn8TJMG"
-    "36G5g+ZFUtAuodnetoS0qoaD5Rp+gXPw44REmravhtaJZ98t1z4sDUOC0Y/s71bM7zlWZVz7"
-    "TtA5fesqAqu0ap+di580hXdtDaV/4Qz/W4ATdSaeWkjz1zWJ9kduAnFSbH5NTESuo/100mD/"
-    "15BeoVAaSFcT2n5hR0R+9nN3BS5iyVA4cxxgo8ZpjLmbb7DBoYtC55Vjh/EfhRZya/jbakBD"
-    "dRnNUimPvP9RBNSFnBl4FKHEySjjGngfQQhuhO4WM1GBq4RbhPm4TSnYOx7Ye7g8uOuegO/U"
-    "iT6WEheE7zLUBLFzdxK/bOMI8ovYORftAJwO4KAWWLVt84SH5GkKwo45oxjP78OYXuemS+gz"
-    "nlPYgtZ4A0uC2nheRqgau6KGyiVfxjXwqk1WtL18Bj7k5AVSyDZk3LNU+c5NJkz2h9l3roag"
-    "duc2Qhb40g5OH1zHON1h9+FBdihexNnqFsLR2kWjkRtl60h4/lwmhwiZYXcFH9X2ap5CuL6x"
-    "wHuedOLKBjA43nD3cuxx7I/j77jb33XPoCAdjAS6oqq0KxjywUtE3XXlu3UJ5uIrvxSceDAh"
-    "aeT7hgcH4t08pwXYbkAAAEAASURBVOJHkoxbl+OY6LNtc/eVY0t8mfHJviFfk+5jHI3CLIN8"
-    "ueqojsURUvVH6bROK0D5zfoyPoaj0bp0MjKiOdXSbWhzeHfbqQVbmJ1sHG2UjsYUpDwLScSq"
-    "atRPjbs1FHwUgBRSHHB1iGh6dz7ZkcPoloaQ+FJbkkAEoHQqBZCAheAA2L/WldrEujECkxVO"
-    "Qc5BQZsRbRlGgINZaGwdzW32uvR3NirxKGmnwKCwB9EqHFCtEAZhVDnoQ6yU4y6KUINGQyYU"
-    "Nar+oftdseoX7talQn0mJc/68z+Ul/WrW9XnIJRonxREVdcKdwhYCLVeNXEY1waWAXhZfhAk"
-    "z0mYCU2UQdxxBg2XCU3vMRqqpxV2wycKgs0V2tXZrTMxZ2wOCqr/XX5SsFG75PLfBIw0VcbX"
-    "Y0at7YGMWUFFQco4LvNFbZjlCYvCkIzWtpWJBK4COfndOA5uxpM5usSlzRRAxkCRMOesW4ZP"
-    "pjETDINd37ksO5iKqSrEK2A509eGKtHKAAMuFgDrfH7iQeE6lwezT5iXmgJhDC0AaS1TpjrM"
-    "IK5vIO2ALNZZez8CVjPaCo2LDXfg025L3HpuoEb01ukSdlJbcCK5meWnUZxiPvfGsdKJwat2"
-    "YQqxzlY9cmc9WpOVK3uif91kaU+tsfA7c3SQ0z5r4+b1MfiJl1XslnOp7RJLE9EO5HONetvu"
-    "p5jRu7OvkyW8Jup7id1yxnEWLAm409BBEBk5fFsxVka4sFimGi+1T+LbJRlxbF1asTdqJFwN"
-    "3pbNvWXXkzvZ1bSJJcJ+tpf3lwNv7y7f+Pr+MotTndUEOJh6qZ20jWwTBSxpQmFUITEEHHbD"
-    "GfciWgrpRA2cAopLL5cRwtwGr9bPfrsEzcd8BwiWPb3UmvQdO0lbsZuSsxBXY5PWxneF4g8/"
-    "tr382Gd/tNzzwK7wwP3u7uPl+y+/zlb/jrJm4+poJx3E6mCyEUFLenRXohOx0DoA0wAbDV5g"
-    "yVDtvFpE8RK0SNlqqjyAOjQ49FdpwcmlO8sO47nbA6fXIiiux7aru8Vz/TQmTs2uIla8kI/l"
-    "2j5e1l/ByXdxpoCSwk4KLfYPBSCX2owTkyHiG8eJpYJMjLEWVF3WpRbGLEv6ccAJbQx3hTXp"
-    "WoFOoVgeLf2qwZXf2G4Kb6aT79R3y9YmSRrx0hv5fOyMlCYyngb1WU37ufxYAc56565G6i1O"
-    "BNiPwH4O7VQLuNI55gKE4AMHOd/vxki578EHqONcJjOd4HdWOXvmHDtMOXOSOkuz1nYCPnd5"
-    "HJcGCAl6bddGb5Qds/uwf/N4qu2cIrAO4dozIMW2Y5TjjDwMSImvkbvCsc45EU7JtMaXmh4Z"
-    "uyzGMNtBn3kDTHIOYeDeCG5G6VDj9OX72FFp+pP9CHvQcQopKgbozwpqTKgcGx23FGJidcGd"
-    "jORuHdQ+OZGTF7mrUN51gz4yn0mSvNTlc12BLARnN6D/14+OlQ/sckm1B3wTB35xg/NEdZMx"
-    "F23wbNpuHmlcuREWf+4gdJyUDizHshV0zD/5dI7TPjve58RXIslwIgXOxXuMOOIm8iHgPZf4"
-    "yjwtJ9AaOCQ40tbpAgrziEz9Y2Tu+d/I0xd4zm/Td5MaxSQmqsuVXjOEUNJJm34zojQcd8Jq"
-    "GOMb6et3uCPPkUX88TFtsKKgLDQqwRcLEyFqSWKZECK2oQ1XkBpladBnzz9SmHL2qSDlsqJa"
-    "IWcwqV1xXXwohDGFnoV8s4OoEbGDqk40bVSSRssGqhszgRUOooakbSMKeGilYHBui5eQhFsN"
-    "2hgqXJ8tR4JUUFKNqn2VakuN9xzcJie0g1GTQidncLR8bZrU0ijAyQBVlwaDifJnYC7B+qF/"
-    "bYf3XgF/hXlzqRvtrtZ4b6L6farYmhCUyoHVWRI7isRHrbWZalxpofpn2XdfSSg1UUQ8iMb2"
-    "UMCSkcV2XXBTL5cqPKkhUDulnyDb1mU+BaxcirCDp22VHV4BTMFaAr1Cvt5DhQwgLo05U3HA"
-    "NC+ZlFpQBWCXBBwUbDMZvVeNT+tMNtWVglcIPrSfs0XjOUDkUgZCAczctnVAES+1tsoMfLdd"
-    "b9KJTCPzd2bdwjb5Je2LGLg9tgWbwigwaTL6BWnD2JvC3CbvJdMOxk1ZCl7aj7iLJgySoesl"
-    "nA+nQH8RYSbOBwxBJDcUuEVfRu2yJEoVYMaOZ3AIB5uny+lBDjsGTuuwGJx6WPRqdiHde886"
-    "6JqlHsp32WMNBwcL65Gj58qjj90fWpUzp89io8SRMwwWtq8uCVpYvutniUNBcKG2VpQpzi7i"
-    "4HAheNeORFZ4Zhghm/BGwkw7yfIlE+QQskgSy35uR1eIcJCX0iYQMBwIG4CrBbsuJykd7U3l"
-    "icfv5diU1QiH9NE5Y2jbXil7dx9iWXCstHfJB9AkIBjVKnqFM2lFY2JpLCZKCPTiV82fx6+4"
-    "Q7KD5cM2hELbxIOWTbP9ng1l48b10BPnO3JUSydLcXewTxnVMSm4clKnEPKNb71adAR7/8MP"
-    "EXa9nGDwfeDB7aUF26iDe98p3/76S+H/7CHCnv/Oa9SjpazZwLE5YXaA1pwy1dTFUhNlD3GE"
-    "kVqra7TPOZb2Vq/qgubkm6mldTLg1nx5nRP0IKnQiKb2fTc7ydT0LqBN7ANyYWE1nvzVvkBx"
-    "Udfss/ks3rOvJD+wm6etYAo2to95OSnxmBhPP5AXhEE7GRI92ldhzmU/JyPZx5Iu5MPiPVx3"
-    "EDsM6O1P4FABXEPzPBPUfqDgp5Y6+x8B0IN9Mpep/W45sREEPAxjTO4mEDUsDmTC6eRAran1"
-    "lf/q0V4eoBd+/Uqp2XSjgII0r+UC/WQpTmnHEajF9weefhBhoo3zOk/iAPQAS9ZqydjBi+Db"
-    "hIArDp3cOI6o671+E/xDfzp5HRy8UB7At9iPf+6j5cMfe6I8+dEPl65lKxDkLwRsClhqdOQt"
-    "GugvQDhUk+byvvlaA4VY+6p9yqvGpcvYUEw5fOxMGXbXMXWapM7rlygYNpSBi+6GxHifSZg/"
-    "J5/H0V4PUq9hfKMMjuNKhF3FF/BNN3AZty9MShbRNxYw5uUEWzpJjaQrTWAavjYZ9AK3Cv7X"
-    "hib7LBO9Mca3BRi9b96ykX7SHG5JpAdxLu7nqq1SMUJ++VOglv74EZb05zOVBpEhaMU385BW"
-    "5bVV/ESDxFo/gQdf4y9wVogyjF++TQsriccamRnJtOKVEiKfwLcpI1qVdgYMpIq4AYPlVr9I"
-    "7xfrUcUJuHmu2y/BpF7U075L9CgzhM3ASSSNsCglEmS7C2MNlpJNHdM8ogJQD3c1I3iMRSjS"
-    "fskjDUL7pHCCtkMmEN53IRKBc5Czk1V1oKFSsp7A6H0Mm6mwGUIgkOiDxGF+GppfncjdVzaO"
-    "y3ozEZ+A+bcGmK9wHvNWBXqF2aIzxoVo0Jz5jFOOlVCQUmjzCuSYK3WqhSUH+IQH4YpRA2E+"
-    "Oojx7dwybAWX7DAyZuH6/39FnaoMvNnA/1/zmyasCo7IYIpUIlfr7lp9NDDPEoe6b5mndcpC"
-    "+VARQxL7dL0kHp0IijuFNgcoo8q44zJP24l7wMNdyV5Ng0t/sxlwZUTObhN/LB/SPu7GkZHW"
-    "ndWBQU2Y8cyrIQQ4O4ileK87a1UX6MJZ6XwOevXbPOis1pY4KDu4C9d86YefV9SNQYAA3yKs"
-    "/iPsbo+HcgMlClLO6NWa1EssCmQud9XdwzQKJ05QZbRucR9j1uh3l8kUNhYzYGj7464mw5ew"
-    "/LQIoW0MocB0lxnsb48yMDJwOSiYJyXHLNdlkv3HL5bXj8nUS+lQwOG7y5T9MNsl3B+8bwMw"
-    "shQPTpd0tpdO3EA8/PiuqHtrx0vUaRaz9TNlH8tMwmg5GgVLx9LwxvUryn4MuUdYLuxgN9Il"
-    "dr1Nwlh3nxqM/D0XcA3G7/0c5aN9XwuG9uFUlKVDsQgIIQg4Sxdn4t42k08twcB3EbY0ajx1"
-    "6rl1K0tmCG0H3jlQ1vVie4PFyZe+dLZ0Ld1Qlq/XTpLjaQbwSo1A1soA4GCVbSCTr89bdKkB"
-    "rR884xKmCvbf1atwf8Bdn0u2eVeX3sCbcVGB00jCzp4Z4Ky5Y+UDT+4qDz/6IIdG78b+C+N1"
-    "liydke/Yth5/WYcC6O0770EzMb/s2c3B0izrncPFxec/9/Hy7M/8Cga/pRz/7E+V/+Hf/CWO"
-    "TD9StmzfzM7CgXBSaV4OSKlFYqYffoLwMYUg7ADn+Y1qxqVzaVPkyZ+slzBfw/RiAcunan6G"
-    "RjBGR+ugw9dmcGE/DWZPHe0vXtK6YdKDP8NtDwdjhXqvWps6myOF1JoQLdrGCZDfUgAwppMX"
-    "tbLyQ01BzEuBUT2pghNh0YVSw3XLpUH4ZWrJ4TfwBOG/5gYHYA0tJvW8odRDTgljll3DbKmO"
-    "F7axvMXJ4UkE2+XQiUKBkwyPFzKtdGqbWEe1jqnhxIv/Bpd3N7AU2Ffe2dcXQpKTNm3S/uar"
-    "r+J+oQWtYkGLeKSsWtlU3nn3XeqNtoxlOPutk0ZxYnwnQd/bw5IhuXxhTWf5qS88Ux554unS"
-    "1r0OOGeXk0f3lsGL/THJFifSoGOiMLnsPmvW8hBUb3iQuP64EJjlb7KbwCt1sL5i1gn9ADZX"
-    "x9jx2kEHmkDwFL1t2EB65I1jUQu7LPefx6yFS0vCn/zoPdC1TkLJkEzNy0mMmyHe2XuwvNY3"
-    "EnG3LpHP0pb0D8ALGmts5CQKYGq9qcd5J0GOhZzjuQW/b/tOl79+kYnY40fKfQ/1YN/nSMzu"
-    "U4h9TqWkiIyhNa+gQ2qRbxESYdJeEDV/6zgSJBiog/PZ7xnZBP/gVUeJvKqyIzcbLD5Wd9+5"
-    "6nKqV1AkrgknbQ2r5foWJ3BkJpHWP3U50lukILLPdd8jQoTbPwyLbzUcpL/Nd78ZngDS0j7H"
-    "f/9kfpblUjCZVZeVo6VkyLMQsEwQa7J0PhlF+LeAGaglauBgykY0EGamwGPk+lwimbuVUFgZ"
-    "Q9PlSd2qV7WPijiqWil5kgHKWXgs3UGIIi7VwImoKUQIHuX4Xi/7uEvBAVoti5K8PwceYdJ4"
-    "XoYgMzONDMpaqm514M/snAEuwG6iLcp34LZU15s9wDOWP8OGS1sCqJfvP/y6C4O2jaDmVd95"
-    "y8bIYONYXghwM6LOiF6F1h+rL6bjn5e4mroyKF5DKq8Ei8CnwBiVn7gQjjq6z/HjY41rt9aq"
-    "FRR3Ck/GdTauAKXQEcIXsxmvWKYj3xCyiNNAu6pS9tgO8T93LoIPhpbzaGtV/lE2GcqobDuZ"
-    "q/YHCjZh6xS0J7AJa31XGJYJqw0QTpfDpLHUtMGYCXew1xWDePUS/my3rH4E3vUHTAKL+Tlg"
-    "q0WzM/mLJUtmu8EkgTVm1tUSrDhQOFKDcYPlsyE0QG6Fb0FgaeY3iTCkLYWC1jCajQUeToz2"
-    "qBla174LsALuSYQWBxNn+qMTLB/yLOjdMGGbbIQlwxg6WUZayex91871YS91qu90+eAHHysP"
-    "PfZIacDPVBMMv6mlEwY5txzcfxhNJH0NOvdMPc9Kc2J0/MiJqPl99+IAk23oX/7714MkOlo4"
-    "NBdha5IB5yJanjtoB9awS3HRgo6yB79bk/TfBnwThZaPHLrwKC/eL7OUKO4XYeyrpsSjeBbS"
-    "Jlewgepd08Xyymq0JuxgPHs2dn7tP3K8/Nm3L5dPPb21cEoMgpXH0OCkEY2c9mIOuGoa1VrZ"
-    "1vIAl/5sUzdF6NtKuPX/FS4uaBsHPXecbduxBXucs+WN1/ZynM9A2bJxWXnooR1lePA8g2sD"
-    "ZzauLX04L7VNF7NL6zZ4Vou65+13orwdO++j7Dnl+effRGvHrkWMj8+fPcbAyXI4AvMKDKn/"
-    "3f/9XPmNX2xFy4WwKv2CA0VOcREaGGCfwNeY4rJcxFFFvEQfIIHuHWJUdbsC36QBu1ALnsWb"
-    "Ec4vs7PzPDZwLr1pyxbag4pPSYP2G6+6z9f9WINotVMKfIYFnYpH4QtaJl30N22p8hgYl/TM"
-    "yT4YAp/CgfyeeF7C7zcFhXGXsskn88++okA2C1lK+lfza/9VyItw0qklInvysx/yzrhhvcSV"
-    "z+JeDbcaMY99WbaU3Xv2P77VcVyKdTdoG1rQBRhkD3Ig9KEDR0OYWL95E/x6QfnK828goC2M"
-    "ZeJb9Pvnv7Wn7OK8x7XrmmLZvEnzDmjEJWW1yZ5nqBB5i8leE8LtP/vpR8siYPzQP/pHZd3O"
-    "x+hLi6Gz4TKgH7nhQd5ZsQFGNXW2sTynpbU9+Jb4sUVsp6OcIznITl2/q4G3X1hvtbPGc7lt"
-    "jP7iZVtO0pbbgFtD+XH6+E0mhApXP/aEWtXHytIVK8qylavJyyN8dGmkzRtLd8Dj+DYyOMhy"
-    "/4VyaM/b5c23Xysv910vGziEfCHfdV80+xpj8SzOfNSgH3jmzfHsRg9wn1tW44fv4rEr5dWX"
-    "XytrNmxGy9cT49ztOCLH8RE6IHbSgrzWmkgfBFY0mOOLNFnH45sXccMNROTguzl552f6qUvc"
-    "TdN0HWy0WqNUh3nPopPvRzb8ifTxrYKxKiuEIehV4OTp2oIrwNb9p873Dip6v9fh773X/cv4"
-    "NfixRBhlGiZd2J6U5UUk6T3zrOATQfzmfOZTH/2tetCO2vBHzYeAeUmkGohfZ1lQQzuN1W9D"
-    "eE0sDaqO97sztTsMMmOXh6NQNUqqll2GU8DS8FcjxQY6hgO0zDPsdqrZl/Zdaj6sjDCIwHgE"
-    "wFoQEYc+1w0u85Ixa/A+mw4sjM6AmzylnIFb4jcOrR6uJCRubTPsCM6IFaAWNLjcRdmExe4U"
-    "uR7Iv4qxt/YCYcfFdxsqgEuwAkjxFxeACXf+asLxowDz3w8zrzodYXXD+tnGUXsUGfFuI1do"
-    "8HNFfGYGTvi5rd+On9ombYgqOLyb1qjgJS5f6zCCHBws2xQO8uZnu7pEuohdJmH0D+6cPSqU"
-    "mo9+eFx281BSl/8UjLXbUs0vs52AGVuGam89YctcdEHgzkTD9UskCM66pRlV/7aP2St0j1G+"
-    "2hnbQwNJ28/RTNlWQjaOSyg+m3cwL0cqLungBoOxOFRrYxyXNQOBUXefpu1XHEbEjJ3GgV2B"
-    "RDyEuwDoVjpzgHH3kzAItwOkxQXefI8rBTs1Wdqi6aNHXDjQuotKuIRffHl4sr1SAU2Mh/Ev"
-    "/chzEu2nlmEeN2/OKUPVcs4GDo7eicCwfdvqmDk7YbF+mzduKrueerp09qzAkamAuHv3fDmP"
-    "76smtrLfcy87qzo7WSK8UE7hyLGzi8Op8QfU3NIK/q8Wj9bYd/wCQhHtBCwKfvMA4AqwIQ+y"
-    "LNZcOtGmHL80Hl7a2xbOKRuZ6esrS/sdt9svmKeXZwZYAHj7JIdXdy0qH/qRx8tatGp3oBUa"
-    "LHbHvfJWX5nd0FXe/9Aq6ngHWxSOyaHOYfdB+eJIXuARMrabNOldlwbasKkddSeZ/dblQZdT"
-    "1RgM4nuot3dpMHUHOQ8Rvu9e7M84a26Sgavv2AAHZR+nzo1l0/ZVtAN8AI2dWqxRNPLyoj4c"
-    "RLYj5KzduB7hGOeV2EL9m//r++X3/vBPyje+8nd8m88B1MMYnbeXdetXs6lnjDzUwsi8xXva"
-    "D0ojExg+z559I4Q4eYMCvv1mAUKwA4/CYtAZ4W6C2LxtLXywsXzl24fwS4YvNQQXDadNpjCU"
-    "WibNAHKgtp9bpn3JiY14qePaDtK+kxs360i/liltSW/Slkv/TiIUgDI+gw9xkqciKIL3FJKS"
-    "xp3IWj/tgYRX/iks9t164EocJEwKW2q6XB4WxoAVXipLs95kT18TRiYVtLlCe093G9oqtF8I"
-    "EmqVxBulQI95MkFPz7LQEI0MXw7Y9YzP4FPWrFtddnKQ8uTVy+XeB+4vjzxyH/ZTx/iE13iK"
-    "cmnZSl9jEqOQ0dya5h4DA6xwlJHyE//FJ8oDDz3OyQhry873fzLMIy5eGMAOC4/qCFlOBh3s"
-    "A7/wrTnQaUwigwc60aTT0baLcSXiUqdaPYUf+4XjWL1UW/Dgbp3c6XoeG+SF1Nnlwc297CRl"
-    "gvnqYdxwNN4sv/HLz5aP/ePPl5XrNpVGxlXtWMMrPvi2reV7Y2i/zXcxfbirZymTmI1l54OP"
-    "lA09LeXl7x0IAb+nx01j8DE2a9lWjQuY4LI8r72VvEybvza0zM/v7S+burFT7F0dYwFNRB2g"
-    "L6lAYpE5evGsZjEEhwyJb34O5QCVs7/6P/li8krHkzoTPpEvP/ON/JIGCIoryzYWKWSE8WAf"
-    "hx6oQ/UaeKzhiolzFZdmsPAsH0DMox7bvNdwJki8g8+YFJGuXsnK+L7Di6F7TToiH97lT75n"
-    "GaZlok9Y2NAan5+4lvYjP75JH+HSAmE71tEoFnqxkgmojxFGiIOgTt8mMQocRYCyI7S2tcdA"
-    "KnIdDAXGDOsdHi416V9qAgHLDqXApV1FrT1yUEs7KM8G4ygKhDe99io0uL17HnEd3IXByt91"
-    "0Ugx42IAVjBzN+DoGCpToi1arHDldtc0PLRGqRp2UKYpyUskONODzm1vZrYuA+WSkcR1g05k"
-    "PZxNC4NpJKC8ZsLiMxgQWbaycbg5uEaS6t0Q36cu4k6904lNbz29gnCmIvJg1vyLr/Gc+DDr"
-    "KMwocLBkkoZVcfMx0oZBTcCVeQXjQC1smRKw7/GPuudOSpk0nQpmYAo9DOvDTPwpNKcNBx2G"
-    "7/p+cnYlzj0A1SUABbHb7IoTJy4tp+2bR8NYP4R3snVAjbx4DmZMeVO7khSurJPdMpYoVdGr"
-    "8TQ9hAyT8R6XAwkNKX70QaXTThm3uEmNmPnTcQLhNY6pLYHZBt6pHz/TBa4lDAcG4pi3HShm"
-    "VsQxjaU5yMtUjePSzhj2N2cupt+ljvaFsatOGNVOXWUZyKqoBXBm7vJh/zg2aECpCOh8Ny7L"
-    "jetWeXBtZ1m7RmeZjTHAgbXo5FfYUXcBHz4H9veVrX2Hyn2PPg3TvFHeeBGv5IePlee+/kYc"
-    "+7KRw21l0Ap1m7euRNh0MMb2hbPw1AYs5XDqpx4s5fk3jsPgMVanXa2DjrSPDGITBRxur78f"
-    "+64+jtoZHLtZliBAa7iugDaGTcjAdWyhqNfjD68rzz6zCcFqTQhNxw8fZvY8Uk4ex+fQ5Oxy"
-    "733bo10GGGSusRtRAbsRx6YuPTrAq8ESp/qckq7VbGqTdJpdkouw09uwfmUwL22tFC7V0Clc"
-    "rF7pETiLWO47HIL/Gc5l7O6Bh+DVfZA6MMwgGDSUN9/YXx56dFtZv2kdtHMMO6mh0ITJANSk"
-    "fO+7rzHYTvCd3YVoXsdYspu4ysHLtJ94PotQ9k9/7kncCHSXl3EMmbQpTTGAI8gplLh5QXvI"
-    "xpiMJfwnT/fj3PRSuYel0ibaMQcpl5mxoUE70cKh0NevutRzuSxDkzdM20Iu5SqHSXu1ESbd"
-    "3WZgdPBTC1/zQrVAzj9Sm0wcG0w650GfadK8ExQFYnnKjZtqT+0TLBeiWZMW4NzkqRZVTbMl"
-    "in2FMDddyMM0kjcu+fOuJsu+cBPbJfuLedhu1isFEPPQOB0eYf4CwXfz9W+kJx9h8N0J2Tls"
-    "BJvh/03Yyyq4CaP/PJdyy/ZtuFs4Xl7m9IL165aUlT29ONLFUPzgyRiDNmxcX1biINQdfR6y"
-    "rJZcfHhOnxNm4V+IrWDBgH2o/woHbI+WJx/fiknKjfLWy7vpVwfL+z7yYZbUj2D3iIYTXJAx"
-    "45gbUFgKxEh+LkL46MhwOXvyBEvDR5gcDFIG7kQQqlzGVKOqfVZ3dwdVxTQATZabH+zwVt+l"
-    "Y8ebcSb/Xtehd5qN8WUWjoKHyiceaSqf/8lfKMtXb8YWcZQlwyGExOTJCmryEHmO/DjEH+o0"
-    "weqRmWvisLi1ozz18Y+XNetWl7/7z8+VV3DqumFtBzhJm747t0k3GztPylXQWtw8u3zvwPny"
-    "G1/YVVasxBHvDQ6I5hij2dAyLZ4kQIG2b9KaYfziv8IUV7QrQQLGlctzyUcjgMjSiYAbx/4i"
-    "PXiJC9Mb5rfgrbybpc8hyGQm8d04+uxKWqqLpizz4ZuXf2u4vCvsGHIbuk1hi9cIMS7/pDHT"
-    "RiLCePc56BkYIle+R5kAFrJN5JlxDFcIi3gCzoOw2w/cWRm4s/6WSdicz3z6o79lAQ4uGZpa"
-    "KztoICo+MmtCzZpq3HmlraMjluHMwA5oYUp6aoZ05ZDHILibjB09seSk8zWN3lNt7izSeCJc"
-    "zYQdw6U9HcK5PGcHcdlQRMhkFMh+2KXmSgNI1cBq05qamyNtvfPB+iv46XhUInUHkGUp3IWE"
-    "WUmb7qQQDlWsMdNkzVojeXeOWL4NoxDzg1cSR4RX6KvaPRFeo5S7uBIe74HtqefMdVaVMAgg"
-    "MGq4aYzPFS1aPRBXwVDGF35owGXkH7Bm/CqVWZCWxPwijllEvoankOBnpXLbPJYHya/WEpnG"
-    "dtDeIL6DE9tHZi5R6Ylb4SjtPJwh5w454ZtgeUq8aocQJ8hHXjlDV4tpfuYvnQFdzNxlLApU"
-    "lj91IcyIAKLSHoJdM/yMYXzLj6VG2llNazB+Bj8FQYlejVQuMcr4ENikKfJTsJI2zEMVv8e9"
-    "CJMDjUfh3CCdkEwxCfISX/4coFLYcgC5E64Q9Iek8b4DifQtA2LkCB84Gt6uX7e8rEAz5Tlh"
-    "y9AULccpYDeezldiWL8Go937tiwrHqdjoRcx9NWJpUxbjY6+tiYnMHo9N4qman5pYcnudN87"
-    "5atf/m75V3+8u5weOFPeOdlfvsf5Zhfw5Lxty0q0SCMIVZfoG4vL6VPaleDvZ0UPd9wD0D5H"
-    "MLJlGIIRW0tww+8Cg9BC0KOhuv5/BjhP7iIOSe+AE5ew1q/DpcH7dpSnn7yHQ5YfKOtxUXAB"
-    "7dlrL+5lNv1mnH84t7kVW6xufDfeLqcV0tj5Z79rwc6rBa2Smk5tOp2dDw3pMFTXFrk5wrax"
-    "PdvBTzAvvH67RHwZLYBtpCNF6aSNnXkdCIJO0hTsv/bq0XKLJc/ly/Qnlku9czjs9hw+ruYy"
-    "AK9et4KGY6cxW+bTNUAOAGdxZim96Yyyc4kbdGajsdJQvqV88NHtYd91cP9R+Ag7RBEy9fSe"
-    "y+DSTdKLbXV5dAJBTBcLt8s7B/pL39BYWYkLiVaEJfuvExG4GfA6kUTbMhczByTsNzCAbqa+"
-    "CjY3ICzPllsAHakViskF9OnAYZ/zXZx4t8nkV7m71k0W8jqW5GjD6Cs8KGgYRwHHiU1oeO0L"
-    "DLr+M4/k85lG/kONot9EHwFuv1u2dTBMfmD59h3vhufARj+ZGhAdnEzLj/jJ1/ye48WcWfPK"
-    "Gwf7ywp2c3ayG1R4NQi3n8ZSKbSwpGtJ+Fbr6emKyfQQ/tGcVPedGChvc9Yn6EFDe6b80Ze+"
-    "WdrRynp4t9o5+28s4yuQowW9Z0s3Rw99qjz4+AfBvkLnvLJl5zbJPTZgWbgKAeuxgL7r+YTa"
-    "Hx9lyf05PPx/8xtvxHmFQ7SnPstO48/s6OELHPPTH1pij2NSAyttKmi7bCq/cHej49xJ6GsE"
-    "oQdMlQ46lptdNm1sKT/7c/8UY/qNZejCKCyCXe3aPUPrwWtENz8v2ykH9ZqHi393o6ZfwCXL"
-    "exFIt3Kczpzyl9/dV1Z0LqRfaegOghAYAaK0dHaT06xyoG+g/NIvfJJNDyyFX7jCcVKrY5ym"
-    "BQNvlhWIsM2qnw0ZgojAcMl/p7Q8fvMnTYWAqta++k5YVILvoeVBeDSdfLEefx2/DVN+UMZI"
-    "QTzp1TQ3kSHqsiIecULwRCQ0Dyf/YCfKiXGd/FIwrcrxXXgUVr3Lk4kv+7fvRmfhXfqrxyMV"
-    "RNKQ7aDm3LsrOcoOyiUqnVIZgZwSzyoImNzzLeLYz3h2gvcDAhblZE/zDihREJnH4ApxKzDV"
-    "DkKFKjUoxCShje6OwnDRQM+1MLVXbjGNZTaztkMS12YMoPlWA51O09hmirAkgF51pePlPX/s"
-    "iAprCm+LsAmbz+DvJYICNmAI5PPXZUONImPZkDgiLQQ5EUMeIagAr0KVwpV1tO6BbPP7oZes"
-    "iMs/8ZC3YDKkSdzUH6veElHzWaYVQiSJQ9IHN0HUgZ3M2Ia/+yIthJ8CVs7axGPAGsytim06"
-    "ogY7iztPFssfGaYdRuFDBhlpnfODC/HjYGNYfflYE5tEo2Yv29rNBqqlZbAQLaNzzdhipkrH"
-    "kjEotKltcNanMJZEK8GSQBzzz/xkjtJMlg9cgstPQdp8k3idcWvwrjG9Rq6+k5czZ+sD3nPw"
-    "MU+fzYUf9bZO1sM4xrWcmB2S3m/OTt3Gb7iaBm1QVK3XeDJd4IrsQlPG3UExriiC9kSYChcP"
-    "5K/DP/PS75flqGFbyuy8Gw2SBuBdHOvhgb4OpN6XLuUgaLTFo/io2rPvVHnlwJlyEK/uJ04O"
-    "lvngwPZT4OpZ2lpOnhgpp44dKUcOvFv27DmBgf8V3CPcDNcOHSxrOIB+9ft+u1yefN8GBKwm"
-    "YGG5BIPwocFLsdSlFsgDjF3GPYudyALqpxaBqsT5hTcZdMKJKgJDhCEsdWLHtBz4ly5rom/j"
-    "LX4MDQJaom9+43vl0NGjDDQsp21YRV3T98/lYTTU1L8dYW05zlY9QiaXUdMRq97bOzkapxlt"
-    "QLQ1JYlTBS7bzQHZHZu6wFADKJ683BmobdbS5V3grSvqcIudhi7VXccHWzs7DaUz7XxGEXyQ"
-    "5/Fl1FqW964IxjyM4GmdFPTcIXuR5UG1ku0IRO6S68TIuLunm2XBUZYST9Hf1CYkYwakwK/0"
-    "eonlK+F6aNdOzhC8l+WvKyHQbt60rNzLMlYbx5e4M0tekJOHpNdh8rWd2xEWOxfNKXtp5/nS"
-    "JTBp6hAH+ML4Y7mKAoNX8E0a9Kr7p8KT2i37mTSmBim0sdCdfd8JifAKv7h0Gdy+r+G3/FMk"
-    "mIc9zbi+Z7/RnijzDhj4IC3b70IDYXzy82e7JS9LuIKXkVmYXdAPhMt+JxzyNwXBEep+iQn5"
-    "A1t7wR/2Q8AnxF6j0MQgPt7UDK3dsDZ8Vr3++r4QwE1vff/+tUOlFQesljEHuyocDiAIt4bd"
-    "khBZT5d3d+5cWj7zT36mrN36CMLQ+TIHrV5Hj4JYY2hC5YX14NnEpKAJOyt3877+0vfKV//m"
-    "u+wyHWCZF+EYJTzNCH8UZ/JfTSDQtDKxGIYG9PVlf1DI002Ngq4aLOG9jF/G89g3tiCATVzV"
-    "J96N8tnPPoMAuRmtHAqFBbQfmsH4Vwns4iFwW+HM9vEyv2j7fI12n0SrrF3aylUry8LbE+Wr"
-    "rx4py5jI2N7NCIyDOO/t53xCj3JawZLkqRNny5f/9lWO7tpaWju6YtXo1q100aIwHAI1ba/w"
-    "Y7mWGQI+77FkhpCioOIEn49BTyEMIfAp5LgyEt8VZhwDoDeFo1oAqutiOXlVZZJX/a0OlyCl"
-    "naSfpDV5+sx+EN+Dnyd/dixRwydt5BiP4EPjOcaHIBRjhmO+451x6ZM8Z/90XPLdfhqqXfpD"
-    "JUARRyKOcYNvdRl+l4YMr8dx3wOOz3z6I79lopq4rVAtMYZwE12eAYUMFWDmwZCikMg0K0ST"
-    "Bz6shMKVBDA/ZqO5w1DfGgoqoDryCYmXhps7h/gQRlQUYnSQtjF0jxBhAXRq0siSK8tJ5Odf"
-    "jQjnL1hMBZm5UIbCmgiXW1hhG0wEzmO2aNxYUzYN5VoXBSl/wjj9ozdZIL8QyKLhM68otaYD"
-    "vgdE3uNhmjzq9xrWJI2qV1SZmG2N9+g0AW3GyfccVMVX/V2Cjg5OJw4Nlg0Nnqy79a5nGhU4"
-    "FgBQdoKZeRhIycF8FeqScdvGQRTkN1UhYaUyQYR8D2IWzzLawHMW4XKgGqvZzMC0kbEdZYTS"
-    "kBqdnOEp4SdBW7aM10sBxvzUcHpZV3/CVV8K6DIs2892tJ1DsCK/zBMCN10QOeWT2IEiliyo"
-    "ruHOAuyYWUfwZb3smAIjnQDPHDwkexf2cRhozL4DjjputlgMQuQlzarFElaqnDAEU0ofNVZR"
-    "/2F2Xu1f9A1lvS1DPOWFx3MELrV61xEQ3sUfz362/DeR/2Jw3oaRvIKebdjNLr9GlvWu4r15"
-    "FOFhNkayXd0Y109eLqfPeYSUTDAFgcsIY/esasENwSaW9dvQfl2N40KcvHQj6KklWtG7NPxk"
-    "nT3Zz5KBHqIRNMULgA1hqD9a7XoKDRf1O48BfxO7OS+P4OgTzRR6k/LWnnfJl6XNB3eEkfsk"
-    "GpoL50fLVQzFQQXGypyhhiChPY80M8HWc7VW0rGDqMxMTVZ0V8q17V0+dGB3mbSzi12IIfhq"
-    "KO2MNkga/LlVHsESB6L23bd295XT2HyewTN9CwOsDnTbO+aWRx/dwo7OJeXt1w+jvVuKgW8v"
-    "wg27my8DH3k4aKihPcvRKpMIWx4LpWD1xmv7OTx7mA0Mi2MgUyAJUgFG66FmsXdld5xPuGAB"
-    "mjnOuOvsbsdT/AT1H0Ez4zEsaund9YgdK4MuyQhDQ4UgvYedbNeujZVt96wt11kiUjvZ0dpQ"
-    "LoI/8TbOsq3LIS7rSW/SojTrpMKl+qRpogKXNCV+HXzSFgo6oGwzUqDNPpX9PIUrJxTSO5MJ"
-    "4pEt8ZLXphZJHOfAZ5n2Z2EyjcRu3vGdZ6k4BhcqJ13bV2dOjANOYkmbnoc5hLBxjp1uvc3z"
-    "2ZSwMiYNt1mWI6vgBS4Tm2ff8ZPUnSNklnSwlNwQLhfsA5Z7icO9N67HJQaToiOc19ja4sHO"
-    "ap6k3LS9WsUxPGrF1N7OIp5nj95Eo05t0Fgx6YFmhHUe/U5heRGTj2vA9/r3Xi1f++rLCOI6"
-    "7WXXLisgOk5WWyJK3cBynVUPDzxvod/Kky6yLH0L27EWbCDFkUKWJgKxIQLcnWCJvAnBfQRa"
-    "W9E+qzz88AOltXMpArnOlq9GfUMbg6ZFGx6dfNP4opxys84h+PBsoKtDN4HButwmvm6LFsAn"
-    "eleuKP2HjnE+In7b3ISCQClvvQ08t8D/XCa6p4dIi5nkzu1LS/fypbEb+jaw3qy0PDKywHPV"
-    "xtKgY00KRAlLfBcu/9EexqnHE2kpBA1oK/ixPNZnPthv3GFrOxkWig35oYIy/D+VHTnR9lnY"
-    "jZ9Cj8/G0UZRAakSnFSQOOknXMEmlTzazmnXTdnQv2ZDKmNiFa0qJ1e6LDe/BazApxIoJwcp"
-    "bNmGwhvjYw0neZs+6F34o46Mw3GnTPsB9UODxVmEUrMXDWchzrYkdp/rTpZ+MJL5+b1GWCK4"
-    "Smx1ACAQSUcXmdJDDJwwAQvwm3lKPKpPJU7DEtDsoPXgbfo6vvcAyqK8yEM4gCju5mkckWD2"
-    "5l/Xy3iWkxBYh0RAaKd4jrIpKwVKyon4kXPiwErElWVZjmmjAOoVBEbmAaN1tHrG9x7ASHDm"
-    "WyHa9KaOcvI5gK7qEPGqdJmsShdpwB/E7EBj3imIIpiYp5Fps+lLAGa8V3Gy3rZDXS+Si+vq"
-    "Z/qsSzxEdkJpe/Al/tuBAue8OxCmaleGnD9BsR3V1GjDV7ep+Uo79eWgkWHkDbhZrt8NF3/G"
-    "jD9+zDK5G8/v/syv7tAZ3w8ZPkUjBvgLfJAPb9Yn28V8Ei4HHPN0yU+BSM0AjzUgUb8UyHLH"
-    "lMKMccVk5EkZ82Gk4dKBvNwWLsN1m7VhClvuptLmUBsjy9IhpoIEKCWP6wgknB3WMBsmeYUB"
-    "goGWJaOlnCW4aeNyBJLWEP40Bl6MjckoPnMaG+7gtqEBJ4nj5fwYhsmkoX+XZRwB48x0BNur"
-    "UTyP6xfLZfKNLOlJ83vwSWU/6ULIuYrLlEPM+FthyNqK8B+jXHDEnbEpyGoe9UFZgP8gdgCy"
-    "rHn23KXyGkJNe2tn2XnfGhgZxucYgqsNAikMWnOYpbcwq28K5iwNDWODpjG3Zw22YmBue7l5"
-    "QgFBgVOnj850O1k6uu/Be8FFG++zEZTQ9qGhkNGrpZKhaWyukDWMV+4eDs/toL5L8JrustwL"
-    "75wsW/BJ9cT7HgT2O+UQ9jxvvX2CgXWc5VU8c3d0RjkKelQLoVV7wnngkKNFcPWgh3ttWdQu"
-    "LmqSTyUJpDE2PGP+DQzV13Cg8E60eOPlP7LT8I039qGlW1I2bdvM4HunHD50irZYjDA5Uf7q"
-    "hTfKPozqV/c0oYVDy4Gwdfb0SHnx3eNlw4o2lj3byysHT+Er6UbZBGwO6mGfB2F5TqMbQKQj"
-    "ad27/UZcgL4pgV0aNkzta/Kk5E25DC4PlB878an6nHUivY0gDuwf6YRUga3iB/Jn/lXjOryN"
-    "ZxOFDWKmkXBjQKr5Q8VzLEuBRO2UOw1dcr+IRlNXBWbRwGTm3nvWo+3EPEQbQAbPnEwmb1Ho"
-    "0Y+VWiH7i5pX28E2H2LJubcXukIwO9vPpGUeB6Zj16ZgPshSnhrMVtL99h98vRx97Sja3Wtl"
-    "9Wq0ZewWvIMLAzfiqEiwH5hnIyszXkfe3V+e/8ar9FN8VuGmRLi1G9TPmQNquYM9HGW4oUHe"
-    "4dgmXvV0rza2Hdpyad3Leos3x7ljpy6CO4Rd+tK54Tvlwe3LsKHCLccd3FQoT6OBjiUweIQC"
-    "ltojcaHpRhpN51JaxtHemYkgHdOxILRLtPnEpBvKFpalnM34l99+syxvYeMNx0y5g3IpGln7"
-    "/jwUHzb1Xg5Gf/rh1aVtSRfudVCcsJSuYBoTaXCSGv4cEx0XxdNMAcgJbgg/8HjHoBSC8tn3"
-    "CAve5zM8sBJqIh7fnSyHsFMLP3y3jEhLmHD4E3eWnz/HasMVlMwDmIx3V5yEcyqNAg80XKeP"
-    "caKKn2PIdB2lA9syxxLD82dbSrDGtyzjxdhHXJ/tN3Hx4lPYZRtAP5jz2WcRsEisoEQq/9Jf"
-    "iJg9LjLNgdVwC+cbPzu48TPz7LDmaSP5PfLis2lj/Zi4hpuCBzPLG8wvhTXv2sEonWanjjwg"
-    "pACav1Gc6YXW/CKr6P40RA6QEqA/a+J3REqjxyyvyihAju/CUV2BWMq3jpHAcD8HN8lbCCAB"
-    "Ox+4iwvhCMleeEgb+MmSq3yixsQ3X5OZaaafuhEWod4rvEdk62BbVOVYDyXjtHejV3JJ6LHs"
-    "yrcavznbrNoyCrFewEohiUNh4ruFctVlqKw0bT1LTFxknAi3/Ao+O7VZK9D6IOHF8iFqe2fS"
-    "MstwGMluQWcptm3kR10CX1FXZ5smr/BI/qn6FT4vYIHJhMQasEILwBiaBN7FGkmjTqbwXQ2e"
-    "eEg4zdd8KDviZhvkTIzQoEHzMH7GUcCySKKDZ2Z11lO4iCtsMsxgmpEGJloJWJZiOP05jqvw"
-    "GawgILGUyeCovyByjqWDSYy9zTM1IlEx5JFklGZgH3CJ4SL+qLixo6+hPPzQJgYUzjJEw+Iu"
-    "ucUsZzi7H+gfxVfWPDy4c6wMu48OnB1lGY9NJghxHuVxCS3N7hMXy9sHT5dNaFvc2WT9NZh3"
-    "+7jCldqz69fJl1MQmOgiFCQedbvheYJtTdgkUsY4Bw2721Cv88fYkdXJjPn+HZs4J649HFnq"
-    "NHQUlwOz8MW0GO1EF9oc6VODcLU32ijZt1s5Nkj6UFMSS9UxKZOu3Z28sKxeu5SlvGUh4Lz5"
-    "xgExi91nEzZSnbHUOYjNiv2OrAKnNrLLfO04F+3h3Dp3zF3FfcZl7GWGLlwuf/oXe3FV0YfG"
-    "ow17sHPlxPGRsmxFS1m5ppeBkx2YLFeNoA08g0buFPZanje3BuFM/2UuPesNXgbtzkPL6mb3"
-    "244H78Mwfis+k/rK1/72O+VHP/14OKj91t8d5DDopWXDtg0Iprexl7tCv2DWfvsagl8z7gc6"
-    "GQivc7D0CYRH3jk25j9//0DZd/Rs+eyT95ff/LWfLf2n+8q+00Olp2lemWAn3AguIDwCSE0U"
-    "YAACxAX91HToQOOSsO0qH5wSxECQGlyv7Mv0PchZrMm//edkUJo3Q4VH+7llmAdqH0IhaMnV"
-    "H7GC7xN9Dlv66xm9k1dSRB8y77o/2adMN47GchC3AcPYx10DxgXQOCJOGUYA+dGPPIjgvIQj"
-    "aM6TX8WnLNW05kXO52mXC5wJaedXqPBIrrPnxnBii9cojrbpO8GJBG0lBHaXXaXhr75wnE0c"
-    "+wrzjnIEAfzQdwfKzns5DLx3OXyPwZmKizdrpfZzscccYeP31ksIwviRm4dx3B3wYltpByR/"
-    "k4+E3SUCEN2AdBqiI0SCM4W+k2fHy7a1LbiKWBFuFcLxp7TIkujp00w6LAv4x6H79V2csrB2"
-    "PWlTa6jdUAgCwZMYR2g78ZjjUgo4TkLEuYKN9/yWAkcIPOwe1Ia0q3tFaadN9r9zsCzndAjE"
-    "Jpb+meThuPQak7WJKzjFxa/cB9HsLl2xMcbG0ByBD2kshBaehSHC4WGWF+0NHhKGvKsdCuHL"
-    "1QXaLDQ3pIs7eYg3+aY0YjzraLxZlfanrl89NlhnIk/9TD8lLJGf8ZxcGSXol4fg9SYBwzGW"
-    "BabzPdISx7hegdOImd+rx/hmSOI8x3afbd9a4MpvlFt3hiqVkOQ36ydsApP3FLACODOvAPDh"
-    "h12E+0VQvZuRAoVv3iJj3vIyrt8yPKJFvAyvvkQ609dX5A1wcRFc10XA33vFrInw/JcDpnEq"
-    "VJL3dJpEgHBO/96bX1al+l7DOg1awCpzUwCxQwlb1rtCahZsSmCoXqbq5rt5T+MjQ6YADnDM"
-    "0ySBSyMTkMKNH2Q81RIAxn5eQfQQXhaj8OIAmqVPwxZRqzjVs7coyzKqsLjzJ/9Hlgb5I9YU"
-    "7Bnb0Lz85uWsR2EiGEDVEbNTZscwjsQZbWAn4z3zFWPTl89BxPW9BsBYtZRI5YImKinxrnal"
-    "jExvWTXBR65RGeOKRzuj9BtCcRUGf6K+mV4hxaNqHLxcPtGmSian6t+BxmfthWp88xhH2ixA"
-    "eHCwc2Kh/ZEDWLipoD7u6PPy8GWNOnVzoYdrZ+siehbnqilAPPfKYcq+XZah6XGJa/W6VcH4"
-    "BtFGOYPW2NodYyMIEnMw6F6+amkMBpN4Yu/A7sclL+ESdmQqDndeXB5/bEcsCaqhcSv4tu0b"
-    "GdzaENIGYgmrE6NxZ8TDCBte19R0cBdfEwhX4tQjPhyWntq5CiFkaewCVLA6yyAovhox4u1d"
-    "0YWWpp16u1zMLkuPsuEnvhSgyC4mCbaBjNhL4WrufIx/OYuxubmNnVsXyivf31t6uhbi32hT"
-    "CO2DF0ZKR1dPaUC1dmnoUght2lDpXNYjisS57j/cUeq2+XGW+t7FgHxxI8tSqN5WdTeXniWd"
-    "2K9dYFkENw8sFyqMnTjeXw4fPV0OsCy7iOXPbZs4Xggt09Cl4dBANjcxkFOGgt7GLas4YHgz"
-    "4S1l/+4j5dXvv1l+4vMfj3ML20iz/92DZXhoNAb7FSt7gQ37rovnynqM5nsRGi8OjpUvf/sI"
-    "uyA7yoZN7WgvxsqR05fL7/3a58qv/2+/xzJVd/nif/+/lG3LF+KcEn0mO3IbIcpRlg89ccK6"
-    "aQdl29b06wAf7jNou9A8gWAnBw5ELre5K046cPkwdtc6CeZfDlTWSzphiYf4XmrAzF+tg17r"
-    "b+L7kIpACPIf6SGSUH79Il/LX2RAfraFS4KeQXiRczYnofWb5NFAm0tUV4B1R28jGr8e2lJH"
-    "1grmCo1Jc8aR1xp9Dttb9fflUqbL6Nbt5QN9HHfUGhqpKyw3zoN2lmEb6FKsRynNwfVFI/ld"
-    "5RiCFZymcHxypGxb2Vh2PPQIWpvlAa8TcXEXy4rUbXBgoLz8wuvs1PWAZ4RAJoYuJVoXad+f"
-    "z3J33T8EHgDaccj6nxmcQBvJeYg7NqMRa6YCamRcGkV7jUbsJAJ/MwLvOP26ec4tNlIsLz0r"
-    "lkf7zJnH6QXULQSSEFpS0Kk1RSHoAI8antTuKPRMCz4KEiEEollcjEd75kXlO996GXrF1QW0"
-    "I/3KN8ZwM2K8lobRsm3zmrJu8330WzZtIExbX2kqBCH6pUJuapoqgcmwCE/eGW0ONkKosf3t"
-    "z6SZ+QOMKdowvkhLgYnGiWt6rKxpaOa9inTXTVKkQlW+qe2sJ9bxqYqdZeeLPN0rYJC4fuCq"
-    "w6ocAlZlisjF4uKSBqbhmw7ze8gb0slUZGhXDRaoyYLJy2f///DLeNNfcvAyY8PyQxRuLgRO"
-    "/WZkaFhe3oU649Xp/VYjiy/TjTcjD+N4zVEa/iHl1BX0W1Y3kZKp/qG/wsE385uCybgJL10r"
-    "yoqB2TgyF5HNP8O8hDsup4VRNb965d94Mm31i8aK7zP/zMAJyWQ4mVkUR1q0KDAGjSrNxw6n"
-    "YOOVsGTH4FOExN98mQmGwXnV3+p37hKwyc1/+oqQ6TDjgANDhdAr65X3mKkAa3Q2OqWdT/wY"
-    "txZu4t3Cqqsudwa6+OL3qFkVq4bDOuezUYzhP//XaXyx/GAAxq7qE0IVOMuZFakIj8E+6mN5"
-    "tnYKQ2Hk7nfqoJDlDC9sVWD+Hvwc4FOmApeHRJu32h4vBUDbeIxBxqWm3MIuHjDSZvBxCcGB"
-    "TcZaHy3EUMgAgp3IzfGynd16WzcvLeu3rA94PMzYgdIltYsM4hc5RPnCxTGWRCbL6rWrYOqN"
-    "7KoaQEOETSLocYBTqJE8T7Obyp2Km7ZuZIv28jhIWdyc6DsZ28+tiDsM23FcavwjaH6aGUQU"
-    "Gq8xSLnVW+FqC0tcTz+2NdILh76jLgGXjLiNJb/W2CGY9o5X0FjoVkIctHKo7mLg4zGuGNyj"
-    "xZwU2D81LMeRI0tBfUf6y5f/6nWM89eUT376Ywicw+VNtuuf6OMQZgSOJRj5e9TSJJodjfAd"
-    "aGw/4dF+qp3jbVbj5qIFYY5xku+0CRqXxQhfCoNjaNl2PbKVvjMfzcglhM0J2mBO2blpedm4"
-    "blksaQqkQqH10ey0hSWne+7fUZYtX1nOneov3/r75zn/bn/5b37558v7P/LpsmrjzvBL1tY8"
-    "pxxkefLMybMIiuz0xLPqGEecaGzv5KP/3Dl8hjWUrRu6y7Urt8rynp7y7//kd8uPfPa/Kofe"
-    "ebv8+DO/gluMy+UiGkbUM2XXxtbSNwj9UL9JNxuAQHdyStvilfGeC2HIZUPw6JE43h1E1Z46"
-    "mEFiIaAYPzdyMIhCx3aH4C+Eh+aYd5vHNGpfCeY5847+YQJ+3uC+Qd/0DJ4zLMOBGqJxGfgi"
-    "dOGh4pMCwOUSs+dpKrTNYcDvxdgcOYv+oJNZdlHGpDEyJ295t/BAG6RTq6uw6K5ktbgb2Njg"
-    "MrPaV3dpDqORcQm+HXs84dl74ny4HbFc+YxCzboljTHBWLJ0BRMBBCDK0EmwFXVZeqC/v3yf"
-    "nbAuYxe0sNKYcWLSSp0Uxu0zajW174sJPnxE/mFfu+qJB5MXOEHgfjZLdOM+CMfXGL43cgSO"
-    "sI4jSJ6E/payKeJg/3jpbrqOQ+AVbDzpCIejYjKX5irhCvqM94qPxngLLkJLAt4td/qXY6H9"
-    "fpYTG/vrWD9CcxrkuwTrodDCOcmkb+6c8fKB9z9W2rtXw4uuo7VOt0iRH5lEK9jc0b5iceYV"
-    "HzIgmyueba8ZrxEWMN8FZ9KKGzmkx/pn5BgXqjzMh2Tx3fapiCHeo4wZedZ5BOxVem4Bi+V7"
-    "CZuXcX4QyvjiH678XkfLsvJL0COw1DifygeGnnWXZitY86laIqzyDY0AOWfkBMoCfI/LStXP"
-    "3BOIRFQgofo2FSthnZHCNNkhBU7EmEfkw3tUPpBOGIRUV6RG0nRG01AJm5Wq/2Wc/J75GWGq"
-    "BtNZ8DQFZ4RanoH8Ibr5RS4+T8EZEWqAI9+AMepiJqQxrimN6kV+9XvAk6HxV6gimn9qEC2/"
-    "elcDkt/jbxXJGWUeOeRMQzW1DDFgJLYdMutNhmZVJX1v2QFAna0vdflZYn6uEke0Kq86H6On"
-    "8JTtaXidXTz7PsUMzF+MegkX36byzlT1+1QmRiPrbDrjmMb0U6VMPcM/4zkgUHox/4hvmqQz"
-    "8TMNg1HAlYzEuGQZnduHmK1yA84QgmDa4jfBVgPgDkYHJ7U6GI5SuK4chEEhy8FDDZaZ1ks1"
-    "+r0xa9X3sfRSQXsVTZgOSd21ppDlLksPJWzADkqbmyXsrlMTNA/BQH9aVxhMNnBvAABAAElE"
-    "QVSsJpit683cYzPO9KtpulGODg2V9+26v6zftrIcP3gqzoU0z5iZAvs8BIx5wPbKoTOlEwN5"
-    "l3AncBJ7+iReqzGuVuujCj/s+qiIO/0auB/HWPwa6a7zU+/2/u29ZQPn/Kltc2fewPnLaAyu"
-    "opVqRHvQFnfx4eCsQOHuKY9/8bgeLwdzcW5b1FoB3xUS3DXorj1dGHz7O7vLUY4q2dzbjv3Y"
-    "efwcncEmRo1MQVM2EAO1hs8KLGNsGkj3CWoYc2DRiHzZch2rNpfdu4+VPRwFtJD67T13uXSx"
-    "u+qZH3uKmf3GsE07h78thbQ2li3bWYa0nVzuEiaPQXFg7GRpb8s928t87FteeeE1hL2D7ASd"
-    "Xz749ENl564nyqF9r5WDe94qDzzxCQbTxvL9b77IUuRAOYdmUJ66dftmBmO2yKN10f2HriCa"
-    "ECgGzuA5f93KsuORh8vbr71YnvjIryNcHab8m+UPfvunyy//0n9J+MlylOWzbuztRrDzuYqW"
-    "0F1aDdCguPMSr9Ke7wpK9bK0QmxoktBmytVnCkn2hbCbDAnNDsS7y1QgWWFGnqspglqknExa"
-    "UiCHqPYdhAAbhMuys38o1EPTCECj0PVld3TyTa2wvsy138ObQmlFwBhmoL9/szaFXaSRHth1"
-    "VwmJkWk2RGjrFBZdpXCThu5NPvyx95VdD99Le3mgN9oYNlAI85kzg/QT3atcx+bQvsGyJ+3o"
-    "cSlLOEIGkRBP7hwezokLi1vbyiI0pdryiCOrNnjhIrR2uBxHOJs1W4esCqnpTsg6ai5QT87C"
-    "sSRhTnjU+NkPbrATcD9Llz/xyUfLsjUb2CiBJkytE8uC0oVnIl7D5UkfGr1WwocvqjG9xYRn"
-    "NbA0Y4Ru/vAk2jD5UvIo27X+ZbjvCnlVXGjLtrDNPF9Tr/TX0bz1nznFDsJBeMmiEGKVcyeY"
-    "gJw4M8GxW03l0fe9n1VgNmKAe33giSfzr5s52jQbI/5O/6EhifbeK3jsewKn8jO+WfOjmPgZ"
-    "NbIhMOK9J218r75lvTNe0KMfzcgMq2v6KQN8r/MlZlz5/t6Yfro7zGz9zaxThjmeZPiMoqfK"
-    "EWf1SOfznM88+9HfiuyJHf+inCzMdwuOt4CQZ198jne+VnfzEBgbWSIMhGSOCakRZkjDWdHM"
-    "KEqYAW2dNioXUWYUIvj1K2kyB6tUBSboQjNV6YAryq8/ZtwZReZX84tP+X3mcyLBbF0S4hed"
-    "DQZjJhVAiZoKDuteF8ddnIhLryn466jCGl/MLp8UriIi7yH4EtfofnempwbLwd6fOE/cA7+w"
-    "8Yu45kn8wGdk65/EX11eFGzedR2mPmRaYTCvuKYeKqZuOZEu8/S5bnvr6ntUgxyiWpZTZxTf"
-    "ZKzmn/+EO2ihKs7IYW8SoTMBq8CJ76Q1LyNzxYBA1LrOMsYoI8rJ78a3nJi1Z1b8zfYK+zPz"
-    "4edynkuEfvNy8FEjFB8JcjlGW6lrCFjGd6edApZG7l5qurwcIBTGNFw1jeU6C641eg5KMm8F"
-    "hjkwXpclLsGEh/E9pR8nGaCz9qsMHAoT48yMdeKrt/q5c2+VSwxkTzy0uWy/f3MZRfD66xf2"
-    "lN7ONCx3EPWMPM9YnIvWoBmtziT+5gbRLFkRd3eKD2e2Dsj6ntLv0MaNLAFioD6JALZ+OU5H"
-    "N/eioWKXFfXtx7h95DJDJvlpdN/b28USqEayLP2wc/DcAN6woUv9VSksitN6k0O0cU2T4ouB"
-    "wjBxrFH88t4lCHE9LKHMKn/xzd3lxTdGy8qlwN3iiRLYRJHviSNXwNP1sPHydAZ3sKr5i36A"
-    "MKsz1IsMll5r1qKtqNrvE9g4PbBre1mCa4dzCEDv7jvGkskkWMDGC+2bA6GOceVTtzCE1uu8"
-    "g/GihWwsoI3femMPA/jlsmvXBlxRrA7D65EhhJ8VK0vvuo0sWU6Wv/nzPyu7cVvRsGBWOYHd"
-    "zQW0b6vXtJXN27fmWZW01WycO16ZRKPWNjdsx/783z9X/sX//n+Uh9ZyQsJwY/nX//xHyqc+"
-    "/wvlXQ4t/h//6EvstpuH/RKaFOpo/5pA0LK+0pI0ZrtJf2pDxY+aUrU50q9hiAYhwLu0GHVz"
-    "xx44N52ThUhvHyJvBQKXixQccps+zUw72z4O6vVAbz51H4s+AwAKGiNoSi+M4LcNOiFCaaAd"
-    "70Vbt5xD1M9yMkAb9KANny2+bnlbOOfs7x9BIztYWhFmXabK/ml/s6/Qh266C3OybN60snzo"
-    "Y0+XNes3sHOUI85cLqOuaijdlbkYY/mzZwfLeZZhBzznlj6v5i+dYbKsh1A4gnZqYnSQvsZG"
-    "jXb8a3FyhcKJPozcyHXyCLZb2C4txH5OG0X7qvipL2GTXv0pmOs2RRsrHadOslt0DFvGzz3z"
-    "eOlcviY0Yu72Aw3Bs9VSt0JP80l7Au2zLl1GL5xn6fda6caFyaJmlqKJbN6Wk2OGJSd/q/ES"
-    "IeBbXmeYbS8v8WEePEQ7sYN7D5bde/bGpM2d3W4MEdZLGOL34zT82Y8xIdtyDwIoR9QhWM9S"
-    "kyeuuWzXADreeOSf5Ux9MwS8+i/CvJuGK2mCL7zHr4oTH/mT0M74rrygoFjVO3PJ2Fmif+/+"
-    "2c/rMS+/JSTGqtNP3XnIfDJPy5mOlWF3v2fsjEfaqt7GManhEUY0n6OcKtyCsn7kWz1PCVg5"
-    "sNioAK/6jgZLUCAuCzFDwq2Yz1NhFiycEd/n6t2gilDiO2lNk67qWVs3Fe8KKgE87zHg0LEj"
-    "XpU2nqN8B2krx2e+CUcMkAo85GEZIYjMKJfHjG+iuy7gIMzgmXnGu/HiW8IRiKJut50KcVdg"
-    "yDo6W1C/nXnHbg6YWtTVljDcfIA1uAnPgQ/fp9LQQeKd+NaNZxmi36cwaTqZJGWnQAC7lHFS"
-    "Vm5XTVV/VI+4/hNC6N+KzIAhn7MOCVe0lNHjR5iCgmULjsE813kAfMAgHO5Usny/WSdhrmG0"
-    "06dKPZe/bnGUivWKcNLpqVhVe+RBp47dMuBxOh/bM8tIg9KESSHJcrS/cAkiacsdNrnLJvAI"
-    "PHrud3AJmIBF25SbCA8OkKaLXX+mF04Yi7BSGlWhHO7+9V89uw9DbNDgkmcYA/PsN/Fje7gV"
-    "upUt5K0YJHeGQ0n7UNKiApnaLfHk/TpTeEQKBkbdhUQo35iZo51xy780NA9hLLxt873v5EAI"
-    "VA6kk2wft1zxOIEQMDnpcpBhLD9hNN+JEPXAQ1v4frV8/fm9LIlxAAsC2LiMlbvbwcPvFkso"
-    "bjO/FDvbDpZOZ9YYWk8gHHjw8urVy2HGkyFoKOxsxJ/TAgYfHWumMTiuINCILFw0G9cHGJ5z"
-    "jI3OH69SB7VWGoZbtxYN2RlQJKHZ2IWkDxwGdXCmwKhvKzDFd2195CksK4GDdnbTdXYtAfbJ"
-    "cvDdMziQdGaNU87wZo4mBC3G+9+/JY7k0ahfTUR712Js0XALMY6WhLpOcHTREEuoanrXbVpV"
-    "Vq3pDq1RD1otB+1jR/DM/e6p0Ig0cxxOKzZr8gFYPbRC27I0sxKHsGrfPG5mnPwmOT6rs50d"
-    "mLh4WNG7jCXB9aWndy2G9CwngeslK1aVV7799+VXf/XPy73bcUvRqXNdhELSDpwZRkDEmSx2"
-    "dC4XDQwMgZMbIbgpkP6/rL15kF7JcdhZjb7v+0B345rB4JwTM8M5yeEhkUNSFClKlHVLq2Mj"
-    "tKsI+5+NXUVIYVqxG7EbXq93bYcdWnsty7ZibS0tyZIYkiiK5HDI4TE3BhgM7qPR6EbfJ/pC"
-    "N/b3y3rv6wZIKvyHH/D197336sjKysrKyszKmlsYT4fAtYFWH36wLe0/eJAAl19Kf+93/lU6"
-    "hKB8eXYFDeJmehCfpbF5aAQquoUmC+IN4dkNFM6N7k5VQ2pbFJC8sgYlP9OnSk2l40uhIXbF"
-    "UZabEAxzY9gcuoEx4g5leCpl5m3x2QQrz1UQ95IO87d1YYJEaFpAKzqKcGVfQZ5xqcHqllbw"
-    "T6uib0YWWGjw5sWn74+Yb19+5XK6SsT7GwhfDx4cCHilGelCh/01d3Iyjh5nk8eJZ55InX19"
-    "qY7Yimpxl5fcPcjiAeHKRY2mYsfOCrvpXnzhBA7nQ+lVdnI2gRyGQbTpNrv/NCfegdaacdLq"
-    "wievlV2wu1jINLHYWMc378/+5tsJOQghmP5DKAl8oNV0rG5iopanuQhaRUjegD7c2CE/mwM1"
-    "Q+Dukz/+/rRJ6J/pG2iPgA+OFWEVmlnc7B7qhWfUsKt1DrMlQlZVA2EmLuEnSUR7tKttLGKM"
-    "1yiP51ThgFm+FIKmAys4Dwhyswp9IPdS80RSNKyY4Nlx+95b76Svv/QNtFMEQG1EM4aAOgeM"
-    "+rHNoEFbgm987keeST27D8Z40epin+UeFU8U7zwfl3VyFVX7XOHK/olPvMxzhguuyFvICc4v"
-    "eQFt/lxA5tumz3N5ZOePZdGg0MqFYGl6nuU5nZICpjxGA5gCrPgtLGUZ5LNsP9YZ5foyLu75"
-    "l99RfPEskoaYk/l6Thsl8jPD7bOoMjJRfuDApzyIRqtYyvws0looV806wQTLya1cneQJMQNS"
-    "mp+ciAK55LO8GGB8W5GXebYbJhQg15HH5UTjwJZQfe7g9ldMbuaD6Vq3ZWyrm0VGLtdvNQem"
-    "KzvWuizXid5yytVVEB31CqNlepXMIEPKfeVZUa8dRN0AGROAeUrYS3Vk5b5AnGmdECsdSX7V"
-    "xoFDER2It+6iQ2m3cAhXeUX7eVDi3X6Ieig7yiVh2V7xJuE52AyEp+OkdXgWXOCuKLgs3rbm"
-    "dhZti/fCYB7hEC7Lj0qAnbr5aEbwWZlGWCMPDKSE33eBd19y+T73Qy4315EFosCDQllRfmb8"
-    "GY7SETsqpByFGYUv689lcM+zoDFg9V0IGZQn2CZU8xN5uLXNeTcefWkhNDDXa/35o4BoGY5Y"
-    "A0takGVZn5c40QTiVRRBXp7jc2GfRFrbzyTlvRqAevx3PC7F6Og6wMchrdSjiVHBLsqhPPtJ"
-    "/wdeBZNtMgab3qiEZjBo4TTn6VFTGh7KATn3s5PNqNErF1ZDkNGPyzr0ZZKpuyNpA22El3mn"
-    "xiegX3yhqonaboR2/I70U8QAmEbYTTjIobDTU9PpGBHeX/zhJ9PP/tSH0rvvYhLBofxhzi9U"
-    "K1Cn6QrNzWV8ufbRTh239d2YifAKHoO0iRDUEhqfRkyL4sFjbnS2d6z0EkpBJKrNWEUojN2C"
-    "G5hGiPVTS0DFRg43biHCdRXb3d3JqM+UCGbuD8Hz1JvncEJuZTXfnF788EPpm985g7aNHYiz"
-    "4/ij9adP/Ogz6f6j96dZNENvfOdc2newOg0fwFGYSeQU5sARomarwRlAs9aISebi+asISi1p"
-    "E/+YKziyq2mYRTu4iwmqG1NdHMANjtYJonrh2kh6BDwcfeQBNBoIp2g61hbZ6TdYE0JYDxsC"
-    "BvfsxTH5AJM8PmDE4GKkppvXroRWZP99e9M/+79+Kv3e//P/pra19gi90dDALkW0gK+/+jY7"
-    "1Yha3tePX9cNBAToFto9/e5IOnKkJ0zBN9gocAMz5n/3m/+OHpVDpnQObcz/8Vt/J+3Bx+4f"
-    "/i9/yOi/ktoR3Ai7lOYRamoxG7voUEMpfXh5Lx1Lb9Kozu36vGSNFuMAgtzFjIyyK95L+yX9"
-    "O8az+akcD3msFqMkypdGxbGLFc3Qi5jH5hEU1+B/xlCrrd5IT3J25YQ+Rxw9dPaasd92sSmC"
-    "E0Bq56HbBkIJdEOrtekDT+yPTRADbEBoIVSJjtie0+nJD7cMlUCsqQ9wrtN9R4+j8csR1ifH"
-    "R+kvYlRhVnNAGnTZEyU8WB4OQL8SCqNnAJ+90YC3Bj+kGto7w0Hsa8wXdYyRk4THWL8DzASE"
-    "euh9L7B5wuC4hAZ531Pp1z/70fQv/uhL6WAPfUs8tNnFqtSFvxQjPhY1LQjJ8ukNaG6NRZPx"
-    "tUA/8K6k55/bg+DYQgy4pYDFWFt4X8bRSJoxG2mXZwX+0AeW0//31ekw+a4Dz1dfOpVuXBpP"
-    "zzz/vnTooYdSS3cvLYF/Ya3QJFw5RJpn9iuTH23nUHTKV0MuPDP497392hvpTQ4ydx5sgEZn"
-    "CIuhi8Iymz48g7MFofIRwjdIhxQSNFhL39injkPzBZ+jvKAJ8Cv/LWnJZzFHByeMXPziX7BU"
-    "R4N8HOEP3mc5QWvM01lLyksu5Qh5YnkVlBb8ww6VP0q/5dyrAKh2Na74ll7vzl3eFakydCaq"
-    "pCuyA6HwhuWteBdf96SrlFcWWD7g+95HZvVZBV8BvLhAcP3Mi8993qBmHvRrJyk02JlOmAod"
-    "rmQyMbkrKQszah2yVB8kkNOQLk/AlkE+ylGAsMN4Ee88ioYX0WGRn/JyHutxgpfp5GcZAz7L"
-    "dWZMbZcb+SSIAmaR5jPzb7Fy9TcUE58QnoSvSCNsFEyRaovyJwd5k7iciJ3oVa+7WgN9AVsJ"
-    "q+20jX5bfq43fhftDMFJ2Io0Ij6IlvTRCU7u5LOOgMUyeCacCghRNrD7HWXwPvL7TFhos34m"
-    "9qMCUe5d3vFPeCw74PJJASMP4lkJr9/xCUrbfucKX9yLA78dXIwHkoob6+OxeXzHvcw7gh5y"
-    "778Ap0jnlupYKZNG7Y8DS3hdVcugjaXje1fd8eFZlInQUcOK1PyabcIxl2/riZ1Qkcey1QY5"
-    "eM2f76O8eK/5lHfxnN+RJg/0XGf2r8jxWSwnp5EhiDMFI1frCgr8jLLcwRUmFJCgJibqpj3R"
-    "B6BIXKlVUcDycqIyTR1w2DD70Mtgi8ZmckIURs08+cxM8aeWAXMGuHCHoePQnYNGgze75j6F"
-    "RY+Hivg81LW6vgu/FhxiEdSuXR1Nr793nZ7AeR582S4n4gMISvcf2J2efOJQeuHDz2MeeCA9"
-    "cOxY2rMPDRXRqd0ufoNz+mTE+SQGjshB03L5yihOv0sIJutMQJj9KMcAmmqtcugFDoSmPcb0"
-    "Mq6Vk4h4059LWnKlrxC270BfGt6H6Q+NU0NjO1qHRsxvxOlikrYtoClW+VMTi7Gq9uxGg3a2"
-    "t9VziPV8uoTW4RC7E48cPciRP1fTF//4a2l2ypAVmEoR0jrQfEG1lJFjbBnXiq4MHM0hpKi1"
-    "8ZgTD2s2OGQrgSkN8tWMv4oC5AjR8vehvXvuIycQmKvSn/+nb6XL5+aIGdYYZ+N5Pt6hY8cR"
-    "sA7ix3ILDeBkmpm8GYErhxC6YIipWSd/0o3jBP97X3wNp+Z5THNVES/r+ENHwMtWunzhWpip"
-    "JAkdj9U6dRG/q4WDwo3jZBuawdsAh/p+6oOH0m//5s+nnsHhdO7USPr9P3stHezdTNfm4AFo"
-    "QqGEMBe6wGimvdJmaH3hDxQUdCKtODmKC+myNAVLh9KtH+lKAcwx72/HB08DZ/ZdLE74ln4z"
-    "recy9efRJHhT30DzUgfFIWywSDDSPwuIEXbWtaAdm8Znb/+eDoTLttiUcecOGjwCEHuQt07q"
-    "mmIVAD130VhOt4H14qWbxH7rw//tMLQwyFjGhIrgQjUBi+bQ7KyfeUsdNHOH+aKtrT1dRbj6"
-    "oz95nb5dTT30tW0zvlsDeTJOEoLhMuURSR2tVg9O6c2t7WhEmzmeB5o7u5xeu3IxDRGr6tYa"
-    "OwwRzKVptTQLbK6w3xbRwq6Ae8OaOBMs07+/9BMf4GxBDgZHqJYunSuAlr7BnMlY9DB7w9m0"
-    "MLY70Ty+ev56mO5vIeAbk+382fNsvBhnQcDxbvII0qqZamzMJwKopXNnoUxZjckG2uyxa9fS"
-    "6TdPppe//I303tkzbBSpwh+ylbajPQNktbpTCIrGxOshkO0eNKHve/aD4JAYXAhw0acZqcCb"
-    "+9lxFIISc5BzdV5A57aUfIyG5Yu8YdmQb8bY5+g5lAAem+ZcZfmx8xG6+tsuSCfqtyxQRvt8"
-    "cveVH5XP5dXFe7PwsvKeF+WrnSX4rCy2TLHdHtq+M/EP/F3WkxNEHv4IS4k/hUPHUE0Lp3eL"
-    "SCd3HzpZKRQ5yeSVDEghpxN9bkCpRZKkBDYjLRe8fe+7mKT5zgOcSQNisXESWp74BYGLP5Zj"
-    "ep/7u2x0CGvUH3UHoxCpxT2FqZoVaSHVW1bAnlFbPjM9BeS6TMJ9PON3SMnciwPrsM22P8qt"
-    "4EDmI3EVl+VxlW0vnvLA6i074yYnM60dgtizs17vPYOBZyHEcG/7S5xV2m8h/s/FUH6G09t6"
-    "NAHh5A6+SnyWdQuTaYJY+VW2XhhKPAfAJuQK2KhfPOU0CscZz1YuPsrL/EEzPCB51OF9aMHs"
-    "j4C3xHHGh6swHaB9J96sow7NRtneXCf1cAJ8wGKdphcnwG87rMP0IQQBTkkbMQEUz+2n3HdW"
-    "lCcZtWA5TW57bj9l2iDqEaa4i28maR6EdssCaKCaonL3YAiGPo+spss4CLioJyYnnskcQvvG"
-    "dw1mizuEIfDShOE1hSllms/e3e2Y0/SDIngiq01NZ/ow6Uc0gIChMGObxtHY7CKIKEMgcHAH"
-    "DYyO7LeXqwhKeieNc07bFznsWXjc/adJ0jZpSnI/Wg+C0dGjB9JjRFvvIRCh5621tLOdG8Y/"
-    "Pck5gt85jaaFIKGXZzB3tsZkMscuMBdFBkH1/MB+4HGiUGjSAXyeydWrHQ2RAo2ak3XMEE70"
-    "BpX0HLj+vq40uNdJ1FAHteltNFTXry+lFz50P3Go2EGFFuLU25ydODEBIjF1onlS232Dw5v3"
-    "IhDeh1P9HTQaDad3pW+9dh0fm7+KwJ0jtybT0xyKXT25mkavTyK8Tad9xB86eIhdfiPjQe+x"
-    "zZ72C7ObCQwe2dvbHkLnBs7AtZg9NeG5rf+p5x9MDz9+hB1/s+mrf3E+/RhajCdfeC698e2v"
-    "4a81yllu3aG5qiYo48m33oDG1onLhckRhLsLa2Z2Np06/aYdjzYRsyFXF8f6PPb4sbT//gO0"
-    "rTpdujSCX84UWkUDmyo8Z1OdcBo5XoGhm4Cym5tofTjrbjd+Of2D+9J//sJfpv/1d/80He5v"
-    "SmdvbqWH9rilvzm9emE+gXUEaHaFUWc7ccnUqCrUSweOE4mcYRO4lTYV5vVZQh4seCZ8x3Qm"
-    "Afa8OFMTHDKj2cnDc97JTy1X36M5BKY5NJArCBVyhmHOxpTLjLBjsoaoDmNoQQfRUh3f3ZRO"
-    "jy2HH9lNhGfp+9LNZehRvSpan3CIJ/I+Gkt3v6k9dozNg8/bHEYMpHyjAHAxilCpn5QLAN0Z"
-    "1OIbiLI8+QOGQGwxIulDe50E+zzxyED645fHGFsNaQCH+KssGNYQ6LewF8buOnjGxjtXEObQ"
-    "BNU0pkeefR7fqf3poaeeSX/vN+vT3G9Op9eunUn7EQBrEKpugbR1+Rj4WjesCMgwppcxtW4S"
-    "CuFXXzyWDhw9RJgTDm4m7pchREKAZemjgBFmctpBz8RxWc9/4AnGVUv6Kj6TU+xYXQXPK+Dg"
-    "rXevpO984710kFAeww/sY3dqbwTcdfHiTt9wiGesjY3e4DMegXGNI6b/5N79e2Ox7rmJiwto"
-    "6+hvtYy78CnrZUFzm4PM9+49kWrqm+AjmpDd0EAva2OU09I23S40v8pzXSSF0oLEjiN9Ho0b"
-    "FvMx7c+8OvNknfSXiCEXfoyUKU80nfTd3NKKK4L+btJeFtSosHJZu/QT8xQ325RYSVL8kELl"
-    "2ZlmfehP6dIyyr/xdjtJvKm85Xnm9zmBf82b8+ekZVZR8z1XPNxOnfMDMY/KeVughBH+aiBI"
-    "bkCmCTS7WXkpcJnBd4EsB6CJyJgHb17JmLEigEFM5RUTGTdZ0LGyXK7vw2xIkyqD2zKCE+Qy"
-    "hSH/L1pInQ6uDHghhCkMSSWWVwhfOROEYnucjYqGmjc6j7SZKCxXodL2KPTR6cCQJ38eAavP"
-    "/WObM+KAqijPN3YJt5Ur0gR6yrzk3pEgfntPGtOWeI17/8BMBPkuAZP6syDBc2BVwHKVKuOJ"
-    "nTwMSNsZgpVF8zvDmsEqhRBLF9SyzlIgA4y4ynaFUKNgyarTtKYTZDUupslwK3yD92gDgwtN"
-    "lAJJUA6PTRd9b/6oE6EJ/NbAPKN+HppG+BVCyroVoAgHXuTJQpzvnZAsZxfvc7nmp15Wq14+"
-    "U6jy2yI2iz6Nd6QT5twuNTXCoDAvjAFdUb91eGYlTJ76LEtGrwlSnykFLJmlOUSZeIvc/AlY"
-    "qKcaGFxVOuk6mW2iGTF/ntSkRXq4aK+7wNxlZeRzd78ZY6uNyWqFlawL1HVWllOeU0Y6zYID"
-    "CCqzCEAz+Bo5ifpeE6Qr6g0m+w3gdeNUD6vvOmCdVlsMLjqrG9Jzx3vTniEDDm5iokSIW11C"
-    "06Z/EStxnOVvXMfExbM9CDQe93GBMAl0J3W2IRj1cl5ZG5qn1tgJdWPkZrqOI71aJ/2JjNQv"
-    "XkKYlA5pn/jWn8io9e3k68Fv5trlifS1vzlPHKq69BOffSztPXwfk8NNJtgldiBirqBfVteJ"
-    "XG/wIvxIaqsxgyI09AO3h0nrp9bSMoMPH75izYtpD/5CqXqNZx6jU5v+3Re/mX79p3+YujBz"
-    "4uirCUlfPDV/S0ziCqPd+DNBAaIM5+eGNDm+xLO29KlPP57aOIJobPxm+u5XzqSf/W9+KD3/"
-    "sc8S+X4UjeBsWsT0U4MDtf2tyefgMWIH3ZphYm9IY2gaJnF0XyLNjdH59OZr59NXTl1OnyLm"
-    "2EOP3h9O/tNTs+y4nGUinCQMhv5eTHxoL9RoaUYVl3RfuoPZUFNl/0AXOK1nN+X59A/++W+k"
-    "1tSeHt3bld66NpP+9T/6FYTQ3emf/KN/DzTTqQ8H+GnOg7zJOXOan3spvxUTsn0iDUutmt3k"
-    "G05uHnKdzUDwUi7HXDYpyuPkmUHdQcNqV6XtzJNyedLzLILzDCbBZcrHvYpzMj3TsQZ6aSft"
-    "dLo6y1FJU57JOcPB4P0IB83pwuX5dJaAoGqyX3jiQOrHlGy7NS+6U9Zj2PSrukEgWOtra67F"
-    "qb0P+nc353Kaw7Td3t0fgsoKTtrONy6GXawrZKH3DaGzBqG5umaOAJq96Ul5EuuZl1+5ypjh"
-    "9ARg9CDzTh4uqT3cuBVj9J23r3Dw+ZfQ0i6nR575UOrbeyA98tzD6bc+//Pp3/zzv0h/8trL"
-    "aAtpIyhbh76boSVkiTBbLSMszDMMXzw8nB45cSzdgX8sIHjWQl/uQqzTdgj+1TqFVSioCNcC"
-    "nOw9pLy9kxMaDu9OXUSpR65GAF1Duws/4NilZfy93j17Lq298SZ9RgBjQpjYXgVR266PYQOb"
-    "S3QZuO8BDnDnPYonNM+L6fRZzNDQpjQrFRzerVmfDSET7ly9P1WzODdMSF4IyuOy5tkNVGqv"
-    "lhaXgHczXAYgAurLloY8HzjGQUYwQecFcAEtrGqG5Kgq7vDnNFSM4Ss8oB44SOR4UUjzPeI6"
-    "f4WuUoxM9675K2QQ67j3ytnyU35HCoEAxgKkeFcpP6conhXpizIt6vvUEM+iGl/GjyLDjq/y"
-    "ld9RBpWX4OY5jWC8AiFDrHIW860pmQhDOPFnAUGYjnhpkkCP3wy+uCJRThw7NopaQujhcc5j"
-    "4ymseEcFvAGhO6C3QwIAviLcPEmokWdcBRzm99Tx/NiOz++jnCIpmOY/sFXuLcW6+R/AWIZF"
-    "RgXxXCfmuCzf6sBB5aJ9Vl8WGGXEfX5avrKOQEXlcZGrKMp8JaoEA+oOArdwa7AtISDxynRR"
-    "Kz+ygOo7nkVZudxIT0FO5tFmASnz2QoLsQ7byRXCLA2XybkzSCIoQIvfMmTGLfkKIRsTShmv"
-    "JDRYphfwECKiIpJ6bym5bU5eUW0URJ0wJIZxlBMCDWXuIoFpAmayZkHOsv0NIyfPlgOaB1X0"
-    "o3AFrJSZjdLe0yqFMTkPSBEv4of1Oc+z8CR9xoYNYKTUaL/VBl6dTPhYbha0oBde6kyqz8Ym"
-    "IyPLWlmrG4I3cAQegEvGVCIvGL1OorYLpq7gs4s2WFa1WiYmJTXDTnBus3dCE0Ysbmlcp98t"
-    "jnohFEAbx89sbcHYyLvBjqSpWznulQJYmBEpd4H0HTBUey7vPsQkTuP9544tzUCLOLEPtlSn"
-    "g5jljBbehpZaAeYqTvOaHWV6LfhNrRKn6srla+n1N95NY5NLaf9+Vr0Eajx8dICt4/1pBT+v"
-    "Opx/d6Eha8CkpyP7yPXpMJv2IshosqUDwAM4ZDKQzmyn8EubQ4M9cXDvd79xGrPeLA6/U+kX"
-    "f+0X4kDdt189nS5dGA/cP3D0vrS/eRC/r2vhOFxXQ1kUDV/mOJlpNEWdHJtzJCZZDwG+fJmQ"
-    "B5jnNtaZTDE1ffPCpfSLHzuBCaoPcyq+L+BDTYkaNvvaWFZ1SAEb+NvU0B6sFwgya+nII33p"
-    "+CMPor3gmJpvvpr+6R/8WfqPv/tb6dlPfTa99Md/nP7D//3l9KEfO5RuXd9KF8++h58OuyWZ"
-    "fJoQBhrqBxAQL7C7bS6OITp98lJ6hYjsr126nj6NE/4T7zsODqqJhzWGgIDjd2iOiE1Eo9rR"
-    "JEg8+lIqxEunbWgx62ubMD3ORRwmA7KmwTvpyY3+eP/axZvpd/7ui/gIvT9986uvpC+/OYZG"
-    "C2dpNFqEscWsiLkLgW0Gc10dwb80P6soCOdo+sbBlRePLC58riK14N9qzhyLmT9nnh7smffh"
-    "IgJd6/wftIUJfBrhyoj+XcC+pKTB5YkBQ/0E9UQovzpLuAQqWUS7usoGDAXgcUxsxwc7iaY/"
-    "HOYxd6Mq6A3hb2ioBE1um2iSPL3gEqbqZx8ZYtFB5P1LU2l4gPGxF9pCWEFxy27BdhzQMXkV"
-    "CywHrgKMR6isILBjcAUiBcLb6dETh6ClmvTmyQv0P4INz1eAWZ+sLcb5wi6iy2P6u31uBB+y"
-    "b6DNupMefep9qf/AwfTgc8+kX8OMef+ftaf/9IVvpolVDi7HN24NXOTrTuqE5zz35N709FMP"
-    "p+ZOovRzVqfjoNbo/QgTLoY2MUF6Lp4C5cT1Md7Bo1gEqH06c+pizL0eoL7OuNWEva4GCWFZ"
-    "wakDv78G+lKNp/2kmdJNK/QW409tZI4mL0+ZIEDxeRYyV6Y4soe+6UJQ00jSAS11d9DHt2vZ"
-    "mFFDBPk9LKDUXOl/nfsvNvzIvyhXoXsFYdMgqW6kqsFnTE2X+PV3bI4gLR0o6iGjzJ/VXIXQ"
-    "yKKqhcPlFcLUaG9tzrPzGf8vtFj1BH3VvUWewRDP+SnDKwe6lZPF4+JeHu0DcR45Im9IjTy5"
-    "6wKe0lerSEkOfhUF5tblN/HXMVHUbTlRz10FFjc5sSnigeksK9/kfMxAlXdlOsebI4uCaawc"
-    "LX4DT6XAeMSf/K5yV7n1R9RGHn5nTJTlR/LK43idwcq5zFd8IqUA+oYryjFDvq38LZ9HGv+U"
-    "hL4zqU0tyrJ4k1lsbhQ/fGKKeLMj4866SeJVJMm/y5siXZEgGFGZ1ldlsnhfvqjcBBjiOwtw"
-    "mcgUSm3ztuBW5LO9fuibaAJ/FSRCcGBgxzP+5Hzmz06Llh+A8B3t5HmkiQFRtNzM3oOXSCVx"
-    "mi8KzdmFItBmcUXDmEq9iasoKbL4x4EmgBaRy9rRFzzLAk2uIgpGGMkDIJfkpBxPLIOiKviI"
-    "doSMEGWX7Y2SqEzajR2uaKbgPFZOOgY9TNSr1G5WsZK0vhLuKCxSRJbcQhrsKlHhykvhNXY1"
-    "ggPRk9tFCaQLOIpnsSARTj4KWvoWVcGgqoDBidbMoUngO7Rb+PfpHFvPuymYcn2dvk+cG4bU"
-    "NUswwjtsw9KHxXWei5tmmS2MS4blTj23hmvqMbp1gVFMGExqzKUn7uuP41wMcuixImNMWLBK"
-    "JrYmtFOjxGeaQHDahQ/TUvqrLxNodGsytVY1pm+fu5YOYT4c2uMWeMJFYBqdZsJvxj9mYX4C"
-    "7UKO1q4myNW4JmFxq3ZYZr+F2UTBM2tE0IAxaRjE89vfuZTOToylDz44nM6fOY9/yjpmths4"
-    "xMNs+ffeu2cw8WEOhPGPEctoERNL+LohwC0TmmEXEc0PsCNscHggTEobmzXp1z7+MIJKS3qF"
-    "c+Z+/EOPpOdefA6Ba4MJa4TJnmj34EINgsJpFbPyHZzqW9iSP0EAVXHx+JMPox3rJfbRXDr3"
-    "7hupGfXEX/7b/y298OM/nybnJtO/+iffSg8TBfuHfuQnObrmQvqDf/mHaWZqnSOJ9mD6I64Q"
-    "5c2w+20Uf7CTnOn4H/76ZNDLL37yqXTggb1oY5Y41xAhFtORccI07UwQlNVYU/rVSHsGRpUW"
-    "1Joav+kGJh8d8F3kd3QoKNWmvcP9nLU3nz7+VDemXBze/+d/mb79Bsf+sEvxLHHInj2MyQw/"
-    "r2+exMcHrfY8mpkqzEO97IzUpKSQodCbaR7aZ5yX40pa5X/QD90YV6nVzYu6vCjRhKbJd9qd"
-    "aNC1WbpwtN+HAD2LX9t7E/i2sYlgBLPugf0D6fnjg2mMw741T719ajyNo0187uhQRP6XZmbZ"
-    "edkAbXv+oogwxpt8tKmpJh1FE7R/byf9hxaMiOrVLPauI5R0D42gSe0i0n1vunVnEdNoE/2t"
-    "6QtEOgblPdCe/krhlwVNatpSeLORLgBeeuU94nGhVWVhtgZ92OR5TH910LkW/I33LpKWNi7N"
-    "pseeuZV2P3AsHTtxIjZLDO/vYUFwDc3cZCygWC4hMOB3iAbKnbQdmCCrqIvRHmM2BFMWGqsI"
-    "lvpxzo+OYgp/L33jKydTdz9+fYSomMcl4MyZ0bSfsrsRTMW953k2KMhAF8ayWqLv3Mm6BH3Y"
-    "V1lz5+LSA6U9hNpFF3Hx2IU5itZJ/tZOXvlCZ1sNsHWyAYLNJXVN6SrxvR7/5CPguRffLYMk"
-    "25d53vDbf175KLZsfs10kJ/F/AKekUujnbG4lQ/aYug6+B44NxyFZkS7RNnd3wuMyeVFYu6x"
-    "4zM6O7PmqM8OtJR8lVAUt/FVPhM+aJgvn2znMZHPfebPTBP+jN+ROm6CFraf+z7u8vNcfPHg"
-    "7i+LdG6rQBI4EI78EahKUTtgq/7Zz33i8wJRvszF3n13d1U/4M6aLMX/jhaLKIoJ4Iqb4hFp"
-    "/FW0yN85kYVs/y4T56e+qPzKP7y/58Ptva0xbQiQJgUREnIIKZV6fVFeZXnlffldPo+GFg93"
-    "5tt+ZDeU185mlc+220H+ooj4Kv7kr6IV3MSvQkjSjKp/jir/Ogg3MxNZReSqVOFdyUgzbn2S"
-    "4fJ5aGCkVNOZ9+7sO26LF0XavG02st2TzzIsV1h2vOdnxsE9vVIgJkrnd1l9CbPfpdCfX5Yp"
-    "tssOwaoop9TmlYRuy3bmyPXkvOXfPCB947DJA8RvceOkZPn+tiybn7FlueTZUbiThhO6mjY/"
-    "a/gMCb954igOmKGXdBdaxOK5mh7T8Dj6M7RaTL76aRnvKpoGOoWllS3kaqM8wNaJ0wlR3xh9"
-    "UzxSx7wt7GY8vn83flsd4ZR+hQCbIxwofJOJWQ1Yd+TNcbZW0J7cJEDp6u0FfLZg6BwR00R5"
-    "+tUYvHOD1fYdBFKDOTY1t4bz/iIaIXcQ9qFRUhBsYWWsRm8FB/jY4o9W0XZrWtL8aCTsg4fu"
-    "S/vxlbpF0NJvvTeXvvbdS6mKCWFwb3Os7OtZGZt/DDiNvN6JDxJZESRhzmj/mjAZusNyFc2P"
-    "Zlqd63u6utOnP/f+9OATx4GDHYPD+/E1q+JwZYRHJmODebZz6G4bgo3XJiZUV951+E8ZauKp"
-    "p4+mB588jiP0zfRXf3E6nXiiL33sEy+mR576UGrt2Y1/Skv65GeeTT/0Yx9Dk4r2kQm5b6A7"
-    "vfbqW7SZchp2pcmbN9M7b7yX/uIvXk9ffuNC6musTo8SZmAPmj81IhMIbk2YFXWoV9PnUTBG"
-    "vDeoq+ZK+2+eLfPSbQtmnmW0iafPjKeTwN+q5gMNhwsEfd+acFpemGtM3/zW5XRt/ELaN9yd"
-    "Xgf23//Hv55+9Mc/Q3DMq+nMtZupj4OudfFZYELehH4a0GSpNS1WHYGLsn+CNum7UqDypTyR"
-    "OTHozvcKBoYpmCXm2QJ9ZDT08tK82cUGBA82XkAoXHQ2xSTeRlv6OJvSwJuniW/Vj1b2/Sfu"
-    "51ii/og55sYMA9kaN+0OgvKp0zfSxcv4SaEbcsEQiywma83LLG1QvO4Kn8Qudp924SBfS/9v"
-    "Ql+xAFO4itFYTHwC7RNo0DnIb4+8UWtrnLNGyp/GH2wRDVCjQhUg65Mlx1I7p9CyzGJnBp9E"
-    "wyb0ENKkpbM7NXZ0QJftoWHu7++JhcB+xtkQAn8//lGtaGvUFHounx/rlpvoXD6PSX8S8/Dp"
-    "U5fSl75yGs3rZLp6czGdvHA9nWMx0UxbBgfdoHEHGtEpPDu217OZxbapNcq7eJc4NWEujbFA"
-    "mGLTxk20VRcY3+fGZ9I4C7LYLIErQZjqWbDvG8DvjAPTDXrsOaoLc5jYO5bTx9HOtnfsh2dw"
-    "NFHgKfPZ4HPij/86qBtbTgFfbZVmdp3XNR2KcTVzu8CfibOpEAEMrbgaWU2LneJNrTmpbY8a"
-    "K8uTvvTDUtso792+djDT7YfFL2HaTgvIxRVcuLzJ39Eef5Kokq5MYjn+t2d8b4Ky3CLx9+Qp"
-    "ionkO2f1u4vP2bbhiXth4V/1z/3kJz7vAyuO+gLI/KS8L14UAOXi4p2wF7f+jHRlI0vY84ui"
-    "QeWNt0Ud24/+K/6ycj87gdv5m7d0WhDYXWn+S0CwnLvLujtXbng0b6f+8e5EcRdpKCt/Z3jL"
-    "kuObF/nddmvckrzKLibV6/Xof518y1VGWYV5QsjlQVlefpfLC9zzorKaNQP4kI5z3u1c27+K"
-    "EkqAispyWTmVvxWwgpZ4H6tLnvnWd7awHFhRTLwoYPSB9yQq03BXlCXcuRyfeZk8BksUZFbz"
-    "K9TANX0X6PSpz/N7vgKGKKBIVMIVKcmf/VO4i3JzfssK8x8/FIZy4VkzZgqZmr5VUT5pFLYE"
-    "w6TuNoyVHRlLIXANZpUFfByGdXQGZx6srM+QZRgM1OsWgoW+WgpsOpYrvLkr0I0Nnm3YgQan"
-    "CefyViar3ZzLdhjzSx8r1hEY9zffG+G4FeLgkN4dlq2stnUkDh8zanHi1BzoGX6zCDy22+Ni"
-    "PO5jhJALOirvRVjYi+boFqv86/heaVbSdNiHqawJbVgHu97URDhpxu402mq7pEc1M7M4bmvq"
-    "Gtw7QN04rl8eSbtoe0O9vmC3ET46wF2i7BmiXDchSNSGQNfGDrpJtBfr7ABzBaxO4DY4uMlk"
-    "Ir67cVRfQyOh4/8UARtXEE5GLlxFuCJuGMJNR4caIwWUhLYsHzDtYsSJQkFTv7BOjk1Rk7SG"
-    "30gNUbsnxybTO6+9nob370fDMMxOLGJOXb2W/uj3/zAtzY7jaNzFFnvCBiA0qvl79Vtvp9/9"
-    "wstMbiupl3LokrR7oCNMgPMIqS3NbNVHe6EGz2Crxh4Tj+JZAUvftf379qTDR/aDL+mFwKNs"
-    "JugAn3uHe9IwOyalQfFqgFcFM9vWzZE9Xz91Lf3Tf/DZ9Jmf+/V04dSV9Dv/7E+J0H8b/yJM"
-    "y1BdO210R5saPTUhwSNibDDZhTSfeV+Y/6GzytRBGunPP7cxoxmRfQ4aWpD2oOuhLkxNCJhG"
-    "SseSlm5jEjJwZi9anC00Z/VobBXYDL9xkthfJ/azA/DIPnY4ogFF66pGsQ2alY6lQ89IfBuN"
-    "48WZidSFgDoAjs2vX5ba3vAP4zDnr75zNTVCY/v2DGCGw6TY0EwYgHxUWGmecuyHUAXtxbfN"
-    "QABzE4c4kE5bof8WYlCpCTQQaX0hCNlkfRiNKG9IAE3vq7yvw7SnoNDS3sN4a0fo9TBlOhq6"
-    "qqNP6yhT029ovOHF4VdsmbRBTfPcHIubMXwWR66na9DmFjHr2tmA0gye9GBZgWcMgD83oMSu"
-    "ZYQ8zYAuUEJrTjlqNj1yZx4z85I7GYWNsbBEn9jmOj4GUzXIsUGRO3GK288Ozt6eFuBy7BAr"
-    "b701vctuxV/51R9l5/Cz+CRmX7iSlQmv41batJ+lG7WD9lFtffabckxLy2tr+CMCn1qqWKSD"
-    "O+koYg0i3Wta1Ge0CXOgtZcMd3mJA9r518ah2jsFLGH4Wy/giTR8330VtHrXw0zXQcCV5BBz"
-    "lFE84Ct4O3jbvnb+3n5a/jJpng/KJ9//u4TImvxtHjRYn/x8AFTkyS+3Cyjv45sM5eQXIPHH"
-    "dlfAK4COyT2gyvjNjyupovAMsKWWNRR1mqyStHgX91bEj7vemfaeZ3HPM7PuuKABHu0oj3QW"
-    "5eeu667yeFNJcE+BkeneZ5ZpJ/uS77vSVAqKpzlNBj8e8MdnBYSV75JZ+NIJOlYKaLAs3Aki"
-    "Oz3mjKXQmMsr4cjt3G5I7vjKisV6+eSW3NueDJTvd147ia387Xf+bA8q81SeRSGWn+so279d"
-    "rs+FtSwnf8d7XkU55Y0Q81+mUNJj5ZUEWaS3xIqtP+q3dK6CaIXBcsVFwFN8RxqT8S8Lr/lJ"
-    "5DZPMPFcVpj7YM4WKeOR++qDlTUDMD8mFYVOGVdFI0ZamVnE/IHRqqh3q3cTAs4yIRWEp5kY"
-    "TjWsip1k/FabZAiImJzUcPARKvu/jx1uQ0MDCBZtsZKdwKn6JruYdrPqdwdkHzsRd8f5fUwK"
-    "MPAVmPZ1zH0z+Cst3yKeD/C6icF3+ntAVekyWqyD+Md0oFGaZpedWrohHId3czjvCoz+ysVR"
-    "tGSrCEs486JtMThpHLmBQKSgqG+I3uRjN2YwR1ZhEmEnVGdD+vrbOra7BV2hyU0JG+lDH3mI"
-    "XXzHYN5L+KVwvA5O0e1dxERyMsHxWzOXWjtDRRjHqhobxZnTk2gFJhF25tktNcvE5+ofqZAx"
-    "YmgHzRwz4ODs+Qm0Ercx5+iPQhvxf7lyhbazy20In61BdmqNctjyG68TQ2tkIu26TaRvdhJ+"
-    "6U++lH75J/91+sJL/zGtsvNvEwf8iZuTnJN4PX3z5VPpT14+nfow+w2GTwmmwz0Knmj7Yicf"
-    "whnmwf/89XepZyLimhmnSf+1LrSI+/b3A2MreFhj8wBCFW1V06Jg3orGp5UAp+7KVKOiJk8N"
-    "X3Mbmi58t2Zn8R3bgxYRs9R3vv6t9Nu//ZepuR4NBhPuh588gOmuhkOilznomCCZCO8eEK2Q"
-    "L506LqTLGEuY3uQnargcQyEYQ3eGZdAcGMfdIBCu0gemd2dtH+EOejGP1nK4+BQO0mqRtrbw"
-    "2XtgGEGrKZ25PIeAfiddQUD/8MN7aOfuGFf6FSkkSp/yL0PR5CDJCQ1YXTow0Mlu0x6EyMag"
-    "m9pqtFsw7BAkFtbSR586mk48eSjtfeBAamSHazleFRw1Azr2ipEdsDIs4hJu6wm3BdrpSQni"
-    "Vgf61amNNEpQ0RbGrLsCPYjaMaoAI8/wMPTZuWl8tTApIgy3oTWtx7wlrpZx5F5FgGJAQ5f1"
-    "EUXezShugNC/cQHBapaDwsfp+7GRMTRYaIpZUEi7N1gULKCpAurUhSZ0D0J55EWTq8bXxZq7"
-    "NP3Ms/C5iYl+jh2G8oFSAFIYoxuheecEtG/c2729hGAY6ucYJjSZvnNsskZJ1y+Mpv/hf/xc"
-    "evjEB+EvCMvUrk/m9kVhwevyM/GqcKUQpYBZW6sPFkFBWNQso6GSVprdTQjMbrhSQMvaeHgf"
-    "Wiw1XeZT4HSjj+kVsHQRaSUWXPRJUTldVLnu4uXl+/jOM7c/7dP4zpw8fgt9PJUO4n1ZKN/0"
-    "V+Q2EZd1mGY7XZnWt/6++xNv+VPW6xi6+8qw5VyROl5Lj+ap/pmf8LBnRgo5JTAnFF/kcjIw"
-    "vnOiD/sv70yTkVFMQNEIgc+rV79zAabVidN3BVggubSXl4OCwm1BpU4bGY+knsib4Sg7IPLl"
-    "BNG5drAZ/Gca7+3MEon5PbwXWGA1AJLrc+ILYdD7uMp2BQTFMwHP6S0vyoy6yzxFsspX+dzv"
-    "nD4nt4wyUTSqgK+oq3hXlm9bcr1+VTIGQ1EVK+z1dfjoQMQhhJEkw2cdBZy5hIzXSgfk4ko8"
-    "hZYpUthO8F1cmYlZL3jkX6SnjCxwxONIWeJWEMs00Wm8BcRIqFAgvA7CzOAjKyVrKqEPItXd"
-    "OPGhAklgn29/SMpZcNHso19NvI3n0Y84VUrDOZ007ZXbZNrAqZXFlVfb5Z3fVlP2sSV7ea8P"
-    "lPjwcrLiacCcNVLwKukdenMSk7YVsATN9wpdapmcyFwZW4xlaX4R1hrKWyOPu6BaEKosYwkG"
-    "rLCjGWUdXxS1N+JJwcX2C4NnFyrEKHgYgVpVvgJPCDqUvQJzNrbWgeHOdPCBIXbLdQKTGjq3"
-    "2bPzjbAOt3H67e8jP6v6pQX8vFCcKZBFH/FuFMFC34lBhKOHHjkcdcIywC9BG6dn8CGR2VIg"
-    "nzVNirSjlhW6j2S8+lF5LXDkjybMDg4+vo/dejX4RHlEzUnOAXzsSG969LGjmJQW0jv4qJx/"
-    "j915DXfYbr4n/KeWWRHHpIMAoQACuaN9w4y5OIkGxWjttzmT0Ykdh1IYfi27f3UIBkjMM7fS"
-    "u1fG8T/hSB/MJUaXv43QMTZGYNQpxg9BQHcPd6WhvUNMvnmyfOO776X/6X///fTFv/kSQtDV"
-    "9IHHepno76R/++en08uv30ivEaDy8s259MR9fek+BKUufJ362T03NNjH5O1Oy2Z2UGKKREBd"
-    "Yct6V4faRqLgY6LR4fupZw4itLaneXZIVhOQsxUNhv56M2w6mOfsujrgkFbEXw07vJugAeMX"
-    "LS9VsfpXQCDtzGb6/S+OpJe++0bat3uBuFjr6Rc/+yhCyBEm9fl0cXQ2DVKveNu4jR8eUhpF"
-    "Qiv6FmbBKm9ikkdKp9At/6xzGSFgFq3VIoK+tFKvAMIPxA60LmjHEFA6ELTWEJKnEaZ6ECgV"
-    "BqW9iwS3HeysT889wi5BNkFIZ5AEQnk/uK7DV4izLRGqGRU8Z0whKDc2oVFEs9RA2IANBOnQ"
-    "qqHZmsGPrBWn9g9/+OH07AefTPseuC+1IuQ0EsRTXrILuPT902XC+UbaiwUMz/LoVHh0w4v8"
-    "UWdwfjO2FBzUsDQybpZZYIwSjqCJ5/wnH4sDBEzp37lOjdDyzDRaIoOaIviiPfN4HTVXxo10"
-    "x6y+dcbt8ogrzWA3b4zhqzUS53x6kLg+jGtohWEJmFoZd9C9m1GWyPuZDz+YHnn0cGiAldcU"
-    "AHWEV2Ol9tpD4jVd1jOm1MIpWIk//cXquY9FGu3eizZW4aqro5pzCLMzuub0GTR1M3Oz6dd+"
-    "4zPpiWd/GG0YwtgGfxig4jAuCCDz+lyeY1f8xcKOMmrZbRj8ABrxUkMFxwsBSvyaTt4LxgJ/"
-    "Hsa9goVFU37plK827NatebR9u9AeI1Ai9EY9INzvGKx+cdkH5eVv3+c0+Wk8K1LlfiaPDyMj"
-    "T+I7l5jnh9weX0jjkYA08Xs7m2946JxhGm/ylcv7ngcF/EKw/a78Xfkmc/VP//hHP+/q1YL0"
-    "pwDdUUFmnEyMcDQd2Kw4D0Qmt2D0ClOZmYZtNjpAosbV0sNFAzIaBQFE2H+YezyirJi0IPpK"
-    "S4q00exoqY3Lwo9w2ImuDJyo9YeIsslT1m85wiazNUBdTIYsryJ4KoNFAnBw6dOg6tbnG0SW"
-    "VhUqfIFd6o3OdFcFZTtYfW791reNxgz1znuhDbB3UoIPK1dOvbOUwG9J5JFuO02kK3BC7bm9"
-    "pDGF8IaABZ4NsWH/hIjCy+gfADFrxj9kJGD82dkOB2a0uyhbU4xbcp2kzZcFVJmOQoh4zIHm"
-    "9PcSj5uhoQFP9GleGVO+eJRGbFPAXsIAXdEHwqYfiuU58GJQCptpBTJ+c28r+e9zvzKeFE7Y"
-    "PYNJYglTgwEC55jA3FFjMDvpszYGrcKBgStxVOWjOc16NAuV1ViPk4uMeY5zuRxoCiy2W4EI"
-    "UAPWbFaRcQgOOPGHv0kT9EB64w0JX+zEgd7CiZ/6ZczWV6YrI2wbWiHKYLxp9nMyoWryswUc"
-    "nIRWKtBHxHV8hZpx+tUvZRlm6ySXx5+7z7LDaz1ClpOblVm2dTo2J1klr2CyGcJx9r4DAzjQ"
-    "dtBGo8wrmIJTVQ9cRpx+4FAvgl1DunIVC2M3qgAAQABJREFUZ996TXIKqWzdZxx45t0FzHJP"
-    "P3YYbU8/R77cINwCwTVZ1atVcqw5ISjUiR/Ho7GdQmMgLPAT27fBuFxhe7zHTXW7WxL/KE0f"
-    "izPsokPzNI5m50+/cI6yl3CMv4OgQXmAqG+Lvh5qzHSE9uifelb94mRxcR1tDgEUnSTxcWlt"
-    "yuEtdGq236VVd+jt7mnG5OZB1JqmNFvqr0I4A8431Ml8Cp8WJ7Z2fIlmpqbSt1+9nPb2VSEo"
-    "EDaDVXpDfVtob7bWl3EgX0kPYb57nEj4ESkeM5G+cV1dBk5toByFpeiO0JT0sRmgDqHvypUF"
-    "HLYX0yc++SAmVxz5EYAWECAGhz3GZDWdf3cUPyb827qbIpBssFtGdQgICu7IqVvwrhXMmdaD"
-    "7iKtzum/s5n6Oebl0z/8MEJba7qGH9a5c+PslLuTrhGPiogP0BVaGfpB4ZSuDZxI55nupH7H"
-    "btbceEDzJEKAtCYtGeF7HxqWrta6NKaD+wZaEfh2O4LeID5pNRDTCkLj2PgyhxzPpmeODOCg"
-    "jvkYGDU9tyFwttGH0oaaJvEue1Ug8V6fIxcIYCzGrLvrNC/Og4s9HB7+/hceSY89/QRHugyi"
-    "+egGZnyM0IhECBngc6wrXMX4i3bIL2g0FTr2YgzLH4OPOX4QVKjP8aiZth1z5x3gvEwgX82F"
-    "kKcjPRz53TUpL1hAg7bKhoXqXescf9SFkMWxOiBykzmk2p3ALnRCc7UZ8dxe+urb6Z2TI+kC"
-    "/VCFSVCndfG/hDZQ07Fx6drwGzw82BZm4L0H9jImetF4cT4ooRqcw9RUuwNWbRrNjHbKL1bk"
-    "GTzxvNM4Hoe27utvjh3ILWxo0RXAkBXywvNXRum72vTzv/rT6YHjjzNGPS8RczU0CoICP35n"
-    "HPLIlsuI5GfAu8jCKm/CEH9GikdzR5DXFcK6uKO4GQ0V6Im5QW2xZeWA05lXq83OIYXU3Hkg"
-    "+xJCGSc04BYA9UVe6eK/5JL/Bi/lWzjzVbSB28rT4pXl2o++MB9/8m9z8zNo3roZW+WVRwLt"
-    "98rJi9/OrpbGQ39RQMYT/I7fGS6TWkIkifyRnFt8sD75eQvQBGCQMJHoyjhW6kUB0Qm8Vx2q"
-    "qm+O3TMyYtWGiwtsU6Yz/C1BMwNFZ6g+NKL63Owkgybv6nFCsCwdAsuYViUgdyG7cgPI/Fdg"
-    "m2H3hpOH9lvz2MjcZBoKI1BKnme14e6IelcY2IPNoxBVj7OpmF0C1pkpTQZzYVbQzu6huR4i"
-    "uwrzFFna1L0qEr6o5fl/rSvKKvv1rnLLh7l/yvqi5qJ6k4uDVVaG9o+7M5x0+UNy82+XYSnR"
-    "5fGYP2S+txXm1adrkX5XwHJiyhoxUmYqhRF6Urw4wqxTCBTL2PBl9sbUif6gZFfhOQo5sBR0"
-    "Gtot3tlmhR6PaZGBKGAJX57M86AWviBYBRj++d9LMDY4DHWOwINuYZ9fYLDS1wpcHqVh3JXw"
-    "NaHfyvYtoFJXwGqEDkpBTiEvF6rQqBbE4JDsUqJNEawVXPg8VmIWRPIsPMHEvSlyC6N5FCxt"
-    "F/+DptVGefk3TIRx60SmoJoFMceYZboryG/4YayYrU5NltqFaDqF6lPh2WEKufXQfNZGSPMw"
-    "sJjYssOpK3LxKEya6hSGxzBJaOrRl8cdTqr6QzuBZkIzm8f5ePCrWoOHHj4QWpTREcbp6gLM"
-    "G+0EArT+KLamhWNNhohObrBRI7d7ZM6iQQiBIUf5VrAkabTcSUz8SI8Zf4Er2raK1lWGbQR3"
-    "NVn1THCOv/cwK02i+disWsDHCXMMTt1OtGdwWHeiMIK1C6IsTLua9+w5TIBMPhNs6R+fAmbq"
-    "HNrdFWWLC3EuPYtvaU2ftqAjJjeDqcrHmB8Qtm6lP/jLm2l5fIEz4jhPsptQFExuo2MIL2ii"
-    "NGupdZxEU9eJZuaDTx8iWOt9sd3cAtU0afpTY1bRCDHpOgDKcT6Otqsdjc/H2PXY1NTGjsR5"
-    "tBrTOMGjHSQ6/Sx0vYFWoRNTYzvmEwM5uka5xXizz/2tCcnjVXT2Fx7plBGXLo/NpaMcjH3o"
-    "8IEwb/77P32LeE4pjbGQ+Y2fei4dJ67Zd4jqj0zKhEyZ9J89Y8w1hWBp0HFrJH4n/0Um4XXG"
-    "iWnLTxdCSBsCVhP+SJPL7BxFG9PMzkxNeh5pc/rGbGqu20pPP7gXLV5/4PY2wmD0MX2t6mtT"
-    "QZy+7kHYfZhjiI49dD+BNnGER8uqDx0MjDbq+8MB1dDlbrScz77/RDry6HH6RI2RO+wQeKQ5"
-    "Jm6Fs9BuA7/CVYXPQAfBO6Q9/ilQRfxD6NN726tAp4DQgNa2wfhz0NMqAX9HoItGxzT/1PYp"
-    "wEhDkvYsfnzLxN7aQEhYXeYMQUyAG9Bz+LdJb8x1Hod06s2R9IdfeZXAuJj5WPg11K9Rfw3a"
-    "4hVMfZjjmYs0tbpzeC/mabVTjonOrh7yL7HIuRHtvMViwvFaCobyi1XuheU2/WMZzWg6Dwx2"
-    "EH5BrazKB0NVYLaDYE69MZI++pFj6VOf+yyx7Y5h7jQqOxpMhCvHUtCmOKIcr8zHouUxr7pg"
-    "XSMkhXO984OCkkFdl5bmSYwmmtMYFJLlrRGaAX4grPq71SI7WK59JZ+WH6nVclx29/SBcw+h"
-    "Z061r4J/bn8HMPf8sY7vSScioqeKxHGf22Mr8us8n9xTXOW2TFNkzbm4ibpM5Qvhyz+Kvzl7"
-    "gbZIY7I8P5Ql5TTl3+qfV8CSIYGQWYSP6cnpYGp2hszRUsyq4CFhT7F7RiHMyKw1TAjTxKNx"
-    "W7X31RBagEQGmcIS2zKnJsZQj7OixkGuVQc37Lki2BWmDfCKjqavbVz5jIdFWbAS6p28OR5C"
-    "kH5HlhEDjI7322sBRjU1MRH5Xfl6sv3N8XGIg7gpLS0gYQsBbArNx0wQgx3nYJMQ9EFRvSsx"
-    "hF8TsAXDFJxofVTxt/7JUPytSe55+f1zfP+nBfGAH4k1BCxgVLgxdoh4y52cO3sbZplKrtZy"
-    "A7/eRiUSIFuB0eQpMMvAMm7doSYbVrDUL4S4SghgpmtAXeyq2gFtkqAPyvLbOGKWYXr702dO"
-    "cOLXvjaPE4srTCf8GDiU4b1wCUtFSBFmyrAcf3o8xs2bE6Gl8XiNbs7M01lW4UK6XUDo8nLl"
-    "rJBofwp/Pp+MSoDRWFTCVsKoNszAgjIEV6HRlph08AuCrnTatGxJUrhEWUlrApUFCTVjeaKy"
-    "XOsUbjVYwu3le2Ph+L0Bk3TSFCB/z8CI10iv0seI0O4mo0pgZIcoY0v8aV4wiKOChXW6qo3F"
-    "D6UodIC4MFMoXCnYqE0eGZ0KR+Q+TFeex2e+TZi0O7s8BFktjkd5zMxspRMn9nBMSBtjeDF9"
-    "h1V3O+XM4TROUSG4uFNxkuNOGoiFpXDkwkkNalX0G4lsKW1T2LCNwib9iA/7z2d0bX5G20No"
-    "oP1NHpCtaQghyqCTDuMb1OOB2BM4kT/66H3pwH0D9Bv0jlCoBkahKo5Qoi7NJfq0wA5yDDE0"
-    "VAqyaq1sb8DEvTgpNbLiSNrwWROMfhUzWHvdMkefzKGt4bDu7h52AfaGAKGQpR8MWEj3c/Dz"
-    "o48eQos3EM2dm7kVdag9dDzQTKpT4+RYzG313jGh782B/b0IFcTTWiKe1rlJdnVeYefcSDp3"
-    "HuEEE9kBDqPuxFGcUQD8mF2I7WVFOtS7eHSHmOXWwfeMRbbJgrMd0+JR8GO4jrNnR2JnWSt9"
-    "c4UFx+/9419Jn/6Zv0PMpevpK98+k/pagQO8bsB3s4YxC8KWu4Cpb57+voWwBIlE7KQBfOWq"
-    "IMR5CFPn9fbWGnDTQlBR26PWBvMTQuelkal0bH93evRBhE6E2HVgkz7cAOFCbZqNCgtommsx"
-    "Ce/d20Mgzgdxsj6CRrWXjQRMtgino9cm0YDhp0ecsk1gXEToug/z65GHjhD7aj9hF1qZOzx2"
-    "JYcV0BSX56tMXy60o3/BXrlAlJeYxr4Rb/6JBTPCQfAdnnm6ggt+N0O0u9t0ZTNdmp4FVnqc"
-    "9C5wFNwpIrS5i/jxnXrnRvqbv3wnvfXaqbS+Mh0CmuchViOwz83Op4mx0bQFr9JXSd9C58dN"
-    "nPSXoN8lBCm5mfAsgNsGypaGX2EH6g18/64T4mK+2Gnn/CjPcazozK5QZTP0E2sEwH6E/QHO"
-    "W2xEg+pCUw29m16WUBacOnUz/fIvPJ8++iOfYUPAMIKhizR4A3zOXY3hykB6cSbdesUYDRxl"
-    "Hu4CwTGkUMRb6shH6UnfOqm3chSRWi0bI4/00whvUDEj3PIA51ZxrlZLOhZPTU3ICIyzotqo"
-    "+94/tvOuKxL7Z+dHXnNXqvzeBvGct8X3vWnuuaeQncVUfsfz8p1PK2+KAqgnqsrPxV8GSBjv"
-    "vlAgkxZku6oTCTM458lsQ2BikGSikJEioMxOh7Yqb7VUUoVhMmk5eVlBEDHAhEaJTpkjveVr"
-    "j3XgKJg1cvZXTJwgIxg/SyXvvWySzDl8RZywCsCVjJ08p1GhKlw0sUNHdXE0kraFFgYtmROg"
-    "zneuXGTwqjpDK2I5wG/kW5HRgZq3kc5WLLEQn42NjtC2GVSYHgVg2TwXFtNk8ARw+zc/d96X"
-    "SXz8/a7KZBOw5KYFkZPYR7bZwi3HX3ddPAhipX3xjwwSe8YPuWAcDkrzw1ruKaCArFKvAoFJ"
-    "xW9+5yCV8XiJt+gDBzWTqzC6SnGruwWbzoFnTrfm+0w86x/k2VsKUrZVrZBCii0KrWDUj18D"
-    "TN3dKNXVmJlwtrSbPbDUHTr2Q9CCANoM2rtLoYdanBjr63QAhrFAT67A1W6oORX0BsqQwZo1"
-    "4yLjKt+rpl5CqCC+FA9sXzY5ou2kXu+dDPV3WsQcoJZNlXjAYjsRAhRwot2kVfCJioDXZt2+"
-    "nX0kQEPgi0dxWfc2PBm3tqkVH5AuNDWDYMB+d0dfnG9GG/UXIQltRvtCHy+zM2yKyayb4zo8"
-    "egNKiEnVCkK7wiSWtVhqBdWIEbQSh2O6I3CmWTYLiprumUhZiU/jm8SamICQaI8mDrCi78HU"
-    "ZdlM7mgIrN0O8CBk4agnhMMYi5U1xnRzI06v8AUZqTiKboWOcjvzpBcH1FKEPRDmA0ySMlwZ"
-    "ryZFt/j3MEHsY4eiE/N7Z66mmzhmz1newlb62IePouk4HP2vltH+jD4if1QkdOCoE5wMY/6z"
-    "328Rb0o8gj7q5PBdhB/7y7y1xUQrLSvA2PebG3lhspsI10b3P4vgoxnvoy8+np5+/smA9Sxx"
-    "wR5W2zLYG3QyyeJzcmIm6E+BUj7neAjhGngsZxmTksC1GJ4BbZZtHr3OOXwT0zjU95PmVnr5"
-    "JXZJTk9CsxyxMnGLBcNN+nYYAaqZhSFCIz43ex98ACGgKV06PwLvnKHFHKE0tgR/XqZs2oew"
-    "2MVCo56xcPnKOM7HqK5uN6Vf/fRg6kWT9Db+Wf/w/3yFfEzoy0zW0KaCgw7RE5gB28GBuNEM"
-    "7DNpVt4hv3RXaj3CweLoUppnETCF1nJoaA8707pTenc8vTMqPCl9lIjsHs8iK0H+iTGi32Ad"
-    "Gj3ji/3xS2+mp/f0pBMff5xjiB5LvUNDEWS2hnGsVWNw7zCaqg0i/L+W3np7JMI+IGWF5rCZ"
-    "cQ4nKuhF4SrTZDHVBM8J/kwbbIf0ENrxKhca2fdKmrFhLlh8v6saSwblrGKxMGRHD0cPyXNU"
-    "BqiNJ2X6DrGuUAGEj5OO4uF/Bl3OYbKfwTVhaQvhdzLh0H89/Yz0BF03t3WmmQnOpmQ3ZE0t"
-    "2tbb+JoxADe3CHyKgO34q8XfzNFknDq5prDKC3ug/9EbWGcoywCxhkLVBO7aSeGKx9Fv64xF"
-    "Nd69CL9t+MG50UPFg7HGFLDOEd/u4IHa9Pf//s+lQ8cfgw/sirM3YxGqzRkY4sguynFhJl2W"
-    "OBUHXpu0LXyXeecOddsmf9JxXa2W83AdfZefO+aBCdxlx3XlAeAnbwPaLfFuGY4NtchhtaAe"
-    "XQtyfbnOqLj4Izz2cnmZouTB5bP45oUgR1r+lLmsO66ikEpZUdBdJdx1YzqT7Piz/Zv2f++V"
-    "+X7Axus80wRpFfm2c8SM5ESowNLEgaNK9ZqE1JTIQAQ/VlGYXGbRQHivo5rmKQ/SDHWtVdhQ"
-    "PjIVuorV2gIqYM7H6sQ/AYFoff1qaEpaWz3KwrzEpqHDIhM5BLK87AAHulj0qZJxM1qpcZi8"
-    "E2X77U6eqlZWwmZbMBoW4290cL6aA9Or1KQIu4iQoEqhywNFazB90N3khjvwiTqZOGSYDNco"
-    "o4Qt3/DXpu28bHBcwll2sw+22xI/d6SLt7RrJzHl17msHTmjZCsts/sdbYBh+HsnoeZ835s7"
-    "MFt5TCb+i9st8cvlV/5pPWqgshCq0GSQP+/V6ISvV4FLnRhdoTnQkWWDXjy7yjwSQhas6AP6"
-    "WC2Sph7fCbvCmviX3rbw5XHCdcB6XEYOQif10B80MAdgZaBCLzr0u327qsojHDCvUabaCp/v"
-    "7h8I+BS69NPRR0tBoQ2thniexRSzCD0qRDnpyvA0WSkUOibFo1vgPYZmjeB9apxCCOO98DF9"
-    "MOkYRkCTY6bJSsRg8BeaCwqS9GGngdf4EygWVukU1PPeS1psxeTmZCTjid2BOJTbOWYR1642"
-    "wzk3hBm3zHucSnZuF4a8iyn7Y91k0lfoM9aPZXSylV85SUbq9vjSfK/ZdI3jQW5jR8rjtDpd"
-    "ucKq+85yBHVEH4ODPdHb4eTCuo6zcRumqf5+whrgzC192H/rlONRSaVwarOkoexz4apWAcdg"
-    "g2g8wlk6C20uqACTj07ut+ADRJvmqJohHM3HOLbmyX3daf+BLkwmXYzzVYSZBRZl2bcqFnNk"
-    "rmICtT2464InJgIEDftdxIlnaVthfPN27sPwuSQMgo7NCqxGx751i/G3awVBVI2hRwZtEtvL"
-    "8+44OJdwDR6/88wHnuKQ5kPR30tohS68dxWNFtvg8beqqkKrQKOdFHWqN8yGoSomCPw5jzlp"
-    "EP+h5eWp2AVmmW4iOH9miv64g+9XZzr+0O505txlNA6r6fqY5z1OpY2VLXZ69qehfX2pb5jd"
-    "d2gdRq/dQDt1iTqIhcXOt/fOX0vXZzfSk0fpj/Y2/HoIw4EWcP/egTSOD9Tm5mJaIMr6v/kX"
-    "f52+8LVXwVFNwtc9IrxLldoXDDCrQDVJujr6Q3rzsg9NcwONR9d61uoM966ny5MIDAij+v0h"
-    "kxHQcp7wC/TTvgH62GjxCmf0I2Zfj8tykbJFu9wV+1mc7j/44RPp8GMPpq4+4osxZ+CUFLiS"
-    "f6vZ2I1W8PkXHoN3tzE/TBPpfXc6fPwoQr/x0Dz1QKFd/uOpDfwG5/6jMoCWZwm5H+99rNZE"
-    "wVrTYU6vi0mEHcBlQMtM7VYD+WzPahw+Hr6lMdWpAa1J3z1zOZsIEZhb8W1yvC2jzayGjnrQ"
-    "IDUj1BJfNb30jZMcZ8VxRWjkFM5Pn75JkFvoErxDZtCHGzPgh8DSTDw3BaghNGeO65toa9XI"
-    "GoalBV9LdxurZVplzGqSXEVjK33ZPPlLC2OpleCuag+9NM8Lm/j58snx9LMfOZxe/MTH0uB9"
-    "h9ig4DFRusbQqODpWajRB1kO43x6B+HMdpVXzEfg2cXwLgQlefUugunm+rMAGumZE9wdLN8U"
-    "htAahyVBywU0Rh9brPOGfN1+yX2U64q+ZNIIYaysnO/o0x33/oxezavNu9443HO3F7nihiQl"
-    "TZjaaT0TRC6IwkydKV5YLD1fGQ3bYyHKKV+W6XbgqpKbIiLXXe/E8XbZNWH+CIDVXBCdFtPL"
-    "BMxefyUnx5wXVSV+Vssw696BAYiQiYZWWpQmIDUQ2cTiziEcHBlg06zY9Btobu4IiVab/CwD"
-    "yBW0mg+P5lE4c6A5KKwnIy0LO9kcE1ghjWaQZiY4hD/UqDHB4sMB7URHqilzomrVgQ7iLf2o"
-    "1FjFBCpjhxi2YqDhF4aWzsmfMUt+tsQa3wMG2dbWBazNtEUizmbTgKOCL1FbXhmNpSAoTktC"
-    "Ckl6Z6eLcu59VD7OhBdUUBaYvwPhOWHgxIJdxoADP1nAglC4tW4/QfgSIpcT0fbF+3huft5Z"
-    "RhSt0KzPEjhhJrYl+kjN08fiSyamWkgVuU7koe5GIA1hFAEqJi367nYjQgBp5+fx+YGReIp9"
-    "LYxii4l5kRXqEhGRgzFKK1RtP6si9pwq+9MJeQo/uRnowp1EuF0HMzGtMISWhPY0YpochO7G"
-    "MQGvrLCNfm0u8Om5Y5pNPIJB2nA1pU+JsVpsqKhQILBdTsRtrcSywYThpLBr11z4uXh0ikxw"
-    "DRPowuIMkyH+GTBh2BrwyoQxkYbJDGGOxYeTuPgW72ECFU6YUZjryOVqWgbAf0CQAcUQjH73"
-    "me8VNvWDamq0P/POOOHNiTRZ24cyJoRcVqo1CKSxewhaVYvViJMsYCFk5VXtMmaeLRgaFMtq"
-    "0oOXxXEtwgmCFP3V3KKpF7zAvAXMVarCWj8Rns+d5xw9ltXuzBvoQBhdpF3ArcZUXxF3jbUS"
-    "SqC1pQNNzBxahs30AAE1tWJdukBARqKIN4B7TrOGJwh3bZhwhw/g+4X55fLFGRy68d3gneY+"
-    "8SZO4pgefF96MGMa9+qJpxAGMJO1YOpY4Pkc/lHiPhg5NKrAKe5Kk5w0prOzQrNt0u9Nn5kW"
-    "whTo0B8rdMa8pliFyYaqHNxQwdl+ZP1PNrWxLtQwGRLMc22dUAoEb5QPGjVercEMfl4LmH8M"
-    "zFpPnK6qauieuqqZPNwVJe+YJOQD6MN00szRLH2YEnvZpUiEc5zXt7bwYcIpHF0RPoTQDnnq"
-    "mGyPHupLf/362dSGkDE1W5W+8vK19KkX69LRzv2cE1ePP8/F9LUvn0oXLtxMH/6howgjtenY"
-    "4d3pIPJ+d4/xpNqoE9OTi1gWn4P449wYw+T0HeIuLV1MxzhEfIyAlOLn4CDCCj5114FJdgDr"
-    "ZWzZz35DC/SalxzBKXEZQbKleTM9dGw4DWJSfufsYnr9LY4mAr9HD/anA4RfaGWemKZfdb7X"
-    "yd9FiTvf9MPcYLwYnfzYx59JA/v2piYsBvreODZv4b/pJhmdv52A28mrGakLjaY0HCcW9HWH"
-    "FiyfzgCfoz8cH8HnoF2Hinkcd5Bp9GPWVrEgdE6hkfKsDca+fm4rLLhccWid8KDkeoS3ao9O"
-    "goar4WtNzVXMay5aqYOFg7T/9XcvpRZwZ2w2N32sbWQYltHobd1xl29Vunido28wFzfUX4H+"
-    "dOAHMIBzzInjdcyrVdBeMzG+1KK6i1OTsLDOcYDhEv3nIrVDp3/aMs8JBx74vkRZdaSxjCb4"
-    "ltpShbBGhKwq2rFri8UDC0wDmC5M305/9yefTM9/6IXU0r2PhRjjBBzUkl/8eUXsLiETbz7i"
-    "O3ygfeng8UHArWCV8ex8bvr4w+/KFUWqmFDIYp6kbxS0FOZzMgVi61FRYen8JY9zTDzgJmu+"
-    "fZuv/IsSgTnPocVzC7I+82dgihx8RXHCGgQQ80U8M50FkkfOa3sq+XkXu0/59hQNOjInFVfW"
-    "EW2nPDLk+dqRkfNnLs4deeUbZojjBUkBojN8lsEnKiz+4lsroiwUYgNZzZrfqjkSwxU+Wqw6"
-    "hKwwK+CgrGnQ92GWoQL9ItQGuDMhJmwKV3JdwsRo7BM1SnVMjnZEaLzQCOjP04izpyupAFpA"
-    "Ayhh9ofAlkM+bsVPqBvbca4bR52qhq0BDYCTk07rMjyZtL49pXCl8Ga7XBU4QL1XK6cErblr"
-    "mRWcwpjmAv2LHPxNzUXPUF+ls4ElkCojj2s7TUAb+C8QXKSIXqv8zp1Y3u78zu3d+eQH/A4c"
-    "5Y5XYMp9VsLzA/LseCzEITRJfP4uvkW8DNaJKZ5DYN4HgfB9h7pMK35dqUca70nv8xAsEMws"
-    "uwXtZzOfUM+jZbDVntMmjm2nadU4tGOadWeRgrh9vYozpcJYCVP2UQIC+05ECgcjt40Vuz40"
-    "qwhPHgobu9cwF8+Td3Z+jkm9HYdudxo5acochI8dQQjOtscdcwZ/VPMl3cRuO8w00ovwqYGw"
-    "7WqGnDTuuFJjRR5wU6blBiFaGnjxXwhZ3CtcKbyEBqV4Z/spNsr2m6Kj/MCuafjE5MYqVk2a"
-    "8PrMbz/hQF78VvOiGUB/nuv4qwz0EjDRkA44HmsWY8iFmWwCZ3E1a8btMWilgtccu5EUKIXN"
-    "fhNuf69iGjIC/CUcpRvAqxoqd8RdxWdmGKbfxzE2rS2YMonc7pE97gB86NjedAzTlQcqq13o"
-    "7L3Mqv0SAjf0A2dpxDzf1UuMpr5+JqyumOB2bU2ACR2zFXSyhkDBYIFdacK1wURo+ATNF8s4"
-    "4c8hFBiU00uzDSghb8ad483LfhV3ClHlGIqdorzL2i3xnVPncBY5nZOYuPXSQTsvwHQgp3/p"
-    "7joErWU0hSffvJTOnbkBX5OWEHAR5BTQLXGFxWPwmNtLlFGfrl66hSlmg2jwbCjo6wPH+gJy"
-    "FApxoJwEr13FyZwFaAMmS/F/8o3zgQvNuE/evzu9e5ldf5DWKri4cm0+tZy8jHb5anrl2xfT"
-    "6wiwBzCDKlzt27+XBWQnB3MT8wuTrfy2iT62NfNs6jA6+u7d3dADsbXm7O86NBy4VYBnDzfv"
-    "6UKQQLC7zIHUdGU4dG8o3NMog9xq9lVjMkW/XmJ35xBldXX1MoZvp+mNybQX+B99cB8R2fsY"
-    "4wSdxP+tieCw9qUbB9T8qCHRYf+Zp4+kY488FA7qDQTorGJBHc7Oji3aaReE9gOhowGXkbBQ"
-    "QLOeMSsPd5xbljRj//pRG0WvBv3qd2pnSE+Os1iMmRZi0QfRj/x8bGSUo5POcNTOONr4qnAs"
-    "H97Xnwb3D6e27l7wyoHHCoWU08QxSijZqAtagGcZSf0kmqxZTL7NzIHyBY+iagZX0pGTbByx"
-    "w7ziAe3iRAFDHCqIemlirEMoyrSDLx1zjTHoWjyVAaF7dGI1xqnxwa5em0jnMKsaJFZ/TOne"
-    "KOxqthqBRWONWvlG7tEl4Ec5mYY52/GXf+Wj6egjJxh+xD2DH5b4CtwFFGIt0BV34r5yH7j1"
-    "MZXxvxwb5TeF5cSRo0i3nTvK2/mnkm/HQ+u69zKdc3w5diUI0yk0Vy4BrVzSgPBVHpA+3+T2"
-    "Ksx5L3fLtFG+V9Arm2G9eV53MZGblmEhr+8iLRXFf2iOspgBikpLADKP3glMCVZ8B52WWeC1"
-    "uaFKrtqpmYjQBkjgaoq6enopZwtnRdTbqIj7BgZ510g6gIa5OUlJzA0NOGhSvxPoKlsyZ2dv"
-    "Mulgh16rwRaPqhCtgcKNxDw3O4OanZ0h9Z5JxP8Cbr4qE0wG3ideoArI1Xy0IWBNjE+F0/Md"
-    "JlPPYnIHowJcON4xYC0P/WcM6DAJYU5wAKmxkik7Uff295LODna9psCwFs79s8T28UTysDGL"
-    "Xtpjl8nQM/Fsw1T0QnSM8OX3wnv3b9uY21N2QySJP6X0XT7JScu6yFa+4DuXn4WaIJ4SlB1p"
-    "fuBPCwLI/CWTKspWkOWh7ZRZKkBr9rFvjb1ENyOILiAUY15jxLuqkUaExe9wXse0IU0Zg0hh"
-    "1onW5zJN8W5YDU2EqsvjqBMmhdi1R+GaeNUmhPYTmIIWwLXwWId4lZm5a1EhT38C+1lTonWq"
-    "BXLTwpVr11HRz8K4YNacYu+lEGG5CkH2u7h2c4T+OmuYasSCE7TvbYv0LVOqc3cRK2t3/0j7"
-    "Tvauyo1l5SQi7iwvw5eFUx2NvZzkLSO0ViKPqxHTlAPXM+jEdeSjjQqSLk5kyu7OdOBnzZrw"
-    "5naXJgLuAv/2wS1WxTNoeIygrVO8OFlAMBEfbgWvIr6VbWpkUjBa+PjKTJh1hEl8qulZQ6jT"
-    "94a5lAmWeFeshJfYFaqg9fTh7vCBMSBmKTAmfEmOsFPtkSceI9L5ARqBtohPIzCsrnOe2rvX"
-    "Qujq7GF3Ef1rRy7i5zWBo/gSvistpBN2Q2zMEYRSzZToaWWCc2LS/KTArFAk3ShwKvTILLNQ"
-    "VCxyKCMYJAhyorbMLJTa32qd5RPSjgs98nAvbqUz2+KlWWaTsa+208NsswOwzNR+RoPHbq+/"
-    "JuioBrWPPDychve0x65NmW3sBiWlE/ryLeNp3WCSbkjPP3x/tNEQA7dYWLa2YdJBW2rE+RUO"
-    "JV5FIxTnxWHydOFpWIsaYn11ElB193xzuoBmqQW4T1+YTW+emUxTSMy9LFoPYPJVWzKN87Xt"
-    "6erthHbd1esiQL5azSKWaPjAMwteW4i3tQdzax/1urBxd+bE/PV0Bg3b4TtNEQtsP8g5yU7G"
-    "NWjPkdKD6dFrHS2uwtVxNGGe8ThL/73+5uU0St6nD+1O+zBDtkJPItdI7qFJpN7gCfSD/kSG"
-    "GkCBilaqCQEGzWQPPmdoGm8zR6yxEAvNBXh0kavAnnkF41ILCP2nUJU1lGjJKU++HuVDF/al"
-    "l2PVT/ymXp+rYYoFJPA04PfjDrjJsfF0loOUX/rau+kNfPzQC6We1Jl++nMPg/+FdN+RIyEA"
-    "ZnrJwn89Y7yXo288Vin8laCJ196+HLSpW0Ojfk/UBWnGGFU7CveEVqFLYHKR5fj3ikCfCENq"
-    "rWgogG+mNhYsmqh1SO/sRPOL8OW5jE73dEdc8ofm2NQiT4Be5RGYiy3DSPm2/S02R/zEDx9I"
-    "H/n4x9PgvkPhRO+Zo2qtgvjFD1XmEUDV/BNPfnZePvVZ4JRv6w4GZ3p+ZyznNDlfLiHQHz/z"
-    "/c4y/R3lxA/+RGJvdlwUrCIyl0960ugSUuKuBLSATmiKR7ld3kV/W4AgFABV6vUxtBBtYFxF"
-    "+0hnUuvweQjsBWwVOHzOJ8rz20vYhNR3QlLMmT6ywEhVpI1yeR/1wuAsvkZ1YkwmAGSr9Ytq"
-    "Y5TchDnq3KZGSqd3tUcKXwIbZg0Ylr45MkuZlYUZlmF2ZhKmsoSpwuCHSPMIQQ4oljGxYljF"
-    "x0M1sYw41PjUa1wmy9Wh2Ss3Mn5GwyxchqrzXDvHc6hdW0ZzsUAEZ5+3t3ex4iDYGzAx5hD8"
-    "cqwrkaBgZn41WPplNeKkq7paWozBEbCjuQCuBdqpk6lt9rJNMvES1/Ewvyn+8o40eXVVZIjO"
-    "2E6Ze6Bo047H+WfZQ5W770kRD+xcP9RVEgg//8svE/MJoqZRgd/IvV2KQqXClYwua6GYcCBO"
-    "44XJ5NQMOIlJuDGxiRwKdReek579YFt9p9l4ExyG8O6Y55/vFXJC6CF9mcd3PrPeEDihGe8V"
-    "qAJOylzEv24ek7VOvR1oKndRp1omBZdmtvY30vc6fGP84bnCSxZInFRjpxf1aWLSHOwzTWSx"
-    "oxCcSncyWX2GlldcLWJyxN9KuskO2ji8s309LocI7dPnxrbJYCMkA4NWAUxticKBQ4kEfMMU"
-    "EYDkucJlHzBkYoW7C2bcsGGbgYcyxZuTp0Ja2T8y7eg3BAIZrYJqc0MVB9Sysw6hpJ/jMAzh"
-    "4CrX9zJ1Td2abjyPUK2GauwbN9icwuSvsGI32SNZsNQBHKENYauGoJdDg2gtcKJtQtvX5GYU"
-    "NB/uQrJtQxzr0kIYgY7e/sDZ3By7etEmym8GiInU1Z/9MicJeVBTrd9UMwuhhCP7cGpqY2fi"
-    "DDuKMbdNYXLy/Dr7RXW9rEEeovDtOW5qebKAmmleBIDGwEmwOnASARZpbz34KOko+oc/mT9F"
-    "I/NvMquhtb3Sr75jIcgpREMxTuJBD0GfVeG/9oHj+6AhNgugPXKRoLZdmDR/S6MKaRvrNQhf"
-    "+EwNt0cfjRHLy122DxwZzho+Gn8LB/0qxoH8aGqSwKw4l4vj9duN6drIWLpCP2kaP8bYOosP"
-    "lUZy+2uAiddAswoOao5fff0cAskunO8fSnvxfbp2hV2isRkDPAN/jvFl6BHiioFTQ2oozPRA"
-    "H88/ti9dvDLBwdAcoM24MWTFo/t2MZ6WK2PIg4SNz3SorxEBjR1++M2O4dc3hk/Z44/dj8Dm"
-    "WXv2DRI5WBM3HoMknWpijfhu0jqali6OfVGjuYL2tL0nL5R0KpdvaZZyrIHCGKOW5bigh/mX"
-    "rzzJ5r4PQSx3Pi9jUFEnfctP+4WM8TvmDniGvkHyHuc0EuITN5O+ceZ02oNgOFTTnB57qJ95"
-    "R+16dRq/dh3aY8Hd3R0LJzWCNagSdWup1oXFsYrGSK3mK69dxFy8njrQGtvWVfCgMJ4Xbprq"
-    "86JFYAxqawiSCOHBb8e1wnErJvteFiDNLGQLoMFpdbp0ZTLCguiT1MdirJ48aqzUWq9DO43Q"
-    "geZOdzsuYHpdXrid/vtfeCG97/lnOVuwJ863VFPqmZ6aWEs8FmIBdYmkfG3/yvemDV9XRTFu"
-    "Im/xR5yWfKiYlotS8pfTZyTd8bRM7yPL87q3zsozEezHNCS2DuvMV6aHEGx4UKnHdEWKyFve"
-    "821f8KdShjzCOQcKJEdeXEkb5aUMI7wl7ViX8360wSzAEjjYrjHm+agn6gWWYPS2NUNlepVO"
-    "mdbz4j00WEASxG9TZDataHkM76/mIg8q/QsIVsikIw5iEPAdToSUrfbDSXF5GXPNzBwE0k6c"
-    "k0EIFwbIcxuqw7JRiq9cvBbltuEorw9FXJQRQpbdUcFxBtq/MkfLcHXbjtlxnC2tasJmCbvQ"
-    "iapXzZZXaOEgaL+d6Ozl6DR6L5Al31X1DLPapWDFZG4cEo/YUMCSeSpkWE+sjGEKBe7IWAJm"
-    "TRk205fI9akpvN/O41OvnD7/3v67M2/5NOAtbqI8f9vZ8e1PB62fTDRF0r/1K/KSJ4MBLOIj"
-    "gBTWLPworNiHMjxQGFcIWmh8rD8me6Cwn8wjnGqDGun7RcJxePyJO0zUCuhDtITTuypthWyS"
-    "xpW1DZkwFYZ9Ly0pyIWJgbJtqe0zU5iAuK/D52gdX4fpKQYNk2X2KahGE6MTN2E32JHYifbK"
-    "M99cBeeJVPV8pleFJ4UBd6Q1NeGkzWRiPC0qiXYY4LOdRcX84hxaIP2WFCbVMOVgiApBLiKc"
-    "HLxEnTAKnwKBTFQnaic3BTi1JrZL4UtcaQ4p+9oBuoJwZH7zQpCRXyasJgJJKcoXZ5YbeGfs"
-    "OKnd8QAzrlr63iNMLt1YJNCg259pHxogJWgoI7eB8rvRImh+aETwmyD4qOZFI3TTbFvuVwhc"
-    "Q0ygvTibi7uZGc34i4yD1SjXNk9M6Z+HKZENJPML+FbWNqWpccIN4JN15RLnAwJsYxumJISn"
-    "Xeyo7B/qof3s/GW1XteIcOikxOTv4m2QiOdBX9CFvEW604SioCUDdAJ1crItoiN8rNCWBf6o"
-    "J8ZH4BS8cS8exbUfGZ7vTSvc5i3Nr9Jt1obBh4CDohFG0XTDVOV5VTgwW5Yw7tnbEX2T/fVg"
-    "z9CC481yoy76s6vfo3eaWEzSFzibV+GUxltwx2KkBj9PnJ6vX8RhHu2dIS662FrfjLarkSN7"
-    "utDcucnh0oUx+nGNCNwt6Qm0kVfcnYcw7UBVQ9VKDCqd2e+MIMjiaF4HXRnOwJ1j+P6HwGeb"
-    "7E3NTjrvR/BkGqdw0sLO0H4EX0NA3Hn9ajpFgNMHh4isvrsZ4as13SDq++WxhbQC3j753KHU"
-    "yyG9aoJnsQoMEqdKk2OYQ8GdYU3sK/Fj+ApjkF0jHEg3pmVxa8T9B4/dn0YQ5nuutGH9wPdu"
-    "/k2c2wfg+y586GD60cObFbRCS20He9FPPKXVmpLlGdbDWLbPVAAEpeakPlMwyr6djqticY4A"
-    "KP06nqxLK8wwfnS9VXtYjI+kX/q1D6UTzzwR4SquYpadGL0W1o/9h+5LzcxF7iqvqW5OG/AS"
-    "CIIdhj3QAAdOA4uC81dfeY8NAMQrU0i3DdCMGqN1YFlhnCuAS7YKZNkRHeUC9NwAXL0Inb2M"
-    "MbXZuiwYi87F2RqCWTNjV96hVlDBr43I+ApXxpCS1tRS6r/15tX59MT+lvTf/tIn07HHnkyb"
-    "wOrORjdAVNHeLfhbFfOtNCpOQHLQrLQUYyejr/JXTIl9P1nI4jc3ND1j+66bSrbtHxZgStKV"
-    "Y67y0nK4oeZIE2O28tIsPBfGsl+95Rk9t53KNFwl7HFXPIvn+WXgyJ95/DtO8zznIlthR3Oy"
-    "NGzWzF+gHdKYXr5k+dK0MGqNy7DlNvlMq0IFBmCOhTL1iSefx4eywqWFfpKfWLZ5raf6Z42D"
-    "FQSTydjfZIX5LIcAIzH3cMK8u/N8FR+ZAAN4gTO7HFid2OrVgNwcG6ECdjN194e2q9ajXKwE"
-    "opTgNQ0ZCVafrk60EW7dnsZx2fANOu9mE5PAS8Dbn7IfslBhrBQGbzjhN+PvsRuzHkQGgdMk"
-    "Bp5+VaziCeRnozuoRxPBKu0xXlKOp2KoAHYoGTQOPyGd79VctWEW6WAHk4w14KYsEeklwvyd"
-    "v/1drLtAcvkspzOx//NzJwovJ0vTeRVflXxl/vI9vRbpys6OPOS3jFusXO1ADy9VIIoSTR91"
-    "RrbtP/llFBe4EeZIKiyZyFbAyxoeug06d6PZs8xsopPYERLQFlqnvhFqMCXcHGQU7RE+V6rA"
-    "HUiaANyVo1O8GkaDtxp7SXOefnsyTv0z6lF/u5PHvrG92Yn+Nj4Q7mAtnlPzNo5gWtBNNUxY"
-    "36tlyl2GhhZwoF/kIwNuI2pkF/2mg3owWIQUQzm4snfwaG4SxiWcXSOAYzBOzQkEssSkYFpp"
-    "sQ56dWKSRhwolh1mScrJpswMcwwqynNikZk70Ttp51AEmgTErZOkAzAzjfhNHttlfleqChJx"
-    "Tw4dhB07CmfG0ZJha7Lz8sxChQXxVREUKEu/nU0ErWa1ZwiXwqF2xraWWlXf6Xzdis+P2jR3"
-    "d7WxjV54TO/OpH1oLQxyOYV57PUzBBFm16Rm80Wc5Le2EORxqn335EUCl/ZzyO5Wun75Yjp3"
-    "+mL6OlGrX37l3dgOPj/L2IIGDh4eTHs45mYXPGIOgTZMhTfcUczhumjfNJHof6dZUC2AWhWJ"
-    "N/xWwIsO5zEeeBaaSPAFqUBP2WzYjBO72jt9qNSeuLLX3GRkd4VbA0jm0WPGTO9rCAT6Cimk"
-    "Snc6uIY5Dz+i0HaIL/CmIOxmDYZXfFwoxIfNBD430Oo8oT6ka3c/tkL/W+DJQ56dGN9642y6"
-    "xjmHN0ZG0woa9rYWNDaYhhrRMHRwwLQaEuFWa6bDfBu+Z4sGf2Vx10GgUR2eZ4hiv+TEy7jS"
-    "sVln8QeO9af9HOTdhNnR43/m2MmndqsY/DFede6eQqhbQEtm0E4tCAo2floU1NDGbTKJG3G9"
-    "eRfBZFer0zsjs6kfge8xTIB9aDwbEdLEzxwmaIWVdhYtIkJfLfmriwOFWCdCYV4lQGk7gqI+"
-    "SvNM9vIntTkXccw33EITC+o7aH4c7y5a5VsCHT5UMiJ7ChqM7+g1fnOfeT/fwCIfLmna584B"
-    "CmgueiJLdLZlcPkVRRTaiCrObTzYnp5/krAfTx5P/cN7idVYD02upDffuJauXGGHJuXLRd3R"
-    "7Jgo4z/aTvmBNNYMjlrZkDJJUNVZeEMjbZGGrM4dmcbMivMMwVk941etsOO+HX7ZN9BC32ZT"
-    "/jKa8EnG2Bx9NA0dzaFVdmEp3laYf6oZM7Z3g3Lc2aoPlkLbRRZSP/3JI+nTn/uRdODwo2Df"
-    "o4kMdQM+eB/8CHyKH27iWyFQHlBO9jG3BMr5EzhjnPHPbigXJqIw+JXvo1/yu1jIOF8wzqg8"
-    "8sfcREGWX/Ka4DsUaBniMve3YyoLO97nD/fQq+Pbe3mtLkT6RIbbETh2PvaZ6cKvjjklwquY"
-    "D8HJOcuQTVo6pP2Yc8BJ+I6T32+Dh6+usVkGwclYXs5R5rNcF6Qu+mJXNPeRBquCdQhTxEKk"
-    "ng3mioxTv1zoKvBrGcuCts+kyeyXLtqyRcR51IV+TXQKGcRa4J0E9UjsXd1G6lU12Qoz4WR3"
-    "6Dlwbul2CgU7AFoZ9Gq29GGh6HBsD2dnChcSkR9MDUJU9dpNZN6lOrQHvHMFq3AVu3/w/4H2"
-    "cyVF5wpVeblisF4n4U629Os02tTEDkUm8GDIwGKhSqm2SU2XoCrUKeTY2FYm4uhIjqcokShi"
-    "sumxgYFE8EoYUmAiBlAmQhueCaqEpvgGB9/vKlDEK3CUSwOGTPxlepv4A7LbjGhrmTbggWC1"
-    "VYsrYfFfDJoikVnuvWIAkW77MlVRMV/2ixF5A5/s6ivLy/jMkIuPLtTopQlPwtGPzcFd7aGs"
-    "9K9BG1lzRn9GPBkYxe0QtPJWXYWcOrZGt3d0QYgSo4e52l/ucHNThWpxzTEyU+FFHOSZg5Q/"
-    "QY89mKYU1hyMEn02IWYGnIWjIp4Vxfb2dUfe0ICBd4V5tawrHYZcAHMWC504Vehb4SRvfxje"
-    "oJmJT4dWNQPWX/pHBb0XdGBa6ecO3E+TojQUzA74eRyaLe9rMLEZHNCurwr/CVe4eWLwqI4s"
-    "fHHPJRNzAlPQULhysleQiO3b4DzQErAX8NMGwECLhyCDI3MnIQfUWFjGGufy6Xivv1ONK3vK"
-    "VsNxYD/Cz1AfWqrFtMqhxVsILf0ICt2ssJ0AZfYKBOLYgJJLCLRznKE3bJR0tIB//edf4Vy5"
-    "PnBzm7hR19NffeNSGuxRAEQ7OGPYjt0IUhtx9M2N0Rv/P2lv9ttXkuX5XVIUSXETRVKk9pRy"
-    "qdw7a+vqqqnunranDA/gGQMeeMHAMPzkBfCT3wZ+mjc/+r8w4CcbMGDD8Lgw3dNLlbuWrsys"
-    "yqxclFKmdon7TkqiP5/vufEjlVXTLw6Jv3tvLCdOnDgRceJExInu9hePEEK4A3BOjd4o1sbX"
-    "OWE3wXLjWU4qY6qBO/SixVPQ6gWrQTuTyDhpR7FT/vQB1pqCEuFGkcd9L75CKwr9TOSEr5mp"
-    "8HoVDa56uMKB7Akb6UfQoHnyTe2ZwrOwaPLQz/ykcWmsbGdPSW99W6e2CvcTHnFXo8sySzfm"
-    "ifu8++qWhy0Ou8++2OR6nufd66+wHw0zFLNoRtli1M1zofEkGrObtziNxxKahk0dRLdY9lnh"
-    "WD5jOZqp0e4ilve/4BT3l5taAnepdYwJLv0vnfh9tm3ssWQLATIoOxjYHv3b2trpPmCvkRbJ"
-    "//jtS/A8B0no+0oQPWIZd654+f2u++DOE05Vdt2/992XuqXznHhcY2P/+48R4B52r79+hb1a"
-    "c93t24/gBfpRhMDn2FSyEhRgnVAoqHtVzgzC1VkE5pwIZOVrg6X8aa2ug88vfnGbuyKPupdf"
-    "04bSULd46SrCDZpD61Ii87/1NwDH33aS2vSTYL6NQ5tSC25bzHsYQt7wjwh5mp5Xvh0AneDY"
-    "r1xEg6XpEgWgCSYQh2gBDw+GORi1Tj096n5x+xOWEbe6t99+hOByBRpxCTd72mYYO9xwPY7G"
-    "8dLVS+GdDJbU2b/684+6x1z8PQlesCE6N/uCo26eiYpLg6dZHr94gTET+qvhl2ZaYl9BMFZz"
-    "tcXyvn97CAb2BavYh7Tsvqsc0Cipz2n6oW3q9A5t5L/7z/+0+/6f/BAt8SyTTLbtAE9+R+IB"
-    "B+lQlDhiPNXZjz6HeOmjpGt5Vp9XhIL2IE9A+sHQlg8aQTSNBAhDV99GrTHQ5FVXRq/xVkFJ"
-    "11YorBbj+Kcz3DoPTNJEALOeeA+uEFJZwL4rMIirgKPLRff4WxbLYfxaFVNIo69kXJcvhNlw"
-    "NJ38o3MZNu2WvMR3GHoNUS+W6HkvoyggOVYAJGmK5/qxCLiORSUngQe41rigfAMPIBQ6+VVL"
-    "5uS3ldu8LAuxpEbyCwJ2UAaenVtC8EA9TeMYUUiBldIACBN5CXaWNeCpKYUdjPVBsMULl6Mx"
-    "yOZEkA+BQV54OorHxsIllvQWgrDeakae9ur5qhCInNkJSJnMhxFB1sHczdTzbJ4sMwtocchH"
-    "4tv1EZGKMg5Hxc8vhjk8TSPh3aO1dOlScJLoRrdsZqG6WSKbv1n5Z76QkmwlrnHx+x3XR/wd"
-    "/2OPQTIAVPmOwxpcoegGcVOaagBpHqblnx2OzviNpvkOwn2AHsQz3DRZDjSozyR5AsGng7qX"
-    "0yoglJ0ZmV8aEGhS3h2ozp6bC+3zzaDk8q6Ucx+Um6MVkk0yjmbEhKVa12ZLbSo3nQOFWkwJ"
-    "aTqZ9IglAwVmB3cbjntbfMrMJXwQB8DypFrFUQQ0ZyvymjA9qt/imW81OEyNIExEG0FjsP6e"
-    "I8wNsczo7FTnoF6CuI1fPKhpNAJqlDQf4VKnPJWOwXwIE19ddVp5ZXZSg5ttoflLdRs0i4xE"
-    "siLIA+2H9Kk6qbrw27IAPmXxqXOZUEOTOnnZP8PMPtd3+ELa5oSp1mB716U2BAbKqZkCcXJD"
-    "vHuvciQfIcH9Pm7KXmJm7D2MzxAAX315ibq3NodZFlpgKZE799D0HXAsXSOJM4toFtmQramB"
-    "/WfbDEw3KY+bove6b705Fa0XpadveMZeEjZoL7MPiIHG2aEnEOcw46DV9mkMqyJl9mYZJrsN"
-    "NkRvseT5nIHGS3/T2lI02qF0EyN4QeFBvrA8cCw40y54Ncx9W6Gv7d9veFONqmY3XLLWTpR+"
-    "3n2oNlNn3c8iaNFTwHcuI6u57PsqfEuIqI4ydW69ka8dq3uwJrk8Wb7YZlkcX/hFo65YPd/k"
-    "FCl92XP2sq1uH3Y3bz9BwDhEaD/bXbpxiZN7GO5kWc3lH28j2Ob0pxczf0i8y1pOZ3LqdgVx"
-    "usIdkvLidazKO8Hd2lSgdIZffJ8lVWggz8kKzuhtyy9dnu8uICzb7rxyZpjN0bYlhSzJphmM"
-    "b3/zRnfl8lkED/iAZbADhKDPPn/SfXj/Tre0PtpdA8YRuDpwPB9mBs8gvsxVL2uYO5hkkzbo"
-    "o22mT2BFQ8OoiyxBnmKwP3OWy5xX9rtPuQ1gzn2y8N5fI4Cr6bsCveRT+9hqU5bHNg5tw8v2"
-    "R9UnpXJTU/WTYOrW4d46TgISyg35ae9+wiOOy2rL1ZJ50EBTQ7b1p5qO8UJtbhVZXlW4etgt"
-    "oGH7+ef3ur/EmOt3Xr3Ufe+9l7FR9o3wzDjaySPqYmKM5VXGPrWfHnZxYvh379/sPn70OCYt"
-    "xhiXaHbdLNrHCbSpYwjVCxxGmEbwXGUi82QZjQltbxNhyeXqTCjAVYFKHpggsRbt5WtxlKUn"
-    "0Eb/luX377wy2/2X/8U/7r7x1juMc1PdCnvi1II6DqtZtVw624hCgYcJFFIyseS7+shqG9JX"
-    "oaUmJwg7lE36KUBZJyVANJ6qtidzGVZCK7gxTto/yW+aKDFfeVDhyLzk7aoX+1TBi0uNz4Zb"
-    "f+Jhf2uY39FOGpnBTUFFYcbKHmaCY69k+zRNeB18xDMwyDd+4IAHMU1PQmBJi+BOuyQowo8e"
-    "x5o2cRDHGusU2NQi2sm+iKd4hcSDH2WzoGue/J2iD/UZ+NSfKMRJCLyJXi95gqSVl44FKGcm"
-    "MdpJYpchCgixhC6y/Cq0ZLCikkRyDG2IRW1LJ8YznX8SVSb1RISDrcyhvSIJqN0eNSXJQ8BC"
-    "P1EwKyN3n0HUU+SvACej+UzHG5xEtRhDHMwjjJNKhciEZQlS6L2kaXorSWflJlMGUwcMgMVf"
-    "gv//ceIS/E/ASTkBWhV8DP1EkUnDV8jgT9HQb70jcUPvBicQjNNA9S/xCZhKaPwSKo+/Behe"
-    "uDAuJHBJOKgSVz44RYdifjRTaF37I2RghZ7hU8xmMWa3zYDipttDBh87ZzeUO0CoGVNDJhwZ"
-    "uBobeSNYWbgSjsXFsjhDDo+DkQUw3xIungXvUAR/O6E6mZeBI/tzqrEFprhRpwoNg2UJcD2y"
-    "4dIfSXMH5me0BDuGajDQBY0ElAArOw4bjeWTBnQwDNjCbrzCR2ifbt82De7C9c8Owie6oKQB"
-    "9W4/nVh1dKYt6ve/SUfexJNm2agLvVzaG2ZZwmUE0Kfzsu6kj3gULYzuNRpq2bRz5NLDwghL"
-    "gXTY6CPJiZmyqve1qlPTTT9j6XTmTPcylw7bIU2h+drD9IBLdtLDpcuvVjAQu8fyIcttsywt"
-    "TbOPyPZ2CsHYtuM+EutqjL1F7hXiUBz4ezpzs7u3fKfbhv4/+var3fUbC6Hl06fjXI/CvkxO"
-    "uG1zirUCYQsAAEAASURBVO4JFslXEcTUJkuNDJxSJbQAV3zlB0ug4GA7ttzVIZMn7/JyZo3k"
-    "Je41AGpug0M50MwlWzVME560ROjcwDyM17tc5A49jTtqkFbBWy29TsFKXOr0WvUjp9E61qCA"
-    "KEU+DijuDRIfGAh+xxQAZmMmEOjn0fqcX1zuVn/zBXtvhrpl7u1zFW/uPHclTj9GSBzq3udE"
-    "mkaa33z3UjdDO9tmWe37mL6YYTlvhoMADsIaKr1xfYmtD2hhKacnZR+jcau252AxTPnkBwe3"
-    "nudoWxNMbl7m7kFpGL6lnjQ94iEItS/NnWWpUgHNk6H7u4iZCFIv3zjHwQP2EOKvdlr7Si6d"
-    "Ok4pFNy/v9J9cO9e9yZaOK/McVlfnvnD772F4dQFhCmMBTNJWn/8sPvVnYPuvWde7Nt1f/iD"
-    "SxxyuACPscpBuM6+RJq2tlR9mPxPbacdEamaBi/wW7iAN9LU0iCoM444WMqLTWsgr2iawW9d"
-    "Dab2KeNckszmcE6wPnn0kMnIFhp5hEMgr7H0u4BmcwFN/M8/u9dtLT/GYv0CwvlidwaB3GUg"
-    "xyltIy4soulW886/Myzddj896j5+yB5ghGovfV7DnMPWNrbtEI4O9svS/UMmK94hOMsSrXXS"
-    "ThkqiFi3Wsu3qPr7zI0D1OuHmNL4Z3/yje4HP/xO7E5usVSvUW+SsFau1hK60M827ZJjr31W"
-    "HTaAxry3tiIdQjvoK80jYFGvjd9tN/qnPaW8vltPRNIpeNBP2Dse+aSsyY9w+1dde4pDc2nF"
-    "4Gt9D/rG1KHjSJ8HeOsM14FK4ssA+pmneBWPVJxE9IdPaSiyFY4fcJPOAsgQgs974YU+JXGV"
-    "BRo00w7KyiiX9K3sfXIe4HycV/iOvJKO9OKR8pon38JMmfBHQjE5zkDfIahElPAuxUhMxEky"
-    "cHSSyEY0elWYyxmpaBk7gCtMWH3UPhwhLYjTQcK0GnSrfUTzvNPoqDwJb4W84IIXxMY/6kLx"
-    "IO9UHPHNxIE7xaBAamKEn6LU6DmoLOFGyrXSrQz+JV/SWYZB3iS2QehkPonbJPx4/n0/jY59"
-    "nBCed7IY0OPvS34cJoVJLRFJbIUJQ1z8Jw0GjjgnvuKdSjaeUU+EBj1+DKdp9WWrRpAMiG0j"
-    "lBbSRu2NVRsBFLWyzAXFeVIHDKpjXBg8P69BPjpell+ImT1NWvF26dUN4zrTReAF5jCDRN1l"
-    "RwkD2wYAXHhiSAFPpHtELbf7IKzqCOg04tCBOKewUaRASNJ0MMMsQTu7SlIiOWMTvkTIgA0f"
-    "WzadPC57GOZAJQ8NMciqGS3+h88or4JWZlfwuflKNzuSVh8Kc2noQCrBTLUxdCKtQqVaD2ml"
-    "n05+ymb2wIpXYPkm3mQQfEzrpljdsntiiO9eMnE9rEIlTPxDD/JwpryBJmWKzldNiEYSn7Gk"
-    "9IwBcWtLGiAkUMZR9p2pCbZHi/kLBtYcs+fIuBdoT4GzM+sbaFCWEIy062SW29nXUHsnhjG4"
-    "qS2nRU6KffLF4yDvrPwyF/qubmihHwEDgWxuCSHbwcq9LwiAd1h6WmaJRl5R0xXTB8BO22OA"
-    "dfkxdLZ00EJ3PEN2VisflEZG4Uvnt52dM2z0pwgbHlTxvjxMRKBtmUPzMs4eoxtXL2Ixfjmn"
-    "7RSWdlmO2WUfkfk46EWbBV2i2udbWmXpIPxj/bsB2uglvO+TfnnFe1nH0Jhz9c+1+e4fci/f"
-    "Tz+81V3kEt73H2LgEmOjN9lI/oQrcW492O7+wbe77iqX5s7Mn+uuv4I2n6VrL/3VLJya10WW"
-    "F8+As1rHR2i4FJrVyExraDKHOGh78Kp2qKy7Wr6oNqswJL6WTR4DBHFqr5rCgn2HJza17n+G"
-    "div/D6Ol8kSne+OOEB6dtCiwzrAncpFTb+fY+D7DRHp+Ts3g8+4Sgp/XkSnMXbi2FE3mKCfv"
-    "Vu/voD2b7P7H//7fjaZaIf88S24eQJpG82x9tPbf2k5ffaGp9Wgvln4pDC2hq63bD1pHxq+0"
-    "9kO22xIY7Ft06auSlvDUWdECJT0Oo8YPnneffHi3+9UHnxO60S1OgRMTtK9Yjn0Hjd4Pvv8m"
-    "AikCEvt05EuvnXKUlqYKVfKF/OUeNw9DLX10s/v1J/dyCncPXMbsv+Bh91PGMWl38YedrGi7"
-    "uVia+rOupaPaZnlO4WqfCZw8qx041nO6//qffqt799vvdqdop6uYjLcdKVS18qP/SjuwXyqa"
-    "VXbVL1Gn8i48ULQqYcuxN2Me9LGteABNl/Gt9zNNBDAyakKHZilKa0R64ld+9v2VTwQP0pdi"
-    "hvKLGf8HjkSldba/VbguLabA2upT1Z/peqGFxOKlE5Q8MQBKXk2wShkJSV0TU5wH6UiTMRs/"
-    "n9IippnyTT3SFoqepm/5OCC0MtjewcE/YVng3oWuvicPYcFv/AnPeD5BEkgKWPnqUxoAImZn"
-    "BQSQBQ1sBsE888M7T5GmMv1XQpbe+FOgwGmwAdkqydIU4hWlOtYqTGYoJG1EaiVPjkHLN+KK"
-    "Lj8StIQ2cSliGNYqDJLn3QoQ32PhpMUpvAqckrxEF3/zEKbQzLN/+PmCC+QWg+hEsFeLE47/"
-    "/TZhJS5m6UFXxN/7KxriYOoG0yqrUzYIocGNsORxDEL4wSNBlsMyEc0fnYxCWmEFRtJXGjEM"
-    "I+UliWzDOOIKh7QpIrRWAJA1/BthdJhhE4kdaPIOzABJtRQJ+DYxAB0YVbVnEBC8KJkDtAua"
-    "9RE/gvCDKWQp6segNmMQH6910Fd/4w4zaAutltdKC+UyoIKbkwXxM72UlffEv+jlNwMnQoLl"
-    "fZ49OIYpOJk33snBMvoOnKTllXA7YeEEch83eBNXY4PiLl9HuwadInChyCtYRUfhy7uASlxz"
-    "mWCg6mbREiIICF9NlhotT7dY3qfEty7TFiCelpwVlmam0d54QokZ9h6Cpld9eFEwUmQGD/dw"
-    "uDT27Bmbj4GrNmaHvSEP2CsyzTLHeZb3Li7No8E6Gw2eJgCgDgO0+0gOOHXIoQc2nHskP6cn"
-    "oSVdQWji5vW//M0tBnEMj85hlXv+NFbM17vbn3GgBfXLOBbkh1k6rD5BAananvRXM+pgLB8U"
-    "baQJS/hoS1Uyu7wcgrsRHzra19RgQnzy1bwEvRF7wtYwjHqx++Z33wFvhC5UKofwwCe//YwN"
-    "zh+zfMOdkwikdTrOLQQuRTjw1Kkt+TS20UDCjtm+QTqpOYpm4zmbaBkctRe3w/Ks16BMcWnw"
-    "m29dRage677EIvzVsxpyXe+e3UFrwn6l6xcmOJG5jHX2u91LCD7eaDBz/gwaI+5bRPvrhPMp"
-    "p9jUwK1waGB9XRMpwyy5cfqQPXDWpTwCKt1TBqt2HZB85UqCbOnJNfGSH6TnIWF7e+BO2S2D"
-    "6aOtPORiY4UJBK5plHjuCVvn0MhZNut/i6WyCWw1jZknAuDieU4UXp7LIaG5+dkcYpBeB2gL"
-    "h56NdpuYbLiGAdL5y29gksNL2Otw0whCtcK8Kx3p08nfgUgtU9qGjRp8nMj5Xa0YeoN3ClM/"
-    "RiHcesdRhLRheMa2Un/x7OMopPtNX9ALGqMINhqX1o7YRe6V/MlPPwcQkg9x1DT+B394uXvn"
-    "nes5LDXDEusp6KztPa/28cRy+gfqXqFq/jwaUJ6e3lPw9zaF33zOvjr+zTABUlmokV/3/62z"
-    "H3GcZUj3+lkIeVdNr3d7WnIt5mt6ZZzvW1wV9b03prof/vDPOCjyOjRyszuw0H7VeFh9rn0W"
-    "FAu9ABHahH7pf4qu1r00S38U/i1eCO34kZb+o/hOlRMvftYDE08pXfUjHU1LwyON8Ixn/20V"
-    "mUk72Zyv8gxsgRhX3NtEKDDxyzhvAmOSp0//1/Sp8DatnhnL+zJYYeIsLhXOO2Hx8/ekv/FE"
-    "H16wTIkHv/QAEuh4U3XLp/nxv2AZXHTIL+8J5FcXjeAgokkLH3FtJzITjx82ufPb0ucJkQ3l"
-    "nWQhRj5F8ndcaSUKqxJmTBiYgRsgQcg4KUwi1+BM8RK3/AGOtBwm9LUnnDgUQCrCQlvZFtg/"
-    "Mho0MHHr82jEj/0tvFMOn0HMiL6HtZIm3/GtyjJ+NHbx4yv58CFOlW38whxW2glXDFE4F+4t"
-    "XzsDEuMK3ovpToAY4FR+pnEGA75oFIXv5vISRiWyf83JDoVvEOXdxnZMd+MJrzpb8bcOgnP8"
-    "CZJG/I8WBnzFNX8RsmzYJgdGteFshE1d4Ze8AsJ6IQ5/uU8Q2OalJkr/dBjmzSCm1qqcYrqu"
-    "T2d6GudRj38rl+kLHwcaGy9CkjCMbxIgOJjwCmzrUUEE2HS24RX7Cjt64ltG4UZTBwz5Rf+W"
-    "h7yoIGi/wVK7clRcBqs+rh4KVw5epovwaMcuAknvC6jZcbF0xG9owRAJbvhLT1m7L4I0cbZq"
-    "HxlcSKFdHN06y2tqr6wDN+4K2aK74qPgBWiaECfk0G6ko7TuAFSTVa23e7KP61PIe5ZNuKNj"
-    "bvxVoFFo8A8hAbX/FFd7nEMDo6VwhQkHEpFsT2fUQ9DFfSbS7uLiFiYgNpj9V90ODRm/6z69"
-    "yX4cjGleWF+MXaQDDECewZo4KA467dSBeFNzCo7SXHpaFoWtEr6K7yyxm3rV7mQQhla8ZCas"
-    "9mYEEwb7LKW4HPeD77/S/eDP/ihXrmic+O7dr6JFc8OxSqsNluecFFpv8uXIM/ZAYfNNu1Ma"
-    "TlaTQdCAF9yQLsHl49Q1+KqRGEIIkQefkadauyk2tb/xhoc4nrLpnBsG2JuThCy5qZC8wF2E"
-    "G2t73Scb97sb37jQLaEldFKwxrLpDnvGttGerGIzTC3TNALbAgO+9qVy2IL6qcFUvrT2Cz/f"
-    "IzzhJb38Cy/Ev+/0CbO9qKHwbsTsZcRvGuEnxl8Z7N987UL3xlvX0Thx3RJ1OzOLMWc20rv0"
-    "tIBxZq/IcoL37DknshDKtJMG13Bw4RKb2M93k+zVHHG3Ps5bQGynako9uJFZvijjp+ZbHvYn"
-    "fSg0tR6H+jZlOgXc0FteSAOp9pUyKKRRdy84k/Cv2pf8IV/QN0CDITbpe3J1hv1wV9lz+Kd/"
-    "+nL38f/8GLMLG917ixOx8D4Orb1Gh4aV/Xu0NvaPcYKDTetBB3i0bsQyjHHPYMbh4tPuCsvO"
-    "D+CtJU7LnqP+LUtN7LRJ5goNe4G5ZmofIXZnpyYOtlMnQDRk6mEc2hx1n3Iv4T/ngvP3/vBd"
-    "zBtdoW6pH67k0eSDdFOb5t2U9q9FGworeSxbkKu8M/CHphK3XMiXV2kijXTG50H68vHJ29fS"
-    "Gia/JX4fbkLTGtfk5tlwoYYCP32aAInQ+NT49LAqqeJ8hxkFnb88gCV/ysuVR6EYLInQBCLb"
-    "fvIvUHJH3IAeAE1fbx468a23Atjexec4YIBrJgAtjuUU3gAnESmY5qd/4BMve8cTZJpy2MHq"
-    "X3003z7w5GMQ76Sn76RpYS15cPbDlzwtiB8JOfanwduxnoxqk5UTqlgmaemIxWsJA/jjjoUg"
-    "/cvP+JVX/33ykUgAEeQgQYugp042kQvad3uvagw6iSeIhnl7N1kNBhWFcKVks+wTpkMxGvEa"
-    "3Xpw/aOVs/mauOVD2WAnG5qM76Asvi+6/tv8wK/lYakAlF8Z5nedsI1DKA9jNJwrrnQVpIG+"
-    "6Juf+s6nQlbzN2/rFs1DcFZbxHdP9zCmUXW9n8+WZ+XTB5Gf/iXjgyXxwgd99mIrSiJdmiq+"
-    "s0mSNox3OIyGYDrhlNDnIO+76fhhsAhOTDYjQDCQx1EGzSRIG7W1ptcSuIKNwpDaMV2ERWHz"
-    "GQEh84Dibv0qDgMOMAp/YJG/A8AR2iNRULDK4J34VeaQmDie4lMzdH+Zo/h9ns6L3auq9uk5"
-    "A7qaJOE4GGtjZ2vYi4bdgwPtqBfLsekpJJ6IccRTa+IAyMlDZtzS6TT4xWgqmjMp4HFmhbCc"
-    "LGRPj8eavSj74NANvZi3YDZ/8cJO93dfsFmbwXQbIUO+mIQ/v8R21tznt9EGoLVCk2FcjYla"
-    "fu2ZeexbYUDBTq2De2igZPCTkJlLxWRE2asxzA5YQU9652i08YEVIZf07pu68eb57o/+4Xe7"
-    "85evYFLiVvfj//NnaC1+i32rc+D+tPuSDcQjI16dpfFVbsBkH47ugBNmCniUuhtiEPWkcm16"
-    "Z08nUcI7xHcQ7bgFQlqLv9/e5Th0CnMx/JviWP8bb1yOpujTm08w10B5EUhdknRQGR85QKO3"
-    "3107vMBS3Cx1iIkbDJU+QbDyKhVpvsjSrPar3NvkUoo0dXnPzefiZP8hpjXY0GtSv04ixhyk"
-    "aGdqUKSV2pjsOZHPhMJTF94jfId9X6fQ7rz5+rXuW99/m+uPPLTE5dJceK2w5LF2t4qYnwKv"
-    "y5IKXRuYGzh8utOdY0n4wkvX0Vx55ywbrwCviR/zdnO09wHaJyZz+N19r9JRD2k1cD1+ErXC"
-    "Ccv/EmiN73aACMVqLgPQ1CnV1771h9TQIdoXGrla9tGxuuvwrT94rfsXaOIe3XsAnvB09gKy"
-    "b3HsbLesGQvMyszOYFuRMjgxEn8FCdtVvkHMU8l+q918750rRH3affHFaverr7h+i1O959Ee"
-    "a6ZDbaLXWXn3p7gbT3hqDzXgfW56qPtv/5Pvd6+98xZ7HeFPBC+3KZyhraR/gdUsof1P9V98"
-    "4JF69GlBcfaHljVty3IHZwhYiY1BGHB62vdskLTtZxC1eQyex2mFX71h+dlnpi8GbgljhuOI"
-    "B+q/66xy8TAkP8dRWvmOcQykREx5+zTBIQWQV1qZCBS3+BfMwDHC1/wr9MVfk7X8UwDh8s/+"
-    "WRey8TwJvwLyW699pIafTzctvOB+B0AL7TNqn3lKIIA2oSFjqwEt7gnYee39B++mZfAVTFwP"
-    "L0JJPKhKI+OfpIP0ePLeCm1UO4xyRtaDv2TUe+fRx4l/H+9rkcTIimkgClCG15OA8G6wjmMa"
-    "t9A4zryFlvQNCIL6lMnn+KuBb2zZUupPCj6ztyzlltKFZ0v1wtOkuHq03MrPRhAJfUCv8s+v"
-    "uBGelIRL7hRTIZEGfJJUQjXMPFoOvg+0hgbSKalYSYxCpk8k7gTzM6hfICUKPwo9iJABLuWb"
-    "YGaa1I244EpjZgJxS0bVASYY/iD/UIofO3xzUAslDAcLv32PsIogaP4pP52mTzUT5UfanvfM"
-    "1zTCdhmxbcS3M6wopBB/BtRo5+hPB2mDYtUbv0JKWJb7gGm8bFonpKUxL5fCEMsiLL3CRvFD"
-    "zCiI3w7LfreWOeLPspadq8uP7ol0mUuBRY2KV5VM09ErSKU8R24ur2tNhO0griCRU5QRxBQA"
-    "FSJc/sC4JHGzTwSVxdaWtmW8T407A9fc0+NpY2z9nEdQ4Z97VrzfsGnP0G8xWGkZ34vCXZpi"
-    "mZNuV2O0oIqgoEFXr+9xAOIUKji69CRcT9Rp8sNN9Do1bLbx6tCt+9J0WWaFnJrdo0/hBKWn"
-    "S0G/++rmre6v/vXPuj//Nx9xBH+se/iYy8IREj32Ly4aqnWQhNqU2cuwhaVmi3pAOJgm3GU7"
-    "T9JKK+ki3esUn/xUfOKtBeLr8fkpNFbejDGFxfS337oB3uPd+x9/wr42Lulm301OW7OP6a13"
-    "FzmdO4+As8sl2suYC3CfnPmxR+vKQpboFIzN7wDN4ypaEuvBU2oK0grV8o/CaQR637NEBc+C"
-    "fwQsEFagN55tLfvv2PzfNDsK7N5p+a0f/RGHHm50Z7ljchStyhgaPOtLe3cjlH2cPVfubVSw"
-    "Gh52H5p7kjxFPoVANoNFcU4SshwcG0QsJSsgFE1tYU44oF3e9PbNiVjhpbd0NT5Z4vjJt6/V"
-    "JmwLrT3UUmdNSCqabbjSFRyT6UEaeMON2eE76lfhzhPQGkeeW5jrrr50IVladyurnC7kKiO1"
-    "mR7OyWSAtGlXANZkhdrcdCBAHxvlejjsUe3vYzmfk7kTLPO9zanaCd4/dsmQScs2mmQzsH85"
-    "g5rZduw2CpfmP3283f3Zm/PdP/jhe5wyvcGBlhlgUS7+Zb8ceXgzSrZNZOIlz0sHy4prz/7F"
-    "+jKw2gdPBcMWh2eRqOhZABqdTjxbwIln0V0+FLwAqy5rjic+LR8wsEpbnidgvPDahxekF0IK"
-    "f7wqLzG2boN5n3fhap5ma5/bZIU+WuK197RZofQ42paE6XeDi8fAZbLiF1m2ZU1XBHQZa5Jv"
-    "FeD3pU/E9mM0/twmnJf4pyz8xMsY5lUFzIfI9X6VTsLXX4tbMSr2yd8qZMGstLKEw4b54S8c"
-    "HvVt54WLv0/+DJRy/eDqu3CCH97tWQQPICHgxJ+YLZ3f5VXPDMHGK0Lqaba6PPq4hXMgESO5"
-    "gUJfYeIR3FqqxCay+fLoswxEhRVhJ5OGS5/hCzAKVuFSODmQZCkgBQCH1kkZtXfFcwUvFCIL"
-    "OxqFlN/HFMGvzz6MJ3b8z03sCfTTCA1XXvvPxMunHsYQT2miI34cfpnlFC2Stg9LlfaxjG92"
-    "TZgSl0CVJi0+784Y67tobizht5mGiUyb/Tm8p2FkEK7OLcIU8e3ojCtN+pySN1GTXpplj5hx"
-    "/Ee8nJi1wUlT/Ft9VF36LVyW/sBQgU7BwU3GcUlTuBpeWhjLix/ALKZ5N+pJh+TXh3ns3bFy"
-    "hqUMT2a6D8RlrmEErNKyFD7ilTLxtHNW64GYkk5+lAF+Gu3KHssXDsDagzKf82hLRtgnNumy"
-    "0JTG/dxn5QnfsvHlAOTgrl0stVmW8TEDhOVXKHKfyBXsDj1BG3KawdSB21o6yyzevUmTmEnw"
-    "9PBhBBiFGLWaVd+W3UFzip3IC+AxzX6jzfX97uGDVSAgKLBB3zLpxNU8dQoW0cIg1FjebJYn"
-    "4gYGTQ/Za/a//S//B6mHue5FQ8juTXPwlDY1+OeEIAOmAlaaEbHlhFjQ3sDYLOWV5hMTbAKn"
-    "HDUxqXr33bHWQwhqe2oDN1os1h5reRfhGxtWM1g5f/e9y9TZqe7Hf32b/XRdd+nK5e7qjWss"
-    "JWJklP1ud27dxz7YKmV8xnIge63YTK2ZBQVNecc6Xl3VgCKGO7nmRbtrdjvmE0bkVx6S/58i"
-    "/O6wN8y+ztIY4ymF00iv7aH4TC0qAhralBmEq3ffeaW78epLXGuDnS60UGcmZhCsdsmPDddo"
-    "HWsZFaEdEycKHYdjaEoRTt3EroFey3+EQHuA0C3Pi5N2ETOJAyerrrUPXv0iRmlxCUh4/VQb"
-    "Mzw8QZl893+92kbkGcMLTgpoIXHFT+SfsPITB21F6SluCumaFDqNJmsCMxMKWxqrtK57JkCL"
-    "NIVJEQwuo40dgmG8zgmWJi17F/k2O+vKSck1LuB+/bUn3cOH97uzbPAfp36sI/dcfcEevHGN"
-    "jTHx2OKU9R4TFe8sdALyJSdF/9mfXueC8O9kGXYYw6+H2ENTUI4QB95epi6P1cA+QK8KlhJV"
-    "QdNPF1LVB/Ie4YBn6luMfTclhJOGzSV88H3s38IHz76eKm1P/xad9E25YZ+ZzBJmfRYODY7e"
-    "8fN5op4ML/wMJ1bSU2dUfKtz4zSXOBnP+75bhuC/PKBr5ZJ28k5bTs6kGD5IvIraQJoq44h8"
-    "UHCO8a9yV9STNA3SJ+AYpkt8O3LIYZfT/gexCCLxEnmRtbFWQjuWFElAEgL/aAb4jrYgxMG/"
-    "z8g4FQsvGnSg9GF5p0IaAc3H2IPTexJQuMLoCx1cWhrztkKFR5yBxBnAEsecDRZ74PBeeVGe"
-    "E3ATJ4xReWXJhloRTEEoGCX9NUqYCmfevfNNuMXc1REYHjiWgT/xVSgb4JF8T+Bq7BP0FnQx"
-    "bT+TYmDTyTAu2dB2j3HokQVa8EjE/sd8TRM6gkdokryJkG9oYpnB14FKFwFEfAxPemltSO9H"
-    "3Ag1fRktq9/mT5LAKuGBdElWtEg+fItu8FLQ6Z3fCh7icdKJi2Gm8hntk3nR8zngqm1ofCh8"
-    "YSicmEkGP95ddhE/NR/GVfAwG+vL/IwfocxE+JtnnUI0n8I1y2g2UGCIf8WRb6q8LnGllMBT"
-    "OBOP7Lcg3BSNtzL4mMgS8fSfuOgVA4LCJr2GRtXQVNkNQ6uABsYyK8xpEHWSTjvfxLds/I92"
-    "Qz7LEgYD8Q4DL7XTsZsnnf84pjUUVL3IehXTBafZiDuRKzqcjXO7AsYPFVQckBTkwq/gYfsL"
-    "TYC2jHDg9TvDp59xRc4auJmDR8/ZnAtuO+B4BZiTnECspbwRTphjz4FY4xm46roa75lcwLjm"
-    "+UWsyaMRec6VM1ucQlTosgwauZSmlk2Bw3Knr2Afj/R2f09R0vpwoMTAKgLSNqfadtlTtcpg"
-    "pgFML8f2FKYqiJi8AA9tZKXurKv0T+apkOzSqLzhaUwMEY+zfwZTD2oz1FJZm9btNqYKrDc1"
-    "XG4K91TkNlq+fWxLaehzZBSaI1zewA7WP+IUmfjNcfME6p7u9q3V7u5Xy90aS77uXddMwhlO"
-    "fZ5GqHFj9QZ4r7AR32tprN9zHDqYRShzP5aZVnPoeUcK4Scdqm9QmCqelc+lpRbLhSMdZfDT"
-    "1O0s9HapSqOU49gGG59EuGIJWcFcswpq5vKkzPbeasisS/dVPUOQQ1QjDrRDY+XKKlycOgt+"
-    "5BUkzM4/XPWN1f9V/yLPWyd9BHDWRWDs+Q2QuD78RJuxDBXWgvvERjVIAuCcDDjQunwqbaSt"
-    "ExWNxWoZ/zTL3LtsaB+/hqAIf8e+E3zh6Wj31LjXNXsUo21FcIQ5NJ8CGCYDZ7prN5YQyjdA"
-    "kZOB7MnT5tss+xevQDP5bgvr7S5B2xaXOaU7h0mOf/Kj17vX37zejWFD8vApNGTCczqMaDuF"
-    "1wHupzQ6or4sUu07tJ6LfqEbZXTyPqADNHcbg4krTdHA9vv3O+L3URrd4pHk/KSOpGmD4ott"
-    "0iXSSuhT2uif3Bu8PknBrb62QQmSLY94ksh0fT5VivJoeFV+hFCnxpNeDXbQ7NMKrvCtcNMJ"
-    "6SS+SfdCfD5sWMS1FMflFVrv9Awswk9KiXiLS4Of2MQbWX3yKAlqICo1sO9RU8JwmflAuCEY"
-    "RCaxg3WA05inHbAm5r3TRwa2oyGPqJLNyFNbJYHbCI9PtlgwBw3/mg0N1c+WSMOjOmcVDuzO"
-    "GmRw02TQJEyYwhcX9wQ44AnHBmLHJ16jfAcOjd8y1FU8HkP2mg2OzQb/mknpl9kDflA4MByo"
-    "6z4s86WR0tjMV+LaUB2kjZtyOhA4+Ji3NpqIZxpdwvk2PHDA1TKlPMxSDM/xVWH0cCOsQs8m"
-    "LEgHaetyySFXcxxyOkUbQs7ihZmOgfcID6Blp2o9BH8HjywpQTfoohNPG6/1LB18b/UjHa2X"
-    "hr98ELzATZwtm+m0dXXYd15yrjjagbvfwzitji2fjM8jHX1pdGpDtWVRgLCc1qECfIQl/Eyn"
-    "Gwh3ZKKfuMkrPm0yPmuZCPyA4+BgHgkHDwc1y+ImaHEKTJ4KOxqkFDFz2qM8hmvTxjDTu3Tn"
-    "k3ksedh87MBIInHjSnB1WaFo33CSR5uwpLDlYGM6HnaY9EPhpR6Sy4xuhB3nTLeDfmkkSlgT"
-    "rh29dQ3IlE+hIoIX+660W6WmrAYqIvSdnti630O+dsbtLFoM3BfiIDnOHYFDGMVUM/IIA4az"
-    "nDTzpNqZSa6f2R/pthBIjxgQxsa5kxDthfiqNXHA0obUyOiz7hcffNldebLAQLLT3V/l6D90"
-    "cIb+jDqYZeA+h0Dg7QlPsRi/sYYmiBn9e995mX3EY90XXECsBY9r2HxSS3AajcgebXX53lr3"
-    "APtCDsb2N5ZajZhtX2v/bh4/g7Cj9XXrWdMtWnwMLyBIaIBxEo2ampjPbyKkrLJxHEHVi7TP"
-    "4j/OEptLqtlrBZ62S3lDOptn+JWK8rokPml39GsMgA6okwzG0oEW253iPlP7DTemj1HmdpWS"
-    "NrfEa5PTkkdH3g4BLpiJePX1i9AaPjwY6u5/udI9uLeCELcHfUZikNVN9V70rJZvDcO9niT0"
-    "OpoxhN8lbxjAhENG07AsfTH4wKZpH8XX8mwNeqOUUV6zH7F+D9DEaQg2ZjFoz2oh7R+1bj9E"
-    "nXnKbwjTHrtoKENJeK3GDnkHH7VltE2Xm+3zzM9N14ZpiFS8wn8Ew3X8mYio+eGdp/9smy65"
-    "6BNfOwZDJDTOtibs/KUtG6tctRe+iep7YPVxqcS0WfsQIVc/4GBndOLaVVMg09mXJU+W9w+Z"
-    "ePiusVjzlgeCV3zt52qMs480nvXtu/67u+t870er5/66h4/ZP4dQXmYuytSLByo8Jeg+r83d"
-    "re71l+e7b7/3NrbBriOQUjfatHIpj/YNB5IHZQM/e2nrzjLGQf9Qgh/7evvJil50NU5oxnMI"
-    "+lY5elrkIS0KvvF66ofufkunyqv6PeFV/KoLaVftQt6v+tIumyfmBG//qtUB4zToVQf0MdYJ"
-    "nqEdtIjQaDrQcRwJWibqnekKP2kgdB1wg2d9F78AQCbFf+DI37LojG+dGt74q8GIooh4mfCK"
-    "XGCYVrlC/uLHspDePsgoiSss6sX0QY2nMHX2I9LQvEqxUPmObHHBbYQjGMfIbtg8PKADofBm"
-    "LEF0o6i8D7mvSUIp2HiZq1ffOKiaOZ50LMyWILyWvC1nE7AURjwSHaGGzlRJNwIVcXr8Muib"
-    "TwlMNgorF8RNi7/E8j0NTeA434OnFNCvLyAI9XjjmSAKTVqQDNFahZWfkBIteaQ1kibw+JE2"
-    "w8Cz04zK1krQn7yrQsgDomqQ02+l+nyHfr4aDjwbsAOGFWQcHIdFEpQK118/8fUdWLa0qjBw"
-    "7yvOyrMzd4Oxic3TelPzZ1a5CkApAKegaZg0Ek7h7CCpsMSgQYHKgjs0Pt3P9MBNWo9Y74Hr"
-    "ng7rWPoVPiWYUc/UdfDEP/VjGft8TBsG59tmxxd1QDw0HSJqujEGoMa4wjataeQpa6Qxq+8W"
-    "VpwjfAAI8H24fn0a88TfCUDjFRtpwvUzEc7v+PFsLgI94cG2h9fitTpoAr5ppKuCqkJYGiSg"
-    "FeRzygo/w83PNOJSsKRDlcsimVZnOFFTL8KqMvZxrWQcpAkMn/WuaQXvTZTmHAVHk6UQpuAg"
-    "vgL06Z90RfbgFKL3eT1F8OGUGEscCiZqgRQunW0jYsUo5zmWtp4tM9Bjg2mSfSE7bMoODPA0"
-    "rsKKnclDLnf27xi/ov8og/bi3AQaKWwtydRA/v4fv9Vdx7jp+IR7mCa666/vYfX7M5ZkziKU"
-    "Pevu3eUCXgSrFQYq922d4/Sc2pXT7G05e3QmV8FYlizn0FLEx7rVDw7t6eugyJVMWI3XeOco"
-    "piDc1L/9mDvJbL/sifGE1hCSnYOk/YW8Zh25T8gL4K0H6Q/kaAvdoLy1faab5ZTd83n3t7n3"
-    "jAknNLc9WefuVbO+XdabwgK4dxaqXVxnE/MWBnhnOJ3mkpo473J36+rqOmVj0ucSI3/NMvse"
-    "m+A3qKMNNIjyyzT7uTT0ariaFzVR5pO9J+BnHAe38Bf+WSqmjdhXaUyXGPTXT9E0blJnu1x+"
-    "fI7lXDa9w3bCsQ/2frZ19h9ZHje2uyyomQn7KIVp+0PDWh0XZWyN1aqlv19EohYgXv7qUd8E"
-    "4e1sPzF7WNLbNHHkIT7+FQjhnHB9tPj08RK3j5LY5g89Ck61J/EaZJF0Fa6ndXcMr3/lob/9"
-    "on2mNPC9yk/90mYUqpbvPYJu3MmKiYebn32FSQ7swHEYY4u6s068zkZTGO5rdAlSw8rffPel"
-    "7t1vvsktJOfpN+Ux+1toTNlruVdySAPaJDCUuwy3DxmCx0Ln8Lt4E0g6y1GuPUMJYFjugmU8"
-    "PuE9YvbRHFuFp43F1KN14/sAXg82D9oIfYZKACdsjv9OeMQBKqIBZDmbsShjingJI2gULvKm"
-    "N33I99qZ08yLNJLOY2w49EojNaLGK8EmoE8gIF5VL3oe41jwy+9E9K+9Onmz2I2/8hR//0ts"
-    "nWXn0T7j1/8USSo8NOsjJWV75+mr45ODdsPRMo7ML15KYRvDWXhdDc4wAonM3EQlVQPMOHyb"
-    "JkgCXUEEzxCvMXoECuLVIFoDgenEZuAHEwk/AzhImsa8xEPYvtsxma5UkMapvEiWdC1epN/g"
-    "a6VUA7LQCSdN6zRSmXxLNuE7UEaooTylrak0RZOeUYnnP/+3MocmvZ+4xF9cK5JewZuQavyp"
-    "Vf30LiHSsBKoLHMN2oaLq6BaxQnVS7KlyzQd9hkMe+pqRgY8W1DKqp8h1Il5+A9/XfAFqHiW"
-    "AFuDhHGE2+hhXUjr0A0Y4lGNXf9qCKetH/6lMPw2OhseEuB3DLPeqyxhzT5d0bnoqZellAYK"
-    "Q8Kx0xT/+rMRZ/AzGi48RLj5+Gc8w59iMyl5k16Q+mlHSdx0NWkgrrNxwsyneJncGcSMf4pR"
-    "qOVnGuMNowXIu/lIB2hzKvYYKg+oxGFEYR3jIk09dWin6ezS0qtVCr8TVjR006xH5x3wxcf2"
-    "xdOeEZe04sifA6dGXMVHG0birhNOKOsnL713VQ8f8pgD/za2leyAzxHHPVkO8NLNjs8Z+BAD"
-    "uYLNWTZpP3+2g4CA8GCHBFzjeQIxG6yBKT4uCeq3izaQOVR3lk3SFxYmuouYI5jFEKmIvMOs"
-    "/dU3XuWI/HWQY6/S9jobo89lWe7WF19B71PdnS8fsdn7EcLRBEuGZxmIziY/tWoRhkDgzlf3"
-    "0fq4SV1aMTDhV/tWnLiwMR4tnEYw3TOlGQrvI33CEfgnLLUdov3dRVh08ic9J1nmkZbOUJ+P"
-    "VP0Ik1KBY9//wW8bLPktr7JvC5plqYe85Ts3IGfyRfnkNYW0EdKrGXJ/jjTMoENVuuleQUfN"
-    "uTN/hSb7HHnOduUy8jZ73jY4faYhSje3z3H4QIv7JSg56Sn6kzUktY0Uj1n/aqqlg31n+mbw"
-    "tz9QgPJKpI8+ecj+uHUENpeIGcwEAq4b62oeapIaLanadyddwNIJO/0oz+byBt/LZIYLSt5I"
-    "FN7znVA/TAVfGp4fvxtc34pnq++wPHq1NpHERopLTEESqbVt3/tEggo021X8k8qMewC0F9P5"
-    "l8iU00DxruI5QSmBSn6rgbnKl76YIu/S/25w1Y63EdxnefdXv/x19ysuQXdZ2zavUWJtlakR"
-    "3WYf2zp1ehkbcG++/mr3Gvw/yWTCvVgKyjW+2ocUfpI8hwEoU07H853xFrx14RV5076FJ6UR"
-    "+/wjYuLYJxT7SoMCnPIRy//1Q5wU2LTlVfVc8fXS+VU5iyt9B4L46rJGeutS72p3LIly4vLc"
-    "nPgAj8J8vfY8sOLl5Kurj5n0cK9lXx6XYkVjgvY66HuT89d/Cos2ng+wKu8e06+nOfEtPVMa"
-    "cCPDokcPs8e2sDbNAOgJACDZE+M4lLfGz3rKh0WBPl2fD5lhS41OsHfGK5Wlg6jCBsTtNy3b"
-    "8cN+YQyN/ETLwEAgwjV+FyIy4xEzRBtNNVTRpzN0Oz3wbNwyzkjg1yAug3hKI3iCaEiSypLB"
-    "/SoGM6P23UcuooVQxTfNxorNSMKw+BACuEdAZMXPpxUmwR0khF+zYTs8u1gLRb79H1HKEbEG"
-    "RoLjadqKayktRzoLmf9kItI1IaoGbcMbjQEtXMEITeGRtEnvExy0hi5DD+2qwheWc3ZRTIpB"
-    "3Agc+JmeH3D1IY7iJaaFq4mNlvR2OEY3fgLsyfnfokJz0wWkcawDkA28xCk6VaKAyY+Y6QLH"
-    "Z/8nHXTp6BIlmfc49DiaWaGRuGSLEwfrr7wCjwKmHzG8ELQKMvBF4MRbPBVWAoN49W3+hbfP"
-    "wWyvByMo/zKj6mGYT/EzPExbGITjX4KbAhg49nskTsJ1thpOCX/Y0dsOyIP4jTBtGTxaA/LU"
-    "PwMhr4FrhpSl0bXhqF9s79g+6Xy9iDf1ajpiF24KIiwrEb7PwPwIIcu8zw2rHdFg6BgdJ6fq"
-    "1MTADw4SWvZWW+MA/cRN1hnQRYyxmTyjIwWlHYS2HfJeQjOyMDsT21jzHN2fQUAb5kSfJ60u"
-    "XLmKMLXPsspW9+qb3+My6E+6m7/5JQYqt0KLDz/4bWw/rZMXMg8CA8uUCGqbaHLUEpydU2AZ"
-    "Ras1m5OMsqzCrdputcBZSuTbHQoOAGtcPO1Re5cTZ9h7dQ6h7QvuoWMLG/cpUnfwyBGnKTXi"
-    "Os6+GWmPxVbqVE5nuYYMDtVCob3a0KYYlBwlsZuXo8Gijp+rBrJK5CNoomZQjeLIHnEQkBIG"
-    "06Q3cU0YhpbnZccs94JshGQGXJcDtxFkFbSivTs3kdNo9lXZ8xVegeYKg64eIBwpJOqsR+vb"
-    "fiUaVrIWofA5T0+svXID+0+HbFJHMBdPTVU8d38V/bgn04Q7NjqBNkJjwSzBQjuXfFxxyDgA"
-    "HIEKMzSS+fQRrz4/C1x9XyIXDqEMIUS0/UiNSlntL0D4aW1ReJWkh9EitKdwEsm8K06S9O+m"
-    "DTqpR95tj7y3uAWmYEgvy+Y4UGMC9aLAzZ/fbUC3PdjnbS4/4cTnNst6T7uPPvi0+8XPftvd"
-    "ufuQeB5uKGv7bhXwZK9tSVq8cnW+e/fta915jJMOYYpjB4vxAOd/39dCexcbxM/4ZSKkeNsi"
-    "pe1aoL4M8o+CarSBwd2wjFZE6cspW1hu6yvBEr6nfBEH355Q+vNHBP5+jyNa6h9eefzwIW10"
-    "mTbozQ7slYSlPWX66MFD8H7anV9actRLnhTGQgHQvm4IDRanjBE6vSbKe14bD8lfHqRJ+QEo"
-    "3U110hkWHIN7o1XvR8TC/2SKF99DM8uXsvbxg5706XMz2GRfz1wvxzvj5916krwm6D1PJGv8"
-    "hlelIcrIkUYBExekUzGOYOk+e+A2Qmc5AmfvDsTUqf7UfouSMs07CIRAIsSaMyD5q4JJJO2A"
-    "SAw7RkNaZ5OIli6Mor8pHUhT5OCQgabvnAwL88ukVJotNzySipDZZDSYNbmbfzGsJv/FQ2cc"
-    "XTpH9xfko54ytUJAYBKv4ZHOy/QENGFJ3AtmxRev9Hvk3xqoUFOVpJWOdmi6asTSjhYRvCwH"
-    "tLHicPnNDxAyIFOmpsEx3GShpS3KXCwV+YfNpbEwUgPJN9/kI77+M4m5+886se6L9sQk7JT1"
-    "ah0QX2E6yyKhC7lE+ydaPe6iUADLPIHJ+FZoFKvUf6LIYxn2SWxzTITy6+tXPIbN28RJw09P"
-    "DOtCUvmXHFwW5R1RlTJUQ7AM4bDEMZv6bvhZP0Ax5+w7cUaos14ibDMYpu5b9jzdf+XVPuUA"
-    "bB2ChORJdfFuPVoe+VztAMW0iMCqmbE0E5eBgE1YlvSI62BdSxFVB246Np1tJLzfymI+Vfig"
-    "EtjSi7/YtgLHEelIPkkicn2dtY5CHA8J3+DUkunOgafLheLr9Su7226IJhkb4b3U9zTGSA1f"
-    "Y9P1OmnMR/poTkJBcxzh5PzsWDReC2idLnDUPwY/0TR5qm6HvV8P7t7vvvvH30IAOOy+/PQj"
-    "BnkGJNI+xA7Rhx9/2X1+60l3hLZlkk3eLoftsBfIvUOHbBZf4bLc/ae7dM4aRUUAYQluFzyf"
-    "crpQPORNJx/WqP2TGqqVFfZnPV2Fpg5+O8FtDEvybmS3X9jNEmcRVeFaONGKIzhpUNQ9Sg6U"
-    "Gwyme/Qbry2dYZCcZmBxMCBPhM1sDidMoUq+cWLknj41VfYV0psLMKknl9q4DJ03278vvsP0"
-    "qSeP8qvtUMhzSVWzGV6jovYJcgXmFsu31sE0GsHWx4qD9T+SPkA6lMCgxkvhSz5xP+s5KngW"
-    "AdN9eNJKkw/a2trf9RCDy4piI1eomeMibK7GUROmoCETSSXbZDX1ytN8w4d9WaS9UGi2lSAP"
-    "feszMHiPk1b8iX8PHVi89Xk1AKYduJMAiGjewngBugDiV7j4m7GGaLaH5irU/ApGWw5Mn079"
-    "pI6ETIFNb8qVx2hOWeJax0jv+7/4pPvlz7+Ax/fQtmKxn6Vt68rsTz/3Khw2z2PI9cqlRa5O"
-    "uhBzECocPLnrAZYx6jljn3iZCFdo19jXxhv9Ixyc6GubFjBlE3/qxQ4o/VmAOP7hCGt1Yb25"
-    "AV/NevM027I4DiT8Q0sSBJ7pdQFEEvsg/tzz6wnLC5cuQiMPQKABZpKw9/ABxouXKec5+AZz"
-    "LH2ZBOGrPOeyomObFv4ROUhLH4PgHziEm1fVp6ledIEnvjQd4fldWYh3iysA3iugeeY5gEtY"
-    "KSBohyQ8TtsnLQAvpPWjjYnJl2971lqCBaHmkq/9sHJA3zYMw58NBeUZXPGgDDg7h2LQ+FhA"
-    "vVut8erR33QivMsUQTgZGTGlLUT8jDNjX0QwlKqnUanAythBS8QZXCB84hH+grBCWqXhcuYr"
-    "vPoSnyziDL6Jy4Cpn3GKqGZIuvZLPo5DFUHiOxCaN7Eol0//7MSPnamlkt21EYwPTAZeB9o4"
-    "EpkOiDzBg87dpxUwEK4IL2m44AVBwZkwafnpg5y5OkCpWi1PNRZ2ACfwAnY7BVh5mT8AhAHM"
-    "Vl9FB9MqFFR+NSgTx7ogwoAxhWA+pidMJvK9tCtBsodPROOSNuhDEzuE1mirszM+f0QQZhMe"
-    "bOzx41H7mHgJHPIsDIv18m4mxgd2j0fKlSTiLT34GLgqv/6W2GCXlpwSZCYIHOs7nSnwbO+i"
-    "Y72ZXTo5eF26h0YJtCOzzuEAhV5xIU7RppZ+itbWN6Do4ASaPg6wgqD4PAtPB0XfbUce/XeZ"
-    "6Ij1NmmUjtB8CM++FfJSYxWNZpUIHNVCuOTlZnwERLKsa3AcEMXBMladiY94bHKCcIgZ9Riz"
-    "yCyVkdYThEND7CVhrVAtzllOwE2zuXqKGevM9CSDBAcsaHtqdiyzNpbG2Oc0i/DjBm4H9Kf4"
-    "73IfogLZHieoxtGK/M1f/gpL4LPYTJrtPrn7EQUf5tqcB7n8+OcffspyHSfaznLRMEvfS0tn"
-    "ETRmKIP7O2q58j6GQZmzodU6xYbwiW6bznltDeGGJTfLE60qpFQToxkDeWh3j+tnWJpbXVUQ"
-    "e9pdW5rq7rK/a0chyCbKj4dGZPcJaO7eRYUUT266jLOHMEfxMJhq+c6wZDkTrdoay40uaQ4h"
-    "RMnbLs/VtgLqAC2XtG7CctoMeDlZcF+U38QIvjKBAqhtWjprK8zZvHzq6c7cFUed7u9jLoON"
-    "7qxMMpDXgR3ZW16pDl2hwMNGaFmoT6wmoAWDDxTy4BMvvB6OEOXJSK9L2oJH0JpxAtIl7xFg"
-    "K7jKv2oO5duc+iQPdyGMQ1M15vQ+wd1GYTkUkP1X7ridMru2aIGXPsQyy3D4idMQeUgvKZEG"
-    "RnjBkTK8mbj5pC3zBU78T1hyMqmxiFrxzQ9P/2dcMsD/QLSCcdXnQhfKcaQwCm1H0Pa6t038"
-    "1F4lD+KPwF/eR7iLkL/H7QMaBH2ArbK//cmH3c0v7nJZNNbZEf7vPXhMfiwLE1/h2nY5gxmU"
-    "q1fm2e92kSXZc9CW+iGOy/r2A7VvVbwYwyifvOEo4mw0fZfjcfQbRRcvWG99qGWsojcCUMYq"
-    "dsooCYqWffl5pA82VQ4oSB/i6M+LE7xGv5oASmRAEcd+L2hRn/Y9C4tL4evRMbemEIHAUyOe"
-    "vMS+FydKn3FPJ3rnwJY3i0ekPaMvY7BjjYJYzLzQh4ywHD3NKU4Pgbj3z8ur6X2BLBeIo/0r"
-    "NRgeIPWgHgtn67V4yNgmkE7VuVq+cuLZO16FXbzY94Wtj29xijDkFQz6/KssgQkMD7ul9Hgk"
-    "G5+8DPC1z5bIhNovjUS691uvQAERI/R+vreCJl1FrV/iWMHmZJysHROpEcUOQFdhQSff+SGe"
-    "7U5nSMtbRFv+eRIoYVJpfbyK2ycWQCC0bxOYojmhHzNTyAKuErHgF4EctJtAYOdOjKQrKAWj"
-    "Qaz8jr/ylkE/WZt9efkrXP9xrDx54yVzCF13ElO/W5zgduI7tARvB1YbhjQOXS17X29iWQKq"
-    "b8Iq6ImHV9VLhejX6in0BOfgaYdKAfSTqZMWWgmxlauYnfR9BZou+3QKdPAplEglg5h34n6N"
-    "lwRqRP/SOIhHnsnHH/wlpcGkzBOkxETfPC2DvCHO/jlIGpQyVYwwerRtxjUlyd0zoZAwPMjf"
-    "gc/8CRQWQGyww8zyPflkepu076LWnB23WoASYKpWK7x41nq3aA76bZAVX5FIQxaWnwxYqTs6"
-    "1xG0xfGjrDFLkI+qA1+TDnxqv5boii8zaGbHLmF5VY5aFPNJXoSmPiVZ73yVlGpsdhjo3V/k"
-    "cqHldJlIP4U2+e4se4HOMns1Hzdvb3KNi8LMZEwTaDWegy8Y6HyMAPPw0XqWKXfYsK0trUWW"
-    "9dY39ru/+YtfcnrqArx/hHmCJ93/+r//ikt217tvnOcSaDRW09zL534wK1n6jZ3hpNbeBoPN"
-    "AfAcnLyXbTKCxx4nuMaYPSs8uqym1sDyKSiaXgOlwhCvCBUIYi57zlOO52zcP6AOkWEiRLp/"
-    "RjpKJ+m6Dz22gOmJyDGu3rHM2inSaOsp70OkvuUv61NeUfB2cLJ2VGxKF2nW2mvxIX7AkdVs"
-    "B/opWM1hemFmBtML2pdCC7LTm32oOPKBBj0RGKnLLCuS1jwVDqxncVPQ2SXdw0cr3Vd3Vrma"
-    "ZaK7evUcwqCHkKCHcahnHolvGvu2XcqjgHl0tBnbam5Atr7FS1wVgixXlgktMP+bkCL+PTc2"
-    "duJJBFqXuGfC1MNwTFCIyd5a8DBt9rxm4CxaFBDrvepNOgkNZuEHxF9whpzwa5+kLdd72B8D"
-    "Jb7i5L/AZwkdPlEwzt4+07UMw/sI3UwgNtfXMRfC5ecs3X7y0Wfdj3/8C8rfsT9wCr7egd6b"
-    "EcaZn8Sfiomm9NrVBYzashQGv2liwzpwaTkCL/DhEvwcpIvPFdDMXtwyieNDPtRfv+qDfZen"
-    "LDrl4GnJBiW2qLgaO30zxPL6rhu89O8k8D95+afz1/zyHhzEi3yhnTwwyeljcRA3+zFharF/"
-    "F4H9/CKGZgfaq0AKLNNabmk9zOET+zwvjlc7uoUZGJcXp2a4CYI9b6dOsVWJBiQKhUbDufA7"
-    "iVuQHMTLFz+UBdzKNRws4zEPBS5BfZFNIZWSJHRoWQqtRUo4iZKfNJVnpY2A/N8/+dbPek1b"
-    "72FwF+Exk7dCFJL1GwAnPU68AzqZ+BA3By5yoZM2U5uxxCqEDAx8EQ229WxItXyKuezU+oE+"
-    "govIB2SeSQkc/fj1B9ee7T3I8FFPB94Q2Nx7ZhXPpDIK7hjC8VsLKYL3ERMzpQC8JK1cfDeP"
-    "8sE3Gfahtg4rht5OWMGduK3c5iP00AP8cjSa78E6PKHBN+AqH1/jzKeIUfAISB4GBgdfZF5b"
-    "aDVgw9vg+3UeKFDGNx9LI75802B4jZ/YBl9BK0RSvxUvUQZhxeBGKtfQMQ/T68I3fJk+Qk0Q"
-    "MM8qF828L54xiE948DFxA+i7OOrlq9+4+q5yRFsYT74dBHmvGa4DOH59wwl8BwPxMT7lHnbp"
-    "z85QepCPA6hoyq8ZTBW/6HeiVSQgbUD4vB9p8Z10soB9QOVpx2yd9jjS6Wamx3cuHEZYcqmn"
-    "9vbgiROXah/CIQyeVqvlv+KNatxjdGi7CBfiRz+fvAPgxA/Y5kt47skRb/FxUJ9iaXAH7ZNL"
-    "hrUvBIvtbFD17jRPyflnvHb66QA7QGqLbn65nM3jU3Sinr6r04Zqnrz7b7P78H0HrEMMM24w"
-    "6Gx1bywpkDzHpANCFiewbn7xiDsQ3QumjS4HFbQoWOecxAjpHKcKXUZzX9Yp1DkKW/v74uD1"
-    "PQcRCDWQKi3YPRS6Z58SdWZfolNLpKCywZ6QHZYJXaVyb5k2kSh6TlruIXxJGestSzoMLpub"
-    "B2zAX+WCa+7xU6hEEFHTpZBFCRLPQdPBxMGnNjyHc6Bf1aH5KgCqHVJw0eDlOZbjJiibQuDK"
-    "kzXyrEHWcitUeTm3eOSkIPxn+YVqXvYL9mmxl0Z67y5cX9/oJhAKd3a5xoXlKJu7GscINBTQ"
-    "Acg2rJb7DCe4HnNdzxk0kArDq0MbqX/Ak4+CmU+1OwiaGLaNdi0wmGgosf0e5wRBPtQ0igLa"
-    "Mw8UIKwP71suTf84kJbgN5ikkU/j7uprACzj8qe/tPh73SC8oFTbkIHnAABAAElEQVTcE+8B"
-    "UN9V9hJMfa/+DSLZtO1zeaqFenz/YYTWLWj6wS8/6f7Vj3+DlmW7W0KQ2EWoWGNP4iaHH6Yw"
-    "KqqA7vLrRTS0C3NzsVXmpOoAjWKM2ZKPfOi2B/dnpv8XJ8ttGe0AlMx1POwvE9/2SD0bJ9HF"
-    "0Wgi6ROYzwlIL+Y2B+Ab18gl4EuY+isYvgvfxOVipZz4wlerV/GL7sbIeNHHtw2JT/HiEQLS"
-    "Rnf79uc5rat2Sw2UCBq98ij6jqLBvnDxErDQ9NEZeWLQieAo2q+D/YdsAVgBBtptTi5rP88+"
-    "so07PjNhBpfW37bxxLDmjstUfFnpK9T+LUhZxpCnxpKkjp/0PYbVYII9ZC5aFbyKE1pJ7hS0"
-    "xW44802ESlV+p/75f/yP/6XRBGIhfJq4ZVpga8DQ/8U/cyJtS0/apPfbP6mlS8F8wTf/DfVT"
-    "VBo68dEzf4ACVgWnLH3eFf/raUxb6Xwr53dzlq1waz7CFNeUM3n15Q+cgt9o8Ls49lCCYMER"
-    "2cD7HTyKZqlok7V44JMabwgNnsAR18DBM3galUt8Nzf49PJfTl7A7C1e0OjhCqYxRtIWCL3N"
-    "Oi71aw54SIdk4i/vVb8MMnwY3ngi7zbunlaBlXe9fBF+wTMsHZaeuJQGz6QZ+FWGyU+M+7yF"
-    "EXimS3LT0Y344V/wrTgOVPqbxgBh2cn7Vfjy4pce/Jg0YPJeVEpQ/AtODWJVDuGZIMt0BSJw"
-    "hWHeYlEas4qX+OSSMhDH5A4kdrihh7Dwr7/Kr+LqSQaCERfqP3TPVwltDvbCz1U1DKh2wv7V"
-    "PYS2TzuhGhy9S1DBy/0PTYh2IFZTozOuYsQYPORF0uapuYfsJwLGKEsnCgQONl4f4yAtnt6L"
-    "lw3lCizgoskEN8ZbNoUebUI5qKoV067XWYSgRZYFx8e1+M7+FOI+WV5FOOHoOst2u1gLt12o"
-    "jfEE3617693zQwYnll+2tg662XMzCCFzg71P9ifj2ZiunSuupAHv7NVySRV8FGAsr1oDac8r"
-    "uLEkiLCmUVDp7pUl4xoNpfyWzw37B+DgvrQD3qUQMkrcOJozhTI302vfSBp42lPBsgRoI0r7"
-    "RmdpW3xo3bRtDuImrfzzuPskV7VMsZ/KI+rjCKNqj3bYh7XFJmpxFAmS9AJc1al0V7ASljxv"
-    "nka1H9AEhPvDtDs2PzeDZpGNxNBKGAJTWJMPjTtoz4ZQ5rsP17Bz5mZ2TjNSTpcP9be/aUK3"
-    "OKvFiEZM5Mi/YAv/2JndcwQqDY9q42sbW2BqgRyM9ymf2iy1b5Y36SlA4395PtQnwDKWOx6H"
-    "XszFkvunq7jCOXbtnWcPS/jiX4KCwgt/lLkEvxLAd7Y2utXHjzGtcICF/bvdT/76l93/+7PP"
-    "ONGJoVA0VZuEAwVDtt5hiYkU7PhNc0DkwtIcAgLLXUxAxF2tokKq+YmJuElLURyUl49BXdhn"
-    "8U1pj8tu5KStNK2fq36w2q/9T+KYzn+Wlf+VZ4J68hjGNz/GEXR6Sd+hS/KmzuXZor244W+H"
-    "EheIvNVp2DU2u9+79xXL0acxtHqdJ3dQQhd5ptIX2U/Csl9VU3v6NPsYyUsDtuK8uvI4/DqN"
-    "kFV9ZeGTbPlp8Np3ytfjrF8Lt3yhR5Gkjw5d5GX+WcZyPiVGuWN/v0/G6yP0cROPZObX8my0"
-    "M8y69E/nd/tLT9SkwmgMGh4NfqqLRI3W4pY4vLhxnU8LJx4WRA+B6xVnBP2cJuCCYEILUYMN"
-    "tZM2zI494CBMEVx4htWMNsAS/wQz9vACqocXhIhXxDULcgqiRijs1Lr4br6+ibcvA9yNWlES"
-    "pz70NIY482tZB3AN87sS2bk3F9jEy78Wn7TGfMH1HnagzWVZomTZxC+bV84W+zhkI9w4H34n"
-    "L98LT5FtfsGZfIK3/jIh8cUmHR3pnYHmm98ecvJIOQDrwNjiEsX/BSP4V4eBT+rQ4lY6ITm0"
-    "64TuICh84uUXDwKDl1GMmHIQV1r1ZYmmyRSt/MISDvQWZvKis+ClgJiW13ROxDhqWg1gy2Pi"
-    "pCsc+2z7b/3seMRFaI7a2X+IhwOo/KqTHg5kapxsaHYoupQFDZZ15YBuftlYDE+7H6HlmUko"
-    "sO2c/avJR+HsBmo7PAUm08ecAHhJV/N15ufA7h4s8zbPnHijk99mqS/tKNjUj7Sw65fuDqpZ"
-    "WuP9cMdlI2eRDKgMhA4qGjHdRpslAYQ9dwpbSQDw6hv3O7lHRRLsdAcsI453Dx6wR4m9FJe5"
-    "b29paZ79S9zPNokApdCF1seOeIcN1gcILGOntZZdvGfdLDKQdcNcDYMl9kmul4GiCA/g4gks"
-    "lhu9nFqzAs+ecx0Owlr2DlGOmCmI8ECZqKpROnHpTYmoHwUSL3PmhJdLGgh1CkmzCH/d0W73"
-    "BM1ZKpdf69c/6Sq9fUqlc7MKBGyAZ6lRC/dH2OUaY2ZuPWqQdB+BV1p48hGFIUImFEAjEGGL"
-    "+pJ9FFoto/BNs7uLcDtJAIKHuE6zEd0259KJac2/CYwRlCFyNFcAs34Nz2QAPrK+FMA9gdj2"
-    "YIqD7To8j0IqS5pkLh7y7f6ZvSwNzs2+3P3fv/yye32BC4oXpgPb/lYXrRz5KXSJ4ySXVqvV"
-    "KkGLCNAnBTJyHOWhPtVara+sdPfu3OtW0czJz5qcOK8gwpLx8znuVMQQLJnRFqvt2g7kvabh"
-    "l05ptAX43/47wCE118fDU//6gT7Qrhd4hGleCo3NuZdvD54U503of/PT291fsW/Qerpw0f1W"
-    "xXvPnk509x9uofmk3XIn4wz0VqulaRDvwLT9KwgPAdsxIDaj+HZikn4meffFsi/zH7S23ASB"
-    "rv2B9ZzShw/kW+s6tKE8act810nyFDJ8VgITMEgqf6Qd+97TwLJabr9z0p4qdtIVKiQ+4ytw"
-    "A4Df6rd8ggE42dfK/8uPV9Dm3sKK/Uh34+VvMFmZAk/7QfMCPu/mYV72m/aPe7S7zY11hNA5"
-    "JhazyUP6HETLXvvTxKzxHRH48qfgyMfyn064X3fBNYHybdHENHknetG5pSMnC2UwXr4KcgBD"
-    "ODjLoJ/8eCxo0t9SPuPLUzrxaTglftIItMJO/Wf/0b//L03QIvX49Ykro4oMQBJHcxKgLntU"
-    "5UcoCsLKa9rFcRO6A4kmEqpAwveUD31BnLZsSN3nWwjJ9PBuBjCNs6lONk/IS8dQa7imCx4M"
-    "Jj6dMQUnobkBDe+oxB1CaOzOHLK5kjJa6ior+cpMwuYvLvngFcImCG9ZJgnzXhGPfwdhgTH4"
-    "MlkPR/jCMo9ilnjwJT2ibenB50G8QT0YJ/F6Bqeid3Y2oIn3n00H/2PcKz+ilyNh4KWw/XsL"
-    "Cy7FIJ64OmDjsng446oN0kEYP2CS537sntDAZNg0Mqyv9xoN61ZnPJ0NV0xy2S8AbOQS3PA9"
-    "TnNJoVCpvAmyvHyQRhzko+BgJRLTASoDHUxtZ7XDfXLaAvNk2AEDZQ1ExYOlraExc2Tao/oe"
-    "SQ8fmhf/5KFqpObZoS3YpNFvpmN02UY1fxqIDEhsy1pCpjj0fJqyHPOM8Z04lGaBa2fW1hkv"
-    "2e/DYFt1K88DDucFzY+fLGdmP8FO5KJVqFERyNNOzDKHB0QSJw0zUPuBl2H+SaucdkN7I5k9"
-    "1TfNJvVR6tFOWNzchO6T6mLjtoM2Qhid9z4bcs1Zg4EKUmbVoxktlnhkUCJ9DQzUC2Q5YOOS"
-    "5dEMgYOGnbyWwNV8bWIbSFMDG+xxWmSgvn59sbt8hetv0EJ5i4JLJuuYh/DUnKYHFE7ER6FT"
-    "ASEDEpmkpsBfzdE5hLNp7l40D5fM1ToozCxjcuHm53fYB7OaevaKkphsADnL6wTk+DAIWqsJ"
-    "hQ9FH5Yq2QiusHGGk15nSOcG5C2W4pqT6t6nqOHWCYS7SU5Tnp3hODl0tQyy/ASnHd0ILdHK"
-    "qKib/oXpacyimTT1LwMjiebmznJCD+GU5VDrTQHT5c4DljfdlyK/1smqYZanvC+x2qR4RRMC"
-    "rH3a6jpXFGkvy71S8pkHBjy5+Bw6Wh8jrgmDV/GJ+Zdg34Q0tWhZ+iQ/07300nz3H/6j97qP"
-    "P9jmcMMhZVAIVkBkbxr1mrZN3qW55AX6yu/2uRbQ9smLaBJEXgjkG7SDu7fvsSn8o+5nP/+8"
-    "++nffsyeJu6CTH/MsjUas1NqxKCpNLLOHLhscw5mgQ0861F6Nt7sMznxXXw8aEVBo9pHayfy"
-    "lnwT7RXPqhfjCFd8uWR7fZV+ZbvbYOnvt7/+tPvlL34Dz9bew0P6SDdk2/+tw+N+aw7FyYQT"
-    "iHGMbB65fEu/DKqBG1qIPx5Zwgcv86WA/OWFX/7VEBZ/ODdpIxAbBZqYxn7EUurye/xjpN6T"
-    "J/H7aMnF+MLUW/rmqx4GxcUbeNIqaQPbICPWr+3Rf7AR7e4xtuhuwSOnu8uXr1H2SejnUrAT"
-    "M4VLeR/ehqc9kGHfPoIWL8Z1WQrco1/WDJTZbaxxY8P9e/D9SLd44RL14wldhZe+/swfBIN7"
-    "w4tv6VP8UZ7CEt2T6fRLmSwE7ve9H4OssoaPQ5CKb93xRlrrwNo6doadhFl4Gl6wWkzjRIdZ"
-    "kiOktGPmX1VqkxhNZwMwhH0BWGXdoLFAC4jnTJaBkBAb68SUR3y9l4sOAwZdecypAaTUKTbI"
-    "ehVGNB7koXpQ666b3BAvsmfnONpNg0tnTlGsqEdPHpPtCKd3FphB7HSrjx7SqRzRSS1gbbjU"
-    "jBZAoUziiPPGyiqdzwp+Y+zZuAgkK0z2lFAS7ISTmKbjnyWzjBLUSq53K1diF0MkmPAXnWma"
-    "6+P7abRKwOM4jpWVq1LwE+dUmwKo/jIX/4KLIIxcgAJKYUIhIAIrjV0tTIKJ1UfzLc6UACCu"
-    "L+LlC9/x69/x2VhfYca8yxHb8930qHtcEJBpIEazQ9o52OJKj7vsv3HmOQ8cLvnlWK7LQUus"
-    "q0PAdMS8hP4tD3G1kw4j0sEdMAN8Qv3NYGjPC1YLL2LLO/BVmBm06lSYdWUJrFPC4DFnP1vr"
-    "aywtoT2Q2yi6Wfin2nkBOzOxbE8qB5A1Gu/IyFy0DO4hyiDOUemhmBpxUGRPzd1HqPxXuaz1"
-    "nSo32g7JNALvyIdeb+FGap2dheYc3Eehc+DRKZiVVopTawh2j5884cTdLPyL4NHKANuV0PSs"
-    "W9tEILCzPjpHuAOoA6DhVSY5lUWLyl8NBP/URJnegdo0FBcBwW9xYMmQNkFz6cbR7NhuQjni"
-    "uayni2qeetqhzCueHMSPLLFOVW3GvVRhi7QVaAVRt3cqr3GWD+0APSHo8qIbvRWgFI7EdJjB"
-    "dBRBRQHLK2oc+M8wwC9w4m7hPDax0Fo46G+jJVJ7pcD7lIFb4UdckzFl8NSk8G3fbj6Xz+7e"
-    "XWOJcQrzCHPQzHINZwntCZdA//ajr7rbXJC8tMi+DdJeuMCmbjRKmjtwn5yahxH6DidcCjTD"
-    "I55acjM+ZZuuzeTe6eiVOZP0JTNcYLzBMuIZeM26mKZMbqxX+JrD6r2nHD0NtoM1d9upkwDb"
-    "ovckuhxauJf20rZhG1WgabdSnOOqm1n+LO86PKyA5aZ269Q41rEXQ6tdKiOlo0x8ONpeMlza"
-    "iALVxvp2d4crdlbX9jEDgJ0vKtLDCXNepYNAuqrwxZ9mHqxo83GCKa9EUIfZDHPQ26e+vvvt"
-    "t7rX373eXXv5NS6hfqn7r/7F/4TQuQQ+9KXP1ayBH/ygltP0DqRnMRCrcE2j5X8JWdUq/LU8"
-    "XOfF3z74f/Dr+92XD1eIu9n9X7/YyNKbBiudFC9SHvvysrnFRn7SCE9+EY69oU/dyX4xPjbU"
-    "yvT4WVErPnS2/cnXJWAVTOG1pX1psoddtq2NNXjoefcQcwt/x3Lgz3/xKdrE5yy1YhST/VVO"
-    "8ndYrt5ivHr2bB/Bv3hqBt4cg7fsgxwD3ZsEWcmz9be2aflEROErD89YEpDSy/1TbvrzhOsz"
-    "wuRP+VX+IlniqSlvfYPRhaW9SCFJAiLxAhPowXs7SJVwaUd8o1QCXuo/aV0OhBYE+l59i32x"
-    "fYYJBGf7BARjvsOOE4nHjx7TBtbZM7WEyYoN/tZJX0KRVtnn5j1cMcUl5hgWZSyeZ3vAGIqR"
-    "KU4JdhdY9meLy/JjrsgCtv3eJFdILZxfzGlL+9EI8/CVzvK1sbP60nhTH9VvGJbihw4VZiLp"
-    "Ramp9ypbAFkWSvICPItJ/GM/49T4a5B5iooKI53x8gbcBPR+x5qyqtviOyGUY0Rtr/UiclUg"
-    "33D8ADsID9F5PFx51N26eQshaqobRZiys9TQmNJpN3QbRhvurr30Snf5pasw5nr35a0vuW/s"
-    "erd4yY1unFKyscNYjx7c7u7fuQ9znu7emHiXAX6chqllYQb2nTVOGn1JZ8AFp8z81lafdLe/"
-    "+IKGcNRdtzO4di0dmENFCVjw6uEed5jdJt1dOvgrCAQXCn+K4EzJwYqSVIH4bQXT3/JVWP9u"
-    "weOnf7mTldz8fu+zJ1oYmwgtXSN8NbqW5zEEBUQ4Pp13jxCBhURg8GqnPeKptgY3ddPHobQV"
-    "8mIpkwPIBK0eYnDDw70SCroL589TJ7QiIChYRcCgBRywDKPgMDlZe1zEw025tVRhXIUEZHQ5"
-    "L/gZz2KoyewZnTTC1rbRuJobOyPqOZ0pQs9zrl+yIxEnhfLYKoI/zIMABsU9BKbl7ilXfZxl"
-    "nd4O2Vm7nf365kr38P5yZv6LiwpGbqge7+ZHFlIOMAl+UC542Yk7Q3aA8W+cwcbZfJ2cQtAG"
-    "B9XapfFU8NAadgkqCoHSJTN5/EuIdJIBzhTeU3eS0IHOzlJXjZeBCJpYHu8lc9lHurkMIK1a"
-    "pwnqeXdQVTY6sE0hFEnX6lSKlxww/XY/E31k6lWNyxSzSpcOS/NLnuBo43cjvMs2V5YmuyUG"
-    "NXnIu9OerO0Fhyboyx++owMBhnuWLE9pksbGEHzoYN2nxVambnhV2GqGqPtTnMwDYbVSChqe"
-    "gJSusRBPW9/ccBDD9AObgncx/7DH3wjXJZVgp20cabeLkGanj5YLLYrlkq6Pn6xwfc7jbmIH"
-    "oRW6uen4zp0HCItb8AodNjheuLgQq+/W1STGUXcZwGup1nIr5HvaSU0s+CNE2c7ct2Z9OlgZ"
-    "7lIP+iHq96i7dtE9Y2OcfNyO+QaP/Q+x/APV4C2WFhW4qGM16SW4yFsuhXiPpJrLU/SF2P9i"
-    "WVX6qzkbxxq9dwnKP5Zh0ou12eS7B8+sI7Deu4f5BYTUSa7GUaBRqC3zH/RwFGMfG0T2G/a1"
-    "as+8iuWZE1fay7e+/Y3u6vVrxDtkErPWffD+F9yLh6DPEqinZF0qTB2DVwYJyvz4yWr3vW+/"
-    "0f3on/zTbhITG7sIfa+8/Wr3P/w3/2n3F//6g+7+g5VucXECUxvuNbJN2PfYb/fL30wsRsHH"
-    "a1IUKKkuHBzkZBRmH0VD5aXHi4tnug/vM9AikJ2lSfz5R59De+yaoTU6hGZqpWfn5hFoZjNZ"
-    "0Yp8TSRLwLdOM+knrrhXe6qskmV+5Fyy5mH/57PKS/ulbkvAqrYMgNSJhxo20Vq5P8y9dQ+Z"
-    "bP3kr9/vPuHaGycwnrBcXS+6uRdwnUmowvs5Tmh64bZjlG3ccaw0buQd/IJK+g3fspTvxAxe"
-    "U/Ci+vOMEOYEGWcZ7T8jwNJP2TYtQ+ux9dfZnvU96idUlvHY9e82SuOlXyCu9eG/Pm3ySlTo"
-    "UpkkrnSThy1DxbU89t8gRjyjuuzrKePFxQvwIFecYThY/hY7NdS2DWktjmcYI3w6+TWGtJpl"
-    "eXDmLJbs2VKg1mscgcyxO/cXEzvGmCFE6jj4HuNiPfqPwMANrc3ZzxOusCkP6VbxxOSkgy6B"
-    "U4lDE2IM/KxH8/fZ/7XUlXsf1jwDvNG4eR4/6U2FdYxpI3AKlBKQOZ2LBD9Np3fADfXOsq6/"
-    "/DKdB7My01KRzjp3uALj5qc3I4DNeaKCUzK3bn6K8UKv56jZzRhHilZXHjAbW0WbMYkUvIXR"
-    "O05kOMGDkF7fscISgLOgS5cXqJzTGWQdb58zKG2gyVh8qkqRWRSEsSOy01xZfkSDWc/gY0et"
-    "ylm7LtLKji0vXyP1iWKnGMdk+X1voeTXAo7pNghILZz0N500qhj9Vz7soBO9JU7Fto/+CZJh"
-    "MMJMW3sg7PT5ag0Kf2qAcP18e9GZLgjwUvVbsFwG0B5L07hIJ2ki7dQcpZFRt+5xqXVoBk8E"
-    "mOOLPRlYwOOQDtNNrXY4LmE6m7Fszu6Nq8DitwKOAp11W/ZnFDqADXwFJoUQSWDZFCLEx6XA"
-    "PQbSM5xkmp5BU4UlYC+dHeKy4tMs4TzH4J3Ckg1K4TA0obTC8tsOem+PZUUNBXJ5sTNY90wc"
-    "YbtF8hmukK9GwuXFZSw2r65tpBMVptqHc+fmiYMWQ8kHAtlhyM9qbrxsWDy1aeTmcjufaOTA"
-    "QX/61uAmXc1LrcCx493KiVfxqrTReron+LxHT5cTewyu2qyadHM3RNpBQyB+09DApS7ptcFg"
-    "4NH7GQZ1NUmaL9hkuemANjKHLSeXNcxQTdEqy3VZvggCFkskPOlWJ4W0AeQs12+FBMs/PMxs"
-    "mzIrfGV57xn5ZoIl7dXo2UHWkqHCg8LpKsYZ19YU5PdijsELjKeA5bFuJz7yiLNXTxya34j8"
-    "BB+pXRpDg/aYPR/jW8UbVpjC2+L5cwjbGnocZxlyIQY6az/WeDe2U+X2OhOX4eRJNy0vL2+x"
-    "pOgSO8ZV2WCuwKSWZQ8aaZqBrLvzc2diOkFt2+oad6dx9+DuPktZCAyQkAHjNDzIaUrqwMMG"
-    "R9DawdI6lt+koTRPvXg5M05eKRMI1hHth7ahgcVTXM/jkqLtZYtTje7tkr/sa9XCyjvi50Xa"
-    "wtWSvILapQvzaFc4dYVQ+Ec/+IPuzW/+QTc+qfD2tLtyXWOlC92/+fO/4pLrbdoHm64pmLN6"
-    "q9k6tG987bWXum+8/TIasmfd9LmlbuWzTzGg+QECwU737/zoG91Hv/m8e//DL7oltIeniMOC"
-    "evqECPfAEOYsWmPb0jB1Lv9W/+AEZyL9uRa//+RP3qHv3u3+6uPPu9kIWae7Dz5/6HQnpzBf"
-    "ex3r9QijtvGpaQy5oulQg2X7kR2lQQlY8ubvd4PxijZhl1j9h4KzfaS4UXby89s+ZneHtsX9"
-    "kDtswNdg7Zdf3Ol+9re/SX0unp9kz+J2BFhPt9oe1lnGVcBc4OolDxKotU7fBFme0mdYL0fk"
-    "Ix84Q7N955804a3KwDPCvuWyj6X/soC9swuwHNYNMfLud9tzajRjm6S6C3JIucxBMah/0vYG"
-    "kUyEy2hgUXraWCZh65+T3+AdmMLG3zolCLylmXEVsCkn/cnlq5cJcnmf9huBvQDbjh0jTCiN"
-    "PXU6wUnjKBOAbtnNQ4HclSrLad9sftJH+OZrnnE9bRLOu2l9F6+By7t0qD/Do3UDv3qnjCzd"
-    "hvcHiU68kN5xJukBnOrDr8BWnqFliC4GhYNvfdYDv7z8W35ipsFC6trAYKYFpn/ykIGeMQN2"
-    "rVoGGcPC8xjqQAlqg7Pxa0LfZcFHbAR0A9sY9325/8EOTu1jbA8xsKmROsXM9+pLl2hgnwNz"
-    "t5slgvsabJAr3Hnk8c4zCHDmJS+5BORJjTU6DmfBU9Ms+SBYydAKaE8ePaHzm6WTqtNEdngS"
-    "yKJYnlRQSDMgEfj4Xt/mo0sDKHLku36svBOfReLAPunr+8kKF3ZmK+JBK7XBvzDAysAi2Kf7"
-    "OkBSk1OFt04ywg7IpI7CdBVuXHKv2Ja5x9dQXxv++c4H9enSVzp0lkvQILo5WHQYRqGNA4ba"
-    "FAYSKsCOxePkWuWenpnuFi/S2Kh3r09YR8Pk3oSa8VDP1gtCkMuBc/Nqk2iQDMSbdGpulJTP"
-    "1MAo4KmVWrxwMYOt8KpxKIj0Qj3LJqNj3tfGJbjYpjnDiTRnPRZh5NRkd/HyGXBkAAameG6x"
-    "T+sJNoEuX73KADaOVe/V7qvbd0Ib8VArt4HhwIfwyyx5q+ZXW/IAo4Ff3XmYztOOVBy9uuXj"
-    "397sXrnBVTBL54lXwhTA0jjDPpTaAVmhaGF+OtqP6vCK8uJZtK+6GbQ1/ClhBgV+yU/ecVnn"
-    "abeytpXyzGPV283TbjRfo6NfZRBW4LGDFz/9zyE0eT3OWm96wFzHERhGuSTZS5SdRY9Sly4X"
-    "ufRjB6uWRQaR1vJRBgWewrSdKkykDqmPHepc/9OjnuBjORChRRxRSEbAdN9Q9vRw3H+G63K2"
-    "d9CwsFlegUaBZBdr6JssDSiwqAws7ZIaQEuv5ss9ZGqvCg+XhZ/yrVDZ/tROazk62mpQd7/S"
-    "4oXFbJoObVH7nUI7qFCndsEO30mCtrnkDcvtkh+ky9LP/PxUYC1jNPTuveXuPs9t8r/MZMCJ"
-    "wBImIZbYL3X7SyzMc0BBcwm2XcbSzL61jZT7GKl7l0vTd6Sfou+BTrMI8AphlrHKi2aOOlWz"
-    "I/2lsYYnR7D7NXFYF1irqXWfnp2+S+rW1x5Lkl4gbH0PYcCSaQt4Y0YDnr320kXuc5xGwOFw"
-    "AMt7bs3YZGn8ZScVaE0++uDj7vYtlmOg5WmEUuvMv9HTGjRlQzZWx5fRED64+zfdT/7iV90v"
-    "/+433We3ftbdeOkKvMFEAeFvk37ZkadNYle5U64EDIQXBFXI0Q1POSgzwLo0Gg0EmkSEJQfN"
-    "V9+4Rp678M2p7v/5u0/AvyZQP/30AfTAgj0Tgpehy9XrO1lecml3EuOT4+MTqbcyeVGDPEiR"
-    "mzniBq/1XX07uNA+5VWjVT/iizzvFhZvFWB7C3cJ7sK869T5R7/+pPvo41tMIE4xfiHQMk6N"
-    "oYEdQftm/+eSsle6edJWg7sKFk0IUAMk75mPdaxAVlpN6cU7/t5nKK4KFNarbd80fUIeprHf"
-    "qnZIVWWsg0WM5E85ywugPPTnxTZT+fMePPBWVW6yipi09qONFopvjsHyYOKYzgQACl54OqZm"
-    "DBQZwjJ28pQHxzy9Dr5Osmrp2T66MnvKUr19gXvrnNQkDjxiu7btpJxiBF1hqdDEvW226Wx9"
-    "Sd4iD2opW/8Ozewf5bdQgDBz7LNNOQoH6G2xCp3AsWh+FqTyym8fqdHFcafGS56E6Z88iBxw"
-    "vV/SGsZ3YVEwja8rPMqv/TrlNyjfLYKJTZJ0BOlf68N0iHRYbm4bPc3SQDpimJpG791dMrAz"
-    "1SnWp7McNLLH+uoMDV8VOMsNdMB7u9jC4TjyzPQcqvIyyJb1beA6Y1W4cgC8fOV6hCoL71Hs"
-    "EWa8DsRrq5/m2gLvGnMWqgCzTseitHpu/jyzZWzs0HFlE6rXnlCWtoH7mNRFkAg7lE3Xyp4P"
-    "gx2AEtD/5CMBeOTDSAZWheT1BOH9lpOsOR7mhdjRJ5GhC35TRwYQPw2P9tRfqAq3rXFLE5c/"
-    "qpPrGc9szBPc+j4l6RqmhiSsZwYbu9EVoB6y2XBtfBV6N0vSZWRymw3lpeFRQ1QbWPcYCM48"
-    "nUQ4Y9mP2eCTR4+YlZzqli5cTvqdnU067sfM/LbYe8dmfJCRZ3TWwywX8HpZtUvKTx7dY+a+"
-    "Fh6ZmDqbxkj7oyDOBGEunBqz84sL2WD55MlDBAyuQHEPEELC5MQ5hHC6bVsW5U7nSrphOkkH"
-    "fbVqy+yLMkzVthbCLcfK8hqCmJas7bzVwB1gPoBlSGhx7eqrmAYAF0ZBL+D9lBNFDx6uchqO"
-    "O7jYWyjNHHCsPcsmrT0sIFndl6EAZAdjZehnnSjYZWAiP/fZSAcHg1PUoRMC+kDg2gEfIZy4"
-    "ef852hQu9NbwJkC88JjgbvM+y2y0hWnwOPP/MfauP34m153f081u9r2b9zuHw7loRiNrNLKs"
-    "2M4am3VeZINgHWATIAmy2ATr7L8QIC/3vwiCvM0CwQILrGXDXtnxeixZknUZjyaSRmNpNBdy"
-    "eGeTTfadze7O5/M9Vb9uUrY2D/nr53nqqTp1zqlTp06dutFo6kURljRsMKwxgyEBeTGq9IYI"
-    "R4+QcT2ewnkgKv70lAkXP+XSfH3WGHMvKbGx82FcPUwrbBQ6x3DgDHOR9ApbNs59slyn1moH"
-    "eKKDL8P7Dq9gTFkvHUqzkYysovxV3Oa9xvBZV/wbDAk69Cg/n6AjnvD9FOmO492Wl+oE5UGZ"
-    "dxhMuZvDY2Nny/ls8QBxlp+bly7hpTvOuYVjxFWWN8lHvWPDd5oDpD1qRs+Yxo3lIY0a/Fs2"
-    "pHjEz5w6RrwZti2go4fsfP7zl/BwFb7Gda5UdcrgG3jaMChDFEEuZdeDnDM0Qrnb4Fg+Dhfe"
-    "v6dx4hCYJY2MMEfMeiMf5KNDg26yWzqp5k9ZhtMMCWqsLTnZHx7amGuUKpvqu6UTZ4GD0ZQd"
-    "tkuuXscAO3X67LD0/XeGDz74mF3pMbLJewf+OUJwnxGC73/ngxgF7/3wI+ohhunUBnSfpEOB"
-    "Z2frPmVpJ9qtCRymVq6RdaWUcvYn7ZaZgjk9Q8NLRThCvobpiaprf3jtC68Sl84VHYDvffjZ"
-    "wGE/wwwA7jJy8Y2//vlw7frd4a23Hg0vv3KZIWyGIIFjR49E4bX8Vgclq+SmOJiLiIgLT8Tx"
-    "n0ZAXcquzyXbHvPi0UDOAVp5sDIs310e3v/RR8PNW/ci03p9dzDGMQNIR8EBT0+y6nqezhaA"
-    "QYeyof7EAEG+3Bi98pMH8gU8wdmfZcj/4CQ+yopp0+k3wDjSRLqu57PPnt+Ac+g2+p6wtCWk"
-    "4Z+0e8vVn83UDwWiogSXmnKRaL43fsoj+daQBSfo4FsMjoaj6KirzDPOFIxp4+fIPO6lA4lE"
-    "HDPONAx0s2nUE/IttoNwia/nyp8GuDzo9Sl0d3qAZFx52q/gBH4hCrwposAOxcRTNjO8LA3K"
-    "A3GkM/IRMIdgianpO3A/kZ9XPaqPKr0RDSs4wuVHXPHrOHrPlcT16F/jxsBKZsSRGWZr9LhX"
-    "/QDC7jI9BsNqrgq85N/jB/eJY29XtzaTfGlsVx4+oPe1N1y5eoHWVAMAL9TMsZzlpIEwhmvc"
-    "E7m31neHF1m9YiM5T2N799b94SkG2v60G5g9QmFM0hA7POgEWpZ006Mb9h164kBS5m88engb"
-    "BXyaCi1OHGNw6zrzrs6H4Axr4M7cZYzYQlZx1UopqX/uCqGGNQb5CM1QG0GTtcVM2EC47CCC"
-    "f8K8Z5+L4WnkW5yCW/GtvD1dweFrK6R8GMGscD7GNusCYsOnwHQjS5silTR4kYdGSQS2CR/w"
-    "OlWju+Vr5gTE6CGNSmKPYw70VDzZdSk5jSC9aivfzhNW/hG3ezws52zKSEui0nywfI/y2cST"
-    "cJWJjGfgN0MZRxdieK9nT5+i2ZU6ztNZOlETGi2XeXqJeh7XVz/jG5kAL5PQrSD8czgjRhaV"
-    "dGmJhQ2TbCzJ+L3KcoPJqc4HWXmEYbiCx4DxfX9KpvyKkoR/jJrEO+qGjseZgKnho6v7JEMf"
-    "D/CiPsUz4kiz83Mc4nOocY3GWo9UVlGRR+Zr0Dg4bKNHzNJMxWHIw6GenZ01htuWMRLZ1wij"
-    "v8rfcqoSt0zkv2mUxTmMBhVMyiFlR1lQLvHAEdO8HbrLijRpkdfw3f2bFjC0nOu1yBweV9k9"
-    "dD8eGlyVjw33EkN5Dnf5m6QM9bJYm1XswQue6LzSu9zngGmAkI3ixqVCFFl+3GPiIiMe7/Hk"
-    "kYYQc2nYedmhQOdgOKz34IH5e14hnizmBC3Mjw/LDzeHO5whOL/pcBjGAnMnNfb0cro/lobc"
-    "xlbhJI7ZEgKWzEHrefaGWoKXC3TG5pkEq6Gmx3IGw5RMY2DozXYuopt+bnEY9H3mDM3i5XQK"
-    "g5tmLjJPSi/WFsZbDRM4fwmjC/51g2oT75BbQJxnzpVeHRX+CSaaK/f7lOsePX23PRhniMzJ"
-    "ww5tOiQczyr8tgily6kKGljKrBzTK1Gr5Fy2L8r7DIm6ytGVVW0OEx0EPWWQk45GjiDCCHI1"
-    "pFCcxwpk6hMLhzBs3Y8rnmRgOUQ8e4yh0Yt1FMukx5VQUBPgPDe3RN7liZ5hvqOLFBZZifn9"
-    "7/+cuXAreIdm6ACzHxVl++HPfzLcwMC4fBlDfnEzvIqRN4bHknzXN+U1+pc5cmMMEYIV7+55"
-    "pryU4aLX0IZM2fIXWdMLCJ+mpmZZ1GJdnBhefHlr+E2mBrhT/Y9v3hsWiLuBPpuAB//vR3vD"
-    "dz+6OfzL3/ttPMqLw9NFhu4XHUJCUD1iJW0S2feL/ORRViofyrsaesQWHtnAKsZOqNdT7qHE"
-    "rkBepfP90c+uZ57a3v5jZNYFJxrhFhQdQfLSOLKcy/NSpaoSFJ5hQQsErDNVVpQpcidPLWvl"
-    "3XDlpDoy4Eu4+qDS2o4IF5iGk0792tMSyLfSHT6bs7QVVPMwb+I0IyLhwDBePGeE8xGgfjGd"
-    "6RsdIul/78ZrlzpKfNU1wjB+GYPV3sRIaoTFaBnlXQCAlst7hhjFhjzMxvxEWthuNyOstFsE"
-    "S4dHBZlfXR1SewOA6QRSaSqef5NEg5Oy4X8Ckh8vyqIwISXPQjtIX3mI3x71seiu+DH24J06"
-    "tTsvwnsB+yM74chN2eceenZChZg5uTz7XoQbPQaWuEmkdxmAMkTwk6r+hGkivYmHSst+88mj"
-    "YfuaHgDdzp4cTu+VXuUiQxrz88dx956uAgaoG+nZWGkkbW+O4S1he/wFPVdO9HROwyLnPN0J"
-    "nCdPJjDAHgwnT56JUk1FER84ZW9W5Xfi1ElWtt2M92SRlW8rDx8iFEN6c+usCrN3J9pdKBXi"
-    "p9nyAS3Y6JHhz1+9kGVWZ5BCC49aqhIY+WRghLR/qUR+SHjFyashgrAz1OA2weM1fBdWg2OU"
-    "jgcPvlUcnhOXUk1jmZqaTE3S0K2KFCOsIVC3Uki9xyAchdbyVAE4Z+L8xUt4/TgQNpVXodFj"
-    "tYvh++mw/GSZ8qdyEF/PjcJnJVIY7U073KCXKfO5AOAqPMtVD0Epx+qlWB41xFMylp66yINP"
-    "VUb5ggIjH+XJy/LeQEnuci6fm6s6dOBckxP7p9NYeUTIvbs3mKdzg6FoG5RF0rhcurxENrAa"
-    "fRrq8tKraKyJ7vsMkxiu4o+M0ctf31zBONHTYImNYTDg0YBHTvDsuMoL4eglc2WZw4NnWSig"
-    "UWgcv9OEUvF9ttJV+C6JbGTl7VF4BGYYCoVU0axSwCjwHwGZr4BsW2a+O2FdeZYvDvu4yaEG"
-    "i0OcUxg9Gk3M6sHLxTwph7UAPY/h43cveW4PNc/AASz8KdmqMgj6fOZD/U+cbXjhcKPKSNGz"
-    "V1+bRUrLEG+Kx8loWORsQjxFKwxnLrPs3XP+bLA80kYYeqvcUsIGexOj8DwH5i5ibDvs53Co"
-    "3iYbPo+2SW+X8pzlfcGJ4ZBhQ+Rim30Yt0njqTfjwpUzyKI6honfeMyzyhHlfe7CCfTDKh6b"
-    "FfRC8f4BnhN3jVfITpzEWIGWeNpYIeYii/v3NVq3+T423N5nI0mmIlCcwK+5J3CLdzsl8g7j"
-    "FwbY8Hphj2OsG4+tF8Axyh887BQuMl9M5byNx8zO5vjYNPqUHdQfPMbgJCHG2SNWYc6yCakG"
-    "zC7x5hyaom65y7YdPTuul1+4NJy/dJm5U+wphFdV43Mi+36p5G3sSbN0Gn6yoAT83NJlFsPr"
-    "m3/xvXiylKG7dIxqCFdPTU3x0CORMsI4zzE6kIQ0hoaNLV80qpWZZkzBH3VRvAbI67ETdF6Y"
-    "X+u6W+u/eavjj9KJOXnmxPDSKy8M167di4Hllgb7dhiRJzZVGX79Ip5FytGFMBvMlVygE3WU"
-    "Oldy3wRRBpNPq8AjPIzDS+LKV+uM9W+b+ZR6yTfxqNvxv397hSNvrg3v/+QacTSe6UDSllWn"
-    "VYPKhh8ZR9btrMBuc5MJlJXw8+hrXe173vNcja0fTWd9SmOcdOqLMiycPypsZUo58md9N9/o"
-    "j6TtdVVIAqg6L8zS39UBNd0In6QzD3ElPv92uVtGXX/09OHZMynJQgJFzMtnsWqvPIYey17Y"
-    "vtc1eugBde+w+NzxE9cYv8QIbxrwwq0n67EPgxOPno/PhZvpDgxb5JRLZ4HfC+ZB5paD/I/s"
-    "EsfvfTGFtPjOH9LWc9o7+FdwANzy1BFQcQofMOCj8ao8DY0hKSzKU3masNLkMlLjXDKUISLr"
-    "R6I4oVMknedw8dJVlvVeSmOQ8fn04pz8pzuf/2lI7MWovOhNosQ9jXyM3pETT6+8eBZuIAAg"
-    "MaNCobeoAfaIg1kdInn182cjnCodYckMz0KbpMKeYNuGa598RO+RyZHMy/ns0+sMT12g92fv"
-    "jCXBXPbiLNoIrV1NLpn8/CVj6qpC8RnWtL/FFxmapwQ3nihkXMXsPOU5AhwI9T2RnvszEhai"
-    "aCU/f/l9FKfjAuoRkvat8ilh6PGrzKCDBl2oQGl4S3flM4LLaxoJFInf7G0e5ee8D5hGg4Cn"
-    "huGIGBLkqTElfNNorPjzm3OS3OlbwdbYUMGbs/NJbPCcwO6wSLInT9NpZKVBolwL5xF6oTtl"
-    "Qn5eGnMuBd7GUDp9xrlYypf5ch+Yk4JB/xQP563bxEGZTk8tkZd4OEToVh7ipTu68JrECyJ3"
-    "ttj2I94xMtOrZSNlZV1Exl544TI40rizwtEhRrd8sIc7SwciuKXQwS13jHeUtEahvW/nooRv"
-    "ElwkwE94DU4aOdPkb12AbeGZBqoRLQXL1zkeC3hl7tMgOAQ0g0zLW4+dsV64FcJJhs7iISHP"
-    "ReLe4Ow/PV5HSTuLgaIX4nEmtnOsC0aXm2oK13zSQIJQ5Af80nCo6CVMXihfickf76FBfO3t"
-    "ceYdXubhsVXX4VmPsHHOJB0uyvsITmZxlb55VsNZ1m4bsLzC3jdkb54aKYqcKkf+LeF1Mr75"
-    "aFQ5l0zDza0HnH+lvLklhQ3vmdMLeO1cFq/HnAaUCfYe8aPR7aHF+xxSfYyhqScYvJt4yk6w"
-    "oaVy6w7p88yfKc8Vnlp4s/LII2Iw0Jhz47W367AhWzPg0TrJQb43PtsYPrm2Nnz+dbfTUP8o"
-    "1dIgT8CLnyHyHZKKn4Q8xqNo3ZlgW4ixsa3hOEOObj3y6IH7JxXfn+JZJGX45sT2dEQoE3mz"
-    "CJ7O95rE23buzALbUBxHrpjXB1/OXboIX1lwwXYpi3j3j6JX7RTNL2LYY9CoS+NRskGlvI7g"
-    "SZpwXiXePhtZdfm3vvHD4dF9F3tsDj/85NZw9eQcw7WrzEtjywEM2gd4HpVDFxm4s73lpFFt"
-    "ncJfF/kRjqo0C03gg/pfHW35uhowOgb165EoNlTOy7VRXjr2mCHXq6wCXRne+eST4ST8Xsbo"
-    "/qf/4MrwytVL2d7Ejpo6wUnv4w7hSkuTQRCoK6Jaxh2IJX7XI8mTMnE0xd3jN/DWuZ3AT3/8"
-    "4fA37MfliuiJiQ147mIty5CykEZoUCeVjqVhJCxtH7BiVHDPBTJ80t4xadGaMHV2RfGvhoSG"
-    "f92Bqy4lQn93ix3hm8YaVzaLMHg2nXHlO3EQNqmseGbaLxO38CDjWz7zJw+m8rHSmPcoOWGG"
-    "GhbcePYqiD6IVV0tmxGOLdRILUZPB46VVdL7USiW4eGrG2nBbYSQSYr2w3H7c6ffd8npPOpG"
-    "UrLlg57TcspUSuMZx3vHI/SIOw+WtzrGq3hOPIgQx+jCVrcTx4zhlzpOyiIr7R4AfBeGekZ8"
-    "ylFgF9roEufd1oCnEGCBEOKzH5UxlSZPVJpFjJ3Z4UiEgHyJW648PR3AwBjLMAggJlCYHljq"
-    "RpOrDL9ocM2yZFCCbeRcZaar39WBJETBsVIMb4WTkctQq9VINpg2hhpPHpPhydybzOciEkM+"
-    "ZxAWlZSb5Lncv+YSaUF2BqIS8u3wH5KG7vpjwfE1UiLtUt9fS+D0SChpVo5+Fe+SMAlqaWwV"
-    "Qo/jvcUofvYA7pWTAe0iQJheyQWkLGxpSeQg6WOVzchADm69sSRxE45RxSKdvEh5Aj49NZS6"
-    "w7QSXsYRj6CuQWK1ME4qusjkKtmI4gM7VwtubD5mWG2VIbpqVN0MdfXxw8DTaLHhcL5O+EQ+"
-    "5q+6ME9p4naAF3lElkCisSBysr7xYBhnKtUx9kubYb6H6fyld+qKv4nZeOJKKZXHzPxUuHOz"
-    "C+C3RrrHNNAsmuCf+2o54X7OOVMYJYt4g5YwkFwx5ErDWdI4PKSR89HH19NAO//K89s8lsQN"
-    "H60Peu3uM6fDeVU2UN538ZaWTMBr6JE+KZb3GhPrKPm795epS2yrYA/aWLBDni6ytP4EKxYf"
-    "c/admxqGVwBwibgrCl1Bt4hHzWX88kdDy7kxm3Ra5thk1PdxGvBZvu9hfGTeDOkLjryt+t1l"
-    "Jo0KhtMuDYAGoLiKS+4p7wP8NSaU+1UmrbOQPfhnmwuHr9gPym0cjk7WBp7KnB4pD4lWv65Q"
-    "7+MVIKVbShwhg9mZcYzF2gVa4+Mp+0y5medxlnIfZw+iCSZvO29sKx4hjB/qtHs4Oe9sgyGf"
-    "lUf0Do/OYkxyDiJw5zP8tUFHbmc4dcaGnvlDGDzjGMqmVa4X2IH96aldytc5Pm6pUR2DJ0+k"
-    "rYbsrL+n2aLgFCvKpthkFClllZ+LKNRxrf5YovCqJugWw5Q9Yz/Gm2ld2tvHqLtdnYxVPFN6"
-    "ro5iNFiX9bR5VJCeM2VMhe7eUk7F2Mc4PMuw5ZtvvQ4fWISBvjt19vxw4vQF6tHWMLd4glWD"
-    "i9Gvzj9zcrsGkEOgGlU2KJQ0hicGGDpavayeffM3f4PvR4Y//oO32ctuZziLPN/C8Du1pGG1"
-    "Ho+hxu02eVjWHh/kodgAD916HBUP3iKzykIZJEW/+chz/hPHmLYXrpbUUNKrtjBcZZ7VV5go"
-    "/84nNzCudob//I0Lw6WL56CJPb3gxzR63XbDDtoEZTY5XptLq5Mtv3iGAV0dPofOK0P1lDmP"
-    "cR7eFvirfzbh673by8OP3/vF8Nff+QUcWceA15CyPYEKPIjWC5swZbO8kOhZQUqEFZxMzas8"
-    "WEVTI5A45Ade4iAv/Gq9qiFU3gOEQPJoKXkRdsWvZ4w5PFoOnYlL52eMAWCa0NS9/tbdQPPN"
-    "Z8Fw+eZlTs9+Eabp8qn+JIpyHhqgvX9Pav+Yp5AClj/+F0Q9mn1oNuboah9NEngm7jwgzLy8"
-    "5FcDkDfzKp6U0ZJIh/4E1qF3wRT1hwI7DILs/FTWRXdPn/xFQdxjK1THgBThu0a2Ca3jynL3"
-    "bmYEgjDrlR1tOaNM2PFQfxtuByZySx23Q6VxldXx3FllDkJKVS8YOZvLMK8qYBWQDZNHAmhc"
-    "UX0QDrdfULgrtSUQ4ikB90fp1qON0jJ7s6hUXv7cG1Q4V7VohJUbeY4lnTeZ7DhP43H15VfC"
-    "IOfKCHWTVYvVQAMZxmg8LbE67R6rvuytv/jyCyhjPBrk6TL7WuoMzhCXCXswTSGzcRvhmSfB"
-    "W9zi7OVff7xDeg/1qXOi4lZsw+vXYvg6+tRTEMaVT3xTOSVKi9eFrmLVXwWiesgH74YlHJos"
-    "vAgNYT1DBSpIA10FHgaanCjdjRrco6UKX4cMVQx6hWywdZHb05RP1Ss1Txre5nUS10wW1fAl"
-    "rnA9J26drTlufHYDI2YDWON4EVnowOR4VztG6TYF1pXHqMKDnB4c0Q190JUGxuaSBkMDyrxP"
-    "ZoNTd4d25197n8pFDXFub7MTO7J07NhJDAQaTdLuMLwTbxo4TuFNOH/hIoeSMpH33h1Wt94l"
-    "P0oWulCpNHjOIYHfyOHVl64M1z69ybyUG7DSBp35PewPNDvPXktM4HfoxrQpM9Iou0/0FNFQ"
-    "XDh3mgZNr2l5N4pG8wG2iho+ywsPS97dZbItHhm4C661/5Hp9AjpoZmjx//iCxfw/jximM2N"
-    "/Gww4QPbRTjvykbagrX4nRN2jsnbTtifJ71DbHoVjzGH5Shz6hxWd1J3GgjSiLuNgHfx4tZ+"
-    "lLsNCWVgnepX5IwXh/ZsgDSMnIS+ghEzg9HkgKRenzJ8WPEGHru7ZQhZBlPMqXSHZmmL94oy"
-    "lW6Vll4qZc3NS1fYMmL5IUfYMM9Oj9TJUyfoRNnQPkWu2P4DQ8sNizfxgFtyriK+h+fu4UO2"
-    "pcCjuaChjEGnzJ2/cDp5uARfz+wu85l2j2JwYIDOMRTppHl3gxe2mzxmXlV4ImYe5Ix0TSND"
-    "wLOM9Zi6IeWuq8SQeXlvdfObw6te442nTui3k7e8XNvSzGEwP+aYEJerW57WszmGsl2kYX19"
-    "wvQK+SRAD+feZQHDr7/1yvDFL78xzGKcukjk5NlLGCen0JccxzPO4dALbBnCMLw6QgNL9TuO"
-    "EeNqPeuivXgBOu9RTNWDs2wUTOENb7z1RXZTx7N47+nwR+/+9XCGvdPWmMMWTyDGRzzOyMwE"
-    "HkFJw2GKpxCOM+SsV8u8SmZKO3ZDXXkf/Yikfpjl7qiCxqNtxiJDmvbu3/zyK8P/xly3Vfbi"
-    "mmKl4lPmQD1a2xguMqqhR18djiAOUzRmtUWE8gu7gFOdFPRfk12NGBs6dYWXU1hW6ahbXo8Y"
-    "Gn73Bx8Mf/lNd2XH+Ec9OI91csLtAzBmxxgGpt6FEusBZQjDQl8qFy/yLpkTM3XBgidOv5RF"
-    "pcZEXTdUna934xndMO8mz4N3Hop/1sV8ie5OfOEZwxefZLy6W+Z3QAarKwno9bQMPEIsAzsE"
-    "5kua8A7ZjS4SovCht0BV+tCKTMaJAOT+NdkbbuxOR2A23ALFZ658D9L17rfgCaYxggkGL4IS"
-    "DpaobN6ly5/8JizfeQp+wBx9Nww+uNpWeau2wHrEPDqGul21qYw4GT/z6oDQjSWNIfGzE6G8"
-    "6MCRb9oOwnKOZNo10lu3a5W7DqAaAbB9NA9lTx0slsqzdGnfCKfe0XE8U12GfSoQXWGw5pI+"
-    "GyjLskiT8WWVi/geEw6dL5CE9NKzokBGK/0QUoWMsPNsw+3qpRI6hkZw3e9gYJ1kkvM8xpGr"
-    "NkznxOdxDCZd3zs711Cqp4cZVhba+DtEgPzDfyo7immKxkXo6o8Tp88NdzCwVDyLx86i6DTm"
-    "IBZisoIHD4xo0ScFNxgGrAhUSswClUb5bUDROOaKQ5hrPPH2Wz7HdE+0Q38KQK+UiUuGFGfF"
-    "4XMXE0N986qhmDymUC3YbjGbZzxGxE2aQi3xbDSdDGhj5TDXfiZ/tlJC4BKVP4FRBXhAm7QY"
-    "Q/jkp4CGblCaZFKtE39tVB1eKDStzHCOJOMYKHO4/SdobGKU0EM8zr45CpP8np5ZHC698BLG"
-    "820aSndZ1wvDkDB5PGZDRfnjSimH184cORuFqtLXoNGIc0+hI0fO0bNm6I52ZoyhmrjWrdAa"
-    "/vybRDOeOXsRuMcw8NkzjYrh5STmmblzCDdGB5VGmjToF5aO0zAdS3q280ahzoDjiwwzMWyA"
-    "IrcMppgXdPbcOaDQu6bIrFBOEH7ppekMNT7EKyWvLl46S4OPl4AGTG5nQjl8rB4mXhoMtJev"
-    "Xk16YZiGKg5M4obrKv8qF43Fq1eugqNhloWeoOY1UV40wlI2TN7GcHJYz2FH4496xSWQFmWU"
-    "sXONHEJaoINiPMtfebIRd/M/+WfZ2wnymzR4r/l4Nkql5FUiet/4GLjZAZzGTp7GCAZfFYxl"
-    "o5HlXLINvHhTbElgPbUzZXI9UR4V5Lwej9Nw4rvzp4pfUEu9lnZp0xh0r69NJlPLI6/FJSZq"
-    "s4/sqTOLrZyPMNTDPCWMkzEa/acsKJhnCwTDVljm/xm7ugtjFhlwkcG5s8eREQ0pPGEc0fME"
-    "75dexkVW9ultsvGWHzOzbn+AR909jtj+4Snzr2YwFJWfJ0xcd58vaddD56pJDUG9Uu4KTxHF"
-    "KLK8o/tg6ya8MG3pRHjEHECPu7F86OXxrVZUSmPqvIYaRLuCVEPeqQ5H4NlbX35x+NJX38we"
-    "Qsr9pStfIAUGHt6Y+UU6Ecyrssz8B1IZRlMm7Qjo3dph6PupHSBibY3h3cfrdISytTOrV0hd"
-    "+zpG1j//F9SD8e3ha++8O5zD8FzDyN2mgZnDIJbmBbaEGNZZTAT/3KzUYVpliFy5kBkz4F0d"
-    "u7qmnBDKn3zn4yT6WH4TCf7R7JCEWQAAQABJREFUIYcW5cRd4K0HHka9yUrxyCRArC82Um5/"
-    "4Sa0s4s1rcMGLx01rT1gOTxTOhrZRUeMe/4ftLmXltNDnMy+xRYhtz67l72t3n3vY2RU4aK9"
-    "wmulnjBPV/2OswjLhjZYQyNvwKTugrsLeLLiFv1g1lV/xLP0u2Uo0dpFoRv8Qws4CUNdSQHn"
-    "n+2VnHB/L+nxJA8LSH1uXOu9dSKgCa/OdaunpB3P9g/FY+Mnb7nhIhpg2m4Jt2TR+gjvgOPR"
-    "SQLte0FKgyNAlpVaoe/tYNvokH/wT/6lh6r9Ag+BEV+8Yrwg56RO2ee8S/gZw43vntLgFZ6Q"
-    "kbjapqX+A0ddoryKg/n63VM1xEhvp+EaKdZZYVr24myHyPbCdkfdEeOHtPFMk8gNa7vNYH5V"
-    "PsXLamu0G+xQaXy5ilF+SpdZK1e8Uw6WlNNFrNt2GjXS5GdkWZ4S18tVriUn9W5K5TJlIK/A"
-    "3by8mIOlAFbEMJkIxaB8l7dhvoReuPwic6BQRlQQFYfxvA7+1pPCr0KSaHtFJxjCs4evy7rP"
-    "gwnTrakIs5vjfeFNNsybXgijHaJKw0LBL7Ja8JVX6QExnGCPUbjzGGGvvfFrvDMsgwfGXozC"
-    "dvrsBRTtSRSsc3OqsGVWXPbQ2QteRohp0ascNrxhYIUpiIbJC3HsRCYVL+3q6Xgt3rd0h6MJ"
-    "J3CtcDA9rCYfaE8evKcMuPtuuDFH5Q9sv6tI7LlH0FCUCpKXlOju/Y9dI9rFjUthvXj5SvB2"
-    "7lzhr3Koyq0hcpKl3lZMhd/7qTNnslqvBGkfr9Bn8G4cubgCfgoeW3fsb7C68MeUuwfz0ltA"
-    "cI8z7Lu/5/wo6afiUVnkw/zCccoKg5tnPTUqYfl/mBrxctK9w9Ke2l7KTkNAUBqdqi97pzbe"
-    "nBGGAd8vabGS2JOe5rd0rOJU8ZRiK2PHSmljoDePlVcsvBCPTHwVLjyuelJlpLzAjlQ8hw35"
-    "HL6RVeiQOOWGWFFE0dL0ZTpvC1cbkfIimrfwvPtN/oqHho/yoOLqBlSVk7DritKHF4HBRz2c"
-    "5d04MKpyRI2anu9RtAIRZzHgcYI8csEvr5QB5aQM2Ki5d046B3zr+boS0E01/e6cFj1gDgs6"
-    "UXqTlcRO1p+YYHUhBqpzoFLvSZysgWsPcoPVq9KlF2eReVuePagHS++Tw7AeReMwn4sV1teP"
-    "5PnWTfau+myZI1hYbYy8aLxo1C2zn5K7r+t5OnX6ODDY0oLG1g1qnT9kxtV7hQcYWirnzQkM"
-    "D+ZySq88Ws1KN/NCocOTOQwNjaRpDARloXihAm1yCu6mDW8IO4IsOMcrw6nQerudlagOtFxs"
-    "MEomKWP468axKxwXNsd8sN/6nV8fXnnjNSavc9wIO2G79YGeeznuFiZTDPk51AYARhDcLoQF"
-    "FusrNBiulGOjUvai24AHaxgum3hwFKgpPIcLHE/lMUJHGO7cWH9IvZwc3vjqV4Z/jhdsixXA"
-    "f/reB8MZjJt1PGjO8Zs44txZPIxsyaFYbDGEbFvti15MywtbcNhG/09ua4zwjSsbhIKbdUOj"
-    "zhMZFhjudVdv66hDhS5AcARiViMZXsVYAsAOjazGkY3WLLrbhTfqjt4ZtK2wHuQift+M1Lla"
-    "rmx8yCbTq8y5cq7mjWt3hrfffm/41k9vDK+fY4GVJ0WQsDpx1GO8likfwFmnNXDMxxqlB7I6"
-    "DEVH2gXyk0blIZW0VQDLvOqJ4TLAD/4wHICpATOGbNpxDABhCAj+JR7xXbUcr6jf4Ff2EuNr"
-    "4AFLkBpSlnWMPngbWMZBnjK9g0fbZssnx+74zAXW8En9IT4mq/bPdpJSpBzbcBceXmUyvAAH"
-    "O67Kt++2OU7xEUc7DxpHIpUOPzD9bjzj+3uiZwn91Y0S43vMnXXfESnjalBJV80LBUYzuMob"
-    "5ZQSF85ocBUe6kXjC0MbIuFp02uOdxnyxRbLS1pSDJYbcDTuDdAW4WtkUXo0Sr18TvlbNspC"
-    "QvkDHEGlfkObMOShl3xPPnnhT7E8PDderoZGNhrtIREo47cEHUgJEoYQkysXl2wAVDAIJ0KU"
-    "qEngUwmjCKRAFTSEdw4FMT/HvAj+WQASlR48hW9v9yhzKc6e92ytxggp44InKEgbVpbvujW/"
-    "podMo/E+xZyEXRplC1mExxBWG2x3hI+RYuLGFNN0izKAQVXUUmnJKwpT7MJ041b+iQuMZ147"
-    "A/OxKhmQeAsnuB9Oa6QO79nwGHkAjmBbEcUDvvgvE0tNykXxQx5KDsGLMUG8kbJJjJ5vXsQ2"
-    "KDxLg9+KzhBDEivSxETNgckZVqFdWqvXY4Vy89FA51uvSAq0uFhhwGr4xYefDheZX6ehtLa3"
-    "jqJ8kDI9zcac0wyr2QCKtxNvLZKRUpIulZCVE2NEeVH+njInIZnKLjJvt8SzkTK9Sl5g5RGp"
-    "cuZDlSP3UCuf+CdP3TspdEGz8qIRIx+E5WW+rl7zVa+qmWrAqiCkV/s1MhQFZ1LwsIMBPkeY"
-    "KySvlR17m7JROOIdu5cXe8MhprJLelc3KoSFA+mML8aRBflh5AKkfJJFcOiGlhmkrE3HRxsN"
-    "qDAw8cbpuAgjuPG8q1cy5Viwo4yMDN9V/MaVvw4r+iy9yQsczNsfwaNLI85icAK+2wrY4zuK"
-    "R+voUWnSm+U+aS4AcJ6Z+2gZB2UNnsL1CBINmRUMKIcxFzCw7NW6ZcYdjldRxgY3+cR4crNH"
-    "PRPreFXWSHOfLSM8mHiBTYwdIhZvzzN0M9Zr7IdlPmfPe/yTvNiisWb+FfN8bJjNW6VrmVjG"
-    "7rEnX7JwAhpp/zPPy2EH52+lfjbCq6dPGwlu6SASX/lyTqhlZAOtl8tVqWvMm/MQZ/lrMcrT"
-    "lAfxbFx2t/GUMcx66vgsO7K/xdDZV4Z5J69jSHme2xpnqjpv9Tjbz8zivVU+IUBQ1C+9hA6L"
-    "cEYeJ2Lcu3Vr+PCnPx9+8u6HbKrLeazMOTTTpaUZvHrHhre+8rnh1S++iseLuSUYlE8xMl56"
-    "45Xhf/r93xu2/vfx4Rsf/HQ4Q0d1DR5qGNmTB03mxJU94KrPkUHRJHUbw4vDSuO1tE0nRspM"
-    "w1t5ci5K2gielcFpNp2O15k6aIfHTaRrlR+ebr7P2YBiCGpc6ZXWIOuGWbw6GCryvOTZMrDs"
-    "HBJ8iMy43cuT4ec//WT4d1/7Ad6pp8OvXXRX9sfAKoPP+mb7YVGqP8tjYX1RjsGXslPmHa5z"
-    "vp0R7aSXUW21IrU6yn+Uue9eRWPpAK2pFLd1BTlXF1Ch+UO+/JOH6v1dOg4aCmkj8aBKU9UL"
-    "vSzGscNS+QjP3NVDSc93OwO2n56VavwYbqDjaAGv4F11XTlL5xkY4m5c8wWpyE50L/kEBshK"
-    "rx07OwLWEztBenS6ceQQmYbOPjIuXukMAlPDOAYTPAY16pueX89ptZ1YpAxqCE35V/9arjF8"
-    "eE+dCAwtUfWnvIf+lD+4klE8jZST8uM1Fxktnom7l+Wajr8P7ZLn6pDcpF+exsAEpm1ALtNb"
-    "7vLcTgWEAaPbC9Z1W+GDq5d1kgV2vgGGL2aV9MmTPxMSWFcRm2eQTuRgTUjR0KzPsi6TLvEO"
-    "8jC64fAP5oM0D/G0mAUMSvbAkpjywJCnDAX/MDaZl0I3MMrN4T4E2ngyx/kL5mHhxXMjDsAz"
-    "TKaJg0w3brxohNW7TCoaUymAZzj/kzZZS3Vo9Y/P3k1jnGIDt4PLQDn5H73ERxyN6J9qMOv9"
-    "UGI+pXLR8HYjSzrqEM4hQ20Kbnofwf1wwTc4I/zrHSpSAeW99CRP4hhurzwNBVGhkj96DnXN"
-    "4q61jBQu4qpkbPgtj8Dgbvmd5EBtvUsPH97Fi8BmrwinK/muvvIqFYghXTJz0YMVXiNKWrys"
-    "mOKhUaw7WGVixd+l8o0QlE3tsuLY03Qo03JOuZEGyioGYUYv+gRcMhKlQqyiscKM57spXEpr"
-    "uYBkkx1XYik31QnwrE1pLrpJqFXOf5OIv6JblZr3YFIf3fdG0QFsFFHyIMJ+lLxyhSIijh2E"
-    "Dme00rG5zoVI1qFX5WsP1rDKpxSmz5ljwXdqBi8HuAq3X/I3cmCeKCfrmt/lJZiOFLf808Dy"
-    "bsdHI6k3mB1W6CJtGh4alHj5iGtZ76HMpvF+uP+SHk3PUnzCKlMPCzY/47r9gvLgZHWNpTWG"
-    "hc6zYs7hRJfZP+JAY/OwDJQJlfUehpvGmI263oHFRbcmwAvCnC8NoWmMOndrN83H1+7GaHJB"
-    "zRLnxp0+c5r8djj79D6NN4YQsmwvWtqzEaiygNyal/OziBL+6MmQDstKxRuZa3hlKXwKpxq1"
-    "arRgP3E9emoGb5GNjsabqwS1tEt24TmvNkbS4fy9K1dexJP8wjDDUPzSqXPQNYMnZgPDnRXT"
-    "dBhdBQgA/lejI5+lZ5P6toEhdfv6zeGbf/at4c+//j7t0irD8E5S12jYGz69yb5TH+wNb//F"
-    "+8M/+a/fHH73v/yHDPnj3WdTzVmMrzfeemv4/f+FLRb+zdHha9//IZ4sPGoYuE+Z1D8Nz5U4"
-    "h4SnGDmAbRhcyod1FXlENpUlSEgdGh/3WCd1vngWv+SLcqf8yz8bTcN818iywSyvYgSdbwzP"
-    "mAZajaPnfJz3Xuflg2X8FONtfe0xv0d06DbZtufu8M23fzj8wV99OHzh/CyGFYtPWH08i1Fv"
-    "Z18DvQxE5ar0h+WrPtJ489xPy6Lm1KFVqB+Re8Jty6L/oK6f6xhjQmopC+ny3R+oyYLRu3Ks"
-    "DjK938VBuvq7aYUhT5Tz6BdAqFP0EpVBoQ4mDu/q5KrH6A103+5uDWeZTwyCMbc5sa2En7nU"
-    "feDIT7kxfxdDSPfk0dqVvZeHiKvn1P16XAGYd2FnlTVpNHT4AK52lKp9Nhvrh+VuejWKBlTa"
-    "LeLbefdZOv0+PgsFvHfaDeejYAkHfn9VeZL5mMYWdSkXcfxe2974OYTn02HjU/rTjpJOuklS"
-    "vBOeachMHIVfvFLSrffVETdtx9eykNb6nlvSkTL3IAQ8cwktLQ/zNEo8WPnQI5jODPyaSIWU"
-    "CHneYHrvVr3QJtBemBW9/7WHZW8uTAeUFVN3rsKlZ+ApytIjUJwAalbOtZJ0iQ5wAuWxCsuz"
-    "0wzXqg7Bicg3lFQ8D0h2KgfMqEmexlX4i1GCPIxnZ3LdOw1FZyvrQiPE9MwQHh9lS7uXEWQ6"
-    "0TPQ3999yWONRP9VXIkTWEhL0nwDRmL5zf/0pip+NTrmkLIAVl2G9GdDDuPTvlBGyBzpgG15"
-    "Ed2NY4M3KTRyLKcqY3surBKjwrtDv42eaYEaPBQ2K1i8OxggZ89fytwKMXDuicrJSptDm5NQ"
-    "I0YFbSWRslLIoVHUKf4Y23p5wuCIrjolPOEvOKsgdGuXrCgD8sRf5Ct8JbphVgjKPWWjbjIu"
-    "rNYgN67vfrMsaq+uqlhhN3kGP9PzZHyRMKxfvSyqEaiySTzyrnKRjDJETdPx9DkyIC2QCpZ8"
-    "I7ApFQLy3SDTpEGACXqmelEbP4qEOqRtGb4RaBr/yGfhxoASh4QnUWDHGAowG+miTZj9lzIh"
-    "2AbafaYOJoAXB5I/MF0JKFMMVbmKjHk6cdweo/Ov1NEajXvojE220JjECHLu5fi4q0CJDx8s"
-    "TpWvO5UrmzFEkDeHGdOoEecox5g4B3OSbRmOjePZWVuNHCxypMrtO2OsUPT4IMu76LjPAcWz"
-    "j1gV+sitR5BV8p3Yq0nhNuYughFxe+Pi4Ry7PeaBleGJPoIahzX1gmWuKHwMLq0Q0iEEVb0F"
-    "Ro7xCmNsoG343Y7Gjp8HRu/h0dzBC+DqPS84kHyVxd2n5EU6G6Z44qF1nE6JheZw1gIrqWNs"
-    "wGuamBgazgX0eCvnO+rhus9B53/59W8Mf/SH32EvO888ZEtQDFHLcYy8XSW5xJ5kmxgc/+f/"
-    "8TZbgMwOv/27/8kwMaOhzZw3Fql88StfVGLwIM4M//o/fIeJ7xPDCltd7ONhm3WiP6KGKCAj"
-    "zBeLh5LGmcIVq/AMvN2LzfKUIcpgfvLIRsyLMGW/Dxdad/QMeJ7dEYaEbdi6ZyMrD2kYq96U"
-    "jozMI5PWf/nrpqHrayvxWt349M7w9a9/b/jRB7eGt15gVSny4RxVhzlTfWmgXSSRjaLRL3qu"
-    "1A/qQYe4bScyrI1hKd7VbjQvEDhrTNrpkD4NZmXBToKX9UncNI5ilKhX+DfJJPox9m+LgJCX"
-    "XiT513mjrAtXw8EwC13HgRveWse8uhcoX4Ghgaas9QjdaxTvHpHUPfJM3eslvzV0zaProOiV"
-    "Fs/v4m6cwKT4+pCjearnqyMacHkXN0sZ4Iop3w8MH4LQrRqahPFsmbofYUWHL0bgg7ZFzUuk"
-    "HnKljYY3wqS2EmBYxVWvFE7VbjkUKl7C8idPAk/IvFufpZFIQqYs1fMomcA0zLR2ag1TgtWt"
-    "7Vm4qkTyNIHthOfM2pmpsP6NOzJU6kA8jR3NGRlJ/sCuO+UmwtXgENHCThr/tEgBIfJFnAlz"
-    "iCMEpfEingVVVxGe2fZmq4Qbj49l/Xo3CEZIr1dLS25mmfxllsGGmYeGlG8VDuPApQSK6ALk"
-    "s9+8VFi8hNkq76QnTo21G6PoEr5pTFZJzbPyMzcv2Vb/i4HiU/jWe8Ey6CCFYT08QHwjyDzK"
-    "IOvxCTA/irmsiYqdOPnUYEKr7mAnOnsOnOWQSoEgRNn3TLhb2eBS4S1fEiZNlDF5FY8KrnD0"
-    "jKnki6+SarnAM/nS0od+njOeT7g98eIDQxUYZk8wlMcYSkkvJsMYGMSO76eyqRRtyCDIVJal"
-    "ZcG7/6xoacxTAHBChQP84JlKZzJzs/JxRzmEj8DQW2ke5iveKShIc9lzDB7AW9kbF9klvuaR"
-    "9fS1F43lUpXSbQr2Iv9gFtSUd3CCJlBIh2A/Biof+a+ShJLgkfzBV/qyjwo4gWFojtwDUBiR"
-    "ecU1cYEPHMgID1RGMTwwfKp+oPxIkLIhvcVh+nGsM3vXeslU9rl4d1PBXi7pbMgL+SwxXDb4"
-    "T2jUNDCyczq8zLmd0KFBYWOY/KHJ8pFv0wwbyZcNtmZYR9HYXIZF3C0/y6XK1jeJ4QOhE0wg"
-    "1kPgz0ZxfcPe9gbzrEqHGKYOUa6nmVg9qUckaFaj41YB8s05WXrB9jC4tsHBsnWl5fq6hsM0"
-    "xgu7uLPVgF5U54k5GuAxN25OC/U0WGwcy+IGt4U5Oofyhonu7u0ROm7ToWza0MkP9/OyjEwn"
-    "8Rq24m/nzs1R/eiO9hpWHnYfWuGNxpRwEJBhDa/JGhPyJ/AS7DPvbIo5Rxoyynz0EnC7kWtZ"
-    "uPDi3t1V6hurLKFz49E9pjicynxDy2KHTTpn2JIhFjk1wPq6vcUq3VXmWzFJ/8fvvId36m84"
-    "Qky+uhhAb7ANuwYvtOI93NtjCBaP2tXXp4b/61//BftpnRxe/9JrmmwZplP/f/G3GWrCmFqH"
-    "N//u2+9iZFVjHaMKHqo7a+85eGq56hGBrvKml7fHEUPPKg0HM/wKFpYp/CELCc83G/xsMq1n"
-    "z2BkwTrmwpNMG4FH6ivLIvWKuYsW7FOGNjfdjZ2VtWssdllhw9i/ff8Xw9tvv48cbw2XL7CK"
-    "a2c9c8cc2vUQb+eUaVzt2tnA6IonBLg2qnt+Q+ico+RqTPNzddoCcuJqT72uZTwVL5TPOYYv"
-    "5Zf1Tt1Q9U2ZtdNZeqIbLdYb46qD/JY0VOAKwxBpYbYdhikfmZPFs8ioF43jpRHSjasyqExT"
-    "6arNKrhyLLBI2+t9jAbziGFVRkT0iPlwpd5V5Sv9JE8IV7chcCkLYdkh63nJK6/c+ZPwChKF"
-    "5B3eGNZgx0ZI3AQGf58KlvW/6e2EtQx8ls+mQ2LdY9DLN4LrUsf5r90Tl/iJad5EFH9/yYt0"
-    "mdqkcAaIgPr3aksSV+h+Mj7/ApcyMm+/G+rnXAImCFGvy/zyhI7+H/6bf/yvSMFrA9JSWagF"
-    "oaIKI0LFQzKT8AbP9wJpiL9mXSaukSosMHkWlpdpknMQ8qnDEZcDAfC5C455ZXiw4Syx6ZGQ"
-    "WqUSrFq+KZzAFHLHrXI2dyjypV18DwrcjSpOh/I4gOvHuqRDfCqBSQRgWG7P/TGwKkCnLfn1"
-    "WCQNP5JvKSPpkm57d2vs7ZK5CyzjtwHO1TIqDPjLewUBzAffJSaBCqWV0ndRAYbvVLwYq1a4"
-    "oG+c1qtJUmEahnD5C6xOZ32T72UUoBI1WISVLCRKPvLSYMWwUzsTEPlOpipsG2EqdMur88Yy"
-    "NG4Zk6YBdvBXHkvxyPf0VEiUHg/5CUellJ4136U9vBCZIGQcQJvGfzz38ut556uwhae8J1Kl"
-    "MUETUQPyPelka/h0AM/GOlfDK/Er88DWSBRvqANnFDXpiZqrPAP1bP7+GsajMgk5jSZpaLmR"
-    "SL7I2/IqdiUkr93tXf64XYIblCoXFosNQeglH+VCw2vecwhpVOusQ+arEM+J2dIVg4EEKVfu"
-    "lbbgAApm2Ig6R0rDvDAnVuFFQ+d8InvvM05+gv7MASHhJo21DaS9UHuMbtfw8MEqxqCTXfWQ"
-    "VQ/1LjuvZwd48HMY2saspgrgwcEQclI13Ug8Gs4bYUI8Z6Xev8smlAzD6UFXLjyfz8nf0W/g"
-    "rFfL3rEeTjdG9sBqy9od7DVUJ/VgYESknMhTA2qPBn2dPbD0oM+zMi+GNZ6LWVbVelk/MhkZ"
-    "QOblysM1Vgd++ov7HMbNliesdPSYKmUhfGelkpkqFylTeKIh9wTv1SbboNz4+Nrwp3/0LeZb"
-    "rUCbKwk1QEGLbQ/keXgMfyk+npl3Rp7LzF2bx9h64TLncrJtwhS6ZJo936aYUH8Unp5ka4hp"
-    "PDnf+8Vnw+cunmQLEDbPBXeNzFXmWx1jGx2NYTdp9fBsFycoj3p9LHdp1qtqYxjvp8YqYXq7"
-    "5a10FW56tUufSJv6JnoIY0RDA5AJi/eFBG4Ps/roQfZKXGEfreuf3Bq+++0Phr/69s8wQpg0"
-    "zTw/XG45NWAKnIRdl7WoOiKG2fEo/WfZ6XlyIYlDYrXIRwPPkxvc/iRywXwjPZnioYfK5fnO"
-    "R9JoigHE3ecuKxpIwjNMmvIMzaWnNBDK4Krv0CkzuGwPTCtzxCv4w4Sq7/Iin8Jjk8gf+ebP"
-    "K1B8HqUpuJEbYEt39Bdxe9thHsbqOsX38uaQX+D4kfran+GjV76BYxKHvRUevPgTPR1UpK7w"
-    "qKSNnkT32XJW11R4AUwWybPeGx0GSzT/Td6gju4NtUr8K/52WhvbAjNhSVM4dVjmM3IyJEPz"
-    "L1zjJDiESS+H8DTRiEd6Da4j//0//S/+Vc/QzJ65iBDFgAKpbySEuR3RMCiIGFFBqMohjGKg"
-    "cZ+B6JcgakNZPOsRGtwWveNinChve71+44/fuoAYlDzax6RLgOElRMapq4RShtjIxMM1ShwA"
-    "EkwW/nv2Artk1ECPPnY8RwEklJ+Hf6NvQBVvACX/8mgVj5InDcCIv8Qxr6zgQ0nZc5tnWEQj"
-    "q5opwcg7MfVeVzAnvGij0vA9goKCTx7GF7lR5Sm+JzXB8roqpuCpMMStsMrOnHz3KlqsdBgG"
-    "umtbmQYl/xC5ZIKHjiLwjJf40piKzsfGsOJnYVr0taSmFyQ4jXgu2PCggPdn7yrSYAnc3I3S"
-    "0mq0mEy8/RYQgv974fOxfQ+s9mzDb8Mgr21wbUCtL/FuIV/x5AHcoRCCUWDkRZNVfCo5QP2F"
-    "rvA4vBc4/4GX2OAY+JmDRVxgOQkU7PO9sY0kpdx6ZRfPXk48kid4wBOXbdtT38Z4cdd4jSsv"
-    "50WZ1vKqe5W9BtcpjpTxOBs3X83wPg3utMNexfakD+/JVO+yOHmlEbKnDkzrm9MGlHk9czbA"
-    "5qNh4PmKNmTKpI1ceQPG2YphA88SBg7GiCsFVx5t0BBxaDx4ZGsD+L78YA3PkhnCAXq4Vi9p"
-    "8ZiezJkhLxtHG9HHrLLz0GUPo/b8zUW2CXFCtZfeF/NyWoOTrT3ORQPPSfzy2mFIh9FsHLuc"
-    "a1DsYPTI15QWdw8ad3h8hq0zZvBiiVAMC2jNvJ7myXFS9ROMmVXmoP2bt78zvMpeaifZ+V1R"
-    "cgLwNKtmPXYqTAa4w4XubeXmyo/YZPl73/j+8P/82Q+HEyfsdbvQoLxHymTXIWkMgZApAMRy"
-    "qOv9H91kr60rwwkWoXgo8zRGlps4u0mph2GfOsWZmuDq3mTHltj7DVed22/MMXSoASifLatJ"
-    "52iBlwa2HSMZYBkrc8p/jE75Aw/1flgfNcj8poy59U8MDcpHfB22iZxLMWHqPeFtY1B6BJrn"
-    "CD7Ca/Xxh9eHP//zHww///gTOgdyXQPceW8YNiw4sfyVI+uhpVIGAfmSX3UmqwMTjxKdGXWA"
-    "uJmXQ54zoY04gCljzyfli7v/qUejEB/8QnplQDihjTim9T3xDeddOah81QEVpv4TR+N6BV/z"
-    "SFhrv+RRfsYgLs9W/2DSkTEtsJIfaUW51+fENylXoyQ4J8C4hltpW749XFiGl1HWaSmcCD0E"
-    "TAANnyRWGwVcwRVTAiqryo8Pld74PB6+zLdfeeZ9FHI4bnuuOD3FL99THxoE43bwlQ80HkoS"
-    "PrR3nzNcmfxHGDTahKOwyZ+CYNn5NIrJQ5vkfjgLoY+i+JJLAYzw4lKNABN6iOwWi+wAVRkK"
-    "08zrU688FpbfVbQKhHHqV/EO/lbC/tcCVQZTceSQKFK3xKHwaBnlVkRnqIuvHQezynOLmnx7"
-    "GOCEk4nzPUEvCb6Z5IArvjUg/cOh19E3YuVC6cmz568q4MajEWJgQb7yWz6lUeLZMIde7SFY"
-    "UdNDBuQBr4FOHN9DxyH8kg8oZM4O0aIE0OTpbVpxCRM7eVw4FSw/KJzPl1KxpfIST9MkTxRU"
-    "qGwAvflNuIXXAb5ETY7EyL2UVPXW47UgVKVjuqKxYI3wE6Y8skUCRFcu3aiodAqImFW+Vhb/"
-    "BUYQzR++GiNR+aZ8ozDJ14aj5L4rLhuY4lXK0+QkJartGo0yhkTQIT0elUk2LAVUEgj2CJF6"
-    "tqCevFxtxGhRaElkE4gzNz0DoYtMnjLEoXHT+ShvpNV4rr7jM56lMFUUR5fxhdF5qBLQgDnO"
-    "XkPZWRwYzkURljAdGvHZxjj7o0FTeZGkD+K4tmgwWaybxkC6Dy7LS3o4UgtPinlO8TO/WeZl"
-    "OTzp5Pn1fSZiA9fhP5M7VHkbr9L5M0vkxRAzjfIU85FsyJfxWrkqznkszi+a5PDlY5xf6Oal"
-    "hp0+OT+8+/F9diZ313DqBjTY3rufk3g7aV6PxCaeK40ly9TG/PgJj51ZilHsxqCuQpQfGUZC"
-    "4k2roab06xlTDoofGIx4cSxUddFT0o3ZeFPAcxhscwxdmofGAxxil328Ts5NE5LlAP/li56u"
-    "vp8PaxeHf/+n32NltLuvc7KF2zLMPML4WyAvJhQD2zTuPeeRUCvL94df/OwW3xzCQUeIZ+TW"
-    "eqDBJW7qWO7IkEK3Q9oxzou8+2CLrQw4JucN5orx3aN9FKK5BWhhSPL1L72ZPGe+/s3ho0+v"
-    "s5UEK7aPOxmdyfAYXDdvurrx6bDIfDYsZeis+hTdojAokI037lHmIcf+rHPysFZvVTzT9HZB"
-    "2fbSCHII0dWOOaSZieyuplxn77Mfv/ez4U++/g5epjqH03NwZXOGmNUF8SrKXwCRn8acd3lT"
-    "+sHKWfqAhxav6hDB4UcfwhUX+UMRh4/ETlp5q9BKT/4duld9RB9Szl0vuspYWTd+ygQ8TafB"
-    "5QWoXJZVb6BFHwDotpIX44Qm+BvdxXuMpo5HwyH4inMiC4R01GXn+EWPy4dDuFSE5CZbiJyQ"
-    "orPDEB7BoJKrvDctnrd85C59vjQY1Y426gKjnqODW5xDUOqxRT8cLi0JDnzB+14Aik6f1dmH"
-    "Uz37nPpDGttMU1fUlk5YPhLYeXuQWtmouldc4Ev4YjkYy4ReDUC9PPOXfbAU7JbAVDKDnwIZ"
-    "KPSWy1ApBCrKKLsAS0PIU1m6DdGGcANpFg0f8kIJIrURwiDsNz/LTBP0X/CvsNrkj54vFS9x"
-    "FVSIb0krXd5gP+kthFI6PBHXfBR8mwjz6T9hVXZWApipz4fvFS5fSG988K145uivYBhYOBvU"
-    "jA3g9EtOdRyL15WfRlIqIspYZS4MlXKUkLTJI1JaDts0TC4Bd/WEjYqekczDAi89BjGUiO/w"
-    "Atk1egsDGwgDUW2kcbJleycdmSSPxmbRJ0713vQkJAp4RRlQucVNWCpF8SsDDSUJLebtodo5"
-    "mFaegHfPSxpqGIzGD0VqAyS9wikjpuQtMmcOFlfLR947REohJJ/Os1JmYm7ZqI+aPMA20wjX"
-    "X7wHxkqYgKU7kWhAXd0W6olRnzRolWdxF1ePOElJkMYG1gaiDA7LvxrdNC5EMo3eCze+E67Z"
-    "WD7u81MNS7JJrz97HBFHml0Jp+EhKpnzRbE4adpN9zKfig/iIs1N9CID2TmYMGGYn2lqS4hG"
-    "L99sMOK2l2SelR176g5FOmznaj7jRM7DA+my0cIA4vsJpgA93XHIy+0N9DpQ9kVG5AOoSZsw"
-    "6Idz8ABvFUYWJRecM5eH4Rblza0blC23ZtCAyXwyGPWAyenmceYUq9xYWq83qTyNNRlWI0Ue"
-    "3b23Pbzx2nm8T567OAyXL50efvAxq1iZQ/V0U6lhCAsv3QwwXJWEfQD+7rPk4fQajS4132N1"
-    "4fFaxEF51maYu8B0CAxvFbgqGx6pMs1mvG4+Kk0yX97xgacybI9yYHgMGcsAOhxC1EhzLy8n"
-    "Tx91ZRzz6ywfy88wea4xPo9R+Omt+8N5tnN4l+1OXvzLH+ClnsfY4SgxjNJ55GuOff3M2v2u"
-    "nvLTOHSvq7vsZO8kfI0rN0/c15j3mDIu87LMo/fAdJ8NfPHPgCc742PcLt9dzuacLsNXJx1l"
-    "Qv0M3iDl2cbo5dcoo52NYerbk8N7P/qYkwzYgPfJ6nCGDWDdu+vb3/6YeWgOh2HdICuwkHl2"
-    "HAuEbnJyeQLxdjk/E3McvPTelYzbE5GFW3gl3ZKhe4CtQ+LivCOH1uyAuzGs9WaNrTx+8N33"
-    "2ZX9Z8y9c7+l9dQHbTwn3pdRLX+lgfzJNvPyMISjRykX87F+ipHloDFjRGW96nuVj3U8xl4+"
-    "I01J5wuXaXxMWu/166+8BZ55mNFBOSiXZtS/m5f0avgZuXDKHCMR8jcCWjRZrww2T2+l7zp9"
-    "QjgI6zQZZr32F3zqD39bHmYeoImZLMW5p8sDfySzX113F0ziCluxU/b01AubFD1NBw/2DcTo"
-    "S/jT4yZVPrXv3noSH/uzD+FNa6cN13Odsu2RWlbtVroNzEzrT/2ebyLe+MoTpdJw8qPxzarh"
-    "Y1AL8266wsNbK8QKNeLomnBXUgvLzEWyzkWCZwi8lwLqzwpbCs+GUaSqEROLqiRY7QonsFQw"
-    "5WUBLu9BkfQi5XM1SK6aIG8qkhvGSYir0woujQ3xbDjEydVIT1iBaOUzXiqKAoqyTGNPWNFQ"
-    "DCMCqW3cqMngFxoIcuWK8TQixE+PUAkMlTQNR9FkRR8ZQMRPhQOj0CTdgVv4mdfhRkx8XG2Z"
-    "wpQGeQq/0uCTf2gib5WZWBovhilw5JU9+MM0uhu5DYQ4KQBbmygXnp1oK0z3mzF/vQv7KiYa"
-    "tjTmADdvr6xaQjHLX2GbhzQVX3rZlgxEuQnXRoS4vcejUpJ/hskHHpK3uFvewpKf5uX33uiL"
-    "o3jEIAQX87WR87vxzCe4gK/lYvnEoCKuBqdysM0Gq/LG8u9GmTTAatBAaYKbjbVDdM7hMU0/"
-    "tsAlxuKc3X7BRX4X/sBFyde7xmCVkXsYZegC/MTNlUNeKmRlNUaBxq6sxbPh4eeG2UsVPydL"
-    "O+Rl2WqMaIw9ofzIKLwUOQ0FFbkbC1qXfBY/61d5PghTVklbDYP0lawaX/wDl8baKxO8SWv6"
-    "8sA0ZYK8UIKMXpYBRUtEOWE8MWlY/u/QAO5yfiCzj0K/ZRx5FHfimpcTvcE8NBIbXtOo0XCV"
-    "3PKFOD7XwhOpjmiQxjrpBHHoxJPgMKF5TjF/x4YlQ4TEUnZtdJ3X89l95jDxfuqEJahcOY+F"
-    "eVn8tsObseFGtnbAQKEht9NBFPw/6gS2EwDXhTnnzLjNRO247GHXZMDQGuWK/Fs3TrD3lLC3"
-    "KafpmRmOWnIPPo/hqp3nM++JNHPMx6nhSY0/5m8hG8rYLg25eyV5tJdlHPmjTiofxrGRtxxr"
-    "Xo0yqUejJtLLg2PMt7Iuj8H7y5w7+MFHD4YzGA5/9dcfDefYv2sJ75qyteuO48jI0ckaqove"
-    "BA/1nkbaY+ZwzXE/MsYmvvBnnJ98869lEn0tr+HFUybBO2TKlqT5nq1YFAZwld4JdPHs3HH0"
-    "B4YqO8Nfff21HN9zB2NMGTjD5q1rbFTq6QuvvHp6uME5f1MMZVofXQTgkPO4blQlDrDKhdJg"
-    "+e/ryYJv6qipyYeRocds6jrH4gPlNW0L3zXCMoRIPPWGekBD9Sc/+WT47vevIxca1Sxg4Mgk"
-    "58kdyb5z6Fp4696IOEJlQ2Qhw7aRObBANvILX/iTq/ALkrwbxbzlm88Vpb8TQHi4i7hCWtrJ"
-    "xDGQy5vJelrvlrWppMXv1DoCrWMVz7wqFbc8cydOD0274HQAs+efMg5GxS/KWfhJYTlyWefk"
-    "pd6jDi74iBgBwrV+qastnxEi+exX8TIyVwMQXBJW+dYn6z31WGVgu0T+E+4Zh74SlbTLVkxx"
-    "BYAwOz49vdW+pr8or8XzwARe4ohnw6VgJPjQH/CETiLVzy8N9bpV2R2EKed+6b+iN8kIMo/Q"
-    "02JYNqMYpvO9B7RvOp7Mv+MprFEcX7gmHt67R2NURz2UYQSH+J9GjdhWRJVRliHTMNhQHm6E"
-    "A6TFUXkZT8bp6raRc88Z06joFBgbBl3jNoSZ2AuC9uBVwGlggWEB2eg4MVVFJRxXFjlk4KRV"
-    "Bdb9T5CxxLEBtxGzgB0uidKDdunycnm2K85sMI0jbjZcLsHshkS23Ufo7DVpSJiPeftdGtws"
-    "zTArvfibp3C9bByFJa8MEz9xtoTs0ep1WWenYvlTcMHFNOAcRUzDbNx4FzQSyEeF7y7T5pN6"
-    "hDCtPLw/7Ny5Hd5NtiEQjQRlJvjDS3G3MVa5C6fwZ0iGMuh8sZJ5KRj+xNewatA810x6Dgwl"
-    "8TeOtFv28k6DT3pM3yu6aVQBMWrgZdHoyis3nqvJxxojJCEvaCbOrkYueQtjQm+AZQ8c3/tG"
-    "j64AGqdRH3dLA/hQ/JACDQoYl6EA+Ec8ZSgXDcceRkKGjaBdeI3s4FhyjAg1uqVDfJ347Jwd"
-    "q9fOjsrfI2dsULXmNI7KIJRXwvQ9DR/plWFx6kaZcayoNewmvws1DVEbbBVKFCb1Imdogove"
-    "HofYslyciqgBqedB/vtLAyDfkBPn8QhTWN3It1GVpjRa3H1XlqIw/OZ7fnoeMNide4ShpnKx"
-    "7PKt0BxwAiXM3bBtGDKHiErnMVjmb1lMQoPhwsrmqdCvseklTD1Zj9dKlhfmqb+u0MI7pben"
-    "GlzqKeW9T7wTc+ypxv5VYJbtBeSJDWWG5KwveGxce3bj1ioHETMXkWFI99E6s2Q5jecgbLcn"
-    "sO4tMcx2hCExNypd4vydC+dOht/S5/WAuVjTTFrfw8ix03KSoUZPqJCWDTZBpXQYqnMOFXGZ"
-    "SL++xo7hnH1oQ+6qtmkm/k9M7gxz6Bt1DmILO7xb3m5RQz5EVSTGWP2oOlhjM0w7X8eOLXFs"
-    "Dd4u5pJNs+/VysNtPHisdmRF5Te//T51eWz4Lcrs5Dk9OB5yfg5DECMwfGJ4Di/XPB2sn91b"
-    "Zbd0J2Q7wbs1eOWjT/nbEbPzYhO2xdYre09rvpneuwl0oLt054is5nmwPNzUee+4naD94epr"
-    "Lw3/Gem+9m9/iB7TsDuKB/EBw6vszTV+cvj0+jLDT7XJ6zoypCy7D5rFr1H9FMN+m5WMiDuX"
-    "KzafcND5QzyjHMvzeBaDbh3cOQ6JMrecrHPWwy6ra2ublPWD4SFz704cV/5WY2xPTrABsp0G"
-    "oFqH0BRpC5TWg0aXYuLVumshWge8oq/II/LOXf2aukM8ZU29RhA4kMr0PhDPn5D8UBLk39Te"
-    "1LcjMYQSw1hc9Wx+iadhTH1JHSZEwzmwGnizca+78sBVPbUeiF82RS0w4VFHqfPJum526Wzy"
-    "aP0X23TspUc6EcRCpfEYHExfRnk993h8qm/RZ/LKNMIHJj8nw1t/PUllbKxGF3IuJmVMQlKr"
-    "f/B4M9SrDKof5Zq0dH3rd20F+ZGTIuwUbch76gXD/+YXA7Px0QBZ4JUy4S694iPxljUY8dFw"
-    "Y1U88+zxHf1JBCOnniRW4leagmUoiDaZacASKG1cRubRNyXAv4WHearDK43PExubtWuyBNs4"
-    "jaMMzF/GxMpFKFQ2e6zSUCacxEnxU7FgLG5BGxGX2zuPwvh0hMiAygatR47YuNKDpXF0Txr4"
-    "zHnPKuI64d58bFAdI7a9ncVlvsfOtipgqj8NdRuOAO5R9kspY4Q44Fo77qKkafC90HUpLDer"
-    "M16MjLiP9SzoGWOORAQGHLhriOyilKdo1BU+4Xj3uA+9I3mHiF3239lFEU+iCA3z2zQaQyaq"
-    "ROSlQhLBId8yJPR0KHjghRLTCzSDMrUhFIY8ixeJXp88Dw8RTBspARrH8khVBsYme794QrxH"
-    "TcyxA7ICrofBuOZN+QKjDAuFKZ4meCIc8xQX84jhQ7i8SSWEvpQxYb57uVWCedd3ACfM3kjR"
-    "GU8EsFRE3fMk3/p389N40SARhrhokFVPlXfSyZcMO4J/8rICA8DK5b0MFuIAQyEVXy/fTWse"
-    "qXzIppc0m5f3KCTg9vcIO0CDq3H9EVd+qDjETz4aL8oP2D6Hj82g8Vkm9zBeAkNDyc0MhVr5"
-    "BRTGuL1qKhp88T4NTL+Lt1eem8xIh4aqcpNn4jmvxR6/eQrDxjnzOFiCX+WpAeo8KdM0wwfZ"
-    "saGwYxJvG3VSZqaXBV+VpfRuiS85Qlexecl3h66EZVl2PPORP66kc06WG3FO4lFYp9HEvh+O"
-    "Et9GyUs5Sr7gUFT2cmr4iQ5eFCdQa+iL2z51vT8fAZcYf8BaXafujG3g1XJFlnXFeUbQTJpZ"
-    "5P7n126xUzrzleCZnrBNzsxb4lgbJ6HDuWGR/Z4mJ2aRm/3h85+/Mrzxa6/n2Bbn9DxcXhnu"
-    "3bk/3GQPKfUa7KK83UMK44qhwGXOW5UHJ04sYcDiWQcft6u4e895WtsM68EfdMAsslhzazCw"
-    "fEbXyD+NwSnKWb7IB8t/nRV4j5g0vs0RQlmpxlDkGY6w0ds2hn45ybmJ9x5iWKI3bzG/6j+8"
-    "/RPST7G7e+uAQbPlHYOIjuk8m5K++eULw//9l2w1sX2CHdjv01HRm2antc5RtAyVMw1cD+ve"
-    "Y2+mNXbDf51joK6+ejHeIzcDrmkDVYbKv2FzwzH2m1odTp+/TJkvsjBgc/jed7+PEcqKQxrN"
-    "1TW2QwD306cWhs9ursAX0sEz9kPQDodfrDzFWMVHiGHHGYmU3/o6jTL4OFqhAby+vg6+DzAc"
-    "OWAbo3uCnd53tjAEM/HfEyGQM7yBdpzn59VhdHrRzUeRB6onslJ3yzsSJ7MJLw3iM40v/yrY"
-    "v1zcrAcBUK95l3plS/mTX31SvoExXuCldcR05h2d0kAKtl+WP//bZWZNr5mO9D1t9Ivlo/6C"
-    "J0AMzBh3hGlQGddw2wRharwnX0P5Zn3reiq6UONC2vzen0xXgCKbh58TMfiWvjMT9YdX4pFO"
-    "3dHTBIn6yqNGG3gx9Kw3fouFF+trN+iAswAF4/8km/tq/NjZ4KEhFIICAZXHgpPHwycffcxn"
-    "F01QlgiOZx2fPHmCMzhfyBFPlbDoFE4gcJfPB/gE5OhPyld+EpJ4oy8+NP4UoGe+1MshHCvq"
-    "MzAkxazTxigbEvLcdQChPky8+PLrUfBa9FZQLytaDCwbYBoimWzlGFn9VCYzUiCq0dM4sCGt"
-    "IQ+t8Chq4JgmCElymANSpE3jQ9VQSRW/FE4VEA2TxBFXQ8krDSy4GNGCE7ZR9py4ybvCW42H"
-    "1qOehcJZWElDfJkjHPHsQ2UqIQvBb+LjZWPnJd0iKgxpN5942Hh2803j2/uSoalY3G20pUFB"
-    "7YJZ8EsousfHb/LYLE0jbK/icdFoOo0Q716POSXeMxaPnzgVOhTI/s3vwlC45LXlIj+E7RWe"
-    "kmfy5dsElVaaO249rflXV0Cq6juRUhbGdX8jCE/acQzTHClBnsGfJOWyL9otA4tv1zSktVzU"
-    "AWPkTxIevBEXGlPeBhapxIVf5k9SUXJvH8vcq9ih0iEGCVPuwEmZJ435mQbjI/GNY5iyXHKj"
-    "bNu4Vi6EwSsve0DKkvyKgaNSEwbwIwfSESKSBeEhghfvLS6wjGMPTxiFL+88xIBuOUVOSebc"
-    "np57eBQcrDOV1vylPXPt5Ec3vIJXpRQksZNH5E4+WwfFgShgn2/Grl/Hq+SPNhucS5nbyMQr"
-    "SFxh+U+vC7fwSQ+PV+aW0RjhCEk+NXlVLOqSXmnXOIoHj2dHNOWjKxI1uFPOvGfuCSm1Ce04"
-    "aJw4tKTxNItRZ+YO30xAE/285P3pHSZp82XOThh4uoWCaW2wnVC/tro7nMVT84U3Pz9ceOFi"
-    "DgB3btWta9dZMecE+93hw49ucQD9PBvlLrJicY3GX+873iniZZ8ucN/Ac/WYOUDWq1m8Rq5g"
-    "VH+4mWq8uYSLH+KeOxzF76B8Gco/ys6e8xQerSdPNhmqfJKGSHlZx0Ozzm708xxUvTQ/Pdxn"
-    "d/IF6P3k1qPh7W/8JCcb6LV3rpV1+hjH5miIHwWPr/7OW8N/+/3fGf7tt/5qePPSYjx5ehon"
-    "J+En/8w/ckwlcjftMerrDTpp/+s/+132wrrI9hGcUYhXrOvvaixMVbrPsxBhAvhPDr/xD76C"
-    "HG0Pn37yGfiBD+H38ERpdLuY4BEGsRPNFznY+6TH87C9gzx98GCT7R04hBmPoDyx8PZolK3K"
-    "Dgm7NcckHW9Xtk7B12065OkcpnPgCAZxKdM9jklzbpydO+uDelsaI5TcqS157mHWvVI23sm2"
-    "yaLPFcKdOBVeIdYx06uX5VvxhbQFIOkKvgG/6iKF/+vW5ID4BjQo5pu21DljrZ7nMzwS9dS7"
-    "0OCLdTfUJNycK458EU/vhNEelHYjK96LB+bZEIFF1m055SXVflVH5Jl72p8G00wPYIhHxTfc"
-    "/JXH5TsPhzu3b5E3Uy14t3N37/7+cOvW9eGFF1/IGbR9Tqh5JkNv1OONtY3h448+Hq68eBaP"
-    "1YlWp2YwotENCgiXdY7scomjV7+34Ar0bwL4kwTKvwH19/ly80uHY9J+Ga+DqefS25ZHXYRS"
-    "Xr76UwrNzyxHUTqwdqcJ5D9f09OlV5DMISzGQ0GJUnejyVpNo3CYpOJ0jKqBs5DMs6zhNAYy"
-    "qTVaxlEYFArnT0TIUWIHhpvuXhQUhWXW7vZeV3lAHMKxB9gFMO5UyaQ8ignCtyHTeKHC8EFB"
-    "cF6BXjRApuKIn14dvVrSaS6u6lFgZXHhyTtwih/C97vMVOAhwmdjy10vEC5vHN+4zN9PwYVv"
-    "Ck02OOObKQUhPkAlKRH9T6C8LcOBcHqE0uWwmvD0ztlIxwgkYnpVgVJpSZn5NsJOGYB/wgI0"
-    "KIZG6dP40tiUJnvHMTDJy/luxSlgmZ4w/3U67b3EICG8hgqL3vAfHKEyeUi7/JefVmyghQbj"
-    "Sb8Xj4Hr3Sukm5uGIWnMsxv4+U6E8J4EJgkcHqJ2A4M/8DIeML6bl2VqWBrAxCVdGsOSOyeR"
-    "h19AC9QYSzwLCnqEJWhhJSww67tDKjW80AqTeJGhls8efIXsXJW2nv0blpijPLL8Q71wzVic"
-    "kDNkdxfkNOzH2EvK4Ug+IkvIeeis8nGUtAHU+ggkmE2glzjAKfPIo/KrrPZy08gSh1p154rC"
-    "Xq/kv/+k3+fMFVMWCXCYUEMoCpp36TmQEVLxLm8se+lTzhjNS7j4u8Q+dZS8yxS2A1SeWXvn"
-    "emn1JJhOg2cSXq/h1QCC7AEOfCHeDA20O2s7FK9cC9M6N4MRcvWlCxw0fxJDzaGIbQw7Dhfn"
-    "TELjHcVQmGW/KnFexlhQhxzHkzSLgWahrbFycQdPnbMMHmJ8zc7qIZtiIvws+TFNgfxLCtUx"
-    "PFHW1qkjDt1DRzpz0SflAfPbUzqETzEw1pnecOP6PQyImcyl0kszx471q5uWiyv7ngw/u34N"
-    "g2wrwyW/yST4HPasHID7Pt6+Y/T0/7t/9o+Y8/Vg+JN33x9O4SlfZNuNNYwdZcpL3mksHxl/"
-    "OnzMFgf/8Orp4au//eXh2NlLeNSX4rWT/j3mPilv0XvoBNPPwitlcWv7Dh6zueHFl19kiNQN"
-    "PpfxKM1BxzDcvPEg5X/uuMdiPeVoH052OLfAofAc8syw7MYWcrzP5qBsEDqFEaVxPnFkCrrn"
-    "gA++x9kiArxdSLLDXLIcXZW6qdyoe40Pb9F70qIcRifDowynEFKh3MEViQrdKReFJCkUTINL"
-    "JntY6pmhkc+kiIGefAk7fHU9m7qgfhBg4B+OJaz2C1YKaUU1nVc6g60eVh1L8KE/4mh7YEfd"
-    "BOoBaNbTjIw9U6WB43s3snggOgH8T1ITdvo7ygBtKJkw+fpJQJ0P1W4VvgUb3kgKQYkbWAwL"
-    "M7Xg1u0bw6OV28Nrn38Vj+85AO1Rl+4NP/vgZ5lqscjcxiNHOHA7AxDCDARzrLrOCsuXP/cS"
-    "G+Vegk5lXy866ECHddjSDZEmNW3ylkcJMPCZ64C6+t5xrvCDqMHi+fIjSekq45kX/OYmpM6b"
-    "QCBcuJZTR+N5UInX/rBNQ1UugchQMxkRYIElY4Ch7FQS5S3CS0Nl8b3HHTW2pFcJlHGiEgIG"
-    "cHLYJnnt0huzV+SKl1QavtmAeMV4MoXtKxWqH80jAbtMbowSk2qEy8ZHheBlRZQhxYgWYoUU"
-    "f6IbzTFv6YvEEiWeHnsMRjEDvqUnLf6ZrEkkhzqDj/mkGa974yjmCOCaoLb8u+vWJdXiM3qX"
-    "buLE8yVSoRFw8pub9ypge7woaU0vaJTH9qq17N2zJ0YP0UtBACdJ5ZU01rvgw/d8UxBUQwba"
-    "kDZPxUhh8R3hzgRP4lvB0sCFLvHXQyB75IsNX+VlThpb8jR0AePgMk4JoPdUliiNCu9pnFcl"
-    "4iVDrSK3fKpnV3mSOzhWvokrQkGg8g6Cydz4GrLmbbkkEveeh+H1LAjjVCNf9BFQZWHKzkvT"
-    "mj8/eSitmPDwAflT+RNvD0NdmmJ4Gs+0lofiRpzwDjnTyPfSuGF0GljF211h2qCQJvgDw3KO"
-    "edzKSZgOvdqyWQbClzz1td80bUMuwSnvfCCIu79Ot56T+o4xAn7x5nU+gIfGlvg6JGdjb14a"
-    "SpljIvLtkhINHL1GPQ6IkFeVowiKpt804J3roU23wTDCUYaLTOvkb+U7egWAwgqJ5O0KNcvG"
-    "CdbumyUO88bhfZNhJLKJB2XRHdMZwpvBe+Lw1XEabT0fTzjqRW+ItBw/djzDUJ5dJ+2AwiPs"
-    "1g/Fn0kU/RxeJPf5qjrHSkK8VLdu3sO44pgfcNFgcwjSOWQamjK+N4TikrphZ46f8eM10tBK"
-    "XPHmwGkNNA613sJTtnyf8waPuLfXKkNua9Cyz+HVkzzjxWEuizvSX8ND8Md/8g58GIbf+E/J"
-    "A1maYYVhDG7mOl1hqO/3/+U/GV780yvDH//5O8NHnAl6El64RZmy4HDX8ppG+TD81sVzw//8"
-    "L/4r5lW9DoxT6BLOooMB4mtHS52tZ/4pRp0S7wR73zc3HtOYrqaM1AUuCthjJaI7uzvv8/jS"
-    "WOaXWm6LbJ+xeIzNSuUjTIFMjGJWAeK14+wl6MAwhH6PRprCuGWFFasXZ8LHFYaHMo/WepS6"
-    "a932GULsEWHAKUvWMTvk3hEh1XJo1dBPnYgB5Ie6rCZ+IGm7fDj43kMDCvlj4liCqp5TxsYW"
-    "thdJ5U3St6CEH35OAPFahql3pLH1KNmjLrV6UrBMcFBnfDOcEB/JO7df+hO4yLF1f5QXcQdv"
-    "GLAAAEAASURBVBNdPPlV0oYxgCqekKWhXWbAz7jRhS3DwJffAVTfR6lSHi7eGBsuXDo1nLtw"
-    "nurAQgyU2qnTM8PyPfabu/twuHwZ7yzGOVqGn/lwA4j52CbUnGO8oXfuMSdylbpBHVyYw6O7"
-    "AEq9HRL/RkxkYYQFwPplmMAb3fWY92TYvlXAQdz61kPJBX4qVMUSBUv6DTy41LSGpd1vfEtp"
-    "qW+5DkP3faIPW3jwbl0AhKkRKhncQqP48+I3FaPK1F/QiMBrcXulAYWJaeSBUY1zwMJcDB3g"
-    "oMp5LuC9N+1bMRM4AaUoFA4WcQl9IvHdCB07nlIxwS0GgRqmMyYp06MkkBQ2ePWtK8hRDoFJ"
-    "HIWKq5+lVNnA1IQefM+7TG7pci8WxICLIUgkgzy0NAB4KcxN1yESBjPE2jjSIsgymFR2O4xz"
-    "b3F3ro6NsoVcPc0Owfi9Aom+z1VhUGwIuPGKtwXXd8tBJeu1S3zzjUs+5ahRzPiPyHLVUG5T"
-    "FDSYwu95jCIZ0YoRmNU480KDQEGbGRjIIz0YwhW0CrTkqJdLwe28LJoELM0aIcApAWo34XKl"
-    "DCxr6bbhUDnXc92JJ87EM47w3fjQii4mJrcRN9xhS2XSihSD2CzphZlTZF8ZFnniWkZOPg5d"
-    "9NL38RaUQalRULSEd/IWGRCXHcI9RNd6kQpN/q6sIzav1XkpXmnESIvhhCAjOTAa3GAzHKlv"
-    "kRdp4J/GStGupwnciEfq8Ez48VRzD/z2TQOoGjLrKl6DyJhtTQ3TuUpM3jOlj7uywiIYcHhC"
-    "3CWMhqPxbuvtwMMMbLdgMIeWjSZnHqUNaWaCOhPrdyxP5zx6xp08F7ay4dCbnSHyQ25maIin"
-    "aIhtSCwTJ8ZmQUCM2v0c6Gw5urP4EdORg/NBjXft2sNh6UefDl/E8NJjtYEh84iG/Mb1O8Py"
-    "ssaWBtgOMNgaAmNE3eCwn88aJ5vMF7ID6vYNFy8ssfv5HHXQ1adOGmfRCkJRouwKQY3imh6Q"
-    "YU5kqFa0Srt1oeZjypYj1GNChuuf3RvuLDMsiGE1OamnSW8cnjpgPWA8dYGJ5T+/eXP4g68B"
-    "AzH9ym89Gc69eIVjfzRynEQ8O1y4emX4x783NVy5Ojf84R9+d/gWu7AX480Jw4wNRb/66y8N"
-    "v/O7vzG89uW3hoXT5zCw9BzVzva2H3sZTbBcthi2XBl21TV41R5zJM/aY+ZYsYfYg7t3h13c"
-    "eZbJ0el5OMWRRMyR2saD6F5PDudOYixN4J3a3JzAA7iFh+vx8AuMxKMYVm6j4aHc6gKPxaG0"
-    "OPLHY4Kscy44whDDxWkdzNFEVjB1g9Kj0NkxgInUIuod78qDBNLYG8t6lfaGv7lMY4nyGn3Z"
-    "dG3iyn1g+c2r0qY6Yywyz04DEJlzflE68dY34dhg8ZB0wFc/WMf8pcOVI5tauwge1n9xVR6S"
-    "1rzaTx2h/EffiISw4YlGirHwF/OdRR4s66jpDoY1eohrntYJyRX/0IBDQJgeJD4uv6Iz+Ut8"
-    "cTYv67GJqlPTuJEyCKDAMbJxvfwr6wo+L6IH5/WMvnDlSsEZmL/I8LTk7my7RYlOFA9th8/w"
-    "TniiWtCsZxr/4jEM1z75GODUHzpNd+8BGTivvvo6ntArYkl9Y+43/POfOJVnsyAJR2AdV4u8"
-    "aOz8kI4gbMxc0lGpfS0a82S7RROtXKgD5QyJ/+70hsPT8L1B8Vl94BVdKgTi1UajJvBDfeWv"
-    "b2ZgYCFElArLq98SYGBlRDwrgEBlSEHkm1H9FjjG7un84Ptzl/B7Hn5q7xni6O+ka+ZIYEQA"
-    "+OO9Mzv4+X44k0anYEZXgz96r8zrVfz8Xn8SdkCHH4zQieDO/5GhZ14U2ohNgVOgDj2OUgu3"
-    "427PG47R66WxRKM7IVTvlYVqbn6ruQm8PHfZMMlqFYMVK2znXg8tsngBI/l0BInoP+OJn+mS"
-    "F2XqP6OJY//xRixjeBVW9Wz4oavD6fn4ieiBFxg9LhGBH0XEXSFP1KQTW9JIv3HAPzg9g0/B"
-    "Se6kUfnUZNFSvoGXTBMjkQ3rfBembCrFqwIqBWVEz8Bzvplxgwi3Trnf04ukQVZpyvNOlkrM"
-    "mBlaR9HYA5dGy844Nm4ywnLvZS+8GG02LuKbnGyQjWoYeCLo1isDy0MVMMGj55201onkDy3g"
-    "D3E5s5CUwJA+0lG+wdnAhls3Oh0CVRFuMByQ4bjMv8Eg0itHYo1ycdWrJAyf3czTNBoLNsby"
-    "zEnOz1927PBniwA/4zZauVU6+SCtGFl4j7JyGfxt9Cwb53bJi2NLC/ESuanl5irbuTCMShPD"
-    "UB9DE7trw3e/+2PmAj0cjjH857SEGzfuDz/96U3g0eDPsPCF+WB6cF2x5nc9YJts3+AQiHO4"
-    "zEPv7gL7bul5UQZ3n47jAauhvjKq3MKB4T9kwAnfGpLTzNGanWWOGh4lG07NgSo/VklBzwQG"
-    "yBYGyxadpyn228rk6qagNb53EI5VGp1jGJif3r01fO2PvwMfd4YvYfRdvHqZeVjzLApaiCdJ"
-    "uCfOnB1eeuXl4X+8fbsOnCa9u5KfPH1mOH3pBVYknh1ml5aYe3UCWk6FrhqSQQ/QqG1tPoKG"
-    "DXZLv8tw3So/hoCu32ZY8PFw59bt4Sc/+pD8bRzhy3mHFycyXLq5WR20SQ0GivIBO+sjBdw3"
-    "hk8/Y0sGDAVL1j9rzHtzR35lx7lkNrpua+LigzXmablHml6svjJXmYvxog4ijVLUf4L8/3WZ"
-    "zoahXeqNg8vaUTANc9GIsqWxpx7oRkhv1w7SPfcUAiEx9RV4IGsulrpX3iTA+st7/azLFTde"
-    "XvUdsrbPKtiq3EkaWBqdaIzwIB0NYOkR9txT60iXq9KZ1nljC4Y4wvSf+ZdJWjApS9NZZ4Xh"
-    "V38dv+Da8EvBimz++wedSnnrzXS0xRX9k8i5bfKd2zdZ9Xl7+Nzr55D9OrtRT5VGdHIAZ08d"
-    "8CSARTxVHgB++fIVcAAOm+h+/OGHw4/e+0neL1winKkRXtJW/C0eFiz/irUogdffcRXdB9+j"
-    "W4n3S56pJPdPwStQnSPPAq6sDvIz78LjcPz6PnGAGB8bbAH0cBV5mjcD2/f07AmtCa8qOoWF"
-    "gkqDIvItYsPr2Xe/Veb5/GzUZykZfQP9MLiY3VMHLnFC3ChPBM6aay3O1WPz0oMMN/jwu2Gj"
-    "q33o3xt9id8rK9+qkIzUgPEYvoVXYDXCqYWP4B88JIsWz/hWiHhgmremTwbWwLLBS/zk+PcR"
-    "cFBpQAa+qSyotM9cBcWKZRwv885cnrzUH2PJ24phWNHRcz4gr2NVcf6uv4HRAf2K6KKjchOf"
-    "Llc+++OPGATnVDMNiPYtNPo9eYgzD8hBykPZkdakLxo6zJ6HOCeuDWFLqww5hCYXsuGnX0Aw"
-    "sOxdNTwFG0WXmAUn3jDfaXVkf2D6XgSGRoqa8imYKQtpaXJrtJAijQ2ujQ2WS96l13/io8yo"
-    "Uzsv7MVKX+b9hWUakuYDIK4obF7ks8CEazn7Ht5zt9dtgjEaQOmzrtvwEI0hqK60RQdzJulo"
-    "NJHP6SmMDefTkEjcTCvsw1eUHB8yRAD92XCRIb7ah8iGuvARXQ0cDy2eYcNPh5689HBpoDn8"
-    "FgXPzuJ6kFbZ7VsDz1WYq485BBp8FvDW/M27H4Jneehv3loZ/vb+o+Hq0iQKHiNhizlXoOf8"
-    "xg3KaoMVu86xWsSrZd5uueHZh66OmsHAch6ow2clT42HMBF0MMye4vVh3pQTt+kcyS+NQxsX"
-    "WDHsY8DJa79NMQQoTTuU42M8RtN4PxVRL3k/CX+eYEQ+2sSDhiH4GTj/+z/7UeTQobYzFy9j"
-    "wLFdAysK1Q27wF7kfMEXX3s1nTI5aNlM4L0bY67XHCuQZ+eJO7WQslEvqFO32fNqc90DlB8w"
-    "n2aZI2lWh+sf3Rg+/sWneKDuDffJ9+cf3hlusaP+r33uFHDGCXsIMc4JdK6Zm9WyHQ+G7fYW"
-    "Rxctu0P8MKywMGAFo/U420foUbSuaGc/YDXl7dsP4QNDogwHWTeWH6xjkLm/lcPf7nyv/Ljo"
-    "iiabOmydUIK4lVoPM5swh2Pt+XBQwlO07U8LeOYm1INEgo3cG4fn0gfPRPHLL18jMOAJ8V32"
-    "lZ9A57tRvLzLnxq2b/WDADV0RhoyQbQlgHbrVqaiWH+t5gFEOEa8xqBTqKM7SN/rW5oo4zXS"
-    "xEd9UTqq6lbacAlWNsUneKmoKlHR3vADa0P7dhF+s24dbDeDDqCMl9ny6W8/eH84fXZmuPTC"
-    "VTxCbGuEfBReUtivfYx0DP8zx6hXnIN5dJY6tYtsHaeAJzGw3kP2rtE5cGsVpsWAuz9Ri0cR"
-    "MPKwGCnMosmn569qoxtN2gUAiZ58LmIvN4OL9opQ6Z+PXPBM8+xlOPCjjCuOkwUattzyr2WQ"
-    "7yJDOM8m838BlfE2OmqEBFZaa0suS4xwro6EwvZL1/P4/VKEg4DDRPfQGFK8iNson+BjDPP/"
-    "FRn8ik+mrqtg+LfyJ5HM8IIxv8Rfg1ulsvEzQgkGGKo9n08AjzregpT/xolRxaMTzh0iOsp8"
-    "ECfNCsPJ+JmY/ffQVpVNuDSqNFRxRbfK9SzJlVfxycxLMaQWB5lgUzgrlK08/SSNfi1PhyH9"
-    "+hU8P5Q+RZMkz2IUXAw6lJ/8Cds6ftKtpuVKUfB4mIf1gbBEqHgJO/Qn8UFVXlk+FbXot/Hv"
-    "7zXhlZK09QSiPCj3LygSL3UDPttoOqwons6dcihwjLvzUPS4+KGvQBV65lwZDiMUixrHCyHk"
-    "ouTQ2EovH6MM+t0UKpqWdzA1b2CkpwpfpKdoKMOHJKQpOQsVjSUq7hiBpHdI0HSuKTkCUcLv"
-    "PLWRm8NztYVhkTkwoss/2RQ8SC8L5Y1xucUYKwMII4h85Eu/xBmM+2vycUWfm1TOzrrHnjLr"
-    "EB9GE50MxJ7LxlwjC4MB46ouPbwMHfqPTM3XM/c21jeQC+oN0aaYQA0lwBwf7tzHkNhiGAxD"
-    "YH58CyMQo2luDrjb7Irulg1uQ8E+XcS9cGGa/PHqbG0xefcYQ4PHMZRqDykPp9bb5Pesbg4v"
-    "3DR5Ylhn1/La48+905QXcdIItKEtmuWzvHc+nhuensUIuc1xPmM0UC4csOyMqRcLdobnD5nH"
-    "dHxmnzlZy8PX/+yd5P2lr2ggMb8MD9XSyTOkgG9UCDsEexmyhmswIbvUwye3XzjK8J3C4v6A"
-    "2VNLg5Jz/tY4MPrRg/+PtzcNzjPL7vsuARAEQIAkCO47e5vm9DKLZuvIY8uSrciWrdixbMVL"
-    "bMdxZU9VlkqVU5WkXElVqvLFSZUrqaSkD3FctmXLyUSybEm2FlsjzT49vU13s7vZXJr7DoBY"
-    "CZL5/f7neQCQTbLHGk8u8L7v89zl3HPPPffcc8/drrWzp060t157v33p/36nvXLxZNsCIgv3"
-    "OEphw0jbiiXt+vQ066bGsdItsrOSk/FlPJwXc2vldLfovBdj4y+vuIZqDCXyzt3hKL4sOCDt"
-    "Xc7PYmchVkIParUNLi5Yz+4cXYK2LNyyvUgLCWE74M/yFR/p2X94/J7cOgZcjV8w+hB/rZcM"
-    "Yro4vWK3XvatJn/og1BKTpQCpcXPIkCnQn61PGTFGkjCqec+KH1G2lLR1XYbeHzLx3KRXvKV"
-    "Lm0UOH1bLd/u23ihU4Ubp8rXx+oAJb3A+ODV/Zho7bmHEx94mj7IyrH/V+FR0Tr/wQft3ePv"
-    "sh5ra3v2uaexBnrJuTJRKzXgLDD/0tI69wghGgb+tG1ki/j52bx5inY+jrJ/Je/Cr2VMhouW"
-    "GOKMn9/66svq23rX111otpq08lqNB34CE8eSJXp0edVj3vuv4JD8e4BESjyxqLoLcvjRzK06"
-    "HW9VAjIxUqGcMDMPAONVwcwki/UgliOhhJie8EISGJYqMOUagiiAf3ZM1XpM1bmk7V9kOuLx"
-    "alR/S0ERnMQxnh2bHX356RO3yn2+mbJzvX//7m/g8Lsu2vrgPvfkmU62y7+L9LBkUWwSXsBL"
-    "4cHjvvKty6WjUVG14GfRKcAtnwefxmwOE0rX0CUCrGi+DlLlKn0cnfIbmuHrbz4PRHY6scjS"
-    "8wA4P4BnSoEgzk6pLn8idaSr3zXmXk/Q7plyhJ98FXYyrLAuxjqsFAL12pdVemo+do2gZerx"
-    "U4C7Nq1/F6752EFZrkyVdg2mzyD12JUvnUDoJEo2etNLX609JRj1s5PqTXumt8OMUhbkTad1"
-    "QrM3I286XXnc4wCEr0XG07MjOGGyCCaQkSeKnwEiffwRno0sTcUvykIHZSswvmtuLCsx+PWr"
-    "8LU9E62czRYY6fiM6Cr2ziW5NLKcxEmnTxyFl7T0xPKZWdcVleLldJfnUGktco2Th0OqaBru"
-    "IZRj2b3noaycdoQlIziBl+HDKJhLWiKiRIYkBAdpsBFvvvmIg0LNqadaN1V8W1M1XuVjh+1p"
-    "5gpiznwi3wkWwtoJinNN4Ugj18qwPpG7+SY5dJSX0IztZ8BFQ1N5YYailJtaOzYE76ywvsPO"
-    "z80DtjnZybv5XO8IajkLy9PcPc/nGpac3kJ/izVJ7vAbYDoHNMBFLXCFzkFaeUujuKng1Tl0"
-    "rs2QjnZIaZfQX6vYtm2b2yGmn0dRBC9eZ4oOOg6n0yqaWYVD8IFK6gzK3hamHc9wRc6/+PJ7"
-    "obuLzFWoPNBxYnIXdTImdbv6N7VtAR4gvQMDr2zip5Qwphq1Ws1Ol9XqxPF32jd/9432ta+f"
-    "aFfmz7Zj+0axSLEpYWEM5XGlHdw/HouVAwb5++a0NxagVJUGHBwXoGG1HKZI4bNNWBKtQy2b"
-    "TvuqmIIKdT/Ypmfu8JmBDsVDgvFuSmmXNUvWcfAuvvHbdrbKPOWNr86y6ix9sWK9+WzZfbvf"
-    "CcpQU/TBsQjh72BiFIQ8JijtMjHX0id+n6XeBazqFn/lRhwZR2bxnjR8+Ss+8SeaG6uosZSt"
-    "ZI9pjSCgituBL5jdd/zWBQSmxE0a8uVZK1dkDfGi4CAP3GkYOcmveKf8IkVBo1wa1zwKSfDT"
-    "BrNWHvlJ3JUFbgRROTp75nx7/71THM0w0Z545inqdCttC7lImyyrtOUBNXjbvC3xPAOL9999"
-    "nzYw0Z4izV3WOg5ygCx3e6PwL7Wp3Zuhfx3aneylh2jJz+vwARTOr2Dty33O/Na7orFx/fTl"
-    "4o0y+amyrsFLPa0HYCryX6WbYXn3ocsr+BXswT/70z/x1w2qDMlA5kAay1wikwXJZkzlKNB4"
-    "rIqQTDSamkKh0AgZb39Xz64dYFaqJ7SLiovVvMvM82+EYefoGVZmq0CohdBqs3amCqshiO1O"
-    "nBJqwldAlvXGyi1Lgrt96qDOe9yyK4O4rii0s0hVxvymYkR+3Se0t7j6JRFl8k+CrX4KTs9Y"
-    "Ru3BVqfcZyRj9iHGqUbTw6lYHdw+XmBVquSLf1+hllucPU7iyqXLOXit5rytRMtBPdhRd7D8"
-    "LYWzEyjg3zcusZLuYiXtCMonHVcHJw3QGNXTd/VUU1B4A0t8CKd+AEG8WuNlHZUFpscdgCBn"
-    "3jkKg04xI33yrI6sTMbSpaqi4mYaxbKoVFjPlo08soMIiJ62PX1zmgPqXCviXWROBXWX86as"
-    "jqyWso1cC2CmhOg8oyAJ0ynXrhyLzPVfv3YtHQXZVJnJWtr3AsCyRuCSLgoe5RYnIhAR3EUV"
-    "WomD6VwofuJd1qlgafGk7moXpXgpiDxg8c03j4cm2ya3BQZfwAAQ5U79BT/blPg6gABjF66G"
-    "l6w/68G8reNSdoITqcUXspGGJOBSx22Ab6YczMPczM9f0qIouiHEtxsc+neGtUlXOTFbC420"
-    "WuC2gks3eMfaYRtW4VLBUbmSjltRPMZZ1Cxf2Lb76dKC711zTK2xqNlPCTXqB6KxJiHtdJQp"
-    "MsvtFELoTh6lAJXipGC2LJK8n0Z10bidb8LIt5+GU8hr1XVKzBsjNtFp27ZtQ1p/vdfQtVFa"
-    "rxaYfnJxvtv/zXetAyilrCzFKAfeKWjZoGmUW7DVQufNCZ7hI0Wj4PGrsmfnEUUCedQfG5ED"
-    "g+UV6kaa+U3U0EwLlRYzxZ1XxCwxtXkr67eIb0y+pGWUfB5c76YC5rlf51mov8QU6CQ78jaj"
-    "dLkbb4ByegSCB6Zmc4oc5eAAdxve83Bn63tp4RbTiVjw5q5zafQV1lmdb9/5xivtN7hs+pXX"
-    "z7DZjwNesRTOc8HyVe6HrGnmO1xTM45yywnurJvb5NQmuJ5go4CF88iKRdssodKl8IcmFoAX"
-    "6dP/ykuut8v0JfS0Pq33BZQrn60/5YR8LZxA7DrlXlKmzwDOetmamGb+CCcqFb9+S3Y/mKCm"
-    "PVXsst4uwcrRyktetIyWq5QUI9imbP/yK3yXP7E2DL98w2ckFgfThqZJZxo8jYrLsw+p/K70"
-    "CfNZ3unlBUnILzD5TW7iVLH4LteXtyAlVvKwn8hmsD5en2D1vUphuuyUriyAH2QiF+2b7IMv"
-    "sz7v7bff4oqnLShKL9BGxti8wOGyKNbGiZWZPmKJqW7X8t3mLDh3jtrfXOYMrdNnPmDauizT"
-    "MxyHcuK94yje59ux545xEO+2yBVpGyKFVmBhWeMHhj4XWl2bqZfeLwNKvHwvvy59H0HIPPux"
-    "Nw2j9pxnnKRbS2M8XWQav0mbd/nd/ga+VbmlTRg2+Of+1HoFK9BSkRInnRzC2NEagxOIxKg0"
-    "W6TZrYNQdeRJc8liNrO9g4nXeXyqBSHj/DqmP6U+sRTLK4yC3Tnis8qWuHoIn6NHlaqbLEb1"
-    "WhpHSAt0qF4N4/UsMq5O5Gmu/NrxFmFnbl6l850HLw67I51KmPl1dCgC6YPHgx+JJ9OmZohj"
-    "IuPc53jtffowf6tj62NaPoH1+VSzqpR9at/WAZN7TbDeJSpfMI/0FxUZZI4zeca3uCCQqzuM"
-    "Y4CNLS++68Vbx4h5No4xFE7QRCFWiqw7fG62d2kUKltjHF4aGhA9goRULn69cO4cDeJC8h3n"
-    "7KAL5063N9/4Looe5wAxXVLHUNQUpvXn9Iwnfdugsr0fRXcT8W4gxN98/Q0WE49kmkWeyGgJ"
-    "XLWeZMs5eApDppQ57bSDL7/z87fayXffaR+cOYkV4Sqn/V4P/lc5b8XFlWPsqBpxfRrCepbD"
-    "WN9683WE4yidwVY6HvgUxV9lwhOrAR+KzzLVcfL9k8RhDQv3oSkoomDyG8XI91QNnX4SVScg"
-    "nfJKmDzst83ShrW0ON9OnHiPdQV7WL/DdSOpPyumpqpcuPsqdNDis3vXrvCPMFKH1mXqS59S"
-    "aLROaInfsKE6evEQpgDt2PuBj3hCMrw9ZNNjBlSEPLlfhcGOqhbuikdNVxXX2IloRdNac5YL"
-    "h13P9ARbrj1VfIobnrezvVor1QUOi3SacteOKtMsC5G3bxnhTKk6KV0LhS6dDmwvXJ+l1SQd"
-    "8tioO/wYCKHQ3Oak9ChI1H11rNUx2VHYCatYhmCUx87MHWeWQ4ubFh+n+rSm9dOE0swyqfxJ"
-    "OfnXcE/8jvWBulE5c7pxHsXIM74WsMBIAfMkOgoYUxzwoRc6Cw+ShX9iHYL+2VVI+xGuFspp"
-    "LE3iGIuUMEQUZ5mNqxKoBc78rRfbgnWkIqmCpzXMfAaRaSpYKsLuxptjkfc0Sqm4qUx1lMh7"
-    "wecbOrhubYI1WbOzt8HlZvP6oVGv41JpdjCAUjWEbFXpcYAjXxSdmOKFLxY4k2oWmXmNXYFn"
-    "TpxsL3/9lfa1r77ZrnDCfRtEoea8MHRs1lCBFziPQXNppfLo6eyW0zoeYofxCrzjFTk6qpd8"
-    "qn3JjvpC1njgDQxoCe8Pq1SlXm1bKuwq2BUmXxcfSQVT6fi1ovJefuaTeJ2vsT7KmaZg8u1z"
-    "h6x80zvbSwYS8OFmDq6NPDTLRKHe8ueLMIquPAZelBb8KqzC5Q1hOFCSfsbRSU8TJTzttPxr"
-    "cFfwjSeK5dZw7H0q30ongqFHFYx05t9/OtjBWWSBYBhtI67Pgyz6nKOUVES+8XWgty6yNFP+"
-    "zHMX5ttvv8vRItc5WHaME/+n6TMutYsXzrOG6oP8btnq8Seb6QeutW9942X4c7FN7ZhCVm3m"
-    "0GxkNGOAa/QRly5cbufZVTsADx558kDbu+8g+XL+GUwktn15pJnPPUaixWv8+OZtLcR45fTr"
-    "P53Xup+KZtw+vjmue10Xtx5t05VPn4dvfR2kzyA/w7D/9anrIR0cGqeNVc38EoQ6QQdnQ1BI"
-    "2Cl60aZm76UlF5FOtSNHn2i79+9FgE23t9/8Fjt7DrZnjj2XdSkqPO6kWVyYaa++/J2cj3H4"
-    "yJH2/Kc+i8DCHoh1wZN8b7J75dvf/DYXiT5PZW1tZ06+2k6f5Nb2ke3t+Rc+jclwiryZpoD5"
-    "a8SghW2lvUOHeg3hsHXrrvbJz3wCoeX9R+vKBCGc57bxrCe+MaKMdYQCaBrA+gYXKKFjpVdr"
-    "LYJWhfvew5R6RfL+oX9bJfBa/Qn4vgR64EhiZVt5KhzemZj7/1QcKZT3Cy4xGlU5VTilkokv"
-    "KPEq3AKp+6o4pbB4gTNWBZSPZawTZ84wcuAsnN37Oo2besoCbMokE19FALuD6MChI3RS1hGn"
-    "ZbPjSktm7gaEnPaHy9kRghLAOTceGDjEqesbuS/pDoJDoeK223l3QbKQUUUm94hZVMqjoiwr"
-    "x9qC8FHuaA0ZgP/s/FXsL5w/xYiGM1UOHUJx2dYpZN7LeK2dOX2a6xaW2bHybMo+xuGGx557"
-    "PsqVwsq1AUUXFJLcmyUNOUEb64n3QOqsQlg5nZLlhLDBSQES1oiSQ4dhJON3DcfwHM6JVcEO"
-    "/9pVLr9lMfG2SczjdKTWiXXU14mdxwTKbO7FpK7MRYGbnT4qAomrMsExAdCm1m5pSndn1Ty8"
-    "gGWEjtTG6wXTDkA8t2nI0SGDC8cg7sZy3VAduqny4e62xTbNoMYzZhT2do6IgtSxyotlvEke"
-    "OzjDaBylyfsfLaOKyXbOjzrKLp4bMyj4dK7Zuo4MWFziuqjh2i2oUNGqNcuJ5IJepv48VBIQ"
-    "DV2NNN4fqnWFBeBzt8LgWo20eFn3djawBQbw6mizm4527kV+oygSsYCjoMl/S1hehm5T0PC6"
-    "HbXC17tFUdCop7vAdds/4p9y4cE+xdvdeXTS17JbXpIHP3/ryAfwps60iG3mEE3rTDnokRjy"
-    "tErNAkcIzM7ModzPQ8tRBjsuyqfThIaJj6zMnyykADIPnDJTa56KlQqeeagojjKtNzbELiyO"
-    "pXBQYgXKYSqzIqeFS73CNx25hFcgb5vmyhuPcHjtxHlKT1lJ+wIwVztyyL8RS9YQH6AwQ6p1"
-    "aQPW3yuxWqmYnT11sX3lt7/RvvEtByRa/chk2YubmQ7m/sHbDIQsQhan0y5usk5sFNmqMmfh"
-    "qNZ25MDONoRyfoUF7daENI6iJY0Tq9qAb1nYj5IqD0Zpxq9kWClf8kENEElIetTFro46QuK9"
-    "3knrD7uHx/1QPJJW+oovH+Yfmpe1tvq62gFqGSxdlU8Z+eFcKr3xrDOVWmVZ+in4wzYi04mx"
-    "1VtH4hT+Rk+Vi6T86zt/4SnxFCZAe4VOGhtf+MZLWuN1f9ZzZA6A9NPlXbhG9h/ergvgu7Cg"
-    "ZzoCxVXXKVWBEG8j+V90cM2pg4wdU5MoTOxmRVFyMOtgd2CAqWrgWM8OTFZWFrmqaqx99gsv"
-    "sKh9JLsPPZbBQ2aPPvlk+qXIJpT1TV5Lh7xA3ci0s22s8PG7K288glmegldHYwfTltP8bZtr"
-    "fXxXLvmqL2OlLhpKGGWSfEh46Gx/kArtIq7+FI0lp6DyS1gw6vIOsfAoG3JCiBEcihEssKMw"
-    "O+VZLChPfewYHVzd8m6l28EsLrHD5O032isvX2qfH/kRrnJw+y6H5XF4niJBheA2jdsR9bXL"
-    "l3KmyjbOknEhqpdJa9p2HcQAAvTS+bOUhVvbGd3rnEL05vab1ziIj7n6nXt3Z5pF87FE8yLj"
-    "8x+co6OZjxDfgoXHgwZD3KJ4lVxgFLosab48zvWEeCBOVzerzCVVO7+i6gPxH/Uq+D7dI+Kk"
-    "ERBJpchG5YLUBdZhjYy47RzmgQksT0Y71EPyXwezr3DBF6zKU6aJAAs33EUJGYO+WwLTMC0s"
-    "MrOfamj3spNKa5Xb13fuPsi27J2Eu7BYxYiODQuR9yQuYPYVrFtuTTs7fQNFboyOn0W/TMeN"
-    "jo7BL5yazULWBRfYEllr4yamN5ySsVw2Np2CWCVaRfkWZ/LcZLS9Z++Btv/AkxQV3iQsaVEO"
-    "XRR7kaktFxZblnk68Dtseb/L/W4czhM8FdULczfhPy7KRuEap3NcogNxkCB/azXZCC9Jt2nO"
-    "/JnjupJZFArDtrCtXdwzBWMEXehYDde6sEE6xXMLnt61a0f4X/ydpqyFxNWxR0gDYjOKivgv"
-    "o6SoyPaCMb9UZ7s3As0YqLx9HKvC9VjwVu6MxLJ0+NDudujQPjr5ufblr363feqFw9wHZ514"
-    "IfpSe/udU+3ilRvtc5/+eKww0nL59lz7rVffbz/+madypIHWHItinSsAxxBo2znL6gy7uDZu"
-    "vN52cUI4hINGrEPBIjbFKHMb1iwHVsNYaLYwNfjGuZsoUVyAzsBJBeIGC55n4ZHt1KfKlUrS"
-    "Ih+Vl01qT8gCGdXjGoayVVXlwR6ilLM1nle4lSXL3YDi4T2AW7n3bgRLmNOvtoVFphtU3DxQ"
-    "VBws5215CnoKN2uDmMKyvl0yUFOu1bbT2YGNsKWB5ZIgnhQvXaozUzHyjCxQ5Mty5I68LOz2"
-    "vjzu+wN963Eo5zCZjrqEHypdtVEVCKcvvR5HC5lrt9w96GXOynkvbBeOvOhVOVtuskwexUbV"
-    "UJoMoOSqNIlX2i9I678MzjPev0jbfO+Dq23kK6/DdypuLKuA790GP7FtB0cyaAGsdrW0PJ8y"
-    "DzCN+MHJ8+23mBL82rfegq4qpMhoZbq6q2/ppKrWsr4OHAaWUNDgOxfze+K9x1CoOM4jx901"
-    "ukj9L4IbUVPbKloqia4pc1elV+o4uCFKPkaU//SrdmA6EnVlz0O95vHBL+E86KTT9+KSlC95"
-    "TZne/Ye2vnjMiAaFjSw7ke7ylHyRTzJ5VEZCFmb3SzTbtc26/MSuD606lkdc7N7L5jQXowVJ"
-    "YpNf0QxIq374R+kSp1IIUg7D4aeeV4Rh/uud1mAHdTAr3qRaJVofz19TWcaij7ADEzr4nH4d"
-    "vcCB5dPHnkaRIdsoIg56SqVQ0dF5mbhrT+2/9h+aTL9Oc6IsNTB1wGk/YRse5CRh+6GcBQYa"
-    "WrDTXim4fN9/Qivx7glicfgDyeS5/su6S3m78oRA62AZd5UGq8mlwUc5aWI8f80fB1y7Z+FR"
-    "LcGXXqADFHxhejsdRmwSLNM2KDNaJHbuOMI24C0ktmICiw6VkRevr778OiNtbqTfvY2TfLe1"
-    "s+8z1QfRBgbRZmlAWjnOYjHZt3838De20+9fotNjVDzEQjaEtluFL168lMPFxukob9+ezcWP"
-    "m7DUOLd75fLFtmf/Pho1nT0mbC04jtbPf3A2Uzw3b3BgHZyl5SM7vyRUR/y+DvAI3uu/rKie"
-    "MCEOgTLQhxyRUoFdxVjoxFsD/gD0D+cVmA8B/WBepTjJsORpw6OyFNIqlDJYdqPROMy/GuUa"
-    "bmnJADSNcXX55VE/mVjBpsKrUmAHMYIC4XqmwUFOdoYeKlC3EcZ2FE55+G4neu7USaxGM+3p"
-    "jz2N8rQ5cC+fO029nqHDnyEnpr727GcEsrFdZxv3E089zV1U28NwriM6d/ZELDtzHPboNJxn"
-    "pBw4fCRXfmStCpwZiyB4O61yZ6VbXMn77Mxs1kxtxkKVtWnsRFIRPHDoSRYi76NzUVnayPT0"
-    "jfbWd0+0Yx//GPyyv60w3ezulosXPkgnNopZemaGKWV507oHtunk83MfnGpXrlygI9CkrRI2"
-    "x66Ys0z57W57DxyC2ggX0lg/oTh8r3DUGjODQraApejAgb3BK8pVwmrELnOkoeNnh85P8q/6"
-    "AY5C0TpCoMxgKfj6179DhzfTfuhTz6EATeRy3bPnLraf/2ffaH/hj3yB05K3t8MHptopLj3e"
-    "unUS6xK7bhiEXNEyMbvcXkABmcTap/VllvVCu7AEjapQQjOupEsZxEGecMByaP8OrGsz7f3z"
-    "M+34pdm2A8XFOwAnuDRZi8XoqNZiy+sIXfW60rqYfRalYZrOdS/Tht4HKIurYOmvVSLlhTFJ"
-    "HnqFb4lVayhRhlPv0sPOVx6Ak3h26tH8NsGDI+CI/tBGWWd0nXVhC1wHc2ecaW+spiqBHqtg"
-    "GoZl2WWrbNd6p6IgDVRuxElrzIoZJI9qG7A2VtUNuWdQBbLvsFSSwRg+8DJpzqziLuYllJpR"
-    "1ncZpjwQX9uGSKctkqLH3/JqlZNHxMNzns5f4jLbbezI28ri4GHu5WN3nUrNBFfM3N21JQra"
-    "eaZZbri6HKfSKK4j8JjwpG2vuEi361gNuZWmfe21EwxYXad4lw7vaNt/5CB4gCNF2MyZV4Mo"
-    "oUuL8uh8u3LxSvvNX3u5/V+/9rX2yUPkSUfnujQVHS1sdcEyU+rUs2v5PBR3E/TxAFTIg7zg"
-    "1HsuvLbsTpk67beNwdp1rFge7torLTQV6svpYdfBcTgp8QhMGS2LA3SnCkNv3nXCXP2Vz+zQ"
-    "gdN5JyzhfEmL79uZnW3PTHDmr1zw3b/Kl7rtcLgPjwcRAFa/Xkk40t/jR7IDhbj2m1lTak2u"
-    "Aqp8koH5GSbbrYMtLsIrfuyUKfGx3VA/UdDE3bTrnOlsPxmQCy84WDYfO4/yxE9/87dfAQ7C"
-    "yBjCDFS/9O5hWLnGBK9SuShnN5DSkqzLzkniZH0kbdPpao01Gg7UCUoRU6GqXaexlDrYYckR"
-    "wwJ4zbTsCMbCmyVBhPR4OqgVwd46VfTuytaVJTjYhkW1vlIGy9b/lYe4rsH2BdImhfl0FBDI"
-    "qhMPnfkW3fglDf/QGxrSqKsfR4lMzO5LwtvgXIPjbfTe33WL6YU7HrTIict3uCLBqxRyTADQ"
-    "BpdYl3GHKQC27npYndyxncuITx2/nJHmKOZAjWSz1zFNc47Kseefw0IwC7FPp5ObYDrF3T/X"
-    "UKDmEUCf+OQhSxocLOXEll2cjTHc3njlrcAbw/qAFTIVdOn86VyU+tQzh+n436LBqghA0G6E"
-    "vL5cUisFlgRSob4SpQikl2F8pJ0ETDyfDauPwXokKp7FqOWXaH49ypGoB5koAfbhBOnEiagA"
-    "tVHJiJpivSrH9IY7OrA8vVA3YI1pCma06yQQY/wok4qEi9SdwnD6bJ5O8BbKyyKC19GItDBP"
-    "hbHrNTDd1EgOS9Xi/GwOkXviqaNAu8uc+oV2/M1XUaJ2teef/CTKGpfJnjndzpw6TafBmiiU"
-    "N5XBEayKrk+aYcfSvgMH2tGnn6AjWGjvHX83U8BbmYaKksMukl7YOv1s45nYsjXnqZw8cYr1"
-    "X69EmXZ9lZfjunZsI1Msda0C1lQ6Qa1emzdjjcAiig2CPK+0y5fOtgMHD2KB4+A7RlGu0zr5"
-    "/jvwDNPTCAXpe+3KeaaZL6HM72GL/tHwl9NLVzla+N133qVTGed+tV3UuwKrFulHmDLCVdG7"
-    "hXLjGT65IFdaUxtlBSgeqXpLrcPHtCForxLWT43aaSpghH/p8hmm7C62lz77mbZr9z7qQcsg"
-    "lwFjPVb5eu/EmbZz5w5OFt/TXv6NU+2FY6n8No3V2PVEH987hRJyo+3ZvQOa3G7n6FCfOboX"
-    "BdMdZwp50SvrgTS2o9u+HSWNqbEpzlGawyLpadZuvX/n/HWo0Nq+8Y3t4F7OQEKBmud6lyph"
-    "rZ9ZRolQiHg2lnJXtqaFoGyVUrbC1FhOhodnMg1kHJ6zXggeVlaaRrnjVGPeA8Ft+yXAnJ4d"
-    "YqpSBUiL1G38N7M+w/ZueZw+dRStnNK6ow6s1Ulr3TKWLC+OtqyxOJKXSpbjRPPz48JqFVCn"
-    "GrUExYoLIrYF4TvNAdIoIfKWwh/6GU47XD0LkPchPmlDRFYRtQ0qhBexYM2xXmUaZZfZD+rC"
-    "qROPgXCwiKIBDzn9vn27ayzhryt32mXqjlyhrR0lDyLAc8HlLR0ZShZteAt1++b7l7EwfbN9"
-    "4cr19hKbO5Ac0ErFkvpCkbFNX75wtr375on23TfPt8NbnUZ12naWenUjQJ1dFbkDzsMoVRJy"
-    "EBhRTKlnF+87Q+ERC955qBKsBVS8lulArUPjSrNN0GwEurp7sOhgLBVpyiCtaHc6/UwQ3vGZ"
-    "YkrDBCRQz3J69066rjoC+iB/14UElz7e/RK4S0Fk/X3L4ME6Rhm07p0uNJsMBsjDX49eET/+"
-    "g6O/gZQvFceSy4UffO5BmUSKFYW6tezmFwUJEBgp4cXCvxQw3lVWOniruINIdej62MLqXTyD"
-    "DHlIW7wTL/7CJ11obn+RdN23WSQPEvBQz0ke3JK/nqEPgCL7LD/8QJuSBrWJwzZSCrdy+54W"
-    "3cAVrDQDP5zyku882xalg8DlNy2ZobNRiO5RHRuZ9pZH1LmUpeZhuwxeHVJVEqCQuPKUJoK1"
-    "TMlKtDtnHDxTXAOLhv5Wfdav1rbAg5bGKlA8mTTA4xuYUcAqw8qP5+qTxYOMyc/2m0zN2GcL"
-    "T1XROEUA8/YiF3W6fsahLyMu76CyYaqNXrxxor337ts0uom2c88UQoPR7ghTKihNCuqpQQ4O"
-    "Y07/wslTzNPuYsH0jmQzxM6imywW3U2H6w3r1y6dZxHtXuZpOZWZ/L2v8C7ztpvGtrbxSa0T"
-    "CCgUs+07t6Wz8Vb68+dPsn7oIDC3wsRM/YxjXaMS79DIN/SVTAF7Mlq8ZN7/SOiuzGuxjCQl"
-    "JUrnVhPip3fe+VGQyNBdpRnbxz7c97zEL82B1y5xBfJdDLf66oOV5C/1M2BDh7n8uOV9hHOC"
-    "pLsMmQaEkA3TGF8HeIWcTobs8XUkkzIB28amlu3n1Ml3qL/X6agQ9O5CQqG6e48egDpZYfQw"
-    "NrKtUIZQTslMsFhxkDU6Hmp46sQ7bZI6fe7FHyI3OjjYY4xF4+46u3p1hnQocdSLdSPPPPHU"
-    "s2371G4a2hCKE9M4c8vt9KnjhNPIUhE21OpAneqtEc8KStlTKBfbOWH6CgrTDB3VDeCfD3+O"
-    "jky0A0f2ojwdAP+R0MU1OMM8u0X/+rUbdPxDKE4H4Y1N0JCp0W1TbWpqBwt9pxGklBfaTk9f"
-    "hR4oChxqdwO+1Ew9wk4pG5Dy6wYKiwszbeAKrLj8ugtOa800ZduCVc6pNHiXRPJUWCM0r47X"
-    "KVUtQlpxdbn7kt8shObXkd3s7ELbMbmT6ca9lJG1Yiu3EPwunPaevYn27okL0J8rYpgSn+Kg"
-    "Io9XcKH/FayGB7lvbsv41vb1V19pTz91EDzutfev3WrPfewQ6d0A4qhapukUGTsM4jiF5W67"
-    "zShFKhNbt1QZd+9coNNeaGevcE4S649c+C1fQZIoG7FAhFnBvWNlf1V25DOnWew0TCMvSDJ5"
-    "0SMZ1B7kGWmUdmP5FWrE1epVFhVzYiR7D/xQqOyFh7EguWPT+rEuemUcsY/cID8y11JrizOt"
-    "Gzs2sv7rLgqD9xPavem0Dg1Ax2FkxghlH2PKa4ypSBUdC+haQEfXw1hunN5igRKzzjXFKY0s"
-    "rsoEKCVPMXVtzQb4WUVWOstHTrXaol3sf2TfROiromh9rGCJXXFxPcBUdLdxLpZToSotWxmQ"
-    "XuDQTnfn2XzdfYmuEicdi7ccNDUuiWY6d9N0O3VlsX3zF9iZdXau/aE/9Jn21McPtzGm2EMJ"
-    "EL3JlPPxt46zlm02yo/nWt1Bli/epG6Q9wEP8E1YD5zWk4fvqAFQTo+KUGG/xXo97010mkc6"
-    "UVJ4Z0MscyMMbGYZKJMs8JVTPJK/HY48x0AdP5UQn9c7y6SLPOuD8Oyk4WpYeKWLq2fKhmfR"
-    "o94Ted1X3weseVUGBYbv+gcvY4hnne01wXR44FMKFYIotx3ewazL17yTBxUVfgeKvBlFncp1"
-    "PaPlUyYaV1ncW2GSudkSEGuTz+TfK1nVqXd0Maxz1o2gAk4/aRV68UtdZW2nBUk86oFncc4A"
-    "EV6T5xzoWOtJF2DxtFrxte3gyccg4ZjeVLZR68n2VoqSwV2snj4KTvxqF3el9z31Cx2URT1N"
-    "05cFBPnTtuWP5IUMV5Yoo8WVmqmykTblJ6+grYzxmRdxCmzzJnGWAJDyfmcqaQFEedSEuODB"
-    "o3jpV3VPvFSexal40kIZmtzjpRwt+aNRIdFTfnvG9Q6IAWIGFFSGsIC3by+01779dTKuBmIn"
-    "PoPlY46LQHfv2cNt2s8j8LgZ3vVQWBHGOCF5HsG8ARP+zMwldqRcbcdefIn0QwgxL2PlHBUW"
-    "XGoCdPH7lUs3WZz8yWiskm6R3WGeoOy0ypYtk3y2ZtH1XqZ9BhGE1zkxdmHubjv46SNYD4RT"
-    "1o9YBViXU4SgMD1dfaQsoUvIIhW7gvdh/avUkWj+xoWCenTvD/ysxjNKEt4fIcl6GP3v/VHW"
-    "v1lpVrQMVtOn7OpBUKuoZFE4gjCViF8q3kpfh8PaY+GbOGSw2hB4rjnxTShHz9GBOEVW9JMo"
-    "npx7m80Hr3yT+ob5HEVY3/MsqlY4umB5lrVK09MzrIt6KlNM8/DBAOeeuGh+nBOjb7CWpMsd"
-    "xRgFAX5yKlIm1Ho1ytSTollcVRg3ceVCjnQglWXMPDyBWu0UABPwwATroWwQTku4rusW03If"
-    "nD6LxewMndYYyveuWC2cEnLE42cGq86mDn+vuikLjhYIppXANcdGMGKR5jbE63RAK3fOs7Zw"
-    "MSN1p1AnpyZQNOtU744xwgriFYVoZpoyznMX3BHKWR2e8Sgyrq9v30uZ0dKnohX+Jo4KjvTt"
-    "R/TRPEjpu1f0DLB2zXpRmXHtg8owXT/rw0aZJtzfLl66Soc83N5nB86/zu4bp1FhFdodU0J0"
-    "vEcYoIwxjSau8oKj8sJLmK2d40Ljt94731549nAsFFo4RV2BNbmtlO4ZNinoxDU7wHhWiZlA"
-    "sZvlPJvLHODZKzUqCsMU3vU6HlAqCcLP5C1PWOfFslUfEeKr/kWnEm6EEzlKzgD1hYXVQ1A3"
-    "c+L7AgrXXQYBWjPdlTrH8oQcQaAyA446LVJmqMBVzDll6JotNSLO7ISGKD0oaU6FullgBLgu"
-    "8lfx8RBNLW8qz8vcmbiRdaPm5XSgbUdY6ZyQTxlVk4MyyHV1WjkUzZ4PFYGd8jLIQKcehTZa"
-    "o12DJQ/UetLCV4jmfY+T8EdHWfOIwi6ks1ex+CO7YnUj6kbw94R36xG9Jt2Oys/0POXDurgH"
-    "Be2Xvvo1BqDn25/8E3+Agx93UGZkH7L45Ptn25d/hx2DN29SX7RpLBFkARAUVvjDk9khSdu9"
-    "g5PfoYl9xBy7RhdUAvlzCnGWevXsIjcmhdSU13ayxfrhAFeVid5qYl1XR1SLnbXUVd3iX8Xm"
-    "oXPiEb8kqmcZZdW/4gVmn2bd76P8jfJgVuuS5dGy6aotVmzbSjpnUUhbRl6BDxyauLbTXrau"
-    "wXdQIWeRhrglc+WGgm9C01S6Lh9oLEhjpIVYZgibq62IEtzWkhOrXgpOl4942WcTGrf6AGhh"
-    "W/86+0CpYR6dS3sh3HMOewuRuEdhMXFH2L48/vY49FD68kdpNNQ4pLX8hqW8eBlfcIEPv+ks"
-    "c99m0ZPKL3kmdsWF100d+hhjHf7JgGBhqOwXbSuf/rlyDuiCAx1WcVJRAl70A0LXFH9olYIp"
-    "02vJlMtl0qaJJymV21EgxYy4KnSmSfk7mGsKVpWHYsAYaQgIGDo/d625O2rnLtdTFRCnk45s"
-    "2kXDmsCq4vEBE5y14sJPhDad1xhTg04tDjFt98GZE3UQ3pZtCCDX/QwzUtvGFBPzqxDEszFG"
-    "RydYM3MQAYZZnNGk0z2Zz1cgcQLxFFMiJ987Rx7PRbCcePd4rBKj3MV18dz7FMjKlEgpXX7T"
-    "KEKgnrD9b8VZJWoqs6MlzyHOh9J9yKMHxm9HuPz23vrp1qfTr/dP4EO/wnAdTjLobRQGFRIV"
-    "FM9SEr8cXUFYCfD1eVg/xbgphxh0ZUrld+9LWJkUECObpphq0zrpcBT62f44PHFTpjBcn+Vx"
-    "DHQoTAuLR7+TznrS37OmancjglPmU15D+Doo0qmWmnZ0kbzCy/chrAC2Dxdli78dltzpKEX/"
-    "vhEZ9yKdxApC3fV3WvNsRFq5PPJhK1YejyXwWgXPJtI59SYcAUkHlYoaUdgAurzgP2mhEufH"
-    "KUYpqOL4xNNP8FQN2XVdwRF4nvkTczXP0kg8ndYU19lZrv0A14mJbZTHkdZDHPHFTaXKqbFB"
-    "rCmb+LuNUpppJ95rzRCWWKyE3z1+HEvdfNuxYzeL3FVq2EyAgnueHVt72U2rkiOeRw4dbF/9"
-    "hkdgbGz7uXZCS9YmyvHsk4fbO1x1orXo6aNHaJ8qIgh+EA9+8pe0hp5O+dxiqucSp5nvxQpt"
-    "eoNVGOxgVJQuz9zGQrElSot0pA+vOqZOtrIRZZTrT65zZtLuqXF4gl2aTCE5Lbd13KkWFZJS"
-    "LrX4uLZHJx524MoUCVpT2sgcaRwkZQvf2X2Hoqgi5An42ZwAvbV0O082Td5axBzgWSjLqCxQ"
-    "kfHZKT9pabpJ3l0879QhqOSuPnc1qYC67s44YES+rg2pRfKePO6uv60cVaJsLMJRHp7k/bvA"
-    "UnFXXi2zXst6dBBwiylBo7v+qG1wbVLhRhKUL5SVm1qCaGPk6cBFfnU9HxGpAwY1/G3dxi5A"
-    "BgbnUbLmgCv9xJsooU11+EU7abYo7TAg7YB3v3X6XFv5h/+iHTm8A4VoFKVxpX3pd07AdRzu"
-    "OcSuSOZ+zVPLmEqQC7sP7xprhw9PYT3l8mtgXeRQUzcWeH6Zi9lVQD0fSjluB6yVUcVWWbCE"
-    "cqkyXO3X9iaedNrkYRZ23pZT19dvXj70ReT1Djj/fzizEbtY2MCz70gfwIYYxuz6mvADr/pB"
-    "o0K1V6wcPJaFR6tW+iapQyRlId+hzz3o6J2C1mWWHRQoqqQetET11ixzkpa6glfPesZfsA9z"
-    "pqHd2t8+WJ7UV9IRIpwuff9rUP9skHWa6A/Jy7A+TuL1FW1cPv7YzlN+XpTPQpeXyhV9+uf6"
-    "tWzFN5Xx/fgEZiJ2CjHPHRr30wj/Pq60izzUj7q4x9StfraH9EnwszAi48UzbdPBgbLBGSUN"
-    "Twgu3tN/ETdnJVI2lTE5yfIbvxQsy9flHsZyPQwAtDYssSV45w6sVM9/IhmZs+dZ+WtH4Zb/"
-    "JeLZkSVTEB1nmuISUwqegXSN84qOHn2BTtutl4WY626uXWFdDouSL55nATtrTRypLy/PcImp"
-    "B4w6KmLnEELTznCStSHvLL3NBaQuNp3NzrJjzzs1VYxu49XaoxJQplEKtEpNohmTwq86cOR/"
-    "1a1n1vXPFYGIgINcwFyXaDX1gw8Ss3dJWLik+fb+j/gleiq+qxwXmksLR/kucnf9yQCda5QI"
-    "Kv1Rrip3DQ/fRd1f09p5yihOP+XeOtYrmW/WGtwZzM5AFWudjWADdWP9Dg5Q7xBWxcurQ2aw"
-    "3uzat48OyAt3sbLBNy6k7WkYmDDwGAqi9SkzGpa1YNSHioP+MuyqgyntIFewRHrG2cVz55kG"
-    "5swUpiMd1dnBq3ypZM6wW5HoscLZCBxJq0zUUQh0ipxHdYn0Wph27GY1MAq/52q5GF4cSmFz"
-    "OmQYPmU9Grtld+89BC3Ek2lZjhU+8d5JFJ3tdCxuArCTKAU303o0zOmZa1x5sp2OlF2e3dZ2"
-    "CE16SyS+lBN8RXTz5rrLzjNhBr2nCwFsNOni9IuL1/ewhmo7Z8q8+da77dizddHx9PSt9t57"
-    "p9q7Zy63P/ETn481ZZm796a2b2dab2P71W+801762AHKzbENTF/t2rmz/fYbp9rBbRtoWzvB"
-    "jR1frIK2Lt31pkLQ15EK2+eeu038M+3ExZvt4BQKE21VXnHB8zku7T28kx1urHvTTyvOLLqN"
-    "U5OuyRrD8rOfNGe4iub2pemU5xYKzxRTeeax3kKVOu4M3Z8yAABAAElEQVSahLvOFPqbYpkD"
-    "L5XGhPlb7SzWNvwUNy5UVxmzDdhhDViXrAOaYQ2SC9GHuLzZaWzhuPB9FNyGN9qJedyD64Y8"
-    "QJUs77GbDie/yGeZjoO/VDT102qlnDK+ZVT2j1LGIdalqXS4i07rk/cjOm2vsuHF0O6oU6ma"
-    "5TgH690q9yR8eca1ccKGfMCjfHSoyiwVE9czWW7hem5bLIPs2jS/JXhcZWsXJ75fuYm8BK9l"
-    "CqEaCPWibEmjWpBul82xHMBcoX63ofy+cu4cnzPELDfOgMjzyOzfaUoBYHqn1Q/uGGqf+/wT"
-    "bRsHii7C9yqBu3dtB8fZtsxUpZaZWHSSjPaKwmengmkN5YvzD5mxUF659s0y2v9YRhVcnXwg"
-    "/aVNCuzjepcwPR4IhzbxWh/3B/Ks8loDbGmiohxLHHhH9iu/qbdUYpd/34ZIVVh3ZbQEltf0"
-    "Hkej0mbZ8aqi86vs0cnqgk1AnlWorBroa3qjma1fcTyJU4DpUTKml2UVZ/23mWlJ8q94flVh"
-    "IZpwrK8oOebX+aVsvJtr/IJLKSbBZjX/dXkF75LlypqUscNfID0sn4OP8PHsy9LnaZKKbZh8"
-    "VrJEubw+rs9raFSbSrgZmVuHc/x41s/nyHGrkz/bpfnaFpUrDqZcFy7uDpyJXeEdbzugsH8x"
-    "vulcWiMc+6OsQSMXml5krPqIQ6XOWWpLu/bqqFtB4mWMK3Qe2RlIBmqgdtQ2IBnJzteCmskw"
-    "62c2M5ofGJxup0+8h+AY40AxFuvSYQnbztRb4C3YqRMnIqD2HTyUdy1g1bkheMkzC3OJP4FC"
-    "tpczV86cOslodKYdffJottAbVzO7+WvlSaWSiQUP4S1SXzw9QuQ1P4taXnnq0lWldVH71Ma8"
-    "jzardEoM0+tWc6vXR3itBdbTCp3e+Vtsj8eVgkVWsZd6RQYn3qJoTM4jNLFUWLEqssaLo1xV"
-    "jrW8Lb+f3pWi4/1sCPwOVddbOXWCGEy07A6l/odgnrlbwkZAkEeYkzfn7iMwmQIepgP2Is5z"
-    "Z0/T+YwjlHciWLnE9cIp7nW7hN+WYlzS1zw9yjfl0aJip5a6ESZ5qBRZAJk+eYJ3OjI6myef"
-    "eRKl53p77ZVXskPRM6bkG4X4Dabzrlw+y4F0e8jf7b+sJWGUHetEcB1AWdrTbly9mmsc5m4t"
-    "saZvlDVWLHy/cC441CiEjmTvXvjqFjsQ32H6k3Ok6JBn2Rnpur+NrBecnKrzt9KIwFJ8pYtH"
-    "BniEyN5njtAxsqaGwUatUZT/NLuv1ZHtZIKF5DdZ9+IatVr0WYukb6JAKeS++MXPoWRNtZe+"
-    "8Kn2nVeOt69+9eUI5znK5bqjP/NTPwwddmcXnYtJtbode/ZolIoD+7gqRSsniukW8nnpY+y6"
-    "HaE+aR8Z2EA3BWuqn0GW9JaO8sme3ZPtj7L26AYnKd/gsl8tnJbPnWOffQ44rr3qpkRUXp4/"
-    "4KXBHJMAr2j52MHBpDvYYTyLguH7PupYpcL2qQVqCCEpLTKGhi3tWyagsVNGOnHI4mieVWCV"
-    "LyqBduquYZqj7BuZqnJs6JEcLkPQOj4zw6nqmGKWtA5yCr1ndXm/ncqVxzuE7+E5BaB8ofJk"
-    "Z1cL2p1CLAueZTFfXnHVWbrIf4bpT8uxCQU9uylZPydd5rMJoM4BW+T5Frv5vGbIxbmQmQ/U"
-    "QvnICe3wnbQjWZwdmYuorRctQJuxCCnDxM2pnAh9cFHxGxzciuVuuE1vxBpGyG0uRV4AR5aO"
-    "MT3YtSOQjvWDd/GX1lbyEgOIbSibwzmmwQ6WAQN14+HQVAn3C1L/PI8zSH76ycn2yecOtZ37"
-    "djIdONcGNu2jEIfbdY4LeX/+WlvizLOhvUxrU7jryFqVWC2vt6wfrLuLA/QTY/K8SkktDh+a"
-    "f5vpzIXUceQRGKg06KRwL1c6j/zgndD6La/V555+3W8Xuvqjt8mlc5fNWlhHm1WP7sG4uqQD"
-    "K3HvnW1G2aXFvGSkkf1QwaQoLvG9yhR5y6M8L9+VFd/OuZfpVV9Ka2UBWnFoID9Ii6IHkZHB"
-    "UbhIGLrxklz6QvFyvR0hX6b9UZyyQJ5kWsFs364OHB+cbROD1ws3QfIpJyTxF2Z5Ju8Oh6on"
-    "QklgX+zxEQANbonNu7hFjsA/+q3RQaWCFoqn/K+C4jrfpCeRfJ28LE1gFL76GU/ecHmB8JVS"
-    "6+lS+VUJTCz5usxDI0OihHWwDHMgnmg8ZwAvXMKVQlGOwE840saBQe2kh3rIJK+UchZNeniX"
-    "p3W6gBXcGY8xZhgs3wxLZEw3wVpY47nTXcNFlgBgfPDZATvLFcUGDIONFiaYAroMMy1owF1s"
-    "zlvp2CRCGAO/jJrQ7uwUomyRQcLA2PU8jvaXb3P9xpnr7egTx5iGYiopVhJN0SyG5vTsDUMs"
-    "br88xzqeg20EwYiRGciIIhrptUvsKkSxGBxES0QvG2Lx8DjHP5x67yR+o+35fZ8ME9xhbdh1"
-    "LGSxWlGSjDxcUAiM1XJZCovINEUqWELb2fBng7Lqu8JXxVEGSVFEqbR5DXb1ZISQS8Bx9eur"
-    "QsZ8eledrHnL2A93V+e3tP/2d/6thwd2vlt2//322c2Xobf7utTCS6mtMpWWLVPpUt7uuXAh"
-    "f8rs2WL3aNiupcCDqVutGWriKj72DCamIyJcC0vzLik6N48gcN3TwGCto7K0Tx/7BMLzdU4v"
-    "f7UNnXEb+DIL0vfAgBymyYLsTUwVx1wKM4bKtBzPNck0MFtxs94DC6WH0HmBrKMscfUsI5Ul"
-    "5hzbRjqXjz3/6XYFhWiGGwJOX2PKkI4jJ2bTKT797FMsPt9DWkvtLiemk3ftxMqHkkZZx1H0"
-    "n//Up9uFs2dQrM61u1fvoYxtQ3F7CubnGIFumm8jRzM8+cyzDAwu0FA8V8uKbEyLe4je3gwa"
-    "nC60Icnn8paDd6eCdu44nHVnG5ha1SIn9xjucy6upUpUTofpnJ/52NMMKLgVAUEkvYeZ/pY/"
-    "nMKy7GM0TDPes+dQ+7Ef3RklT4ugFkStua4DEq9BLDMKiRV4et/efVga9kRAZQoXHMdQxD/5"
-    "4rPkX1ugzaOfppAPrWrbrR1/xRmio9dyNdr2YfHSAiITyUcKPgVUWS9cJ8RxHCiBKkAuBLe8"
-    "Ckbx384mFVWEdE7U0605eMmRHoy1SEfsmiGpYxoVBy1r4uYRCio0rrly9BgFizzdyXYLBUbF"
-    "YIk4Y/NMqcGzygVEYskUrKZOvdriEF2k98npPS1WlA9txN1ullXlymlUB4daax3AuY1rkRsq"
-    "nP6SkW5zmKnWJHfW3UBpcxPYolZ68tgM/d2VOMcGDddbeYjrVY6I8ZR4R74qabYnRGD4W6SC"
-    "DW0203vQXPxUrMxLOmihmsCyqXI4wXTloGuYKK+8MOZgBj6SzsusvdtLmss3WX+IhqR1Iw66"
-    "1+Gk9tlCpMMgH52/Dox1euWICp5BM9cFHdi+sb343B4O8WW6nZ2qC/DLRuT+d1f+VPvNm38J"
-    "LZjIThT8HtzGV36mDc7+NhjjgpeY4Xq8fdaLCMGa58hs/XVd9ETIa3mYvECsl7OlvFXd9/Eq"
-    "3D5KuLbdNVfPDhh11QGbrtLadu+yY77konDWW07AlvLYoa/ml2Q1vWRZ05GbH7ztT2R/5AAR"
-    "9Ya3B+Bt81ER8Qyy8AXyKFgAQzgmziM8o7yQfw3/5dv/Daswd4r6Q92Lo/+s/eGJv2329LOU"
-    "vZM39gFx4GCelsPL45MPYeIpnaJcpXzdbAnxpKOul4HV38cLWhUsN8r06bO5ifIpY21vtnNh"
-    "mGfWvvLu7JezEb5vgA4acwy3kCo1Wva1rkobUC6ZIyw+0k4DkP2Jio6DLppJdnTbHizqKIMX"
-    "B4tujlLWOLtxi/WaKktm4+yJ+Tkwt6/axHE0MV5QP+LrtP8ES0jMX4VLBWtuwWNrOG8zOoY7"
-    "1ZEXDObGt2yiDwRH4bDEZpwNX9u2Y4mWuHH+kJlI23nbCXh1jadVO71XgrmsDOESoit81zOu"
-    "SEsJrSNuWbdQ+w7sDwIe/iflJMwGbmd34TrHILIN/yB+NYWRdS8IMhv5zl12BGsMsYWdZMOb"
-    "rrVDh1mMi7UqFQAhXHi2FeVLYunCADScwqsrW+pM5MoZ5l9qrfcM6/JCmMIoZeE1FX5/xNUU"
-    "Pgir4vTC3cT+FzH6sPsS/R5eVq/JIa10+RBelV1X7h7vwk/0XcOkNcGO9sgTT4RZXEtno62L"
-    "nEWKiHSG46yXO/b8C6ztqWtkNJU++exz1FMpTR67oML97Mc/144+sUBHM0cYu5+wnLz52nco"
-    "OXwSfDa0g0eeAKZWRkc8KMH8qhwcPHJEHY9Oke32MG4vsOy4LZt8aB14ersn+3uHVdYwdY3L"
-    "huAhdpbH0YKoT7I7cBtnb8U6062bGufKnKNPPi0hopwpPORBLRou6LZxykvDKBeHjhxFEedD"
-    "o7aBrXCqeqb3GGSIU093G7BlcP3WJNN0aYwIi0x32sodhuFWOw7gSR+nxoXjxzQKCt3WbUzF"
-    "gIdrWKwL8w9fc8bVNtLcBZ5Tc5qcVV6yroV0OSJAeAgAd6+Zq1OEcdDD2rTcYpLpX9+ND4Pz"
-    "k091QNURBGP8S4k0Mg48dQoZ28U98klCwfKxXKAL/K5NdXFdF6Xg1Uolvk65mOcm4i9Rllis"
-    "xIWPsJ12s/xaRBwo6ScMrSzLKEDTKDWbUa52cpSBC9CH2bEWfCibirvHRHgkgCLDvJQ3/iLv"
-    "wuOlkFY5nV4UvmV37ZUn1MvPWlPHsAw4XZuBByqciuHoyiYEMwecolRZHnnnJhs5bmK18mJg"
-    "z9GSh5z2VCZ6HYzwdZZzkXVMqQbe5R0VSJ1x54HlYMM1TPNYRHNKPAJ8ZsVDPWuN1haupxLe"
-    "Ru4JlAfPMWW3XIUHihbCopf15tSfvyqrvaLFa2hlnqIF1Ul1rx3Yv5VjSbajaNo22ThBPndX"
-    "WDd7kmlUTuH/flzKDy5R5EUAl+/uOR5Fhjz2X6vylDA7MRDr3OpDaNlbHPUVrvlJY8H3WQQH"
-    "3sOzHZQKs1/p4CVRl4Z2Ju0cMMj28q0wanBhGvJROyWpvJoZHMKLh4UhXQkGph/LrvxQVglX"
-    "POVtW6rwXWYgsulb4UX51TzjRxzhm8q4RMtvX6YefXF6mIs8pU14F6ntc4A+Nv2p5VUek4/4"
-    "2i48emJYWUr0DIiIEnkBPZQ9d2kDAxx/JD4qhFp4xMNyWU4HaconvNI+zMKBoUh7DIm4qyw5"
-    "IDV9r2Apt4WpPLa9zXEUUB8urio0YAlcFL+UX6s2MpMM+rWixu+t2uMsCVnCAmt/otX9HoMz"
-    "DUbuzBVfqoI+jd3SDGi0MIuHeQtDeWwBXP6SckIly2mfZv1kYIww8T7gDU65Gh3cdcYHKWjA"
-    "bmcG+ebllX/mTdsspgD/OCsmfhT44OEnmZI4RGFG2vTScHv50jNdrO4HQiokTKuQf2Lr5XZw"
-    "gitD2KH1wid/CCHowZAKLKwfwBUJTXHn53e3i1v+XBvYNtS+w6j07vs1QhBhLWC7p3a1F5+8"
-    "COJuZWYeE0Ls2Lm/feGLe6K4WVkyrxaAYy98ArAyowJaq4SVbt0GK547TV3uISDMT1pdogT7"
-    "escn/uu/+jime9CZx5opsxjW/BTWq3SFUazA79fZ6MXfcoq4MMUtkK3t3umBf5XfJOCjl7hK"
-    "AwInp3ZWw0oy/SueIMRdRWrHLqYJSBhGofFtmWQ3EnS2g5nHOvCNr3y9HX3qGFakZzI9awfz"
-    "Phd1nrwEs+7/yXb1wqToJt+Y3kWic5/Y8U7bwtRbkb7vjFRasEvQocr0fl6+/ES7dZut0tYb"
-    "f8XIlN138JwcutGOTZ4Jo3s8hAw9jDWqTgZ2+tPDF2tjgILOxaLyTixrBtJYpY8K5MmbO9t3"
-    "bz7b3pp9ot1cniBfj1zQogSfbZxrW4Zm2p6Rq+1z219tz4y/RUdWVigbpsLAhme+iIMUq+i9"
-    "od24PdVOLDwT/K0m+TZ0CeRS1F7c/I2ceO39bnAOFhA6eCUKDVl65CgCEk1vONzO3gUWgth2"
-    "B9CiBc/W8uYNDEAGvlnCguQKdeNFQIX9zbusKBa/HBGDM7j07ULYcfAYZUOVIR3xKGstrOYR"
-    "2CVkqQ9gW65SGOUnhaJwywVXXu30vUrHsMU9f7Itje0LPoabpcq14RZMVKKEhkfBAP9lZMzt"
-    "gZm2dcOVNn7vPGc0fRAlwkGC6+i8TmeQjkCl2euDVISUTvKzeSobtE5ZXy78VoCbbgyB6xoq"
-    "rc9uoFBhs9O4xlEJc1mL5SJ1d/POYVnyjsg7LOpnSgBeAmTwtaMSb6fOsl4JnV8Fp+hvPRgv"
-    "Mjydha+9TJkDV2HNzpd1+c6hP4YmyoYDlE6PiBieYHC0lQ0HW5gCRxEbP+D5VUvhZcvntVTF"
-    "b8C3ieNXbcQ6URaRV4fAXeKuLNxo+2Z+ATk9lCnr0bHtnK02RYfS2te+8nZ7eZrrpn6Plitz"
-    "16UzN18qdpUTRCT/4Mef//e57t0wuKjCK0ngWUY95RU/4RvKFX6DN1bblkmNIBzqtPir5/uS"
-    "d1ZCOtUOAWOLczpiaAQrRpH3wMv6g7DBpeIEx+BTedlOHSSE9imYeVsvhtOGCRlChqfcycvV"
-    "OT1s64uURK5+kjSU6w64azGWdy1PLMYo8wEPjEc5FTXPXpO/Y/WiXIPL1Q9plVGOukFIOC5z"
-    "kG6+Z90p4dLFOMpT+UdlUro4IJfPl4AdxQULsDRTuYryBI51TRfH8HASgG6CzSH23+arIqRc"
-    "H8NaKl28Wkcd2mm4TVrvGB2Yt2t2laeZyaCelF/mZyLpZ1/oZezF2yqJDHxI7xU7tdnEo2u8"
-    "9qvaYs/7lkl5Fv2Bcmj10s/ZGWngHZ6ROYSJpzvNlSXC9ggXFbewpZUFPbrKXeUvgKdqnO6P"
-    "wmnZjETUNYdnMR4mfddBsVbCc48u3ZxoP/fqj67Fe8jT0cnz7b9/6UtUFOscNrtehoMJMcmp"
-    "E3j8vaNrC/vtCwfbLxz/fQ+BUF7/2oE327GdLASOUoZQpfMc9IwtzmbJHXLgPMjorqwdEs1d"
-    "PwrBdSAhQjUy/CSIP/l+2JcJHx5aSR8RJigjGOxOBBEw3x6W/l3eRv1+nBUtqCihMHQPNkWG"
-    "aaJI6bmOBlX+ql8VEteq+Yt6GoYSTRUjnZ2jzCctLZBpiw8EaUHMQz+2kTMNePDwgXbyxHEO"
-    "8jyTDkorlor08O6fbH/v/M+0dl6oD3d/4dhQ+327vhFhYsMRQ+vV+62GUaptMMsstv8/3vo3"
-    "wKsUpYdBen7qePv41BnwKtw9bJZi8J4SwA9A5qMQ6IWvQoIipLyLjNZ/4+IPt39x5YewRDgf"
-    "8jDHaOT2eLvqZ2Ffe+PGiwi9ufbD27/Z/vCe32Syk92QZpq87N2K3tLRfM8tHW6/eBF6PMY9"
-    "O/5mG7zjJemlZKRTlvepiruOlBGqAwjpM4vPtS8v/qVHQtre3miHN3wz4Sk39LTOSq+u5/CE"
-    "BKJOi1XqWZ51er7q2DLQAeE34Foy+Zp/VS3DTaHAjacvOmESL/CJoYDSMrTISC64EF26q3RM"
-    "MoqcOfqftA1bP9yLS0Fd/1tva992VDe6D9Ri1xx0WzrfJma+3HbP/nIbXn49J5PPcqK9Sos4"
-    "DG28k7VOjmo9IkZU/dUKIpldN+FnGR6kyugUONiV9WRepOw07yKL6FWwVEAdaXtvodOxnlLu"
-    "2jh3TEoVyaSV2CuBVCY1dsRiQX7+SrHe+SxddNJFK9cQU77XmQJc/Nx/3AYmjiXsvi/2afTO"
-    "BRy/V7cy+35b/vV/AB2w1HDW2vLCBqxWl9s3v/VB+90T7FT9wkir7vH3moPpev6ijBaTMsbx"
-    "WxzUva/7SRToJqX6OKFaRyejWnc6ZZMKjG1DP9+jFEDn4uGwY9qgSpZxBFPwOhiOePCRD3Ra"
-    "j1e0NvKsYrLI+j/5OFZ+PO27lJ/3YBL5pPIRtnVf6cL/xC1FDcXYM9jElT+Ve0+ndwq+BjMl"
-    "I4pvFFzFi8LQqqmirxVTPlGZsL+TT+/sBu9HNRBwv8WawQs3L2Rph+e49YfnWq5+nZDTZTr7"
-    "FXHz/ENllrgqtzyGw2lvskUPYMALHm4EkV4qXNbSKO0pa2gFjM8QCo51omJjf6xTSclOU9qR"
-    "5VJxkqYqT6EVcKSvg1zPLsxshu80TJ9jAbT8pDV+ySTpRjgzYPaH6D/A6AwQ4O60u5tbTCMn"
-    "leJm35XaJi6+vNQUpQYl8y9jQuB0+YWnsHSF9sp4ywjuAxgHNBoo9zNAR9+x77yNnFhZYd0h"
-    "cezL9FONXnPhM8hNBhu43uQ2I0BFB/l3xFiL+rCnkzf2tVPTU5wSfI2OjgIwordivCplAwpW"
-    "iCcsiv04lwKDnIVwtF6KFgyPNcIGJREktu3DzjVav8SkUKUw0BGYAX6rTlU575Ztnf8qAcQJ"
-    "/5R9LW2YgKCHYSxjlqPyTCpO4pEGXWFWkql7Ydol+L39ANLyOb/t9JiVG7eunH0+la+hdiK9"
-    "lk8acLORWfmxbIC4So4U0WxM18ATdEfY2NA2eDI++bhI/TZlyfocnp/6+HMc8nmQA0Bv5G7J"
-    "7VPsfuPz/uLh1i6b76Pdy1eOtD944NVEUL/TsmBDyTVH5G2+J6YPUc5HK1cFHYZnhGkDcBdq"
-    "hCMWUBV5rT7SwsbkqMtnhZ6NboUG8eXLL7VfPvv76Bw3PxrRR4TcXtnc/vnlH2lfu/Gp9jMH"
-    "frm9OPldaFqWVvne6ghvhJd6HnkEMLzD092I2tGe9aMaDMbUh0xOJGF+FCjCLafRpGHv5IU+"
-    "raF10auR5dUCqlCUNkbMMxkaYnDiiAPPwlVZDXz8FPo1rbAGy47Iwzgzcr3FYZ0IatuHZzh5"
-    "r6BnWXm50vfvEI7Du1gwuqvdmvhku9X+0zY0962299RfbwuXfzt4utjd86883R+5B962VQ/N"
-    "5ALaiap7R9+OiD0yQR702A8Xck9t5/gZOoKr3NM4z+W0NJNME1pe11HJV05hZkqTalrMtKiW"
-    "CqZGIFxoB9GkXxSsInX4QyuDfzrJrkLmxzWn/Yj7+6fPwyGIxnU2zZw8faMtshPzwrlbbFhh"
-    "LRlt5xMHt7Yr9jbfp7NMlrsUcYCRaWRpB1faxNPv7rnkcl6S1hiR89JFOuqBs/7kQadmS9OA"
-    "dtSDzsG9PKm1xwTJH1wywOroLX+LX60/1MJZ5UWsRlmOYkH9eKSHipA5i6N59GXSUils4ZAr"
-    "z7RVXszbbISpMmSZzMc83Sjhaf++e5m2yoNTXSZwIOLshBZSYar4bORw7wE2PjhrEDkArILZ"
-    "U8K8P+w0iuydYJ1keFMcOlxsu/IueGmVkT6WzXKIv4qQeavwqDjZr8ZwQRb9RjZzkyJatO2H"
-    "M40qFGkBjN6atGkEuYAi1g/Y7a+ivBBXEmV2inAHLMFC+rKeMjRkYHTHqxYsNXJcEpdsImZH"
-    "c2W+/ZT9krSyj5LWfd/omlmdd3n28s+lT9EXGMS7jjd9pLwgQrjoOcC0/dkfqU+YefJWDoOj"
-    "9eC6zqp33qGD3TBoQSNoCLziFeQ3aXMMSgEgBzwMFJKjG5XKei7G8u2j3K+debH9ey/8JtGo"
-    "NPhWeMFfuCKTPJLJo0ERTDQqS+LLrBLGztQzjKwgSkSpLOwGrBYpXUpMQgieTHoKCAAkQsQU"
-    "TvYov2SSr0fjI8FKEFYc8Ugl22MQYrjwo1wJF5fpFP0tq4zrcMPk4mRcPsKh5hI//vX0yG87"
-    "YZ2VKSdEc06DKAYyAxuU9FFB9VNOZrDM0q2YuRpLR0fRJLyY37oyPRWPv+UUjsqWgsN3lbJM"
-    "+RFhfMsUB4Ay3agAgSEt7123OX2Ee/vmITplOrwsHiUNks3yOA10j4Zlw37j2pGPgAJ+4gI9"
-    "bGtgmKqPkkh5Ql78LZc1oJMG87c3tf/1rZ9mIHD4I+F/VITF21vb3zr559vnuKLkpw/+EnRy"
-    "nSHl4a/WfYiHFfZ4J67iFqFHVFY08K0FBD6xEUlYwvs64uWhThhRgFAiUmIAp8ZlBfCQk20r"
-    "WYMlSJ9pkxAyI2vXWVgXt7vpTzMJPAisydsktXbDJz/wkHF4rA4soPJlG3DR/O4dHAyKwuI5"
-    "WVPcV+jRDoFFmqoVAPwrdCubP9M+eO4ftYGx/73tfO+vwZeuiWLqj1PqZdHIFMqrGX9hnjUT"
-    "dCR2Il4rs2UbZ12B1z3W3NnxOZVx7+5ssLPjME3ais2DiA5WXPvlWjEP49R5MnzRqGgRfpS+"
-    "aUtdiamXEh92yKUc2J/4LPyCFHA/mC/Q2IzYvMC9jreY7slFzCzw3eb6EWhUi/C/v6zlBxWJ"
-    "8Dbl5x9aui6MglJAeV05Lk2VJ8oVrUB2uKY1fvgdAFoiZRZpqXMK1iMynD7TTzhulLB+Tdcr"
-    "U7aH7v9+mqaOCcPJ35ZXmSweqWPsDlonVXpUcJSp4iL8DPoBmkEh/jrTCsMp/r7uxEslK9YM"
-    "wleVGBHEyXfuNLS2w1PEdw2y+AYIv1m/CAwHwBoZkg9p3DGI/vdIp9XLZTo1K0H80BZqBCfK"
-    "DLwoEB0uoRFxjFf0qvZhY4j8JycHBMp/I6iAmbT6E2hmfdJneIWOfXLJvOrjbE/Vj/Auf+MR"
-    "RVVI4KPlyvI7yBGodPJdwZLZBurWfOyzrOc7DHTEPQoh8atfciBa9R5LGM8SseQleANP2gnf"
-    "P/myaMybCS03Dk4i76JPLHAkMZ+ERQ6TjPB+ACTM/uPGFMutQSkzGuCvgjaUwphK1yHRvdRP"
-    "vPsuatXrkQ9fOf9M+/PP/i4NmCX1ICj80ow7rTApCXicA53e6mAB0mBAXkc7CpGkkBVkibNY"
-    "kLCUJbHWvkJYXqlb0YlLn9IVufPqfoLw2rN56GXW/NrxS0SZzn1MfX49XCtNUpqmd6lSYeDh"
-    "R0oabNo+fR/3cb+JD4Pp+koXXpTN+Pq2ln9fbvExrbSq/Crf+HWI9kzSU4gYhR/5rcIR7575"
-    "ycdGUuiUpcgt6XFm+BHOhbTHsXYe23Y68BVa0qQabtX3q9cPfwSUCrYjr5EJZYxX5e8iRp/6"
-    "xmDQ5YXJ9je++zNteqGOxEj0fwVf37j62XZ1eVv7D47+XIQXueYvtd0J4cdlIz8Zt0jnGrRq"
-    "1NaRIzDLWKP2x0EpvnNEl1EbaYUX6651R12HMnryn114CM06LgKhR8OqNlfCPyZ0OrFemJpI"
-    "+soyEUqiwoMCkZ4gQj+gYVF3KBXuTjOYd+NC4JF0iCbLKL+w8fUH4KDX0f+wXRnd0cbf/4/g"
-    "W2iBkM7lySzwFc/szGMaxjVYjoA9DsIR6ModLQnVmXlNkDxuR54DNxEisVZRnlQr1WTHY5j+"
-    "XhUjvXoFRauFnagdgu20H8hCkdDS+tA/a7ZUYhlQKutUr3+gDrxcbqESocXEadTwLISxk524"
-    "9ZW24ezfqLKBVyl+xJBwuDsju9uGQ385z4/6mmaN2Nz1Wymbmw+kSaZP6YjkmU3djrNs1ABs"
-    "7ntEwUoevBuHM4nhEugBDvIvIPCHxviPgLO0jrUVq5WK0DBTN+kSOnktlRNHz/v4zU7cNFUT"
-    "Jf+qfCXfneKyLjgahzPStBpFaQgOSHDSSafwPpCDm50+fqCWug0fwDdgzKdkW5Qk0uadviQK"
-    "hHIUupqHSgQZJTzKR/DmNR2WSo0ygvQVJfEe/oXiAV8aVwzET6T8iZLKQym1tgWA8e9MhcsQ"
-    "jCTNzdNsBh1sE4eacWk8wYYaXsqIi+B1wpNe6iHmYxrTQyzoVDSwnPZ/KnjlEiNxegNFycLK"
-    "Q9SCe6UKXYsu4lEwhJA4PCihgJ588yQioVmXW4dr3giKwseL+KVvoy5Sz8y2SZfMnAmX58Ij"
-    "mXTPQjH3chZZPafi6WcGiMYQOO/FND72zLSWviOWgR/hnNb55x88137yyZfX8hfB/JGYQovM"
-    "45y5JVaw7lNWqj6tMdbw66Hhp/RfK3cf8JjfHuJalEreAbGWdTJez0Q2zFSwDJlAvh6d6WoI"
-    "D/3OGMHWCMPK7RlOWA93URRMJP1knJS/IPsuPv729dmj3UPr/X1fLXEXKezcMd8agxBRfNeX"
-    "ax3QwLBBGm2d//rnBD7i69VrT7Rnt55KaOGdoqUzmmFh++Vbj96GvB7kWn5gGvKIWUrUReMd"
-    "/xnWUP2Pr/1Fdpn8y08Jrs/voc/w3A9PfZuGWh2pjTrIhC6r1H5oUj0tg0JHKwnmpTzLG47c"
-    "BKXQcMiaan8klC6A7AadmrBj1KqHsIhgQ/HyVwuBbaeUCMM7VMkC+Ri0FSyl8mr/UmCBH35y"
-    "W+hNeXNuGpbNeJo1HVZKmrAS0uan0LUEHjvgs+s3Up6KbcofmLu750+zYeF42z77sxytsEDZ"
-    "6bTp2LWIOG3impjgR8G8atWF7lpQrTatbNaB00UqB8zaBmProK8vR9lOEercOajFwbh2vEWn"
-    "TjEGlsqTioquOnYe6rXi+sq7cUJHI/4A3V5O/u/5yQ4mnSPMFtxmvtGGrn4tFhyVIpUYlWKV"
-    "P5Fe2vb5tvARCtY401SbOSA1dKBEKhw+h3ahj3VQfrZ/6SYppYFxC7eOjngaJ5YXfmvAjR9w"
-    "xE2Y+tVaqpIDkq6vB2GuEpVnYVv/uh4/y6V/7aBHaUbRln9LzptH8bdKi7vIwBK/vqYMZ4OW"
-    "8rDD1X7IIxBq+onw5AV805ORylgsHfj3eDoTEAVCREhhuEq/g6AOQnAMMGI8ztlXRXEgkmW0"
-    "vfeKhMRYpZ1ApAc/lrdexRG8jMcvJUm5hGMULT3CMiSwKtL97/KSQPWVb3wmsa3F87UqJ0N1"
-    "9SZdfO5/lYcqneJecgSFhffwTdLVVw8/VCIPaSsoeaJoJ/XMg48F0BnB7DpXZTOso42lpwDW"
-    "gfnJe8bRUmVacSxQxXuCCfZ6JlwfZt38WXOVQd47PCpsHSZrkR/59E9Ov9D+6BMvd/ivg/nI"
-    "FA8EFI6rnqXY6LnqFVpJow+5+/D+UOiaR6jh67oEAvS19/LVZ36N7kjXdWRux7fSE5bwPgGR"
-    "HuGsnLiuAh4R7ZHexSBVsUYKqmmsMhMNVqFFo+8bbYWvgRP/D2FppEe5PnL/+5CohdOjADze"
-    "/zsoWH/2qX+eSD1zR7GH0t+9egj/h2T4AEjzL7r2tKWMyrjeH+8801j+t7f+zR+McgVOf3zf"
-    "r7ZPbHstQkB8+g6rBPRHl8O6czrB8jsKUpi4VkBRJp85go8sf1x9dbQxvYypYJZJ7sGzA9mq"
-    "LY3wV+qRT61dFLcQjPWlChQXltbIXauLB4maqhdwsbQgYAjiU51yFAf8as2EWZOiLzKPntVl"
-    "eVx/EqWF7Hph2aH8A/25duC/aPve+6ftzjSXHDOFMcLaEEf3KjJO04yBr9YD7Z22IxUwN2w4"
-    "VTTOjsKbTG2Cfspl0TLVB2lL2ah2aAFUtISptUYaOGWVfgVaCLdXrlyfZV0LXzJZ9yoJvpgO"
-    "sq7RT8A/AGfdeZBpKZFlHbK+tUp7Kr6L9sXfjsWLnLVsirN4iu8g69o+ahH8MPGzoQAiyEO9"
-    "ItTLKq9P8tnQ8APlFy8LLzmkdaaSeNaCqLM9xeJlLNPyLo0rhwo3M/PTpePNgy8+lFMxqjFt"
-    "l5L2UG3VFkf5rCNw8VdeMa5t2jIYL7v5HMRYaXH1K95VvuqQDXc9aDpoYBmmy2/w5xn/KD4J"
-    "6+DxnL+EFa7Svdy6gnQ+D/4Iyjz6fHplqs/HUks7B/v+mReR4VEUJx4tp5Yu8SaAMqcBQMPK"
-    "O69Bhy+8zEd4KWfyrT7JePLOXYFCc5XNxIXXiPYQJy8EleSrPDSNeJt1Xw7r/EFXZS3ZYpnM"
-    "IL8PRnzsuzQrObCWtkPUPP08FO/CeY0OwKHMRl89psF8FRop+IOll3hG+B7d7MJE+86lo+3T"
-    "u9+vnMkpFUp68E/GjwNl9lW5NpoicuKLMa7quSq0fPpvI3SReq9VH/3XEesh8QQcPHsQlVFA"
-    "uoBPAvZMWp2geBZc05UTxmpOlacefCpO4eBzlDQTpTOt1I/8FoQ4k048rKuAlWnDgDK5Hac4"
-    "mYefPs+kXAUdPAh2OklX6arunW6V5sESOD3ThFyBmwSkMSP/72fkyjtgH/t1fW47u/LGuVJl"
-    "hjykrfxHgwbu6zePPjZtH2heCv5VvhUb4Ihb7yfsX3jvD7QzMwf7ZI/9HRxcap+aers9O3Gq"
-    "bd00w4nYI+3krX3tvZl97ez8PgQG25vXuS/u/kr7sf1fR7G101T56EaKmoaY7On5eF2SDz26"
-    "uDVXITmER8S7c6+2fLPoFtNJFDAtKUtVXx8C0HnIBxvZ2eOpwlaPikNG5ODlwZs6R4Dyrh2p"
-    "NRceJPIiFza77sDpSYWcO+XMW/pKZ8vmrirjpCMkjcLTTjAdNe81rVgLVTuUUg8KRKolnaNn"
-    "SXnwpzgovh/l7s2+1ibP/Ww6tDlOa19AOfKS7rtMT7VRjtyceKYN7fwiyR8HxeCxdmby3207"
-    "Lv1nHG3AfZoYCR3hMiSlHE7v1RS3nYrX1txbuMt5VPN06uwPZV2I5ZWnegXJsrtQXh6z43dC"
-    "Txmg9cp40s82EaWYOMoLadw748R17XTdKzCtf9ZzrUbq4j7ws+HutbZ55fQ6XxXGUhxV3KwP"
-    "f8MEwBI/8RA3f4dXLrGQ3zUvKi9Of9WCb0+kV6EQX8tQ7VKZRwRclCsVjyhC67J/yGN2yomD"
-    "jnxcwF9tks6bzhYUgVeBWof6s/hKmpCA+JKB/zjx9toZlQLrquSS1CKesYBl3GBqgeLEnVA7"
-    "+Ie6pCQh8QiXJ+Vn6WTdVh0aTKj4EyfPgPPwTnOOszNlEBO3DuleDhW/mLbwzi+RxV1usTy6"
-    "1akzyw6Nw1NrrJM4fZb18ujvvl0LOfSCfuabclDOrmYCoMfLdWU+9/gkLrj0FiIjR3EIeass"
-    "lkLrtrIg5TUMK7kV0stg646UxKz0ffl51XvVmV44xhemtO7fExXcVHDto0rhJLH/1nFHQ3Hu"
-    "4Zu/G3qE26encKvvqxnzkHJD81o8L5lIw3/KCxwt/3KLOBlWbTVQ8VvDoVcis+FOXjKKC1uT"
-    "QQhRBF1DisLS4ApFY39v7ldOf6L90J6TYdq+EsREBHrYj4NUuwssuMhbcEub/xTaJ8OigPVE"
-    "tSHgRwb5NS8fFu9y5g1Tl2Nsrx9AmUmDI24abRS4ip9pENJmaibwK0MbnqDc+eBHlzgESxuz"
-    "FJlYj3iJQAVkFBcoZ6XMLnP2B7skNm+sxXyuC4EYYebxTTLk450do9ewmJn0q06OND1NeczO"
-    "P4W+5cdVeaopKUKiOEk0nMLh1m1OpIVxxoe5ikX8LSQMOcT6JZ3MJl+ksZIi4aId5pf+NCwt"
-    "JPJNBzcCKKnv/9qQ+53ulxZv3Him/eiB1+gMShHpO/PXrx+5L/HD0hrBhm9brjPQ6i4on60T"
-    "1yG5s+/C3Hj79XOfuw/eo16e3vpO+4uH/i5HL3C3JmWST2zgT7LN/8e20XFt2Ny+dP6n2neu"
-    "fzYgjk280v7Izi9xejAbhslL+qTuCXUHjfXv0RUf5a5evtyWOWdrkcXgEeqUq4SSV8NwYGYE"
-    "1r125S4HFDxgc14P2ytc3j3/HvcjevVOV2/wgvT1XkE7Xc9Wkg88TFMBpBImR7igV2XCa2Ss"
-    "B5+9KsZnOxur10M1Z+mEnVrTQmFnpMCT3fhOnuKjBcQrZkzndJwLkqMkUi/GzJUaRnyM27B0"
-    "sY2c/bvEJgWKzwpX5YzEGgAJmDIRoTubn223nv3v2uC+n3oMpNamt/14289aq03gQTMCL+uW"
-    "o2Sy8L2mZj1LyhsOrAPr0fP6bnBK+yK7kSBTFBj1ClldJ50sk1NoTg+qqEgLXbUZ233e4rf+"
-    "y2iKqlWXQpYnID/STS59s33+1v8Q+G7BVyFQgfaU+ZmZhXbl6k3uBpzLPY3T0G2ck6X3MSXo"
-    "QaIS1CuNPHrDdU9ac1z0q3Kl4qtiKf7ink6TB6fe9NPJM9b7RzlSlBwiGZI20VM2weiXPAqm"
-    "cYPYOqDm5467dKhWAIj7V7iVLLMsOv11wZFzF+9s3NEGb3NI9l0Ou8RVtXSRu7x6GSkyFi35"
-    "yZ/ilkquKV1vjuDSoiiEtu3ewrGmuJVCYhksRfALTHhjkLWeyMhN927GP2WGCFUGIxs/GOah"
-    "T9+XR4w91qGXBaaPYrF+at7kD7iRDfRzlCHykcIL15P/+9kNyTl3Z0sbH5gHfoUbp5ddklOa"
-    "kSLtRBxX6SVSON97P5cLhPbCSlz4hPajRTyDItpTlCBks/2glsGRQWUUMMJK4lB0zDQr+bqp"
-    "S7F3l81Q/Rpr8a91a56XiLyhQQIitW/+wWfdr7ikVmQ/8TWmhe/j4G25lYcD0hTX09r+dW6F"
-    "cxBJ53ry0INy9Eowj1XmpOJLPLqPQO+Bq54eehAhmoojhsJF4ZMKEiXf+bPj+pdxx6/ub+dm"
-    "J9vBrdy7BrwsbAX+BuBkod1jgdH4OfRLgtmB29BVbJzWCJGCF4ISU/UAteCfccX99r1N7bUr"
-    "h9q3Lx1qb1zfz11+45Sh79idFlhqR7dcaZ/Z80H7xNSJtmcM5oeYMqMHPIYRghvUwt1BKNvI"
-    "a1spnZKVAdPX3DCCjY7V4/pVZlLhVN4yndeFW9va168817568al2dd6rhgoHlYW941fbF3a9"
-    "3X5k3ysofVgJvodlrXa0Xr4delBmD3+148yuLy0NTHd42a/z1kscZyEu7rq0/hS+1xYn2ju3"
-    "nmuv3XyqnZjdy2naCttOytNANg4utH2jl9snJ99tz217u00OnOeQ1zq51inRZRQFhY0KlCMd"
-    "qbNIxyfTe2BbaEVnevFGMWo81n19bPPr7e3ZT67zae0rZ/e05wZ/ldF03fsk312+vZ9O7f51"
-    "Ugc3HW9nFj5+X1pfPO/l/Xffpdyct0SZdfJZf9id2+3/35t/da2cifHwr0+N/kr7g8N/r105"
-    "C79RjuzyAa50V3mSZ+3IfmTgf277Nn+ivbbwxfb77/1NLqN27Q7XuRBPZcXzZaLAoOyYZvbe"
-    "rYdnuM533guyUZ7kc9d+rC6MRohoRVLRdVsx2T/W2RHumOJi7aGyLNkevPDaa2i2LHF/H/WW"
-    "jgEe1TqzDP+oKNk+PZJFq1V42/Zg2+sUqN5PK06dsF/CTOuP9I5whSH6zreUrhKatlcHIzrj"
-    "WRYVmfc/ojDmLy2kYawztk/ySieF1JIPN8y907a+/Jfa9MivtsHtn380bTbubfPjP9QG5r9M"
-    "nM7KOLa1XdjxVwJHJYnsQps7WLVUclVGB5f+LueQvZ93haW48E9cp5BqIFOy0fZA2QAifZfG"
-    "nmlzOzksVFdipJ75lgbD8++2scu/JKCS8Ibi77tw8rya4sMPtjDrUktVrIGxnigzuQ5kFCUa"
-    "uTiytLEtD3u0xIY2NTmeKdp5dk1KV5UoOxD5zeMqFqJcF11E1/KLjoqs+BbPQG9RtIP6HlzS"
-    "kLflT6lILCxxt9DyqrgUtKK/8JNJfAnnr+JLmopZEHweavMTn25zW15q81s+0+6MP9s2bJyk"
-    "EpFrcaRevtQGFk634aXTbdMCFunp32ijC28Cy7y7aPwELzLXq8cQVuPZHaKe4+agurdEaiAw"
-    "ED8S2F+sbNzZLm39U21+09G2DK/dHubqqo1YWjf0p5VBz7vTnHPGxfBLr7S9t7/a9tz9NpY8"
-    "YRceyZ2XUuIC2kITDt3J22i2Uz8f5byLUNfTk1bejs99ur0y97l2aQX5eocD1eAZj2KaHL7Y"
-    "9m082/aPnG+fn+LAY85760kjXYIPCo/0N2/xMFwaCF/8fLZPcDetu6c1Bli/N29PtnemP95e"
-    "vf5EOzW/nz4Hub6uzxm2zxm73F7YWn3OLnAZ4po1i2g9DG/EAIAsU34ok/VbgVfFy7aWaUd/"
-    "waPWv7GRaXEHZxU+bfH1FkG/4w6NX2hPTZzKc8oD7olEZVumd2eOtt+58ql2hvW/N5a2Ias8"
-    "QoMo9NmjHDb95PjZ9tLON9ox8B247/ok01ODkXM8UUb7Yek1dOHcOTqTGo15doSC1u2mOZ+D"
-    "jtcj4u2gryyvIZpcP/JrQ/uHr7PO5vA/TuXYifCQvKZvPvnY1LOMwE+98y7xaewoLwqSYW+0"
-    "RygvgY+dngrPJjo0T3o3nBsQ29dv/Xj78vQfoHB9I3swG5Sf5ZF2/OrBfP5Oe6kdHX29/aHt"
-    "/6Tt2Xgqwt8UCiqZxIPIrNhYqRBIdlj1kfHdhs56De81opGpyJjm9sDW9ksXf6q9tfTFMMCD"
-    "GKhonZ/Z3f4fPv/45PPtz+z6W+3Q8FvAU/hVhT6YxvdzZ8+2jZfeTj4ygx2uVgbxsQN0rt/O"
-    "uOcnOwDxvry4q/3W9B9vJ5ax4vTM/WAG+Hu20+nZo/n84pkfb4c2vdp+bOIftr2jl9LIpLsK"
-    "nRcM2+hiVUHhVUhvXOxGvTDZ7dsIloe4qY2XoRNlvLtWxlPzT7a5xTk6Maw8sJdbfd+dr8ax"
-    "HsTBkTMPVbAc5WzZxu40aIEuGQVwlIPsVH6tj8WNu9p7V15aD+qhzz+x5xfbj+7+bcI84d7O"
-    "tRqHQqNO/bWdKmBL4Oy6e7H98N1/QAPaD4uiQJBGxddGv4nF3PK5iogMPDOH0D/70GxXPb0u"
-    "avMAZy5FwdEShCCFxiosdZI+Ipb3SzcQjBixHuXcDbZ1fAeXo28HV9oKipXK3rZJtlDT+MVT"
-    "mJYvggWaW16nXsTXZ2VOKUooRTCaHaWWEduYI86NyAYVrf6cMUeSutABf0gfp/KV86IYeAyC"
-    "l3yigmTGVFfaT6Ws+A/7loczqsbyK19HqAqBF3FUtnrG3ugb/3Vb/v2/+TAQq35zg4faCJ2K"
-    "vOLJ7XfvzrWLE3+s3Rt9djXOgw8rK+Nt4rt/DdxV7kKOfKm06KoDgmA+dx9pNnPw3293D/5l"
-    "vR/qBt78r8q/b6xdLOH5+d6c1kORsj7JlH/rrzYRAAE445RTK2LkJrJBxclzwUR/ngGJJ92r"
-    "7ErH7OKL4lFKYinVq6UCoPT+XnETrZKRFqevN3EUhDvGnDIMNCPwCUn1EBn9HnQJo40PbW/X"
-    "9vw77dbeP88ZaGuy5sMpoCWKzj0+S+3zfKiXe/9lG7n8823fB/9T27DsZcj3O2mfNkAjUEnV"
-    "2ms7Uq6Llk4FP42E57nRj7fzKOlz234Cv/uXDiTy6hdKyMAkfcNku7TxqXap/TTlXGq7ln6r"
-    "Pbv899vk3fdS5pTBL/LIzzplygFzlKsOj1XQD3kY2zAT+qsUfnvux9tv3/rj8Huv7K0luHdv"
-    "qF1fOpDPG4wDvz7zUvsrB36uTW68nioQB+mh640H1mvqFtyicImjxOFfpV+WvHhrR/unV36s"
-    "vXbjOfyrfQTI+i/8l+lzTqHU+PlHH/x4+9jk8fanj3ytbUdgLnJtzuzMlTY8tqHt5iJ72zuE"
-    "ISvzkEdDJrIVS7/5w/MDlnH84uk/vD6n1edPoRw9vfVMR5tKb5rfufTp9ivnv/DI3eX22fNL"
-    "W9rrSx9vr1/7ePurH/v59sLkO8m3gJs7OGBDcRZJ+kh7p76Hbly/GOIpSCMEGbltUBBhetYc"
-    "eocD0dRQF+6sMfMqxt3D1KbTXAmyGyKUJaMP//b0p9sfmf9SGx1ybl9TO0ig2XkdzuOdSgP5"
-    "kr+Xvw4OoSHLYHRwKhLs2cFvuI2iGK5QqW9OP9P+zvm/gAC53/Lx+DwM3dBOLrzYfvbci+3z"
-    "O77WfnLqF7ASsBC266S1TsV6oFKBMue1Ai5yt7NV0Rghf381W8pgV+8ebf/LW/92W2LH2vfi"
-    "lu5Mtb998T9nDc9X6bhY87Kypnw8mH4HV1ns3bwvIwWtZdKjV6gUAFr8VJCd2tANQJ8vnfzR"
-    "9utXvgBuMuG/nDuz9In2fy6/2P7Ek19uP/XEt6gz70zDUkZZZR/p4houFTwVES1Z8tXMjf2t"
-    "XflwXkOb97ZnB861t64eXQ28e5c73sa/2J6eeA+aOgIfbj//nU+thvvg6OHY3tvtdx+iWIyN"
-    "jnHtz57E3zwOr/RCCB9x+fWbf5CHRzTwpOLU7pEb7SeOvo5yt83c8lm1uND4/j/e3gPOs6O6"
-    "8z2dc87dM9MzPTlIGuWRQAkhMsuCeWAyn32YZb37/NZrbPPsfc/ss9d+67V3SY+1jW1EWCMs"
-    "I7AIRljCAiShxEiTc+7u6emcc9jf99T//vvf3f/7/4+EcHXf/723boVTp06dOnXqVBXlZGSC"
-    "AIGDv4KL0IhCY8rTknc+0H68M1HmBaKRwAig1yxO+fgpAIqDcE+9zslWKQh1Ek4kyHIuFmXK"
-    "5PgsOUjhwggP3oh2ZlFCiGtoXcBRIOWD8w5ZB6wiYMEQvGwYufNReKOMbKoHc0ODDR9g+bpP"
-    "VUgLgoNHEI7L+QWDHYRL4QmNXmDQzn6UjpL1xMFzdheNmIUeHaURYEa4YYoSI2yhW064Hj1g"
-    "s9q7i52g49xEToOOZ9JGj6JV8Mq5YXXdX7D+zX8aF8VyN7zTZl7UXloqo0jLy4hwCZ1RLu/w"
-    "FNvLGMATGkUHjW90SkqX8NLCuFVe+dt0nzx9/5ClnqPICE7wAZCNID4pjTIHUFNfYcPKYGPG"
-    "uYwIVgwIceMKw95k0BN1Tjm4eKfy6S7oDxCyAijULzHRWugrkbK4IISH8KlBo5iuCSMtfSQ5"
-    "H6R6HiHH1Dg8T5fstL6Wj9pco6aDc4s93uowWd/Fr6ab3mdn6t5s1Rc/Jbu8v44IMiVqoGXw"
-    "Cp3R1uFxtA/uvgq8oNxOtX/eZis1iH65TgJZb/Eb/Kqc2297Z76g4d0JyJkKSOI5wnd0v5qC"
-    "l+WN2qD644dGPqZ+uf2qIRyebbHPXPgP9v7WL9nmslPKioEMfJ46T/AxEQJ/EAR/CMu4MIBa"
-    "sn/oebP9pP/V+h7V9FVnr617ttsfDG+1jtH7be/Sd3RiSIGdPTdoe6/fZXuu2xOUP/k6Qsf5"
-    "MaY+ok9nKiEP58kBnLSZDkhI8mnSBN3NqP/50sm32qH++EHWmoTECzZXXFzjHfhfoGXaHzwG"
-    "v/z2LVudwAOzCMxUTcuFGVIhkKt7R1pjR+IcqXNb/Sl7suuaFRkvqQBn8t4kAeI5pYEanYy1"
-    "m7OpM+tdEXTFS0VVhTVvaPfOzYmNH8WnIQYOrQonPRXkG6dusW933vqyKjQ102f691nn3Cb7"
-    "+I3ftboSaVUgHKUf6ivAXSllBM4bmjc6LT/XYcKFWiF1arDF/uSZt0gAixeSQuxVvyLExzpv"
-    "X+W59rVIQh+HMCPo4SD6fE0BgBPqiJG+9EgSgAptTALeZw+9zc4j7Pwcjo76m6fvtL7pGvvw"
-    "jn9U2mIyyou/XGkQ89Towvw7TB4Y6KTTCxSDUyW2u+rsCgEL0A4MbLZd9V0uuI5PLtipkXUr"
-    "IN5YfskmZtOnCSGz9B4HLWDvg+Fy5A4ObooeY+//ou0nqlAJBVG06A5epelB2+PyiPxdLa6O"
-    "B0cbAfn4ud2U44UwtKHAlNAw6DWrA3tc0LZPuSkPcEtaCCsIKhBiEE4yJ8cqNW/cipAjYS13"
-    "DhsbDQqUQdjvKGHALoN10sOYnhL5FKE0GpSJE+y9w9MXpuWhMd8BnX5GDAYX/IBRUg4vwr/Y"
-    "sR71rH+m00KnSfgAk0hUwl5490Qy/CgJLz/G0krap6sQqpzuRWfQJmKba8W0weviVKdmhzbG"
-    "pjiVq0O5hU+m1ObUaeYLIXUDX7e+9b8ddoNPEzO3SPs9bXq7FXU95HTmRdMPsFG3bh+jd9Wy"
-    "wwhupmrukTIjfjCa2/MdDTLHqU65lbgg3eDnD5l/lBflh0bQLmJDhZE+zyFt1amEYezfODoE"
-    "TRZCD4MkBCzXUCVomfCuoUTQEm5Dh0rqoWoDDest/Ht1ZwbOScDbJP0s/Ye7xG3Fc+RHZmnc"
-    "dOlu69n0e7ZU8yp9jQKnCfgSvHLyq22k45OaXrzR2k/+m2RMb7cJQRPeAtzQS9DeBsF8SXRz"
-    "cuNf2HxFds14MuEsD6MFN9iPCz5vzfOP2x1Ln9bgTPo2FRWeHgnQURK07Wyuf77NHhz5NfGh"
-    "l6pwYEBWZl/u/lf2ggpZ2AAAQABJREFUO5v/k5VowQ8YR3seBHDRHM/yCwNJSEJ+agPjCxX2"
-    "xfPvs87x9mzgZf6ugd3Zin9lTS177D2bv2Pbd03YI9/9oRQHs3bt9Qy+0cKzP1/oE4DP6VMP"
-    "8BvnPzE5DOk4NMiMiU76tM+ceI+0VnUxodN718uMplRTm4EWyR1HO+Smdz3QJiWeOP3nFuSX"
-    "alQnw7O8Enmyk69GB5oGYJSgCT0hUlqiBXbdDQXy9Fb9DM5UyFj56Crf8Pq9C3vFVIt0NIBG"
-    "fVJJzsloTTwgo2NX5aCl4lBIDlcNNiLYBGEbAcHTITx06mb79umXp6FJB0DXSJP9/jNvs/5R"
-    "VhLpTDCmH9X5MgtCR4dmYVYdk0+LiNBhccwMdw/l2h89+8aXLlylAyLGjwYfLYnnKBUO02TU"
-    "QEVTuSyv5z4tw7w/2v+un1u4SgXjic5r7HvnODcOjY4IiI5W+c7No5VUp0wnSzeT6Iz5utqN"
-    "yqB+T+3Z1d72ooSgEG/Jzk1sVFIrtRDX1Z7RER4xU740Ks83CEEIgL7viTjApFTivZONa/JL"
-    "9agsGbCbGvarHhEimApWwaQxy9Gmhb7Pk/yYgvLRvDfogOuA89CQaNA0KG9UdL66YEYwAO6Z"
-    "GvwyLKGzjPZQUhI0Wf9MOtQ3PThTZpmcN3fBwijNbQdFs6TFdD9aRoRFOlgB65ocOlMYJR0L"
-    "OaLdQZiLYGc/LPeTNtuFReGaY2dgHqQRdcTkSzm5gyu2dyBjNDuOHy9LYMR8z8YIlYw7cIrQ"
-    "THvTIyjwdLnR8QBbEOqVZmFmRrk4PaL2G9JCuADYuZkJK7z0xZBZzO9Sx4etvLTQKso4CzXY"
-    "LnlZvaNjylg0l2DsYGCi8e0xKQXvyq4vp3wHYwlHAYWzCLbIO/au8LT/Kdn6jYxM6JrUXl+a"
-    "xled48+eXm6gLZix6WMF6ICM9lm4gPBLfftKv0TdUw63MVO5KI875UEd4Lh5p+pv2X+S9RwF"
-    "JRldITWKKmyRTcIv5BN9jSKpnucHbanqBnmk4Gr588/1NF//VutZ9/FEGgjJztj83QfR4FhE"
-    "R9mBFY3J6U2fe0WFq+UCyL4Ic/qlKccRtIRL4km+/InbZMXEY2MfeFnCVQTLolZOPzesQb8K"
-    "TY2gJQIfEU6AKShkQozZpRL73Jn//ecXriIAdP/p5Vvs+xfuscbmNrvznlvs+f3Hrb/vsvLF"
-    "FCehPXdMBBijqOAozo1LwALuWck0nz3xyy9ZuCLdbdJeeZ3oGZp1uqWqnJjhK7St8Eoz0lq2"
-    "IBFi6+QdNkQmGJc0yqMnRT0eqcg9Zpof7JraKvqssaJ/zdfhyWo7OrDeVzEgkrCaoVi2OJkc"
-    "KEKFHzpwdXzOwNTAA4fVe549fXmHPXz6lRtFRPAMTtTZ5w6/XWUWM1U+bAwHZ0cz41oL/XK8"
-    "CIZs3gRUnr88+iYx77Vz3FGar9Sdji8idK9PJRwJWQCzKJg+I81Vv+bAX2n3zXN32PmxRnXU"
-    "gQEDBziBPzNKZkdf6bCUrWNlTfbjEvyay4estCgYYEYBhibrbWiyxJnY8eGNkXfyfk3dWWnk"
-    "4nEbGrvqiUavKzCkHDtBWtRdBndH4wF9JYwoUw0jbCaIVkZlcV5LB4pGkjAqnZc9EpoIExqY"
-    "L3AQrcCIEYIKxQBoyOG8r8wwKOGAO+EyX9sQAItyde0tZQkCDh27SzUEj3eUX50pV540mfMA"
-    "pHIF2gVHaKsklGiVaA4rRaFvOltwpzsdLG2PaWDfVVrPvLu2SGGBjcGRp+dhoQH5qn16Mn4P"
-    "01aR8BPqJGAQCiEcVzYH6OQ7n5ii5B3n9k96DvZw4b5UvlFlrggB4n6nezQFD/CUj3JLANTg"
-    "qfz8Z1WPjEjTu8Wau6y0fpNVVZTquB1WQDFVCnBMM8LsqSNoB9rTgLRR9jgxbnHsmBWNPJP8"
-    "GuGOO8UDP+4St2TAVQ9kP60jQ6Ym521sbNrGtFcX224AD9OBTBOyUpOz+iAbbK0mfUoQPqZ8"
-    "/FI7RpgS3XHB64JgHWVGVwV9Uw+ONscZca/WeVsUnnGJ1LzNIKhBF6HEiQw81NrEC2YvW0n3"
-    "l/zrL+JnYv2vyii9VWWkr6OPYbAFnUq9IDoBJwwIWF3dU/t+m9WK1F+Ey1/qsTsW/qvjJbSn"
-    "0CbBEe+sMYu2y8ie/1o8Zo+zMsSPhu7Q3naaE/GGnaBM1ZlPyxFU+HJBXbTzhbPvtaGpeK3t"
-    "ypSv/u0fOu+0M4MVVl5TZTU1rTqQ/JR4JYN62hsUJQdMCaLUk9NXXA5L2k14QnZfXzn9Zhue"
-    "enl95I6qC6qHBK+k8xMU/q7BXqg3+kdWWAOdeLobKycgCtUC93PQE77hlm30MqQ9jV677rD9"
-    "zbG7V8Tj5fvSYu2uOR/8lYkfoxPe0v6CL5AGFM7MdPd3ET7S9KiWen7x+L1p4671XLJqrRSs"
-    "0lYEl8Ya1HGt1JCsDW92dmiDPd59g712/X5VJkgMlUgFUqFcATbTfl9b7ORAe7pk0vqVFY/J"
-    "Jk2r+iZrVJar6GkSqVDuCBdUKM+CJPrqVfbIhZvs9FUcMVNTNmQ31msFZXG/bFvEOCQEXxRu"
-    "DvVvUXrLqUapcwfWB8+82j5+/d8lyAMCTyFux4ljJTVa8nlCQhJwX1t3wZ7u3pP05+GkzgW8"
-    "sf6wHR1aOT1Yqj2yWsr6tbR3pW1fFBmacIN24QKBz+1iNBKnci6Mt0TBYu+NRQOhtNSp4gT8"
-    "UoZQRCWLp9c1fgSjEblgKe2Wr2zBExeiJQWjFZ7hJfY3YhBMdzlDV0g0xpG/3yGVKK+YlPgc"
-    "tBN0qpyzh3AYhHCgRLsnDhloR+XirENnmCoTu/pQXvLi7rhQcOoMPzrEBT27TZoCuN2R0uSb"
-    "/hU+0SYcESAj1IOGb6Ts755m4pM8MjqCIcCiZSF9LniQT8cqPccJ8OnDdMvbMqbFx6Xxix5G"
-    "JZEwosGjtyfZ/S0MaaXPN2yh7f3p01AHMtb6QWvu/rTyZLBHVPABKgP9o0gm3Ym6+6RJiz+G"
-    "qbj768k8Aq0F3FEWBEZHPLjSYyZHXOytxqWNQngiAosspmc19ScNLII9aWJaN6s9xHwApPJ6"
-    "R00B5OBq4C7Qc8iQdOWV3sX5pw/98nyVf3DcExnq1njp03a+6d1auBeHW1HYTLflTZ6RxmtI"
-    "q/pkFF3UokV8GxPpZbhJKO5p+z9s/bnfFi5E304XodNEm5szJTwKkRzMPNjw7gwJhU9l449b"
-    "09SPrXzhkhUuaTCpGaGxgm02VrTVRvK32GTBFg3mVg8G5uyu2f+s+aIJ4Z+BjJwqgrqgHkMb"
-    "DLjxvQtBTYQqD/zK/0zPSTEyusf2VGgQmkIUtGWGgAG+HHv8yp1aGLU5KwCF1m3XVRyz7c1a"
-    "XW2z1q3FP52TTXZseLviUqC1DoP2hy7eYx/bdsmammptePiC6F3xZYeVdNCM4AMd9NXOF5If"
-    "1z584/xr7UD/7rUfrtJnS+UFl0FgAKH9J4Q92hd1lyhKVCKNcRJOQAIclxuORf6Je2CSqzxT"
-    "XpkmvL3luD1w8tVrhJhjAxt1Dly1NZWNeIxSzim8SueNXmEj4ofJPnTmNjGU0HnEJcMUz3t3"
-    "PG77BFOp5pKpB7QUF0Yb7fOHX29sdJnJPXT2Vnt16zErLZDELEafNHwWBsFFGLEu2bcuaHXe"
-    "VbjXbHjB3rTxeR2oGjQ4C5LCz40021dO3m1dumdzqhmvu6R9jSIk+ZGeR+dK7eELmi7N4HK1"
-    "JcQHtv5Q9XREaaG5ZFpMRAFu9HdWm3F+/sgbbWxKq9XSuJOqx87RemspveJfYdArhCz5Qujp"
-    "3Iw0WNTlNbXn1ghYJ0bWS/A6YV0TK4Wia2vOOsMbn09pUCmJkx4XLmBn+X2cbSiyuIbiQe9k"
-    "oPmIsXoL8TRJd7k0CpLEE1OadP4rGjMBHJ5IIA8dWRYQ/DNCjsNAT019eGahZUJ7TB3i6Awz"
-    "OXAQmHEIVSD7KjoHb0NK09u1YEdowY+t2GASrOjCLenZ9x7Sd0ZgUVq+klLf3LxNghTfoENG"
-    "asDn4Co+4IWN/QQJNkKAqwubrgiX0Bl/WZ2CEIr0uc/qvD/AZJoOzQv+uPmybTa39RNkE+uW"
-    "5kZs/vLjNiGSKNQ0ct68cKHo7DJPh1bX+XnrbXuv4qevs4Gad9jGgf8hwUUG9VpNPTVFu2FK"
-    "NcABPqQ0tIlMgt7ijFV0fzUJY4SzUA7hSn90EBweDR4zueGCa2x/9R9o6izgwAVPaa/AORo+"
-    "ysYFinxgrBdClvd808oGwqpuyu3TggnaitpRpnx/0d+AEadiCF7ewIpqZXHUKlVHY5v+I5/d"
-    "LUmQKul50KoGH7HiySOWO892QPAjyg4+ZSZQcYv1rv8PtlhzZ4gU8ztV91aNyP4v5wHkCV5I"
-    "CJ7AKktMUvK1Lc5iCcJAvGscvN+2DX/K241PHauSKUvNwlHtyxW0Hibh4Gzh2+xk8bs1YAla"
-    "n2vn/trqlk46/LRH+GoggfBLXZKOO7yi54RXpltd4TnbXnzMOkpOWn3hZRuab7LjU9fZMyOv"
-    "UToh/bj4XVMttrv8BeEztAvHK3HEr8D1mFbZPnLlrrjo7p+TM213Ft5vZV1fsb6jA9Z69822"
-    "oaPDFuul8ReBnptot7889TYbn6lJm86ZkS02tLTRmpoH7PihY4qjVessBJLGFniSdCucreHJ"
-    "aVJ8vveaNL7Bq1QbS1+rLRiaZDrSWDIisyatHlTfMzhbJUFwvfbTLLIKbdfgbdb5j+oJmoOf"
-    "6mLHenhT6KMDz5Ot5zJTWe4w1tZgVOVx0A1qn6UdtZfspqZT9mz3zpXBVCmPXbpOAs+P3b8s"
-    "X0Z8WVwEATA5TcmD+/Bspf1klTH96qRy8+bt3+75lu2pOyebEkZzYeNEld/aKy7bJ296wP70"
-    "wNvtwvDKDj01Hab8fnDhevuXW55RfOUNHH6BLypW+2YMt1l3NuFILeNXdn/Pbm05kZq8tAeL"
-    "trmqyz55ywParuFm+9ZpjDjjXWh4y3UV4SeK8e1z+zIKnQic/27Pw44Tj6MEvAPVi6elAm2u"
-    "7BTevm//33PxI7UnL++2d26WgAVxKy5wef2QDkQHYtI4lrpOz+XZdhm6Bw5KrOAg3gvj6xVf"
-    "wkWKu7bmtKc5kUHAYooUogaaSFCh0Y1J4MzmGkq0BxqBFB4GxsgsrObDjw9UPGXiOZQ3CCm8"
-    "yyVoM7woEIRCKstFC5+y/HosRWLzR09f95AGX6A1ByAOtStSh0bBSdCEBZrF/oqUJL7Rayjt"
-    "RCeSyId38pG5mfLXo95hoAhnbnPnXoLNiximLdHiYEUgX32lI/eIenIsJnyhDXBKOHIIPx6U"
-    "5wxOVerhvTyCGcdGo77DvRJDKBxr+YBNbv5NCTuZjXlnux5RubTZ6rQ0VhpklMjoG4jCQbXC"
-    "xYS2SRn8kS3V3uP5rP5ZKlxvw2Wvstqpp+lbFI9VpNptX/AwFQeM+ezb1yAN1urI0Xuv9uqS"
-    "UBA58OLCjzw8jvCdL4EVGzdn2lHANPelwnU2VbsuzZdEHaf5Qh6z48ddwCJHBDHgDrQVC3Wa"
-    "lH7BXiIS6CSQpGhfD0BX3/NXNtr6IcuZG7Oqy1+2mv6/VWE1UA9EGcKvAq1s/DnbeOz9dn7n"
-    "VyRk3bXq6/JrTn6VTRVfY8UTLwZPJ9Rk0o6nOdFANlc1d9TD0nbCFfECtS0KpP9cTXFtm/07"
-    "277w93a+QFNVeVts19I3A+8SbRGO+vfAZAgsuhIgeXHxzurE7+8o/5bdWvZdCf/YUoYTHEry"
-    "h229+GpDYZ99p/eXMyYzJC3WCidcOzi6w+ofuXyP+EOG7SkEw7/e8aAGz/02vusuO/CzA3bg"
-    "wCGrqa+zqtoGCTBz1iGbpo9s+Xv71JEPr8gq9eXJ7t12c94BDWzYCHjSissSmqoEXhxniuDy"
-    "Iqh7ia5Oe3G9ed1Tdn2tBHXscRMyEQI27YR+8q0StFHQ8Cyu6MK3V5PycuEXWKBF3qlDf1Rc"
-    "PJISmBgzEiK0kHRRXSciJ/1XPYy6DVKOvabt8Kov4fVHQtLsYjBOeykarECYAoL8BdiL/dv0"
-    "6GCnzQfP16w7YNc2XAjIUCfBUlvvfIUcVmdVFM7Zr17zqEIGhMQl9FNN//kyXfCSWn5F4/3F"
-    "vk1xUZP+Nzcft1ubVwpX0Uff2kAM+saGk5FX7N0rjYqhPpR3gCfAr+ZrP72SeXT1+vbnbLeM"
-    "zIkXlSUIJOCSBhOm2TaJ4LfL7inOHZUw5CuN0LTIwf6Q2LnjlEysm5wr8hUYLeVBAxYFHJys"
-    "s+f7tkWvfvftGWouuKAwKaPLdC5iYqHZhxDgiUYwlkWDVaiRSHEums1QbsB2YVHxvTyUyZ8d"
-    "4V4u0I8wF2xVKDOR9OsPPCK4BLsmnsOHDAghvhw4oy6AmzheBqWDYARzJI9MePVEiKkWDy5Y"
-    "DBFNnUZQMP0IwwAsmC2rUdFYOS0ocUSwQvkXaSk/5wayWSubrWKvxGic+gXfTEHiz/RjKGvI"
-    "Afi4KENUFr6Tl+/JRvmUedT5RDDH3ovX2ei6j9rUpl/V9W8sb/ev2dKu37Dezf/ZLu/5kl15"
-    "1c9sere0BcVtsUmED6rfk39phZqCY4Ule0b51hUSENFCC1UuSNZ2/lnGdLqrf8nLV6gBW3lZ"
-    "iYQr8KP9AoWL4mLtmdekrRnUUce58i5pr1JIgfbm+BJOmIoqVjplJTKkLw48Mi6dn8cf2qD+"
-    "WFFIPVH3aN+gC+jOXQqMwJd0qc9Jz1f4AZwkkETeZJmASiZQs7bxwJut48B9Vtv7ZWm1NEgn"
-    "vAeMQkahU+CSMNx85ndTPNI/jmnDUto9uGBKlRQ5r5G2ACS588PpI6b4nqv5iM3kN3sb8zYs"
-    "HNN2WGQA3r1tqL5pp3lSH29Z+K7dMv85pRB4Fm0j4hveqvTDanniwXf80rNnkJLv6sdc7dD+"
-    "ztrP2m0V/+D8w3mIAoErb5Oa7txb+bTgWmkPuzqdobkqn+GIeBp8n3IAIwLW/uGVph6r49/Z"
-    "+GPbVHRU09loAMts8/atmh2Z1oIMZrKgPS3I0KKb9pJztkWnaMS5Y5rhAEcF2nqIc0IZBcKP"
-    "nFaofxy8RddLdbtrj9vvXvfXdmPdIQlFjBhJJ/A7Vxh40lQE/qID8TT4G7k67bkmK+TKu0PA"
-    "D7DoP599k5wYJHgQFsApgOra/YlKGbIBPzobDHu31nRbbdmApuDqQq6J3/n5Ivtp93a7s+2Q"
-    "jmbRSqYMjoItihGyWIDlmQUFpWFaQ8V6rrcjQ0x9EhJeu/5FwR4EBwJ7HchfRdIKydCp1Mv+"
-    "aHv9RW042k6QtK5PxuID09VWV6RdeEVcSkk4YqpCl94ODW5IGy/yRGv0ji0/BalpXS6Wi3Kh"
-    "UaUNkvSk8kKu8qLBeT0BhdnpEe2SK7u0eLdkr2454HGcMFWUMHUgQlUDdkGLpHSBt61VV+yE"
-    "DmNO53rGm2TDoj11CmWDJJsUNRMxpTCdxLPTT7qI8pteKLEaHeNwgwS97441p4TKkVby+pR3"
-    "sw5p0wpzNWpQqSczjJIYYdBhOnP0ioZJLki1m2FkpZyK8ziCxgvs+cJE0PyAZ2doShc7JqbB"
-    "wikCQYtCFgxICO8796ou2AGdJfvRXlHRRp7eia0oVfoXX/moBkk9qCBeD8BB+t7uaI/6lM3I"
-    "FTIrEFzse1WgCGBvRkyMsw1Z6YmRPuc9ilXYkmAuVBmVsgtbrI7FnmdkZNSP2mEz34qKchmX"
-    "1mhPNVISjiWQwNr6+0ZtaHjE2jc0uTDnR67oOyRJB4XWi/pg37ie3gHbuEH7t0mrrIN/vIz0"
-    "5xQzk8up2G1zu//Yg1CTaN+4cETNEt3D8TN74WtWJO1UxM/QOhE7aI/ooElJx+YMPq45vqMy"
-    "EN2l97VusvJem+kutaLFMe0pVeR0Ab3ki+lL6aS9leKP61mcOm9lg/+UqF9yVw3I9hEc0KlK"
-    "ZtOlu+oY+PCLyroWkpfvQ+cI3XoHKdrnDgzwtuXVcsuYjeoo3OXv/8vfrxaSFTwhER388+jf"
-    "En5JPihS8o+JDAgD/eXO9SdiqP5ERIT3Nqa0wnsiHm1UaS7I1mm+WLuqFzaK3vtlwxVv2DxX"
-    "KJstpceAgDR5ZtEAOGO7i7JF5T2ngSE7tMe4+cJt9uy6h6xl/CFbP/2IVc4dE90F/koUyhGm"
-    "DlXRcmFLDPnTN3n7Vlj/opDKNwzmQtnpExlwuR0lbS2Du6b4p7ax4KDKEYQzglKmUPfCjeN+"
-    "Xptsn7aTYyv5bmqyI/PVvigNecDrRmngFF0bem7SopHy1OCrnpekbDmiwOIHOTqaSavIc61M"
-    "NF5rU+PD4hHyk09ufpFvGL6xtEv92MpBdpRg32SLzRaxEEqLUrRdEa0DGKBLNJzgCfqA72Mj"
-    "erXutqbn7V2bJIR6/MAT2NcraOND/YArBqe+4lp1gFafMPBXAHC8CBa4KjmHbX0C/QgyBpe8"
-    "BKbDCj+AXRRheQOgtkkEiANueUrrmMZhfwoo+03th+yrR+9eE+7Rzj12pwzhSwqm1nxL9XAC"
-    "B2QRHiNxnwai45Dm6vTwutSga547qrusXvOnqY6KgCadsKiUBBLvbj2aUcAijSMyGr+z9SCR"
-    "vBKJi5vTioRurarL5DpquqyhOG7kA3MIjALYsjkqFjxQG0CCo65wL/Zt9HvcD4b1GPhfmWpV"
-    "EMUVQjhaAEEBAvEiubdXuFZaxAtrdEgj8xVqFMF+CeLAwJZ0CrRyLRotpYNlRst5Mea9seGY"
-    "fffC7auCkPeyu0kHLjO9y35bM7HCUmCCDoNOG3ANjrYCgcg5gmjtXs3L6Y9pyW6B7CpmdLAv"
-    "5XfDYI0qgQKbI5gZ5Qm2d6EzEuKcJmEMPHM2JHiEcdHEL549a5U11Toup1RwB4ENWs7mvE4B"
-    "QpfXgH7QlLjWyefhVCbu/jU+NaXgRybR2QQDfL2LybK7sB+/I1g4UoiNS3HkFe2PdO58l+0/"
-    "dMZ6R8Zs2zodL6Uwh0/MSpgutL17NtmWTW0qk7Q/89M2ONxjTxy9bM3NNa7xYosQaNnzV3HR"
-    "cAFDb/+oHenut9aWeq3A0+hTK9zQICF8OWNyKH5xP0vTl6z+9O/YmGDDhfafoHdB63whfHIa"
-    "qOr6KxvZ9qfpAWJjyOp3WFPfXzgNF0vTxEIEymk6/26i/J708eRbJluhYp0HiHNuqjwLRDuQ"
-    "BnhjexHfNFQeCDsJkDz8K/njeStBBkTYFo2Oa2NiwY9QV1VeoulJjiOjFlMcZEnNCqgI9pSv"
-    "mR9JisKsLhD+6b6pQui8+IRbES3hyUafUTlCINnEle21ybJrdUTRVpvVtViySXuRNSiB5UHW"
-    "irQ84sqfBe2NFWhSqQOHPgtNThcMoKCV+t77rb/tt1dGXP2m43EuV7zPr7z5TqvXuZFtC89Z"
-    "y9LPxK81pSkHzeT5SmNyiSBTuR33CAwBBsKi5QkzBkG7lkQOHzM4lABM4+Pg2SQNrZGfo1KP"
-    "5bmZNViT85WKh0DhhOo4cPsjJXB0dLunHfujY4qO98hmqfJW32qFsvX2DFl30W2y4d1mk4M1"
-    "OsA9nIm6pCOxZnLjp/mBf//xfmusKrPyqnoXeH0VNJmrkvwPuvH68tLFghV9aJex+ns2f1/Y"
-    "EOdWGYmFrOE1L9wst4MIh6HeqDt8ghAewiH8Ej70P4lnQgltsmllRBNG/WSkjbGUkc65k5qU"
-    "ETmERQEWx0NGEYCr71MSsOjYOOfqtsZD9sCp25XGSkP07tFm69Y5Py2lPTJU0xE8MavDSJsO"
-    "b36ew2YFmxoV20hMLi2f6bc6/+idswXjHVIutQCZaQv+jGFDKkM6y5DwNGwqMKqAcXZrV8Vn"
-    "cg3SfHkMcEjkFS5Iw/iH0fSKj2te6MRZSk1d8I/zZ937Zf+WyU1MV9qfa+uJV8qNawO7OuvX"
-    "aWCMkBDOGTmg+UGCj9dOjs0EYXlD9ZBVlQxpH5Ka9CAJ17e0nlEB5637Yo+EhZV0lIwkPBRo"
-    "ZLPIRpNqpM8+8aTVNrTZnuuvswod7J3JsWR3RFq/MmmynBmJ9qlgUOt1gjCrAkEvCPqhQVHf"
-    "apISNFyHyMBEdgSFhbk2MtBnnRcv2HVNDRI6OBNSe7WxLUCirjLCEtGGGhvnvyGwKBsXoJe0"
-    "LYCSUkcI5YHreAfcZFcgDQvLmWGlBe5HGhK6oH35Mu23pP1kEMLYPX/oSp898pPDdtu16+wN"
-    "W66R5qpM5V60Ca1SuyIN1MNPHtVIdsE6OqQN0N/6ja32oc0dSomNGEN9O32KRsEh007F2nur"
-    "JDqjklMcpDmDfksEGxuGegHji/Jzf1mavmCbjr3LpnTQ7mRCwEqXKJ0p6EeQruh5wIY3xm88"
-    "2lvzdmsb/KvEKFlTqgiSwmtn0X2qrJhBiWi4bVQHiJcEzVEEAys40b4ywEWz6FvCqO7DNG8U"
-    "6hW+i6agZ/jNkA6FHtC+YKWCY1h3hCx2LneBUX7BBXpJvr5UcKJk0sVL+4381jqo2r8Ibmhu"
-    "MbfQhhvfYWOymZuv1tRewcrZkrRJr012hc9CfqXaObRAH0EHqnaiQRbT25xmAp9bN/SX2lF+"
-    "i43X/tKKuHEvC/nr7AqXwXvnrHruBdsw/xNbv6BVhtqskvxwEbx01NR/5J+q5YP/ABvlvxpH"
-    "e1TwpGMw7RojRUdgg7dFZxYmA616IDfScDs4wUrO8BT+BmarV4Ve9VrYbA90f8S0eHClk9nz"
-    "qcvy4noJrrq12m7cdpM0XmU6Hk+zWwLGYdNPJPS4hi9DW4+yw/zkfR3fC7yZfp0PpKPLcY+H"
-    "nh3fnl6gC4LxPVFtAQA85fD32klUT5RmfiAoRsckrtVowwPWd7lH76hKZZgsozKk6KH860kn"
-    "1o3N6jxDCWps+5Cvc/Xubjtmj56/bk34xy7utA/s6rWaognrjRGwhgaHg4CnBr8gBoWGjQKM"
-    "aDfwbK6+eDx9EK8QL3b4rvdaaXayueEZNjulwYXOLVEdvp9Gtrj1JSF91ZVX1urwkeS72j/t"
-    "u2CAwn0PLq/MQACEHV51OHLa+K+g54SmCK0UTOjPmYIkKxWSsxspa5yb1uGZNGwEj5vrT9ij"
-    "l/alDbqhosuqRB/HDx21i52jkhgo/Fo3oXMg53RGYoE6czq65pZmGUBWinbmrDx/cm2EVT5D"
-    "szK2LBvXmX2y5xD7YXUKjRXmhPDBETJ0gMtligoXcM/5jHmCTW3UBvv7rbmp3srLK9QGIg1S"
-    "YIqrsk376g1XX/woGuGIfH0wILjytBoQzUbujPCcwZEGR+pweDm0gtCLfc+c9kzC3g+FJ4ya"
-    "ETItHobC3/CwVmBpWvHGG3ZbieAfHRn3o1fKK2uttLzKbrrcZyNjPdqsstrK9D6tpetj2mup"
-    "prpcA6pwIDV5j45O2ODgpOwk5qyxoVLaryAS0lmRL0e1sM1Cf/+wzdRqWjVGJslQxKv6lKPp"
-    "vnWnf132Dz1edwLNXaQZ4E65cRFlIXwuagl4cedXbKbjN/zb6p/F4h02V3GtFU4fFV+ckYDF"
-    "Dun51lcuASvGFY//2Kql7RVxeYiIlrw+VSFeH8IN+EPsjCgsJrmf29vpTEBwh5rADatDoTX+"
-    "6OCXXerzsu8v7on80mAAL8E8L0FqoO1jNtn8nqRQ9YpB6LM4yyWDRqBbX4krTSV4QsTY0v07"
-    "dlYvo1pZ+tJcgQ0X3OLXQfv3Wln4ot249IA1mmx/lB6XU2N0411lpv1CpPTT2Pw5drKwNqIm"
-    "BTK9UBYKgF+UF3xbHCZrERCuAvpDvSglT2M04/Rg1mRfcoCOXTdoevCgeI9MhjTzwKKV4IAL"
-    "qAJcAY/+Gvtzb+vT1qyVgmF2goXb6ttVzjC9p7pWvdNPUXDCkHoQShM41DsCa+SiNhPMhyJf"
-    "RdZ/Poj2TelUkYA6MTZi509rQ7zCcquurtG3GdlmTNnw4mpRNEoo3MdlwExFSpch4i+wO1t+"
-    "KgHrWn0MhY9CP3Vll71v90+tVtqd3rG6yHvFfUr2IHSYRTL6nJIdDD0Ywts4p3FncTWrNrIM"
-    "wYFB7ENEiqOh8F9RpIOaZZ+SyWgeLQexqDjiR2mMauokm6srnlB44jEVtzY0ErcTerqPq4L7"
-    "CESV6rDzjSIk4rEv2D+ny5d2pLRYZ0KpbHTc2ChRlvC8rJZfDdO8DnrO1cadbAVwS/PZWAHr"
-    "9pZTNik67O/ttfZNO2OPaJoYG7OJkUGrqG+UEWWpbdnFElxWjMp+qCALF1LIvskq2yiS4qgj"
-    "hKSJsXHthj3hU5OF0rSUlkuTgyYqYWMV1b8LYYpQgPGNqGNyYtyGB7Q6p61FDZKDk4NWJzC0"
-    "1VhI/05VYpO3BE0oz77ePuvXQGdmWtPp8iuvqLCpkpvSR074Yjf15I9+Ztt2brSW9S06b04H"
-    "owuWwwePWoWmgNo3rZchtktZYq5iFoIVBlKsVXVTKv/Zs5espqFRjLzIyiqrVO4ZabTNbrx5"
-    "rzgNU6f6Eb/o7uqzxw+dtHfde5NV6VgrynzsxAX72dluu2Z9vnY9r7WfHe72UxuqJYSQXoFs"
-    "LSYmZuzUuU471Tds1bvSNIiMpcv+cXHilNVe/O9WO/SQ2py0qWp37BfFc9TE6DSxq0EITnWR"
-    "prLi0p/bzMZfVWWkH8xdKn2r7ZzWNicCH5u1JW3eOlJyW2pSK57bJ76hcwFpn/AO/fqP4JG2"
-    "ypm2aoKuzpmMYApYyYKbiRNWOvQDzyfwF0bfQUhKzTziD56aAC4bfc55BnRZXcG2KVPS4i5o"
-    "sKvFDaonQAM/DksiIXnJhd+E19XfiBYVJUqCdy7Qzz01jF6TLuHv0QTYWPW91r/9T7XPWFMy"
-    "yWTYV+iB8gOUDwgY0AhPCMJ0nNQ1JxSgedzR939bz+xhu1T7r20pg01WPFh5NpR3oz1qN1rt"
-    "4gt2S85XrCk3nP0XyhtQ41voKD9oDR83lRFM2ZwLyyqMo1eEsSRag+YpD5VM3+qzhyHhjMk5"
-    "PSgEfJD+nXQAaPyfWcDSdJcVaPCcL9tFNiBntBiRT/SEqQqa+mzunuZnRXZqdSoL+Kbeo/ek"
-    "BjHhl0SRAnkfrLvjEZyovRKXd48niJjUwo/+hGeNP3mj8jTIki3A/OykiKrQdl63V9vUY9DH"
-    "IcSzdhbbp2fjQZ+QEZsbh2lKo0AVWjZz0hpyDlrf0kot1pzC/axni5Ut9SmxjrQJIvSMyoi2"
-    "oKxRgEuxqY4ZGKVPSxs+1XNGx/oghMDIIgYDIqiNpJAEclVB2FFlEq5Ityg/EJYj06sjIDAf"
-    "w+EsblqwUHVUUlIwSokDPLnq8CIJOOXTmsdIsFv9gTQK3YB49Zdf3HutZkeH+nptdHBEmo1x"
-    "P/C6ubVVbWBWBtDxho+nznRZdd9+q29osPbmWcM2bCLN9ObehlM2omM9JqQlqJVNQ5yr1g6/"
-    "JRI82F2b1SgHn3vRqqqrrX3bVttcO2w/7IqLGfzPak+0W+oDI7p47rxdutgp2kfoUEOVrVBD"
-    "Y5O1b9wsrU6ZhAUZetOLeX2qvYimFjVtVqJBwJBWtmBoX1HX4HSHoSztCkZWrD3Ysjk6aabp"
-    "mZKf035PnYKl58oVCVVl1tjaIJjy7NzFLuvMHZBBT4bUZsd0Cv2QTWuBSY61qD0XCs4p6+68"
-    "aNffIM2LDEQ55FeeYgDaPFEDIRhnc2uTvfO119mDjx7wxG/YvM7Wr2tyflBbq7M2pZbP03E5"
-    "LDhZ0FQsTA7KZuQHc+ns7HHh6i2379aGgGgQlWZTs52WwHbw0pBzGuh0YGjEhau7r22349Jm"
-    "ZW/NGcq6pEHYdLc2grykbRZO6wDlb1jJyFOCTW2fKTfBNquphDntdUWdOSNkCk5wUDep/CHk"
-    "Qt3q+0yf5XR/w5bWvT9t5kNVb7TZ3t93bQI00Jt3szhs+in6nIVea5p9wvGsLD3f6M7ikuAE"
-    "n76h+V8UrKoWf0+becKzaPqYrev+Qxd46UwhS6Zd0Vg6oyNcgt9Repx3AiErf2cKt7E23+pU"
-    "Brf7Ai9CEqzSkUV8T8SDv7wfMk+UO9KikIfjHkFOLvz6o36AX3546op45mDzB21k6x/pPbtw"
-    "4QlEP6IR9suyOZmNFLVJqM3QeIBTyIc+cPB7lzXlPz3DIedzwUYNBYI2wGwd/VtrHf9766z+"
-    "gF+Wl15ZEIESdx/Mvd6+b3vtVTqDcFvu4y7ErECK8ndBC5jUbum3IrzEpQmuKQfChtv2odGW"
-    "Sy0fg9xEFcQl4/6p05TUDppeUFSgBUj/nK44XzxZ9AG/gj6hIQAJ9RXe4c/Alt3R1kJde3in"
-    "NeGXiKr30ASUvv7dplj3ILRyR6gKfQbP5B/lSRhgwwki0YmmmR1QES4GccC2pI4kV+cQ5mpZ"
-    "5YyOqaASFnR2z5K2zc/k5hW/QCPVaXYWVgd1+dw5u630cXt4YqWARRqPXhIjnn8+NjkErMG+"
-    "Aatr05JXDI+1uV+eTtZeHLsUGyf6wIanFNiR7S1EX9RwQIlLno4DkJBjQzPxwkCUXjVaLqUD"
-    "8gIiA0LLCqVZy+KGZ8oUh5zlAt5XxIDgw9Rjmo8rQkJLnkqoOC8gSYZyVGnLgc5V4X+RrzO9"
-    "B+zMycNWIeGiWZqSvoEBe/G5Tp9SG9e0Upwrr6wQwS7Yof37rWPLVrul4Yz90yVpR1Jcc/ll"
-    "125OVVVplVqbnTyjyfoYZWFJmY4u0XL5eY1uZifHrbf7oqatZKwqhtJedFipvkFXwFtKFsnH"
-    "J67stbdueMqunNlvly512q5rtsuIskqCRZ4E/CFNUZ7S9JrZzr27fKXdPNpU6EjpIxgvauqc"
-    "I6WG+gesWIbtRWUVYsTYg0mtrDpC0CrJzy5GjM1VaBpJnYDcxOiIdZ0/Y62bNtim7Ts0uJCR"
-    "qxpqmYznDxzLzMQLbEyDoiobHx22BbVDjssZHBzU/lEy0G2sVxuWkCSD1UK1KWBkuo5phxkJ"
-    "Ihva19mvf7jZLl/qUX2O2PGjx2XMvmgDcwV2y9YG27Wz3UrLtGJO2r5yBE7ByopFBMOR0XHb"
-    "3VJj1dJ6zc4safps0SorK622ulLLjYYk1M0qTqmOa5lSOaU9kiDgu6nH1Ct4yJ08bK39X3KG"
-    "Do8KDE7TpbMDliuBKn/6ggQMMV0xOR9VeySEFgTkMLWrm76pzKojOgrf+4kQ3pYTzBmGKBKh"
-    "HO6E66rzn7fhde/Va5oOvaBZdjX7rHFGwpy0/n0Vrw3x0vy2THxPi0E04BO+o/bvjFdh2YOL"
-    "VWowesrHOacsAGDYG9p1mgQTXo4P4ZDOjk6UIrjwn+ARBHOBRne+RVqIRHTPj2c63wLRBHHD"
-    "Qemp5RV+EvwzGzxRui/lHkClbQrAVOfNNfBYvCfLb7GRLb+vp1TYUiMknpc0NT78jJWOPmsl"
-    "YwesePqUNoVVfwERKI9z137HrPLGNBGDVygjHSa2S+AVzbz6HdF4odoRz66ASCzSCPZzsksc"
-    "u986xr9iQ6X77HLp62yg5E7ZN8bYlsbmnmNP5vyaDgFfsG35T7gQ5WxLSHK69DpU+eE7Eoyy"
-    "ugQdOL37M/1XaBO+zYDqO7h43hjlEQktuWjWwYvSgbdV5I3Ltuyfz9UUD7m5UIAH4TDRftVu"
-    "gYuSQK9JXpABNPpcZlwwA8ExHUiZ0Og7MxC9OGaUHpjy6UB9J234CPJEqov6Zh/pAFfKx3z/"
-    "qDjyVyXozCrZtTDlU1qiJZVagrwoIQsCW91IU9LwR89YxMkmn3MydO4bGLfbr7tiPzozbCM6"
-    "iiXVnRlsk/Htk6EsqR8Sz6ygGhnSIZ8QOastGD1rumKw83ia0Cu9BjBKlwPZ4ILG5USq8lER"
-    "7hLPA5MZRjQhpCG8eAWCoIBufy/Jyz4FNZSwjSJXYqe6BGjO7JNwpQZY9Uw9RZd/isARTAiB"
-    "mVyeDLl/66bvaMqp0y5e7LKyMgl+0vpAJ+RNo6FoTnSSKGD+23ftsDJpUAZ0wOap42esbX27"
-    "1bc12cRwv5078Iy1b9lmG7du9mm0pikJeOfO2uljx7SCTlOEMfbltdIIbW7coem/CRcC9nYc"
-    "WyNg7Ws4oSXV8xLeqmzbtu1aZq0psgvpS8chyI5XcCO+U1yqgYEYItsbLE50WfHCWZvO25w+"
-    "snwXpWH81tlbbHPvI7Z+Q6u1d2zRZqj4z1ldY4mt2zRtZ89csrHxUauQ4BXqKTQgGHKhtADz"
-    "M5o+l7Z1w6YOxcMuQMIAgrPaAg23ODe7gDUyV2kbVAam6y5f7tKUZYE1NjYGDQUjLdVHZVWt"
-    "liq3xJaFDwVL47Z1xzb72TNsyjdplTIy75H91IaNGxVfU4yaDkK7zNYsblsmAQXKLPA9nYql"
-    "gZyx7Tu32kZNNe7arcPE9b23b9COHj9rjz/ZY3e9aq/s3LQ1Q4IxIahQB+y7Vamz+jDWntPy"
-    "a2yTEBzKykJbhHeQX4E0dPOK0z84anMb5mTlGe8K5qX9GXvYBQh4C4tuyI8Kpx7mpamSnsry"
-    "mOvQv3+DiPVC3QSjfg53DsyQpu+dk8J6sChrb9fRi0e3gsnjttT3Q8tpSC889VW9xcouPurb"
-    "NYyU3ZkSOfVx0VpGvq5tMrTYIJFHalZz6qiBDbhh4DwDuR+Zk5pMmmfQMOfTIQieKrGIn7Sd"
-    "71M+uYAJPSTe3TP6UWA6KHDiK5P1TP1EcCbjkEhaF/thZWgFAy5+qDMuWo8Lf57EqnQIi1d0"
-    "12Nv+2/pPYMkrjCFlzXFdvGPrWBetm6ry6t3ypnNBd4ahJeIz5IUNnbFWl1Jf8LACnu1iJ5d"
-    "AFUY6q1h5mlrmnvW8icKbLDwRq2Wu8N6Cm+z+bz12bIO3zXweSLn31vtUpc15pwXyoIwBW1I"
-    "zeFTylHZshUHYYorbDkREEKZwAMCCn/Jus4CnddVov4I6oKN+FpVYYytcyK9XO0x+NHN/1N5"
-    "hsFmJBgm84UwvCABFodPcQO0iUSimzxL89UPiA8SwOsChp8IzC3ghJJldyg2nJcrIncELerU"
-    "5QRSiBLRNx65mPLzvIGbB+ExlCXQtl6cPpJAKRROsw+M8IIhFwbDU5OT6jg02pwYtZkJJaJM"
-    "CiRsTY3H29aQkFcce+zIWPbs6VNKo8Jq6ursTfMH7WvHVjOhHDudcw/R0jqMjUelwRofHbOK"
-    "Gtl2aWDa191tC5PDWoU0ZlPSUsW5EyMtknQTxXQERRUYkEkD98oUkk9qJ/Zsrq28PxEEDIc0"
-    "qBQIjNUIq3cfTwT228XxOq/AZJ6Jj1QRzqdUqWw4ZhYX6jeKSWDKQceiVV1JGNMnsiDjctWy"
-    "bas6p72oXrCqHIyXdbK49rHyzlLlQTBhRD6mqblJHSK7WR1mpTQQVybP6qiAZ21LpYzIa+bs"
-    "ZOd+m1PH2bZhgwTfQp8iZDO+Jk0Rdl08I5uOeNUx0xgFhcVaulsue6dp21bbLbuGSWlQlm3I"
-    "bmg+LQNsdb06M3JJmtT6dY2xAtbYmAyqZYdV19QkTdOo03FRqc48FCPElnBz/kE7shQvYIGt"
-    "p/pussaFaqvQnk0vPPscU/3SQoUz3dh3KkfHrExrCrBUZY5GOtFcf77OGUOQAYeVVVrS7OhH"
-    "YGF7B6YVZiWga4qC6WSWOse43hmV0bRSDyGkMNBnsabz3L6GhqyEsacaz98gw6KYRORdab3W"
-    "2NKiLQGOagXguAzSy61P7Wj3nu1i0AjUU/rGtCAHFWvFr/dbmpK8qHpQm69vqJUGekrftApQ"
-    "whkGvg0Y7pcV2/3ffsaukyDZKE0YAyB3oj865glt/QA9wqRyNX0yI6N6tmVgs1Ic06gw+yLl"
-    "Pa7G2bGp1YaUZibRkzbq+BZteoMmIeXn/voGBMpOeKZ7C8IKAgZtisUJ+qRv+gIPSFw+FZZo"
-    "NyQX54hbceHPbDxGwJqqudeWzi/aSN522eC0pk2maOI5y588bbPqCIAL5wyZMviLeKX/BaoB"
-    "tiUt6GEKVg8ePvYHlGjwTT2JOsTESRG64T1LXBJVELpthyORSehIA39LeMXe8ud6Y79FHxby"
-    "lnk0+ayBarVnKjCJRGaLN9lS9b4oybT3ytO/a3U9fx2+0en+HC6irQgXvAM37Rvl9ZJoN3TC"
-    "AU8MfJaRGNotm1E2Luy3xqn9ljv9WRvVAO9C0RvsYuFrtS9XfRbo8uyg/Qu7L+ezCqecIzpI"
-    "4GY1yuISQ5ihXw8uwEUbwDl96NFpMQTI/Es71IUjjei5tUhmARliLupYGbEP21BywXkhMEUD"
-    "HEAJg4KgWSNNH/ABYqKsgWCW8R3hIhJqaefg3yne+09m21T/Ec4ywOb9rcJ5PUdwKTw8O7jQ"
-    "igAFmIOQC2+RfyKvgIcAbDRtKkwl4i/fxHXDC8yR/XEWNHqfETM/fPCAVtVMSGIXcYkhD+Tv"
-    "WY6V5gmQ/PgMHV9w5dIl27jxGssXk97XesAeOLFPgK0chcxr/UScwz6AIy3GtLqpumGdLUjw"
-    "67p4zjZ1bLJ98xftn87vjotq41OVdqBvs13fdNY7XBDOlBFFd+S44Cv1vHD56CWM8OMd2rhd"
-    "dZ0eAOQ7ApUQyC2QrU5bRa91SqCLcz2y8TmvrSk2VQZlahL9DkwilvAfEX9cOu5P5ery+nIY"
-    "lhvJ9Q2nhePXZIz+5OUtdm/pjzTy1XRQR4e1btikZy2fR7hWebxRqhM8sv85rQbr83zkq44R"
-    "A3btXl2hZcz6m5JQU1lZLYGDVWKTwoM6bJ3tlicjZvYFYsFEnGM0yAayc9r/BIGO0fqnXv0/"
-    "XDuB/dG87I/yZBUIekaH+3xabi63Ki45FzqGBvv96IUZFkZIiAFF/GCwvjf/+3Z0/m16jWe8"
-    "S0sF9sPcT9i78z+jKa6gRSoqqkrAlCcbrI0aYFQGJiE6Im1GlN/pfr0E2wFrGHzAp78YFAiJ"
-    "Hi6qT/BVmDen1ap9NpjhtPmnhm6xexofV1tjGktTEuBceJ1VY0YwZhq0a2ad9h/riMUFH7ZU"
-    "iValOdugqdUBaZ7ogEsl3NRq6whYR9ijDMGPo16gJ9G0NEFT0+N2/8NP2b993+ussanOy85+"
-    "WVJoqaSaUiwo9nyZfuXQ20grhNFvqaZpm+ur7KkTlzWNOCOhvFwaLDROc3b5ShicsDISV1oS"
-    "0untlaahjVqOd3z1K0mbohf5AbdreyT8Uh15XrfKT8/ksyDa0lyLRyYstJ1gcc7E4XNhI1RS"
-    "j74Ah97BCU+KUzb0TzY6dljmVWv5HobW01W322jFnURM61pHHhQDJ3/BI7ogeSXraSMY0jeH"
-    "kbRg1jYAHoAlQtpyJECRNln3hMcjfBPHeZJ+nX8jdXkB9IkwBInePWb0IxxCW4IrmlLxYPzg"
-    "0sYJn/gtmBGdLUo81gAozs1oryPK7El6enCT8O71wkcQknRR5ngEACYrbtAzsdK7pemLy8KV"
-    "goA3F3pCrvJZrvv0KSz7AgngpApXeLCBMHc0qJ6+wnjbUdohvPoWVahrABNlgn5w3KoWz9je"
-    "2c/LnP1Ldjj/A3Y87936Egk/HmzFz5WlrUpPXqDAaTxsfIoH/X8i6RVxVr84P1dAkkgKDbSF"
-    "RH2HdnF1aZG2l4ciKUHKyt/uysP27e638jnWPT+w2za2n/dBj/efTvhKRrSXtD2W0Oq17XjW"
-    "M8Qd0EdzdFxQZrcv1AP14/gXMojHFfrmwN94z+aScYQP31iUAZnyCG0BvOkPfCkhyu5p6ic8"
-    "h3yTjSsBD+kwJRs54uNyfX5Rz2yyhaOTq6mt1ah3p+2+brftvHaXXX/ztbZj11b/HvcDYqal"
-    "BRjo7dGAvUDaq1oVnJ1XF+3muhfioqX1RwNQoU3FMHRX7dhA/xUJW5PWpGX4e+tOpo2T6vmd"
-    "CzcqWoL1CAFRsSNEcX+mZ6dNZrHB2lV7UR0knUOiUgOqQ1ZKZGul7IOyuEcu3uiVR57Jiwec"
-    "KoGKeK53e3jP8Et9OWGRSiIefji2m2ipzDyq/JHObzwxtl1aCR2DUlop4YoDdLWsXz3TnAQk"
-    "ySdacaXpXWmgqqplKyUtBVM/M7KfmZtWJ6DOelYG0tAL+yPhx4hhVt/RhrDppqrbN9kMUK39"
-    "nZddEAIdK3JCMcQxsDFCiNBiBs5nhAoL1UFePHPELpzSGXGaoo5zdGAIaQiHc0qTDTVntFUE"
-    "TaKsTJrPiTN2Q83+uOhJ/5Hca+3LY39s+c13WtumDqtrabP1m7dbRXW9tKVqGyqbC1BC+IQO"
-    "rf7ciQ/Yj3put6+eebMdGt5lrW2tEip0Fh3aE4VhCo46AofM93dUdCfzSvcwMVtrLw5DJ3lW"
-    "LVsrNEIjQ8O+ui9fw0Cuf+i+J13UFL9F29E4KFjzpYmqs6HBIV+JuLFjnWCTnZXqiU6YPzoD"
-    "Rri0M55bZEi/vaXUfvLEC9I+d9rY6KTqdUGauzk7c6rLnnjqqO3b1iYtV7EPWioqwsIDTUR4"
-    "fW7e3G5b6svs0OHz1tXVLw3otKYWh+2pYxcdPuoEe5/amnK7dVurPXe6x88VSwE+9hF8AjfC"
-    "ocOd6CTAFdOw1D3PMEfKxnS3/kUL0vKIdxAfB2MmDG96VEg5XqLLH4I/jJSr7MIXCJXW9Ve+"
-    "yUaqYupkQfu8DX7TaXFGUuqsNmedlVY0umZmp4WjcbW3CQmxakvSdDKwRRhjepW8M7lEkTxc"
-    "FDaUE7gTZUvceQ/hwQXPFDgRxh9CQB+d+zfedaU6jweqeNAHbtrENZOb0v5UybB6cLgS6ZKE"
-    "uwCQwiXSpVY8TMh/rrAtCpn2nj9+aIU/ZaMc9NHhCunOlmy2paLmFWHTv4R8oaMIr5hNcIRR"
-    "RH/nan/Njjb9kU0XbFQSCifa9MGp0yExg4tQCM2ySCVXNmLXzX/RmhefTIRIf5tekjmNwI7S"
-    "DenE1F36JLyOwUMYNIc2oiS9P44ELupSQbK6YCOsUqk9uYG9+lXiVReOakPvzHztp/032ImR"
-    "zWq3WvjmWm/ME+CRiWx5UNKUUbXmfQtafFwY+Ic8WfLIQibau8OhSAxEfe849R568l/40dW4"
-    "QGKUA2Ep+lPSgmdOC3nYyxE8sfBkVu2XgYrvoK/+xgVDJeDyoOreB6n6HuhDD0qP9Hkv1NSy"
-    "+A6eSOHaBmF8UgaqYoTqWBqa2qxS2qPaVnU4jeuNPXEyOcBc0Mag3RcuK/w6GeWWq++csTxJ"
-    "qK9fn0mZuDZVDlWsbWq0mbFBm9NUx6Vzp621eaMVqtPcpoMqC3MyCxPnh9rsU/vfIi2V5s7B"
-    "hBwM1++q06cv77D7j78ueGT4vXfdIUf08ooD4UrxETKYVr2p6UyG2OHT8z077Oun7pJ2EIJe"
-    "vqhMtjn41tnb7NvnXp01Heopurx2RWSuLaL+dL1+XWYhdlFTbl+9/DHryb1dTD3YzYTuhlEv"
-    "whKdpRi9BJVcVuVJ8JmRavzA4C47X/g2CVSzViL8V9aWaZXamHZAn7Ki0gor1XEqCDl9PZc9"
-    "DNswxDuEDtWH0mYH8XDuZSQgSQcvwQrbsBx1/FUS0Lu7e6ynK16IpW6raiTIK0M68CKljfZT"
-    "4GhH9QqT6bvdYA8oTYTkzG56vtb+32ffY/948XbrndLhvv2D9swTT9nZEzrBXZ0fODk0stv+"
-    "8NBH7dxoR0hM2pNHFz9u/RLQWGWkZkSDco0fDBImATe5tuZU5sz19W87f0lC263SIDVYQ6t2"
-    "xzl0wE4dPWTdvbP2pwd/2c5PXpMxjQpNxZeq/ItsHlleKXhl66SBSaVWWrKbuyzCQhsQzfEe"
-    "ViOh8dOSfW3Hct9rbraWpjJ7+qkn7Zvf/K49/O1H7Nvf0/XYE9bSVmzXX7/dmLacF+2Dz/Za"
-    "pSfBGEN5NJr7bt4joXbRjhw5bt/+x59aT0+3vWnfdtveKI2WtrOYFw4LZEu5qb1Z/jtEshGX"
-    "jS8WPMUFJ2hcjik/riBoIYgwUSg6ggM6D6NNoJFlh3U0c/MSbtAKycxB9OF14tKXgisKbRAo"
-    "/NKzO/njy19l79dtaaYn+K/6HW94ly1qB/F0rnLwYcuVJn8ROynNLbHClQUS2LgtIEzJ39uc"
-    "KBe6hWbZtJQysABAWWd0oMOL4UFVCyoz/IiIzs8VwDGS6PThO24Qr0jgAuedfgURLzsAAEAA"
-    "SURBVKKDQCMYaQ5ImwuhlkTAA3hyl8gPv9ypi8Ev7rfm1TbQ+iuehsBQQoolJgzVkLSnrYy8"
-    "Tv2be3nefA5OeMrg5st2a+YdvJE8Ggd45HI6WqllVzZ8wrpueEybumcW1kiDfCkbjnbMBdxF"
-    "2saCDnOo6Fa7UvdRG6l8iz2vI3FerP0Dm8jb4HlGeE1ED7DolzI7nYkelZS2Dxz29ON+imzE"
-    "w4UaVCgHgTTQsoSFMw5oXAJEUbhwBY36PG1CgguG6pw8EYkVbqKSIR0+uV2pAEdYAx9oasAT"
-    "qHlN/dMZYy+p//2LM++z4yNbvRy0Wx/kiR6wzeLCbhNehf03MGNGcnBwhz03dIO3Ewar85Ij"
-    "oCH6KKbQF13jyw738tPli0j0jZqLBLRMgLEdDvJOvmYG2FOLgbCbIygxTFgKtXk1igi+FZdU"
-    "KClO0lDZRU8F2r4K0xCBCwPRGaLF6m8KbGpi1sZHtJpcCiq+jQ2PaaHeoOWr3gUVmqtp36IB"
-    "uxwOgYUJzLNxpJ5hyM4UMkANwge6L0l7laul5c1CiEqutUZMR7TXzFpz4XHtHbIjQwrLnwCp"
-    "tq7G+rqu2IXTGD3nW5NG0EtCSqGmNO4p+p/2yPSvL0dI83Skf7P93nPvsVu1Um1z9WUrL5DB"
-    "8nCjJOo2bROBxohc4l1HzSXbU3fGid0ZigoYCUjEoiK3VWvfoNJBLdPPLHz+4PyNdmKo2a6v"
-    "1zRnZY9rQbD/OqhjeAYnMseNIIT4IpBptLhUdfjtrYft+1qR1zPG1hrpHQT/j/ZJO3Ligr15"
-    "/qhdW3tSxxZhYyABglGWGPDEfIH1z7XZEQl9T/TulQZH9lHC3RtyPq3Gmaf9lTqkpRyyo0f2"
-    "W/vUJsXL1yabg3ZFwlCumJ0fl5Q+e8cZOGQ1GZ01cV0IUXhvwKpfjmJBSGtbv1n2gHN2+sql"
-    "mNSkfpctV1W1jL81pQ1upqUNYJfyBTWG2pp1tmNnjozUD9qepa/ZoZz3x6YTfVjSMTt/f/41"
-    "uvCZsZqKC7a+ctyePF1jnZNN0kAIF2tckX3+/IftN4r+0lo0ZUgnTkuHmUI3lHdX1WFt9/E6"
-    "CawancY5CTrf7Xmrfb/vPmspvmzF6/rsMeU5fWWdYtCWMrt95T92TdUsu3KLMey+ZqfnX6bV"
-    "jXBDmFtEP3TF6tq8U8XAk86jubVFmusqu37vVj9OZ0qqO+KU6mDjPB0FMy9tZ462k0BbWV9f"
-    "b295/d2qM+ovbNCHXR0blS74NG+e6m7a062TRo4pZviANuTxnKu0wrCkpNBkthrroHdGqG5T"
-    "JUam3JUfUDt6l+PBVVNc6FiwURKjUzwENIRCHEIE9eL+evc25V/4oetPoChKU0Jh4aUv29yW"
-    "30qGih5yCuLbbcvgV52n0iF5UsrfO2zBH2lcVZhknsADnSCsssUFzy/ZpbKzZEEoI20r5WPK"
-    "Y8gDQUK4cf+Uj8k0qPcEXhKfqYuCqfMavmR2E1t/3ybr7rXqKw9qc9azykN0IE3SVMWNNqVd"
-    "2Ev7vmONF/44AmNNYqXjBy2TKXVOyUa7uPPLVqX0y0af1KrBXplu1tpExS02qTwmG95iOcXt"
-    "a9KN9VBBvayUV0iJeC5+szrX8Jw0V16xnkCeDZe/yZ4uf73VTf3QNsw+qpXxOg5HVO2CCJHc"
-    "QbcS7tWGzuXca2fzXp/wT3+rze1UfIVXfI+nO50//Sl4dw3UVZAHJITQ7fwQwVq0FbS+Stv/"
-    "RH9Xkc6cBJoC8WPoljSIxIBGJKvZgWfthwP7rH+yNX1hCK2B/RdOfcDWlV+0e5qetT01x6xY"
-    "ZiBQFLwfYWQ+t9yG5hvtZ33bNci8RrMp5eoD5uyaG85bhWx0GQwwgHX4NVhzPCgJFtNB27ka"
-    "nFAq7bsk/pO9UGNDo5ZfOmdT89LUa0EPPK2IQY72PhyT3fe4zEvAfbmUB2j+2ficfHgHp/jR"
-    "57AlTJlWR09P6dgpxaHdEg+hMdjpsuO8KjB02NhNaD5ELCxPnRQEhs1McCA0M+DQ08UzJ615"
-    "wyZtVig7DhU+EIQyEYLuqH7MHuy9OgELhoNRseVq/63TZ2z7jmutTEbEcyrcgoS+jsWnraHg"
-    "bdY315GAL/2tV+fvfVvXS3XsvfXeLY87wihD5JzxgQeIPnG9uf2AffXYPVGQ2PsFCXZcL9st"
-    "g5FMApy7E0w8fnj7D+2//OzdghvmHe+6J9vtC4faFeCN6pSnrEbqXlWRNt4UjucS+05dSo1f"
-    "bI8MvN4+1Py4CKrarr/lZjt54oQ0i8dUR3lWp80pt+5cp1WEJ7TfTCZhQIK7GmnbhnXqYHVo"
-    "J0BzqcFGzCSvgCX8NOoi27F7j+XVqwUeTYVl+Zk06DvZfwuBbfueXdKylfp0YW5eifLZaNV1"
-    "FbZTzHf0zA67MHfTcuSsT9rfamGbDclGPZubF84+feJD9olrvyhcalpbJAIjhF70KJdjdzU+"
-    "Zz/ovi9bUsJPsXVObFI4XeDmKlxh/pjd1dGpRq2RKnmq/ll0gOCEET4kiwDtgCXSg1FAwxif"
-    "84zmRBZjMk6vlFG7RpISiGA8TCXOYIspVoCARVjOhyxSXOoSlbm89A0WJzW+FJiUm3TlKaal"
-    "LV4kWKGpiTZgJa/EGCG2dIpKdNiRd1gat2kAoB80reBWuTnvIpzKB57hMxz3MishRRSld6a/"
-    "5zXNjx1ZoMso3eW6WQaB7EJLWvaruvQX1tfx78QP0wnXy+Gip9zxF61IW0zIbFUwBAdmyA9a"
-    "peAc/aVRq38EF0ybMLUJHrnovKK4iSTS3ih/WrfKe20wBUiECd/Cy6ponnTSTw/OCxMetd1f"
-    "tJ62D8pTI7QMbqn2bhvStdqRzFTta9Vp/Ff/lMwnCiiPEuHSCQANQIxbrFH6XPq+NKcBjgu+"
-    "IbU1acak4d4KHAQj3V2gUa0JOUEwzrWLm/6bFjS0pEkhT1sz3OeXRAUrnj9nxUtDutQpo2DI"
-    "KZNwVmWj+VoQYdlpaE/e454v7Ym8o36XenJ6hziyukDFtH8GFdiRYWuJQIPCJJyDiNAWj9co"
-    "i6JinUuqNLBvzdOuAsAEP4Ea4G6/vOERmUx8SMjPnFbn+Ab7ii5cgU7ZqCoYUVpLWkBVIz6T"
-    "6HP8a/hhhfffntxn72p9WFlpKxjtoYcrlh0nbWZctsBj2tKmorJMJi9FEnq0ae5grxacS27I"
-    "4o4ePmyVBWPSuHO8HxpuNUzKJByztyIlm52Z12L4KZVZG/FKW880/vyc7I+rq7TXnxZpTchP"
-    "GumyckwttOn2gvCk8oBTVpwjEANf/oIYqavMlCiAsxlhkQqBehvmRqWigoZBZHIknKcDTWsb"
-    "pL2SSnV+StKzRrjCol83t523b/X129xStpUUXk5naC0bNmqTxzEJbetc4KPzQDLEvusjZX9j"
-    "n+n8P9NuVJkJzqv59sHtj9oGGbCH6UWVm/+IsIWPiLFRMXe2vqgNLXca5yz+Il0y/0QmMDsa"
-    "HdRO1fC8pbrbPrjzUfvS0ezTnxGss7MldkVXNvdMz3X2pi2HrViGv2q2du31OsRzbkL2QbJP"
-    "kIqVLSBQ5VZKwIlz4CtX2owNHVug5aQQAj6B3wlddzQwM9KgsB9VTW38YgiqJBKuWETRun6j"
-    "iFwdvj4sCJZ8TUlhb1ZeVm2/3fSE/T/Pt1v/xEsXuOPKk+o/s1BmXUrbBSx9iGiE0SfG5ve2"
-    "PmPPD++1wclXPv+3N/ydNlTkTEU1NeZHhcwZCRlTHCuBYAVyIyJRGBwCEIMohCiYjGucNbCY"
-    "0agOBzNmOkHjJEXlyA5tSaGwqPOVoISuBa0ADXZ6HOdBGDQwMOAZ7XXhbUdBnYEpHabApmXX"
-    "xYHCuAg//hL7s9zWYN8uXwVVi9MPcJAOx3nQRhEGSyTQLWhrBBfi8BP+S4p1aqbuCIRE1D/B"
-    "1zj8+JbqcrVRZW6XNh5d/4FU79jnyp6vSZOKTWEiI4VkzO35CUe+Lx7wiibILQhWgfe6Josp"
-    "hXTApeRIVa4BNOX78mMIuLpM/j01DcEDuLE8Xt+E6WSePBdOn7aC7q/ZHELWy3VaQDCvM+sK"
-    "ZnuSaSeTEny5C9JfjR3Uks69Se9MD6vPJMwUdu03lUpIgH5de6UA/i666a97r83XvWltlDU+"
-    "+TadLw3wGv+r86jOOWHtec8nA1NFtFNvW2rPtD23ZUpboclo3pYjm2oWpUSC1CKCFrQnRz9K"
-    "WbM5tD0cXo+cMKT97ohTopXaOFY2505c1OKpPHts4urpYG6+1Pp1ZXMvjt5sWybv976YgR0N"
-    "Y2oyDArZVw8wZmeHVZg8zViUaSV3sw2OSsDSGq1M7prrtlltuYRhzkpVeRwXqmd4HLjmTw/6"
-    "xCKvUvVLEjA9f4RTWnOub9ArjuQw0cJpk043Qilh4fu1tTXSYOmLr5CQhNu8Du1Ti9tw+Nyx"
-    "Avr8pDKKbXyJkpDxDbfsEyPVER1T41IDalUZ0wI++tCUjfZAeuOmg/bw2ddkKrt/owHPS4Jt"
-    "2bDVmtul2lTnyXRljph0kTr0zTt3aMlrqX2i6WH7T8++U/AXZU3zagO8ueMZu2PdEZVXUAj5"
-    "/LG6kqkKCDUiUPDh3yW1fmzPD+yTz7xXiJVA+QtzVLoSVwWGfAWZe+EJSQRY72w7Ymxw+vdn"
-    "XvWKQgI+Hjh+m70p9wfWfa7Prrmx0Gq0ueTU+Kzmm/vsxOFj1iTbuzk0FzHOp3sEJxoWRlXY"
-    "YEGZEKYKpUcJ8upgZrWSCnsdCH9mmvLFOEWL1LE0Ah9FKS06MXZZZz4c4/xFaQtQOf/mnq/Y"
-    "F078Szs93BGT4Mvzzsmdt49se9B2VJ0UDQgMRkSCzdupbnwvEHP88KYH7b8f/ajKGY+jlwrB"
-    "rsoX7JrqIxJkyDfYt9BpY1+wJOaao725aMuORf0AVngJt2j37zCYgIGwYEA7YKt+mCIEr2wD"
-    "4Ib7UBkJ6GIFIdPkiwqLlmpC9pswf/KindAxIDCTLqp8mBFaLL7Pwhd0lmU2F9lsOHNVxpL/"
-    "/IgPYgIHTC0qWGiX6oBkJF6uj4NDExp8acFGuZaLSwAElhkGk6KPaAPGqC2vgMMTDT6ejx6r"
-    "Lmrj0fXv01PmUfqSBILyy9r7ynkDLRLwolQUmzIIZ+S/mDD2hY9ALgwKCJpg76GeAhixv6S/"
-    "2iXBT35UoiBrlSNc8KW9ECS8+UCOx/Dq92CKEBKAy0SuUdqnzuZ3aPoru9YgirPynmujdW+2"
-    "ust/tdI7ykIwNp/+hPXsRYuRybZzZfR0b0sLE2qHanc58X2FTzcJD2FKLmiQoMGpku1Kks40"
-    "c/2ny/dq/bS1sb0h/9P0zmJqDGH1p0piNS9148KAEuP8Ved1GRLmTNCuyW5pezT4FQ+YnGAh"
-    "hQQKKU4oI8eBsbiir/jWDKmIFkWT3ZfOimZlgyY8QL9Tk1PiydMSZsqsVNojzmNtn/4bu0lt"
-    "//m592RM7yV/VD9xpPzX7XV7v+VCC20YHsO0J9pwBm8sLuJUBNfeq466r8hEJouAVVPXpH21"
-    "wkAS3KJJ40+E7PwJnqV/5bmoQSFarDBIZdHevGZXWEAHHgkDE1rU9irginbNQBVeyYwBbSU/"
-    "R5HDDqZS3Wn39oJizl8LDBn1v6J7QpEUHIckEisuqdWc66yM0AUgBCkAfKMxZ7Q59tp2GcCe"
-    "v1PAZO5gUIvmYAvGIZvYeahgfoaamHMORtQUTmm2lPbaH9z6VfvUgbfK9ihe0xEHc6o/WzJ8"
-    "cPtj9qqWw+AMTicnPKixqw7klGd40HdVBwxR5aPcraX99vHrH7I/efHtYpyZVeaktNo1VvTb"
-    "Ozuets8feMvqTynvjIKVJ9l6zSZAVGcGhwZnEArf37rpGWstG7AvHHudCFFS+ivgEFqKJCg0"
-    "r98gIlqwM2desPzzRWq4HCFj2h+p1jbriJqTE/GMMBhbB7hd2PJ6DtwU3CLMM11CfcNEaNiu"
-    "kYmDPxGf+vDRGHShdKimRf3QIDFQFUr0rL2ZCubs13Z/zb55/l77p659cam+JP9CbUT7kc3f"
-    "sC0VZ0T7tJskweiZzhPBQvQuIFqLuuxjW+63vzj7fmlTfv562VF50P63pq8680GLNI/9gXDB"
-    "AgJ2L+eZbsGFJ9oQtAKEwg1nqgEqx8pAWYGhyEsMglkf7/hd44PApBBiGPAFBF/qhsNWg0YL"
-    "QRl/j+Rps+qR8roGQAnnaoQpeVeCjuqXNBD8EjQch2yHUUyd8GimoG8GOrQ3t6vS4G+5o1FB"
-    "3InB6Q4/LNZRPEvaa40pQl9Q4f4IeNSJ6EVlciD1S16Rg1aS7wqrfysYlx1o72OW03hfFCzt"
-    "PbfnO7JjHfNpmKDNAxY6S+gvCJ7wWoRMyqVHwUFSDC4Ely7oeBmatNkETyUa2gZ0Tg6UyRPz"
-    "714+eSNse1Xrhzy4yI8/2i3OBzj+HgaSAYIIDoXTt0goBcZICMub67OKM39o47K1onN6OW5C"
-    "04T1iX2sSBe4KQf4Iq+SiYPa1PUzNtH+8ZeTvOJogND7bWu79Pt2qeNPbLHmrrTpODWIRoUB"
-    "0ZvKLjjgV4vqxDd1fdIquv/Gujb+nvYAvCVt/J/HM3+h0+6b/YTNjFywKdFFaDzCueh/VuYP"
-    "4KRI9kF03uz4v1COEBafI21zdmrE97EskaYnCAi0FwZBhdbQUK52UWwnx5QGOpAYBw42b93i"
-    "fBgbJeok2GyG80X5Dk8g/b1Lx+16bU3yxdNvFV/4+XkbINHnFGgV/7ROcilEYBHPQJFEn+OD"
-    "FQnds9IWs38cOELWgN6zOQQz/kTWjtPQLoineo/aCTyOhBSGcnudyIOyosR3bbi8WSHpXFWm"
-    "CwqpsmO7qjCCBx4Mp0smOivAycA7K9Ims5ANwbI6NAYgBQbojVBxicc7lVEhm6p9LSfsp127"
-    "M6elOPBfGDfMAzhobHrxZ3qNKI/6khH75K0P2EOnb9e+VntV4ZmFt3QZb6rulHD1Q2sr70vk"
-    "E/L0sivbiNWEMikFh8/RmsTPVhm8f+KGB+3zh99ow5M16bJJ47dk923Yb+/c8hOVR7tsF7xW"
-    "xJOdOAUSIHjNBNiiN/knHm9sPG0bK6/YA6fushd7t4r4+PDSXa72I7uz+ZDdt/55ayobE/HU"
-    "WJU2IZ3WEnPXfKpeCnXwc5E2o3V6GQe6DE7hgdEZfQIkJ/BE3dL5+AjCC5IhncSn0GGAC+VL"
-    "2iJ372/0HUbtNCT/CCqRof3Spsfslsaj9q3zd2nxwebsmaQLITrf17Df3rZBO3rnyM5Jf9SF"
-    "dw4qg9Ot4sEk6ciAg+/bqi7ab2z/gn3pwjvsykRbupSz+uXoHLA7an9sr296ROlSMgkxKpgz"
-    "UtAgn0iTBC4JQ90EdOuuZ/DGO8wARxi0foV0KhG8CkBng4vi+FJpMSfyw+iUmS4llShnEBI8"
-    "J0UjTtCmSchVojBj8MOVrXoDbEFgoO3nCD7SwIYE5sCeYTA0v6XARz1QpnLt6l+qEw6mWVWp"
-    "JhVgCnjwt1Ash5HyJR3Jpn5LPFde/DMbyyJgVV/+qtoxuA04ca0UzEoOeqBOGP0GXIcw0AZF"
-    "csElJW+PFPMD7rjIB36rJw8Z+XmbIJ9EfA+3Kq2IHpbDgBu0azDelMDKx0Vw+UWDIr66Blr3"
-    "WglHJZNHrHfHZ16aQXkii0VtJDrPeaPz4yFv+aNtAR/YEFFvtRf+G9ZNNrP+owImfgCXSDJ5"
-    "W5Q5Q9Xx37HioR/bFB1KzQFddyW/pz6wem1UmxYjjOPYooYNlJ03CZZybVp8zdlftonyfXah"
-    "6j02XfM6IT9eG5aadvzzrG2Z+4btmf2yTl3QbJGO2kJbC30wYMHGdN4HShLypTFmuxXwkT8o"
-    "QSuQVdqka7SCemvDNtEVK+UYpFKmMLAInT88csma+mWu05U2iaRnuY6/wpEv9FtYhGZbfazT"
-    "c6AZBmW0zd2VR+x393TZQ5deZ4e0EjCbXVYyk1UPuTp55A71Oa+VWUVtofbME+2BBudB0L7/"
-    "wRvgqfQXiQSi+6r0Vr867/J2Gtpk4G1KjUGoEiMZmoDzSOhGjn5FRO9tDn94GC7UFzAE3u9p"
-    "K7SCyE+2p0zDeKIESELqcVe0MyJkc0QPFRGAA+lI3YycA/C59ob2g1kFrFBIGIQy5Z8CeeHk"
-    "ozRzRDCeD8xF//naPf5dW39sb9z4vH3v3M321JVtWW2zmLbZUXPR3tz+vG2v7UwUDcavBElU"
-    "DjjckY1ggMGQL4Tr0yMwfEdMCMcKwT/ad789cvEWe6TzOs1Rx6vOGyv67EPbfuQwhEw0WlD8"
-    "4wMbw+tV/IZcl+FdGWVJ+2ON2q/qDK5+Ga9/X3uDPa+VlRPTlSuDxbxVlQzZ3S2H7N4NB3We"
-    "nmxaJPVjS8Qu4LkyQC+vKtVdBulaUSFEeZ0wugrSfkyiCW8gBo+OXuHPsS1cRjwjQjvBA34T"
-    "EVfdiEl+Ef1GdRQFi+J6+iHTEFZ5byi/Im3W1+38WIv9RGcSHhzq0L5ogZlE8dPd0VjdXH/C"
-    "XiXhqq20S/ARSnRDOUQ7/qr06TR1U34ScFDf+DM/Zk3FV+w3t/3/dmR0l/2g59VS529QQUOD"
-    "TZdn5FeQP2HXVUrYbXxURqKjjpuAM7QYgRbJj5RciIEJ4C+4ktorAcBgBybuFRAK4HgJcQSg"
-    "u1A/0HqUNmXj2e0RVEluRKv4LgDRoYsewAPOteBqL66RkZbMtWvyhwE5EgiUyTkRAIPCK01u"
-    "lI326ZjykSS4Fc5DlknYiFOkjqBcu8nnTM56x50UYJQnMCWiJCEgThB8JKDpIzjiL9CYtLej"
-    "z9uYDg+OM+pelJaraORpp2Hy8gyUptDljvwcTk2B8+xYpl74Uzg+upZIdZb8HqKu+SV8xOC9"
-    "/ApBmagrp0HyVJIIRtQ7ZeDP61efgvCvXLyM8lDeDjP41R9hwz/wKSmNztHIUfc40vGOJREv"
-    "t+8n1jR0h/Vu+2OpaX8pFkceOfGzNKuj0Aa18q/nERsaGfVNrbG5JD8WKUCeRXonL4Sd3Bd+"
-    "y/JOfdlmb/ic5dVm0iJJ0zl62AovfMnKzv+ZC/gzGuQwxVUw8qLWBqd3yCCVFUUunEd8gz3J"
-    "mJJikDQtPgft1hUdtU2zv2fzA5+yC4Vv8Wm2kYLrhPey9Amn8S3LOWe78p6wPUU/sdLcQeG3"
-    "3POBx9KvkCd1DI5L1EkjIAXBCM104Hdpkk160UstsmJXaShJzVCpHml3aqOzHp9pf2aGklHi"
-    "H1QPwEHdJ7U3bo8Q6IB0g32S3gV7fcmo/crWB61/utoeu3y7vTC8XXz16vqcSp03eHfzQbur"
-    "9WdWoiPGHGa3bxIQKY52pKIkF7fwCbp5eW45JjjnzxNTJv6cSBQIIt7mjYMGQgiiE8WTwS/4"
-    "68Gfc/7u/v+ilPRVCUaE5Q2ez4T1CCTgKfirN0B9wQt/T5YWkQDJwyoyAkkQRlhmCYHCILlC"
-    "siCJPBCaCBsREYzO/7gj1CgCKxoZDRM2FCh0SBEsStFdYLhLdnmi3o4NbbDB6Qob1lEsc5qW"
-    "rNKSz6rCCdsoA/btNZ1SP6IfhTFRED0KFh+lJfPAMzjHDUWUg2nR2FLxE77oNxEGw9szwy12"
-    "YnidDUnQGhEM5QVT1lAyZtdqu4Z10paBmxVOCeZLFcwu5l3nLuhsvB1adFCkqRExdmfMIXGP"
-    "l4AXuEPHkNAOUBYFI2QSN+4HLrU30lSVtDbrbWC6ysa0emN0VvPyYvQVOpS4XB34hsp+21zV"
-    "bWU6zBO802g8PU9TaSTqxjsgFxxCBwwC3bBSeYQ6CsQamPIyc6e8XoooPfcIsAFfoI+Ad70m"
-    "6p9APIc7xXEaEywswIBuiIcQ74mDgiiwx1P6unucxJ3vwMadMpFm73SDnR7d4DZsY/Plwo+m"
-    "zKV1rdGKk9qiCU1JX9GRQRed4cIMo+mXAFXI07U0whnwAIyXn8zJx6FgNCY49Yy2gI5tdqnY"
-    "zoxvsksTzTYhY/kJGYDOSBNbmjeletHKFeXfUXbGmjTFSDqkDf0542PEq9SCQBPwDCOkEyWs"
-    "T+HqO/UDfmiDXocJ4QetNelAU1EbxAbL4xMLxCgHOrmoA+AeaaPAAVOFoZ4JqlLqcuN28Apj"
-    "1z2sSmSEqCB6Jz3SxQUG7khS3LC3Fv6kQ4fCFdUXz8AJfFGegSY9glIkbHj2Mw8Fa5lsTzjM"
-    "2NPRJ3AX6p7yETaUMwhhCVrVBz7hCDPU9lGb3vGHwSPNb/GJ/2g1nX9OUR1WOuVImxXBT77g"
-    "P+A20IMLoMrAaUnpev14AZYziegWnBGXd2ACwggXCLuUg3JSNs8rUaf4kSQ2cNQz6VA/no6y"
-    "cTyTLvDpu9OplwN4uESjmp0AP+CEtNFsgnfKGznXdmqrloUKbddRdY3Nlu+0hdLN/jl3UStR"
-    "Z/usQAd1F47st0IdyIzzcvAjR3tgSpVMAo2qjahc4HIZh4Jfac6U7XHbqNmybUpDfPN/lXZu"
-    "P5Zd+V1fXVXdXdWX6rvb97bdbo/twR5PlMnMKAkhIQkJQkhIgMQDEhIvSPAXIJ6Q8oAQL0g8"
-    "EAkeEAGJB5C4CClIJAImyUMmc/PY40nbY7fb7vuluruqq7qrq/l8vr+19jndtkmAVXXOXpff"
-    "ff3WWr+99j57b13i1UTn2qGbv932bZ+PbiVajTN1VU9px+bIr63to/A1YCevfT36A47sPocI"
-    "9y3xCjlfzn382CF2lmZXGYRZ4rLb1fYqL6p6pW0t8NgYdvk3+eUglPhdLs8L3HW37W/X28nF"
-    "D9ozyx9Rvs19jt46gK4k5Ygs6F7rT/mgl/1rcwIdCIic53D96OaGQzwUvZRXxZwJ1DO+Zz/q"
-    "B86NMlFvNzto96OvaA9hqYi9hak12LmLYRt8d6zsk7JXxiFjUIeK3PZN96UFb4WQcDjGcMG7"
-    "vnmExyM9n7VnfWd/u8P8ZtB+wPlt9wZvxLjMw5jPsz6uh2bGJrxdT6Z+k6pyk5Qh2g+5u96e"
-    "XMhbMGH0IUUpvMIVf9AMHYD90+etn8FSA435NMrjqP4FX1Da27Zan/U3Ypd//6/+sZS7QAUw"
-    "kAYh0T+PsYpYrxhRJqJ2B9ZZ+8SYs2f7RMguc/A8g4tzVGdCLQaWb3Tz2BEE0xDKGlPxVYN7"
-    "3gilx8Sk9K5vkQbv0MEBwyQkS3/LnefQd/AStuqKnGUNrFQTYUvIVw7i5FAO5wJkfT7hXXDK"
-    "E/pFsr6huXn3Nk8xP9teOvNlHua5zHN8uLHO9agrULRKfshO/AyG0rnRQeihcNlsTFrWS0P5"
-    "XdxMQ5cER0hlexKH9C3958VnH0DqQ1MdmExBNQFQrqABECYNb16nKn0bG1NQrtCULGXbDbCT"
-    "CaP6Sv0oA1OLRdlr9BeEQsszCndgF3OWWTc+TqgS6inZrk54T/XKUZ80S5c2edoz2lN7WJug"
-    "BVtJddhtLHadXA7ac6JVGeAdC7XwJfDqsjly4ivwdfEy771R0leukkMTISPO7t9I2jLBE20+"
-    "L6oesFm+Z9uY9JRHLMegN4bmcgEV3ojpBO9CG/9Eao/eLzZOZAY3+UtPWuKot4/S0AfUx6cd"
-    "G0DFeuis2iMYiF+B7+6mOmgLn7rvE5PHZC6uC6gLpf7ljff5Ay/2QZCyB2VXGMoVMJXvWh7w"
-    "WTzhoXznP72q5u04z/eSR4JJZHBBlV/si62Ul0P6QBlnfhpWLOgvt2tf/23uA/38Hc6drSvt"
-    "+P94k50vn8hOQAgNd0zSD5QrwKn5wrro5F5XN3D8Axx3iWx30VcoZblPHWbIbo42uNdvjs+D"
-    "U4ERRzqWDaC81OWnAgd0g5Z0trHpCvcj2mfuEOUXacBrC8XwV5eLbN1RTIoNyFXw4W4HFoZ/"
-    "BWEwJlkW15L9LI6yqo/621Y+XDYWcNClKSmUwOM//a7qhWc/dPgC6hidI5NH+Yzjpfg6nrr4"
-    "EUp8kzzNK2+VkZUxI57+oq3c0cGVGec9oICWeM5bvi7sLjebb+JTPnvPB8N66c1gULsYCGWu"
-    "KAWDp930VQOjcbLlDp1P9zbZJ/q/4z4/CEnfy7/6qGxpWwVdXpq3TfevcTOUw97OreiQEwTo"
-    "ipP7Pu0z9Yaf/RM+zDGuy3kKun3GR7s4P6l7+kdjieU/BPbwa7tc3hbPYMtW5vgEffDyl9zS"
-    "yTqPDUQfdOIzVsjDuRS40V/WCSysfzJ0fnIect71ntxZn9leesSn0E3crFc0Zc6kXVYm8bRx"
-    "yFKOPF02K9MOzKgfGzlVDonAhK5ykoYsdRRXb+vjousgzzEW0rc6qQpHyUS4oFAnTTsuCwbt"
-    "JSyV8kKJwCuoRuNPWAmqn2VvDgTI/8AkehZdgCjWBx8VCiR+aBv1hY5MBC0avbHoQ1QlJRW8"
-    "lJEZ5XRsG9KZZkoASFfnKm+MKbPoAn8309FRXSHIvzemSl98ZdCIZpWldw7tYJV9qKtdA2UH"
-    "TrpSgJ50fbecixZVZfzYk7IwEu5JmR3wW9zfJK8HLELjpnlOWCKDAzlt0gZW/a1j2ATA+2js"
-    "eOk6wLW7NCvokacqzvQI0c7fA2xIak+eQi222BWamVy9lMXZhzJ4f8BDLhvKL2dKIiinR2cC"
-    "iDgghZ34d3U9lM8MbrItewwHtT/lGUIOFtrTFiZWqwe66q/0hq/ryfPXun7jsrRPMc7ko61p"
-    "q/53YqUeXMmlX6EiXMGUD0VO6+M3tdtCSKJqKBCRgmsx/QcvgxH9TFmdhOyTPPuITswZKjw0"
-    "kT2p5PFJ8GO2yFC7BfaCMipSZAyPspE/8ohpaK/xa5BFv6TvtVjZxgk9u0UQ8QZX6dDYZfZe"
-    "D1/y7YNAedI6suv7Pnl89KcBGCy4MmYfe8IgCR+7wOW32JLLZ/ySx1dZuPM1TdLAqXNuvofG"
-    "Hl5irW0dY4vsDngjfH4lylsFpONlEdvsD4+W5X3fnRPqtKU6GTz4cEBtIp7z12yXzsBG+/ja"
-    "J29wJyBEpzv88spAxInb4GfgiWvSfiaDDAOaBDiUXTx3eHrz5s/8Cxanzw+uxNs++8/b2s0b"
-    "CXIs+4gMk7w76cgkH3d5ltAl92fpA+TDj8VtGdvTffYcMsJfRaJnjWEnFn3X5A8GhAsMZXWK"
-    "r4BQcyME8u+X448RAm/lEcdZTx5+wAhOvIYK/5L6ITLwK/P5hKt1EKAhKn+YlHzkHa4DIvjA"
-    "JEijIKyqmQyq/bguKJO/MFYeAYqm/SCzieAj+cxzBuQ070bGEsOyPJQZXOhn3nCeQo4al/aN"
-    "n5JdHQw+DZqE0RdkubCHE0l/0cwPNYgjQmsXdpTfmJt8Uvpu6tJ54kDH5NxbwdDg65xehsvJ"
-    "t7yByxpKxgBI3Kxp9oIk8QlqYguhi6c2GTqVPo577ej84gnKTp+jI4dt/DmOar1Bfhqce3YB"
-    "rw0cj9UvtNgIvP2grWBGGVirSekXAy3wrHXnSv+axRKlf4w062h0q7UAJMjZv9ql/FC55Zm+"
-    "Tltx0yecJ7wnTd/Pr5nBV5/dPKmA077I4y/5lHEWLwAxBAbWlO/oxlenMUDUSZsKJJ5iq3/h"
-    "2d+l/zgGUCATePFfdUF1ayvOYD6Skvazc0wKrk96EF+FF3vAIWYYCBrDCA1gT3ZU0KXJJ84L"
-    "nAtgLt/Qns7pcDpOEuXgUhBOniMatl05dCzrgxF85YSPQlGvMZRF+ezsJHBUNJdGHADCKHe1"
-    "djhh/ZSjxkHBMUnd+uis7ODWr7MYDCxW6WxVpj6TsRO2Zf581L7y5uGKrEuAdKMjj/cy0ebi"
-    "G9Zy0QYFxE9hN1iofI8dOiOai4NjVgcVb9IPvOyM6JzAaRaE6Rkb+ZCsLg1LB+la64DQyU3a"
-    "yXJ+9YQNc28ecBk8DFYXvV2+LkA78EAiZVDGMeEncJCeOkgPhhk0wvM3BnfwqVOeWvgVFz4o"
-    "6NHA3AlmOHdsQr07NBkAoY0NYOAE5tP9bTOwcjJzkZGO+pj0q8rBUd8Qz4Fu0QXYs09wyq72"
-    "CfD6FTRNkU0/UiFUy1igXRry91c+KuOE6QTvqyUWshjFEaJ75lRgkrpc2tmF1V/Lxj/RufzI"
-    "SYTJQvs6QfPxhCNndfJBVkWx37NAxG7Iz1+9RgIdnKihLc4mjyqQl0JqE+v8cYJ6q5Mfe0P7"
-    "SdfdJQMbJ3t9Y4v3T5bttQ2yYE9/Kr7BYxmWuQnYXxe5O3X7Nj/95rjKT7f1lTu8r9Kj7XcJ"
-    "iMxLVx/zmVjKcYd3Hm4SYC0vezmGh6Ly8293CgyMVvkhhb61wbO87qxvsmvgI1oqWNzIU+Z3"
-    "8Rycem7NXWQUR9usACcP/WeZhVF5VcwA3+MSdsmuAHbzNTrRP13l+DMgdNLXY7kXaP9r7dar"
-    "v9GWDv2Z6rvP+X64fas9d+1ftgVeIRU8+IW/fQUPP8POoks3Y0Rjm4BPHceazfRWamzGSZGK"
-    "jyd8JtuosznBgy2VAk5WfYtiJ2HJMY5u9Wewqj/76WMUunJPXeA7zS5jyVe0pSovA6HwiTBi"
-    "K27xjkc5hqgMbmhi1wQAyu846Y2RueCiU1YqeTnHhGiN4QziwpVl/YBAOD6SIhPJIkjJQS3/"
-    "6B4htIM6+3FeEAd6ZHCb5O0rk+PffEejsWwmnPp7rHWqgjLpTvcIA1H2FU6eNZdEH4NHmAtf"
-    "RizR9POcoNuGbJrA9sDR/9Kp1H2JcZwATbvyFztDo4KVSA0u8kffbjPhAHQ+dK4dchROJy81"
-    "ZRvsqHaOcW6MnbpNxAUwNMY8SQ2p+5DtKYlfcM49mcvVxWZgpJNgv1fJO+sIzZm35Yv+2sZ1"
-    "V3htscj86hzprwc9eS2SzqNlD8mX7fpRfUokMj0LrcB0f1PpqO4Xqb4n4NSlT2gZ+g8eESAQ"
-    "0LTdv65fVvgQkxGVPlwQLTLhZdGxEQ18aKhGyhlTN9A22/kykZgTaKJ1JsosbpLzo4zguyDI"
-    "PEKqxPAi2o2irY/gCuqC4MDo8CWsS4hJk4NPyvv9kMlUnQcOtOWlPIxC6plk+WQnRkd2kUA/"
-    "2z07UGfPWiMXcmbRhp5OT1P0k6Y4ms8zG+3Cb89DN/hO1NTVM8OEoQzNdEB2MFSuHMzFyg5w"
-    "gGSSgmc6BJ4ZFMi3m3ch8Yqj/Dpvl2f2XK/PmQsyGJxpOret5R1ZkCvvmlJGFxcHEnlNmGBB"
-    "A3kmlIWfOjj6b39kAbc/+OzlbK22eyuADH145No6pjJYTFBIfgQBDkBtKn5sHj2gLC94jIGR"
-    "7WT6AZaReepr4AHrk6RnkPY7/tT71Z0Rxg1VWB9b6YsZ9NjY99up5yLBQg0W+pLFPEEW9SYD"
-    "B1PsjYz3uBdwh0/8ANkNku8SJNl//lIn2+gM3ugnHrq5XyVe+tjghbqNvPC6ni3jBLCxfivP"
-    "iPEyQOyBvLnXBZv5MFb7NsENtE3qac/7GIHs0FAWTx4++0abuIvjhHKLB/y5W7iPXxXtJmDZ"
-    "5Fk0mwQVIyiV3pbvl0QXd3BGoGZAo52zQwJB5XF3zR2fsQPlpTSYwq8mL23sU5Ir2K4gzEBa"
-    "GbTxKpdI1OPWnfW2j8vX2voWwZXJvti4tJ5LKPbfOq/LWbvFS2F5LylasjN2zwfvJVxY3rcb"
-    "uAMEVPys2d0b7j3cxbPt7FMDNYMg6XlpLzpoL/hnLmD4eYkxk639g041nrEhPqZNUZun8N8i"
-    "ONvi+WxH4k/C6Ur21312mbSD48P00Znf5HmFvFfz7sdtZzfwy8+0XatvOr2n/Yu+lj/9rbaX"
-    "Zz4TXQOCFSGXX6Ihq8mDfW+DQUHmz8xL1W59dAJWfZx/0vm9WRoloTnGlSvwSOKOPEd3jrNA"
-    "P1JnwxxUbEhVxhf1yueMOvHDf6ZCzU3OE6kKjCVpqldllL9S0bPRJtSZsX5M1hqeg7+A0vOr"
-    "5nM1G2JQSz3fyUyHYjl9V2MHmXCDKnp0UI/SZcicoxMq/y7unkBVPzjPAIug2qfmC09wHV/s"
-    "+qKcrpNWys659nPGZJgOXtKAeOev71GDKkpaMPq5H82ozvHz3mY/aRFlcuIPJWBHMCgrYUIN"
-    "ZI9hZ/3oF5FIOfR8Fap+wLnmlX1KrvhBlymQYWLOTMlpdvRVHlge+8Kk83YeUachr4+QGCeU"
-    "rivRVQWxn/dQaXOUDb4kdjgBVesEXsC45rOSZg4aj+LxSpHPw7IvIpfHypaoJW7aUm9ZPiYP"
-    "vb30nXqmZMMmj6SgDeIz3BChf+o+sG4bmpnH5s5kmcQ40YmCdriMF9ipMe8GEGs7EyTIlO1U"
-    "J2wdyjQ6JhEr7QlsgE3noUwMF8j+JR8nHrtHB9GaA47jCHC8ZCF/ec4v4MILY/LShwPAxTyB"
-    "HHw9a9exhXNQZNHDmto1gSOy17aoE3T9+s2F24ldUWqLWGUVqzrcRTeLHjrXhA4t6LiALfH0"
-    "cRcebSYPlEJnZSKyVk7yBnSe5WXQcFzgyYkO3goIa+E1WEiHI4SP4ncg65w+WX+bh7ppCxf4"
-    "vDyWBcukbtbnnWvoqn7KqYkNIDxqa2GUx0DJ/lrGKe9hM3dhdHovsbmAu5i7iCuXT/F1UvAB"
-    "c+q/5OUdfEaYeyzy0vFBky7C2t/LNxow9qatbpiuSz7VR8VfmcY1dhd9+UvLPrBfHZjSKRh8"
-    "jUUXJdKnQ4973R5jF0rdvM9GeQ2U3KnZYDdQmvt47K/8lU8YJywDKm21yc6JR58145PPxcti"
-    "TD8mMMOCWz0IMzDR5+Nr2HZMqpo4fY0N3M6OrthLPINLeamffAyo9DP9poIBJ+faWVHfnYe+"
-    "WxE/cQMcM+zb731OBmw8OZ8ztn370Y8tfXc2peNnPz/i2N5GHwapeiSIwGbqujdjuMaC4yHB"
-    "E34Wn4kv2BcVIKiDu1aAJQhTdneVtIe664v6uZfgxMmzreg7aUpbuxsUGQC66HiJcJGJU7oF"
-    "45hVtwo2DPCGv2oDf21one3OGfJ1DCrPoCGdvXt5ErS6YE9C++we6jc7Bt2OsxqyvPey7oty"
-    "LsjzsMDR/g7R+Ci4Ozz4a/v4r8CHdy7akSTb/6T0cOOP24lz/yRgwqNubFCLMnnrqFQudcki"
-    "2Sk7B9jH6qxs/gnvVPF40haVAtGzXcIhKE3J+jXAO1Yaet2sufohIAMxR2t6hn7LQ0YtRtZA"
-    "F/2AzOSxf0TrmB2wlx+vtFXaHqCb5DEy8kWW5l7PYeTnqsqWA0TrCVbGC0nl5U/UCpwqAPI+"
-    "tfDU0MLgKNrfOcKPuLanv/D1gqkTUU8m7E/HjX8JluUSPPuXWuYPEyTT3+nf8AGu84mwMX/V"
-    "gR6elOoofM+HP8a1bN6UsaPfKyc8ow/t6jrDC6AVqQ2d3p6aTsv8fKp1tQye8cz4L/rzUOaB"
-    "QXBhHIfxeeX2Y6tH6uvSHuOUOUO42vlHZrVgHGpD65xLckVjyBU6rCPMbc4nexjvnjz5rtol"
-    "Lg16tcBLtz7o1E0BH97M7FpCdhkUJGOn1Kk2xU6O7whaMKMOcUhgpRkpq4K60iuo81+dhuYw"
-    "uJrGizDIsaRwLoISHZcFdKKxCLsw3KczDUJcVFRyLHqeAUp4BFlOlBpSh9MwTiJOhg4GJzPp"
-    "ViRak7FRpzs6g78wwrrYOomrmwu3jp37LJyodGI+2kEZNYDBRE3svPsJfexsO1a4ezwB3kXV"
-    "soGYtA0oNJeLpzDykpZ67AFm0LbzdRj5Z+GBjouZL4VUuC1om7SRsstLG5iEEdYXR8ZB0NWy"
-    "/NRFmXwYonXyLxsQ9BzgF0/QuX2Tny7zbshdyKic3hfjmb1Ooa5OBnUG7s5Z/ZzYheMeOD45"
-    "ex+BkbxcLE0ulC688koQhJbauhaxcVmIRR9bOjsYXGlL+1v71mtTKsiRn0FWLs3h/Ckjk4FJ"
-    "HAIhlVEfSPDGIvmAIMygu97pxGU0bL37QQXvypSgA7pjgsqDZtMTBtC+zZ7Aw4UR/R002fXg"
-    "TecJcOFlP2lDAw/7Qh81GPAlxPad/Kzfx6Uny5JWPu0irnX6hjAGBvqV9fFt8i6S+ozyWa8M"
-    "9WLr8m3hxDEwt106JuuywGJTO08+VZZ3XWItGL3OMTkb1OaTaNKvnKAjHzS1hXhRRBzahVng"
-    "fWHKH5uijzTsY5Pg2ku4whW7bKofZrcI3JX9qx3WG6bZOTtYtg9NiHgysYrPm2pXiGehMb7U"
-    "7T7PnbKfl9mFjWzo7DiBDLK4GNQ84I3xXo7bCy392h2lzBW871A7OVfYP5FQXc35S1pmvprq"
-    "nE6zSoVm6ePcQL8nSrEvmIRjY/rEP+0EIe2v/yxAT9vcPsATrf8vn2n0cHutPfn232Ij+5aK"
-    "IZ1Sj6+hueXqT3nPAimtzqo6kjIxOdclslHZjxCd/AArjLz2KKM8Bp+Gx+osKpx8kuU77Itn"
-    "bBILlS90debgh8XRRVp805UcHAV1TAb/DP0CSpA0tat/h1cUbTExgPdDbjtwzFedbT2lv8OR"
-    "ik54tHGcg6zaENdmFunfHEYQYrCl6sx9AOTjmMJf6/40fEI5/TB3xtYSQlnfZqDM5T8E+2Sc"
-    "X+uSIyeZzDd6aU6GYRIa4OqXwjnX+qfvuXq72yMsNUjY9ZJV+Hd9yYsblVJvzj7jm8/gETnV"
-    "0wSIc4R4GefAgxoanUvwRr6Qimbli25IDUQLIsiepE5mYcG4Vh/LtWZoN3knge+cIKxvllhg"
-    "bHvVxtsovBXDNXmbnWjfgbzDo5acNzKOS7n0gXOZlzAufnwRH+H9lPvB4STsLjvTXFfgXYAr"
-    "7fiJE7M5TWaPKjfJHZmiR1ekV0SfzE32Rs2Nw7bpLmpD1j4Izme/wrLLnV4FUH9fuvjpJ1lI"
-    "BXCSTJTIQukiLJO93GdhR7loO8G62PuaDOHzvkIyPrpehzG4cpHTwC66Cu6i6zAclySsq8WM"
-    "s1DfBUTZKNQJ1UXUZ48AQZ2XZArPemHElbYy6EQGfNK/T752I1w84MZZ/D0ecZ8FiU5D0gQt"
-    "jml5b7Pzo276AUOCLxc9cHGWHZw+g8GbBOGnSeXpPVWaXzt487kB1Ao3wCqTH2n48kjpG1R4"
-    "puQZ88GD3pNC0Akv9dAuD3gN0L0tZGYxrAXTANaFCd443o2N9XaIl1sfWF1lwWQhNoCQO73t"
-    "bk8CSIMe8ga+sTd9J4w7S8qgbQ0GRhBqp2sjbao8FDOZjPuohDMtAiNeFmzo+DRjZTDYlK4f"
-    "J6EKsmshVwcDFQeOfmFKP8mfugRP6GCdC3xoBMedBoJX9MiiR91IymmdOHyFvzLVAEZ4Jin9"
-    "0qBIeTM4KXscQYS+bECPuJFL/BRgQlW+xa9WvuFpGjrER0DW7+17edvX1kshu5xkU6ZeeTyr"
-    "0t/LJ6AV+JqEyMZO2ks5DCqyq6ljImcmRCdfJ3L7CXoJSiIV7fonvl2LU+8jdUpyQnXiV9aR"
-    "kBEcNUwlAkS36JRaGkof7eB9TO7+5ESIfspYQp5MOsizy2AUjNidQNJfPKpL4GO78gvtr96o"
-    "BN96EO0C49R+N3kvztJS7xfhEMqA3V+xSZs30PfgxwVLmYEFZhd5x7ILWfqVI25Fso+0n2bU"
-    "F8oCywRv3iTvvWLSTQDH+IofytcxTp8mwJLMnzYx1o+9+3fb8ub70HDUaSPtyCibGT+2Kl+B"
-    "cBqAg2/O2jugGsVXuq2Uxz4ZKdQnorO24AA06Fe5+nLgTscZuchqfYkJdTLaf8ZzTgGhMXwX"
-    "PUi2FvgcUdE72pAnRCEcXP0ZcEpBNihRzQSUwYuWtGdp6rSCEG7Bk6uw4zPYB18BaJKZ/2Fq"
-    "jfz1Ue2WIv6BoWFec0bxjVCGYtJCVnHM6nNh4xd9mzkOp869k6wb+lH60zmO505lrgLUNESw"
-    "LoEUR6nqJ/6nHaNk10OE1MmVbG+PDMpS1WnzSzrOAdbLH3BqeiKjfzn4bBu2CIwIAaz60RaK"
-    "1IevtIDzBF7YgPNdc04xkr//Ba9OJiGha2GOr1dQFnkZ8ubG/Xbh/Eft/LmL3Ht5K/Z//oWn"
-    "2/MvnuQFyjxg1be7KDP9E1ml2OXw/vV3vvuT9p0/+h4vsT/Ia3oYs7dutCtXP2nf/MYv8OiM"
-    "n2P+YCPIe4TF09bgun6MOZ3qpEG7FJjxGv0SXbQTqcZUsnNf8iibz1XCT/iyAVaoJg5LR48f"
-    "jlLW6UCeiTvZ1hlyTUAJAvDLBAoY3sVVx3GHw2S5FHKCrAVr7IbVomyAUTshild1XHLgLNcz"
-    "yQds6xuc5eyTGdMbUrOlCG2DCwfDWJhVWnmk76SZnSdpE2CYXAxVVJjhFGVkg7Na2AwEDMwM"
-    "kuyMWpCVu/C0lp0z9TQtdrwLiXqPgTQcWN1jYeBySY5ekr9pLCruVgx5IN4nWTsqXRpY6bjQ"
-    "3GT3av+ho+3Ek0+ju4skl6KUndS7LliKWEJWg2IwQwAzoBSr3CGckD8ORl1gwdeG0siGQ/CA"
-    "AW7XbifBrgP94RRFPBg7THoDv7TU5XdQ6T/0pzVjoOhTZQpqYbqg74AjDf6NSxnMDK6+KCqP"
-    "bZUI0JCFqKE0YvEX3vcLWpEtfTI7LKIPOfu1XwxKQhcfcNFVT882EQiS1a/pL2V08Ugdef6Q"
-    "zowtRYNc7kl04GgLjrVDS7HLq62CG3nYBaKvkijLh0N4OC5SpsJxFB+WHXK5MCtozp6BLhvU"
-    "Hgel2EM90gkRsHhadne1bIlvAvQQW9Vls7KPAgxZDWTdqVIiHDD9rKzDHl7+118zuUJXmyka"
-    "XDiJLL+33UXXcZk5AjoGZRkvChkcxhHC+UsmTa9H+Ms522qBAw6/yP2I2HSB++y0lHTdFVQe"
-    "x7e2FU2JHXvKbNlZnGUr/NXVJGtvUtcWcAmNvZysXfWELw5I34Gv3ZXb+z7NG+ytH/yp0PjT"
-    "fD3k5c+Hzv7Ddmjtv8uweiP+VdjV4zNKNsWvqIIlST0dk1akmDLV/AucFlsrqU+p2CsAJKmn"
-    "/erHGlQKfkkkhHyKhaYrhkJWfXbnyceesRsE2F0IlSGC4ujnvgTSJLoHjn2arzoq0tTxpFIj"
-    "1gpa1FfyjiPK6lOLYAD5IoH0kIcYq3/uxQLVADg2Q9fQVxbai2rRrXqpSpcW2g1onAu0kbI6"
-    "IyYDpvZyZ1Qfd7yYwqNUL3jyUVtcMsLq/0u5/5FnNSUwx2eB8wTUwD184AtL8kVX2ulrBY5s"
-    "VRYviz9yjfUkFgRP29gnfiRT6xCZ0JRPzxejrCPZCMCXA5J28UBBntCVf/xKgvkvvbqNaIwc"
-    "JSMwJG1XsDXmdhFAWuecqczK4Q8VxkmFWKM+OheRXBG6z0nPj949286+/YftzGvH2quvn2o3"
-    "1263H77zNvW/377xc19rz5z6aa7SrBffKAJ7bOavONe4J/TChfX2y7/6TDv9+hvcm7y/PeSW"
-    "CW2zsu8AfPkVND/OGffqZtVCRvvFVBolmy+9ybEWHW2Hn7PGduYi+xsMeMtfo2o6SsGK/aUS"
-    "+9BACn1xOiNhR1o6fOTEpFQIS9vRE6KFE2NSNhAxPwz5cKUTUohw4hvG4zKgVf48uxQoPJm7"
-    "gAivjErvpL+YQVwdRwWXD7jEECDhMDR1zMlU8YfT27GevC7yriKFzc4FdN16HJ0udO1gRDqZ"
-    "5c/dNl8JIn+Npz4jWeeAy6JHZX7tgvFL71kANp2lg2BbJXlnOUigZ92wVWxa/d1hmRR7bupo"
-    "9Lq/xT1DyOM9T9k5wYndXfPeuPmOC6oTlgKTtIm5PDW8qlK2XTBlLDm1SSAzcWTQOKqlAUwC"
-    "FPuH/MIi9cBmMo7NnQCqDiHlRjO0Bj9hlVdi5D0OyyQ/7CSObc40ocF3lwGh0ke2F748tZS2"
-    "F54yfuhHGTq3QEc2cyCmPny63jWrBT8yaxP+Rhp5RRRtaunl0rP6Wrn82E/DHrEjiFMQHcIg"
-    "S0gnk3CI21B08vgI9Aht6lz4hRHlEZ8MSucdnULC2vRtjtSXXl1fKsOarzFRaJOyUcFMPzcH"
-    "1nFiMuiIr1jsvFy4siAMf1P5oU+ytiu3+tNHysJfBBDWhA1qobJQushr8LDWgSdZEXPEFxh6"
-    "kSdkBaHNqUL62nohzi2Z0in3hQIsvi+V1nfdUfZBxRWMErgyR2Dh0hnA+/u/ItP/c+Jhv3sv"
-    "/FZ74qN/1BYf3AAXGrEDaKpagj+iTumvbaI1o7NBAAAqwklEQVSRX6mKcNpIMR5Pw15z9Z8H"
-    "NvwsfgesgUDSwO/yWGfLxMsCH5deQeMzyCJ+lbuMtJWwwthPFIGRbOmD30rrsRR5AkcjY86y"
-    "/qN3RCSr+QuchMgnJSsTSqm3NoU0F3LP2vKIfsK5vgwdtLk6qWVEzzF+rWy91rIwrj8G9MFX"
-    "DlJ8C//MeND5gsOPK7xiws7zyj7rZuNUeHmawgfdpVdyRrnk3cAYfFUh0szrQn4q0g4VCaau"
-    "aA2NwqpLJZWeNKF0p4rRYKX//CFX5heBkLn6yDV5RqfwKUcPZSg6XhUwX/atoE61nR+cW2Lz"
-    "2L0jcEJ989LV9t7b32tvvPpMe+tnv85tLwfaKRbvU6+83v7nf/5+e+c7f9xOPnWKTZJDOfmU"
-    "dnSFrr8SXNyDzR+utaeffak99cyX+IUyu9JcLWq8Muwuz4y8x0mtgZ/Wsr/MjVjls3bo9hBo"
-    "ylrAJgCXjSnZ56VY6E220V6pCQowg8rnH5cSfWsxBPQm6bCKbWSmgiDKKMxlqvAaoBg4eWsE"
-    "62sAFgzunT4RX1iFcqGsiVrnNxChMe06HXhCRSmDj8ysoZE62gIDMdeC8IxoFEi1CEMBehW6"
-    "lPyTU6qL+hUAtGqh9iW2OkWv7u2TOTtBkCf8uk9nkheaFbCUngEEOJd+kES68ooNBhPqrasz"
-    "OuWN0GD1+7hYdD0bF8ckr3RqgRWLarJx5FKv5AGT1+DHMXXAFnS3s7XCdBrCRK45mpF9xiGi"
-    "Bi549hlJoimnOVXCxNZztNJgfc8MyQNrHTSUUFfIgtkB4yu0VXBQyPMTWlA7fhcmtBTJxHwS"
-    "Has8uNsyL4HlL0jqAHIwyYs1BRxdm9r1oT4DRoD890wEIB9MvulP4GoHh7EAzUFbPvaHdjfJ"
-    "1bmjni2mT/R65cH3hNXOsXVQZ7iC+mgN2TphjJ/W1zitEwz1CHNWyzE2wlc5eiqW0qUiRM2Y"
-    "raN11WdUgmet2ONINmPMo6n8ovg69rzyl7EJnbqsK3Z99H3jau3ASAtRJ9Macy4K3QdDGDpE"
-    "X4qeiV75yGsngyp96h5nui58CozU/HLwYNuz/gMeycD7UZeOSaXSg9tt19a5tnT3o7bn7oft"
-    "6NV/1/be/TFyQhC6Hgww1DFf4aWUvewxSSBxBmzZMZ6uoCEAYCc2ih05h9CcqwiM/IpbWtTF"
-    "VGTIV5FD+Za7HCarA2uGOmslpU8EOfpRORIE9ZtKIvXkLs68/FR3FgUgqITpsmw7d3tHbKr0"
-    "/ceTa5rSzVLZKuXQs7m3d8FTos7jWFPGeCg/620A6K/ZuUJX/8xPPozw8SXg1COeRXvYhK27"
-    "qgZcta4pk76QeAO6NXaErpRduEhlGW7K2D/lmx2QQ+HCXbm6nAO25Kv6QaeOklVrSyMVj9R0"
-    "XtUpA452+xkMx1utYZKRd81JSJNy8aVNeP6dr2JX1yWdTCo2xUa10zgvs/VC2f0+tf30S0fb"
-    "i6efY5dpifuSuSLDL29X9h1uZ770Svvet9/nlp6b3NZyGLmQEZxhyQfb3Nqye1+ukl26eJ0r"
-    "BB+2T3iA8Mryrvbs80+3I8eO1AlT5rG+s+6anDV0+O2gBmFpR/5ZnRwdCdUPquv4VnLzyu93"
-    "pWzYWDsvJE36TI2mAVlHbneAHMAZHB0vxpEAabQlInQECNsn9uGQMQn1dQYAp+TLwOkUiNek"
-    "hiLIbZ107dRMWKLYwQZqSTqsgFVfdMmDYyXVdYzQ1qchRyeDyVDURz/lBimPixCnCNBmRl5U"
-    "8SlbFE4hpDlylnx1+SL2yQ6YU75yRing6leDSpezc44GsH5KfyrCR37lyMW35FANFw5vLD64"
-    "uhJ5pFWdSWOpmSq/xHo8Sa8rM8MPk6of1rPPAppq5Kc8yA+fGHaV3rBp8C1rW7AeT4XT9RFi"
-    "Dqh3EyhUSkM/6ilgHSA+0etjJ+ClOwKsBAgGKU6DfSBHviIySNI2ZctYlJW66tW/5FScZCfw"
-    "uQpARgAktD5rcjzoo9FXcGkrS3xKykCLwEcY/zpQKun9Po4o2tqF9djRbCBJ2EnNLG32pVnk"
-    "GLJYNz4ukoNW4ELP8ee4qLGhnPqsJymdHOWiO3BmNIqeaodn4NSlFphk4FE1KY0qjmVjWwHh"
-    "M2zn8tXrmMDdhdIeKp7dpRpOE526baHLZ5uAXd6MPyA909cGLoDuBDre9u3jxyiQ3csTzPdw"
-    "b9x9FoedHiwEHb5LO7fb6+f+dsg9ZPLfXlhlvPKrxO2roedlxcm26fsuh+KS5dDlUV1KfU6J"
-    "8H5R5UzYsYIU3mWQCUw4aeVrAFsRHmmZwZpzzhFHOklaxbyVVsDTI8yqmO/Ax8e68DlrFzw8"
-    "ZVbM7R8rpUEYKgSp91PnFH2rob71U/+6TKGEzdnnmNEPZAUm86hVXbzlU+U6zqxXOWsHD2UI"
-    "FF81P5Sv6+/6gn2nSoEXlo9t+ofHLmr6sqQH1qsgtDnHaSaDC2+Z8Mc2+fGUO69pq/mr5iNp"
-    "l39LcyZfzRmWA2cjRMNLwedgA5M5pMvZ6aUf6AhRuyGDmKJV0rbRCg89a5NJqyrZoD/8ueaq"
-    "Ua9thexEOBY8dkIO3zOak0cNgu2oDbTUU+q2HDhSkd5D7nc+9sRxnmv3tbbIG0k2eTfo3t0H"
-    "aV0mv90ufHKBjZ01gteVsrX0e9JeS9znvMG7Km9c3Wpnf/Qxlwc3eNH1On3xoP3eH/xO+9KZ"
-    "V9vPfONrbf/Bg1zxqSsbUvBTtzMo3WPpMxW2I2tnnUP6qGxTBLpG+ILlz6H6GJMqciG5nw2G"
-    "oMbSKZm2JEQasriYucVu0q0SMEQNcDrQOCqo91FFll4pTQez/MwbRXrvhZ2QeyIknGvuDmYd"
-    "HxUAFzZN8g5eyRUVJRf60iwDea/SLiZRd7QSpasBgkhndH45CORyOU8ehe8AqYVI+epMOOSh"
-    "MSJ+2+U9ImRpVrwJH9IIrEr4KmsP8Wc/Hx/yaLuhj/n62b3y7Duwn3Ldn6ajxXbhMPsS7vFk"
-    "0GJtnV1qQ+2MzJETW2qHXo7gIVCyC4Pi+egJZHqRug4y8QuTqVTtmQQEdGKCF9nqH+HUr/wn"
-    "dK3pAVZg5G3dxD8lSHRaHEuPghFXvHwA9Vh9NBO0RLSMHvz5H17S7GW5mH08BbdQy16RqxZu"
-    "s0MWfbdEVh51VN6oHsIuUIN86UJJfCb/BX5QUD46g5GuvpUdGgjZV8EbVLST9QpsfiTr5sqV"
-    "RRYymRjBV66ciTrOxPOLyuFH4mfB1T/SJAKZYhb6wlQ/yk848KEnyJBJ2b23yV/98RWekU3c"
-    "MUE5Sctv8Or8nHccB+o8Lu8XXCQuWWGby4SR14lefhnmGX9FwweR+p5NGviUXzkeSzdMXAIP"
-    "/bQfD2nY8+BqToiCExAAwFcGaZS4HDNPaj7tV2byG43AejQN3MDSpH38gQDAjyZl8TNSzwv6"
-    "eNKM6lbzsPPLPOIMWt6m6D+rTtk2zSHmaB/01EkBxXbunyVq/H9cqMhTug9J9DIp2DdVV7aS"
-    "1mfww0AoP3LV3sU/cyT80mKT7Q6sTjXgNEozJwEe+Ti2BMl8J1baq00/yK4zZPTBPNant2ds"
-    "2tGhU3jCOrfnBndw4kcYSVzAEKF2uOShLUfQ5Y5sbCqQScOGrnZR3pJHOr0pchaw4NGaOo+W"
-    "i458RprPPZqflSJkR4gdugzS106ROYaMeJEhPGSLKdTfk5kEm6rgZXaOjj11V48xn0Mwta4B"
-    "bDmwgclu+ZLvb+SXltw7tfPgDuvbgfbh2U/ad3/w3fZrf+mrvBLuSP0gq9OLKNBfZC7Yu3ex"
-    "HT283E6//Gx77StfbbvZ6eJ3yu3jD8+1//pffhf66+0X/vwvssu1SpDVf/TlPZ7c66pR510l"
-    "QlfIP8wXHdKD2CR9otn0vdheMPsopAq9qvyuFHjbtcUMxMYlfTCTXCi4KBaTDNjBgDr0xDBa"
-    "24TzmnfkPDahaPBpYkx7CeYykQmXYyY9MP0VVgbREB5aylLt3VFps6NrApkX37xn4MpkvgZ3"
-    "zQVOuA4QqntySlTFVA41epv03X2yPQGKhgLfcpzMI7Ce8eeSam/Lr8ik6CDjqCjVQcge2uqn"
-    "0btOVEbcqoFX0Z8WqmyPOtj9KWrp5g26kUn6cdyBo8wOypkytXiGsUCRXdoGm27rKlv6O3Xu"
-    "YLilyk2/VGZHBrnUd9wbREau+fOBnxWkomufFKIANKIjeNKvG6nrBmiV9WboMfC4KNaFq8Ow"
-    "bZXUwwnffu920smhqS7yiK60pW8Y4PLKQ2qZfJzEfF0C1otd5hllUkBn33MnPSfKBPX6Z9h6"
-    "dKKhIH8re5ODs7aF5dv9UAHlh938leReHrfhYI59cr9KlxUh4oeA888EsJTHZviLWs+urEPD"
-    "6OPN3fZBPAeeA089Ktiisv4VNflMenaoZRu7jTSZMB5zQy9+FZHVDTvElmAschO4T87Xp/Mz"
-    "c/hrI9yq+pFFSDkfaARwH+zUM8Ya2/be66Q9/ESOBFIERtrFx2XQ7/lBAPbwhwLaFNZxKUAs"
-    "oZiZ8VEDFiknRiYbbeuo2q2P0y91477+YQDqLyO9GR90XDT64ANuLPjrY3XezS92r9+4Q5vP"
-    "EOMXvjy2ZOcBz9zSUkFEIvH1fWyVvFKqT8YVulBffqV9lVijmnfust2CmvGHgcsW2ho4W3on"
-    "BMXO6CkzlYOfpM75p12sjlp1aTUYq5EjnwABpx1CsVhhC/GtmfEJrOTR17/YSRKRtRZ+vB7b"
-    "On7scyn0nR/q1CfkpisLtneGaYBdT9aWXkLQ36Bm54qS/TfkUjpLkYGMNjbxlAYodjnFQcaY"
-    "jx0wCIFgm74QLqEvnvRM+pZ+GJ+UgzpyTMDljhRtdf8TNOTj3IZ+6l16Kki8I/UGNLqJviCu"
-    "8mhj0+ZdXuDML1TzEGSmtCUeN7LEDlfpqSzlQyWPGPIDV50oOf+EJqVcEncMA6MslUp/56Pc"
-    "ahI5wQ//OvlQLlDCs+Zl8DWCqkst4CWH5fJzG+1rfafmL8AqWATBMZe1rAtS63iNN9CkAl2t"
-    "yjEVCuA/f8gqvOuodotstPm6LO+V3sXDshfcSV6GN7+WeveHH7U/+G/vtS9/eaU99cKLvPAe"
-    "GH7sVjtZ+A9zuTvKW8wzh4+vtr/6N3+JebZ+KFY/5Flop176cvsLv77c/vW//WftjZ96rT35"
-    "9CFkqL5SFk/83NSIjDqa/3zSz+gxdLFs/bCfECpQfoG+NDrnpDa2q/ZUTF/6R/mfdox/wyOX"
-    "CNMbYTwzWJkNNhEEKhwfT2FKdcHEU7sGCjd5y+egFq1SttOWvzyGHMmnELYK/Giqzq466SlI"
-    "sbf0eIqxHq+E5DzVYgHdz4GbU6e3doccdvHIv8btvVj6CA1h+QwZQh/40qlzcwKh83y2VW1t"
-    "dlrBBF+HUUA/4vLJIOvSDPsUj6IZ3UqpQA2YBGo6QddeOgUWjNAVNotczsBgOwc/YDOhUJjo"
-    "wsUACehspydoy6Arp++iTofiNoqWoOWii278J0VvcvpTdge7XDYjWvpKu23xWA6379W/ApJB"
-    "fXY0WL3HQ0W3gVnmqejeByK8f9piwW3wUq6Yj29JdHnK/t0e6OZjTBJcuYhE9CE4MMoKzPjF"
-    "KywyyY97ryQvX78jB7JYMkkl6/dg3GlP8gGYgQzf0KCs6H4GLelaUfXmLc4dmXRyVm5kQsqz"
-    "qOhnn6qeh9Byc7iLxSInQp4Z+jy02JegzHwCHX/96wKG2/tmh0Ue2pmTAvQW1vtWFnjrgQGZ"
-    "8Na50NXJVtimbK70mNmiVIc2iyxSZxKvHLpDH2LRqaiUzXyS/nh8hkGW6iYY6fZTHmW4T9+H"
-    "KHlt7Ze20c8rOb7SwhnyqHMBq3zHCl7yTuCkqX/IVyA3qys+QEdu5Q8Kh56pYr4fqVGJAYtM"
-    "fa2I+HMon5NVJhDrP7ZAGsoVqOYXsvjPsM8iQYK/vNUPfFyO84I+llC3M40YfCnS46lzq+q5"
-    "wlw2bVHf3DyNAIV6wfjtEjIYpjaig0dl7K0trdNnOGIbg6D8UU73cTSjzec/nVwO4prsb+eS"
-    "4ll1+Za2MHwMiNwUcI7WPj7mxtdBOYQ2twgK6NbwRZ/ceB29kK/rJ45y+pdEfeUtC1QpPjIK"
-    "HPUrIYIfXSgo1GSHTk8cyfRP/QpaJsWlxn8FWWN+cW4NP1SP/bSBCZ7hZzbzGzS6IeKSE8uS"
-    "23GfIBSYBHTOTdDe3t5ih2o5Jz8GjBfev9y+/bvfbWfeuNK+/s2/zOutTvLgYn5ByLb0TvPV"
-    "XOxCJTDCzgjpfLG8b39E8tFQ9zY5UV7kR2BLG23lyEp75omvtpuXb/EIB2cHZInuJZP+O9ka"
-    "ChmTw/bdfAWpukEkUw2pN0997N9tGLsPpMkGGikiFnVh+fArUx3GSWNgSE+C9olAdYzghT/7"
-    "niOehbBvUAw8MDssxGbkZ/gj90hb522bcnCQ3pjsBkodB/1+xNmG7I/CFY3H6z6vnM4YZAEo"
-    "w86O4mgTk843knAR1iMpNqhMVfeJ23oJpJ1BOqWqxhndCTFAmT35u3TvTMXtdAdueFsALxNE"
-    "siWPFgxPi6NdGk4ODHTPkqr/u8y0ZeHuergLMWiUjhDq0eaQI/S7MA4GAw7pV3AEvDMOh8kd"
-    "hLVcX2am5DSS1/3gk2Ur5dfOPlPNB8uOeneiaqLbRVDmo0Jk4EQQORUOHubHxOngrEeKOOi1"
-    "PQDAFR+ODCZ1/cJkk6pwrIkHW9GHvp7HJ97bvM1N1EWv95OVwmMXGoKnfbOL5uIVv1Cnojn4"
-    "i5Zkn9nYk/lp4qZuvq1Aur2Uk2GtvdQ/dsU2ud8JmlpL2/gLO3cZl3iH3x5e+rKNLhu8Fse6"
-    "bLdjey+f+JDaerAtj3pgJ+4u7wc0YPJl0uke+PGUt/BUWm2kUmveP3HtZjtx8jjPo1pOUCtP"
-    "YWqntPpTe1bQhB3shxgEGOiorxsZ2bzgKL/ctE5Fbnh3+iJVX7tT6U4gT8BnUjdQ8Pl+ObMm"
-    "0AO729y+MEjlSK20WR7iU44Jd6jGOPDMtPpF3wJYa0aBkMtlTxcW22y2SYBabAwGa5wHJYjK"
-    "SmkCFqEnqoPvd/6lG6bp6yyA1Cfmm8dPvss1aOVIQ/1TEqgK7lRayiubkKmew6cPlh9qeF9H"
-    "FOtEN/15nOSBWEKS+ZPTZ0Bl/HjlXDkjp5fj38KbqEu1R+2YQslczWBSr7cPOxVcXUFwHOhn"
-    "NXalUXQKx/nEn6l3uvR55OhMrK6TEQJP2nx7hY+1yLgGxp3s0KWteFf/p+v8Cl8oOhdKM/9K"
-    "Sp9ZZzVfM73MU+MXSR+InMBmPoRkoRSOvAPHV8cI7ZwwUFFBNBnxoFkm7ZDdv6yTj34/+FKh"
-    "hKHFYBNCNl2PZKevzL2ebAVAuYT1Aaw87NugicuE7//oo/af/s3vt1/4ldX21s//KjtcBwlM"
-    "uU+SMXp3m93rh7wCi7l89wLzKcPG5/oZzP7h730bug/aN37+G7TtbVs7G4xZXlF213Hri+Zv"
-    "Z+4veUvK0kFp+AwdcyxblqVszwwAvnqPsW4rejuJmqozzAwTpDrmkASqOn/R+4ERXD9YkugY"
-    "wMHowOZTL2TZNM3TF3XjstpYpAcd69Vjdt04Yk2oX5iRjx9ZcjRrJnTjmI/SGfw6ZCGJ8/+T"
-    "4F2GDfdQks84S4qhFY6UYEY5ezmX4hSeVDhQUn5hQzdN+QoOlRk0HEOxlzOQOdP2qG7iKtX8"
-    "IJrsEmpdBuXgU/C9QUzp936W5pDX+tzoTJtIw8F0FOESJLHY0FCLn1KqBwNHG9leovHd9XQw"
-    "CORfXojNxJNLeThuKVmHCW9URlxrDYg8o3J7KlCTvO4+xE7wcvFnu6R4AevkOXZIJFVWl0QN"
-    "EuUp2sL6Ohfe5adIMVmoFp8iKehnU4kTsbRVuHBc4exq8+5GW/f9fPv3JzgZk6229uNz19Zu"
-    "3EyQsYddL5Ms0v+ZHDtDBbKezyRCt0NnHxwBxJ1P8sllHqonXACLpDV8LPBxo9BkP2s7X42k"
-    "fGtXrra1m/yCjnZ18NLcKg+9ffLpp3LfhGfE6xt32jtvv9tWePjuy6++lLP40cf6zgggJXL9"
-    "+lr78CfnedryEbiVHXzgrhPXuAzuAmOgZICb/qJfElAxNatnzp6jkb5deihbYpT4Ljyljl62"
-    "ZoGj3SBsD8EgNejp89iUbeAXLxprYsQgkR25TNpEHww0jCpwx7fRSROOuU3a/uIXKtDmEB2k"
-    "MEuPdpOwUat/aZWRykvTbv+ICLP4iNnUUR/+A6cfaXOIKdeM3oCZ1UhCAta46BpY3dnY4t2S"
-    "m+DutP0ru7nf5SA2ZEcThfawI1g/DADDgCL2V9sZzZD8f/lSmC8ioz40+8m3ZX1EhORr19U6"
-    "+ypJEWOvjoL99K2MxX40L3wF3NI0sLJOv8GnaEv/cnS3CoDQCB3gFn3mEjt8zjXuTCtOAhJt"
-    "rxAgp5/I6mr2qDz0yQ4hVOo8ymvcF1jtwFEn31EW33wdC0m8guE4JbnNUtmCOnQxcIgM5GUw"
-    "naiC4Vym6wrn7r9rlnaSfg0XmdXH79jzEU7SHGOrzyng+gv9OrcwaNvVrl280b79B++0X/9r"
-    "T7a3vvZNfjjwBK8y4/Vve9m14napPBgYhvc2edg2c9GeJd5IcmR/dq88WfqNf/of299fXmyv"
-    "vPo6tzfsa1u3Ftr7PzzbtrY/as+fJlhDj8wBCtnTsFmkR6/YxDb92PsLYg7tpr419q2bLIke"
-    "0hh0YoZBfP44cEJP2v4bYA2mg5Ad0OtsS36OavD9IoHSj2bKSYPj8IuXITSpOrPyJaiK6tB0"
-    "QqdReBQmeYIazgERgaQDmCu0jpwaa/nkMOqrWHLO6qTzhWlGPCCRy4EddAzd26139yKS0Khe"
-    "OQMSS1m7vBM5Z7+eStcqgEnGb7uDDmHQSkv02rnpAxj8WSeXo3QgDp1f8DJUimbkUhQDEu7x"
-    "wQGLtlKRKJt8LpjBoa80sd2nwLv1vckT5cX1CfB1Fl/TqjCRuISM7FJM0IGc2uX6VX5Ky/v/"
-    "Dq4e4gFu9T7E0QMeqxfFGrWlww6wPpSVYdrWeYnwGi/srXcFesMiuxLc/H/02DEu8XHTpNfY"
-    "627ndu6DjxiIK+2Jp56IXsrnv/LnrAT9nFQvfPJpXtT87Knn29IKT7Z3QQ1rZfEjEof5NCdi"
-    "ievEU5dR7ntvAZPR+Y/Ot1s8PO/1N1+PDcMfGi7a9uk69wO9+8MftTOvnG4n2O1yFycTFbb0"
-    "qByRBRzZpU8jQ5QIzRT7l+3RrQSamooWbT2QgDypFAjNUebo2bdnf+4MXr14pX3w/oftxBM8"
-    "o+bMM7nE6/1Mt9nNunb5Zrt29VZ75fVX2v7V2qp/4uShtsKZpq8Qsd+dIF0ovJy3h9diyMYA"
-    "3ADHXaTlvCqpdE0AZMBDf+iXBnn6pq/MUcbMC5nvHDO1gDqfJI6RMjCqx4EjZZWkUOODcUgg"
-    "rs73eAG2AdUm7yP0jQp1csEuZhbGbj8XH7ev8CXHtnKn+0OTOv/0aZjH3jIdfiKwJfHI5/K4"
-    "94D4R6W8EwBULJA+ETY6onNw008SGbw7sTSWTv08Al2Lri5rP2Oo0Jh9hfOsOOWgGU1o7yjK"
-    "Kvo6T9i+dO1O2/T+Kwxwi/IyuwkH9nuPEQBxIGxQJCaKEdi6niTbSY+qLzxOaD2Tg1+DiWwt"
-    "wttq+37MjxEnbXxFJ+HMIr9wFLSX9ol5okPRqqBZvQ2enE/1WX0SPD9U2D/qloCkCDBO6Ct2"
-    "P2233pOl7Pzy9HDH90MedLyHG7FpFHmWIJbALLxKFxWy/03Fb8zJqbG2dM+3dUW2eCufvi8R"
-    "IStllFCnHkVaP+l0HJOAJfhAvmED9SiamS6hpxxSgm6XdzqBjsxpKhzaP5uKtvRlGF/Ft70P"
-    "zzcp3OLRDD/4Ix55ssiL67eX23vvfNyuX/qANWYNmj6wfHc78+rJ9sRzT7UH95bat37ne4z3"
-    "H7Zf++t/g/Z97UuvvdL+wd/7i+33v/Wt9oO3v99eeP61du38Wrt5+1vtz/7SL/NcrGey7pT+"
-    "XToKue+W2CT9oM7Il00FB1HG/NCl+lbZYzmNRjKfsWYD9MZuNEKlD6wuOIGlMesjZwIf3hzB"
-    "7sHQhW2RSBMRmDARJiPb5z75LjomK6M8n46N4R6CuQBDb8i281yQvdbq+/h43wyLnTeVsmAz"
-    "MS3sciHzco6vv1EcJnYccoszYUf8Lu7bcDH2JlQHinOON7vqyNL3kpPvsPNprb7kdTeXJbwJ"
-    "zoFiR3Yd1VDi+l5SjKMhZgCpHw4eg3TYOtTAGuDCmedAJA41Osc/6/NBUMkHIBny4UdlNdSc"
-    "kerCI5uUjkBSzoXCw/I226h32QlRp3oivMYa2shGfkM6WHRHH51qu2naSXOg8Nnihcdn330v"
-    "wc6zp071CUN6Olk0andurrU/fuc9ApQn2zOnX8Dem+3c2bPtzvrd9ubXvgoc27WcuXnpsrPR"
-    "ceDFJEXf6zPeerzIpHPrpg+We7s98+wp3hV1KPx8Wr/S2bdyTMAGfywp6dIL+y7gO1ZcvnSB"
-    "oOnDdm99g50wdvP4qPqVi9vt4vkD7aUzZ9rqkSOxyQ4//z1/jmcV8UyU4yePwq9u3lZOAw3f"
-    "FkB4yUDZ4dLWWrvw6aX21HMnc7+Q28zeH1S2dSFFIfC81Jf7dfBfbwTP08YRQJtpb4O16I49"
-    "Nn3hKP55+PCBvCzb3ZyHLsgABN5BzSWZe3cZD+iaG899ajVJm8SemRAdkm6J82T9Zd/lZ19C"
-    "h4kh93yAbDDkZR13EzTUNmMmN6YDs8BY8YnL+g6Y8aP6tRN6IYty+8nbD7DndvbgHevb7fqV"
-    "6+3o0cPtxVdezn1ljuMDyH38SSbI3efa2z94jyDrUwLcU3nP5akXTuMQ9Dd07qyv8yYAXkfD"
-    "GNm5v4sHAa7nQbnHjtEXXHi0j7ewzwHG+G709AcyawSc166uxXb+SMDLeE+cPIbNtJ1zTMlZ"
-    "chuMla9oB21WupCBnvariVNbll3E09gugF6+ASr94Zxh0i76hmfr+q42zviGr/SycIolbdqh"
-    "7LRFDnx3cizTiCokadbOcMinrnhIR39PwidMlsIbYIPcMZfYVpO5AMqAzPIAw3xhpsnm8Pcw"
-    "n7RLcSm4jDWllRbSjx2o8O+vHnJXUrmF8WZjX5nkzmX4Mwfr65VojCrakgxI4slQ3KqSe2nc"
-    "myJP4ApZMwbGyTH9mHrl69WW6Y+iYz/aR/KSIkUO0UOw5HsbO47hDKro6U/nyMDRv9nprjnR"
-    "m6+1te96HXxzXysEnTMrUFAG8ZyvuMwMUeciTxgXdu0HJuKkPgGNPuSf85h0IoQySkNg9S16"
-    "hVlt2i5CzipL9g6rjlM7oPIYfpOWApj0sN2kRXPSizwm6wf/SWfraIdiYPKlr0iTo8FlrkpQ"
-    "rDm7aNqcHzAJG/m7PbsscqQl89ce3vN5f+M68cIV1qBd7dNzl2m5wRjkfYLZCVzOmn7vATbl"
-    "xvYVTnxff+sEAr+JjZeyu2488OWvvtleOPNCu3jxE078branv/5sO3bi77SDvPVkm8uL9W5Y"
-    "NVBPNMpTCtg44MX0VOS+21zSxb+dN+JP1Cvr9KU+/PlfLejg9XiALKuq7cERL4b0y9Y+zgAq"
-    "/Tm5vr12I2evd1gkBHAouYW/w0Ln+8K8iff4iWfa3oNc9+Qp4xf5aWTjVzlPvPACiydnOUwQ"
-    "LghOQjevXWmfnPskz7l48czLbc8K11R3vGmNiRhHvn7pUrv86bX25DPPtkNPrLaPP/qgrd+8"
-    "iyGW2/MvnWqHj65CD4dnQhwLgpPC1csX26fsEPh7hBdOn27HuJ9jOzchoFTpFgX5SrKP0+lq"
-    "qQFHeWq3odumsqOlH+tgBwzTSa/u0bEtBJF7OCVQWp6Uzol5U8yX/D8v1cSG5VwMpI+j58yI"
-    "Cc1BXjsa1E/4UA+r4jVoxlF6Qdhs6UuPvIPCF2pevniJRax2pjRa3r3owgMf37O4QwB0g8tD"
-    "Tz79NH3Fux9xyv0siPJzZ2E3uxB5WTZ2ty67d9BfXuFdi0zC3rPi/U1Oyq7/BtfWBy4LC/q4"
-    "yCNnJjZ0ZV7vnVDC27aILLdu3mjvv/fjnIm+9pVXExiqsTshV/Ght7/7Dg+nu91++ptfbwe5"
-    "nHGXIPCtr70VWtpCntpUX/J+IWf+XQR+Xt83ptjN29iXV+qeKS/t5f2L9iUL7jY3UGoP37eZ"
-    "y4jQGwuM9lR3k3UGKnvYSdvauk1QcbudfOnFjAfrgQhc5IGpQe9uAj0JOGC1gT4VP+1EaxHl"
-    "BchMMPe4MeHO7dvc30VgCqz3L62wTa5HOpnb5iJ5YHUffchlPiZCd2yuX70ZPquHV4nG6kZc"
-    "74HypeMGoO78+TwfXx+kvXWS7CAh4yIL0NIC9/7xZnpfLr5Dm794PHr8ifbGW7xX89CB3HO1"
-    "xc28H33wCUHo/Xb6lecIuvZhqwft7Htn27mfXEIennTNpaZPz39KAMV7MTkh8qTIe7j85dWF"
-    "8xfa977zHnx9IvaejOVrN263F154rr300nPgMiG7w4cjeZnPywvZqTJAMHBNEKUpHTOogD0c"
-    "qC6vDiX91eDY52Ct8Msjfdd5ijiyFj7VhkZObsAbE6PI6pxk4CZRE1XWysslNN1lE7CeZNoP"
-    "poKv+cYJPDsKBJ3WF9XeJmyIFE1q+eUkUJLhK0Eg48P4J1VUCzNSiTgrT/UAj/kwl1yDJy50"
-    "+LJNXU05E4fQMr/sOnpgd7t22x80sEPM88LcdXTe2OXptwJEvy6JxPzEEjOpbI0C6Q8Ls+QY"
-    "mCCVo5cyb5UyqakQWkoTBHl8wJ0GaQzY6egcZz0YHvkLbg6UtKE+xPixzTHrrml+lIGc3lto"
-    "YF+XjUHFSDOcunRObfFFLHn4S7ac8IGrX1cwav8WD4XJn/aDf1IJWPXUVaAivQrCg2PBTpqS"
-    "8s7KNleCOrTVyfnCavmU/l3WDjt8gdrwGnDScW0RW7rKkzo7G5rOL+lL2p1HDbBCn7FYfqsx"
-    "CqdolRzpOQjK3gBNnDrBecjcc7j97J/jRJ3WMR6NCcZtHY71beZIN2P8ReaZ114C7mXmjBJF"
-    "f73HHLOXefv0mS9BxuBN7vxghXnOzRn7IIk2edtmLPOAZ2YlSEQ/5+GMM9rKfgUbcDDSpiLm"
-    "pSMcOCbXysrQpq3mktwA7WOl5zksXbnwafvkowttD1vC+ziTlKQTz/b2ZiblewR/a1c32+nX"
-    "Xm7LB7y59TJ37K+3Y08+39p+JnXOTF1Y79+7yyJ+vl25cpHFaZ2dkJM8r4KfTWIEX3zsgnvt"
-    "yqV2/dpae+7F5zlrhv7N6+32jQ3OCJZ4GNnRduTEcSZ+z7KMml3ofOrrWrv4iduJ0F05yCJg"
-    "O5Ijo4FEGdLyoyn1Ogtwaj5NaN2StqfuUTtRp+NVEmbQ0XjCD7zRIR2yjBtOGv9PmZi4dHrp"
-    "Gny4W+fk6iUM35MYuZ3coq9UzXCMXvKouiFXBp3OgA7BBU4HdwLxZmR3cirgcfAyubCL6M6L"
-    "Ot+no3fzWiN/heUuggv2U88+y+IHLvcY+f7GCgQlX46nBJvsjjlA7a8dLrXsZQF3R8hFzoXX"
-    "X/bduXMrO4D2m7+4UY3797bi/Jn1VUliyOsg2yB42OFt6WfeeL2tEtwbQOwgp3sXq0dPtJde"
-    "eYFLfZe5IXsDur7UmiCKndUlAkhIZDDtIUjypd6Xrlxum2vssBAsLvPm9W0DFnTaJIAxkPHy"
-    "pzs4V65caZsEavc26xLlIYKR1cOH49vqrr+Z4g/J0Wfooe3urK3Bi4fDHtbf53wkE3vHUTf4"
-    "ZIB3WqV0iOVL2gv8hHnt5s32kx+/zy4Q7z2jxT7cy07ZoSOHGTsvUrPQfAbMBjtFr3/lNYIU"
-    "giz+1m7caD/64TvtCHCvHnxtmoSvXr6Sm82PHDsUeeXjLps703m0BRPn0ROH2rkPz7e3v/P9"
-    "9iRj1/vKDMh9z+Miu8Ynn+X9X05y9KtpY+MWc8EGyj3HorPCSdCn7f2z59qLp4+3Z58jSMd/"
-    "Ll243N778U8Ys7wUHbvs44TsBuP/D7/9bjv13MH26msvho8T4wcffNx+8z/8r/ZX0PWNN7+U"
-    "vnFSrJfO1+6ljpOFn/4uv55beLFvTYD6JgsXtvf1OAaTw9zmsyOok/jJMBGaPAfxfdF0/NwK"
-    "Ojh9LAiwLqFeVhB8hzmKAzUuPow534VJWR9HVZJfykTA1EvWdiTqJUoxYOUzFlKWjY3C0J55"
-    "yvJc0mYdaq5WhaAV/oXrZb+HC15eRxeoGlgiMGWDfvyK8Xny+KG2esB5gJOjBB3epoAeKqIB"
-    "+Ddl7ktOef2kkPZQp8IqUUyjOTr3ig4RWRSzpAKHnPSrXcyeJ1u7Px4LJqSs79DmUsJe2sW1"
-    "HzUSoPgOzHGDt/Oj+hm4KLvBlu3Dl7JrI3EEk1cFOPqcUqov8yM+JQ3nj337OUlLn1XbkG8c"
-    "EygrGXj8Jylh/68KvoUTJt1Go7B+9IV5XBFGOXP+KEtw5AdyyqnuXxKUZnEJ7QEjP2nYPvK9"
-    "LfDKgc2Sh752NFke9BQY1M8kdwrd4fdEd//qMXDd+df3ALWj/OEJuI6Sh5zkb+1wT5Z+T/nu"
-    "OuPbk3NlUi8yrl/3VYFP7sMlU31aO8jWC1dyUeDftTTrOv6coEp+yK7/QzFrnT7WTSOBiWd8"
-    "DzjhI4F6KouFx5ME0tQbgfvfmHIzmcf7eP0AAAAASUVORK5CYII=")
-
 #----------------------------------------------------------------------
 Info = PyEmbeddedImage(
     "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAMFmlDQ1BJQ0MgUHJvZmlsZQAA"
@@ -0,0 +1,301 @@
+# coding=utf-8
+
+"""
+Job queue and scheduler for flashing and provisioning stations.
+
+Work is submitted as Job objects.  The scheduler runs them on a fixed pool of
+worker threads (the global concurrency cap), never runs two jobs for the same
+serial port at once, always picks the highest priority runnable job first,
+retries failed jobs with exponential backoff and appends every finished job
+to a history file.
+
+Cancellation is cooperative: a job function receives its Job and is expected
+to call job.check_cancelled() between steps.
+
+Everything a job prints while it runs goes to its own output stream (see
+console.redirect), so jobs running side by side do not mix their output.
+
+Example usage:
+
+    def work(job):
+        print('working on', job.port)
+
+    scheduler = JobScheduler(max_workers=2)
+    scheduler.submit(Job('hello', '/dev/ttyUSB0', work, retries=2))
+"""
+
+from __future__ import print_function
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import console
+
+PENDING = "pending"
+RUNNING = "running"
+RETRY_WAIT = "retry-wait"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job(object):
+    PRIORITY_LOW = -10
+    PRIORITY_NORMAL = 0
+    PRIORITY_HIGH = 10
+    PROGRESS_INTERVAL = 0.25  # seconds, progress is passed on to listeners at most this often
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name, port, func, priority=PRIORITY_NORMAL, retries=0, backoff=1.0, output=None):
+        """name is shown to the user, port is the serial port the job needs
+        exclusive access to (or None) and func(job) does the actual work.
+        A failing job is run again up to 'retries' times, waiting backoff,
+        2 * backoff, 4 * backoff... seconds between attempts.
+        What func prints goes to output, a file-like object, if given.
+        """
+        self.id = next(self._ids)
+        self.name = name
+        self.port = port
+        self.func = func
+        self.priority = priority
+        self.retries = retries
+        self.backoff = backoff
+        self.output = output
+        self.attempts = 0
+        self.state = PENDING
+        self.error = None
+        self.result = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.ready_at = 0  # earliest time the job may (re)start
+        self.progress = None  # last progress event reported by func
+        self._progress_reported = 0
+        self._on_progress = None  # set by the scheduler
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled("Job %s cancelled" % self.name)
+
+    def set_progress(self, event):
+        """Record a progress event (an esptool or ampy ProgressEvent) and
+        tell the scheduler listeners about it, throttled to
+        PROGRESS_INTERVAL except for the last event of a phase.
+        """
+        self.progress = event
+        now = time.time()
+        if now - self._progress_reported < self.PROGRESS_INTERVAL and event.done < event.total:
+            return
+        self._progress_reported = now
+        if self._on_progress is not None:
+            self._on_progress(self)
+
+    def wait(self, timeout=None):
+        """Block until the job is finished, returns True if it has."""
+        return self._done_event.wait(timeout)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'port': self.port,
+            'priority': self.priority,
+            'state': self.state,
+            'attempts': self.attempts,
+            'error': None if self.error is None else str(self.error),
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'progress': None if self.progress is None else dict(self.progress._asdict()),
+        }
+
+    def __repr__(self):
+        return "Job(%d, %s, %s, %s)" % (self.id, self.name, self.port, self.state)
+
+
+class JobScheduler(object):
+    HISTORY_SIZE = 500  # finished jobs kept in memory
+
+    def __init__(self, max_workers=4, history_path=None):
+        self._cond = threading.Condition()
+        self._queue = []
+        self._running = []
+        self._busy_ports = set()
+        self._listeners = []
+        self._stopping = False
+        self._history_path = history_path
+        self.history = deque(self._load_history(), maxlen=self.HISTORY_SIZE)
+        self._workers = []
+        for _ in range(max_workers):
+            worker = threading.Thread(target=self._work)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def add_listener(self, listener):
+        """Register listener(job), called from a worker thread whenever a
+        job changes state or reports progress.
+        """
+        self._listeners.append(listener)
+
+    def submit(self, job):
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("Scheduler is shut down")
+            self._queue.append(job)
+            self._cond.notify_all()
+        job._on_progress = self._notify
+        self._notify(job)
+        return job
+
+    def cancel(self, job):
+        """Cancel a job.  Queued jobs are dropped immediately, running jobs
+        stop at their next check_cancelled() call.
+        """
+        job.cancel()
+        with self._cond:
+            if job not in self._queue:
+                return
+            self._queue.remove(job)
+        self._finish(job, CANCELLED)
+
+    def cancel_all(self):
+        for job in self.jobs():
+            self.cancel(job)
+
+    def jobs(self):
+        """Snapshot of all queued and running jobs."""
+        with self._cond:
+            return list(self._running) + list(self._queue)
+
+    def is_port_busy(self, port):
+        with self._cond:
+            return port in self._busy_ports or any(j.port == port for j in self._queue)
+
+    def shutdown(self, wait=True, cancel=True):
+        if cancel:
+            self.cancel_all()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _next_job(self):
+        """Return the best runnable job and the time to sleep otherwise.
+        Called with the condition held."""
+        now = time.time()
+        best = None
+        wake_at = None
+        for job in self._queue:
+            if job.port is not None and job.port in self._busy_ports:
+                continue
+            if job.ready_at > now:
+                wake_at = job.ready_at if wake_at is None else min(wake_at, job.ready_at)
+                continue
+            if best is None or (job.priority, -job.id) > (best.priority, -best.id):
+                best = job
+        timeout = None if wake_at is None else wake_at - now
+        return best, timeout
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    job, timeout = self._next_job()
+                    if job is not None:
+                        break
+                    self._cond.wait(timeout)
+                self._queue.remove(job)
+                self._running.append(job)
+                if job.port is not None:
+                    self._busy_ports.add(job.port)
+                job.state = RUNNING
+                job.attempts += 1
+                job.progress = None
+                job.started = time.time()
+            self._notify(job)
+            with console.redirect(job.output):
+                try:
+                    job.check_cancelled()
+                    job.result = job.func(job)
+                    state = DONE
+                except JobCancelled:
+                    state = CANCELLED
+                except Exception as e:
+                    job.error = e
+                    state = FAILED
+            with self._cond:
+                self._running.remove(job)
+                self._busy_ports.discard(job.port)
+                retry = state == FAILED and job.attempts <= job.retries and not job.cancelled \
+                    and not self._stopping
+                if retry:
+                    job.state = RETRY_WAIT
+                    job.ready_at = time.time() + job.backoff * (2 ** (job.attempts - 1))
+                    self._queue.append(job)
+                self._cond.notify_all()
+            if retry:
+                with console.redirect(job.output):
+                    print("%s on %s failed (%s), retrying in %.1fs..." %
+                          (job.name, job.port, job.error, job.ready_at - time.time()))
+                self._notify(job)
+            else:
+                self._finish(job, state)
+
+    def _finish(self, job, state):
+        job.state = state
+        job.finished = time.time()
+        self.history.append(job.to_dict())
+        self._save_history(job)
+        job._done_event.set()
+        self._notify(job)
+
+    def _notify(self, job):
+        for listener in list(self._listeners):
+            try:
+                listener(job)
+            except Exception as e:
+                print("Job listener failed: %s" % e)
+
+    def _load_history(self):
+        if self._history_path is None or not os.path.exists(self._history_path):
+            return []
+        entries = []
+        with open(self._history_path, 'r') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    pass  # skip a line truncated by a crash
+        return entries[-self.HISTORY_SIZE:]
+
+    def _save_history(self, job):
+        if self._history_path is None:
+            return
+        with self._cond:
+            with open(self._history_path, 'a') as f:
+                f.write(json.dumps(job.to_dict()) + "\n")
@@ -0,0 +1,113 @@
+# coding=utf-8
+
+"""
+Background serial port watcher.
+
+Keeps track of the serial ports present on the machine and reports ports
+being plugged in or removed to registered listeners.  On Linux the udev
+monitor is used to wake up only when a tty device changes (if pyudev is
+installed), everywhere else the port list is polled.
+
+Example usage:
+
+    def on_port_event(event, port):
+        print(event, port)
+
+    watcher = PortWatcher()
+    watcher.add_listener(on_port_event)
+    watcher.start()
+"""
+
+import threading
+
+from serial.tools import list_ports
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+PORT_ADDED = "added"
+PORT_REMOVED = "removed"
+
+
+def list_serial_ports():
+    return sorted(port for port, desc, hwid in list_ports.comports())
+
+
+class PortWatcher(threading.Thread):
+    POLL_INTERVAL = 1.0  # seconds between scans when polling
+
+    def __init__(self, poll_interval=POLL_INTERVAL, use_udev=True):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self._poll_interval = poll_interval
+        self._use_udev = use_udev and pyudev is not None
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Ports present at start are known, not "added": plugging in a board
+        # is what triggers an event, starting the tool is not.
+        self._ports = set(list_serial_ports())
+
+    def add_listener(self, listener):
+        """Register listener(event, port), called from the watcher thread
+        with event being PORT_ADDED or PORT_REMOVED.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def ports(self):
+        with self._lock:
+            return sorted(self._ports)
+
+    def stop(self):
+        self._stop_event.set()
+
+    def rescan(self):
+        """Compare the current port list with the last one and notify the
+        listeners of the differences.
+        """
+        current = set(list_serial_ports())
+        with self._lock:
+            added = sorted(current - self._ports)
+            removed = sorted(self._ports - current)
+            self._ports = current
+            listeners = list(self._listeners)
+        for port in removed:
+            self._notify(listeners, PORT_REMOVED, port)
+        for port in added:
+            self._notify(listeners, PORT_ADDED, port)
+
+    @staticmethod
+    def _notify(listeners, event, port):
+        for listener in listeners:
+            try:
+                listener(event, port)
+            except Exception as e:
+                # A broken listener must not kill the watcher for the others.
+                print("Port watcher listener failed: %s" % e)
+
+    def run(self):
+        if self._use_udev:
+            try:
+                self._watch_udev()
+                return
+            except Exception as e:
+                print("udev port monitor unavailable (%s), polling instead" % e)
+        while not self._stop_event.wait(self._poll_interval):
+            self.rescan()
+
+    def _watch_udev(self):
+        context = pyudev.Context()
+        monitor = pyudev.Monitor.from_netlink(context)
+        monitor.filter_by(subsystem="tty")
+        monitor.start()
+        while not self._stop_event.is_set():
+            # poll() returns None on timeout, which lets stop() be noticed
+            if monitor.poll(timeout=self._poll_interval) is not None:
+                self.rescan()